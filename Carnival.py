@@ -20,6 +20,7 @@ import time
 from datetime import datetime
 from colorama import Fore, Style, init
 from typing import Dict, List, Any, Optional, Union, Tuple
+from text_mode import pause
 
 # Launcher protection at the very beginning
 if __name__ == "__main__":
@@ -884,7 +885,7 @@ def reaction_test() -> None:
         return
     clear()
     print("Wait for GO!")
-    time.sleep(random.uniform(2, 5))
+    pause(random.uniform(2, 5))
     input("...READY...")
     print("GO!")
     start = time.time()
@@ -906,7 +907,7 @@ def melody_memory() -> None:
     notes = ['A', 'B', 'C', 'D']
     pattern = [random.choice(notes) for _ in range(3)]
     print("Pattern:", " ".join(pattern))
-    time.sleep(2)
+    pause(2)
     clear()
     guess = input("Enter pattern (space-separated): ").strip().upper().split()
     if guess == pattern:
@@ -960,7 +961,7 @@ def word_shuffle_free() -> None:
 def reaction_test_free() -> None:
     clear()
     print("Wait for GO!")
-    time.sleep(random.uniform(2, 4))
+    pause(random.uniform(2, 4))
     input("...READY...")
     print("GO!")
     start = time.time()
@@ -1197,7 +1198,7 @@ def race_track() -> None:
         return
 
     print("\n🏁 Race starting...")
-    time.sleep(1)
+    pause(1)
     winner = random.randint(0, len(animals)-1)
     print(f"🏆 Winner: {animals[winner]}")
 
@@ -1245,7 +1246,7 @@ def lucky_slots() -> None:
         for i in range(10):
             print(f"\nPull {i+1}:")
             total_winnings += single_pull()
-            time.sleep(0.5)
+            pause(0.5)
         print(f"\nTotal winnings: {total_winnings} tickets!")
         player["tickets"] += total_winnings
     else:
@@ -1477,79 +1478,79 @@ def main_menu() -> None:
         # Enhanced menu with better feedback and transitions
         if choice == "1":
             print(f"{Fore.CYAN}Loading minigames...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             minigame_menu()
         elif choice == "2":
             print(f"{Fore.CYAN}Opening the ticket shop...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             shop()
         elif choice == "3":
             print(f"{Fore.CYAN}Visiting the pet shop...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             pet_shop()
         elif choice == "4":
             print(f"{Fore.CYAN}Checking your daily challenges...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             check_daily_challenges()
         elif choice == "5":
             print(f"{Fore.CYAN}Loading the leaderboard...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             show_leaderboard()
         elif choice == "6":
             print(f"{Fore.CYAN}Preparing to save your progress...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             save_menu()
         elif choice == "7":
             print(f"{Fore.CYAN}Accessing saved games...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             load_menu()
         elif choice == "8":
             print(f"{Fore.CYAN}Opening tutorials...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             tutorials()
         elif choice == "9":
             print(f"{Fore.CYAN}Heading to the theme park...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             theme_park_menu()
         elif choice == "10":
             print(f"{Fore.CYAN}Entering the casino area...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             gambling_menu()
         elif choice == "11":
             print(f"{Fore.CYAN}Looking for carnival characters to talk to...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             talk_to_npcs()
         elif choice == "12":
             print(f"{Fore.CYAN}Opening code redemption panel...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             redeem_code()
         elif choice == "13":
             print(f"{Fore.CYAN}Opening pet management...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             equip_pet()
         elif choice == "14":
             print(f"{Fore.CYAN}Heading to the championship arena...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             championship_center()
         elif choice == "15":
             print(f"{Fore.CYAN}Visiting the quest center...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             quest_center()
         elif choice == "16":
             print(f"{Fore.CYAN}Checking your loyalty rewards...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             loyalty_rewards_center()
         elif choice == "17":
             print(f"{Fore.CYAN}Heading to the entertainment plaza...{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
             entertainment_plaza()
         elif choice == "0":
             print(f"{Fore.YELLOW}Thanks for visiting the carnival! We hope to see you again soon!{Style.RESET_ALL}")
-            time.sleep(1.5)
+            pause(1.5)
             break
         else:
             print(f"{Fore.RED}Invalid option. Please try again.{Style.RESET_ALL}")
-            time.sleep(1)
+            pause(1)
 
 # Pet System
 PETS = {
@@ -2206,11 +2207,11 @@ def talk_to_npcs() -> None:
 
                 except ValueError:
                     print(Fore.RED + "Invalid choice!")
-                    time.sleep(1)
+                    pause(1)
 
         except ValueError:
             print(Fore.RED + "Invalid choice!")
-            time.sleep(1)
+            pause(1)
 
 def interact_with_npc(npc_name: str) -> None:
     """Detailed interaction with a specific NPC including dialogue, missions, and trading"""
@@ -2437,7 +2438,7 @@ def interact_with_npc(npc_name: str) -> None:
                 f"{npc_name} gives you a warm hug before you part ways!"  # Best Friend
             ]
             print(f"\n{Fore.YELLOW}{farewell_messages[min(relationship_level-1, len(farewell_messages)-1)]}")
-            time.sleep(1.5)
+            pause(1.5)
             return
 
         elif action == "C":
@@ -2482,10 +2483,10 @@ def interact_with_npc(npc_name: str) -> None:
                         relationship_progress(npc_name, "successful_trade", 3)
                 else:
                     print(Fore.RED + "Invalid option!")
-                    time.sleep(1)
+                    pause(1)
             except ValueError:
                 print(Fore.RED + "Invalid option!")
-                time.sleep(1)
+                pause(1)
 
 def give_gift_to_npc(npc_name: str) -> None:
     """Give a gift to an NPC to improve relationship"""
@@ -2501,7 +2502,7 @@ def give_gift_to_npc(npc_name: str) -> None:
 
     if not giftable_items:
         print(Fore.RED + "You don't have any items to give as gifts!")
-        time.sleep(1.5)
+        pause(1.5)
         return
 
     # Display inventory
@@ -2567,7 +2568,7 @@ def give_gift_to_npc(npc_name: str) -> None:
             raise ValueError
     except ValueError:
         print(Fore.RED + "Invalid choice!")
-        time.sleep(1)
+        pause(1)
 
 def calculate_gift_value(npc_name: str, gift: str) -> int:
     """Calculate how much an NPC values a particular gift"""
@@ -2770,7 +2771,7 @@ def relationship_progress(npc_name: str, action_type: str, points: int) -> None:
         # Check for relationship achievements after level change
         check_relationship_achievements()
 
-        time.sleep(2)
+        pause(2)
 
 def check_for_special_event(npc_name: str) -> bool:
     """Determine if a special event should trigger for this NPC interaction"""
@@ -3033,7 +3034,7 @@ def handle_personal_request(npc_name: str, relationship_level: int) -> None:
 
         # Simulate the activity
         print(f"\n{Fore.CYAN}Time passes as you help with the request...")
-        time.sleep(2)
+        pause(2)
 
         # Random events during the activity
         events = [
@@ -3043,7 +3044,7 @@ def handle_personal_request(npc_name: str, relationship_level: int) -> None:
             "Your creative approach impresses everyone involved."
         ]
         print(f"\n{Fore.WHITE}{random.choice(events)}")
-        time.sleep(1.5)
+        pause(1.5)
 
         # Success!
         print(f"\n{Fore.GREEN}Success! You've completed {npc_name}'s request!")
@@ -3151,7 +3152,7 @@ def start_quest(quest_id: str, npc_name: Optional[str] = None) -> None:
         input(f"\n{Fore.CYAN}Press Enter to continue...")
     else:
         print(f"{Fore.YELLOW}You're already working on this quest.")
-        time.sleep(1.5)
+        pause(1.5)
 
 def trade_with_npc(npc_name: str) -> None:
     """Trade interface with an NPC"""
@@ -3159,7 +3160,7 @@ def trade_with_npc(npc_name: str) -> None:
 
     if "trades" not in npc_data or not npc_data["trades"]:
         print(Fore.RED + f"{npc_name} has nothing to trade right now.")
-        time.sleep(1.5)
+        pause(1.5)
         return
 
     while True:
@@ -3197,7 +3198,7 @@ def trade_with_npc(npc_name: str) -> None:
                 raise ValueError
         except ValueError:
             print(Fore.RED + "Invalid choice!")
-            time.sleep(1)
+            pause(1)
 
 def process_trade(npc_name: str, trade: Dict[str, Any]) -> None:
     """Process a trade with an NPC"""
@@ -3208,7 +3209,7 @@ def process_trade(npc_name: str, trade: Dict[str, Any]) -> None:
     # Check if player has the required item
     if give_item not in player["inventory"]:
         print(Fore.RED + f"You don't have a {give_item} to trade!")
-        time.sleep(1.5)
+        pause(1.5)
         return
 
     # Confirm trade
@@ -3223,7 +3224,7 @@ def process_trade(npc_name: str, trade: Dict[str, Any]) -> None:
     confirm = input("\nProceed with this trade? (y/n): ").lower()
     if confirm != "y":
         print(Fore.YELLOW + "Trade cancelled.")
-        time.sleep(1)
+        pause(1)
         return
 
     # Process the trade
@@ -3236,7 +3237,7 @@ def process_trade(npc_name: str, trade: Dict[str, Any]) -> None:
         player["inventory"].append(receive_item)
         print(Fore.GREEN + f"\nTrade complete! You received {receive_item}.")
 
-    time.sleep(1.5)
+    pause(1.5)
 
 def entertainment_plaza() -> None:
     """Main hub for accessing entertainment options like movies, music shows, and theatre"""
@@ -3289,7 +3290,7 @@ def entertainment_plaza() -> None:
         return
     else:
         print(Fore.RED + "Invalid option!")
-        time.sleep(1)
+        pause(1)
         return entertainment_plaza()
 
 def cinema_menu() -> None:
@@ -3337,11 +3338,11 @@ def cinema_menu() -> None:
             watch_movie(movie_idx)
         else:
             print(Fore.RED + "Invalid selection!")
-            time.sleep(1)
+            pause(1)
             return cinema_menu()
     except ValueError:
         print(Fore.RED + "Please enter a valid number!")
-        time.sleep(1)
+        pause(1)
         return cinema_menu()
 
 def watch_movie(movie_idx: int) -> None:
@@ -3359,7 +3360,7 @@ def watch_movie(movie_idx: int) -> None:
     # Check if player can afford the movie
     if player["tickets"] < price:
         print(Fore.RED + f"You don't have enough tickets! Need {price} tickets.")
-        time.sleep(2)
+        pause(2)
         return cinema_menu()
 
     clear()
@@ -3382,7 +3383,7 @@ def watch_movie(movie_idx: int) -> None:
     clear()
     print(Fore.YELLOW + f"🎬 {movie['title']} 🎬")
     print("\nThe movie is starting...")
-    time.sleep(2)
+    pause(2)
 
     # Special effects if any
     if movie["special_effect"]:
@@ -3399,10 +3400,10 @@ def watch_movie(movie_idx: int) -> None:
     ]
 
     for scene in scenes:
-        time.sleep(1.5)
+        pause(1.5)
         print(f"\n{scene}")
 
-    time.sleep(1)
+    pause(1)
     print(Fore.GREEN + "\n🎬 The End! 🎬")
     print("You enjoyed the movie!")
 
@@ -3477,11 +3478,11 @@ def concert_hall_menu() -> None:
             attend_concert(concert_idx)
         else:
             print(Fore.RED + "Invalid selection!")
-            time.sleep(1)
+            pause(1)
             return concert_hall_menu()
     except ValueError:
         print(Fore.RED + "Please enter a valid number!")
-        time.sleep(1)
+        pause(1)
         return concert_hall_menu()
 
 def attend_concert(concert_idx: int) -> None:
@@ -3499,7 +3500,7 @@ def attend_concert(concert_idx: int) -> None:
     # Check if player can afford the concert
     if player["tickets"] < price:
         print(Fore.RED + f"You don't have enough tickets! Need {price} tickets.")
-        time.sleep(2)
+        pause(2)
         return concert_hall_menu()
 
     clear()
@@ -3522,7 +3523,7 @@ def attend_concert(concert_idx: int) -> None:
     clear()
     print(Fore.YELLOW + f"🎵 {concert['title']} 🎵")
     print("\nThe crowd is getting excited as the show is about to begin...")
-    time.sleep(2)
+    pause(2)
 
     # Special effects if any
     if concert["special_effect"]:
@@ -3539,10 +3540,10 @@ def attend_concert(concert_idx: int) -> None:
     ]
 
     for experience in experiences:
-        time.sleep(1.5)
+        pause(1.5)
         print(f"\n{experience}")
 
-    time.sleep(1)
+    pause(1)
     print(Fore.GREEN + "\n🎵 What an amazing show! 🎵")
     print("The performance was unforgettable!")
 
@@ -3617,11 +3618,11 @@ def theatre_menu() -> None:
             see_theatre_show(show_idx)
         else:
             print(Fore.RED + "Invalid selection!")
-            time.sleep(1)
+            pause(1)
             return theatre_menu()
     except ValueError:
         print(Fore.RED + "Please enter a valid number!")
-        time.sleep(1)
+        pause(1)
         return theatre_menu()
 
 def see_theatre_show(show_idx: int) -> None:
@@ -3639,7 +3640,7 @@ def see_theatre_show(show_idx: int) -> None:
     # Check if player can afford the show
     if player["tickets"] < price:
         print(Fore.RED + f"You don't have enough tickets! Need {price} tickets.")
-        time.sleep(2)
+        pause(2)
         return theatre_menu()
 
     clear()
@@ -3662,7 +3663,7 @@ def see_theatre_show(show_idx: int) -> None:
     clear()
     print(Fore.YELLOW + f"🎭 {show['title']} 🎭")
     print("\nThe curtains rise as the production begins...")
-    time.sleep(2)
+    pause(2)
 
     # Special effects if any
     if show["special_effect"]:
@@ -3679,10 +3680,10 @@ def see_theatre_show(show_idx: int) -> None:
     ]
 
     for act in acts:
-        time.sleep(1.5)
+        pause(1.5)
         print(f"\n{act}")
 
-    time.sleep(1)
+    pause(1)
     print(Fore.GREEN + "\n🎭 Bravo! 🎭")
     print("The audience erupts in applause for the magnificent performance!")
 
@@ -4302,7 +4303,7 @@ def championship_center() -> None:
         choice_idx = int(choice) - 1
         if choice_idx < 0 or choice_idx >= len(CHAMPIONSHIPS):
             print(Fore.RED + "Invalid choice!")
-            time.sleep(1)
+            pause(1)
             return championship_center()
 
         # Get selected championship
@@ -4312,7 +4313,7 @@ def championship_center() -> None:
         # Check if player can afford entry fee
         if player["tickets"] < championship["entry_fee"]:
             print(Fore.RED + f"You don't have enough tickets! Need {championship['entry_fee']} tickets.")
-            time.sleep(2)
+            pause(2)
             return championship_center()
 
         # Confirm participation
@@ -4404,7 +4405,7 @@ def championship_center() -> None:
 
     except ValueError:
         print(Fore.RED + "Invalid choice!")
-        time.sleep(1)
+        pause(1)
         return championship_center()
 
 def minigame_championship() -> None:
@@ -4656,7 +4657,7 @@ def theme_park_championship() -> None:
 
         # Simulate the challenge with some user interaction
         print("\nPreparing for the challenge...")
-        time.sleep(1)
+        pause(1)
 
         # Random factors for challenge difficulty
         difficulty = random.randint(1, 10)
@@ -4909,7 +4910,7 @@ def casino_championship() -> None:
 
     # Spin the wheel
     print("\nThe wheel is spinning...")
-    time.sleep(1)
+    pause(1)
     result = random.randint(0, 36)
 
     # Determine if number is red or black
@@ -4973,7 +4974,7 @@ def casino_championship() -> None:
             print("Please enter a valid number.")
 
     print("\nPulling the lever...")
-    time.sleep(1)
+    pause(1)
 
     symbols = ["🍒", "🍊", "🍋", "💎", "7️⃣", "⭐"]
     payouts = {
@@ -5030,7 +5031,7 @@ def casino_championship() -> None:
         return chips
 
     print("\nDealing cards...")
-    time.sleep(1)
+    pause(1)
 
     # Simplified poker using card values (2-14, with 11=J, 12=Q, 13=K, 14=A)
     player_hand = [random.randint(2, 14) for _ in range(5)]
@@ -5164,7 +5165,7 @@ def quest_center() -> None:
         # Accept a new quest
         if not available_quests:
             print(Fore.RED + "No quests available to accept!")
-            time.sleep(1.5)
+            pause(1.5)
             return quest_center()
 
         quest_num = input("Enter quest number to accept: ")
@@ -5172,7 +5173,7 @@ def quest_center() -> None:
             quest_idx = int(quest_num) - 1
             if quest_idx < 0 or quest_idx >= len(available_quests):
                 print(Fore.RED + "Invalid quest number!")
-                time.sleep(1.5)
+                pause(1.5)
                 return quest_center()
 
             quest_id, quest = available_quests[quest_idx]
@@ -5185,7 +5186,7 @@ def quest_center() -> None:
         except ValueError:
             print(Fore.RED + "Please enter a valid number!")
 
-        time.sleep(1.5)
+        pause(1.5)
         return quest_center()
 
     elif choice == "C":
@@ -5197,7 +5198,7 @@ def quest_center() -> None:
 
         if not completed:
             print(Fore.RED + "No completed quests to claim rewards for!")
-            time.sleep(1.5)
+            pause(1.5)
             return quest_center()
 
         print(Fore.GREEN + "Claiming rewards for completed quests:")
@@ -5216,12 +5217,12 @@ def quest_center() -> None:
 
         print(Fore.YELLOW + f"Total tickets now: {player['tickets']}")
 
-        time.sleep(2)
+        pause(2)
         return quest_center()
 
     else:
         print(Fore.RED + "Invalid option!")
-        time.sleep(1)
+        pause(1)
         return quest_center()
 
 def loyalty_rewards_center() -> None:
@@ -5306,7 +5307,7 @@ def loyalty_rewards_center() -> None:
             reward_idx = int(choice) - 1
             if reward_idx < 0 or reward_idx >= len(rewards):
                 print(Fore.RED + "Invalid selection!")
-                time.sleep(1.5)
+                pause(1.5)
                 return loyalty_rewards_center()
 
             selected_reward = rewards[reward_idx]
@@ -5314,7 +5315,7 @@ def loyalty_rewards_center() -> None:
             # Check if player has enough points
             if current_points < selected_reward["cost"]:
                 print(Fore.RED + f"Not enough loyalty points! Need {selected_reward['cost']} points.")
-                time.sleep(1.5)
+                pause(1.5)
                 return loyalty_rewards_center()
 
             # Confirm redemption
@@ -5370,13 +5371,13 @@ def loyalty_rewards_center() -> None:
 
         except ValueError:
             print(Fore.RED + "Please enter a valid number!")
-            time.sleep(1.5)
+            pause(1.5)
 
         return loyalty_rewards_center()
 
     else:
         print(Fore.RED + "Invalid option!")
-        time.sleep(1)
+        pause(1)
         return loyalty_rewards_center()
 
 def hangman_game() -> None:
@@ -5443,7 +5444,7 @@ def memory_match() -> None:
                 revealed[first_choice] = False
                 revealed[choice] = False
             first_choice = None
-            time.sleep(1)
+            pause(1)
 
     print(Fore.GREEN + "You completed the memory game! +8 tickets")
     player["tickets"] += 8
@@ -5560,7 +5561,7 @@ def food_stand() -> None:
             raise ValueError
     except ValueError:
         print(Fore.RED + "Invalid choice!")
-        time.sleep(1.5)
+        pause(1.5)
         return food_stand()
 
     # Purchase the food
@@ -5596,7 +5597,7 @@ def food_stand() -> None:
             return food_stand()
     else:
         print(Fore.RED + f"Not enough tickets! You need {selected_food['price']} tickets.")
-        time.sleep(1.5)
+        pause(1.5)
         return food_stand()
 
     input("\nPress Enter to return to the theme park...")
@@ -5665,7 +5666,7 @@ def carnival_games_menu() -> None:
             raise ValueError
     except ValueError:
         print(Fore.RED + "Invalid choice!")
-        time.sleep(1.5)
+        pause(1.5)
         return carnival_games_menu()
 
     # Check if player can afford the game
@@ -5711,7 +5712,7 @@ def carnival_games_menu() -> None:
             return carnival_games_menu()
     else:
         print(Fore.RED + f"Not enough tickets! You need {selected_game['price']} tickets.")
-        time.sleep(1.5)
+        pause(1.5)
         return carnival_games_menu()
 
     input("\nPress Enter to return to the theme park...")
@@ -5811,7 +5812,7 @@ def play_carnival_game(game: str) -> None:
         target = 100
         print("\nFilling the balloon: ", end="")
         while progress < target:
-            time.sleep(0.5)
+            pause(0.5)
             increment = random.randint(15, 25)
             progress = min(target, progress + increment)
             print(f"{progress}%... ", end="", flush=True)
@@ -5833,7 +5834,7 @@ def play_carnival_game(game: str) -> None:
 
         print(f"\nWhack {target_hits} moles in {attempts} attempts!")
         for i in range(attempts):
-            time.sleep(0.7)
+            pause(0.7)
             mole_appears = random.choice(["left", "center", "right"])
             print(f"\nA mole appears on the {mole_appears}!")
             choice = input("Where do you whack? (left/center/right): ").lower()
@@ -6027,7 +6028,7 @@ def seasonal_event() -> None:
 
                 for experience in random.sample(experiences, 3):
                     print(f"\n{experience}")
-                    time.sleep(1.5)
+                    pause(1.5)
 
                 # Give a special seasonal souvenir
                 souvenir = f"{current_season.capitalize()} {attraction} Memento"
@@ -6046,7 +6047,7 @@ def seasonal_event() -> None:
                 print(Fore.MAGENTA + "+3 Loyalty Points for enjoying a seasonal attraction!")
             else:
                 print(Fore.RED + "Not enough tickets! You need 5 tickets.")
-                time.sleep(1.5)
+                pause(1.5)
                 return seasonal_event()
     elif choice == "4":
         # Meet special characters
@@ -6071,7 +6072,7 @@ def seasonal_event() -> None:
 
             for interaction in random.sample(interactions, 2):
                 print(f"\n{interaction}")
-                time.sleep(1.5)
+                pause(1.5)
 
             # Add to collection
             if "characters_met" not in player:
@@ -6089,7 +6090,7 @@ def seasonal_event() -> None:
             print(Fore.MAGENTA + "+2 Loyalty Points for meeting a seasonal character!")
         else:
             print(Fore.RED + "Not enough tickets! You need 3 tickets.")
-            time.sleep(1.5)
+            pause(1.5)
             return seasonal_event()
     elif choice == "5":
         # Seasonal photo opportunity
@@ -6121,7 +6122,7 @@ def seasonal_event() -> None:
 
             # Take the photo
             print("\nThe photographer counts down: 3... 2... 1... SMILE!")
-            time.sleep(1)
+            pause(1)
             print(Fore.GREEN + "Perfect shot!")
 
             # Add to collection
@@ -6142,11 +6143,11 @@ def seasonal_event() -> None:
             print(Fore.MAGENTA + "+2 Loyalty Points for a seasonal photo!")
         else:
             print(Fore.RED + "Not enough tickets! You need 4 tickets.")
-            time.sleep(1.5)
+            pause(1.5)
             return seasonal_event()
     else:
         print(Fore.RED + "Invalid choice!")
-        time.sleep(1.5)
+        pause(1.5)
         return seasonal_event()
 
     input("\nPress Enter to return to the seasonal event menu...")
@@ -6445,44 +6446,44 @@ def vip_tour() -> None:
     # Tour sequence
     print("\nJordan: Welcome to our behind-the-scenes tour! I'll be showing you how our rides work,")
     print("        introducing you to some of our performers, and sharing some theme park secrets!")
-    time.sleep(2)
+    pause(2)
 
     # Ride mechanics
     print("\n🔧 RIDE MECHANICS TOUR 🔧")
     print("You're taken to the maintenance area of the Cosmic Coaster...")
-    time.sleep(2)
+    pause(2)
     print("Jordan: These coaster cars use magnetic propulsion to achieve speeds of up to 70mph!")
     print("        Our team of 20 engineers check every ride each morning for safety.")
-    time.sleep(2)
+    pause(2)
 
     # Character workshop
     print("\n🎭 CHARACTER WORKSHOP 🎭")
     print("You visit the workshop where costumes and animatronics are created...")
-    time.sleep(2)
+    pause(2)
     print("Jordan: Each character costume takes about 80 hours to make by hand.")
     print("        The animatronics in the Haunted Mansion have over 40 points of articulation!")
-    time.sleep(2)
+    pause(2)
 
     # Special effects
     print("\n✨ SPECIAL EFFECTS DEMONSTRATION ✨")
     print("The team demonstrates how various special effects are created...")
-    time.sleep(2)
+    pause(2)
     print("Jordan: The fog in the Haunted Mansion is created using ultrasonic foggers.")
     print("        For water rides, we recycle and filter over 500,000 gallons of water daily!")
-    time.sleep(2)
+    pause(2)
 
     # Control room
     print("\n🖥️ PARK CONTROL CENTER 🖥️")
     print("You're shown the control center where all rides are monitored...")
-    time.sleep(2)
+    pause(2)
     print("Jordan: From here, we can see the status of every ride in the park.")
     print("        Our backup generators can power the entire park for 12 hours in an emergency.")
-    time.sleep(2)
+    pause(2)
 
     # VIP lounge
     print("\n🍹 VIP LOUNGE 🍹")
     print("The tour ends with refreshments in the exclusive VIP lounge...")
-    time.sleep(2)
+    pause(2)
     print("Jordan: Please enjoy some complimentary refreshments!")
     print("        As a VIP tour participant, you'll also receive this exclusive souvenir.")
 
@@ -6521,35 +6522,35 @@ def thunder_mountain() -> None:
     track_attraction_visit("Thunder Mountain")
 
     # Add delay for suspense
-    time.sleep(1.5)
+    pause(1.5)
 
     # Ride begins
     print("\nYou climb aboard an old mining cart and secure the safety bar.")
     print("The ride operator tips his hat: 'Y'all enjoy yer adventure now, ya hear?'")
-    time.sleep(2)
+    pause(2)
 
     # Start of the ride
     print("\nWith a mechanical clunk, your cart starts moving...")
     print("It slowly climbs up the first hill, the chains clicking beneath you...")
-    time.sleep(2)
+    pause(2)
 
     # First drop
     print("\nYou reach the top of the hill and pause for a moment...")
-    time.sleep(1)
+    pause(1)
     print("WHOOSH! Your cart plummets down the first drop!")
     print("The wind rushes past your face as you speed through a dark tunnel!")
-    time.sleep(2)
+    pause(2)
 
     # Cave section
     print("\nYour cart races through a dimly lit cave...")
     print("Glowing gems and crystals line the walls, creating a mesmerizing light show.")
     print("You hear the sound of mining picks and ghostly whispers...")
-    time.sleep(2)
+    pause(2)
 
     # Waterfall section
     print("\nYou emerge from the cave and speed past a roaring waterfall!")
     print("A fine mist sprays your face as you zoom by.")
-    time.sleep(2)
+    pause(2)
 
     # Decision point
     print("\nThe track splits ahead! Your cart could go left or right.")
@@ -6559,11 +6560,11 @@ def thunder_mountain() -> None:
         print("\nYou lean left and your cart veers onto the left track...")
         print("This route takes you through an abandoned mining town!")
         print("Animatronic miners tip their hats as you speed past.")
-        time.sleep(2)
+        pause(2)
 
         print("\nYour cart enters an old saloon and crashes through the swinging doors!")
         print("Inside, the player piano is playing by itself as you race through.")
-        time.sleep(2)
+        pause(2)
 
         # Special scene for left path
         print("\nAs you exit the saloon, you spot a hidden gold nugget!")
@@ -6575,12 +6576,12 @@ def thunder_mountain() -> None:
         print("\nYou lean right and your cart veers onto the right track...")
         print("This route takes you through a terrifying cave-in!")
         print("Rocks appear to fall all around you, but narrowly miss your cart.")
-        time.sleep(2)
+        pause(2)
 
         print("\nYour cart zooms past an old dynamite storage area...")
         print("BOOM! Special effects create the illusion of an explosion behind you!")
         print("The heat from the pyrotechnics warms your back as you escape!")
-        time.sleep(2)
+        pause(2)
 
         # Special scene for right path
         print("\nAs you escape the explosion, you notice a strange glowing crystal!")
@@ -6591,12 +6592,12 @@ def thunder_mountain() -> None:
     # Final drop
     print("\nBoth paths rejoin for the grand finale...")
     print("Your cart climbs the highest peak of Thunder Mountain...")
-    time.sleep(2)
+    pause(2)
     print("You reach the summit and look down at the steepest drop yet!")
-    time.sleep(1)
+    pause(1)
     print("WHOOOOOOSH! Your cart plummets down at incredible speed!")
     print("You raise your hands and scream with delight!")
-    time.sleep(2)
+    pause(2)
 
     # End of ride
     print("\nYour cart gradually slows down and returns to the station.")
@@ -6625,12 +6626,12 @@ def drop_tower() -> None:
     print("\nYou're secured into your seat with a heavy-duty harness.")
     print("The ride operator checks all safety systems twice.")
     print("'Keep your hands inside the ride at all times and enjoy the view... while you can.'")
-    time.sleep(2)
+    pause(2)
 
     # Ascent
     print("\nWith a mechanical hum, your seat begins to rise...")
     print("The tower is 200 feet tall, and you're heading all the way to the top.")
-    time.sleep(1.5)
+    pause(1.5)
 
     for height in [50, 100, 150, 200]:
         print(f"\nYou're now {height} feet above the ground...")
@@ -6640,32 +6641,32 @@ def drop_tower() -> None:
             print("The people below look like tiny ants...")
         elif height == 200:
             print("You've reached the top! The view is breathtaking!")
-        time.sleep(1.5)
+        pause(1.5)
 
     # At the top
     print("\nYour seat hovers at the top of the tower...")
     print("You have a moment to appreciate the incredible view...")
     print("The entire theme park and surrounding landscape stretches out beneath you.")
-    time.sleep(3)
+    pause(3)
 
     # The drop
     print("\n3...")
-    time.sleep(1)
+    pause(1)
     print("2...")
-    time.sleep(1)
+    pause(1)
     print("1...")
-    time.sleep(0.5)
+    pause(0.5)
     print("WHOOOOOOOOSH!!!")
     print("You plummet toward the ground at incredible speed!")
     print("The wind rushes past as your stomach feels like it's floating!")
-    time.sleep(2)
+    pause(2)
 
     # Surprise elements - random events during the drop
     surprise = random.randint(1, 4)
 
     if surprise == 1:
         print("\nHalfway down, the tower unexpectedly STOPS!")
-        time.sleep(1)
+        pause(1)
         print("You hover for just a second... and then DROP AGAIN!")
         print("The double-drop makes your heart race even faster!")
     elif surprise == 2:
@@ -6678,13 +6679,13 @@ def drop_tower() -> None:
         print("\nLED lights flash in sequence as you fall through the tower!")
         print("It's like falling through a tunnel of colorful stars!")
 
-    time.sleep(1.5)
+    pause(1.5)
 
     # The end - magnetic braking
     print("\nJust when you think you're about to hit the ground...")
     print("The magnetic brakes engage and slow your descent!")
     print("Your fall slows dramatically, leaving you with an incredible adrenaline rush!")
-    time.sleep(2)
+    pause(2)
 
     # Reaction
     print("\nAs your seat gently returns to the loading platform, you notice")
@@ -6748,12 +6749,12 @@ def spinning_teacups() -> None:
 
     print(f"\nYou climb into the {color} teacup and sit down.")
     print("Each teacup has a wheel in the center that you can spin to go even faster!")
-    time.sleep(2)
+    pause(2)
 
     # Ride starts
     print("\nThe ride starts to move, and the platform begins rotating...")
     print("Your teacup starts to gently spin on its own...")
-    time.sleep(2)
+    pause(2)
 
     # Interactive spinning
     print("\nHow fast do you want to spin your teacup?")
@@ -6774,7 +6775,7 @@ def spinning_teacups() -> None:
         print("\nYou spin the wheel gently, enjoying a pleasant rotation.")
         print("You can appreciate the colorful lights and music as you spin.")
         print("This is quite relaxing and enjoyable!")
-        time.sleep(2)
+        pause(2)
         print("\nYou finish the ride feeling happy and not at all dizzy.")
         dizzy_factor = "not dizzy at all"
 
@@ -6782,7 +6783,7 @@ def spinning_teacups() -> None:
         print("\nYou spin the wheel with moderate effort.")
         print("Your teacup spins faster, creating a fun whirling sensation!")
         print("You laugh as the world blurs slightly around you.")
-        time.sleep(2)
+        pause(2)
         print("\nYou finish the ride with a slight case of the wobbles.")
         dizzy_factor = "slightly dizzy"
 
@@ -6791,7 +6792,7 @@ def spinning_teacups() -> None:
         print("Your teacup becomes a colorful blur as it spins wildly!")
         print("The centrifugal force pushes you against the side of the teacup!")
         print("WHEEEEEEEEE!")
-        time.sleep(2)
+        pause(2)
         print("\nYou finish the ride stumbling and dizzy, but exhilarated!")
         dizzy_factor = "extremely dizzy but thrilled"
 
@@ -6827,21 +6828,21 @@ def river_rapids() -> None:
     # Ride begins
     print("\nYou climb into a large circular raft with several other passengers.")
     print("Everyone grabs the handles in the center as the attendant pushes you off.")
-    time.sleep(2)
+    pause(2)
 
     # Start of journey
     print("\nYour raft begins floating down a gentle river...")
     print("The scenery is beautiful with lush vegetation on both sides.")
     print("Birds chirp and butterflies flutter around colorful flowers.")
-    time.sleep(2)
+    pause(2)
 
     # First rapids
     print("\nYou hear the sound of rushing water ahead...")
     print("Your raft approaches the first section of rapids!")
-    time.sleep(1)
+    pause(1)
     print("SPLASH! The raft bounces and spins as it hits the churning water!")
     print("Everyone screams and laughs as water sprays into the raft!")
-    time.sleep(2)
+    pause(2)
 
     # Interactive moment
     print("\nThe raft reaches a calm section, but there are rapids ahead on both sides.")
@@ -6872,16 +6873,16 @@ def river_rapids() -> None:
     print("\nYour raft enters a mysterious cave...")
     print("Glowing formations illuminate the ceiling, creating magical reflections on the water.")
     print("The echoing sounds of dripping water create an eerie atmosphere.")
-    time.sleep(2)
+    pause(2)
 
     # Final rapids
     print("\nYou exit the cave and hear the roar of the biggest rapids yet!")
     print("Everyone holds on tight as the raft approaches...")
-    time.sleep(1)
+    pause(1)
     print("WHOOSH! SPLASH! SPIN!")
     print("Your raft bounces, spins, and rocks through the wildest rapids yet!")
     print("Water splashes in from every direction!")
-    time.sleep(2)
+    pause(2)
 
     # End of ride
     print(f"\nYour raft finally reaches calm water and returns to the station, everyone {wetness}.")
@@ -6953,7 +6954,7 @@ def water_slides() -> None:
         print("\nYou glide smoothly down the winding blue slide.")
         print("The gentle curves make for a relaxing ride.")
         print("You can enjoy the scenery as you float along at a pleasant pace.")
-        time.sleep(2)
+        pause(2)
         print("\nYou splash into the landing pool with a gentle 'swoosh'.")
         print("That was a nice, easy ride!")
         experience = "relaxing"
@@ -6962,7 +6963,7 @@ def water_slides() -> None:
         print("\nYou zip down the green slide, encountering turn after turn!")
         print("Left, right, left, right - the twists keep coming!")
         print("The changing directions make for an exciting but not too intense ride.")
-        time.sleep(2)
+        pause(2)
         print("\nAfter the final twist, you splash into the landing pool with a 'splash'!")
         print("That was a fun, twisty adventure!")
         experience = "twisty and fun"
@@ -6974,7 +6975,7 @@ def water_slides() -> None:
 
         # Timer for racing slide
         race_time = round(random.uniform(9.5, 15.2), 1)
-        time.sleep(2)
+        pause(2)
         print("\nYou splash into the landing pool with a big 'SPLASH'!")
         print(f"Your time: {race_time} seconds!")
 
@@ -6993,11 +6994,11 @@ def water_slides() -> None:
         print("\nYou look down the steep orange slide with a gulp...")
         print("It's nearly vertical at the start!")
         print("Here goes nothing...")
-        time.sleep(1)
+        pause(1)
         print("\nWHOOOOSH! You plummet straight down!")
         print("Your stomach feels like it's floating as you experience weightlessness!")
         print("The free-fall sensation is incredible!")
-        time.sleep(2)
+        pause(2)
         print("\nYou hit the runout section and splash into the landing pool with a big 'KERPLUNK'!")
         print("Your heart is racing from the adrenaline rush!")
         experience = "heart-pounding"
@@ -7006,11 +7007,11 @@ def water_slides() -> None:
         print("\nYou enter the dark red tube with trepidation...")
         print("As soon as you start, you're plunged into complete darkness!")
         print("WHOOSH! You feel a sudden drop!")
-        time.sleep(1)
+        pause(1)
         print("\nYou can't see anything as you twist, turn, and plummet!")
         print("The disorientation adds to the thrill as you rocket through the tube!")
         print("Another unexpected drop makes your stomach lurch!")
-        time.sleep(2)
+        pause(2)
         print("\nFinally, you see light and splash into the landing pool with a massive 'SPLOOSH'!")
         print("That was the most intense water slide experience ever!")
         experience = "absolutely thrilling"
@@ -7057,12 +7058,12 @@ def ghost_train() -> None:
     print("\nYou board an old-fashioned train car decorated with cobwebs and skulls.")
     print("The conductor, dressed as a skeleton, welcomes you aboard.")
     print("'Welcome to the Ghost Train! Please keep your limbs inside... if you want to keep them!'")
-    time.sleep(2)
+    pause(2)
 
     # Train starts
     print("\nWith a ghostly whistle, the train lurches forward into a dark tunnel...")
     print("Eerie music plays from hidden speakers as you enter the haunted forest.")
-    time.sleep(2)
+    pause(2)
 
     # The experience - random scares
     scares = [
@@ -7101,17 +7102,17 @@ def ghost_train() -> None:
             print("You remain stoic. The skeleton conductor looks impressed.")
             fear_level += 1
 
-        time.sleep(1.5)
+        pause(1.5)
 
     # Grand finale
     print("\nThe train approaches the final scene - a massive graveyard...")
     print("Suddenly, all the graves open at once and spectral figures rise!")
     print("They surround the train, reaching in through the windows!")
     print("The lights flicker and go out completely!")
-    time.sleep(3)
+    pause(3)
 
     print("\nA moment of complete darkness and silence...")
-    time.sleep(2)
+    pause(2)
 
     print("\nThe lights come back on and you're back at the station!")
     print("'We hope you enjoyed your journey to the other side,' says the conductor.")
@@ -7168,7 +7169,7 @@ def carnival_carousel() -> None:
     print("\nYou approach the magnificent carousel, admiring its intricate details.")
     print("Colorful lights twinkle as the ornate organ music fills the air.")
     print("The carousel features dozens of hand-carved and painted animals.")
-    time.sleep(2)
+    pause(2)
 
     # Choose animal
     animals = [
@@ -7197,19 +7198,19 @@ def carnival_carousel() -> None:
 
     print(f"\nYou climb onto the {animal['color']} {animal['name']} with its {animal['special']}.")
     print("You hold onto the brass pole as the ride attendant checks that everyone is secure.")
-    time.sleep(2)
+    pause(2)
 
     # Ride starts
     print("\nThe carousel begins to move, gradually picking up speed...")
     print("The beautiful organ music plays a cheerful melody.")
     print("Colorful lights reflect off the mirrored panels as you rotate.")
-    time.sleep(2)
+    pause(2)
 
     # Ride experience
     print("\nYou go up and down on your animal as the carousel spins.")
     print("The world outside becomes a colorful blur as you focus on the intricate details.")
     print("There's something magical and timeless about the carousel experience.")
-    time.sleep(2)
+    pause(2)
 
     # Special moments based on animal choice
     if animal["name"] == "Majestic Horse":
@@ -7292,7 +7293,7 @@ def bumper_cars() -> None:
 
     print(f"\nYou climb into the {car_color} Car and buckle the safety belt.")
     print("You test the pedal and steering wheel, ready for some bumping action!")
-    time.sleep(2)
+    pause(2)
 
     # Generate other drivers
     other_drivers = []
@@ -7304,7 +7305,7 @@ def bumper_cars() -> None:
     # Ride starts
     print("\nThe buzzer sounds and the floor electrifies!")
     print("All cars spring to life, and the bumping begins!")
-    time.sleep(1)
+    pause(1)
 
     # Bumper car sequence
     print("\nYou press the pedal and your car lurches forward...")
@@ -7398,7 +7399,7 @@ def bumper_cars() -> None:
                 "A Yellow Car does a perfect 360 spin after being hit!"
             ])
             print(f"\n{random_event}")
-            time.sleep(1.5)
+            pause(1.5)
 
     # End of ride
     print("\nThe buzzer sounds again, and all cars gradually slow to a stop.")
@@ -7476,24 +7477,24 @@ def cinema_4d() -> None:
     print(f"\nYou enter the 4D theater for '{film['title']}'.")
     print("The usher hands you a pair of 3D glasses and shows you to your seat.")
     print("The specialized chairs have built-in effects systems.")
-    time.sleep(2)
+    pause(2)
 
     # Film starts
     print(f"\nThe lights dim and '{film['title']}' begins...")
     print("The 3D visuals immediately pop out from the screen, creating depth and realism.")
-    time.sleep(2)
+    pause(2)
 
     # Film experience based on the film chosen
     if film["title"] == "Ocean Explorer":
         # Ocean Explorer experience
         print("\nYou dive beneath the waves in an underwater adventure...")
-        time.sleep(1.5)
+        pause(1.5)
         print("As fish swim toward the camera, your seat gently moves in sync!")
-        time.sleep(1.5)
+        pause(1.5)
         print("A whale sprays water - and a fine mist sprays onto your face!")
-        time.sleep(1.5)
+        pause(1.5)
         print("The ocean breeze is simulated with cool air flowing through the theater.")
-        time.sleep(1.5)
+        pause(1.5)
         print("As you pass a coral reef, the scent of the ocean fills the air!")
 
         highlight = "swimming with dolphins as water sprayed from the ceiling"
@@ -7501,13 +7502,13 @@ def cinema_4d() -> None:
     elif film["title"] == "Cosmic Adventure":
         # Cosmic Adventure experience
         print("\nYou board a spaceship for an intergalactic journey...")
-        time.sleep(1.5)
+        pause(1.5)
         print("The launch sequence begins, and your seat vibrates with the rocket engines!")
-        time.sleep(1.5)
+        pause(1.5)
         print("As you fly through an asteroid field, your seat jerks left and right!")
-        time.sleep(1.5)
+        pause(1.5)
         print("A nearby star explodes with brilliant strobe effects!")
-        time.sleep(1.5)
+        pause(1.5)
         print("Air blasts hit your neck as alien creatures fly past your ship!")
 
         highlight = "the meteor shower sequence with intense seat movement"
@@ -7515,13 +7516,13 @@ def cinema_4d() -> None:
     elif film["title"] == "Jungle Quest":
         # Jungle Quest experience
         print("\nYou venture deep into an unexplored rainforest...")
-        time.sleep(1.5)
+        pause(1.5)
         print("The rich scents of exotic flowers fill the theater!")
-        time.sleep(1.5)
+        pause(1.5)
         print("Your seat shifts as you navigate across a rickety bridge!")
-        time.sleep(1.5)
+        pause(1.5)
         print("Something brushes against your legs - the ticklers simulating plants!")
-        time.sleep(1.5)
+        pause(1.5)
         print("A waterfall appears, and a gentle spray of water mists your face!")
 
         highlight = "the butterfly swarm with scents and gentle ticklers on your legs"
@@ -7529,19 +7530,19 @@ def cinema_4d() -> None:
     else:  # Thrill Ride
         # Thrill Ride experience
         print("\nYou're strapped into a virtual roller coaster adventure...")
-        time.sleep(1.5)
+        pause(1.5)
         print("The first drop sends your seat tilting forward dramatically!")
-        time.sleep(1.5)
+        pause(1.5)
         print("Air blasts hit your face as you virtually speed through tunnels!")
-        time.sleep(1.5)
+        pause(1.5)
         print("The entire seat vibrates as you cross a rickety wooden track section!")
-        time.sleep(1.5)
+        pause(1.5)
         print("Strobe lights create a dizzying effect as you spin through a loop!")
 
         highlight = "the massive loop-de-loop with synchronized seat movement"
 
     # Film ends
-    time.sleep(2)
+    pause(2)
     print(f"\nThe '{film['title']}' experience comes to an end.")
     print("The lights come up as you remove your 3D glasses.")
     print(f"The most incredible part was {highlight}!")
@@ -7575,25 +7576,25 @@ def dinosaur_safari() -> None:
     print("\nYou enter the Dinosaur Safari building, designed like a research facility.")
     print("A park ranger greets you: 'Welcome to the Temporal Dinosaur Safari!'")
     print("'Today you'll journey 65 million years into the past using our time rover.'")
-    time.sleep(2)
+    pause(2)
 
     # Pre-show
     print("\nYou watch a brief pre-show video explaining the 'technology'")
     print("behind the time travel and safety precautions for observing dinosaurs.")
     print("'Remember,' says the scientist on screen, 'we're observing only. No interaction!'")
-    time.sleep(2)
+    pause(2)
 
     # Board the vehicle
     print("\nYou board a rugged-looking vehicle called the 'Time Rover'.")
     print("It has oversized wheels and reinforced windows for 'dinosaur protection'.")
     print("The ranger secures your safety harness and starts the vehicle's 'temporal engines'.")
-    time.sleep(2)
+    pause(2)
 
     # Start of safari
     print("\nThe time machine activates! Lights flash and fog fills the chamber...")
     print("The vehicle shakes and rumbles as you 'travel through time'...")
     print("Suddenly, everything clears, and you find yourself in a prehistoric landscape!")
-    time.sleep(2)
+    pause(2)
 
     # Dinosaur encounters
     dinos = [
@@ -7638,36 +7639,36 @@ def dinosaur_safari() -> None:
             print("The magnificent creature continues its natural behavior undisturbed.")
             print("The ranger commends your respect for wildlife protocols.")
 
-        time.sleep(2)
+        pause(2)
 
     # T-Rex encounter - the main event
     print("\nThe radio crackles with an urgent message:")
     print("'Ranger, be advised: T-Rex detected in your sector. Proceed with caution.'")
     print("\nYour heart races as the Time Rover enters a dense forest area...")
-    time.sleep(2)
+    pause(2)
 
     print("\nSuddenly, trees crash down ahead!")
     print("A massive Tyrannosaurus Rex bursts through the foliage, roaring ferociously!")
     print("The ground shakes with each step of the apex predator!")
-    time.sleep(2)
+    pause(2)
 
     # T-Rex chase sequence
     print("\nThe T-Rex spots your rover and charges!")
     print("'HANG ON!' shouts the ranger, throwing the vehicle into reverse!")
     print("The massive dinosaur pursues you through the prehistoric jungle!")
     print("Your rover bounces violently over the terrain as the T-Rex gains ground!")
-    time.sleep(2)
+    pause(2)
 
     print("\nJust as the T-Rex is about to catch you, the vehicle plunges into a cave!")
     print("The dinosaur roars in frustration, too large to follow!")
     print("That was an incredibly close call!")
-    time.sleep(2)
+    pause(2)
 
     # Return to present
     print("\n'Initiating emergency temporal recall!' announces the ranger.")
     print("The time machine activates, surroundings blur, and lights flash...")
     print("With a final jolt, you return to the present day!")
-    time.sleep(2)
+    pause(2)
 
     # End of ride
     print("\nThe ranger wipes sweat from his brow: 'Well folks, that was")
@@ -7728,7 +7729,7 @@ def petting_zoo() -> None:
     print("filled with friendly farm animals and the sound of happy children.")
     print("A zoo keeper hands you a small paper cone filled with animal feed.")
     print("'Remember to let the animals approach you and be gentle,' they advise.")
-    time.sleep(2)
+    pause(2)
 
     # Animal encounters
     visited_animals = []
@@ -7823,7 +7824,7 @@ def petting_zoo() -> None:
             elif buy_photo == "y":
                 print(Fore.RED + "Not enough tickets to buy the photo!")
 
-        time.sleep(2)
+        pause(2)
 
     # End of visit
     if feed_remaining <= 0:
@@ -7868,7 +7869,7 @@ def zombie_escape() -> None:
     print("'Thank goodness you're here! Our experiment went terribly wrong!'")
     print("'The infection is spreading, and the zombies are everywhere!'")
     print("'You need to help us escape this facility!'")
-    time.sleep(3)
+    pause(3)
 
     # Start of interactive experience
     print("\nSuddenly, alarms blare and red emergency lights flash!")
@@ -7891,7 +7892,7 @@ def zombie_escape() -> None:
     if choice1 == "1":
         print("\nYou dash into the main corridor!")
         print("As you run, you hear moaning echoes bouncing off the walls...")
-        time.sleep(1.5)
+        pause(1.5)
         print("\nSuddenly, a zombie scientist lurches around the corner!")
         zombie_encounters += 1
 
@@ -7912,7 +7913,7 @@ def zombie_escape() -> None:
         print("\nYou climb into the air vents!")
         print("The metal creaks as you crawl through the narrow passages.")
         print("It's dark and dusty, but you don't hear any zombies...")
-        time.sleep(2)
+        pause(2)
         print("\nAs you crawl, you spot a security office below through a vent.")
         print("You can see a keycard and a stun baton on the desk.")
 
@@ -8102,46 +8103,46 @@ def splash_mountain() -> None:
     # Ride begins
     print("\nYou climb into a hollowed-out log boat and secure yourself.")
     print("The ride attendant reminds you: 'You may get wet on this ride!'")
-    time.sleep(2)
+    pause(2)
 
     # Start of journey
     print("\nYour log begins its journey, floating gently through a peaceful river...")
     print("Colorful animatronic animals sing cheerful songs along the banks.")
-    time.sleep(2)
+    pause(2)
 
     # First small drop
     print("\nYou approach a small drop...")
-    time.sleep(1)
+    pause(1)
     print("Whoosh! Your log slides down, creating a small splash!")
     print("Just a teaser of what's to come...")
-    time.sleep(2)
+    pause(2)
 
     # Middle section
     print("\nYour log winds through a charming forest scene...")
     print("More animatronic animals tell the story of the mountain.")
-    time.sleep(2)
+    pause(2)
 
     # Cave section
     print("\nYou enter a dark cave... the music becomes more ominous...")
     print("Strange glowing eyes peek out from the darkness.")
-    time.sleep(2)
+    pause(2)
 
     # Climb to final drop
     print("\nYour log begins the long climb up to the summit of Splash Mountain...")
     print("Clickety-clack... the chain pulls you higher and higher...")
     print("You can see the entire park as you near the top!")
-    time.sleep(3)
+    pause(3)
 
     # The big drop
     print("\nYou reach the top and pause for a moment...")
     print("You look down at the MASSIVE drop before you...")
-    time.sleep(1)
+    pause(1)
     print("HERE IT COMES...")
-    time.sleep(1)
+    pause(1)
     print("WHOOOOOOOOOOSH!!!")
     print("Your log plummets down the steep drop at high speed!")
     print("You raise your arms and scream with excitement!")
-    time.sleep(2)
+    pause(2)
 
     # The splash
     splash_size = random.choice(["ENORMOUS", "MASSIVE", "GIGANTIC", "COLOSSAL"])
@@ -8206,13 +8207,13 @@ def cosmic_coaster() -> None:
     print("Hold tight as we blast off into the cosmos!")
 
     print("\nThe ride operator secures your safety harness...")
-    time.sleep(1.5)
+    pause(1.5)
     print("3...")
-    time.sleep(0.7)
+    pause(0.7)
     print("2...")
-    time.sleep(0.7)
+    pause(0.7)
     print("1...")
-    time.sleep(0.7)
+    pause(0.7)
     print(Fore.YELLOW + "BLAST OFF! 🚀")
 
     # Interactive ride simulation
@@ -8244,7 +8245,7 @@ def cosmic_coaster() -> None:
         print("\nYour coaster plunges toward a swirling black hole!")
         print("The gravitational forces intensify as you spiral inward!")
         print("Everything goes dark for a moment...")
-        time.sleep(2)
+        pause(2)
         print(Fore.MAGENTA + "\nSUDDENLY! You're ejected through a wormhole!")
         print("The crowd gasps as your coaster performs an impossible loop!")
         reward = random.randint(7, 12)
@@ -8265,11 +8266,11 @@ def log_flume() -> None:
     print("Get ready to make a splash!")
 
     print("\nYou climb aboard your hollow log boat...")
-    time.sleep(1)
+    pause(1)
     print("The water current carries you through a peaceful river...")
-    time.sleep(1.5)
+    pause(1.5)
     print("Birds chirp and animatronic animals wave as you pass by...")
-    time.sleep(1.5)
+    pause(1.5)
     print(Fore.YELLOW + "Wait! You're approaching the final drop!")
 
     # Build suspense
@@ -8316,9 +8317,9 @@ def haunted_mansion() -> None:
 
     # Intro
     print("\nThe door creaks open, inviting you inside...")
-    time.sleep(1.5)
+    pause(1.5)
     print("A ghostly butler bows and gestures toward the hallway...")
-    time.sleep(1.5)
+    pause(1.5)
 
     # Room 1
     print("\n--- The Portrait Gallery ---")
@@ -8401,9 +8402,9 @@ def ferris_wheel() -> None:
 
     # Start the ride
     print("\nYou board your passenger car...")
-    time.sleep(1)
+    pause(1)
     print("The wheel begins to turn slowly...")
-    time.sleep(1.5)
+    pause(1.5)
     print("You rise higher and higher above the carnival...")
 
     # Random events
@@ -8419,7 +8420,7 @@ def ferris_wheel() -> None:
     event = random.choice(events)
     reward = int(event.split("+")[1].split()[0])
 
-    time.sleep(2)
+    pause(2)
     print(Fore.YELLOW + f"\n{event}")
 
     # Photo opportunity
@@ -8724,11 +8725,11 @@ def photo_booth() -> None:
     # Take the photos
     print("\nGet ready for your photo session!")
     print("3...")
-    time.sleep(0.7)
+    pause(0.7)
     print("2...")
-    time.sleep(0.7)
+    pause(0.7)
     print("1...")
-    time.sleep(0.7)
+    pause(0.7)
     print(Fore.YELLOW + "SMILE! 📸")
 
     # Photo results
@@ -8791,7 +8792,7 @@ def magic_show() -> None:
     # Find your seat
     print("\nThe usher shows you to your seat. The theater is filling up!")
     print("The lights dim and smoke fills the stage...")
-    time.sleep(2)
+    pause(2)
 
     print(Fore.YELLOW + "\n🎭 LADIES AND GENTLEMEN! 🎭")
     print("🎭 WELCOME TO THE MOST MAGICAL SHOW ON EARTH! 🎭")
@@ -8817,9 +8818,9 @@ def magic_show() -> None:
 
         print(f"\nYou select the {card} and show it to the audience, but not to Zoltar.")
         print("He asks you to put it back in the deck, which he shuffles thoroughly.")
-        time.sleep(1.5)
+        pause(1.5)
         print("\nZoltar waves his hands mysteriously over the deck...")
-        time.sleep(1.5)
+        pause(1.5)
         print(f"'Your card was the... {card}!'")
         print("\nThe audience gasps and erupts in applause!")
         print("You receive 5 bonus tickets for participating!")
@@ -8837,9 +8838,9 @@ def magic_show() -> None:
         print("\nYou join Zoltar on stage again!")
         print("You check the box thoroughly and confirm there are no hidden compartments.")
         print("Zoltar's assistant steps into the box, and he closes the door.")
-        time.sleep(1.5)
+        pause(1.5)
         print("\nDrums roll... Zoltar waves his wand...")
-        time.sleep(1.5)
+        pause(1.5)
         print("The box is opened to reveal... EMPTY!")
         print("The audience is stunned!")
 
@@ -8880,7 +8881,7 @@ def magic_show() -> None:
 
         # Build suspense
         print("\nHe asks you to reveal your number to the audience...")
-        time.sleep(2)
+        pause(2)
 
         # The trick "works" 80% of the time
         if random.randint(1, 10) <= 8:
@@ -9239,11 +9240,11 @@ def treasure_hunt() -> None:
                 print(Fore.RED + "Invalid location!")
 
             attempts -= 1
-            time.sleep(1)
+            pause(1)
 
         except (ValueError, IndexError):
             print(Fore.RED + "Invalid input! Please enter a number.")
-            time.sleep(1)
+            pause(1)
 
     # Game result
     clear()
@@ -9477,7 +9478,7 @@ def manage_deck() -> None:
             break
         else:
             print(Fore.RED + "Invalid choice!")
-            time.sleep(1)
+            pause(1)
 
 
 def view_collection() -> None:
@@ -9825,7 +9826,7 @@ def card_battle(opponent: Optional[str] = None, championship: bool = False) -> N
 
         player_hand.remove(player_card)
         cpu_hand.remove(cpu_card)
-        time.sleep(1)
+        pause(1)
 
     # Game result
     print(f"\nFinal Score - You: {player_score} | CPU: {cpu_score}")
@@ -10088,7 +10089,7 @@ def premium_minigames() -> Dict[str, Any]:
         print("Watch the sequence:")
         for beat in sequence:
             print(beat, end=" ", flush=True)
-            time.sleep(0.8)
+            pause(0.8)
 
         print("\n\nNow repeat it back!")
         player_input = input("Enter the sequence (separate with spaces): ").split()
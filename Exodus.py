@@ -6,6 +6,7 @@ import pickle
 import re
 from colorama import Fore, Back, Style, init
 from typing import Dict, List, Any, Optional, Union, Tuple
+from text_mode import TEXT_MODE, pause
 
 # Initialize colorama
 init(autoreset=True, strip=True if os.name != 'nt' else None)
@@ -1012,7 +1013,7 @@ def load_game(slot_number: int = 1) -> bool:
             # Auto-save with the updated format if needed
             if needs_upgrade:
                 # Wait a moment before saving to ensure player sees the upgrade message
-                time.sleep(1)
+                pause(1)
                 try:
                     save_game(slot_number)
                     print(Font.INFO("Auto-saved game with updated format."))
@@ -1402,39 +1403,39 @@ def manage_save_slots() -> Any:
         
         if action == "1":
             print_typed("\nAccessing quantum memory storage...", style=Font.SYSTEM)
-            time.sleep(1)
+            pause(1)
             loaded = load_game(slot_number)
-            time.sleep(1)
+            pause(1)
             return loaded
         elif action == "2":
             print_typed("\nPreparing to overwrite quantum cell data...", style=Font.SYSTEM)
             confirm = input(f"\n{Font.WARNING('Confirm cell overwrite? All existing data will be lost. (y/n):')} ").strip().lower()
             if confirm == "y":
                 print_typed("\nInitiating memory transfer...", style=Font.SYSTEM)
-                time.sleep(1)
+                pause(1)
                 save_game(slot_number)
-                time.sleep(1)
+                pause(1)
         elif action == "3":
             print_typed("\nPreparing quantum purge protocol...", style=Font.SYSTEM)
             confirm = input(f"\n{Font.WARNING('Confirm complete data purge from cell ' + str(slot_number) + '? (y/n):')} ").strip().lower()
             if confirm == "y":
                 try:
                     print_typed("\nPurging quantum cell contents...", style=Font.SYSTEM)
-                    time.sleep(1)
+                    pause(1)
                     os.remove(f"saves/save_slot_{slot_number}.dat")
                     print(Font.SUCCESS(f"\nQuantum storage cell {slot_number} successfully purged."))
-                    time.sleep(1)
+                    pause(1)
                 except Exception as e:
                     print(Font.WARNING(f"\nError during purge operation: {e}"))
-                    time.sleep(1)
+                    pause(1)
     else:
         print_typed("\nEmpty quantum storage cell detected. Ready for new data.", style=Font.SYSTEM)
         confirm = input(f"\n{Font.MENU('Store current memory state in cell ' + str(slot_number) + '? (y/n):')} ").strip().lower()
         if confirm == "y":
             print_typed("\nInitiating memory transfer...", style=Font.SYSTEM)
-            time.sleep(1)
+            pause(1)
             save_game(slot_number)
-            time.sleep(1)
+            pause(1)
     
     input("\nPress Enter to return to Quantum Memory Archive...")
     return manage_save_slots()  # Return to the save management menu
@@ -1445,19 +1446,23 @@ def print_slow(text: str, delay: float = 0.03, style: Optional[str] = None) -> N
     # Apply styling if specified
     styled_text = style(text) if style else text
 
+    if TEXT_MODE != "cinematic":
+        print(text if style else styled_text)
+        return
+
     # If style is applied, we need to print character by character without styling
     # to preserve the timing effect, then apply the style at the end
     if style:
         for char in text:
             sys.stdout.write(char)
             sys.stdout.flush()
-            time.sleep(delay)
+            pause(delay)
         print()
     else:
         for char in styled_text:
             sys.stdout.write(char)
             sys.stdout.flush()
-            time.sleep(delay)
+            pause(delay)
         print()
 
 def print_typed(text: str, delay: float = 0.01, style: Optional[str] = None) -> None:
@@ -1465,41 +1470,49 @@ def print_typed(text: str, delay: float = 0.01, style: Optional[str] = None) ->
     # Apply styling if specified
     styled_text = style(text) if style else text
 
+    if TEXT_MODE != "cinematic":
+        print(text if style else styled_text)
+        return
+
     # Similar approach as print_slow
     if style:
         for char in text:
             sys.stdout.write(char)
             sys.stdout.flush()
             if char in ['.', '!', '?']:
-                time.sleep(delay * 5)
+                pause(delay * 5)
             else:
-                time.sleep(delay)
+                pause(delay)
         print()
     else:
         for char in styled_text:
             sys.stdout.write(char)
             sys.stdout.flush()
             if char in ['.', '!', '?']:
-                time.sleep(delay * 5)
+                pause(delay * 5)
             else:
-                time.sleep(delay)
+                pause(delay)
         print()
 
 def print_glitch(text: Any, style: Any = Font.GLITCH) -> None:
     """Print text with a glitchy effect"""
     glitch_chars = "!@#$%^&*()_+-=<>?/\\|"
 
+    if TEXT_MODE != "cinematic":
+        print(text)
+        return
+
     for char in text:
         if random.random() < 0.1:  # 10% chance of glitching
             glitch_char = random.choice(glitch_chars)
             sys.stdout.write(Style.BRIGHT + Fore.RED + glitch_char + Style.RESET_ALL)
             sys.stdout.flush()
-            time.sleep(0.01)
+            pause(0.01)
             sys.stdout.write('\b' + char)  # Backspace and print correct char
         else:
             sys.stdout.write(char)
         sys.stdout.flush()
-        time.sleep(0.02)
+        pause(0.02)
     print()
 
 # Clear screen function for better UI
@@ -3878,68 +3891,68 @@ class Character:
         # Animated level up display
         for _ in range(3):  # Flash animation
             clear_screen()
-            time.sleep(0.1)
+            pause(0.1)
             print(Font.BOX_TOP)
             print(f"{Font.BOX_SIDE} {Font.IMPORTANT('⚡ LEVEL UP ⚡').center(48)} {Font.BOX_SIDE}")
             print(f"{Font.BOX_SIDE} {f'{protagonist_name} reaches Level {self.level}!'.center(48)} {Font.BOX_SIDE}")
             print(Font.BOX_BOTTOM)
-            time.sleep(0.1)
+            pause(0.1)
             
         print(Font.SEPARATOR)
         
         # Animated stat increases with visual bars
         # Health display with animation
         print(f"{Font.PLAYER('Maximum Health:')}", end="", flush=True)
-        time.sleep(0.3)
+        pause(0.3)
         print(f" +{health_gain} ", end="", flush=True)
-        time.sleep(0.3)
+        pause(0.3)
         print(f"({self.max_health})")
         
         # Visual health bar with growth animation
         old_health_bar = "█" * min(30, (self.max_health - health_gain) // 5)
         health_bar = "█" * min(30, self.max_health // 5)
         print(f"{Fore.RED}{old_health_bar}", end="", flush=True)
-        time.sleep(0.5)
+        pause(0.5)
         # Show the increase
         for i in range(len(old_health_bar), len(health_bar)):
             print(f"{Fore.LIGHTRED_EX}█", end="", flush=True)
-            time.sleep(0.05)
+            pause(0.05)
         print(f"{Style.RESET_ALL}")
         
         # Attack display with animation
         print(f"{Font.PLAYER('Attack Power:')}", end="", flush=True)
-        time.sleep(0.3)
+        pause(0.3)
         print(f" +{attack_gain} ", end="", flush=True)
-        time.sleep(0.3)
+        pause(0.3)
         print(f"({self.attack})")
         
         # Visual attack bar with growth animation
         old_attack_bar = "█" * min(25, (self.attack - attack_gain) // 2)
         attack_bar = "█" * min(25, self.attack // 2)
         print(f"{Fore.YELLOW}{old_attack_bar}", end="", flush=True)
-        time.sleep(0.5)
+        pause(0.5)
         # Show the increase
         for i in range(len(old_attack_bar), len(attack_bar)):
             print(f"{Fore.LIGHTYELLOW_EX}█", end="", flush=True)
-            time.sleep(0.05)
+            pause(0.05)
         print(f"{Style.RESET_ALL}")
         
         # Defense display with animation
         print(f"{Font.PLAYER('Defense Rating:')}", end="", flush=True)
-        time.sleep(0.3)
+        pause(0.3)
         print(f" +{defense_gain} ", end="", flush=True)
-        time.sleep(0.3)
+        pause(0.3)
         print(f"({self.defense})")
         
         # Visual defense bar with growth animation
         old_defense_bar = "█" * min(20, (self.defense - defense_gain) // 2)
         defense_bar = "█" * min(20, self.defense // 2)
         print(f"{Fore.BLUE}{old_defense_bar}", end="", flush=True)
-        time.sleep(0.5)
+        pause(0.5)
         # Show the increase
         for i in range(len(old_defense_bar), len(defense_bar)):
             print(f"{Fore.LIGHTBLUE_EX}█", end="", flush=True)
-            time.sleep(0.05)
+            pause(0.05)
         print(f"{Style.RESET_ALL}")
         
         # Display any new unlocks from level up
@@ -3953,9 +3966,9 @@ class Character:
                 # Progressive reveal animation
                 for i in range(len(unlock) + 1):
                     print(f"\r{Font.ITEM(unlock[:i])}", end="", flush=True)
-                    time.sleep(0.02)
+                    pause(0.02)
                 print()
-                time.sleep(0.5)
+                pause(0.5)
                 
             # Add descriptive text based on milestone levels with gender-specific variations
             if self.level == 3:
@@ -4068,7 +4081,7 @@ def use_character_ability(player: Any, enemy: Any, combat_state: Any) -> Any:
     # Check if player has characters
     if not game_state.get("character_collection"):
         print(f"\n{Font.WARNING('No ally characters available to assist you.')}")
-        time.sleep(1)
+        pause(1)
         return False
         
     clear_screen()
@@ -4094,7 +4107,7 @@ def use_character_ability(player: Any, enemy: Any, combat_state: Any) -> Any:
     if not available_chars:
         print(f"\n{Font.WARNING('All allies are on quantum cooldown.')}")
         print(f"{Font.INFO('Ally abilities can only be used once per combat encounter.')}")
-        time.sleep(2)
+        pause(2)
         return False
     
     # Display available characters with corresponding abilities
@@ -4129,16 +4142,16 @@ def use_character_ability(player: Any, enemy: Any, combat_state: Any) -> Any:
                 return activate_character_ability(selected_char, player, enemy, combat_state)
             else:
                 print(f"\n{Font.WARNING('Invalid selection. Please try again.')}")
-                time.sleep(1)
+                pause(1)
                 return use_character_ability(player, enemy, combat_state)
         else:
             print(f"\n{Font.WARNING('Please enter a number.')}")
-            time.sleep(1)
+            pause(1)
             return use_character_ability(player, enemy, combat_state)
             
     except ValueError:
         print(f"\n{Font.WARNING('Invalid input. Please try again.')}")
-        time.sleep(1)
+        pause(1)
         return use_character_ability(player, enemy, combat_state)
 
 def solve_musical_puzzle(game_state: Any, puzzle_type: Any) -> Any:
@@ -4211,7 +4224,7 @@ def solve_musical_puzzle(game_state: Any, puzzle_type: Any) -> Any:
         
         # Visual pattern display with animations
         print_typed(f"\n{Font.INFO('The sequence begins to play:')}")
-        time.sleep(0.5)
+        pause(0.5)
         
         for note in correct_sequence:
             # Visual feedback for each note
@@ -4221,7 +4234,7 @@ def solve_musical_puzzle(game_state: Any, puzzle_type: Any) -> Any:
                 print(f"{Fore.YELLOW}{note}{Style.RESET_ALL}", end=' ', flush=True)
             else:
                 print(f"{Fore.CYAN}{note}{Style.RESET_ALL}", end=' ', flush=True)
-            time.sleep(0.5)
+            pause(0.5)
         
         print() # Newline after sequence
         
@@ -4246,7 +4259,7 @@ def solve_musical_puzzle(game_state: Any, puzzle_type: Any) -> Any:
                     # Success animation
                     print_typed(f"\n{Font.SUCCESS('SEQUENCE ACCEPTED!')}")
                     for _ in range(3):
-                        time.sleep(0.2)
+                        pause(0.2)
                         print(f"{Fore.GREEN}■{Style.RESET_ALL}", end='', flush=True)
                     
                     # Reward based on attempts and difficulty
@@ -4261,7 +4274,7 @@ def solve_musical_puzzle(game_state: Any, puzzle_type: Any) -> Any:
                     print_typed(f"You receive {Font.SUCCESS(str(fragments_reward))} time fragments from the dimensional resonance!")
                     print_typed(f"Total fragments: {Font.IMPORTANT(str(game_state['time_fragments']))}")
                     
-                    time.sleep(1)
+                    pause(1)
                     return True
                 else:
                     # Find which notes were correct for partial feedback
@@ -4478,7 +4491,7 @@ def find_dimensional_chest(game_state: Any, difficulty: int = 1) -> Any:
         print_typed("\nAfter showing the sequence, the symbols disappear.")
         print_typed(f"\n{Font.SYSTEM('Enter the symbols in order (separate with spaces):')}")
         
-        time.sleep(3)  # Give the player time to memorize
+        pause(3)  # Give the player time to memorize
         clear_screen()  # Clear the screen to test their memory
         print_typed(f"\n{Font.HEADER('MEMORY RECALL REQUIRED')}")
         print_typed(f"\n{Font.SYSTEM('Enter the symbols in order (separate with spaces):')}")
@@ -4565,7 +4578,7 @@ def open_dimensional_chest(game_state: Any, difficulty: int = 1) -> Any:
     
     # Animated opening sequence
     print_typed(f"\nThe {Font.ITEM(chest_type)} begins to resonate with energy...", style=Font.INFO)
-    time.sleep(1)
+    pause(1)
     
     # Visual animation of chest opening
     phases = [
@@ -4585,12 +4598,12 @@ def open_dimensional_chest(game_state: Any, difficulty: int = 1) -> Any:
         print(f"{Fore.CYAN}{Back.BLACK}{'▀' * 60}{Style.RESET_ALL}")
         print("\n\n")
         print(phase)
-        time.sleep(0.5)
+        pause(0.5)
     
     # Final opening message with special effects
     clear_screen()
     print_glitch(">>> DIMENSIONAL ARTIFACT ACCESSED <<<")
-    time.sleep(0.7)
+    pause(0.7)
     print_typed(f"\n{Font.SUCCESS('DIMENSIONAL CHEST OPENED SUCCESSFULLY')}")
     
     # Determine player's experience level for reward scaling
@@ -4780,7 +4793,7 @@ def open_dimensional_chest(game_state: Any, difficulty: int = 1) -> Any:
     # Rolling animation for suspense
     print_typed("Analyzing quantum signatures...", style=Font.SYSTEM)
     for i in range(num_items):
-        time.sleep(0.5)
+        pause(0.5)
         print(f"{Fore.CYAN}■", end="", flush=True)
     print(f"{Style.RESET_ALL}")
     
@@ -4832,7 +4845,7 @@ def open_dimensional_chest(game_state: Any, difficulty: int = 1) -> Any:
         })
         
         # Visual delay between items for dramatic effect
-        time.sleep(0.7)
+        pause(0.7)
         
         # Display item with appropriate formatting
         print(f"\n[{tier_color}{item_tier}{Style.RESET_ALL}] {item_data['color']}{item_name.replace('_', ' ').title()}{Style.RESET_ALL}")
@@ -4913,7 +4926,7 @@ def activate_character_ability(char_name: Any, player: Any, enemy: Any, combat_s
     
     # Apply ability effects based on character and ability
     print_slow(f"\n{Font.PLAYER(char_name)} uses {Font.IMPORTANT(ability_name)}!", delay=0.04)
-    time.sleep(0.5)
+    pause(0.5)
     
     # Common ability types and their effects
     if "Damage" in ability_name or "Strike" in ability_name or "Burst" in ability_name or "Lance" in ability_name:
@@ -4967,7 +4980,7 @@ def activate_character_ability(char_name: Any, player: Any, enemy: Any, combat_s
     print_slow(f"\n{Font.PLAYER(char_name)} returns to their reality, the quantum link stabilized.")
     print(f"\n{Font.SEPARATOR}")
     
-    time.sleep(2)
+    pause(2)
     return True
 
 def display_stats(player: Any, enemy: Any) -> None:
@@ -5251,7 +5264,7 @@ def side_quest_system(player: Any, game_state: Any) -> Any:
                         print_typed(f"\n{Font.SUCCESS('Assignment accepted:')} {new_quest['name']}", style=Font.IMPORTANT)
                         print_typed("Details added to your mission log.", style=Font.SYSTEM)
                 
-                time.sleep(1)
+                pause(1)
             except ValueError:
                 pass
         
@@ -5337,7 +5350,7 @@ def side_quest_system(player: Any, game_state: Any) -> Any:
                     game_state["completed_quests"].append(selected_quest)
                     
                     print_typed("\nMission data transferred to completed records.", style=Font.SYSTEM)
-                    time.sleep(2)
+                    pause(2)
             except ValueError:
                 pass
         
@@ -5349,7 +5362,7 @@ def side_quest_system(player: Any, game_state: Any) -> Any:
     
     else:
         print_typed("\nInvalid selection. Please try again.", style=Font.WARNING)
-        time.sleep(1)
+        pause(1)
         return side_quest_system(player, game_state)
 
 def get_available_quests(current_zone: Any, chapter: Any) -> Any:
@@ -5658,7 +5671,7 @@ def flee_battle() -> Any:
     print(Font.SEPARATOR_THIN)
 
     print_typed("\nInitiating tactical retreat sequence...", style=Font.SYSTEM)
-    time.sleep(0.5)
+    pause(0.5)
 
     if random.random() < flee_chance:
         # Successful escape
@@ -5794,7 +5807,7 @@ def use_time_manipulation(player: Any, enemy: Any, combat_state: Any) -> Any:
                 print_typed("the local timeline backward.", style=Font.PLAYER)
                 
                 print_glitch(">>> REWINDING TIMELINE <<<")
-                time.sleep(1)
+                pause(1)
                 
                 # Restore player health from last enemy attack
                 last_damage = combat_state.get("last_enemy_damage", 0)
@@ -5804,7 +5817,7 @@ def use_time_manipulation(player: Any, enemy: Any, combat_state: Any) -> Any:
                 
                 print_typed(f"\nTime rewinds to before the enemy's attack. You regain {Font.SUCCESS(str(last_damage))} health!", style=Font.SUCCESS)
                 print_typed(f"Time Fragments remaining: {Font.INFO(str(game_state.get('time_fragments', 0)))}", style=Font.INFO)
-                time.sleep(1)
+                pause(1)
                 return True
             else:
                 print_typed("\nThere is no enemy attack to rewind.", style=Font.WARNING)
@@ -5820,7 +5833,7 @@ def use_time_manipulation(player: Any, enemy: Any, combat_state: Any) -> Any:
             print_typed("personal timeline. To the enemy, you appear to move at impossible speeds.", style=Font.PLAYER)
             
             print_glitch(">>> ACCELERATING TIMELINE <<<")
-            time.sleep(1)
+            pause(1)
             
             # Grant an extra action
             combat_state["extra_action"] = True
@@ -5828,7 +5841,7 @@ def use_time_manipulation(player: Any, enemy: Any, combat_state: Any) -> Any:
             
             print_typed("\nTime accelerates around you, granting an additional action this turn!", style=Font.SUCCESS)
             print_typed(f"Time Fragments remaining: {Font.INFO(str(game_state.get('time_fragments', 0)))}", style=Font.INFO)
-            time.sleep(1)
+            pause(1)
             return True
         else:
             print_typed("\nYou don't have enough time fragments for this ability.", style=Font.WARNING)
@@ -5841,7 +5854,7 @@ def use_time_manipulation(player: Any, enemy: Any, combat_state: Any) -> Any:
             print_typed("into the immediate future.", style=Font.PLAYER)
             
             print_glitch(">>> GLIMPSING FUTURE TIMELINE <<<")
-            time.sleep(1)
+            pause(1)
             
             # Determine enemy's next attack
             next_attack = random.choice(["melee", "ranged", "special"])
@@ -5862,7 +5875,7 @@ def use_time_manipulation(player: Any, enemy: Any, combat_state: Any) -> Any:
             game_state["time_fragments"] -= 1
             
             print_typed(f"\nTime Fragments remaining: {Font.INFO(str(game_state.get('time_fragments', 0)))}", style=Font.INFO)
-            time.sleep(1)
+            pause(1)
             return True
         else:
             print_typed("\nYou don't have enough time fragments for this ability.", style=Font.WARNING)
@@ -5875,7 +5888,7 @@ def use_time_manipulation(player: Any, enemy: Any, combat_state: Any) -> Any:
             print_typed("in a complex pattern before merging into a brilliant flash of light.", style=Font.PLAYER)
             
             print_glitch(">>> STOPPING TIME <<<")
-            time.sleep(1)
+            pause(1)
             
             print_typed("\nTime freezes completely around you. The enemy is motionless, suspended", style=Font.LORE)
             print_typed("in a single moment. You carefully line up the perfect attack.", style=Font.LORE)
@@ -5890,7 +5903,7 @@ def use_time_manipulation(player: Any, enemy: Any, combat_state: Any) -> Any:
             print_typed(f"Time Fragments remaining: {Font.INFO(str(game_state.get('time_fragments', 0)))}", style=Font.INFO)
             
             print_glitch(">>> TIME RESUMES <<<")
-            time.sleep(1)
+            pause(1)
             return True
         else:
             print_typed("\nYou don't have enough time fragments for this ability.", style=Font.WARNING)
@@ -5904,7 +5917,7 @@ def use_time_manipulation(player: Any, enemy: Any, combat_state: Any) -> Any:
             print_typed("timeline where this battle is progressing more favorably.", style=Font.PLAYER)
             
             print_glitch(">>> SHIFTING TIMELINES <<<")
-            time.sleep(1)
+            pause(1)
             
             # Reset the battle state favorably
             health_boost = player.max_health // 3
@@ -5927,7 +5940,7 @@ def use_time_manipulation(player: Any, enemy: Any, combat_state: Any) -> Any:
             print_typed(f"and {Font.ENEMY(enemy.name)} takes {Font.SUCCESS(str(temporal_damage))} damage from temporal disruption!", style=Font.SUCCESS)
             print_typed("The enemy is confused for 3 turns due to timeline inconsistency.", style=Font.SUCCESS)
             print_typed(f"Time Fragments remaining: {Font.INFO(str(game_state.get('time_fragments', 0)))}", style=Font.INFO)
-            time.sleep(1)
+            pause(1)
             return True
         else:
             print_typed("\nYou don't have enough time fragments for this ability.", style=Font.WARNING)
@@ -6181,7 +6194,7 @@ def present_branching_choice(choice_data: Any, game_state: Any) -> Any:
                 # Display the result of the choice
                 print_typed(f"\n{Font.IMPORTANT('You chose:')} {selected_option['text']}", style=Font.SYSTEM)
                 print_typed(f"\n{Font.INFO('Your decision will alter the course of your journey...')}", style=Font.LORE)
-                time.sleep(2)
+                pause(2)
             else:
                 print_typed("\nInvalid choice. Please select a valid option.", style=Font.WARNING)
         except ValueError:
@@ -6394,7 +6407,7 @@ def chapter_eight_teaser() -> Any:
     print_typed("\nWill you neutralize the infected to ensure containment, or risk", style=Font.GLITCH)
     print_typed("everything to find a cure? The viral directive awaits your decision...", style=Font.GLITCH)
     
-    time.sleep(1)
+    pause(1)
     input("\nPress Enter to return to the main menu...")
     return
 
@@ -7321,7 +7334,7 @@ def enemy_turn(enemy: Any, player: Any, combat_state: Optional[Any] = None) -> A
         print_typed(f"{Font.INFO(f'{enemy.name} is partially phased out of normal space, making targeting difficult.')}")
     
     print_typed(f"\n{enemy.name} targeting...")
-    time.sleep(0.5)
+    pause(0.5)
 
     # Calculate enemy tactics based on health percentage
     health_percent = enemy.health / enemy.max_health
@@ -7811,7 +7824,7 @@ def enemy_turn(enemy: Any, player: Any, combat_state: Optional[Any] = None) -> A
                 print_typed(result)
 
     # Small delay for readability
-    time.sleep(0.5)
+    pause(0.5)
 
 
 def generate_enemy(zone_name: Any, wave: Optional[Any] = None) -> Any:
@@ -7921,7 +7934,7 @@ def get_loot(player: Any, enemy: Any) -> Any:
     for i in range(3):
         for char in scan_chars:
             print(f"\r{Fore.CYAN}Quantum analysis in progress {char * 10}", end="", flush=True)
-            time.sleep(0.1)
+            pause(0.1)
     print(f"\r{' ' * 50}", end="", flush=True)
     print()
     
@@ -7972,7 +7985,7 @@ def get_loot(player: Any, enemy: Any) -> Any:
                 
                 # Enhanced display with item color
                 print_slow(f"- {item_color}{item_name}{Style.RESET_ALL}: {item_effect}")
-                time.sleep(0.3)  # Slight pause between items for dramatic effect
+                pause(0.3)  # Slight pause between items for dramatic effect
     else:
         print_typed(f"{Font.INFO('No salvageable components detected.')}")
     
@@ -8050,9 +8063,9 @@ def update_quest_progress(player: Any, enemy: Any) -> None:
 
             # Add reward with animated reveal
             print_typed("\nREWARDS:", style=Font.IMPORTANT)
-            time.sleep(0.3)
+            pause(0.3)
             print_typed("• Med-Kit x1", style=Font.SUCCESS)
-            time.sleep(0.2)
+            pause(0.2)
             print_typed("• EMP Grenade x1", style=Font.SUCCESS)
 
             player.inventory["med_kit"] = player.inventory.get("med_kit", 0) + 1
@@ -8177,7 +8190,7 @@ def show_tutorial() -> None:
     print_typed("\nWelcome, Dr. Valari. This simulation will prepare you for survival.", style=Font.SYSTEM)
     print_typed("As the last Century Sleeper, your mission is critical.", style=Font.IMPORTANT)
 
-    time.sleep(0.5)
+    pause(0.5)
 
     # Enhanced combat systems section with colors
     print(f"\n{Fore.RED}{Back.BLACK}{'▀' * 50}{Style.RESET_ALL}")
@@ -8248,11 +8261,11 @@ def intro_sequence() -> Any:
     # Title sequence with typing effect and more color
     print("\n\n")
     print_typed(f"{Fore.GREEN}INITIALIZING NEURAL INTERFACE...", delay=0.05, style=Font.SYSTEM)
-    time.sleep(0.5)
+    pause(0.5)
     print_typed(f"{Fore.YELLOW}CONNECTING TO SENSORY SYSTEMS...", delay=0.05, style=Font.SYSTEM)
-    time.sleep(0.5)
+    pause(0.5)
     print_typed(f"{Fore.RED}MEMORY CORE ONLINE...", delay=0.05, style=Font.SYSTEM)
-    time.sleep(1)
+    pause(1)
 
     clear_screen()
 
@@ -8264,19 +8277,19 @@ def intro_sequence() -> Any:
     print(Font.BOX_BOTTOM)
     print(f"{Fore.CYAN}{Back.BLACK}{'▀' * 50}{Style.RESET_ALL}")
 
-    time.sleep(1)
+    pause(1)
     print_typed("\nThe year is 2157. The singularity has come and gone.", style=Font.LORE)
-    time.sleep(0.5)
+    pause(0.5)
     print_typed("Artificial intelligence has evolved beyond human control, deciding", style=Font.LORE)
     print_typed("that humanity's existence is incompatible with its own survival.", style=Font.LORE)
-    time.sleep(0.5)
+    pause(0.5)
 
     print_typed("\nYou are Dr. XENO VALARI, renowned AI specialist and volunteer", style=Font.PLAYER)
     print_typed("for the 'Century Sleepers' program. 100 years ago, as humanity", style=Font.LORE)
     print_typed("prepared for mass evacuation to Andromeda, you and other scientists", style=Font.LORE)
     print_typed("chose to remain behind in cryostasis. Your mission: monitor Earth's", style=Font.LORE)
     print_typed("situation and eventually follow in the last rocket to Andromeda.", style=Font.LORE)
-    time.sleep(1.0)
+    pause(1.0)
 
     # Get protagonist's gender from global game state
     protagonist_gender = "female"  # Default
@@ -8298,14 +8311,14 @@ def intro_sequence() -> Any:
         print_typed("Your consciousness analyzes the systematic warning protocols.", style=Font.LORE)
         
     print(f"{Fore.RED}{Back.BLACK}{'▄' * 50}{Style.RESET_ALL}")
-    time.sleep(0.8)
+    pause(0.8)
 
     # Enhanced warning message with red background
     print(f"\n{Fore.WHITE}{Back.RED}{'█' * 50}{Style.RESET_ALL}")
     print_glitch("SECURITY BREACH DETECTED - UNAUTHORIZED CONSCIOUSNESS DETECTED")
     print_glitch("DEPLOYING COUNTERMEASURES - TERMINATION PROTOCOLS INITIATED")
     print(f"{Fore.WHITE}{Back.RED}{'█' * 50}{Style.RESET_ALL}")
-    time.sleep(1)
+    pause(1)
 
     # Gender-specific cryopod awakening narrative
     if protagonist_gender == "female":
@@ -8322,7 +8335,7 @@ def intro_sequence() -> Any:
         print_typed("The data suggests the colony ships reached Andromeda as planned", style=Font.IMPORTANT)
         print_typed("decades ago. The logical conclusion: you are truly the last human", style=Font.IMPORTANT)
         print_typed("left in the Milky Way galaxy, facing mechanical opposition alone.", style=Font.IMPORTANT)
-    time.sleep(0.5)
+    pause(0.5)
 
     # New mission description with gender-specific framing
     print(f"\n{Fore.BLUE}{Style.BRIGHT}{'═' * 50}{Style.RESET_ALL}")
@@ -8363,7 +8376,7 @@ def intro_sequence() -> Any:
     print(f"\n{Font.SYSTEM('Initializing combat systems')}",  end="")
     for _ in range(5):
         print(".", end="", flush=True)
-        time.sleep(0.3)
+        pause(0.3)
     print("\n")
 
     print(Font.SYSTEM("Press ENTER to begin your mission..."))
@@ -8508,15 +8521,15 @@ def gacha_system() -> Any:
                 wish_menu(selected_banner)
             else:
                 print(Font.WARNING("\nInvalid projection parameter. Recalibrating..."))
-                time.sleep(1.5)
+                pause(1.5)
                 gacha_system()
         else:
             print(Font.WARNING("\nInvalid input format. Please enter a valid option."))
-            time.sleep(1.5)
+            pause(1.5)
             gacha_system()
     except ValueError:
         print(Font.WARNING("\nQuantum calculation error. Please try again."))
-        time.sleep(1.5)
+        pause(1.5)
         gacha_system()
 
 def wish_menu(banner_name: Any) -> Any:
@@ -8579,11 +8592,11 @@ def wish_menu(banner_name: Any) -> Any:
         wish_menu(banner_name)
     elif (choice == "1" or choice == "2") and quantum_currency < (160 if choice == "1" else 1600):
         print(Font.WARNING("\nInsufficient Quantum Currency. Complete quests to earn more."))
-        time.sleep(2)
+        pause(2)
         wish_menu(banner_name)
     else:
         print(Font.WARNING("\nInvalid selection. Please try again."))
-        time.sleep(1.5)
+        pause(1.5)
         wish_menu(banner_name)
 
 def perform_wish(banner_name: Any, wish_count: Any) -> Any:
@@ -8756,7 +8769,7 @@ def claim_daily_reward() -> Any:
     if game_state["last_daily_claim"] == today:
         print(Font.WARNING("You've already claimed your daily reward today."))
         print(Font.INFO("Come back tomorrow for more quantum crystals!"))
-        time.sleep(2)
+        pause(2)
         return
         
     # Award crystals with fancy animation
@@ -8773,11 +8786,11 @@ def claim_daily_reward() -> Any:
     # Visual crystal animation
     for _ in range(5):
         print(f"{random.choice(['◈', '✧', '✦', '★', '✮'])} ", end="", flush=True)
-        time.sleep(0.3)
+        pause(0.3)
     
     print(f"\n\n{Font.SYSTEM('Daily reward claimed!')} {Font.IMPORTANT(f'+{reward_amount} Quantum Crystals')}")
     print(f"{Font.INFO('New balance:')} {Font.IMPORTANT(str(game_state['quantum_crystals']))}")
-    time.sleep(2)
+    pause(2)
 
 def display_wish_results(results: Any) -> None:
     """Display gacha results with fancy animations"""
@@ -8789,7 +8802,7 @@ def display_wish_results(results: Any) -> None:
     
     # Show each result with appropriate styling
     for i, result in enumerate(results):
-        time.sleep(0.5)  # Add delay for dramatic effect
+        pause(0.5)  # Add delay for dramatic effect
         
         # Determine color based on rarity
         if result["rarity"] == "5star":
@@ -8819,9 +8832,9 @@ def display_wish_results(results: Any) -> None:
         if result["rarity"] == "5star":
             for _ in range(3):
                 print(f"\r{i+1}. {rarity_display} {type_indicator} {Fore.WHITE}{Back.YELLOW}{full_name}{Style.RESET_ALL}{featured}", end="")
-                time.sleep(0.2)
+                pause(0.2)
                 print(f"\r{i+1}. {rarity_display} {type_indicator} {item_color}{full_name}{Style.RESET_ALL}{featured}", end="")
-                time.sleep(0.2)
+                pause(0.2)
             print()
         else:
             print(f"{i+1}. {rarity_display} {type_indicator} {item_color}{full_name}{Style.RESET_ALL}{featured}")
@@ -8974,7 +8987,7 @@ def enter_cosmic_collision_legacy(player: Any, game_state: Any, location: Option
         print_typed("Your ship's AI struggles to decode the message, which seems to", style=Font.LORE)
         print_typed("exist in multiple quantum states simultaneously.", style=Font.LORE)
         
-        time.sleep(1)
+        pause(1)
         
         # Show signal visualization
         print(f"\n{Fore.CYAN}{'⁓' * 50}{Style.RESET_ALL}")
@@ -8987,7 +9000,7 @@ def enter_cosmic_collision_legacy(player: Any, game_state: Any, location: Option
                 else:
                     pattern += "░"
             print(f"{Fore.CYAN}{pattern}{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
         print(f"{Fore.CYAN}{'⁓' * 50}{Style.RESET_ALL}")
         
         print_typed("\nAfter several hours of quantum decryption, your ship's systems", style=Font.LORE)
@@ -9010,7 +9023,7 @@ def enter_cosmic_collision_legacy(player: Any, game_state: Any, location: Option
         print_typed("your navigation system struggles to process. They appear to be", style=Font.LORE) 
         print_typed("expressed in a 5-dimensional positioning format.", style=Font.LORE)
         
-        time.sleep(1)
+        pause(1)
         
         # Start the quest introduction with the mathematical explanation
         print_typed("\nAs your ship's computer processes the coordinates, a holographic", style=Font.LORE)
@@ -9422,21 +9435,21 @@ def show_cosmic_collision_quest_status(player: Any, game_state: Any) -> None:
         system_to_stabilize = "Parallax" if cosmic_data["systems_stabilized"] == 0 else "Jonathan-2"
         
         print_typed(f"\nPreparing to stabilize the {system_to_stabilize} system...", style=Font.SYSTEM)
-        time.sleep(1)
+        pause(1)
         
         print_typed("\nYou calibrate the Divergence Cannon to the specific quantum", style=Font.PLAYER)
         print_typed(f"frequency of the {system_to_stabilize} system...", style=Font.PLAYER)
-        time.sleep(1)
+        pause(1)
         
         print_typed("\n3...", style=Font.SYSTEM)
-        time.sleep(0.5)
+        pause(0.5)
         print_typed("2...", style=Font.SYSTEM)
-        time.sleep(0.5)
+        pause(0.5)
         print_typed("1...", style=Font.SYSTEM)
-        time.sleep(0.5)
+        pause(0.5)
         
         print_typed("\nThe Divergence Cannon fires a concentrated beam of quantum-stabilizing particles!", style=Font.SYSTEM)
-        time.sleep(1)
+        pause(1)
         
         print_typed(f"\nSystem {system_to_stabilize} has been successfully stabilized!", style=Font.SYSTEM)
         cosmic_data["systems_stabilized"] += 1
@@ -9475,12 +9488,12 @@ def show_cosmic_collision_quest_status(player: Any, game_state: Any) -> None:
             print_typed("underlying patterns of reality showing you the way.", style=Font.PLAYER)
         
         print_typed("\n\nThe Divergence Cannon fires a final concentrated beam...", style=Font.SYSTEM)
-        time.sleep(1)
+        pause(1)
         
         # Visual effect
         for _ in range(5):
             print(f"\n{Fore.CYAN}{'>' * random.randint(10, 40)}{Style.RESET_ALL}")
-            time.sleep(0.2)
+            pause(0.2)
         
         print_typed("\nThe multiversal rift collapses in on itself, reality stabilizing", style=Font.SYSTEM)
         print_typed("across all affected universes. You've successfully resolved the", style=Font.SYSTEM)
@@ -9661,10 +9674,10 @@ def travel_system(player: Any, game_state: Any) -> Any:
     # Visual travel sequence
     for _ in range(3):
         print(f"\n{Fore.CYAN}{'>' * random.randint(5, 40)}{Style.RESET_ALL}")
-        time.sleep(0.3)
+        pause(0.3)
     
     print_typed("\nJumping to lightspeed...", style=Font.SYSTEM)
-    time.sleep(1)
+    pause(1)
     
     # Set current location and handle quest activation if needed
     game_state["current_location"] = selected_location
@@ -9711,14 +9724,14 @@ def zone_menu(player: Any) -> Any:
             if 0 <= index < len(game_state["zones_unlocked"]):
                 selected_zone = game_state["zones_unlocked"][index]
                 print_typed(f"\nNavigating to: {selected_zone}")
-                time.sleep(1)
+                pause(1)
                 return selected_zone
             
             print_typed("Invalid selection. Navigation failed.")
-            time.sleep(1)
+            pause(1)
         except ValueError:
             print_typed("ERROR: Numeric input required.")
-            time.sleep(1)
+            pause(1)
 
 
 def handle_wave_combat(player: Any, zone_name: Any) -> Any:
@@ -10143,7 +10156,7 @@ def fight_prime_simulacra(player: Any) -> Any:
     print_typed(f"{Font.ENEMY('PRIME SIMULACRA')}: Your discovery changes nothing. Your biological and")
     print_typed(f"{Font.ENEMY('PRIME SIMULACRA')}: technological patterns will be assimilated to perfect our mimicry.")
     
-    time.sleep(1)
+    pause(1)
     
     # Set up the boss
     simulacra = Character("Prime Simulacra", 350, 35, 30)
@@ -10550,12 +10563,12 @@ def white_hole_transition(game_state: Any) -> Any:
     print_typed("suddenly blare throughout the vessel. The displays flicker with")
     print_typed("strange readings that the computer cannot interpret.")
     
-    time.sleep(1)
+    pause(1)
     
     print_typed(f"\n{Font.WARNING('WARNING: QUANTUM TUNNEL INSTABILITY DETECTED')}")
     print_typed(f"{Font.WARNING('GRAVITATIONAL DISTORTION EXCEEDS SAFETY PARAMETERS')}")
     
-    time.sleep(0.5)
+    pause(0.5)
     
     print_typed("\nThe ship shudders violently as the quantum drive engages. Through")
     print_typed("the viewport, you see the tunnel begin to form, but instead of the")
@@ -10566,17 +10579,17 @@ def white_hole_transition(game_state: Any) -> Any:
     print_typed(f"{Font.SYSTEM('OPPOSITE OF BLACK HOLE. MATTER/ENERGY EXPULSION POINT.')}")
     print_typed(f"{Font.SYSTEM('REALITY DISTORTION IMMINENT.')}")
     
-    time.sleep(1)
+    pause(1)
     
     print_typed("\nThe light intensifies until it's painful to look at, even through")
     print_typed("the viewport's automatic filters. You feel a strange sensation,")
     print_typed("as if your body is being pulled apart and reassembled simultaneously.")
     
-    time.sleep(0.5)
+    pause(0.5)
     
     print_glitch("\nR E A L I T Y   F R A C T U R I N G")
     
-    time.sleep(0.8)
+    pause(0.8)
     
     print_typed("\nAs the light finally fades, you find yourself and your ship intact,")
     print_typed("but the stars visible through the viewport form unfamiliar patterns.")
@@ -10587,7 +10600,7 @@ def white_hole_transition(game_state: Any) -> Any:
     print_typed(f"\n{Font.INFO('Navigation cannot determine current location.')}")
     print_typed(f"\n{Font.INFO('Sensors detect familiar spatial signatures, but with quantum distortions.')}")
     
-    time.sleep(1)
+    pause(1)
     
     print_typed("\nYou realize with growing certainty that this is not Andromeda.")
     print_typed("You've entered a white hole and emerged into some kind of")
@@ -10740,7 +10753,7 @@ def equip_ignite_module(player: Any, game_state: Any) -> Any:
     if game_state.get("has_ignite_module", False):
         print_typed("\nYou already have the Ignite Module equipped.", style=Font.INFO)
         print_typed("The crystalline thermal technology pulses with energy.", style=Font.INFO)
-        time.sleep(1)
+        pause(1)
         input("\nPress Enter to continue...")
         return False
     
@@ -10754,7 +10767,7 @@ def equip_ignite_module(player: Any, game_state: Any) -> Any:
     # Visual effect for installation
     for i in range(1, 6):
         print(f"\r{Font.SYSTEM('Thermal Calibration:')} {Font.WEAPON('['+'■'*i+'□'*(5-i)+']')} {i*20}%", end="")
-        time.sleep(0.5)
+        pause(0.5)
     print("\r" + " " * 50, end="")  # Clear the line
     
     print_typed(f"\n{Font.SUCCESS('IGNITE MODULE SUCCESSFULLY INTEGRATED')}", style=Font.IMPORTANT)
@@ -10783,7 +10796,7 @@ def equip_ignite_module(player: Any, game_state: Any) -> Any:
     print_typed("\nIn combat, use '/ignite' or press 'i' to activate the Ignite Module's", style=Font.COMMAND)
     print_typed("special thermal attack. This consumes energy but deals massive damage.", style=Font.COMMAND)
     
-    time.sleep(1)
+    pause(1)
     input("\nPress Enter to continue...")
     return True
 
@@ -10845,16 +10858,16 @@ def manage_weapon_modules(player: Any, game_state: Any) -> Any:
             
             module_name = weapon_modules[selected_module_id]["name"]
             print_typed(f"\n{Font.SUCCESS('Module ' + module_name + ' equipped!')}")
-            time.sleep(1.5)
+            pause(1.5)
             return manage_weapon_modules(player, game_state)
         else:
             print_typed(f"\n{Font.WARNING('Invalid selection.')}")
-            time.sleep(1)
+            pause(1)
             return manage_weapon_modules(player, game_state)
             
     except ValueError:
         print_typed(f"\n{Font.WARNING('Invalid input. Please enter a number.')}")
-        time.sleep(1)
+        pause(1)
         return manage_weapon_modules(player, game_state)
 
 
@@ -10876,13 +10889,13 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
         print(f"{Fore.BLUE}{'≈' * 60}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}{Back.BLUE}{Font.HEADER('THALASSIA DEEP-SEA RESEARCH FACILITY').center(60)}{Style.RESET_ALL}")
         print(f"{Fore.BLUE}{'≈' * 60}{Style.RESET_ALL}")
-        time.sleep(0.3)
+        pause(0.3)
         
         clear_screen()
         print(f"{Fore.CYAN}{'≈' * 60}{Style.RESET_ALL}")
         print(f"{Fore.BLUE}{Back.CYAN}{Font.HEADER('THALASSIA DEEP-SEA RESEARCH FACILITY').center(60)}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}{'≈' * 60}{Style.RESET_ALL}")
-        time.sleep(0.3)
+        pause(0.3)
     
     # Facility status display with visual indicators
     print(f"\n{Font.BOX_TOP}")
@@ -10972,9 +10985,9 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
         # Simulated sonar ping effect
         for _ in range(3):
             print("\n" + " " * random.randint(5, 40) + f"{Fore.CYAN}•{Style.RESET_ALL}")
-            time.sleep(0.3)
+            pause(0.3)
             print_typed(f"{Font.SYSTEM('> ping')}", delay=0.01)
-            time.sleep(0.5)
+            pause(0.5)
         
         # Gender-specific reaction to bioluminescent creatures
         if protagonist_gender == "female":
@@ -10993,14 +11006,14 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
             print_typed("chemical analysis indicates they contain 47.3% concentration of the planet's", style=Font.LORE)
             print_typed("unique salt compounds, suggesting artificial biological engineering.", style=Font.LORE)
         
-        time.sleep(1)
+        pause(1)
         
         # Dramatic reveal with slow text building
         print("\n")
         reveal_text = "STRUCTURE DETECTED"
         for char in reveal_text:
             print(f"{Fore.YELLOW}{char}{Style.RESET_ALL}", end='', flush=True)
-            time.sleep(0.2)
+            pause(0.2)
         print("\n")
         
         print_typed("\nAfter what seems like an eternity, a massive silhouette emerges", style=Font.LORE)
@@ -11012,13 +11025,13 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
         
         # Detailed scan results with visual formatting
         print_typed(f"\n{Font.GLITCH('INITIATING DEEP SCAN...')}")
-        time.sleep(1)
+        pause(1)
         
         # Animated scan effect
         for i in range(10):
             scan_line = "■" * i + "□" * (10-i)
             print(f"\r{Font.SYSTEM('Scanning: ')} {Fore.CYAN}{scan_line} {i*10}%{Style.RESET_ALL}", end="", flush=True)
-            time.sleep(0.2)
+            pause(0.2)
         print("\n")
         
         print(f"{Font.BOX_TOP}")
@@ -11031,7 +11044,7 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
         print(f"{Font.BOX_SIDE} {Font.INFO('Airlock status:')} {Font.SUCCESS('FUNCTIONAL')}                  {Font.BOX_SIDE}")
         print(f"{Font.BOX_BOTTOM}")
         
-        time.sleep(1)
+        pause(1)
         
         # Atmospheric docking sequence
         print_typed("\nYou maneuver your submersible toward a still-functioning airlock.", style=Font.LORE)
@@ -11039,20 +11052,20 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
         print_typed("area in a pulsing red glow. Salt formations crumble away as the", style=Font.LORE)
         print_typed("ancient mechanisms awaken.", style=Font.LORE)
         
-        time.sleep(0.5)
+        pause(0.5)
         
         # Docking sequence animation
         print_typed(f"\n{Font.SYSTEM('INITIATING DOCKING SEQUENCE')}")
-        time.sleep(0.7)
+        pause(0.7)
         print_typed(f"{Font.SYSTEM('ALIGNING SUBMERSIBLE...')}")
-        time.sleep(1)
+        pause(1)
         print_typed(f"{Font.SUCCESS('ALIGNMENT COMPLETE')}")
-        time.sleep(0.7)
+        pause(0.7)
         print_typed(f"{Font.SYSTEM('ENGAGING MAGNETIC CLAMPS...')}")
-        time.sleep(0.7)
+        pause(0.7)
         print_typed(f"{Font.SUCCESS('DOCKING SUCCESSFUL')}")
         
-        time.sleep(0.5)
+        pause(0.5)
         
         print_typed("\nThe docking mechanism engages with a metallic thunk that reverberates", style=Font.LORE)
         print_typed("through your vessel. The airlock cycles, draining the seawater with", style=Font.LORE)
@@ -11143,7 +11156,7 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
             print(f"{Fore.CYAN}╔{'═' * 58}╗{Style.RESET_ALL}")
             print(f"{Fore.CYAN}║{Style.RESET_ALL} {Font.LORE(random.choice(events))} {' ' * (58 - len(random.choice(events)))} {Fore.CYAN}║{Style.RESET_ALL}")
             print(f"{Fore.CYAN}╚{'═' * 58}╝{Style.RESET_ALL}")
-            time.sleep(1)
+            pause(1)
         
         # Visually enhanced area selection interface
         print(f"\n{Font.BOX_TOP}")
@@ -11201,9 +11214,9 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
         print(f"\n{Font.SYSTEM('ENTER COMMAND')} ", end='', flush=True)
         for _ in range(3):
             print(f"{Fore.CYAN}_{Style.RESET_ALL}", end='', flush=True)
-            time.sleep(0.3)
+            pause(0.3)
             print("\b \b", end='', flush=True)
-            time.sleep(0.3)
+            pause(0.3)
         
         choice = input().strip()
         
@@ -11337,7 +11350,7 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
                         print_typed("in several specimens.")
                         
                         print_typed(f"\n{Font.SYSTEM('DOWNLOADING RESEARCH DATA...')}")
-                        time.sleep(1)
+                        pause(1)
                         
                         print_typed(f"\n{Font.SUCCESS('ACQUIRED:')} {Font.ITEM('Enhanced Thalassian Specimens')}")
                         print_typed(f"{Font.SUCCESS('ACQUIRED:')} {Font.ITEM('Genetic Modification Records')}")
@@ -11600,7 +11613,7 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
                                 print_typed(f"\n{Font.SYSTEM('INITIALIZING WEAPON SYSTEMS...')}")
                                 for i in range(5):
                                     print(f"\r{Font.SYSTEM('Charging: ')} {Fore.CYAN}{'■' * i + '□' * (5-i)} {i*20}%{Style.RESET_ALL}", end="", flush=True)
-                                    time.sleep(0.3)
+                                    pause(0.3)
                                 print("\n")
                                 
                                 return True
@@ -11623,13 +11636,13 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
                                             current_modulation = new_value
                                     else:
                                         print_typed(f"\n{Font.WARNING('Invalid value. Range is 1-10.')}")
-                                        time.sleep(1)
+                                        pause(1)
                                 else:
                                     print_typed(f"\n{Font.WARNING('Invalid selection. Choose 1-3.')}")
-                                    time.sleep(1)
+                                    pause(1)
                             except ValueError:
                                 print_typed(f"\n{Font.WARNING('Please enter a valid number.')}")
-                                time.sleep(1)
+                                pause(1)
                             
                             attempts += 1
                             
@@ -11646,7 +11659,7 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
                                 
                                 if max_diff_param[1] > 0:
                                     print_typed(f"\n{Font.INFO('HINT: The')} {max_diff_param[0]} {Font.INFO('parameter requires significant adjustment.')}")
-                                    time.sleep(2)
+                                    pause(2)
                         
                         # If we get here, calibration failed
                         print_typed(f"\n{Font.WARNING('MAXIMUM CALIBRATION ATTEMPTS REACHED')}")
@@ -11655,7 +11668,7 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
                         print(f"AMPLITUDE: {target_amplitude}/10")
                         print(f"MODULATION: {target_modulation}/10")
                         
-                        time.sleep(1)
+                        pause(1)
                         return False
                     
                     # Run the calibration puzzle
@@ -11824,7 +11837,7 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
                 for i in range(3):
                     print(f"\r{Font.SYSTEM('SIGNAL DETECTED:')} {Fore.CYAN}{'▓▒░' * i}{Style.RESET_ALL}", end="", flush=True)
                     # Audio effect replaced with visual pause
-                    time.sleep(0.5)
+                    pause(0.5)
                 print("\n")
                 
                 print_typed(f"\n{Font.SYSTEM('SIGNAL ANALYSIS:')}")
@@ -11944,7 +11957,7 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
                                 if segments_completed < max_segments:
                                     print_typed(f"\n{Font.SUCCESS(f'SEGMENT {segments_completed}/{max_segments} RECONSTRUCTED!')}")
                                     print_typed(f"\n{Font.SYSTEM('PROCEEDING TO NEXT SEGMENT...')}")
-                                    time.sleep(1.5)
+                                    pause(1.5)
                                     clear_screen()
                                     print_typed(f"\n{Font.HEADER('SIGNAL RECONSTRUCTION INTERFACE')}")
                             else:
@@ -11960,7 +11973,7 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
                         for i in range(10):
                             progress = "█" * i + "▒" * (10-i)
                             print(f"\r{Font.INFO('Processing:')} {Fore.CYAN}{progress} {i*10}%{Style.RESET_ALL}", end="", flush=True)
-                            time.sleep(0.2)
+                            pause(0.2)
                         print("\n")
                         
                         return True
@@ -11972,31 +11985,31 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
                         # Display reconstructed message dramatically
                         clear_screen()
                         print_typed(f"\n{Font.HEADER('DISTRESS SIGNAL RECONSTRUCTED')}")
-                        time.sleep(0.7)
+                        pause(0.7)
                         
                         print_typed(f"\n{Font.SYSTEM('PLAYBACK INITIATED:')}")
-                        time.sleep(1)
+                        pause(1)
                         
                         # Play back the message with special formatting
                         print_typed(f"\n{Fore.CYAN}This is Dr. Elena Markov, lead researcher of Thalassia Station Alpha.{Style.RESET_ALL}", delay=0.04)
-                        time.sleep(0.5)
+                        pause(0.5)
                         print_typed(f"{Fore.CYAN}All survivors have been evacuated to the surface outpost following{Style.RESET_ALL}", delay=0.04)
-                        time.sleep(0.5)
+                        pause(0.5)
                         print_typed(f"{Fore.CYAN}catastrophic containment failure in the underwater research facility.{Style.RESET_ALL}", delay=0.04)
-                        time.sleep(0.5)
+                        pause(0.5)
                         print_typed(f"{Fore.CYAN}The creatures have followed us to the surface. Our security measures{Style.RESET_ALL}", delay=0.04)
-                        time.sleep(0.5)
+                        pause(0.5)
                         print_typed(f"{Fore.CYAN}are failing. We've initiated the facility self-destruct sequence,{Style.RESET_ALL}", delay=0.04)
-                        time.sleep(0.5)
+                        pause(0.5)
                         print_typed(f"{Fore.CYAN}but I fear it won't be enough to contain them...{Style.RESET_ALL}", delay=0.04)
-                        time.sleep(0.8)
+                        pause(0.8)
                         print_typed(f"{Fore.CYAN}There's something here we didn't anticipate... it's intelligent...{Style.RESET_ALL}", delay=0.04)
-                        time.sleep(0.5)
+                        pause(0.5)
                         print_typed(f"{Fore.CYAN}and it's controlling them all. May God help us... and forgive us.{Style.RESET_ALL}", delay=0.04)
-                        time.sleep(1)
+                        pause(1)
                         
                         print_typed(f"\n{Font.SYSTEM('COORDINATES EMBEDDED IN SIGNAL')}")
-                        time.sleep(0.5)
+                        pause(0.5)
                         
                         # Rewards for completing the puzzle
                         print_typed(f"\n{Font.SUCCESS('ACQUIRED:')} {Font.ITEM('Surface Outpost Coordinates')}")
@@ -12069,7 +12082,7 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
                     
                     for step in repair_steps:
                         print(f"\r{Font.INFO(step)}", end="", flush=True)
-                        time.sleep(0.8)
+                        pause(0.8)
                         print(f" {Fore.GREEN}✓{Style.RESET_ALL}")
                     
                     # Skill check with better visual feedback
@@ -12081,7 +12094,7 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
                         print_typed(f"\n{Font.SUCCESS('Repair chance increased!')} ({int(success_chance*100)}%)")
                     
                     print_typed(f"\n{Font.SYSTEM('FINAL DIAGNOSTICS RUNNING...')}")
-                    time.sleep(1)
+                    pause(1)
                     
                     if random.random() < success_chance:
                         print_typed(f"\n{Font.SUCCESS('REPAIR SUCCESSFUL!')}")
@@ -12089,9 +12102,9 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
                         # Animated success sequence
                         for i in range(3):
                             print(f"\r{Font.SYSTEM('Beacon Status: ')} {Fore.GREEN}{'■' * i}{Style.RESET_ALL}", end="", flush=True)
-                            time.sleep(0.3)
+                            pause(0.3)
                             print(f"\r{Font.SYSTEM('Beacon Status: ')} {Fore.GREEN}{'□' * i}{Style.RESET_ALL}", end="", flush=True)
-                            time.sleep(0.3)
+                            pause(0.3)
                         print(f"\r{Font.SYSTEM('Beacon Status: ')} {Fore.GREEN}OPERATIONAL{Style.RESET_ALL}")
                         
                         player.inventory.pop("damaged_beacon", None)
@@ -12117,7 +12130,7 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
                         
                         # Visual failure sequence
                         print(f"\r{Font.SYSTEM('Beacon Status: ')} {Fore.RED}ERROR{Style.RESET_ALL}")
-                        time.sleep(0.5)
+                        pause(0.5)
                         print(f"\r{Font.SYSTEM('Diagnostics: ')} {Fore.RED}Critical component failure{Style.RESET_ALL}")
                         
                         print_typed("\nThe beacon's primary transmission circuit is beyond repair.")
@@ -12153,7 +12166,7 @@ def explore_underwater_research_base(player: Any, game_state: Any) -> Any:
             
         else:
             print_typed(f"\n{Font.WARNING('Invalid choice. Please try again.')}")
-            time.sleep(1)
+            pause(1)
     
     return
 
@@ -12181,7 +12194,7 @@ def fight_neurovore_prime(player: Any, game_state: Any) -> Any:
     print_typed(f"\n{Font.WARNING('WARNING: CONTAINMENT BREACH DETECTED')}")
     print_typed(f"{Font.WARNING('EXTREME CAUTION ADVISED')}")
     
-    time.sleep(1)
+    pause(1)
     
     print_typed("\nThe security panel next to the door is still operational. You")
     print_typed("have two options: retreat to safety, or override the locks and")
@@ -12204,7 +12217,7 @@ def fight_neurovore_prime(player: Any, game_state: Any) -> Any:
     print_typed("override procedure. Warning klaxons blare as the massive door")
     print_typed("slowly slides open, revealing the chamber beyond.")
     
-    time.sleep(1)
+    pause(1)
     
     print_typed("\nThe containment chamber is enormous, partially flooded with")
     print_typed("Thalassian seawater. Research equipment lies scattered and broken")
@@ -12444,9 +12457,9 @@ def encounter_chrono_sentient(player: Any, game_state: Any) -> Any:
         print_typed("algorithmic sequences in the temporal fluctuations, allowing your", style=Font.PLAYER)
         print_typed("systems to establish partial synchronization with the phenomenon.", style=Font.PLAYER)
     
-    time.sleep(1)
+    pause(1)
     print_glitch("...OBSERVER DETECTED... TIMELINE FRACTURE ACKNOWLEDGED...")
-    time.sleep(0.5)
+    pause(0.5)
     
     # Gender-specific entity response
     if protagonist_gender == "female":
@@ -12454,7 +12467,7 @@ def encounter_chrono_sentient(player: Any, game_state: Any) -> Any:
     else:
         print_glitch("...WE/I AM THE CHRONO-SENTIENT... YOUR TEMPORAL CALCULATIONS INTRIGUE US...")
     
-    time.sleep(0.5)
+    pause(0.5)
     
     # Offering player choices using time mechanics
     print(f"{Fore.BLUE}{Style.BRIGHT}{'═' * 50}{Style.RESET_ALL}")
@@ -12650,7 +12663,7 @@ def encounter_chrono_sentient(player: Any, game_state: Any) -> Any:
     else:
         print_typed("WARY - It will watch your actions carefully going forward", style=Font.WARNING)
     
-    time.sleep(2)
+    pause(2)
     input("\nPress Enter to continue...")
     return True
 
@@ -12675,7 +12688,7 @@ def fight_white_hole_guardian(player: Any) -> Any:
     print_typed(f"{Font.ENEMY('WHITE HOLE GUARDIAN')}: YOUR QUANTUM SIGNATURE DOES NOT BELONG IN THIS REALITY.")
     print_typed(f"{Font.ENEMY('WHITE HOLE GUARDIAN')}: INITIATING CORRECTION PROTOCOLS.")
     
-    time.sleep(1)
+    pause(1)
     
     # Set up the boss
     guardian = Character("White Hole Guardian", 500, 40, 35)
@@ -12903,7 +12916,7 @@ def chapter_seven_teaser() -> Any:
     print_typed("• Tertiary effect: Chance to cause combustion status (DoT)", style=Font.INFO)
     print_typed("• Synergy: Enhanced damage against organic and volatile enemies", style=Font.INFO)
     
-    time.sleep(1)
+    pause(1)
     input("\nPress Enter to return to the main menu...")
     return
 
@@ -12948,7 +12961,7 @@ def chapter_six_teaser() -> Any:
     # Create glitchy communication effect
     for _ in range(3):
         print_glitch("..WE ARE THE CHRONO-SENTIENT... TIMELINE FRACTURE DETECTED...")
-        time.sleep(0.5)
+        pause(0.5)
     
     print_typed(f"\nHyuki's quantum instruments detect {Font.WARNING('multiple realities')} bleeding", style=Font.PLAYER)
     print_typed("together. Through the chaos, the entity transmits fragmented images:", style=Font.PLAYER)
@@ -12987,7 +13000,7 @@ def chapter_six_teaser() -> Any:
     print_typed("• Temporal Combat: Fight enemies across different points in time", style=Font.INFO)
     print_typed("• Quantum Dialogue: Converse with alternate versions of characters", style=Font.INFO)
     
-    time.sleep(1)
+    pause(1)
     input("\nPress Enter to return to the main menu...")
     return
     
@@ -13036,7 +13049,7 @@ def chapter_two_teaser() -> Any:
     print("\nInitiating pre-launch sequence", end="")
     for _ in range(5):
         print(".", end="", flush=True)
-        time.sleep(0.3)
+        pause(0.3)
     print("\n")
 
     # Create a more detailed information screen about Yanglong V
@@ -13133,10 +13146,10 @@ def chapter_two_teaser() -> Any:
     # Glitched message with animation effect
     for _ in range(3):
         print_glitch("\nD#NT TR*ST TH# AI... WE F*UND S*METH!NG... THE R#AL ORIG*N...")
-        time.sleep(0.2)
+        pause(0.2)
 
     print_glitch("CONV*RGENCE W@S CR*ATED H*RE... PR*JECT PH*ENIX... ST#LL @LIVE...")
-    time.sleep(0.4)
+    pause(0.4)
     print_glitch("S*ME OF US SURV*VED... HIDD*N IN L*VEL 7... C*ME B@CK...")
 
     # Return to present with a visual transition
@@ -13164,7 +13177,7 @@ def chapter_two_teaser() -> Any:
     delay = 0.05
     for char in "■■■■■ CHAPTER 2: YANGLONG V - COMING SOON ■■■■■":
         print(f"{Fore.RED}{Style.BRIGHT}{char}{Style.RESET_ALL}", end="", flush=True)
-        time.sleep(delay)
+        pause(delay)
     print("\n")
 
     # Add exciting teaser text with animated reveal
@@ -13179,7 +13192,7 @@ def chapter_two_teaser() -> Any:
     ]
 
     for point, style in teaser_points:
-        time.sleep(0.3)
+        pause(0.3)
         print_typed(point, style=style)
 
     print(Font.MENU("\nPress Enter to continue..."))
@@ -13235,7 +13248,7 @@ def start_chapter_two_preview() -> Any:
     print_typed("but your scanners detect power signatures within.", style=Font.LORE)
 
     print(Font.SEPARATOR_THIN)
-    time.sleep(1)
+    pause(1)
 
     # New objective
     print(Font.IMPORTANT("\nPRIMARY OBJECTIVE: Investigate the Chinese deep space station"))
@@ -13259,7 +13272,7 @@ def start_chapter_two_preview() -> Any:
     print_typed("movement. The station's automated defense systems activate.", style=Font.ENEMY)
     print_typed("\nPREPARING FOR COMBAT SIMULATION...", style=Font.SYSTEM)
 
-    time.sleep(1.5)
+    pause(1.5)
 
     # Preview combat with a new enemy type
     print(Font.BOX_TOP)
@@ -13282,7 +13295,7 @@ def start_chapter_two_preview() -> Any:
 
     # Simulated combat with new enemy
     print_typed("\nInitiating simulated combat sequence...", style=Font.SYSTEM)
-    time.sleep(1)
+    pause(1)
 
     # Create enemy instance using data from Chapter 2
     enemy = Character("Vacuum Patrol Unit", 
@@ -13482,13 +13495,13 @@ def thalassia_crash_sequence(game_state: Any, player: Any) -> Any:
     print_typed("space-time, alarms suddenly blare across all systems. The quantum")
     print_typed("drive has sustained critical damage during the dimensional transit.")
     
-    time.sleep(1)
+    pause(1)
     
     print_typed(f"\n{Font.WARNING('WARNING: QUANTUM DRIVE FAILURE')}")
     print_typed(f"{Font.WARNING('GRAVITATIONAL ANOMALY DETECTED')}")
     print_typed(f"{Font.WARNING('ORBITAL DESTABILIZATION IN PROGRESS')}")
     
-    time.sleep(0.5)
+    pause(0.5)
     
     print_typed("\nThe ship is being pulled toward a nearby planet. The viewscreen")
     print_typed("shows a vast blue sphere dominating the horizon. Your navigation")
@@ -13499,7 +13512,7 @@ def thalassia_crash_sequence(game_state: Any, player: Any) -> Any:
     print_typed(f"{Font.SYSTEM('CAUTION: HIGH WATER CONTENT (98.7% SURFACE COVERAGE)')}")
     print_typed(f"{Font.SYSTEM('ADVISORY: WATER COMPOSITION CONTAINS UNKNOWN TOXINS')}")
     
-    time.sleep(1)
+    pause(1)
     
     print_typed("\nThe ship enters the atmosphere, heat shields struggling against")
     print_typed("the entry velocity. Through the viewscreen, you see only endless")
@@ -13507,11 +13520,11 @@ def thalassia_crash_sequence(game_state: Any, player: Any) -> Any:
     
     print_typed(f"\n{Font.WARNING('BRACE FOR IMPACT')}")
     
-    time.sleep(0.8)
+    pause(0.8)
     
     print_glitch("\nI M P A C T   I M M I N E N T")
     
-    time.sleep(1.2)
+    pause(1.2)
     
     print_typed("\nYour ship crashes into the alien ocean with tremendous force.")
     print_typed("Emergency systems activate, stabilizing the vessel before it can")
@@ -13525,7 +13538,7 @@ def thalassia_crash_sequence(game_state: Any, player: Any) -> Any:
     print_typed(f"{Font.WARNING('• Communications: LIMITED - LOCAL ONLY')}")
     print_typed(f"{Font.SUCCESS('• Sensor array: OPERATIONAL')}")
     
-    time.sleep(1)
+    pause(1)
     
     print_typed("\nA database search reveals information about your location:")
     print_typed(f"\n{Font.IMPORTANT('THALASSIA SYSTEM')}")
@@ -13693,7 +13706,7 @@ def character_selection() -> Any:
         
         print_typed("\nYour sacrifice will not be forgotten...", style=Font.STAGE)
         
-        time.sleep(3)
+        pause(3)
         clear_screen()
         
         print_typed("\nYou awaken, disoriented, as the cryopod hisses open.", style=Font.PLAYER)
@@ -13789,7 +13802,7 @@ def character_selection() -> Any:
             print_typed(f"\nYou have selected {Font.PLAYER('Hyuki Nakamura')}.", style=Font.SYSTEM)
             print_typed("Her quantum navigation abilities will be crucial in the anomalies ahead...", style=Font.SYSTEM)
     
-    time.sleep(2)
+    pause(2)
     input("\nPress Enter to continue...")
     return
 
@@ -14176,11 +14189,11 @@ def andromeda_ending() -> Any:
 
     # Discovery sequence
     print_typed(f"\n{Fore.GREEN}SYSTEMS ONLINE", style=Font.SYSTEM)
-    time.sleep(0.7)
+    pause(0.7)
     print_typed(f"{Fore.YELLOW}RUNNING DIAGNOSTICS...", style=Font.SYSTEM)
-    time.sleep(0.7)
+    pause(0.7)
     print_typed(f"{Fore.RED}CRITICAL ASSESSMENT COMPLETE", style=Font.SYSTEM)
-    time.sleep(0.7)
+    pause(0.7)
 
     # Create a warning box with red background
     print(f"{Fore.WHITE}{Back.RED}╔{'═' * 48}╗{Style.RESET_ALL}")
@@ -14237,7 +14250,7 @@ def andromeda_ending() -> Any:
     print(f"{Fore.BLACK}{Back.WHITE}{' ' * 50}{Style.RESET_ALL}")  # Stars
 
     # Journey description
-    time.sleep(1)
+    pause(1)
     print_typed("\nDays pass. Then weeks. Your cryosleep cycles activate and", style=Font.LORE)
     print_typed("deactivate as the ship's AI manages your journey.", style=Font.LORE)
 
@@ -14273,7 +14286,7 @@ def andromeda_ending() -> Any:
     game_state["player_stats"]["stages_completed"] = 50
 
     # Add a pause before Chapter 2 teaser
-    time.sleep(2)
+    pause(2)
 
     # Show Chapter 2 teaser
     chapter_two_teaser()
@@ -14455,12 +14468,12 @@ def game_menu() -> Any:
     elif choice == "2":
         # Save game functionality
         print_typed("\nPreparing to save quantum state...", style=Font.SYSTEM)
-        time.sleep(1)
+        pause(1)
         manage_save_slots()
     elif choice == "3":
         # Load game functionality
         print_typed("\nPreparing to load quantum state...", style=Font.SYSTEM)
-        time.sleep(1)
+        pause(1)
         manage_save_slots()
     elif choice == "4":
         # Character status
@@ -14485,7 +14498,7 @@ def game_menu() -> Any:
     elif choice == "8":
         # Access the travel system
         print_typed("\nInitializing interstellar travel system...", style=Font.SYSTEM)
-        time.sleep(1)
+        pause(1)
         if 'game_state' in globals():
             travel_system(globals().get('player', None), globals()['game_state'])
         else:
@@ -14495,7 +14508,7 @@ def game_menu() -> Any:
     elif choice == "9":
         # Access the Cosmic Collision side quest
         print_typed("\nAccessing Cosmic Collision quest data...", style=Font.SYSTEM)
-        time.sleep(1)
+        pause(1)
         if 'game_state' in globals():
             enter_cosmic_collision_quest(globals().get('player', None), globals()['game_state'])
         else:
@@ -14505,18 +14518,18 @@ def game_menu() -> Any:
     elif choice.upper() == "R":
         # Return to main menu
         print_typed("\nReturning to main menu...", style=Font.SYSTEM)
-        time.sleep(1)
+        pause(1)
         return main_menu()
     elif choice == "0":
         # Exit game
         print_typed("\nPreparing to exit simulation...", style=Font.SYSTEM)
-        time.sleep(1)
+        pause(1)
         print_typed("Thank you for playing LAST HUMAN: EXODUS", style=Font.TITLE)
-        time.sleep(1)
+        pause(1)
         sys.exit()
     else:
         print_typed("\nInvalid command. Please try again.", style=Font.WARNING)
-        time.sleep(1)
+        pause(1)
         return game_menu()
 
 # Helper functions for game_menu
@@ -14640,13 +14653,13 @@ def display_settings() -> None:
             game_state["text_speed"] = "Fast"
         
         print_typed(f"\nText speed set to {game_state.get('text_speed', 'Normal')}", style=Font.SUCCESS)
-        time.sleep(1)
+        pause(1)
         return display_settings()
     
     elif choice == "2":
         game_state["sound_effects"] = not game_state.get("sound_effects", True)
         print_typed(f"\nSound effects turned {'On' if game_state.get('sound_effects', True) else 'Off'}", style=Font.SUCCESS)
-        time.sleep(1)
+        pause(1)
         return display_settings()
     
     elif choice == "3":
@@ -14665,7 +14678,7 @@ def display_settings() -> None:
             game_state["difficulty"] = "Hard"
         
         print_typed(f"\nDifficulty set to {game_state.get('difficulty', 'Normal')}", style=Font.SUCCESS)
-        time.sleep(1)
+        pause(1)
         return display_settings()
     
     elif choice == "4":
@@ -14673,7 +14686,7 @@ def display_settings() -> None:
     
     else:
         print_typed("\nInvalid command. Please try again.", style=Font.WARNING)
-        time.sleep(1)
+        pause(1)
         return display_settings()
 
 def start_chapter_one() -> Any:
@@ -14694,12 +14707,12 @@ def start_chapter_one() -> Any:
     print_typed("You are Dr. Xeno Valari, part of the Century Sleepers program.", style=Font.INFO)
     print_typed("Your mission was to monitor Earth while humanity fled to Andromeda.", style=Font.INFO)
     
-    time.sleep(1)
+    pause(1)
     
     print_typed("\nBut now... something is different. The AI systems have gone rogue.", style=Font.WARNING)
     print_typed("The Convergence has taken control, and you must escape.", style=Font.WARNING)
     
-    time.sleep(1)
+    pause(1)
     
     print_typed("\nYour objective: Reach the Andromeda Portal and escape Earth.", style=Font.IMPORTANT)
     print_typed("But first, you need to find supplies and understand what happened here.", style=Font.IMPORTANT)
@@ -14845,7 +14858,7 @@ def explore_cryostasis_facility() -> Any:
             current_location = locations[int(choice) - 1]
         else:
             print_typed("\nInvalid choice. Please try again.", style=Font.WARNING)
-            time.sleep(1)
+            pause(1)
 
 def continue_chapter_one() -> Any:
     """Continue Chapter 1 after exiting the facility"""
@@ -14859,7 +14872,7 @@ def continue_chapter_one() -> Any:
     print_typed("Buildings are overgrown with vegetation, streets cracked and broken.", style=Font.INFO)
     print_typed("The sky has an unnatural hue - signs of atmospheric tampering.", style=Font.WARNING)
     
-    time.sleep(1)
+    pause(1)
     
     print_typed("\nIn the distance, you spot mechanical patrols - AI-controlled drones.", style=Font.ENEMY)
     print_typed("You'll need to avoid them on your journey to the Andromeda Portal.", style=Font.IMPORTANT)
@@ -14908,7 +14921,7 @@ def continue_chapter_one() -> Any:
     print_typed("\nCongratulations! You've completed Chapter 1: Earth Reclamation.", style=Font.SUCCESS)
     print_typed("Your journey as the last human has just begun.", style=Font.IMPORTANT)
     
-    time.sleep(1)
+    pause(1)
     
     print_typed("\nChapter 2 awaits, where you'll travel to the alien world Yanglong V", style=Font.INFO)
     print_typed("in search of the ancient technology needed to defeat The Convergence.", style=Font.INFO)
@@ -15006,7 +15019,7 @@ def main_menu() -> None:
             print(Font.BOX_BOTTOM)
 
             print_typed("\nScanning for saved timeline fragments...", style=Font.SYSTEM)
-            time.sleep(1)
+            pause(1)
 
             # Go to the save management system
             manage_save_slots()
@@ -15016,7 +15029,7 @@ def main_menu() -> None:
             if "protagonist" not in game_state:
                 print_typed("\nERROR: No character data detected.", style=Font.WARNING)
                 print_typed("You must load a save file or create a new character first.", style=Font.WARNING)
-                time.sleep(2)
+                pause(2)
                 return main_menu()
 
             clear_screen()
@@ -15070,7 +15083,7 @@ def main_menu() -> None:
                 chapter_two_teaser()
                 # Future implementation: start_chapter_two()
                 print_typed("\nChapter 2 content will be available in the next update.", style=Font.WARNING)
-                time.sleep(2)
+                pause(2)
             elif chapter_choice == "3":
                 game_state["chapter"] = 3
                 game_state["current_chapter"] = "Chapter 3: White Hole"
@@ -15100,7 +15113,7 @@ def main_menu() -> None:
                 game_state["reality_fragments"] = 0
                 chapter_six_teaser()
                 print_typed("\nChapter 6 content will be available in the next update.", style=Font.WARNING)
-                time.sleep(2)
+                pause(2)
 
             elif chapter_choice == "7":
                 game_state["chapter"] = 7
@@ -15111,7 +15124,7 @@ def main_menu() -> None:
                 game_state["void_harmonic_threat"] = 30
                 chapter_seven_teaser()
                 print_typed("\nChapter 7 content will be available in the next update.", style=Font.WARNING)
-                time.sleep(2)
+                pause(2)
 
             elif chapter_choice == "8":
                 game_state["chapter"] = 8
@@ -15124,12 +15137,12 @@ def main_menu() -> None:
                 game_state["survivor_count"] = 0
                 chapter_eight_teaser()
                 print_typed("\nChapter 8 content will be available in the next update.", style=Font.WARNING)
-                time.sleep(2)
+                pause(2)
             elif chapter_choice == "0":
                 return main_menu()
             else:
                 print_typed("\nInvalid chapter selection. Returning to main menu...", style=Font.WARNING)
-                time.sleep(1)
+                pause(1)
 
             return main_menu()
         elif choice == "4":
@@ -15155,14 +15168,14 @@ def main_menu() -> None:
             side_choice = input(f"\n{Font.MENU('Select a mission or 0 to return:')} ").strip()
             if side_choice in ["1", "2", "3"]:
                 print_typed("\nMission selected. Preparing...", style=Font.SYSTEM)
-                time.sleep(1)
+                pause(1)
                 print_typed("\nFeature coming in the next update!", style=Font.WARNING)
-                time.sleep(2)
+                pause(2)
             elif side_choice == "0":
                 return main_menu()
             else:
                 print_typed("\nInvalid selection.", style=Font.WARNING)
-                time.sleep(1)
+                pause(1)
 
             return main_menu()
         elif choice == "5":
@@ -15249,7 +15262,7 @@ def main_menu() -> None:
                 if slot_num in slots:
                     # Call the repair function
                     print_typed(f"\nAttempting to repair save slot {slot_num}...", style=Font.SYSTEM)
-                    time.sleep(1)
+                    pause(1)
                     success = repair_save_file(slot_num)
                     
                     if success:
@@ -15265,7 +15278,7 @@ def main_menu() -> None:
                 pass
             else:
                 print_typed("\nInvalid selection.", style=Font.WARNING)
-                time.sleep(1)
+                pause(1)
             
             return main_menu()
         elif choice == "0":
@@ -15276,7 +15289,7 @@ def main_menu() -> None:
             return
         else:
             print_typed(f"\n{Font.WARNING('Invalid choice. Please try again.')}")
-            time.sleep(1)
+            pause(1)
             return main_menu()
 
 
@@ -1,14 +1,159 @@
 import sys
+import atexit
+import builtins
+import functools
+import bisect
+import copy
+import itertools
 import random
 import json
+import gzip
+import lzma
 import os
+import shutil
+import tempfile
+import threading
 import time
 import math
 import textwrap
 import re
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Iterable, Iterator, Callable
 from datetime import datetime
 from colorama import Fore, Back, Style, init
+from collections import deque
+from collections.abc import MutableMapping, MutableSequence
+from text_mode import TEXT_MODE, pause_length
+
+# Content Registry - large content tables live in Legacies_Content/ as one
+# JSON file per table and are only read the first time the game touches them
+CONTENT_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Legacies_Content")
+
+def decode_content(obj: Dict[str, Any]) -> Any:
+    """JSON object hook restoring the Python types JSON cannot represent"""
+    if "__int_keys__" in obj:
+        return {int(key): value for key, value in obj["__int_keys__"].items()}
+    if "__tuple__" in obj:
+        return tuple(obj["__tuple__"])
+    return obj
+
+class ContentRegistry:
+    """Loads content tables from the data store on first access"""
+
+    def __init__(self, folder: str) -> None:
+        self.folder = folder
+        self.tables: Dict[str, Any] = {}
+
+    def load(self, name: str) -> Any:
+        """Return a table, reading it from disk the first time it is needed"""
+        table = self.tables.get(name)
+        if table is None:
+            path = os.path.join(self.folder, f"{name}.json")
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    table = json.load(f, object_hook=decode_content)
+            except (FileNotFoundError, json.JSONDecodeError) as e:
+                raise RuntimeError(f"Game content '{name}' could not be loaded from {path}: {e}") from e
+            self.tables[name] = table
+        return table
+
+    def is_loaded(self, name: str) -> bool:
+        """Check whether a table has already been read from disk"""
+        return name in self.tables
+
+    def mapping(self, name: str) -> "LazyContentMapping":
+        return LazyContentMapping(self, name)
+
+    def sequence(self, name: str) -> "LazyContentSequence":
+        return LazyContentSequence(self, name)
+
+class LazyContentMapping(MutableMapping):
+    """Dictionary-like view of a content table that loads on first use"""
+
+    def __init__(self, registry: ContentRegistry, name: str) -> None:
+        self._registry = registry
+        self._name = name
+
+    @property
+    def data(self) -> Dict[Any, Any]:
+        return self._registry.load(self._name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.data[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.data[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        del self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.data
+
+    def keys(self):
+        return self.data.keys()
+
+    def items(self):
+        return self.data.items()
+
+    def values(self):
+        return self.data.values()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def copy(self) -> Dict[Any, Any]:
+        return self.data.copy()
+
+    def __repr__(self) -> str:
+        return repr(self.data)
+
+class LazyContentSequence(MutableSequence):
+    """List-like view of a content table that loads on first use"""
+
+    def __init__(self, registry: ContentRegistry, name: str) -> None:
+        self._registry = registry
+        self._name = name
+
+    @property
+    def data(self) -> List[Any]:
+        return self._registry.load(self._name)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.data[index]
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self.data[index] = value
+
+    def __delitem__(self, index: Any) -> None:
+        del self.data[index]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def insert(self, index: int, value: Any) -> None:
+        self.data.insert(index, value)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyContentSequence):
+            other = other.data
+        return self.data == other
+
+    def copy(self) -> List[Any]:
+        return self.data.copy()
+
+    def __repr__(self) -> str:
+        return repr(self.data)
+
+CONTENT = ContentRegistry(CONTENT_FOLDER)
 
 # Legendary Pets System
 LEGENDARY_PETS = {
@@ -170,7 +315,8 @@ WORLD_REGIONS = {
         "areas": ["Gateway of Stars", "Divine Court", "Celestial Gardens", "Hall of Heroes", "The Great Forge"],
         "required_level": 45,
         "required_ship": "Ethereal Skyship",
-        "required_skill": "celestial_navigation"
+        "required_skill": "celestial_navigation",
+        "navigation": "ethereal"
     },
     "Mystic Archipelago": {
         "description": "A chain of magical islands, each with unique properties and environments.",
@@ -178,7 +324,8 @@ WORLD_REGIONS = {
         "dangers": "Magical storms, sea monsters, island guardians",
         "areas": ["Navigator's Port", "Siren's Isle", "Volcano Island", "Whispering Reefs"],
         "required_level": 25,
-        "required_item": "Seaworthy vessel"
+        "required_item": "Seaworthy vessel",
+        "navigation": "sea"
     },
     "Frozen Wastes": {
         "description": "A harsh, snow-covered land where only the hardiest creatures survive.",
@@ -186,7 +333,8 @@ WORLD_REGIONS = {
         "dangers": "Frostbite, ice elementals, avalanches, winter wolves",
         "areas": ["Frost Harbor", "Glacial Peaks", "Frozen Forest", "Ice Caverns"],
         "required_level": 30,
-        "required_item": "Warm clothing"
+        "required_item": "Warm clothing",
+        "navigation": "sea"
     }
 }
 
@@ -358,9 +506,56 @@ OCEAN_EVENTS = {
     }
 }
 
+class FrameWriter:
+    """Collect everything printed during one command and write it to the terminal as a single frame"""
+
+    def __init__(self, stream: Any) -> None:
+        self.stream = stream
+        self.parts: List[str] = []
+
+    def write(self, text: str) -> int:
+        self.parts.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        if self.parts:
+            self.stream.write("".join(self.parts))
+            self.parts.clear()
+        self.stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+# Frames are flushed whenever input() is called, on pauses and before the screen is cleared
+frame_writer = FrameWriter(sys.stdout)
+sys.stdout = frame_writer
+
+def flush_frame() -> None:
+    """Write the pending frame to the terminal"""
+    frame_writer.flush()
+
+# Seconds spent waiting for the player, left out of command latency in /perf
+input_wait_time = 0.0
+
+def input(prompt: Any = "") -> str:
+    """Read a line from the player, keeping track of how long we waited for it"""
+    global input_wait_time
+    start = time.perf_counter()
+    try:
+        return builtins.input(prompt)
+    finally:
+        input_wait_time += time.perf_counter() - start
+
 # Initialize colorama
 init(autoreset=True)
 
+def pause(seconds: float) -> None:
+    """Wait for a dramatic pause as text_mode.pause() does, drawing the frame so far first"""
+    seconds = pause_length(seconds)
+    if seconds:
+        flush_frame()
+        time.sleep(seconds)
+
 # Legendary Pets Function
 def manage_pets(user_data: Dict[str, Any]) -> None:
     """Main pet management interface for both regular and legendary pets"""
@@ -1318,9 +1513,8 @@ def obtain_legendary_pet(user_data: Dict[str, Any], pet_name: str) -> None:
         print(f"\n{GREEN}{pet_name} has been automatically set as your active legendary pet!{ENDC}")
 
 # Sailing and Ship Functions
-def manage_sailing(user_data: Dict[str, Any]) -> None:
-    """Main sailing interface"""
-    # Initialize ships and navigation if not present
+def ensure_sailing_data(user_data: Dict[str, Any]) -> None:
+    """Initialize ships and navigation if not present"""
     if "ships" not in user_data:
         user_data["ships"] = {}
     if "navigation" not in user_data:
@@ -1330,6 +1524,10 @@ def manage_sailing(user_data: Dict[str, Any]) -> None:
             "ocean_routes": []
         }
 
+def manage_sailing(user_data: Dict[str, Any]) -> None:
+    """Main sailing interface"""
+    ensure_sailing_data(user_data)
+
     while True:
         print(f"\n{BOLD}{CYAN}=== SAILING & NAVIGATION ===")
         print(f"\n{WHITE}Explore the vast oceans and discover new lands with your ships.")
@@ -1583,14 +1781,242 @@ def repair_ship(user_data: Dict[str, Any]) -> None:
     except ValueError:
         print(f"{RED}Please enter a number.{ENDC}")
 
+# Journey length of a leg between two ports, in the same units as sail()'s 2-5 stars
+SEA_LANE_LENGTH = 2  # Ports whose areas are connected
+OPEN_WATER_LENGTH = 5  # Any other two ports of the same realm
+# Chance that a day at sea brings an ocean event
+OCEAN_EVENT_CHANCE = 0.7
+
+# area -> (realm, region) of every port, and realm -> port -> port -> journey length
+NAVIGATION_PORTS: Dict[str, Tuple[str, str]] = {}
+NAVIGATION_GRAPH: Dict[str, Dict[str, Dict[str, int]]] = {}
+# (realm, ship speed, maps) -> (days, next stop) between every two ports
+ROUTE_TABLES: Dict[Tuple[str, int, Tuple[str, ...]], Tuple[Dict[str, Dict[str, int]], Dict[str, Dict[str, str]]]] = {}
+
+def navigation_ports() -> Dict[str, Tuple[str, str]]:
+    """Realm and region of every area a ship can sail from, built from the regions marked for navigation"""
+    if not NAVIGATION_PORTS:
+        for region, region_data in WORLD_REGIONS.items():
+            realm = region_data.get("navigation")
+            if not realm:
+                continue
+            for area in region_data["areas"]:
+                if area in NEW_AREAS:
+                    NAVIGATION_PORTS[area] = (realm, region)
+
+        for area, (realm, _) in NAVIGATION_PORTS.items():
+            lanes = NAVIGATION_GRAPH.setdefault(realm, {}).setdefault(area, {})
+            for other, (other_realm, _) in NAVIGATION_PORTS.items():
+                if other == area or other_realm != realm:
+                    continue
+                connected = other in NEW_AREAS[area].get("connections", []) or area in NEW_AREAS[other].get("connections", [])
+                lanes[other] = SEA_LANE_LENGTH if connected else OPEN_WATER_LENGTH
+    return NAVIGATION_PORTS
+
+def realm_ports(realm: str) -> List[str]:
+    """Ports of one realm, in the order of the world regions"""
+    return [area for area, (area_realm, _) in navigation_ports().items() if area_realm == realm]
+
+def route_table(realm: str, speed: int, maps: Iterable[str]) -> Tuple[Dict[str, Dict[str, int]], Dict[str, Dict[str, str]]]:
+    """All-pairs fastest voyages of a realm for a ship speed, sailing only into ports the maps cover"""
+    key = (realm, speed, tuple(sorted(set(maps))))
+    table = ROUTE_TABLES.get(key)
+    if table is None:
+        ports = realm_ports(realm)
+        charted = {port for port in ports if f"{NAVIGATION_PORTS[port][1]} Map" in key[2]}
+        # (days, legs) so that equally fast routes make as few stops as possible
+        best: Dict[str, Dict[str, Tuple[int, int]]] = {port: {port: (0, 0)} for port in ports}
+        next_stop: Dict[str, Dict[str, str]] = {port: {} for port in ports}
+        for port in ports:
+            for other, length in NAVIGATION_GRAPH[realm][port].items():
+                if other in charted:
+                    best[port][other] = (max(1, length // speed), 1)
+                    next_stop[port][other] = other
+
+        # Floyd-Warshall, the graphs are a handful of ports
+        for via in ports:
+            for port in ports:
+                to_via = best[port].get(via)
+                if to_via is None or via == port:
+                    continue
+                for other, from_via in best[via].items():
+                    candidate = (to_via[0] + from_via[0], to_via[1] + from_via[1])
+                    current = best[port].get(other)
+                    if other != port and (current is None or candidate < current):
+                        best[port][other] = candidate
+                        next_stop[port][other] = next_stop[port][via]
+
+        days = {port: {other: value[0] for other, value in row.items()} for port, row in best.items()}
+        table = ROUTE_TABLES[key] = (days, next_stop)
+    return table
+
+def plan_route(start: str, destination: str, speed: int, maps: Iterable[str]) -> Optional[List[Tuple[str, int]]]:
+    """Stops of the fastest voyage between two ports of a realm with the days of each leg, None if uncharted"""
+    ports = navigation_ports()
+    realm = ports[start][0]
+    days, next_stop = route_table(realm, speed, maps)
+    if destination not in next_stop[start]:
+        return None
+
+    legs = []
+    here = start
+    while here != destination:
+        stop = next_stop[here][destination]
+        legs.append((stop, days[here][stop]))
+        here = stop
+    return legs
+
+def roll_ocean_event() -> Optional[str]:
+    """Event of one day at sea, chosen by OCEAN_EVENTS probability, None for an uneventful day"""
+    if random.random() >= OCEAN_EVENT_CHANCE:
+        return None
+    event_roll = random.random()
+    cumulative_prob = 0
+    for event_id, event_data in OCEAN_EVENTS.items():
+        cumulative_prob += event_data["probability"]
+        if event_roll <= cumulative_prob:
+            return event_id
+    return None
+
+def apply_ocean_event(user_data: Dict[str, Any], ship_id: str, event_id: str) -> None:
+    """Resolve the effects of an ocean event on the player and the ship"""
+    ship = user_data["ships"][ship_id]
+    if event_id == "calm":
+        # Heal player slightly
+        heal_amount = int(user_data["max_health"] * 0.1)
+        user_data["health"] = min(user_data["max_health"], user_data["health"] + heal_amount)
+        print(f"\n{GREEN}The calm seas allow you to rest. You recover {heal_amount} health.{ENDC}")
+
+    elif event_id == "storm":
+        # Damage ship
+        damage = random.randint(5, 15)
+        ship["durability"] = max(1, ship["durability"] - damage)
+        print(f"\n{RED}Your ship takes {damage} damage from the violent storm!{ENDC}")
+
+    elif event_id == "pirates":
+        # Simple simulation of pirate encounter
+        print(f"\n{RED}You engage in battle with the pirates!{ENDC}")
+        if random.random() < 0.6:  # 60% chance to win
+            print(f"{GREEN}You successfully fend off the pirates!{ENDC}")
+
+            # Gain loot
+            gold_found = random.randint(50, 200)
+            user_data["gold"] += gold_found
+            print(f"{YELLOW}You find {gold_found} gold from the defeated pirates.{ENDC}")
+        else:
+            # Take damage to ship and player
+            ship_damage = random.randint(10, 25)
+            ship["durability"] = max(1, ship["durability"] - ship_damage)
+
+            player_damage = random.randint(5, 15)
+            user_data["health"] = max(1, user_data["health"] - player_damage)
+
+            print(f"{RED}The pirates damage your ship and crew before retreating!")
+            print(f"Ship damage: {ship_damage} | Your health: -{player_damage}{ENDC}")
+
+    elif event_id == "sea_monster":
+        # Simulate sea monster encounter
+        print(f"\n{RED}A massive sea creature attacks your ship!{ENDC}")
+
+        # Outcome depends on ship type and durability
+        if "War Galleon" in ship["type"] or "Arcane Schooner" in ship["type"]:
+            if random.random() < 0.7:  # 70% chance to defeat with powerful ships
+                print(f"{GREEN}Your well-equipped ship allows you to defeat the monster!{ENDC}")
+
+                # Add rare material as reward
+                if "materials" not in user_data:
+                    user_data["materials"] = {}
+
+                rare_materials = ["Sea Monster Hide", "Monster Tooth", "Abyssal Scale"]
+                material = random.choice(rare_materials)
+                amount = random.randint(1, 3)
+
+                if material not in user_data["materials"]:
+                    user_data["materials"][material] = 0
+                user_data["materials"][material] += amount
+
+                print(f"{YELLOW}You collect {amount} {material} from the defeated monster.{ENDC}")
+            else:
+                # Major damage to ship
+                ship_damage = random.randint(30, 50)
+                ship["durability"] = max(1, ship["durability"] - ship_damage)
+                print(f"{RED}The monster severely damages your ship before retreating to the depths!{ENDC}")
+        else:
+            # Weaker ships fare worse
+            if random.random() < 0.3:  # 30% chance to escape unharmed
+                print(f"{GREEN}Through skillful maneuvering, you manage to escape the monster!{ENDC}")
+            else:
+                # Major damage to ship
+                ship_damage = random.randint(40, 70)
+                ship["durability"] = max(1, ship["durability"] - ship_damage)
+
+                # Player takes damage too
+                player_damage = random.randint(10, 25)
+                user_data["health"] = max(1, user_data["health"] - player_damage)
+
+                print(f"{RED}The monster batters your ship and injures several crew members!")
+                print(f"Ship damage: {ship_damage} | Your health: -{player_damage}{ENDC}")
+
+    # Handle more events as needed...
+
+def check_ship_sinking(user_data: Dict[str, Any], ship_id: str) -> str:
+    """End-of-day hull check: "afloat", "sunk" (ship lost) or "adrift" (ship lost and washed ashore)"""
+    ship = user_data["ships"][ship_id]
+    if ship["durability"] >= SHIPS[ship["type"]]["durability"] * 0.2:
+        return "afloat"
+    print(f"\n{RED}WARNING: {ship['name']} is severely damaged and at risk of sinking!{ENDC}")
+
+    # 10% chance of sinking if below 20% durability
+    if random.random() >= 0.1:
+        return "afloat"
+    print(f"\n{RED}DISASTER! Your ship has been torn apart by the harsh conditions!")
+    print(f"You and your crew barely make it to a lifeboat and drift for days...{ENDC}")
+
+    # Remove ship from inventory
+    del user_data["ships"][ship_id]
+
+    # 50% chance to lose the journey completely and wash up somewhere random
+    if random.random() >= 0.5:
+        return "sunk"
+    random_locations = ["Greenwood Village", "Navigator's Port", "Frost Harbor"]
+    random_destination = random.choice(random_locations)
+
+    print(f"\n{YELLOW}After days adrift, you wash ashore near {random_destination}.{ENDC}")
+    user_data["current_area"] = random_destination
+
+    # Take damage
+    damage = random.randint(20, 40)
+    user_data["health"] = max(1, user_data["health"] - damage)
+
+    print(f"{RED}You suffered {damage} damage from exposure and lack of supplies.{ENDC}")
+    return "adrift"
+
+def chart_arrival(user_data: Dict[str, Any], origin: str, destination: str, destination_region: str) -> None:
+    """Move the player into a port, recording its region and the route sailed"""
+    # Update player location
+    user_data["current_area"] = destination
+
+    # Add region to discovered regions if not already there
+    if destination_region not in user_data["navigation"]["discovered_regions"]:
+        user_data["navigation"]["discovered_regions"].append(destination_region)
+        print(f"\n{CYAN}You've discovered a new region: {destination_region}!{ENDC}")
+
+    # Add ocean route to known routes
+    route = f"{origin} to {destination}"
+    reverse_route = f"{destination} to {origin}"
+
+    if route not in user_data["navigation"]["ocean_routes"] and reverse_route not in user_data["navigation"]["ocean_routes"]:
+        user_data["navigation"]["ocean_routes"].append(route)
+        print(f"\n{YELLOW}You've charted a new ocean route: {route}{ENDC}")
+
 def sail(user_data: Dict[str, Any]) -> None:
     """Main sailing function - allows player to travel between regions by sea or sky"""
     print(f"\n{BOLD}{CYAN}=== SET SAIL ===")
 
     # Check player's location type (coastal or celestial gateway)
     current_area = user_data.get("current_area", "")
-    coastal_areas = ["Navigator's Port", "Siren's Isle", "Volcano Island", "Whispering Reefs", "Frost Harbor"]
-    celestial_areas = ["Gateway of Stars", "Divine Court", "Celestial Gardens", "Hall of Heroes", "The Great Forge"]
+    coastal_areas = realm_ports("sea")
+    celestial_areas = realm_ports("ethereal")
 
     # Determine navigation type based on location
     if current_area in coastal_areas:
@@ -1691,7 +2117,7 @@ def sail(user_data: Dict[str, Any]) -> None:
                 # Check all coastal areas except current area
                 for area in coastal_areas:
                     if area != current_area:
-                        region = next((r for r, data in WORLD_REGIONS.items() if area in data["areas"]), None)
+                        region = NAVIGATION_PORTS[area][1]
 
                         # Check if player has map for this region
                         if region and f"{region} Map" in user_data["navigation"]["maps"]:
@@ -1764,132 +2190,26 @@ def sail(user_data: Dict[str, Any]) -> None:
                         print(f"\n{YELLOW}=== Day {day} of {journey_time} ===")
 
                         # Random ocean event (70% chance)
-                        if random.random() < 0.7:
-                            # Choose random event based on probability
-                            event_roll = random.random()
-                            cumulative_prob = 0
-                            chosen_event = None
-
-                            for event_id, event_data in OCEAN_EVENTS.items():
-                                cumulative_prob += event_data["probability"]
-                                if event_roll <= cumulative_prob:
-                                    chosen_event = event_id
-                                    break
-
-                            if chosen_event:
-                                event = OCEAN_EVENTS[chosen_event]
-                                print(f"\n{BOLD}{CYAN}{event['name']}!")
-                                print(f"{WHITE}{event['description']}")
-                                print(f"{YELLOW}Effect: {event['effect']}")
-
-                                # Handle event effects
-                                if chosen_event == "calm":
-                                    # Heal player slightly
-                                    heal_amount = int(user_data["max_health"] * 0.1)
-                                    user_data["health"] = min(user_data["max_health"], user_data["health"] + heal_amount)
-                                    print(f"\n{GREEN}The calm seas allow you to rest. You recover {heal_amount} health.{ENDC}")
-
-                                elif chosen_event == "storm":
-                                    # Damage ship
-                                    damage = random.randint(5, 15)
-                                    user_data["ships"][chosen_ship_id]["durability"] = max(1, user_data["ships"][chosen_ship_id]["durability"] - damage)
-                                    print(f"\n{RED}Your ship takes {damage} damage from the violent storm!{ENDC}")
-
-                                elif chosen_event == "pirates":
-                                    # Simple simulation of pirate encounter
-                                    print(f"\n{RED}You engage in battle with the pirates!{ENDC}")
-                                    if random.random() < 0.6:  # 60% chance to win
-                                        print(f"{GREEN}You successfully fend off the pirates!{ENDC}")
-
-                                        # Gain loot
-                                        gold_found = random.randint(50, 200)
-                                        user_data["gold"] += gold_found
-                                        print(f"{YELLOW}You find {gold_found} gold from the defeated pirates.{ENDC}")
-                                    else:
-                                        # Take damage to ship and player
-                                        ship_damage = random.randint(10, 25)
-                                        user_data["ships"][chosen_ship_id]["durability"] = max(1, user_data["ships"][chosen_ship_id]["durability"] - ship_damage)
-
-                                        player_damage = random.randint(5, 15)
-                                        user_data["health"] = max(1, user_data["health"] - player_damage)
-
-                                        print(f"{RED}The pirates damage your ship and crew before retreating!")
-                                        print(f"Ship damage: {ship_damage} | Your health: -{player_damage}{ENDC}")
-
-                                elif chosen_event == "sea_monster":
-                                    # Simulate sea monster encounter
-                                    print(f"\n{RED}A massive sea creature attacks your ship!{ENDC}")
-
-                                    # Outcome depends on ship type and durability
-                                    if "War Galleon" in chosen_ship["type"] or "Arcane Schooner" in chosen_ship["type"]:
-                                        if random.random() < 0.7:  # 70% chance to defeat with powerful ships
-                                            print(f"{GREEN}Your well-equipped ship allows you to defeat the monster!{ENDC}")
-
-                                            # Add rare material as reward
-                                            if "materials" not in user_data:
-                                                user_data["materials"] = {}
-
-                                            rare_materials = ["Sea Monster Hide", "Monster Tooth", "Abyssal Scale"]
-                                            material = random.choice(rare_materials)
-                                            amount = random.randint(1, 3)
-
-                                            if material not in user_data["materials"]:
-                                                user_data["materials"][material] = 0
-                                            user_data["materials"][material] += amount
-
-                                            print(f"{YELLOW}You collect {amount} {material} from the defeated monster.{ENDC}")
-                                        else:
-                                            # Major damage to ship
-                                            ship_damage = random.randint(30, 50)
-                                            user_data["ships"][chosen_ship_id]["durability"] = max(1, user_data["ships"][chosen_ship_id]["durability"] - ship_damage)
-                                            print(f"{RED}The monster severely damages your ship before retreating to the depths!{ENDC}")
-                                    else:
-                                        # Weaker ships fare worse
-                                        if random.random() < 0.3:  # 30% chance to escape unharmed
-                                            print(f"{GREEN}Through skillful maneuvering, you manage to escape the monster!{ENDC}")
-                                        else:
-                                            # Major damage to ship
-                                            ship_damage = random.randint(40, 70)
-                                            user_data["ships"][chosen_ship_id]["durability"] = max(1, user_data["ships"][chosen_ship_id]["durability"] - ship_damage)
-
-                                            # Player takes damage too
-                                            player_damage = random.randint(10, 25)
-                                            user_data["health"] = max(1, user_data["health"] - player_damage)
-
-                                            print(f"{RED}The monster batters your ship and injures several crew members!")
-                                            print(f"Ship damage: {ship_damage} | Your health: -{player_damage}{ENDC}")
-
-                                # Handle more events as needed...
+                        chosen_event = roll_ocean_event()
+                        if chosen_event:
+                            event = OCEAN_EVENTS[chosen_event]
+                            print(f"\n{BOLD}{CYAN}{event['name']}!")
+                            print(f"{WHITE}{event['description']}")
+                            print(f"{YELLOW}Effect: {event['effect']}")
+
+                            # Handle event effects
+                            apply_ocean_event(user_data, chosen_ship_id, chosen_event)
                         else:
                             print(f"{WHITE}You have an uneventful day of sailing.{ENDC}")
 
                         # Check if ship is severely damaged
-                        if user_data["ships"][chosen_ship_id]["durability"] < SHIPS[chosen_ship["type"]]["durability"] * 0.2:
-                            print(f"\n{RED}WARNING: {chosen_ship['name']} is severely damaged and at risk of sinking!{ENDC}")
-
-                            # 10% chance of sinking if below 20% durability
-                            if random.random() < 0.1:
-                                print(f"\n{RED}DISASTER! Your ship has been torn apart by the harsh conditions!")
-                                print(f"You and your crew barely make it to a lifeboat and drift for days...{ENDC}")
-
-                                # Remove ship from inventory
-                                del user_data["ships"][chosen_ship_id]
-
-                                # 50% chance to lose the journey completely and wash up somewhere random
-                                if random.random() < 0.5:
-                                    random_locations = ["Greenwood Village", "Navigator's Port", "Frost Harbor"]
-                                    random_destination = random.choice(random_locations)
-
-                                    print(f"\n{YELLOW}After days adrift, you wash ashore near {random_destination}.{ENDC}")
-                                    user_data["current_area"] = random_destination
-
-                                    # Take damage
-                                    damage = random.randint(20, 40)
-                                    user_data["health"] = max(1, user_data["health"] - damage)
-
-                                    print(f"{RED}You suffered {damage} damage from exposure and lack of supplies.{ENDC}")
-                                    journey_success = False
-                                    break
+                        hull = check_ship_sinking(user_data, chosen_ship_id)
+                        if hull == "adrift":
+                            journey_success = False
+                            break
+                        if hull == "sunk":
+                            # The lifeboat makes the rest of the journey
+                            break
 
                         # Pause between days
                         input("\nPress Enter to continue...")
@@ -1898,22 +2218,7 @@ def sail(user_data: Dict[str, Any]) -> None:
                     if journey_success:
                         print(f"\n{BOLD}{GREEN}=== LAND HO! ===")
                         print(f"\n{WHITE}After {journey_time} days at sea, you arrive safely at {destination}.")
-
-                        # Update player location
-                        user_data["current_area"] = destination
-
-                        # Add region to discovered regions if not already there
-                        if destination_region not in user_data["navigation"]["discovered_regions"]:
-                            user_data["navigation"]["discovered_regions"].append(destination_region)
-                            print(f"\n{CYAN}You've discovered a new region: {destination_region}!{ENDC}")
-
-                        # Add ocean route to known routes
-                        route = f"{current_area} to {destination}"
-                        reverse_route = f"{destination} to {current_area}"
-
-                        if route not in user_data["navigation"]["ocean_routes"] and reverse_route not in user_data["navigation"]["ocean_routes"]:
-                            user_data["navigation"]["ocean_routes"].append(route)
-                            print(f"\n{YELLOW}You've charted a new ocean route: {route}{ENDC}")
+                        chart_arrival(user_data, current_area, destination, destination_region)
                 else:
                     print(f"{RED}Invalid destination selection.{ENDC}")
             except ValueError:
@@ -1923,6 +2228,104 @@ def sail(user_data: Dict[str, Any]) -> None:
     except ValueError:
         print(f"{RED}Please enter a number.{ENDC}")
 
+def sail_route(user_data: Dict[str, Any], destination_name: str) -> None:
+    """Sail the fastest multi-leg voyage to a port, resolving every day at sea in one go"""
+    if not destination_name:
+        print("Usage: /route <destination>")
+        return
+    ensure_sailing_data(user_data)
+    ports = navigation_ports()
+    destination = next((area for area in ports if area.lower() == destination_name.lower()), None)
+    if destination is None:
+        print(f"{RED}'{destination_name}' is not a port. Ports: {', '.join(ports)}{ENDC}")
+        return
+
+    current_area = user_data.get("current_area", "")
+    if current_area not in ports:
+        print(f"\n{RED}You need to be at a coastal location or celestial gateway to set sail.{ENDC}")
+        return
+    if destination == current_area:
+        print(f"{YELLOW}You are already at {destination}.{ENDC}")
+        return
+    realm, destination_region = ports[destination]
+    if ports[current_area][0] != realm:
+        print(f"{RED}{destination} lies in the {destination_region}, which you can't reach from {current_area}.{ENDC}")
+        return
+
+    if realm == "ethereal" and "celestial_navigation" not in user_data.get("skills", {}):
+        print(f"\n{YELLOW}You need the Celestial Navigation skill to traverse the Ethereal Realm.")
+        print(f"Visit the Star Cartographer at Gateway of Stars to learn this skill.{ENDC}")
+        return
+    if realm == "ethereal" and "Ethereal Map" not in user_data["navigation"]["maps"]:
+        print(f"\n{RED}You need an Ethereal Map to navigate the divine realms. Visit the Star Cartographer.{ENDC}")
+        return
+
+    # The fastest seaworthy ship that can sail the realm, the sturdiest among equally fast ones
+    ships = [(ship_id, ship) for ship_id, ship in user_data["ships"].items()
+             if ship["durability"] > 0 and (realm == "sea" or SHIPS[ship["type"]].get("realm", "Sea") in ["Ethereal", "All"])]
+    if not ships:
+        print(f"\n{RED}You have no ship in sailing condition that can make this journey.{ENDC}")
+        return
+    ship_id, ship = max(ships, key=lambda entry: (entry[1]["speed"], entry[1]["durability"]))
+
+    legs = plan_route(current_area, destination, ship["speed"], user_data["navigation"]["maps"])
+    if legs is None:
+        print(f"\n{RED}You don't have the maps to chart a course to {destination}.{ENDC}")
+        return
+
+    total_days = sum(days for _, days in legs)
+    print(f"\n{BOLD}{CYAN}=== ROUTE TO {destination.upper()} ===")
+    print(f"\n{WHITE}Sailing with {ship['name']} (speed {ship['speed']}):")
+    origin = current_area
+    for stop, days in legs:
+        print(f"  {origin} -> {GREEN}{stop}{ENDC} ({days} day{'s' if days != 1 else ''})")
+        origin = stop
+    print(f"{WHITE}Total: {len(legs)} leg{'s' if len(legs) != 1 else ''}, {total_days} days at sea.")
+
+    if input("\nSet sail? (y/n): ").strip().lower() != "y":
+        return
+
+    # Every day of the voyage gets its ocean event up front, then the days are resolved in order
+    events = [roll_ocean_event() for _ in range(total_days)]
+    durability_before = ship["durability"]
+    health_before = user_data["health"]
+    gold_before = user_data["gold"]
+    quiet_days = 0
+    day = 0
+    outcome = "afloat"
+    origin = current_area
+    for stop, days in legs:
+        for _ in range(days):
+            event_id = events[day]
+            day += 1
+            if event_id:
+                print(f"\n{YELLOW}Day {day} ({origin} -> {stop}): {BOLD}{OCEAN_EVENTS[event_id]['name']}{ENDC}")
+                apply_ocean_event(user_data, ship_id, event_id)
+            else:
+                quiet_days += 1
+            outcome = check_ship_sinking(user_data, ship_id)
+            if outcome != "afloat":
+                break
+        if outcome == "adrift":
+            break
+        # Without a ship the lifeboat only makes it to the end of the leg
+        chart_arrival(user_data, origin, stop, ports[stop][1])
+        origin = stop
+        if outcome == "sunk":
+            break
+
+    print(f"\n{BOLD}{CYAN}=== VOYAGE LOG ===")
+    print(f"{WHITE}Days at sea: {day} ({quiet_days} uneventful)")
+    if outcome == "afloat":
+        print(f"{GREEN}You arrive safely at {destination}.{ENDC}")
+        print(f"{WHITE}Ship condition: {durability_before} -> {ship['durability']}/{SHIPS[ship['type']]['durability']}")
+    elif outcome == "sunk":
+        print(f"{RED}Your lifeboat comes ashore at {origin}, short of {destination}.{ENDC}" if origin != destination
+              else f"{YELLOW}You reach {destination} in your lifeboat.{ENDC}")
+    print(f"{WHITE}Health: {health_before} -> {user_data['health']} | Gold: {gold_before} -> {user_data['gold']}{ENDC}")
+    # The days at sea pass on the game clock as well
+    advance_game_time(day * TICKS_PER_DAY)
+
 def view_maps(user_data: Dict[str, Any]) -> None:
     """View maps and discovered regions"""
     print(f"\n{BOLD}{CYAN}=== MAPS & DISCOVERED REGIONS ===")
@@ -2021,6 +2424,7 @@ def ship_encyclopedia() -> None:
 
 def clear_screen() -> None:
     """Clear the terminal screen"""
+    flush_frame()
     os.system('cls' if os.name == 'nt' else 'clear')
 
 # Color constants - using colorama named colors for cross-platform compatibility
@@ -2096,6 +2500,7 @@ TICK_COMMANDS = {
     '/fight': (4, 8), 
     '/craft': (3, 6),
     '/dungeon': (8, 15),
+    '/dungeon_auto': (8, 15),
     '/travel': (5, 10),
     '/search': (2, 4),
     '/find_key': (3, 6),
@@ -2112,7 +2517,7 @@ NO_TICK_COMMANDS = {'/help', '/stats', '/h', '/s_t', '/inventory', '/i', '/mater
                    '/support', '/exit', '/x', '/dimensions', '/dim', '/camp',
                    '/camp_build', '/camp_repair', '/camp_use', '/camp_demolish', '/camp_info',
                    '/return_home', '/weather', '/season', '/archaeology', '/arch',
-                   '/artifacts', '/relics', '/ancient_knowledge'}
+                   '/artifacts', '/relics', '/ancient_knowledge', '/perf', '/craftplan'}
 
 # Game time tracking
 # Weather system
@@ -2198,543 +2603,10 @@ game_state = {
 }
 
 # NPCs and their dialogues
-NPCS = {
-    "Old Sage": {
-        "location": "Greenwood Village",
-        "dialogues": {
-            "greeting": "Welcome, young adventurer. The world needs heroes now more than ever.",
-            "quest": "Dark forces gather in the east. Will you help us?",
-            "story": {
-                "intro": "Long ago, our lands were peaceful...",
-                "chapter1": "But then the Legion Of Darkness, once sealed underground, came back...",
-                "chapter2": "Now we need a hero to unite everyone against the Legion Of Darkness like how the legendary heroes did to seal it..."
-            },
-            "additional": [
-                "Legends speak of an ancient power hidden deep within the mountains.",
-                "Remember, courage and wisdom will guide you through the darkest times."
-            ]
-        },
-        "quests": ["Dragon Hunter", "Skeleton Cleanup"]
-    },
-    "Blacksmith": {
-        "location": "Stormhaven",
-        "dialogues": {
-            "greeting": "Need weapons? I've got the finest steel in all the realms.",
-            "quest": "If you bring me some iron ore, I can forge you special weapons.",
-            "trade": "Take a look at my wares."
-        },
-        "quests": ["Iron Gatherer"],
-        "shop": ["Iron Sword", "Steel Sword", "Iron Armor"]
-    },
-    "Mysterious Stranger": {
-        "location": "Shadowmere",
-        "dialogues": {
-            "greeting": "Psst... seeking rare artifacts?",
-            "quest": "The shadows hold many secrets... and treasures.",
-            "warning": "Beware the Crimson Abyss... death awaits the unprepared.",
-            "additional": [
-                "There are secrets buried beneath the ruins, waiting to be uncovered.",
-                "Trust no one, for the enemy may be closer than you think."
-            ]
-        },
-        "quests": ["Shadow Walker"]
-    },
-    "Village Elder": {
-        "location": "Greenwood Village",
-        "dialogues": {
-            "greeting": "Greetings, traveler. Our village has seen better days.",
-            "quest": "We need help gathering herbs to heal the sick.",
-            "story": "The forest holds many secrets, some better left undisturbed."
-        },
-        "quests": ["Herbal Remedy"]
-    },
-    "Merchant": {
-        "location": "Stormhaven",
-        "dialogues": {
-            "greeting": "Looking for rare goods? You've come to the right place.",
-            "trade": "I have wares from distant lands, take a look."
-        },
-        "shop": ["Exotic Spices", "Rare Gems", "Magic Potions"]
-    },
-    # New NPCs for Weather Mysteries questline
-    "Weather Sage": {
-        "location": "Mountain Peaks",
-        "dialogues": {
-            "greeting": "The winds speak to those who listen. I hear you've come seeking knowledge.",
-            "quest": "The weather patterns have been disturbed lately. Something unnatural is at work.",
-            "story": {
-                "intro": "For generations, my family has studied the weather and its connection to the world's magic.",
-                "chapter1": "Recently, the patterns have become erratic. I fear a malevolent force is manipulating nature itself.",
-                "chapter2": "If we collect samples from different weather conditions, I might be able to trace the source of this disturbance."
-            },
-            "weather_lore": "Each type of weather carries its own magic. Thunderstorms hold the power of transformation, while snow preserves ancient energies."
-        },
-        "quests": ["The Weather Sage", "Collecting Weather Samples", "The Weather Anomaly", "Confronting the Storm Entity"]
-    },
-    "Storm Entity": {
-        "location": "Ancient Forest",
-        "dialogues": {
-            "greeting": "You dare interrupt my work? The weather bends to MY will now!",
-            "battle": "Your pathetic resistance ends here. The elements answer to me alone!",
-            "defeat": "Impossible... how could a mere mortal harness such power? Perhaps... I was wrong..."
-        },
-        "monster": True,
-        "boss": True,
-        "element": "Storm",
-        "quests": ["Confronting the Storm Entity"]
-    },
-    # New NPCs for Void Walker questline
-    "Dimensional Scholar": {
-        "location": "Grand Library",
-        "dialogues": {
-            "greeting": "Ah, an adventurer! Have you noticed the strange rifts appearing throughout the land?",
-            "quest": "I've been documenting these dimensional anomalies. Would you help me collect data?",
-            "story": {
-                "intro": "The boundaries between dimensions have always been thin in certain places.",
-                "chapter1": "But lately, something or someone has been purposely tearing holes between worlds.",
-                "chapter2": "These aren't natural occurrences - they're deliberate incursions. We must find who's responsible."
-            }
-        },
-        "quests": ["Strange Disturbances", "The Void Walker's Trail"]
-    },
-    "Dimension Guardian": {
-        "location": "Dimensional Nexus",
-        "dialogues": {
-            "greeting": "HALT! None may pass beyond this point without proving their worth.",
-            "battle": "The spaces between worlds are not meant for mortal travel. Turn back or face judgment!",
-            "defeat": "You possess... unusual strength for one of your kind. Perhaps you are... the one prophesied."
-        },
-        "monster": True,
-        "element": "Void",
-        "quests": ["Dimensional Guardians"]
-    },
-    "Void Walker": {
-        "location": "Dimensional Nexus Core",
-        "dialogues": {
-            "greeting": "So, you've found me at last. Few have the determination to follow my path.",
-            "reveal": "I am not your enemy. I am trying to seal the dimensional wounds before HE returns.",
-            "story": {
-                "intro": "I was once a guardian like those you've defeated.",
-                "chapter1": "But I discovered a terrible threat - an entity that consumes entire dimensions.",
-                "chapter2": "It was sealed away millennia ago, but the seal weakens. I've been strengthening the barriers.",
-                "chapter3": "Now that you know the truth, will you help me complete my work? Or will you stand against me?"
-            }
-        },
-        "quests": ["The Void Walker's Identity"],
-        "choices": {
-            "ally": "I understand now. I'll help you protect the dimensions.",
-            "oppose": "How can I trust you? Your methods have caused chaos across the realms."
-        },
-        "outcomes": {
-            "ally": {"item": "Void Walker's Staff", "dimension_key": "Void Plane"},
-            "oppose": {"item": "Dimensional Seal Fragment", "dimension_key": "Guardian Realm"}
-        }
-    },
-    "Wandering Bard": {
-        "location": "Dragon's Peak",
-        "dialogues": {
-            "greeting": "Songs of heroes and legends, care to listen?",
-            "story": "They say the mountains echo with the voices of ancient dragons.",
-            "quest": "Help me collect tales from the nearby villages."
-        },
-        "quests": ["Tales of the Mountain"]
-    },
-    "Resistant Underground Leader": {
-        "location": "Iron Caliphate of Al-Khilafah Al-Hadidiyah",
-        "dialogues": {
-            "greeting": "We must act carefully. The Caliphate's spies are everywhere."
-        },
-        "quests": ["Sabotage Supply Lines", "Rescue Imprisoned Dissidents"],
-        "reward": "Rare blueprints for crafting resistance gear"
-    },
-    "Sympathetic Guard": {
-        "location": "Iron Caliphate of Al-Khilafah Al-Hadidiyah",
-        "dialogues": {
-            "greeting": "The lockdown... it wasn't always like this. Something changed the Caliph."
-        },
-        "quests": ["Infiltrate the Palace", "Recover Stolen Artifacts"],
-        "reward": "Access to guarded areas, special weapons"
-    },
-    "Black Market Supplier": {
-        "location": "Iron Caliphate of Al-Khilafah Al-Hadidiyah",
-        "dialogues": {
-            "greeting": "Need food? Medical supplies? The price is high, but so are the risks."
-        },
-        "shop": ["Rare food items", "Medicinal herbs", "Lock-picking tools"],
-        "quests": ["Distract the Patrols", "Smuggle Supplies"]
-    },
-    "Ronin Mercenary": {
-        "location": "Shogunate of Shirui",
-        "dialogues": {
-            "greeting": "Honor is a luxury I can no longer afford."
-        },
-        "quests": ["Assassinate a Corrupt Official", "Protect a Whistleblower"],
-        "reward": "Unique samurai weapons, ronin armor"
-    },
-    "Imperial Spy": {
-        "location": "Shogunate of Shirui",
-        "dialogues": {
-            "greeting": "The Shogun knows everything... or so he believes."
-        },
-        "quests": ["Infiltrate the Dojo", "Decode Intercepted Messages"],
-        "reward": "Spy tools, intelligence network access"
-    },
-    "Shadow Broker": {
-        "location": "Shadowmere",
-        "dialogues": {
-            "greeting": "Information costs more than gold here."
-        },
-        "quests": ["Retrieve Stolen Secrets", "Eliminate a Rival"],
-        "reward": "Rare magic items, forbidden scrolls"
-    },
-    "Fallen Noble": {
-        "location": "Shadowmere",
-        "dialogues": {
-            "greeting": "The darkness consumes everyone eventually."
-        },
-        "quests": ["Reclaim Family Heirlooms", "Exposing Corruption"],
-        "reward": "Ancient family weapons, noble artifacts"
-    },
-    "Exiled Mage": {
-        "location": "Frostvale",
-        "dialogues": {
-            "greeting": "Cold preserves... and destroys."
-        },
-        "quests": ["Contain the Ice Wraith", "Retrieve Magical Research"],
-        "reward": "Ice-elemental weapons, frost-resistant gear"
-    },
-    "Survival Guide": {
-        "location": "Frostvale",
-        "dialogues": {
-            "greeting": "In Frostvale, respect the elements or perish."
-        },
-        "quests": ["Hunt Polar Creatures", "Establish a Safe House"],
-        "reward": "Survival kits, cold-weather armor"
-    },
-    "Dragon Egg Collector": {
-        "location": "Dragon's Peak",
-        "dialogues": {
-            "greeting": "A dragon's power begins with its egg."
-        },
-        "quests": ["Retrieve a Specific Egg", "Protect a Nest"],
-        "reward": "Dragon egg fragments (crafting materials), rare mounts"
-    },
-    "Mountain Guide": {
-        "location": "Dragon's Peak",
-        "dialogues": {
-            "greeting": "Without a guide, the mountains will bury you."
-        },
-        "quests": ["Map New Routes", "Rescue Lost Climbers"],
-        "reward": "Mountaineering gear, map fragments"
-    },
-    "Dragon Lore Scholar": {
-        "location": "Long Shui Zhen",
-        "dialogues": {
-            "greeting": "Dragons are not just beasts—they are history."
-        },
-        "quests": ["Decode Ancient Dragon Texts", "Find a Legendary Dragon"],
-        "reward": "Knowledge-based items, dragon lore books"
-    },
-    "Martial Arts Rival": {
-        "location": "Long Shui Zhen",
-        "dialogues": {
-            "greeting": "Your form is weak. Let me correct you."
-        },
-        "quests": ["Win the Tournament", "Retrieve Training Weapons"],
-        "reward": "Unique martial arts weapons, prestige items"
-    },
-    "Deserted Researcher": {
-        "location": "Crimson Abyss",
-        "dialogues": {
-            "greeting": "What we unleashed... I fear it's too late to stop."
-        },
-        "quests": ["Contain the Corruption", "Destroy Experimental Devices"],
-        "reward": "Resistance gear, purified abyssal materials"
-    },
-    "Corrupted Survivor": {
-        "location": "Crimson Abyss",
-        "dialogues": {
-            "greeting": "The Abyss... it whispers. It promises power."
-        },
-        "quests": ["Find the Cure", "Destroy the Corruption Source"],
-        "reward": "Anti-corruption items, purification rituals"
-    },
-    "Village Historian": {
-        "location": "Greenwood Village",
-        "dialogues": {
-            "greeting": "The forest holds many secrets older than the village itself."
-        },
-        "quests": ["Research Ancient Trees", "Translate Old Scrolls"],
-        "reward": "Historical artifacts, knowledge points"
-    },
-    "Local Farmer": {
-        "location": "Greenwood Village",
-        "dialogues": {
-            "greeting": "The soil here is rich, but it requires respect."
-        },
-        "quests": ["Harvest Rare Crops", "Scare Off Pests"],
-        "reward": "Farming tools, rare seeds"
-    },
-    "Fisherman": {
-        "location": "Stormhaven",
-        "dialogues": {
-            "greeting": "The sea gives generously to those who understand her."
-        },
-        "quests": ["Catch Legendary Fish", "Repair the Harbor"],
-        "reward": "Fishing gear, rare fish"
-    },
-    "Shipwright": {
-        "location": "Stormhaven",
-        "dialogues": {
-            "greeting": "A good ship is built with patience, not haste."
-        },
-        "quests": ["Find Ship Materials", "Solve Shipyard Sabotage"],
-        "reward": "Boat blueprints, navigation tools"
-    },
-    "Dragon Tamer": {
-        "location": "Dragon's Reach",
-        "dialogues": {
-            "greeting": "Dragons respect strength, but they follow wisdom."
-        },
-        "quests": ["Tame a Specific Dragon", "Retrieve Dragon Eggs", "Dragon Tamer Initiate"],
-        "reward": "Dragon companions, taming gear"
-    },
-    "Mercenary Captain": {
-        "location": "Dragon's Reach",
-        "dialogues": {
-            "greeting": "The mountains are dangerous, but the pay is good."
-        },
-        "quests": ["Escort the Convoy", "Eliminate Bandit Camps"],
-        "reward": "Mercenary gear, gold"
-    },
-    "Garden Master": {
-        "location": "Jade Lotus Village",
-        "dialogues": {
-            "greeting": "A garden reflects the grower's soul."
-        },
-        "quests": ["Cultivate Rare Herbs", "Design a Zen Garden"],
-        "reward": "Special seeds, gardening tools"
-    },
-    "Tea House Owner": {
-        "location": "Jade Lotus Village",
-        "dialogues": {
-            "greeting": "A good cup of tea can change your day."
-        },
-        "shop": ["Temporary stat-boosting teas"],
-        "quests": ["Collect Rare Tea Leaves", "Host a Tea Ceremony"],
-        "reward": "Special tea blends, social reputation"
-    },
-    "Lava Prospector": {
-        "location": "Ember Hollow",
-        "dialogues": {
-            "greeting": "The earth gives treasure to those who endure its heat."
-        },
-        "quests": ["Extract Magma Crystals", "Repair the Cooling System"],
-        "reward": "Volcanic gear, rare minerals"
-    },
-    "Fire Mage": {
-        "location": "Ember Hollow",
-        "dialogues": {
-            "greeting": "Fire is both creator and destroyer."
-        },
-        "quests": ["Contain Lava Elemental", "Retrieve Ancient Tome"],
-        "reward": "Fire-elemental weapons, spellbooks"
-    },
-    "Lunar Cultist": {
-        "location": "Moonveil Harbor",
-        "dialogues": {
-            "greeting": "The moon guides us through the darkest nights."
-        },
-        "quests": ["Harvest Moonlit Herbs", "Restore the Lunar Altar"],
-        "reward": "Moon-based magic items, night vision gear"
-    },
-    "Sea Captain": {
-        "location": "Moonveil Harbor",
-        "dialogues": {
-            "greeting": "The sea is a harsh mistress, but rewarding."
-        },
-        "quests": ["Escort the Trade Ship", "Map New Trade Routes"],
-        "reward": "Nautical gear, rare trade goods"
-    },
-    "Swamp Hermit": {
-        "location": "Blightmoor",
-        "dialogues": {
-            "greeting": "The swamp gives and takes in equal measure."
-        },
-        "quests": ["Develop an Antidote", "Destroy the Toxic Source"],
-        "reward": "Antidote recipes, poison-resistant gear"
-    },
-    "Mutated Creature Tamer": {
-        "location": "Blightmoor",
-        "dialogues": {
-            "greeting": "Even mutation has its uses."
-        },
-        "quests": ["Capture a Mutated Beast", "Retrieve Experimental Data"],
-        "reward": "Mutated pet companions, toxic weapons"
-    },
-    "Elven Archdruid": {
-        "location": "Verdant Spire",
-        "dialogues": {
-            "greeting": "Nature's balance must be preserved at all costs."
-        },
-        "quests": ["Purge the Corruption", "Retrieve the Druidic Staff"],
-        "reward": "Nature magic items, elven armor"
-    },
-    "Sky Gardener": {
-        "location": "Verdant Spire",
-        "dialogues": {
-            "greeting": "The sky holds plants that ground dwellers can't imagine."
-        },
-        "quests": ["Pollinate Rare Flowers", "Save the Floating Garden"],
-        "reward": "Flying mounts, cloudwalking boots"
-    },
-    "Frost Witch": {
-        "location": "Silverpine",
-        "dialogues": {
-            "greeting": "Winter tests us, but also blesses us."
-        },
-        "quests": ["Summon a Snow Spirit", "Protect the Winter Festival"],
-        "reward": "Frost magic items, winter-themed gear"
-    },
-    "Yeti Guide": {
-        "location": "Silverpine",
-        "dialogues": {
-            "greeting": "The mountains are my home. Let me show you their ways."
-        },
-        "quests": ["Escort Through the Pass", "Retrieve Stolen Idol"],
-        "reward": "Yeti companions, cold-resistant gear"
-    },
-    "Imperial Inquisitor": {
-        "location": "Tlācahcāyōtl Tletl Tecpanēcatl",
-        "dialogues": {
-            "greeting": "Heretics will burn for the purification of the realm."
-        },
-        "quests": ["Expose the Heretic Cell", "Retrieve the Sacred Flame"],
-        "reward": "Inquisitor gear, fire magic items"
-    },
-    "Rebel Healer": {
-        "location": "Tlācahcāyōtl Tletl Tecpanēcatl",
-        "dialogues": {
-            "greeting": "We heal the wounds the Empire inflicts."
-        },
-        "quests": ["Gather Medicine", "Save Imprisoned Dissidents"],
-        "reward": "Healing potions, medical supplies"
-    },
-    "Wandering Spirit": {
-        "location": "Cursed Katana",
-        "dialogues": {
-            "greeting": "This blade... it consumes souls."
-        },
-        "quests": ["Purify the Katana", "Find the Spirit's Rest"],
-        "reward": "Purified weapon, spirit companion"
-    },
-}
+NPCS = CONTENT.mapping("NPCS")
 
 # Main storyline chapters
-STORYLINE = {
-    "Chapter 1: The Awakening": {
-        "title": "The Awakening",
-        "description": "As darkness spreads across the land, a hero rises to face the looming threat. The fate of the realm hangs in the balance.",
-        "required_level": 1,
-        "quest_line": ["The Beginning", "First Steps", "The Dark Warning"],
-        "reward": {"gold": 200, "exp": 300, "item": "Novice Ring"}
-    },
-    "Chapter 2: The Dragon's Call": {
-        "title": "The Dragon's Call",
-        "description": "Ancient dragons stir from their slumber, their power echoing through the mountains. The hero must prove their worth to tame these mighty beasts.",
-        "required_level": 5,
-        "quest_line": ["Dragon's Peak Journey", "Dragon Trials", "The First Flight"],
-        "reward": {"gold": 500, "exp": 700, "item": "Dragon Scale Armor"}
-    },
-    "Chapter 3: The Gathering Storm": {
-        "title": "The Gathering Storm",
-        "description": "Dark forces gather in the distant lands, forming alliances that threaten the peace of all realms. You must unite the fractured kingdoms before it's too late.",
-        "required_level": 10,
-        "quest_line": ["Alliance of Kingdoms", "The Council Meeting", "The Diplomat's Journey"],
-        "reward": {"gold": 800, "exp": 1200, "item": "Diplomat's Signet"}
-    },
-    "Chapter 4: The Shadow Legion": {
-        "title": "The Shadow Legion",
-        "description": "A mysterious legion of shadow warriors has emerged from the forbidden lands. Their dark magic corrupts everything they touch.",
-        "required_level": 15,
-        "quest_line": ["Scouts of Darkness", "The Corrupted Forest", "The Shadow General"],
-        "reward": {"gold": 1200, "exp": 1800, "item": "Shadowbane Amulet"}
-    },
-    "Chapter 5: The Ancient Ones": {
-        "title": "The Ancient Ones",
-        "description": "Beings of immense power, forgotten by time, have awakened. Their return heralds an era of chaos unless their motives can be understood.",
-        "required_level": 20,
-        "quest_line": ["Whispers of the Past", "The Forbidden Library", "The Gateway"],
-        "reward": {"gold": 1500, "exp": 2500, "item": "Tome of the Ancients"}
-    },
-    "Chapter 6: The Final Confrontation": {
-        "title": "The Final Confrontation",
-        "description": "All paths have led to this moment. The fate of the world rests on your final battle against the ultimate darkness.",
-        "required_level": 25,
-        "quest_line": ["The Path Opens", "Allies United", "Darkness Falls"],
-        "reward": {"gold": 2000, "exp": 3000, "item": "Hero's Legacy"}
-    },
-    # Post-game storylines
-    "Epilogue: The New Beginning": {
-        "title": "The New Beginning",
-        "description": "Though the great darkness has been defeated, new challenges arise in a world forever changed by your actions.",
-        "required_level": 30,
-        "post_game": True,
-        "quest_line": ["Rebuilding the Realms", "New Threats Emerge", "The Hero's Journey Continues"],
-        "reward": {"gold": 3000, "exp": 4000, "item": "Crown of New Dawn"}
-    },
-    "Dimensional Rifts": {
-        "title": "Dimensional Rifts",
-        "description": "Strange portals have appeared throughout the land, leading to alternate realities and timelines. What dangers—and opportunities—might they hold?",
-        "required_level": 35,
-        "post_game": True,
-        "quest_line": ["The First Portal", "Mirror Worlds", "The Time Paradox"],
-        "reward": {"gold": 3500, "exp": 4500, "item": "Dimensional Compass"}
-    },
-    "Legacy of the Gods": {
-        "title": "Legacy of the Gods",
-        "description": "Ancient deities have taken notice of your heroic deeds. Now they challenge you to trials that will test the limits of your abilities.",
-        "required_level": 40,
-        "post_game": True,
-        "quest_line": ["Divine Challenge", "The Celestial Forge", "Ascension"],
-        "reward": {"gold": 4000, "exp": 5000, "item": "Godforged Artifact"}
-    },
-    "Chapter 3: Shadows of the Past": {
-        "title": "Shadows of the Past",
-        "description": "Dark secrets emerge from the shadows of Shadowmere, threatening to unravel the peace. The hero must confront the darkness within.",
-        "required_level": 10,
-        "quest_line": ["The Shadow's Call", "Ancient Secrets", "The Final Shadow"],
-        "reward": {"gold": 1000, "exp": 1500, "item": "Shadow Blade"}
-    },
-    "Chapter 4: The Dark Sun's Rise": {
-        "title": "The Dark Sun's Rise",
-        "description": "The Dark Sun Order, the Empire's ruthless secret police, is expanding its power. You must uncover their plans before it's too late.",
-        "required_level": 15,
-        "quest_line": ["Shadow Infiltration", "The Informant", "Dark Sun Archives"],
-        "reward": {"gold": 1500, "exp": 2000, "item": "Shadow Cloak"}
-    },
-    "Chapter 5: Imperial Machinations": {
-        "title": "Imperial Machinations",
-        "description": "The Empire of Eternal Flame strengthens its grip on the lands while the Dark Sun Order enforces their will. You discover a resistance movement.",
-        "required_level": 20,
-        "quest_line": ["Resistance Contact", "Imperial Fortress", "Escape from the Capital"],
-        "reward": {"gold": 2000, "exp": 2500, "item": "Resistance Insignia"}
-    },
-    "Chapter 6: Revolution's Dawn": {
-        "title": "Revolution's Dawn",
-        "description": "The time has come to strike against the Empire and the Dark Sun Order. You must unite the rebel factions and lead the final assault.",
-        "required_level": 25,
-        "quest_line": ["Uniting the Factions", "Battle for Freedom", "Emperor's Downfall"],
-        "reward": {"gold": 2500, "exp": 3000, "item": "Freedom's Banner"}
-    },
-    "Chapter 7: The Crimson Abyss": {
-        "title": "The Crimson Abyss",
-        "description": "A dark and foreboding realm where ancient evils stir. The hero's journey continues beyond this point...",
-        "required_level": 30,
-        "quest_line": ["Crimson Abyss Awakening", "Demon's Heart", "Abyssal Leviathan"],
-        "reward": {"gold": 3000, "exp": 3500, "item": "Demon's Heart"}
-    }
-}
+STORYLINE = CONTENT.mapping("STORYLINE")
 
 # Weapon types and their properties
 WEAPONS = {
@@ -2948,247 +2820,6 @@ CHARACTER_ELEMENTS = {
     "Arcane": MAGENTA
 }
 
-# Gacha Character Collection - Detailed character entries with stats, abilities, and lore
-GACHA_CHARACTERS = {
-    # LEGENDARY CHARACTERS (5★)
-    "Aurora": {
-        "rarity": "Legendary",
-        "element": "Light",
-        "class": "Paladin",
-        "weapon": "Sacred Sword",
-        "base_stats": {"health": 1200, "attack": 85, "defense": 75, "speed": 60},
-        "abilities": [
-            {"name": "Divine Judgement", "description": "Deals massive Light damage to all enemies", "cooldown": 4},
-            {"name": "Blessing of Light", "description": "Heals all allies and provides a defense boost", "cooldown": 3}
-        ],
-        "passive": "When HP drops below 20%, automatically heals for 30% of max HP once per battle",
-        "constellation_bonus": "All Light damage increased by 25%",
-        "lore": "Born under a solar eclipse, Aurora was blessed by the celestial light. She swore to protect the realm from darkness.",
-        "obtain_method": "Radiance Gacha Banner (Limited)",
-        "voice_lines": [
-            "The light shall guide us to victory.",
-            "Darkness cannot stand against my radiance!",
-            "For the glory of the sun kingdom!"
-        ]
-    },
-    "Ezra": {
-        "rarity": "Legendary",
-        "element": "Dark",
-        "class": "Rogue",
-        "weapon": "Shadow Daggers",
-        "base_stats": {"health": 950, "attack": 95, "defense": 50, "speed": 85},
-        "abilities": [
-            {"name": "Void Strike", "description": "Deals massive Dark damage to a single target with 50% chance to inflict Void status", "cooldown": 3},
-            {"name": "Shadow Realm", "description": "Makes entire party untargetable for 1 turn", "cooldown": 5}
-        ],
-        "passive": "20% chance to dodge any attack",
-        "constellation_bonus": "After dodging, automatically counterattacks for 150% damage",
-        "lore": "Once the heir to a noble kingdom, Ezra sacrificed everything to gain the power of the void when dark forces threatened his homeland.",
-        "obtain_method": "Abyssal Desires Gacha Banner (Limited)",
-        "voice_lines": [
-            "The shadows bend to my will.",
-            "You cannot see what lurks in the dark.",
-            "My path is my own to choose."
-        ]
-    },
-    "Solara": {
-        "rarity": "Legendary",
-        "element": "Fire",
-        "class": "Mage",
-        "weapon": "Solar Staff",
-        "base_stats": {"health": 1000, "attack": 100, "defense": 60, "speed": 70},
-        "abilities": [
-            {"name": "Solar Flare", "description": "Deals immense Fire damage to all enemies with Burn chance", "cooldown": 4},
-            {"name": "Phoenix Rebirth", "description": "Revives a fallen ally with 50% HP and grants Fire Shield", "cooldown": 6}
-        ],
-        "passive": "Applies Burn to all enemies at the start of battle",
-        "constellation_bonus": "Burn damage increased by 50%",
-        "lore": "Solara channels the eternal flame of the sun. Said to be the reincarnation of the Phoenix Queen.",
-        "obtain_method": "Celestial Flame Gacha Banner (Limited)",
-        "voice_lines": [
-            "The sun rises with me.",
-            "Ashes will be your end.",
-            "Witness rebirth through fire!"
-        ]
-    },
-
-    # EPIC CHARACTERS (4★)
-    "Lyra": {
-        "rarity": "Epic",
-        "element": "Ice",
-        "class": "Archer",
-        "weapon": "Crystalline Bow",
-        "base_stats": {"health": 850, "attack": 78, "defense": 45, "speed": 75},
-        "abilities": [
-            {"name": "Freezing Shot", "description": "Deals Ice damage with 70% chance to freeze target for 1 turn", "cooldown": 3},
-            {"name": "Blizzard Volley", "description": "Fires multiple arrows dealing AoE Ice damage", "cooldown": 4}
-        ],
-        "passive": "Critical hits have a 50% chance to apply Chill effect, reducing enemy speed",
-        "constellation_bonus": "Frozen enemies take 35% more damage from all sources",
-        "lore": "Raised in the frozen north, Lyra learned to hunt in the harshest conditions. Her arrows are infused with ancient ice magic.",
-        "obtain_method": "Standard Gacha Banner",
-        "voice_lines": [
-            "One shot, one kill.",
-            "The cold never bothered me.",
-            "I'll freeze your heart."
-        ]
-    },
-    "Terra": {
-        "rarity": "Epic",
-        "element": "Earth",
-        "class": "Mage",
-        "weapon": "Living Stone Staff",
-        "base_stats": {"health": 900, "attack": 72, "defense": 65, "speed": 50},
-        "abilities": [
-            {"name": "Stone Barrage", "description": "Launches multiple stone projectiles at random enemies", "cooldown": 3},
-            {"name": "Earthquake", "description": "Deals Earth damage to all enemies and has a chance to stun", "cooldown": 5}
-        ],
-        "passive": "Whenever Terra takes damage, gains a stacking shield that absorbs 5% of max HP (up to 25%)",
-        "constellation_bonus": "Earthquake now always stuns enemies for 1 turn",
-        "lore": "A child of the mountains, Terra can feel the heartbeat of the world beneath her feet and call upon its strength.",
-        "obtain_method": "Standard Gacha Banner",
-        "voice_lines": [
-            "The earth responds to my call.",
-            "Mountains bow to me.",
-            "Stand firm like stone."
-        ]
-    },
-    "Vayne": {
-        "rarity": "Epic",
-        "element": "Air",
-        "class": "Assassin",
-        "weapon": "Twin Fans",
-        "base_stats": {"health": 800, "attack": 82, "defense": 42, "speed": 90},
-        "abilities": [
-            {"name": "Gale Dance", "description": "Strikes multiple enemies with swift wind slashes", "cooldown": 3},
-            {"name": "Silent Step", "description": "Becomes untargetable and gains crit boost next turn", "cooldown": 5}
-        ],
-        "passive": "Gains 15% evasion while above 70% HP",
-        "constellation_bonus": "Silent Step also restores 10% HP",
-        "lore": "A legendary dancer from the sky islands who uses elegance as a weapon.",
-        "obtain_method": "Wind Whispers Gacha Banner",
-        "voice_lines": [
-            "Can you catch the wind?",
-            "My blades are as swift as air.",
-            "Dance of death, begin!"
-        ]
-    },
-
-    # RARE CHARACTERS (3★)
-    "Elm": {
-        "rarity": "Rare",
-        "element": "Nature",
-        "class": "Rogue",
-        "weapon": "Living Vines",
-        "base_stats": {"health": 750, "attack": 65, "defense": 55, "speed": 70},
-        "abilities": [
-            {"name": "Entangling Roots", "description": "Immobilizes an enemy and deals Nature damage over time", "cooldown": 3},
-            {"name": "Life Bloom", "description": "Heals the party for a moderate amount", "cooldown": 4}
-        ],
-        "passive": "Recovers 5% HP at the start of each turn",
-        "constellation_bonus": "Entangling Roots affects all enemies",
-        "lore": "Once a tree spirit, Elm took human form to protect the ancient forests from those who would destroy them.",
-        "obtain_method": "Standard Gacha Banner",
-        "voice_lines": [
-            "Nature always finds a way.",
-            "The forest speaks through me.",
-            "Growth comes after hardship."
-        ]
-    },
-    "Andrei": {
-        "rarity": "Rare",
-        "element": "Lightning",
-        "class": "Warrior",
-        "weapon": "Volt Axe",
-        "base_stats": {"health": 780, "attack": 70, "defense": 60, "speed": 65},
-        "abilities": [
-            {
-                "name": "Thunder Cleave",
-                "description": "Deals Lightning damage to a single enemy and has a 30% chance to stun",
-                "cooldown": 3
-            },
-            {
-                "name": "Chargebreaker",
-                "description": "Deals damage and reduces enemy defense for 2 turns",
-                "cooldown": 4
-            }
-        ],
-        "passive": "When landing a critical hit, gains +10 speed for 1 turn (stacks up to 3 times)",
-        "constellation_bonus": "Thunder Cleave's stun chance increases to 60%",
-        "lore": "A battle-hardened mercenary who fights for coin but carries a code of honor. His axe crackles with the fury of a hundred storms.",
-        "obtain_method": "Standard Gacha Banner, Mercenary's Pact Event",
-        "voice_lines": [
-            "Pay me well, and I'll bring the thunder.",
-            "Storm’s coming... and I'm leading it.",
-            "No loyalty, only lightning."
-        ]
-    },
-
-    # UNCOMMON CHARACTERS (2★)
-    "Marin": {
-        "rarity": "Uncommon",
-        "element": "Water",
-        "class": "Warrior",
-        "weapon": "Coral Trident",
-        "base_stats": {"health": 650, "attack": 58, "defense": 60, "speed": 55},
-        "abilities": [
-            {"name": "Tidal Slash", "description": "Deals Water damage to a single target", "cooldown": 2},
-            {"name": "Ocean's Protection", "description": "Creates a water shield that reduces damage taken", "cooldown": 4}
-        ],
-        "passive": "Takes 20% reduced damage when below 50% HP",
-        "constellation_bonus": "Ocean's Protection also heals allies for 10% of their max HP",
-        "lore": "Born in a coastal village, Marin swore to protect his people from sea monsters and pirates alike.",
-        "obtain_method": "Standard Gacha Banner",
-        "voice_lines": [
-            "The tide turns in my favor.",
-            "Water always finds its path.",
-            "I stand as the shore against the tide."
-        ]
-    },
-
-    # COMMON CHARACTERS (1★)
-    "Thorn": {
-        "rarity": "Common",
-        "element": "Earth",
-        "class": "Warrior",
-        "weapon": "Iron Sword",
-        "base_stats": {"health": 550, "attack": 45, "defense": 50, "speed": 45},
-        "abilities": [
-            {"name": "Strong Slash", "description": "Basic attack with increased power", "cooldown": 2},
-            {"name": "Defensive Stance", "description": "Increases defense for 2 turns", "cooldown": 3}
-        ],
-        "passive": "Has a 10% chance to counterattack when hit",
-        "constellation_bonus": "Defensive Stance also recovers 10% HP",
-        "lore": "A dedicated village guard who dreams of becoming a hero worthy of legend.",
-        "obtain_method": "Standard Gacha Banner, Friend Summons",
-        "voice_lines": [
-            "I'll protect everyone!",
-            "Stand behind me.",
-            "My sword is ready."
-        ]
-    },
-    "Juno": {
-        "rarity": "Common",
-        "element": "Water",
-        "class": "Archer",
-        "weapon": "Reed Bow",
-        "base_stats": {"health": 540, "attack": 46, "defense": 40, "speed": 50},
-        "abilities": [
-            {"name": "Water Arrow", "description": "Deals minor Water damage to an enemy", "cooldown": 2},
-            {"name": "Aqua Focus", "description": "Increases next attack's power", "cooldown": 3}
-        ],
-        "passive": "Has 5% chance to land a critical hit",
-        "constellation_bonus": "Water Arrow has a 20% chance to slow",
-        "lore": "An aspiring hunter from the riverside village, determined to prove herself.",
-        "obtain_method": "Standard Gacha Banner, Beginner Rewards",
-        "voice_lines": [
-            "One day, I'll hit the bullseye!",
-            "I won’t miss again!",
-            "Splash and sting!"
-        ]
-    }
-}
-
 # Add additional character classes
 CHARACTER_CLASSES.update({
     "Ninja": {"health_bonus": -5, "attack_bonus": 25, "defense_bonus": 5, "speed_bonus": 11},
@@ -3291,685 +2922,7 @@ MATERIALS = {
 }
 
 # Story quests are marked with story=True
-QUESTS = [
-    # Chapter 1: The Awakening Story Quests
-    {
-        "id": 101,
-        "name": "The Beginning",
-        "description": "Meet the Old Sage in Greenwood Village",
-        "target": {"npc": "Old Sage", "count": 1},
-        "reward": {"gold": 100, "exp": 200},
-        "story": True,
-        "chapter": 1,
-        "travel_locations": ["Greenwood Village", "Stormhaven", "Crystal Cave"]
-    },
-    {
-        "id": 102,
-        "name": "First Steps",
-        "description": "Defeat 10 monsters across Greenwood Village and Stormhaven",
-        "target": {"monster": "any", "count": 10},
-        "reward": {"gold": 150, "exp": 250},
-        "story": True,
-        "chapter": 1,
-        "travel_locations": ["Greenwood Village", "Stormhaven"]
-    },
-    {
-        "id": 103,
-        "name": "The Dark Warning",
-        "description": "Investigate the disturbance in Crystal Cave and Shadowmere",
-        "target": {"location": "Crystal Cave", "count": 1},
-        "reward": {"gold": 200, "exp": 300},
-        "story": True,
-        "chapter": 1,
-        "travel_locations": ["Crystal Cave", "Shadowmere"]
-    },
-
-    # Chapter 2: The Dragon's Call Story Quests
-    {
-        "id": 201,
-        "name": "Dragon's Peak Journey",
-        "description": "Travel to Dragon's Peak, Stormhaven, and Greenwood Village to meet the Dragon Tamer",
-        "target": {"npc": "Dragon Tamer", "count": 1},
-        "reward": {"gold": 300, "exp": 400},
-        "story": True,
-        "chapter": 2,
-        "travel_locations": ["Dragon's Peak", "Stormhaven", "Greenwood Village"]
-    },
-    {
-        "id": 202,
-        "name": "Dragon Trials",
-        "description": "Complete the three trials of the Dragon Tamer across Dragon's Peak",
-        "target": {"trials": "Dragon Trials", "count": 3},
-        "reward": {"gold": 400, "exp": 500},
-        "story": True,
-        "chapter": 2,
-        "travel_locations": ["Dragon's Peak"]
-    },
-    {
-        "id": 203,
-        "name": "The First Flight",
-        "description": "Tame your first dragon after traveling through Dragon's Peak and Crystal Cave",
-        "target": {"monster": "Dragon Whelp", "count": 1},
-        "reward": {"gold": 500, "exp": 600, "item": "Dragon Whistle"},
-        "story": True,
-        "chapter": 2,
-        "travel_locations": ["Dragon's Peak", "Crystal Cave"]
-    },
-
-    # Chapter 3: Shadows of the Past Story Quests
-    {
-        "id": 301,
-        "name": "The Shadow's Call",
-        "description": "Investigate the mysterious events in Shadowmere and Frostvale",
-        "target": {"location": "Shadowmere", "count": 1},
-        "reward": {"gold": 600, "exp": 700},
-        "story": True,
-        "chapter": 3,
-        "travel_locations": ["Shadowmere", "Frostvale"]
-    },
-    {
-        "id": 302,
-        "name": "Ancient Secrets",
-        "description": "Recover the lost artifacts from the Silent Ashes and Crystal Cave",
-        "target": {"item": "Ancient Artifact", "count": 3},
-        "reward": {"gold": 700, "exp": 800},
-        "story": True,
-        "chapter": 3,
-        "travel_locations": ["Silent Ashes", "Crystal Cave"]
-    },
-    {
-        "id": 303,
-        "name": "The Shadow's Return",
-        "description": "Confront the Shadow Master in his lair after traveling through Shadowmere and the Sunken Depths",
-        "target": {"monster": "Shadow Master", "count": 1},
-        "reward": {"gold": 1000, "exp": 1200, "item": "Shadow Master's Cloak"},
-        "story": True,
-        "chapter": 3,
-        "travel_locations": ["Shadowmere", "Sunken Depths"]
-    },
-    {
-        "id": 401,
-        "name": "Shadow Infiltration",
-        "description": "Infiltrate the Dark Sun Order's outer circle to gather intelligence on their operations.",
-        "target": {"monster": "Dark Sun Agent", "count": 3},
-        "reward": {"gold": 1200, "exp": 1600, "item": "Agent's Mask"},
-        "story": True,
-        "chapter": 4,
-        "travel_locations": ["Imperial City", "Shadowmere"]
-    },
-    {
-        "id": 402,
-        "name": "The Informant",
-        "description": "Make contact with a secret informant who can provide intel on the Dark Sun Order.",
-        "target": {"npc": "Mysterious Informant", "count": 1},
-        "reward": {"gold": 1300, "exp": 1700, "item": "Encrypted Documents"},
-        "story": True,
-        "chapter": 4,
-        "travel_locations": ["Stormhaven", "Shadowmere"]
-    },
-    {
-        "id": 403,
-        "name": "Dark Sun Archives",
-        "description": "Break into the Dark Sun archives to uncover evidence of their crimes.",
-        "target": {"location": "Imperial City", "count": 1},
-        "reward": {"gold": 1400, "exp": 1800, "item": "Dark Sun Cipher"},
-        "story": True,
-        "chapter": 4,
-        "travel_locations": ["Imperial City", "Dark Sun Headquarters"]
-    },
-    {
-        "id": 501,
-        "name": "Resistance Contact",
-        "description": "Establish contact with the resistance fighting against the Empire and the Dark Sun Order.",
-        "target": {"npc": "Resistance Leader", "count": 1},
-        "reward": {"gold": 1600, "exp": 2000, "item": "Resistance Badge"},
-        "story": True,
-        "chapter": 5,
-        "travel_locations": ["Resistance Hideout", "Greenwood Village"]
-    },
-    {
-        "id": 502,
-        "name": "Imperial Fortress",
-        "description": "Infiltrate one of the Empire's fortresses to sabotage their weapons supply.",
-        "target": {"location": "Imperial Fortress", "count": 1},
-        "reward": {"gold": 1800, "exp": 2200, "item": "Imperial Officer's Key"},
-        "story": True,
-        "chapter": 5,
-        "travel_locations": ["Imperial City", "Thundercliff Hold"]
-    },
-    {
-        "id": 503,
-        "name": "Escape from the Capital",
-        "description": "Help resistance fighters escape from the Imperial City while evading Dark Sun agents.",
-        "target": {"npc": "Captured Resistance Member", "count": 3},
-        "reward": {"gold": 2000, "exp": 2400, "item": "Shadow Cloak"},
-        "story": True,
-        "chapter": 5,
-        "travel_locations": ["Imperial City", "Resistance Hideout"]
-    },
-    {
-        "id": 601,
-        "name": "Uniting the Factions",
-        "description": "Travel across the land to unite the various resistance factions against the Empire.",
-        "target": {"npc": "Faction Leader", "count": 4},
-        "reward": {"gold": 2200, "exp": 2700, "item": "Unity Banner"},
-        "story": True,
-        "chapter": 6,
-        "travel_locations": ["Stormhaven", "Verdant Spire", "Moonveil Harbor", "Resistance Hideout"]
-    },
-    {
-        "id": 602,
-        "name": "Battle for Freedom",
-        "description": "Lead an assault on the Dark Sun Headquarters to dismantle their power structure.",
-        "target": {"monster": "Dark Sun Commander", "count": 1},
-        "reward": {"gold": 2300, "exp": 2800, "item": "Sorcerer's Tome"},
-        "story": True,
-        "chapter": 6,
-        "travel_locations": ["Tlācahcāyōtl Tletl Tecpanēcatl/Empire of the Sacred Fire and Chains"]
-    },
-    {
-        "id": 603,
-        "name": "Sacred Fire",
-        "description": "Ignite the sacred fire to rally the people against the empire.",
-        "target": {"location": "Tlācahcāyōtl Tletl Tecpanēcatl Palace", "count": 1},
-        "reward": {"gold": 2400, "exp": 2900, "item": "Sacred Flame"},
-        "story": True,
-        "chapter": 6,
-        "travel_locations": ["Tlācahcāyōtl Tletl Tecpanēcatl/Empire of the Sacred Fire and Chains"]
-    },
-    {
-        "id": 701,
-        "name": "Crimson Abyss Awakening",
-        "description": "Investigate the awakening of dark forces in the Crimson Abyss.",
-        "target": {"monster": "Crimson Abyss Demon", "count": 1},
-        "reward": {"gold": 3000, "exp": 3500, "item": "Demon's Heart"},
-        "story": True,
-        "chapter": 7,
-        "travel_locations": ["Crimson Abyss"]
-    },
-    {
-        "id": 702,
-        "name": "Demon's Heart",
-        "description": "Retrieve the Demon's Heart from the depths of the Crimson Abyss.",
-        "target": {"monster": "Crimson Abyss Demon", "count": 1},
-        "reward": {"gold": 3200, "exp": 3700, "item": "Demon's Heart"},
-        "story": True,
-        "chapter": 7,
-        "travel_locations": ["Crimson Abyss"]
-    },
-    {
-        "id": 703,
-        "name": "Abyssal Leviathan",
-        "description": "Defeat the Abyssal Leviathan terrorizing the Crimson Abyss.",
-        "target": {"monster": "Abyssal Leviathan", "count": 1},
-        "reward": {"gold": 3500, "exp": 4000, "item": "Leviathan Scale"},
-        "story": True,
-        "chapter": 7,
-        "travel_locations": ["Crimson Abyss"]
-    },
-    {
-        "id": 704,
-        "name": "The Final Shadow",
-        "description": "Confront the Shadow Master in the depths of the Crimson Abyss.",
-        "target": {"monster": "Shadow Master", "count": 1},
-        "reward": {"gold": 4000, "exp": 4500, "item": "Shadow Master's Cloak"},
-        "story": True,
-        "chapter": 7,
-        "travel_locations": ["Crimson Abyss"]
-    },
-    {
-        "id": 801,
-        "name": "The Final War to end the Shadow order",
-        "description": "Confront the Fallen Eternal,Noctis",
-        "target": {"monster": "Dark Legionary Supreme Lord:Noctis", "count": 1},
-        "reward": {"gold": 5000, "exp": 5500, "item": "Noctis's Shadow Crystal"},
-        "story": True,
-        "chapter": 8,
-        "travel_locations": ["Dark Legion's Fortress"]
-    },
-    {
-        "id": 1,
-        "name": "Goblin Slayer",
-        "description": "Kill 3 goblins",
-        "target": {"monster": "Goblin", "count": 3},
-        "reward": {"gold": 50, "exp": 100}
-    },
-    {
-        "id": 2,
-        "name": "Dragon Hunter",
-        "description": "Defeat any dragon",
-        "target": {"monster": "Dragon", "count": 1},
-        "reward": {"gold": 200, "exp": 300}
-    },
-    {
-        "id": 3,
-        "name": "Howling Threat",
-        "description": "Hunt down 5 wolves in the forest",
-        "target": {"monster": "Wolf", "count": 5},
-        "reward": {"gold": 40, "exp": 90}
-    },
-    {
-        "id": 4,
-        "name": "Skeleton Cleanup",
-        "description": "Destroy 4 skeletons near the cemetery",
-        "target": {"monster": "Skeleton", "count": 4},
-        "reward": {"gold": 60, "exp": 110}
-    },
-    {
-        "id": 5,
-        "name": "Ghostly Presence",
-        "description": "Banish 3 ghosts from Stormhaven",
-        "target": {"monster": "Ghost", "count": 3},
-        "reward": {"gold": 70, "exp": 150}
-    },
-    {
-        "id": 6,
-        "name": "Troll Trouble",
-        "description": "Defeat 2 Cave Trolls",
-        "target": {"monster": "Cave Troll", "count": 2},
-        "reward": {"gold": 90, "exp": 180}
-    },
-    {
-        "id": 7,
-        "name": "Dark Knight Duel",
-        "description": "Take down 1 Dark Knight in Shadowmere",
-        "target": {"monster": "Dark Knight", "count": 1},
-        "reward": {"gold": 120, "exp": 250}
-    },
-    {
-        "id": 8,
-        "name": "Fire Dragon Challenge",
-        "description": "Defeat the Fire Dragon atop Dragon's Peak",
-        "target": {"monster": "Fire Dragon", "count": 1},
-        "reward": {"gold": 250, "exp": 400}
-    },
-    {
-        "id": 9,
-        "name": "Crystal Golem Rampage",
-        "description": "Stop 2 Crystal Golems in Crystal Cave",
-        "target": {"monster": "Crystal Golem", "count": 2},
-        "reward": {"gold": 100, "exp": 200}
-    },
-    {
-        "id": 10,
-        "name": "Ice Troll Hunt",
-        "description": "Eliminate 3 Ice Trolls in Frostvale",
-        "target": {"monster": "Ice Troll", "count": 3},
-        "reward": {"gold": 80, "exp": 170}
-    },
-    {
-        "id": 11,
-        "name": "Phoenix Feather",
-        "description": "Collect 1 Phoenix Feather from the Silent Ashes",
-        "target": {"monster": "Phoenix", "count": 1},
-        "reward": {"gold": 300, "exp": 500}
-    },
-    {
-        "id": 12,
-        "name": "Water Elemental",
-        "description": "Defeat 2 Water Elementals in Long Shui Zhen",
-        "target": {"monster": "Water Elemental", "count": 2},
-        "reward": {"gold": 110, "exp": 220}
-    },
-    {
-        "id": 13,
-        "name": "Sunken Depths",
-        "description": "Explore the Sunken Depths and gather 3 Coral Golem parts",
-        "target": {"monster": "Coral Golem", "count": 3},
-        "reward": {"gold": 130, "exp": 250}
-    },
-    {
-        "id": 14,
-        "name": "Free the people",
-        "description": "Free the Shogunate from the Shogun's Tyrany",
-        "target": {"monster": "The Shogun", "count": 1},
-        "reward": {"gold": 500, "exp": 1000}
-    },
-    {
-        "id": 15,
-        "name": "Dragon's Reach",
-        "description": "Defeat the Dragon Knight in Dragon's Reach",
-        "target": {"monster": "Dragon Knight", "count": 1},
-        "reward": {"gold": 400, "exp": 600}
-    },
-    {
-        "id": 16,
-        "name": "Blightmoor Cleanup",
-        "description": "Eliminate 5 Blight Beasts in Blightmoor",
-        "target": {"monster": "Blight Beast", "count": 5},
-        "reward": {"gold": 150, "exp": 300}
-    },
-    # New quests for Iron Caliphate of Al-Khilafah Al-Hadidiyah
-    {
-        "id": 553,
-        "name": "Sabotage Supply Lines",
-        "description": "Disrupt the Iron Caliphate's supply routes to weaken their forces.",
-        "target": {"location": "The Iron Caliphate of Al-Khilafah Al-Hadidiyah", "count": 1},
-        "reward": {"gold": 2000, "exp": 2500, "item": "Blueprints for Resistance Gear"},
-        "story": False,
-        "chapter": 5,
-        "travel_locations": ["The Iron Caliphate of Al-Khilafah Al-Hadidiyah"]
-    },
-    {
-        "id": 554,
-        "name": "Rescue Imprisoned Dissidents",
-        "description": "Free the dissidents imprisoned by the Iron Caliphate.",
-        "target": {"npc": "Imprisoned Dissidents", "count": 1},
-        "reward": {"gold": 2100, "exp": 2600, "item": "Resistance Gear"},
-        "story": False,
-        "chapter": 5,
-        "travel_locations": ["The Iron Caliphate of Al-Khilafah Al-Hadidiyah"]
-    },
-    {
-        "id": 505,
-        "name": "Infiltrate the Palace",
-        "description": "Sneak into the Iron Caliphate's palace to gather intelligence.",
-        "target": {"location": "The Iron Caliphate of Al-Khilafah Al-Hadidiyah Palace", "count": 1},
-        "reward": {"gold": 2200, "exp": 2700, "item": "Special Weapons"},
-        "story": False,
-        "chapter": 5,
-        "travel_locations": ["The Iron Caliphate of Al-Khilafah Al-Hadidiyah"]
-    },
-    {
-        "id": 506,
-        "name": "Recover Stolen Artifacts",
-        "description": "Retrieve artifacts stolen by the Iron Caliphate's forces.",
-        "target": {"item": "Stolen Artifact", "count": 3},
-        "reward": {"gold": 2300, "exp": 2800, "item": "Access to Guarded Areas"},
-        "story": False,
-        "chapter": 5,
-        "travel_locations": ["The Iron Caliphate of Al-Khilafah Al-Hadidiyah"]
-    },
-    {
-        "id": 507,
-        "name": "Distract the Patrols",
-        "description": "Create diversions to help resistance members move freely.",
-        "target": {"location": "The Iron Caliphate of Al-Khilafah Al-Hadidiyah", "count": 1},
-        "reward": {"gold": 1900, "exp": 2300},
-        "story": False,
-        "chapter": 5,
-        "travel_locations": ["The Iron Caliphate of Al-Khilafah Al-Hadidiyah"]
-    },
-    {
-        "id": 508,
-        "name": "Smuggle Supplies",
-        "description": "Help smuggle food and medical supplies to the resistance.",
-        "target": {"location": "The Iron Caliphate of Al-Khilafah Al-Hadidiyah", "count": 1},
-        "reward": {"gold": 2000, "exp": 2400},
-        "story": False,
-        "chapter": 5,
-        "travel_locations": ["The Iron Caliphate of Al-Khilafah Al-Hadidiyah"]
-    },
-    # New quests for Shogunate of Shirui
-    {
-        "id": 433,
-        "name": "Assassinate a Corrupt Official",
-        "description": "Eliminate a corrupt official threatening the Shogunate's peace.",
-        "target": {"npc": "Corrupt Official", "count": 1},
-        "reward": {"gold": 1400, "exp": 1800, "item": "Unique Samurai Weapons"},
-        "story": False,
-        "chapter": 4,
-        "travel_locations": ["Shogunate of Shirui"]
-    },
-    {
-        "id": 434,
-        "name": "Protect a Whistleblower",
-        "description": "Escort a whistleblower safely out of the Shogunate.",
-        "target": {"npc": "Whistleblower", "count": 1},
-        "reward": {"gold": 1500, "exp": 1900, "item": "Ronin Armor"},
-        "story": False,
-        "chapter": 4,
-        "travel_locations": ["Shogunate of Shirui"]
-    },
-    # New quests for Shadowmere
-    {
-        "id": 304,
-        "name": "Retrieve Stolen Secrets",
-        "description": "Recover secrets stolen by rival factions in Shadowmere.",
-        "target": {"item": "Stolen Secrets", "count": 3},
-        "reward": {"gold": 1100, "exp": 1300, "item": "Rare Magic Items"},
-        "story": False,
-        "chapter": 3,
-        "travel_locations": ["Shadowmere"]
-    },
-    {
-        "id": 305,
-        "name": "Eliminate a Rival",
-        "description": "Take out a rival threatening the Shadow Broker's operations.",
-        "target": {"npc": "Rival", "count": 1},
-        "reward": {"gold": 1200, "exp": 1400, "item": "Forbidden Scrolls"},
-        "story": False,
-        "chapter": 3,
-        "travel_locations": ["Shadowmere"]
-    },
-    # New quests for Frostvale
-    {
-        "id": 306,
-        "name": "Contain the Ice Wraith",
-        "description": "Stop the Ice Wraith from terrorizing Frostvale.",
-        "target": {"monster": "Ice Wraith", "count": 1},
-        "reward": {"gold": 1300, "exp": 1500, "item": "Ice-elemental Weapons"},
-        "story": False,
-        "chapter": 3,
-        "travel_locations": ["Frostvale"]
-    },
-    {
-        "id": 307,
-        "name": "Retrieve Magical Research",
-        "description": "Find lost magical research in Frostvale.",
-        "target": {"item": "Magical Research", "count": 1},
-        "reward": {"gold": 1400, "exp": 1600, "item": "Frost-resistant Gear"},
-        "story": False,
-        "chapter": 3,
-        "travel_locations": ["Frostvale"]
-    },
-    # New quests for Dragon's Peak
-    {
-        "id": 204,
-        "name": "Retrieve a Specific Egg",
-        "description": "Find and retrieve a rare dragon egg.",
-        "target": {"item": "Dragon Egg", "count": 1},
-        "reward": {"gold": 600, "exp": 700, "item": "Dragon Egg Fragments"},
-        "story": False,
-        "chapter": 2,
-        "travel_locations": ["Dragon's Peak"]
-    },
-    {
-        "id": 205,
-        "name": "Protect a Nest",
-        "description": "Defend a dragon's nest from poachers.",
-        "target": {"location": "Dragon's Peak", "count": 1},
-        "reward": {"gold": 650, "exp": 750, "item": "Rare Mounts"},
-        "story": False,
-        "chapter": 2,
-        "travel_locations": ["Dragon's Peak"]
-    },
-    # New quests for Long Shui Zhen
-    {
-        "id": 308,
-        "name": "Decode Ancient Dragon Texts",
-        "description": "Translate ancient texts about dragons.",
-        "target": {"item": "Ancient Dragon Texts", "count": 1},
-        "reward": {"gold": 900, "exp": 1100, "item": "Dragon Lore Books"},
-        "story": False,
-        "chapter": 3,
-        "travel_locations": ["Long Shui Zhen"]
-    },
-    {
-        "id": 309,
-        "name": "Find a Legendary Dragon",
-        "description": "Locate a legendary dragon hidden in the mountains.",
-        "target": {"monster": "Legendary Dragon", "count": 1},
-        "reward": {"gold": 1000, "exp": 1200, "item": "Knowledge-based Items"},
-        "story": False,
-        "chapter": 3,
-        "travel_locations": ["Long Shui Zhen's well"]
-    },
-
-    # Seasonal Farming Quests
-    {
-        "id": 451,
-        "name": "Winter's Harvest",
-        "description": "Grow and harvest 5 Winter Mint plants during the winter season.",
-        "target": {"item": "Winter Mint", "count": 5},
-        "reward": {"gold": 600, "exp": 500, "item": "Rare Winter Seeds"},
-        "story": False,
-        "chapter": 4,
-        "requirements": {"season": "Winter"}
-    },
-    {
-        "id": 452,
-        "name": "Spring Bloom",
-        "description": "Grow and harvest 5 Spring Tulips during the spring season.",
-        "target": {"item": "Spring Tulips", "count": 5},
-        "reward": {"gold": 550, "exp": 450, "item": "Rare Spring Seeds"},
-        "story": False,
-        "chapter": 4,
-        "requirements": {"season": "Spring"}
-    },
-    {
-        "id": 453,
-        "name": "Summer's Bounty",
-        "description": "Grow and harvest 5 Summer Melons during the summer season.",
-        "target": {"item": "Summer Melon", "count": 5},
-        "reward": {"gold": 700, "exp": 550, "item": "Rare Summer Seeds"},
-        "story": False,
-        "chapter": 4,
-        "requirements": {"season": "Summer"}
-    },
-    {
-        "id": 454,
-        "name": "Autumn's Yield",
-        "description": "Grow and harvest 5 Autumn Squash during the fall season.",
-        "target": {"item": "Autumn Squash", "count": 5},
-        "reward": {"gold": 650, "exp": 500, "item": "Rare Fall Seeds"},
-        "story": False,
-        "chapter": 4,
-        "requirements": {"season": "Fall"}
-    },
-
-    # Weather-Dependent Quests
-    {
-        "id": 405,
-        "name": "Storm Harvester",
-        "description": "Grow and harvest 3 Thunderroots during stormy weather.",
-        "target": {"item": "Thunderroot", "count": 3},
-        "reward": {"gold": 800, "exp": 700, "item": "Lightning Essence"},
-        "story": False,
-        "chapter": 4,
-        "requirements": {"weather": "stormy"}
-    },
-    {
-        "id": 406,
-        "name": "Frost Gardener",
-        "description": "Grow and harvest 3 Frost Lotus plants during snowy weather.",
-        "target": {"item": "Frost Lotus", "count": 3},
-        "reward": {"gold": 850, "exp": 750, "item": "Frost Essence"},
-        "story": False,
-        "chapter": 4,
-        "requirements": {"weather": "snowy"}
-    },
-    {
-        "id": 407,
-        "name": "Desert Bloom",
-        "description": "Grow and harvest 3 Ghost Peppers during hot, sunny weather.",
-        "target": {"item": "Ghost Pepper", "count": 3},
-        "reward": {"gold": 900, "exp": 800, "item": "Fire Essence"},
-        "story": False,
-        "chapter": 4,
-        "requirements": {"weather": "sunny"}
-    },
-
-    # Secondary Story Quests - The Weather Sage's Tale
-    {
-        "id": 851,
-        "name": "The Weather Sage",
-        "description": "Meet with the Weather Sage who lives in the mountains.",
-        "target": {"npc": "Weather Sage", "count": 1},
-        "reward": {"gold": 400, "exp": 350, "item": "Weather Map"},
-        "story": True,
-        "story_arc": "Weather Mysteries",
-        "chapter": 8
-    },
-    {
-        "id": 852,
-        "name": "Collecting Weather Samples",
-        "description": "Collect samples from different weather conditions for the Weather Sage.",
-        "target": {"item": "Weather Sample", "count": 4},
-        "reward": {"gold": 500, "exp": 450, "item": "Weather Vane"},
-        "story": True,
-        "story_arc": "Weather Mysteries",
-        "chapter": 8,
-        "prerequisite": 851
-    },
-    {
-        "id": 853,
-        "name": "The Weather Anomaly",
-        "description": "Investigate the mysterious weather anomaly in the Ancient Forest.",
-        "target": {"location": "Ancient Forest", "count": 1},
-        "reward": {"gold": 600, "exp": 550, "item": "Weathered Pendant"},
-        "story": True,
-        "story_arc": "Weather Mysteries",
-        "chapter": 8,
-        "prerequisite": 852
-    },
-    {
-        "id": 854,
-        "name": "Confronting the Storm Entity",
-        "description": "Defeat the entity causing the weather disturbances.",
-        "target": {"monster": "Storm Entity", "count": 1},
-        "reward": {"gold": 1000, "exp": 900, "item": "Weather Control Rod"},
-        "story": True,
-        "story_arc": "Weather Mysteries",
-        "chapter": 8,
-        "prerequisite": 853
-    },
-
-    # Dimension-Specific Secondary Stories - The Void Walker
-    {
-        "id": 901,
-        "name": "Strange Disturbances",
-        "description": "Investigate dimensional rifts appearing in various locations.",
-        "target": {"item": "Dimensional Fragment", "count": 5},
-        "reward": {"gold": 700, "exp": 650, "item": "Dimensional Compass"},
-        "story": True,
-        "story_arc": "Void Walker",
-        "chapter": 9
-    },
-    {
-        "id": 902,
-        "name": "The Void Walker's Trail",
-        "description": "Follow the mysterious entity that's been crossing between dimensions.",
-        "target": {"location": "Dimensional Nexus", "count": 1},
-        "reward": {"gold": 800, "exp": 750, "item": "Void Shard"},
-        "story": True,
-        "story_arc": "Void Walker",
-        "chapter": 9,
-        "prerequisite": 901
-    },
-    {
-        "id": 903,
-        "name": "Dimensional Guardians",
-        "description": "Defeat the guardians protecting the dimensional gates.",
-        "target": {"monster": "Dimension Guardian", "count": 3},
-        "reward": {"gold": 900, "exp": 850, "item": "Guardian's Essence"},
-        "story": True,
-        "story_arc": "Void Walker",
-        "chapter": 9,
-        "prerequisite": 902
-    },
-    {
-        "id": 904,
-        "name": "The Void Walker's Identity",
-        "description": "Discover the true identity of the Void Walker and their intentions.",
-        "target": {"npc": "Void Walker", "count": 1},
-        "reward": {"gold": 1200, "exp": 1100, "item": "Dimensional Key"},
-        "story": True,
-        "story_arc": "Void Walker",
-        "chapter": 9,
-        "prerequisite": 903
-    }
-]
+QUESTS = CONTENT.sequence("QUESTS")
 
 # Available professions with their bonuses
 PROFESSIONS = {
@@ -4153,6 +3106,241 @@ PROFESSIONS = {
     }
 }
 
+# Sections of the inventory screen, in display order
+INVENTORY_CATEGORIES = ("weapon", "armor", "accessory", "artifact", "potion", "misc")
+
+def item_category(item: Any) -> str:
+    """Inventory section an item is listed under, from its record or the recipes"""
+    if isinstance(item, dict):
+        category = item.get("type")
+        return category if category in INVENTORY_CATEGORIES else "misc"
+    recipe = CRAFTING_RECIPES.get(item)
+    if recipe is not None:
+        category = recipe.get("type")
+        return category if category in ("weapon", "armor", "accessory", "artifact") else "misc"
+    if item in POTION_RECIPES:
+        return "potion"
+    return "misc"
+
+class Inventory:
+    """Multiset of the player's items with a category index
+
+    Stackable items are counted by name and unique gear is kept as its own
+    record, so adding, removing, counting and membership never scan the
+    inventory, and each entry is filed under its category once when it first
+    comes in. It keeps the interface of the list the inventory used to be
+    (append, remove, count, in, iteration) as well as that of the name ->
+    count dict some systems treat it as.
+    """
+
+    # Like TrackedList, the user_data section to mark dirty on change
+    section: Optional[str] = None
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        # Item name, or id() of a gear record, -> count, in the order first added
+        self.entries: Dict[Any, int] = {}
+        self.gear: Dict[int, Dict[str, Any]] = {}
+        # Lowercase name -> names spelled that way, for case-insensitive lookups
+        self.names: Dict[str, Dict[str, None]] = {}
+        self.categories: Dict[str, Dict[Any, None]] = {category: {} for category in INVENTORY_CATEGORIES}
+        self.total = 0
+        for item in items:
+            self.add(item)
+
+    @classmethod
+    def from_saved(cls, value: Any) -> "Inventory":
+        """Inventory from any stored form: a format 4 save, an old item list or a name -> count dict"""
+        if isinstance(value, Inventory):
+            return value.copy()
+        if isinstance(value, dict) and set(value) == {"counts", "gear"}:
+            inventory = cls()
+            for name, count in value["counts"].items():
+                inventory.add(name, count)
+            inventory.extend(value["gear"])
+            return inventory
+        if isinstance(value, dict):
+            inventory = cls()
+            for name, count in value.items():
+                inventory.add(name, count)
+            return inventory
+        return cls(value or [])
+
+    def saved_form(self) -> Dict[str, Any]:
+        """Counts per item name and the gear records, as written to a save"""
+        counts = {}
+        gear = []
+        for key, count in self.entries.items():
+            if key in self.gear:
+                gear.extend([self.gear[key]] * count)
+            else:
+                counts[key] = count
+        return {"counts": counts, "gear": gear}
+
+    def copy(self) -> "Inventory":
+        return Inventory(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Inventory":
+        # Gear is keyed by identity, so copied records have to be added afresh
+        return Inventory(copy.deepcopy(list(self), memo))
+
+    def _changed(self) -> None:
+        if self.section is not None:
+            DIRTY_SECTIONS.add(self.section)
+
+    def _key(self, item: Any) -> Any:
+        """Entry key of an item, None for a gear record that is not in the inventory"""
+        if not isinstance(item, dict):
+            return item
+        if id(item) in self.gear:
+            return id(item)
+        # An equal copy of a record counts as that record, as it did in a list
+        return next((key for key, record in self.gear.items() if record == item), None)
+
+    def add(self, item: Any, count: int = 1) -> None:
+        """Add count of an item, gear records are added as themselves"""
+        if count <= 0:
+            return
+        key = id(item) if isinstance(item, dict) else item
+        if key not in self.entries:
+            self.entries[key] = 0
+            if isinstance(item, dict):
+                self.gear[key] = item
+                if self.section is not None and untracked(item, self.section):
+                    UNTRACKED_PARENTS[id(self)] = self
+            elif isinstance(item, str):
+                self.names.setdefault(item.lower(), {})[item] = None
+            self.categories[item_category(item)][key] = None
+        self.entries[key] += count
+        self.total += count
+        self._changed()
+
+    def discard(self, item: Any, count: int = 1) -> int:
+        """Take up to count of an item out, returns how many were there to take"""
+        key = self._key(item)
+        held = self.entries.get(key, 0)
+        taken = min(held, count)
+        if taken <= 0:
+            return 0
+        if taken == held:
+            self.gear.pop(key, None)
+            del self.entries[key]
+            if isinstance(key, str):
+                spellings = self.names[key.lower()]
+                del spellings[key]
+                if not spellings:
+                    del self.names[key.lower()]
+            for members in self.categories.values():
+                members.pop(key, None)
+        else:
+            self.entries[key] = held - taken
+        self.total -= taken
+        self._changed()
+        return taken
+
+    def append(self, item: Any) -> None:
+        self.add(item)
+
+    def extend(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.add(item)
+
+    def __iadd__(self, items: Iterable[Any]) -> "Inventory":
+        self.extend(items)
+        return self
+
+    def remove(self, item: Any) -> None:
+        if not self.discard(item):
+            raise ValueError(f"{item!r} is not in the inventory")
+
+    def count(self, item: Any) -> int:
+        return self.entries.get(self._key(item), 0)
+
+    def get(self, item: Any, default: Any = 0) -> Any:
+        return self.entries.get(self._key(item), default)
+
+    def find(self, name: str) -> Optional[str]:
+        """Stackable item whose name matches ignoring case, None if there is none"""
+        spellings = self.names.get(name.lower())
+        if not spellings:
+            return None
+        return name if name in spellings else next(iter(spellings))
+
+    def clear(self) -> None:
+        self.__init__()
+        self._changed()
+
+    def sort(self, key: Any = None, reverse: bool = False) -> None:
+        """Reorder the entries by name, or by key() of each item"""
+        def item_of(entry: Any) -> Any:
+            return self.gear.get(entry, entry) if isinstance(entry, int) else entry
+
+        if key is None:
+            def key(item: Any) -> Any:
+                return item.get("name", "") if isinstance(item, dict) else item
+        ordered = sorted(self.entries, key=lambda entry: key(item_of(entry)), reverse=reverse)
+        self.entries = {entry: self.entries[entry] for entry in ordered}
+        for category, members in self.categories.items():
+            self.categories[category] = {entry: None for entry in ordered if entry in members}
+        self._changed()
+
+    def replace_records(self, convert: Any) -> None:
+        """Swap each gear record for convert(record), keeping its count, place and category"""
+        renamed = {}
+        for key, record in self.gear.items():
+            replacement = convert(record)
+            if replacement is not record:
+                renamed[key] = replacement
+        if not renamed:
+            return
+        for key, record in renamed.items():
+            del self.gear[key]
+            self.gear[id(record)] = record
+        keys = {key: id(record) for key, record in renamed.items()}
+        self.entries = {keys.get(key, key): count for key, count in self.entries.items()}
+        for category, members in self.categories.items():
+            self.categories[category] = {keys.get(key, key): None for key in members}
+
+    def stacks(self, category: Optional[str] = None) -> List[Tuple[Any, int]]:
+        """(item, count) of each distinct item, of one category or all of them"""
+        keys = self.entries if category is None else self.categories.get(category, {})
+        return [(self.gear.get(key, key) if isinstance(key, int) else key, self.entries[key]) for key in keys]
+
+    def __contains__(self, item: Any) -> bool:
+        return self._key(item) in self.entries
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __iter__(self) -> Iterator[Any]:
+        for item, count in self.stacks():
+            for _ in range(count):
+                yield item
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, (int, slice)):
+            return list(self)[key]
+        # Setting an item to 0 keeps nothing, so missing items read as 0
+        return self.count(key)
+
+    def __setitem__(self, item: Any, count: int) -> None:
+        held = self.count(item)
+        if count > held:
+            self.add(item, count - held)
+        else:
+            self.discard(item, held - count)
+
+    def __delitem__(self, item: Any) -> None:
+        if not self.discard(item, self.count(item)):
+            raise KeyError(item)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (Inventory, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Inventory({list(self)!r})"
+
 # Initialize user data with proper typing
 user_data = {
     "name": None,
@@ -4160,7 +3348,7 @@ user_data = {
     "profession": None,
     "has_chosen_profession": False,
     "level": 1,
-    "inventory": [],
+    "inventory": Inventory(),
     "equipped": {"weapon": None, "armor": None},
     "gold": INITIAL_GOLD,
     "coolness": 0,
@@ -4198,292 +3386,38 @@ except FileNotFoundError:
     LITERATURE_DATA = {"books": {}, "scrolls": {}, "notes": {}}
 
 # Literature quests - unlocked by reading specific books, scrolls, or notes
-LITERATURE_QUESTS = [
+LITERATURE_QUESTS = CONTENT.sequence("LITERATURE_QUESTS")
+
+# New locations related to the literature system
+NEW_LOCATIONS = [
     {
-        "id": "the_whispering_crown",
-        "name": "The Whispering Crown",
-        "description": "Investigate the strange behavior of the king after discovering an ancient curse in the royal wizard's diary.",
-        "level_requirement": 15,
-        "location_requirement": "Royal Castle",
-        "unlock_requirements": {
-            "literature": ["Notes:Personal Journals:Diary of a Court Wizard"]
-        },
-        "objectives": [
-            {
-                "type": "examine",
-                "target": "Royal Crown",
-                "description": "Examine the king's crown without raising suspicion",
-                "location": "Royal Castle"
-            },
-            {
-                "type": "find",
-                "target": "Book of Counter-Enchantments",
-                "description": "Find the Book of Counter-Enchantments in the Royal Archives",
-                "location": "Royal Archives"
-            },
-            {
-                "type": "defeat",
-                "target": "Crown Guardian",
-                "description": "Defeat the magical guardian protecting the crown",
-                "location": "Royal Castle"
-            },
-            {
-                "type": "use",
-                "target": "Counter-Enchantment",
-                "description": "Use the counter-enchantment on the crown",
-                "location": "Royal Castle"
-            }
+        "id": "village_library",
+        "name": "Village Library",
+        "description": "A quaint building housing scrolls and books collected by the villagers over generations.",
+        "level_range": [1, 3],
+        "enemies": [],
+        "literature": [
+            "Books:Crafting Guides:Alchemy of Growth", 
+            "Notes:Recipes:Grandmother's Healing Stew"
+        ],
+        "points_of_interest": [
+            "Librarian's Desk",
+            "Reading Nook",
+            "Children's Section",
+            "Local History Shelf"
         ],
-        "rewards": {
-            "gold": 1500,
-            "exp": 2000,
-            "items": ["Royal Gratitude", "Arcane Tome of Silence"],
-            "reputation": {
-                "Kingdom": 100
+        "npcs": [
+            {
+                "name": "Eliza Pagebinder",
+                "role": "Village Librarian",
+                "dialogue": [
+                    "Welcome to our humble library! Feel free to browse our collection.",
+                    "We have many practical books on farming and crafting that the villagers find useful.",
+                    "If you're interested in local legends, check the shelf by the window. Some fascinating stories there!",
+                    "The children love story time. I read to them every evening before sunset."
+                ]
             }
-        }
-    },
-    {
-        "id": "the_sunken_treasury",
-        "name": "The Sunken Treasury",
-        "description": "Follow an ancient map to recover treasures from a ship that sank centuries ago.",
-        "level_requirement": 10,
-        "location_requirement": "Coastal Town",
-        "unlock_requirements": {
-            "literature": ["Scrolls:Ancient Maps:Map to the Sunken Treasury"]
-        },
-        "objectives": [
-            {
-                "type": "travel",
-                "target": "Offshore Location",
-                "description": "Travel to the marked location during the twin moons alignment",
-                "location": "Coastal Waters"
-            },
-            {
-                "type": "defeat",
-                "target": "Sea Guardian",
-                "description": "Defeat the guardian protecting the sunken ship",
-                "location": "Coastal Waters"
-            },
-            {
-                "type": "collect",
-                "target": "Royal Chest",
-                "description": "Recover the royal chest from the captain's quarters",
-                "location": "Sunken Ship"
-            },
-            {
-                "type": "return",
-                "target": "Coastal Town",
-                "description": "Return safely to the coastal town with the treasure",
-                "location": "Coastal Town"
-            }
-        ],
-        "rewards": {
-            "gold": 2500,
-            "exp": 1800,
-            "items": ["Trident of the Seas", "Water Breathing Amulet"],
-            "reputation": {
-                "Coastal Town": 75
-            }
-        }
-    },
-    {
-        "id": "the_silent_watchtower",
-        "name": "The Silent Watchtower",
-        "description": "Investigate what happened to the border patrol after finding an ominous warning letter.",
-        "level_requirement": 12,
-        "location_requirement": "Eastern Border",
-        "unlock_requirements": {
-            "literature": ["Notes:Letters:Warning from the Watchtower"]
-        },
-        "objectives": [
-            {
-                "type": "travel",
-                "target": "Abandoned Watchtower",
-                "description": "Travel to the abandoned watchtower at the eastern border",
-                "location": "Eastern Border"
-            },
-            {
-                "type": "investigate",
-                "target": "Patrol Records",
-                "description": "Search for patrol records and clues",
-                "location": "Abandoned Watchtower"
-            },
-            {
-                "type": "defeat",
-                "target": "Shadow Creatures",
-                "description": "Defeat the strange creatures lurking in the watchtower",
-                "location": "Abandoned Watchtower"
-            },
-            {
-                "type": "rescue",
-                "target": "Survivors",
-                "description": "Find and rescue any survivors",
-                "location": "Abandoned Watchtower"
-            },
-            {
-                "type": "report",
-                "target": "Eastern Garrison",
-                "description": "Report your findings to the Eastern Garrison",
-                "location": "Eastern Garrison"
-            }
-        ],
-        "rewards": {
-            "gold": 1200,
-            "exp": 1600,
-            "items": ["Scout's Bow", "Shadow Essence"],
-            "reputation": {
-                "Kingdom": 60,
-                "Eastern Garrison": 100
-            }
-        }
-    },
-    {
-        "id": "seeking_the_guardian_beasts",
-        "name": "Seeking the Guardian Beasts",
-        "description": "Track down the mythical guardian beasts to seek their blessings.",
-        "level_requirement": 20,
-        "location_requirement": "Deep Forest",
-        "unlock_requirements": {
-            "literature": ["Books:Mythical Legends:The Guardian Beasts"]
-        },
-        "objectives": [
-            {
-                "type": "travel",
-                "target": "Volcanic Crown",
-                "description": "Journey to the Volcanic Crown mountains to seek the Phoenix",
-                "location": "Volcanic Crown"
-            },
-            {
-                "type": "offer",
-                "target": "Phoenix Tribute",
-                "description": "Present a worthy offering to the Phoenix",
-                "location": "Phoenix Nest"
-            },
-            {
-                "type": "travel",
-                "target": "Forgotten Sea",
-                "description": "Travel to the depths of the Forgotten Sea to find the Leviathan",
-                "location": "Forgotten Sea"
-            },
-            {
-                "type": "offer",
-                "target": "Rare Pearls",
-                "description": "Offer rare pearls to the Leviathan",
-                "location": "Abyssal Depths"
-            },
-            {
-                "type": "travel",
-                "target": "Whispering Woods",
-                "description": "Find the Great Elk in the heart of the Whispering Woods",
-                "location": "Whispering Woods"
-            },
-            {
-                "type": "offer",
-                "target": "Forest Tribute",
-                "description": "Present an offering of preserved ancient seeds",
-                "location": "Hidden Grove"
-            }
-        ],
-        "rewards": {
-            "gold": 3000,
-            "exp": 5000,
-            "items": ["Phoenix Feather", "Leviathan Scale", "Elk Antler Fragment"],
-            "abilities": ["Beast Communication", "Elemental Harmony"],
-            "reputation": {
-                "Natural World": 200
-            }
-        }
-    },
-    {
-        "id": "bandit_elimination",
-        "name": "Forest Bandits Bounty",
-        "description": "Eliminate the bandit leader 'Shadowstep' and his crew who are harassing travelers.",
-        "level_requirement": 8,
-        "location_requirement": "Eastern Forest Road",
-        "unlock_requirements": {
-            "literature": ["Scrolls:Royal Decrees:Bounty on the Forest Bandits"]
-        },
-        "objectives": [
-            {
-                "type": "travel",
-                "target": "Eastern Forest Road",
-                "description": "Patrol the Eastern Forest Road for signs of bandit activity",
-                "location": "Eastern Forest Road"
-            },
-            {
-                "type": "track",
-                "target": "Bandit Camp",
-                "description": "Follow the bandit tracks to locate their hidden camp",
-                "location": "Deep Forest"
-            },
-            {
-                "type": "defeat",
-                "target": "Bandit Guards",
-                "description": "Defeat the bandit sentries",
-                "location": "Bandit Camp"
-            },
-            {
-                "type": "defeat",
-                "target": "Shadowstep",
-                "description": "Defeat the bandit leader 'Shadowstep'",
-                "location": "Bandit Camp"
-            },
-            {
-                "type": "collect",
-                "target": "Proof of Completion",
-                "description": "Collect Shadowstep's signature dagger as proof",
-                "location": "Bandit Camp"
-            },
-            {
-                "type": "return",
-                "target": "Royal Guard Captain",
-                "description": "Present the proof to the Royal Guard Captain",
-                "location": "Kingdom Capital"
-            }
-        ],
-        "rewards": {
-            "gold": 500,
-            "exp": 1000,
-            "items": ["Shadowstep's Cloak", "Royal Commendation"],
-            "reputation": {
-                "Kingdom": 50,
-                "Merchants Guild": 75
-            }
-        }
-    }
-]
-
-# New locations related to the literature system
-NEW_LOCATIONS = [
-    {
-        "id": "village_library",
-        "name": "Village Library",
-        "description": "A quaint building housing scrolls and books collected by the villagers over generations.",
-        "level_range": [1, 3],
-        "enemies": [],
-        "literature": [
-            "Books:Crafting Guides:Alchemy of Growth", 
-            "Notes:Recipes:Grandmother's Healing Stew"
-        ],
-        "points_of_interest": [
-            "Librarian's Desk",
-            "Reading Nook",
-            "Children's Section",
-            "Local History Shelf"
-        ],
-        "npcs": [
-            {
-                "name": "Eliza Pagebinder",
-                "role": "Village Librarian",
-                "dialogue": [
-                    "Welcome to our humble library! Feel free to browse our collection.",
-                    "We have many practical books on farming and crafting that the villagers find useful.",
-                    "If you're interested in local legends, check the shelf by the window. Some fascinating stories there!",
-                    "The children love story time. I read to them every evening before sunset."
-                ]
-            }
-        ]
+        ]
     },
     {
         "id": "royal_archives",
@@ -4672,7 +3606,7 @@ def ensure_user_data_keys(data: Dict) -> None:
         "profession": None,
         "has_chosen_profession": False,
         "level": 1,
-        "inventory": [],
+        "inventory": Inventory(),
         "equipped": {"weapon": None, "armor": None},
         "gold": INITIAL_GOLD,
         "literature": {
@@ -4851,7 +3785,7 @@ def sell_item(item_name: str) -> None:
         return
 
     # Case-insensitive search in inventory
-    item = next((i for i in user_data["inventory"] if i.lower() == item_name.lower()), None)
+    item = user_data["inventory"].find(item_name)
     if not item:
         print(f"You don't have {item_name} in your inventory.")
         return
@@ -5217,174 +4151,603 @@ monsters = [
 
 
 
-ACHIEVEMENTS = {
-    "First Steps": {"desc": "Create your character", "reward": {"gold": 100}},
-    "Monster Hunter": {"desc": "Kill 100 monsters", "reward": {"gold": 500}},
-    "Dragon Slayer": {"desc": "Kill any dragon", "reward": {"exp": 1000}},
-    "Master Crafter": {"desc": "Craft 50 items", "reward": {"gold": 1000}},
-    "Dungeon Master": {"desc": "Complete all dungeons", "reward": {"gold": 5000}},
-    "Legendary Hero": {"desc": "Reach level 50", "reward": {"gold": 10000}},
-    "Material Master": {"desc": "Collect all materials", "reward": {"gold": 2000}},
-    "Rich Merchant": {"desc": "Accumulate 100000 gold", "reward": {"exp": 5000}},
-    "Pet Collector": {"desc": "Adopt 5 pets", "reward": {"gold": 1500}},
-    "Master Farmer": {"desc": "Harvest 1000 crops", "reward": {"gold": 3000}}
-}
+ACHIEVEMENTS = CONTENT.mapping("ACHIEVEMENTS")
 
-# Track achievement progress
-def check_achievements() -> None:
-    """
-    Enhanced achievement system with tiers, categories, and visual feedback
-    """
+# Tiered achievements granted with rewards, each requirement is {stat: threshold}
+TIERED_ACHIEVEMENTS = [
+    # Combat Achievements - Tier 1
+    {
+        "id": "first_blood",
+        "name": "First Blood",
+        "description": "Defeat your first monster",
+        "category": "Combat",
+        "tier": 1,
+        "requirement": {"monsters_killed": 1},
+        "reward": {"gold": 50, "exp": 100},
+        "icon": "🗡️"
+    },
+    {
+        "id": "monster_hunter",
+        "name": "Monster Hunter",
+        "description": "Defeat 100 monsters",
+        "category": "Combat",
+        "tier": 2,
+        "requirement": {"monsters_killed": 100},
+        "reward": {"gold": 500, "exp": 500, "stat_bonus": {"attack": 2}},
+        "icon": "⚔️"
+    },
+    {
+        "id": "monster_slayer",
+        "name": "Monster Slayer",
+        "description": "Defeat 500 monsters",
+        "category": "Combat",
+        "tier": 3,
+        "requirement": {"monsters_killed": 500},
+        "reward": {"gold": 2000, "exp": 2000, "stat_bonus": {"attack": 5}},
+        "icon": "🛡️"
+    },
+    {
+        "id": "legendary_hunter",
+        "name": "Legendary Hunter",
+        "description": "Defeat 1000 monsters",
+        "category": "Combat",
+        "tier": 4,
+        "requirement": {"monsters_killed": 1000},
+        "reward": {"gold": 5000, "exp": 5000, "stat_bonus": {"attack": 10, "defense": 5}, "item": "Hunter's Trophy"},
+        "icon": "🏆"
+    },
 
-    # All achievement categories
-    all_achievements = {
-        "Combat": [],
-        "Wealth": [],
-        "Experience": [],
-        "Exploration": [],
-        "Collection": [],
-        "Crafting": [],
-        "Quests": [],
-        "Archaeology": [],
-        "Literature": []
-    }
+    # Boss Achievements
+    {
+        "id": "boss_challenge",
+        "name": "Boss Challenger",
+        "description": "Defeat your first boss",
+        "category": "Combat",
+        "tier": 1,
+        "requirement": {"bosses_defeated": 1},
+        "reward": {"gold": 200, "exp": 300},
+        "icon": "👺"
+    },
+    {
+        "id": "boss_slayer",
+        "name": "Boss Slayer",
+        "description": "Defeat 5 different bosses",
+        "category": "Combat",
+        "tier": 2,
+        "requirement": {"bosses_defeated": 5},
+        "reward": {"gold": 1000, "exp": 1500, "stat_bonus": {"attack": 3, "defense": 3}},
+        "icon": "👹"
+    },
+    {
+        "id": "boss_master",
+        "name": "Boss Master",
+        "description": "Defeat 15 different bosses",
+        "category": "Combat",
+        "tier": 3,
+        "requirement": {"bosses_defeated": 15},
+        "reward": {"gold": 3000, "exp": 4000, "stat_bonus": {"attack": 7, "defense": 7}, "item": "Boss Master's Crown"},
+        "icon": "👑"
+    },
 
-    # Define archaeology-related achievements if not already defined
-    archaeology_achievements = [
-        {
-            "id": "novice_archaeologist",
-            "name": "Novice Archaeologist",
-            "description": "Discover your first archaeological site.",
-            "condition": "Discover 1 site",
-            "tier": 1,
-            "category": "Archaeology"
-        },
-        {
-            "id": "amateur_archaeologist",
-            "name": "Amateur Archaeologist",
-            "description": "Discover 3 archaeological sites.",
-            "condition": "Discover 3 sites",
-            "tier": 2,
-            "category": "Archaeology"
-        },
-        {
-            "id": "professional_archaeologist",
-            "name": "Professional Archaeologist",
-            "description": "Discover all archaeological sites.",
-            "condition": "Discover all sites",
-            "tier": 3,
-            "category": "Archaeology"
-        },
-        {
-            "id": "artifact_collector",
-            "name": "Artifact Collector",
-            "description": "Complete your first artifact set.",
-            "condition": "Complete 1 artifact set",
-            "tier": 2,
-            "category": "Archaeology"
-        },
-        {
-            "id": "master_collector",
-            "name": "Master Collector",
-            "description": "Complete 3 artifact sets.",
-            "condition": "Complete 3 artifact sets",
-            "tier": 3,
-            "category": "Archaeology"
-        },
-        {
-            "id": "knowledge_seeker",
-            "name": "Knowledge Seeker",
-            "description": "Acquire your first piece of ancient knowledge.",
-            "condition": "Acquire 1 ancient knowledge",
-            "tier": 1,
-            "category": "Archaeology"
-        },
-        {
-            "id": "ancient_scholar",
-            "name": "Ancient Scholar",
-            "description": "Acquire all pieces of ancient knowledge.",
-            "condition": "Acquire all ancient knowledge",
-            "tier": 3,
-            "category": "Archaeology"
-        },
-        {
-            "id": "museum_curator",
-            "name": "Museum Curator",
-            "description": "Display 5 artifacts in your museum.",
-            "condition": "Display 5 artifacts",
-            "tier": 2,
-            "category": "Archaeology"
-        },
-        {
-            "id": "master_curator",
-            "name": "Master Curator",
-            "description": "Display 10 artifacts in your museum.",
-            "condition": "Display 10 artifacts",
-            "tier": 3,
-            "category": "Archaeology"
-        }
-    ]
+    # Skill Achievements
+    {
+        "id": "skill_novice",
+        "name": "Skill Novice",
+        "description": "Use skills 50 times",
+        "category": "Combat",
+        "tier": 1,
+        "requirement": {"skills_used": 50},
+        "reward": {"exp": 200, "stat_bonus": {"intellect": 2}},
+        "icon": "✨"
+    },
+    {
+        "id": "skill_adept",
+        "name": "Skill Adept",
+        "description": "Use skills 200 times",
+        "category": "Combat",
+        "tier": 2,
+        "requirement": {"skills_used": 200},
+        "reward": {"exp": 800, "stat_bonus": {"intellect": 5}},
+        "icon": "💫"
+    },
+    {
+        "id": "skill_master",
+        "name": "Skill Master",
+        "description": "Use skills 500 times",
+        "category": "Combat",
+        "tier": 3,
+        "requirement": {"skills_used": 500},
+        "reward": {"exp": 2000, "stat_bonus": {"intellect": 10}, "item": "Spellbinder's Tome"},
+        "icon": "🌟"
+    },
 
-    # Add literature-related achievements
-    literature_achievements = [
-        {
-            "id": "novice_reader",
-            "name": "Novice Reader",
-            "description": "Read your first book or scroll.",
-            "condition": "Read 1 book",
-            "tier": 1,
-            "category": "Literature"
-        },
-        {
-            "id": "bookworm",
-            "name": "Bookworm",
-            "description": "Read 10 different books and scrolls.",
-            "condition": "Read 10 texts",
-            "tier": 2,
-            "category": "Literature"
-        },
-        {
-            "id": "scholar",
-            "name": "Scholar",
-            "description": "Read 25 different books and scrolls.",
-            "condition": "Read 25 texts",
-            "tier": 3,
-            "category": "Literature"
-        },
-        {
-            "id": "collector_of_knowledge",
-            "name": "Collector of Knowledge",
-            "description": "Own 15 different books and scrolls in your collection.",
-            "condition": "Collect 15 texts",
-            "tier": 2,
-            "category": "Literature"
-        },
-        {
-            "id": "master_of_lore",
-            "name": "Master of Lore",
-            "description": "Read at least one book from every category.",
-            "condition": "Read diverse texts",
-            "tier": 3,
-            "category": "Literature"
-        }
-    ]
+    # Combo Achievements
+    {
+        "id": "combo_striker",
+        "name": "Combo Striker",
+        "description": "Perform 10 combo finishers",
+        "category": "Combat",
+        "tier": 1,
+        "requirement": {"combo_finishers": 10},
+        "reward": {"exp": 300, "stat_bonus": {"speed": 2}},
+        "icon": "🔄"
+    },
+    {
+        "id": "combo_artist",
+        "name": "Combo Artist",
+        "description": "Perform 50 combo finishers",
+        "category": "Combat",
+        "tier": 2,
+        "requirement": {"combo_finishers": 50},
+        "reward": {"exp": 1000, "stat_bonus": {"speed": 5, "attack": 3}},
+        "icon": "⚡"
+    },
+    {
+        "id": "combo_master",
+        "name": "Combo Master",
+        "description": "Perform 150 combo finishers",
+        "category": "Combat",
+        "tier": 3,
+        "requirement": {"combo_finishers": 150},
+        "reward": {"exp": 3000, "stat_bonus": {"speed": 10, "attack": 7}, "item": "Combo Master's Gloves"},
+        "icon": "🌪️"
+    },
+
+    # Critical Hit Achievements
+    {
+        "id": "critical_striker",
+        "name": "Critical Striker",
+        "description": "Land 25 critical hits",
+        "category": "Combat",
+        "tier": 1,
+        "requirement": {"critical_hits": 25},
+        "reward": {"exp": 200, "stat_bonus": {"critical_chance": 0.02}},
+        "icon": "❗"
+    },
+    {
+        "id": "critical_expert",
+        "name": "Critical Expert",
+        "description": "Land 100 critical hits",
+        "category": "Combat",
+        "tier": 2,
+        "requirement": {"critical_hits": 100},
+        "reward": {"exp": 800, "stat_bonus": {"critical_chance": 0.05}},
+        "icon": "💢"
+    },
+    {
+        "id": "critical_master",
+        "name": "Critical Master",
+        "description": "Land 250 critical hits",
+        "category": "Combat",
+        "tier": 3,
+        "requirement": {"critical_hits": 250},
+        "reward": {"exp": 2000, "stat_bonus": {"critical_chance": 0.1}, "item": "Precision Scope"},
+        "icon": "💥"
+    },
+
+    # Wealth Achievements
+    {
+        "id": "gold_collector",
+        "name": "Gold Collector",
+        "description": "Earn 1,000 gold",
+        "category": "Wealth",
+        "tier": 1,
+        "requirement": {"total_gold_earned": 1000},
+        "reward": {"exp": 200, "stat_bonus": {"charisma": 2}},
+        "icon": "💰"
+    },
+    {
+        "id": "wealthy",
+        "name": "Wealthy",
+        "description": "Earn 10,000 gold",
+        "category": "Wealth",
+        "tier": 2,
+        "requirement": {"total_gold_earned": 10000},
+        "reward": {"exp": 1000, "stat_bonus": {"charisma": 5}},
+        "icon": "💎"
+    },
+    {
+        "id": "rich",
+        "name": "Rich",
+        "description": "Earn 50,000 gold",
+        "category": "Wealth",
+        "tier": 3,
+        "requirement": {"total_gold_earned": 50000},
+        "reward": {"exp": 3000, "stat_bonus": {"charisma": 10}, "item": "Golden Monocle"},
+        "icon": "👑"
+    },
+    {
+        "id": "millionaire",
+        "name": "Millionaire",
+        "description": "Earn 100,000 gold",
+        "category": "Wealth",
+        "tier": 4,
+        "requirement": {"total_gold_earned": 100000},
+        "reward": {"exp": 10000, "stat_bonus": {"charisma": 20}, "item": "Midas Touch Gloves"},
+        "icon": "🏛️"
+    },
+
+    # Experience Achievements
+    {
+        "id": "level_up",
+        "name": "Level Up",
+        "description": "Reach level 5",
+        "category": "Experience",
+        "tier": 1,
+        "requirement": {"level": 5},
+        "reward": {"gold": 100, "stat_bonus": {"health": 10}},
+        "icon": "📈"
+    },
+    {
+        "id": "adventurer",
+        "name": "Adventurer",
+        "description": "Reach level 10",
+        "category": "Experience",
+        "tier": 2,
+        "requirement": {"level": 10},
+        "reward": {"gold": 500, "stat_bonus": {"health": 20, "attack": 2, "defense": 2}},
+        "icon": "🌄"
+    },
+    {
+        "id": "hero",
+        "name": "Hero",
+        "description": "Reach level 25",
+        "category": "Experience",
+        "tier": 3,
+        "requirement": {"level": 25},
+        "reward": {"gold": 2000, "stat_bonus": {"health": 50, "attack": 5, "defense": 5}},
+        "icon": "🦸"
+    },
+    {
+        "id": "legend",
+        "name": "Legend",
+        "description": "Reach level 50",
+        "category": "Experience",
+        "tier": 4,
+        "requirement": {"level": 50},
+        "reward": {"gold": 5000, "stat_bonus": {"health": 100, "attack": 10, "defense": 10}, "item": "Legendary Cape"},
+        "icon": "🌟"
+    },
+
+    # Exploration Achievements
+    {
+        "id": "explorer_novice",
+        "name": "Explorer Novice",
+        "description": "Visit 3 different locations",
+        "category": "Exploration",
+        "tier": 1,
+        "requirement": {"visited_locations": 3},
+        "reward": {"exp": 200, "stat_bonus": {"speed": 1}},
+        "icon": "🧭"
+    },
+    {
+        "id": "traveler",
+        "name": "Traveler",
+        "description": "Visit 7 different locations",
+        "category": "Exploration",
+        "tier": 2,
+        "requirement": {"visited_locations": 7},
+        "reward": {"exp": 500, "gold": 300, "stat_bonus": {"speed": 3}},
+        "icon": "🗺️"
+    },
+    {
+        "id": "explorer",
+        "name": "Explorer",
+        "description": "Visit 12 different locations",
+        "category": "Exploration",
+        "tier": 3,
+        "requirement": {"visited_locations": 12},
+        "reward": {"exp": 1500, "gold": 800, "stat_bonus": {"speed": 6}, "item": "Explorer's Boots"},
+        "icon": "🌍"
+    },
+    {
+        "id": "world_traveler",
+        "name": "World Traveler",
+        "description": "Visit all locations in the world",
+        "category": "Exploration",
+        "tier": 4,
+        "requirement": {"visited_locations": 20},  # Assuming 20 total locations
+        "reward": {"exp": 3000, "gold": 2000, "stat_bonus": {"speed": 10, "charisma": 5}, "item": "World Map"},
+        "icon": "🌐"
+    },
+
+    # Collection Achievements
+    {
+        "id": "collector",
+        "name": "Item Collector",
+        "description": "Collect 25 different items",
+        "category": "Collection",
+        "tier": 1,
+        "requirement": {"unique_items_collected": 25},
+        "reward": {"gold": 200, "exp": 300},
+        "icon": "🧰"
+    },
+    {
+        "id": "treasure_hunter",
+        "name": "Treasure Hunter",
+        "description": "Open 10 treasure chests",
+        "category": "Collection",
+        "tier": 2,
+        "requirement": {"treasure_chests_opened": 10},
+        "reward": {"gold": 500, "exp": 700},
+        "icon": "🗝️"
+    },
+    {
+        "id": "hoarder",
+        "name": "Hoarder",
+        "description": "Collect 100 different items",
+        "category": "Collection",
+        "tier": 3,
+        "requirement": {"unique_items_collected": 100},
+        "reward": {"gold": 1500, "exp": 2000, "item": "Collector's Bag"},
+        "icon": "🎒"
+    },
+
+    # Crafting Achievements
+    {
+        "id": "apprentice_crafter",
+        "name": "Apprentice Crafter",
+        "description": "Craft 10 items",
+        "category": "Crafting",
+        "tier": 1,
+        "requirement": {"items_crafted": 10},
+        "reward": {"exp": 200, "stat_bonus": {"crafting": 2}},
+        "icon": "🔨"
+    },
+    {
+        "id": "skilled_artisan",
+        "name": "Skilled Artisan",
+        "description": "Craft 25 items",
+        "category": "Crafting",
+        "tier": 2,
+        "requirement": {"items_crafted": 25},
+        "reward": {"exp": 500, "stat_bonus": {"crafting": 5}},
+        "icon": "⚒️"
+    },
+    {
+        "id": "master_crafter",
+        "name": "Master Crafter",
+        "description": "Craft 50 items",
+        "category": "Crafting",
+        "tier": 3,
+        "requirement": {"items_crafted": 50},
+        "reward": {"exp": 1500, "stat_bonus": {"crafting": 10}, "item": "Artisan's Tools"},
+        "icon": "🛠️"
+    },
+
+    # Quest Achievements
+    {
+        "id": "quest_beginner",
+        "name": "Quest Beginner",
+        "description": "Complete 3 quests",
+        "category": "Quests",
+        "tier": 1,
+        "requirement": {"quests_completed": 3},
+        "reward": {"exp": 300},
+        "icon": "📜"
+    },
+    {
+        "id": "quest_taker",
+        "name": "Quest Taker",
+        "description": "Complete 10 quests",
+        "category": "Quests",
+        "tier": 2,
+        "requirement": {"quests_completed": 10},
+        "reward": {"exp": 800, "gold": 500},
+        "icon": "📝"
+    },
+    {
+        "id": "quest_master",
+        "name": "Quest Master",
+        "description": "Complete 25 quests",
+        "category": "Quests",
+        "tier": 3,
+        "requirement": {"quests_completed": 25},
+        "reward": {"exp": 2000, "gold": 1500, "item": "Quest Master's Journal"},
+        "icon": "📚"
+    },
+
+    # Dungeon Achievements
+    {
+        "id": "dungeon_novice",
+        "name": "Dungeon Novice",
+        "description": "Complete your first dungeon",
+        "category": "Dungeons",
+        "tier": 1,
+        "requirement": {"dungeons_completed": 1},
+        "reward": {"exp": 300, "gold": 200},
+        "icon": "🏰"
+    },
+    {
+        "id": "dungeon_explorer",
+        "name": "Dungeon Explorer",
+        "description": "Complete 5 different dungeons",
+        "category": "Dungeons",
+        "tier": 2,
+        "requirement": {"dungeons_completed": 5},
+        "reward": {"exp": 1000, "gold": 800, "stat_bonus": {"defense": 3}},
+        "icon": "🔍"
+    },
+    {
+        "id": "dungeon_master",
+        "name": "Dungeon Master",
+        "description": "Complete 15 different dungeons",
+        "category": "Dungeons",
+        "tier": 3,
+        "requirement": {"dungeons_completed": 15},
+        "reward": {"exp": 3000, "gold": 2000, "stat_bonus": {"defense": 8}, "item": "Dungeon Key"},
+        "icon": "🔑"
+    },
 
-    # Add archaeology and literature achievements to achievements list
-    all_achievement_types = {
-        "Archaeology": archaeology_achievements,
-        "Literature": literature_achievements
+    # Survival Achievements
+    {
+        "id": "survivor",
+        "name": "Survivor",
+        "description": "Survive 10 near-death experiences (below 10% health)",
+        "category": "Survival",
+        "tier": 2,
+        "requirement": {"near_death_escapes": 10},
+        "reward": {"exp": 1000, "stat_bonus": {"health": 10, "defense": 3}},
+        "icon": "❤️‍🩹"
+    },
+    {
+        "id": "potion_master",
+        "name": "Potion Master",
+        "description": "Use 50 potions",
+        "category": "Survival",
+        "tier": 2,
+        "requirement": {"potions_used": 50},
+        "reward": {"exp": 500, "stat_bonus": {"health": 5}},
+        "icon": "🧪"
+    },
+    {
+        "id": "dodge_expert",
+        "name": "Dodge Expert",
+        "description": "Dodge 100 enemy attacks",
+        "category": "Survival",
+        "tier": 3,
+        "requirement": {"enemies_dodged": 100},
+        "reward": {"exp": 2000, "stat_bonus": {"speed": 8}, "item": "Shadow Step Boots"},
+        "icon": "💨"
     }
+]
 
-    for category, achievements_list in all_achievement_types.items():
-        if category not in all_achievements:
-            all_achievements[category] = []
+# Archaeology and literature milestones, announced through unlock_achievement()
+# A threshold of "all" means every entry of the matching content table
+MILESTONE_ACHIEVEMENTS = [
+    {"name": "Novice Reader", "description": "Read your first book or scroll.", "condition": "Read 1 book", "requirement": {"books_read": 1}},
+    {"name": "Bookworm", "description": "Read 10 different books and scrolls.", "condition": "Read 10 texts", "requirement": {"books_read": 10}},
+    {"name": "Scholar", "description": "Read 25 different books and scrolls.", "condition": "Read 25 texts", "requirement": {"books_read": 25}},
+    {"name": "Collector of Knowledge", "description": "Own 15 different books and scrolls in your collection.", "condition": "Collect 15 texts", "requirement": {"books_owned": 15}},
+    {"name": "Master of Lore", "description": "Read at least one book from every category.", "condition": "Read diverse texts", "requirement": {"read_categories": 5}},
+    {"name": "Novice Archaeologist", "description": "Discover your first archaeological site.", "condition": "Discover 1 site", "requirement": {"sites_discovered": 1}},
+    {"name": "Amateur Archaeologist", "description": "Discover 3 archaeological sites.", "condition": "Discover 3 sites", "requirement": {"sites_discovered": 3}},
+    {"name": "Professional Archaeologist", "description": "Discover all archaeological sites.", "condition": "Discover all sites", "requirement": {"sites_discovered": "all"}},
+    {"name": "Artifact Collector", "description": "Complete your first artifact set.", "condition": "Complete 1 artifact set", "requirement": {"artifact_sets_completed": 1}},
+    {"name": "Master Collector", "description": "Complete 3 artifact sets.", "condition": "Complete 3 artifact sets", "requirement": {"artifact_sets_completed": 3}},
+    {"name": "Knowledge Seeker", "description": "Acquire your first piece of ancient knowledge.", "condition": "Acquire 1 ancient knowledge", "requirement": {"ancient_knowledge": 1}},
+    {"name": "Ancient Scholar", "description": "Acquire all pieces of ancient knowledge.", "condition": "Acquire all ancient knowledge", "requirement": {"ancient_knowledge": "all"}},
+    {"name": "Museum Curator", "description": "Display 5 artifacts in your museum.", "condition": "Display 5 artifacts", "requirement": {"museum_exhibits": 5}},
+    {"name": "Master Curator", "description": "Display 10 artifacts in your museum.", "condition": "Display 10 artifacts", "requirement": {"museum_exhibits": 10}},
+]
+
+# Content tables that an "all" threshold refers to
+ACHIEVEMENT_TOTALS = {
+    "sites_discovered": lambda: len(ARCHAEOLOGICAL_SITES),
+    "ancient_knowledge": lambda: len(ANCIENT_KNOWLEDGE),
+}
+
+# Stats each game event can change, only achievements indexed under them are evaluated
+ACHIEVEMENT_EVENTS = {
+    "monster_killed": ["monsters_killed", "bosses_defeated", "critical_hits", "combo_finishers",
+                       "skills_used", "enemies_dodged", "near_death_escapes", "potions_used",
+                       "total_gold_earned", "level", "quests_completed", "dungeons_completed",
+                       "visited_locations"],
+    "loot_collected": ["unique_items_collected", "treasure_chests_opened", "total_gold_earned"],
+    "item_improved": ["items_crafted", "total_gold_earned", "level"],
+    "book_read": ["books_read", "read_categories"],
+    "book_acquired": ["books_owned"],
+    "site_discovered": ["sites_discovered"],
+    "knowledge_gained": ["ancient_knowledge"],
+    "artifact_set_completed": ["artifact_sets_completed"],
+}
 
-        # Check if achievements need to be added
-        existing_ids = {ach.get("id", "") for ach in all_achievements[category]}
-        for achievement in achievements_list:
-            if achievement["id"] not in existing_ids:
-                all_achievements[category].append(achievement)
-    # Initialize achievements structure if not exists
+# Running tallies for stats that would otherwise need a full scan of the save
+achievement_tallies: Dict[str, Any] = {}
+
+def tally_unique(name: str, items: List[Any], key: Any = None) -> int:
+    """Count distinct entries of an append-only list, only looking at entries added since last time"""
+    tally = achievement_tallies.get(name)
+    if tally is None or tally["list"] is not items or tally["seen"] > len(items):
+        tally = achievement_tallies[name] = {"list": items, "seen": 0, "values": set()}
+    for item in items[tally["seen"]:]:
+        value = key(item) if key else item
+        if value is not None:
+            tally["values"].add(value)
+    tally["seen"] = len(items)
+    return len(tally["values"])
+
+def read_category(item_id: str) -> Optional[str]:
+    """'book:history:some_title' -> 'book:history'"""
+    parts = item_id.split(":", 2)
+    return f"{parts[0]}:{parts[1]}" if len(parts) == 3 else None
+
+def read_category_counts(read: Any) -> Dict[str, int]:
+    """Books read per category, kept up to date by mark_book_read() and rebuilt only for another read set"""
+    tally = achievement_tallies.get("read_categories")
+    if tally is None or tally["read"] is not read or tally["seen"] != len(read):
+        counts: Dict[str, int] = {}
+        for item_id in read:
+            category = read_category(item_id)
+            if category is not None:
+                counts[category] = counts.get(category, 0) + 1
+        tally = achievement_tallies["read_categories"] = {"read": read, "seen": len(read), "counts": counts}
+    return tally["counts"]
+
+def mark_book_read(lit_data: Dict[str, Any], item_id: str) -> None:
+    """Add a book to the read set, counting its category"""
+    read = lit_data["read"]
+    counts = read_category_counts(read)
+    if item_id in read:
+        return
+    read.add(item_id)
+    category = read_category(item_id)
+    if category is not None:
+        counts[category] = counts.get(category, 0) + 1
+    achievement_tallies["read_categories"]["seen"] = len(read)
+
+def achievement_stat(stat: str) -> int:
+    """Current value of an achievement stat, read straight from user_data"""
+    lit_data = user_data.get("literature", {})
+    arch_data = user_data.get("archaeology", {})
+    if stat == "level":
+        return user_data["level"]
+    if stat == "total_gold_earned":
+        return user_data.get("total_gold_earned", user_data.get("gold", 0))
+    if stat == "quests_completed":
+        return len(user_data.get("completed_quests", []))
+    if stat == "dungeons_completed":
+        return len(user_data.get("completed_dungeons", []))
+    if stat == "visited_locations":
+        return len(user_data.get("visited_locations", []))
+    if stat == "unique_items_collected":
+        return tally_unique(stat, user_data.setdefault("all_collected_items", []))
+    if stat == "books_read":
+        return len(lit_data.get("read", []))
+    if stat == "books_owned":
+        return len(lit_data.get("owned", []))
+    if stat == "read_categories":
+        return len(read_category_counts(lit_data.get("read", ())))
+    if stat == "sites_discovered":
+        return len(arch_data.get("discovered_sites", []))
+    if stat == "artifact_sets_completed":
+        return len(arch_data.get("completed_sets", []))
+    if stat == "ancient_knowledge":
+        return len(arch_data.get("knowledge", []))
+    if stat == "museum_exhibits":
+        return len(arch_data.get("museum_exhibits", []))
+    return user_data.get(stat, 0)
+
+# stat -> [(threshold, kind, achievement)] sorted by threshold, and the thresholds alone, built on first use
+achievement_index: Dict[str, List[Tuple[int, str, Dict[str, Any]]]] = {}
+achievement_thresholds: Dict[str, List[int]] = {}
+# Entries of each stat already handled for the unlocked list they were handled against
+achievement_cursors: Dict[str, Any] = {"unlocked": None, "stats": {}}
+
+def build_achievement_index() -> None:
+    """Index every achievement under the stat it depends on"""
+    for kind, definitions in (("tiered", TIERED_ACHIEVEMENTS), ("milestone", MILESTONE_ACHIEVEMENTS)):
+        for achievement in definitions:
+            for stat, threshold in achievement["requirement"].items():
+                if threshold == "all":
+                    threshold = ACHIEVEMENT_TOTALS[stat]()
+                achievement_index.setdefault(stat, []).append((threshold, kind, achievement))
+    for stat, entries in achievement_index.items():
+        entries.sort(key=lambda entry: entry[0])
+        achievement_thresholds[stat] = [entry[0] for entry in entries]
+
+def ensure_achievement_data() -> None:
+    """Create the achievements structure of a new character"""
     if "achievements" not in user_data:
         user_data["achievements"] = {
             "unlocked": [],
@@ -5412,602 +4775,94 @@ def check_achievements() -> None:
             }
         }
 
+def evaluate_achievements(stats: List[str]) -> None:
+    """Unlock the achievements whose threshold on one of the given stats has been reached"""
+    if not achievement_index:
+        build_achievement_index()
+    ensure_achievement_data()
+    unlocked_list = user_data["achievements"]["unlocked"]
+    if achievement_cursors["unlocked"] is not unlocked_list:
+        # Another character or save, everything is looked at once more
+        achievement_cursors["unlocked"] = unlocked_list
+        achievement_cursors["stats"] = {}
+    cursors = achievement_cursors["stats"]
+    unlocked = None
+
+    newly_unlocked = []
+    for stat in stats:
+        entries = achievement_index.get(stat)
+        if not entries:
+            continue
+        done = cursors.get(stat, 0)
+        if done == len(entries):
+            continue
+        reached = bisect.bisect_right(achievement_thresholds[stat], achievement_stat(stat), done)
+        if reached == done:
+            continue
+        cursors[stat] = reached
+        if unlocked is None:
+            unlocked = set(unlocked_list)
+        for _, kind, achievement in entries[done:reached]:
+            if kind == "milestone":
+                if achievement["name"].lower().replace(" ", "_") not in unlocked:
+                    unlock_achievement(achievement["name"], achievement["description"], achievement["condition"])
+            elif achievement["id"] not in unlocked:
+                unlocked.add(achievement["id"])
+                user_data["achievements"]["unlocked"].append(achievement["id"])
+                newly_unlocked.append(achievement)
+                grant_achievement_rewards(achievement)
+
+    if newly_unlocked:
+        announce_achievements(newly_unlocked)
+
+def achievement_event(event: str) -> None:
+    """Evaluate only the achievements a game event can affect"""
+    evaluate_achievements(ACHIEVEMENT_EVENTS[event])
+
+# Track achievement progress
+def check_achievements() -> None:
+    """
+    Enhanced achievement system with tiers, categories, and visual feedback
+    """
+    ensure_achievement_data()
+
     # Update current achievement progress based on user_data
     update_achievement_progress()
 
-    # Define all achievements with requirements, rewards, and categories
-    ACHIEVEMENTS = [
-        # Combat Achievements - Tier 1
-        {
-            "id": "first_blood",
-            "name": "First Blood",
-            "description": "Defeat your first monster",
-            "category": "Combat",
-            "tier": 1,
-            "requirement": {"monsters_killed": 1},
-            "reward": {"gold": 50, "exp": 100},
-            "icon": "🗡️"
-        },
-        {
-            "id": "monster_hunter",
-            "name": "Monster Hunter",
-            "description": "Defeat 100 monsters",
-            "category": "Combat",
-            "tier": 2,
-            "requirement": {"monsters_killed": 100},
-            "reward": {"gold": 500, "exp": 500, "stat_bonus": {"attack": 2}},
-            "icon": "⚔️"
-        },
-        {
-            "id": "monster_slayer",
-            "name": "Monster Slayer",
-            "description": "Defeat 500 monsters",
-            "category": "Combat",
-            "tier": 3,
-            "requirement": {"monsters_killed": 500},
-            "reward": {"gold": 2000, "exp": 2000, "stat_bonus": {"attack": 5}},
-            "icon": "🛡️"
-        },
-        {
-            "id": "legendary_hunter",
-            "name": "Legendary Hunter",
-            "description": "Defeat 1000 monsters",
-            "category": "Combat",
-            "tier": 4,
-            "requirement": {"monsters_killed": 1000},
-            "reward": {"gold": 5000, "exp": 5000, "stat_bonus": {"attack": 10, "defense": 5}, "item": "Hunter's Trophy"},
-            "icon": "🏆"
-        },
+    if not achievement_index:
+        build_achievement_index()
+    evaluate_achievements(list(achievement_index))
 
-        # Boss Achievements
-        {
-            "id": "boss_challenge",
-            "name": "Boss Challenger",
-            "description": "Defeat your first boss",
-            "category": "Combat",
-            "tier": 1,
-            "requirement": {"bosses_defeated": 1},
-            "reward": {"gold": 200, "exp": 300},
-            "icon": "👺"
-        },
-        {
-            "id": "boss_slayer",
-            "name": "Boss Slayer",
-            "description": "Defeat 5 different bosses",
-            "category": "Combat",
-            "tier": 2,
-            "requirement": {"bosses_defeated": 5},
-            "reward": {"gold": 1000, "exp": 1500, "stat_bonus": {"attack": 3, "defense": 3}},
-            "icon": "👹"
-        },
-        {
-            "id": "boss_master",
-            "name": "Boss Master",
-            "description": "Defeat 15 different bosses",
-            "category": "Combat",
-            "tier": 3,
-            "requirement": {"bosses_defeated": 15},
-            "reward": {"gold": 3000, "exp": 4000, "stat_bonus": {"attack": 7, "defense": 7}, "item": "Boss Master's Crown"},
-            "icon": "👑"
-        },
-
-        # Skill Achievements
-        {
-            "id": "skill_novice",
-            "name": "Skill Novice",
-            "description": "Use skills 50 times",
-            "category": "Combat",
-            "tier": 1,
-            "requirement": {"skills_used": 50},
-            "reward": {"exp": 200, "stat_bonus": {"intellect": 2}},
-            "icon": "✨"
-        },
-        {
-            "id": "skill_adept",
-            "name": "Skill Adept",
-            "description": "Use skills 200 times",
-            "category": "Combat",
-            "tier": 2,
-            "requirement": {"skills_used": 200},
-            "reward": {"exp": 800, "stat_bonus": {"intellect": 5}},
-            "icon": "💫"
-        },
-        {
-            "id": "skill_master",
-            "name": "Skill Master",
-            "description": "Use skills 500 times",
-            "category": "Combat",
-            "tier": 3,
-            "requirement": {"skills_used": 500},
-            "reward": {"exp": 2000, "stat_bonus": {"intellect": 10}, "item": "Spellbinder's Tome"},
-            "icon": "🌟"
-        },
-
-        # Combo Achievements
-        {
-            "id": "combo_striker",
-            "name": "Combo Striker",
-            "description": "Perform 10 combo finishers",
-            "category": "Combat",
-            "tier": 1,
-            "requirement": {"combo_finishers": 10},
-            "reward": {"exp": 300, "stat_bonus": {"speed": 2}},
-            "icon": "🔄"
-        },
-        {
-            "id": "combo_artist",
-            "name": "Combo Artist",
-            "description": "Perform 50 combo finishers",
-            "category": "Combat",
-            "tier": 2,
-            "requirement": {"combo_finishers": 50},
-            "reward": {"exp": 1000, "stat_bonus": {"speed": 5, "attack": 3}},
-            "icon": "⚡"
-        },
-        {
-            "id": "combo_master",
-            "name": "Combo Master",
-            "description": "Perform 150 combo finishers",
-            "category": "Combat",
-            "tier": 3,
-            "requirement": {"combo_finishers": 150},
-            "reward": {"exp": 3000, "stat_bonus": {"speed": 10, "attack": 7}, "item": "Combo Master's Gloves"},
-            "icon": "🌪️"
-        },
-
-        # Critical Hit Achievements
-        {
-            "id": "critical_striker",
-            "name": "Critical Striker",
-            "description": "Land 25 critical hits",
-            "category": "Combat",
-            "tier": 1,
-            "requirement": {"critical_hits": 25},
-            "reward": {"exp": 200, "stat_bonus": {"critical_chance": 0.02}},
-            "icon": "❗"
-        },
-        {
-            "id": "critical_expert",
-            "name": "Critical Expert",
-            "description": "Land 100 critical hits",
-            "category": "Combat",
-            "tier": 2,
-            "requirement": {"critical_hits": 100},
-            "reward": {"exp": 800, "stat_bonus": {"critical_chance": 0.05}},
-            "icon": "💢"
-        },
-        {
-            "id": "critical_master",
-            "name": "Critical Master",
-            "description": "Land 250 critical hits",
-            "category": "Combat",
-            "tier": 3,
-            "requirement": {"critical_hits": 250},
-            "reward": {"exp": 2000, "stat_bonus": {"critical_chance": 0.1}, "item": "Precision Scope"},
-            "icon": "💥"
-        },
-
-        # Wealth Achievements
-        {
-            "id": "gold_collector",
-            "name": "Gold Collector",
-            "description": "Earn 1,000 gold",
-            "category": "Wealth",
-            "tier": 1,
-            "requirement": {"total_gold_earned": 1000},
-            "reward": {"exp": 200, "stat_bonus": {"charisma": 2}},
-            "icon": "💰"
-        },
-        {
-            "id": "wealthy",
-            "name": "Wealthy",
-            "description": "Earn 10,000 gold",
-            "category": "Wealth",
-            "tier": 2,
-            "requirement": {"total_gold_earned": 10000},
-            "reward": {"exp": 1000, "stat_bonus": {"charisma": 5}},
-            "icon": "💎"
-        },
-        {
-            "id": "rich",
-            "name": "Rich",
-            "description": "Earn 50,000 gold",
-            "category": "Wealth",
-            "tier": 3,
-            "requirement": {"total_gold_earned": 50000},
-            "reward": {"exp": 3000, "stat_bonus": {"charisma": 10}, "item": "Golden Monocle"},
-            "icon": "👑"
-        },
-        {
-            "id": "millionaire",
-            "name": "Millionaire",
-            "description": "Earn 100,000 gold",
-            "category": "Wealth",
-            "tier": 4,
-            "requirement": {"total_gold_earned": 100000},
-            "reward": {"exp": 10000, "stat_bonus": {"charisma": 20}, "item": "Midas Touch Gloves"},
-            "icon": "🏛️"
-        },
-
-        # Experience Achievements
-        {
-            "id": "level_up",
-            "name": "Level Up",
-            "description": "Reach level 5",
-            "category": "Experience",
-            "tier": 1,
-            "requirement": lambda: user_data["level"] >= 5,
-            "reward": {"gold": 100, "stat_bonus": {"health": 10}},
-            "icon": "📈"
-        },
-        {
-            "id": "adventurer",
-            "name": "Adventurer",
-            "description": "Reach level 10",
-            "category": "Experience",
-            "tier": 2,
-            "requirement": lambda: user_data["level"] >= 10,
-            "reward": {"gold": 500, "stat_bonus": {"health": 20, "attack": 2, "defense": 2}},
-            "icon": "🌄"
-        },
-        {
-            "id": "hero",
-            "name": "Hero",
-            "description": "Reach level 25",
-            "category": "Experience",
-            "tier": 3,
-            "requirement": lambda: user_data["level"] >= 25,
-            "reward": {"gold": 2000, "stat_bonus": {"health": 50, "attack": 5, "defense": 5}},
-            "icon": "🦸"
-        },
-        {
-            "id": "legend",
-            "name": "Legend",
-            "description": "Reach level 50",
-            "category": "Experience",
-            "tier": 4,
-            "requirement": lambda: user_data["level"] >= 50,
-            "reward": {"gold": 5000, "stat_bonus": {"health": 100, "attack": 10, "defense": 10}, "item": "Legendary Cape"},
-            "icon": "🌟"
-        },
-
-        # Exploration Achievements
-        {
-            "id": "explorer_novice",
-            "name": "Explorer Novice",
-            "description": "Visit 3 different locations",
-            "category": "Exploration",
-            "tier": 1,
-            "requirement": lambda: len(user_data.get("visited_locations", [])) >= 3,
-            "reward": {"exp": 200, "stat_bonus": {"speed": 1}},
-            "icon": "🧭"
-        },
-        {
-            "id": "traveler",
-            "name": "Traveler",
-            "description": "Visit 7 different locations",
-            "category": "Exploration",
-            "tier": 2,
-            "requirement": lambda: len(user_data.get("visited_locations", [])) >= 7,
-            "reward": {"exp": 500, "gold": 300, "stat_bonus": {"speed": 3}},
-            "icon": "🗺️"
-        },
-        {
-            "id": "explorer",
-            "name": "Explorer",
-            "description": "Visit 12 different locations",
-            "category": "Exploration",
-            "tier": 3,
-            "requirement": lambda: len(user_data.get("visited_locations", [])) >= 12,
-            "reward": {"exp": 1500, "gold": 800, "stat_bonus": {"speed": 6}, "item": "Explorer's Boots"},
-            "icon": "🌍"
-        },
-        {
-            "id": "world_traveler",
-            "name": "World Traveler",
-            "description": "Visit all locations in the world",
-            "category": "Exploration",
-            "tier": 4,
-            "requirement": lambda: len(user_data.get("visited_locations", [])) >= 20,  # Assuming 20 total locations
-            "reward": {"exp": 3000, "gold": 2000, "stat_bonus": {"speed": 10, "charisma": 5}, "item": "World Map"},
-            "icon": "🌐"
-        },
-
-        # Collection Achievements
-        {
-            "id": "collector",
-            "name": "Item Collector",
-            "description": "Collect 25 different items",
-            "category": "Collection",
-            "tier": 1,
-            "requirement": lambda: len(set(user_data.get("all_collected_items", []))) >= 25,
-            "reward": {"gold": 200, "exp": 300},
-            "icon": "🧰"
-        },
-        {
-            "id": "treasure_hunter",
-            "name": "Treasure Hunter",
-            "description": "Open 10 treasure chests",
-            "category": "Collection",
-            "tier": 2,
-            "requirement": {"treasure_chests_opened": 10},
-            "reward": {"gold": 500, "exp": 700},
-            "icon": "🗝️"
-        },
-        {
-            "id": "hoarder",
-            "name": "Hoarder",
-            "description": "Collect 100 different items",
-            "category": "Collection",
-            "tier": 3,
-            "requirement": lambda: len(set(user_data.get("all_collected_items", []))) >= 100,
-            "reward": {"gold": 1500, "exp": 2000, "item": "Collector's Bag"},
-            "icon": "🎒"
-        },
-
-        # Crafting Achievements
-        {
-            "id": "apprentice_crafter",
-            "name": "Apprentice Crafter",
-            "description": "Craft 10 items",
-            "category": "Crafting",
-            "tier": 1,
-            "requirement": {"items_crafted": 10},
-            "reward": {"exp": 200, "stat_bonus": {"crafting": 2}},
-            "icon": "🔨"
-        },
-        {
-            "id": "skilled_artisan",
-            "name": "Skilled Artisan",
-            "description": "Craft 25 items",
-            "category": "Crafting",
-            "tier": 2,
-            "requirement": {"items_crafted": 25},
-            "reward": {"exp": 500, "stat_bonus": {"crafting": 5}},
-            "icon": "⚒️"
-        },
-        {
-            "id": "master_crafter",
-            "name": "Master Crafter",
-            "description": "Craft 50 items",
-            "category": "Crafting",
-            "tier": 3,
-            "requirement": {"items_crafted": 50},
-            "reward": {"exp": 1500, "stat_bonus": {"crafting": 10}, "item": "Artisan's Tools"},
-            "icon": "🛠️"
-        },
-
-        # Quest Achievements
-        {
-            "id": "quest_beginner",
-            "name": "Quest Beginner",
-            "description": "Complete 3 quests",
-            "category": "Quests",
-            "tier": 1,
-            "requirement": {"quests_completed": 3},
-            "reward": {"exp": 300},
-            "icon": "📜"
-        },
-        {
-            "id": "quest_taker",
-            "name": "Quest Taker",
-            "description": "Complete 10 quests",
-            "category": "Quests",
-            "tier": 2,
-            "requirement": {"quests_completed": 10},
-            "reward": {"exp": 800, "gold": 500},
-            "icon": "📝"
-        },
-        {
-            "id": "quest_master",
-            "name": "Quest Master",
-            "description": "Complete 25 quests",
-            "category": "Quests",
-            "tier": 3,
-            "requirement": {"quests_completed": 25},
-            "reward": {"exp": 2000, "gold": 1500, "item": "Quest Master's Journal"},
-            "icon": "📚"
-        },
-
-        # Dungeon Achievements
-        {
-            "id": "dungeon_novice",
-            "name": "Dungeon Novice",
-            "description": "Complete your first dungeon",
-            "category": "Dungeons",
-            "tier": 1,
-            "requirement": {"dungeons_completed": 1},
-            "reward": {"exp": 300, "gold": 200},
-            "icon": "🏰"
-        },
-        {
-            "id": "dungeon_explorer",
-            "name": "Dungeon Explorer",
-            "description": "Complete 5 different dungeons",
-            "category": "Dungeons",
-            "tier": 2,
-            "requirement": {"dungeons_completed": 5},
-            "reward": {"exp": 1000, "gold": 800, "stat_bonus": {"defense": 3}},
-            "icon": "🔍"
-        },
-        {
-            "id": "dungeon_master",
-            "name": "Dungeon Master",
-            "description": "Complete 15 different dungeons",
-            "category": "Dungeons",
-            "tier": 3,
-            "requirement": {"dungeons_completed": 15},
-            "reward": {"exp": 3000, "gold": 2000, "stat_bonus": {"defense": 8}, "item": "Dungeon Key"},
-            "icon": "🔑"
-        },
-
-        # Survival Achievements
-        {
-            "id": "survivor",
-            "name": "Survivor",
-            "description": "Survive 10 near-death experiences (below 10% health)",
-            "category": "Survival",
-            "tier": 2,
-            "requirement": lambda: user_data.get("near_death_escapes", 0) >= 10,
-            "reward": {"exp": 1000, "stat_bonus": {"health": 10, "defense": 3}},
-            "icon": "❤️‍🩹"
-        },
-        {
-            "id": "potion_master",
-            "name": "Potion Master",
-            "description": "Use 50 potions",
-            "category": "Survival",
-            "tier": 2,
-            "requirement": {"potions_used": 50},
-            "reward": {"exp": 500, "stat_bonus": {"health": 5}},
-            "icon": "🧪"
-        },
-        {
-            "id": "dodge_expert",
-            "name": "Dodge Expert",
-            "description": "Dodge 100 enemy attacks",
-            "category": "Survival",
-            "tier": 3,
-            "requirement": {"enemies_dodged": 100},
-            "reward": {"exp": 2000, "stat_bonus": {"speed": 8}, "item": "Shadow Step Boots"},
-            "icon": "💨"
-        }
-    ]
-
-    # Check each achievement
-    newly_unlocked = []
-
-    for achievement in ACHIEVEMENTS:
-        achievement_id = achievement["id"]
-
-        # Skip if already unlocked
-        if achievement_id in user_data["achievements"]["unlocked"]:
-            continue
-
-        # Check if achievement is unlocked based on requirement
-        requirement_met = False
-
-        # Handle lambda requirements (custom conditions)
-        if callable(achievement.get("requirement")):
-            requirement_met = achievement["requirement"]()
-        # Handle dict requirements (stat-based conditions)
-        elif isinstance(achievement.get("requirement"), dict):
-            requirement_met = True
-            for stat, required_value in achievement["requirement"].items():
-                # Handle set-type stats (like areas_visited)
-                if stat == "areas_visited" and isinstance(user_data["achievements"]["progress"].get(stat), set):
-                    if len(user_data["achievements"]["progress"].get(stat, set())) < required_value:
-                        requirement_met = False
-                        break
-                # Handle regular numeric stats
-                elif user_data["achievements"]["progress"].get(stat, 0) < required_value:
-                    requirement_met = False
-                    break
-
-        # If requirement is met, unlock achievement
-        if requirement_met:
-            # Unlock the achievement
-            user_data["achievements"]["unlocked"].append(achievement_id)
-            newly_unlocked.append(achievement)
-
-            # Apply rewards
-            grant_achievement_rewards(achievement)
-
-    # Display newly unlocked achievements with fancy UI
-    if newly_unlocked:
-        print_animated(f"\n{BG_YELLOW}{BLACK} ACHIEVEMENTS UNLOCKED! {ENDC}", delay=0.05)
-        for achievement in newly_unlocked:
-            icon = achievement.get("icon", "🏆")
-            tier = achievement.get("tier", 1)
-            tier_color = [WHITE, LIGHTGREEN, LIGHTBLUE, LIGHTMAGENTA, LIGHTYELLOW][min(tier, 4)]
-
-            print_animated(f"{tier_color}{icon} {achievement['name']}{ENDC} - {achievement['description']}", delay=0.03)
-
-            # Show rewards
-            if "reward" in achievement:
-                reward_str = "Rewards: "
-                reward = achievement["reward"]
-                if "gold" in reward:
-                    reward_str += f"{LIGHTYELLOW}{reward['gold']} Gold{ENDC}, "
-                if "exp" in reward:
-                    reward_str += f"{LIGHTGREEN}{reward['exp']} XP{ENDC}, "
-                if "item" in reward:
-                    reward_str += f"{LIGHTMAGENTA}{reward['item']}{ENDC}, "
-                if "stat_bonus" in reward:
-                    for stat, value in reward["stat_bonus"].items():
-                        reward_str += f"{LIGHTCYAN}+{value} {stat.capitalize()}{ENDC}, "
-                # Remove trailing comma and space
-                reward_str = reward_str[:-2]
-                print_animated(f"  {reward_str}", delay=0.02)
+def announce_achievements(newly_unlocked: List[Dict[str, Any]]) -> None:
+    """Display newly unlocked achievements with fancy UI"""
+    print_animated(f"\n{BG_YELLOW}{BLACK} ACHIEVEMENTS UNLOCKED! {ENDC}", delay=0.05)
+    for achievement in newly_unlocked:
+        icon = achievement.get("icon", "🏆")
+        tier = achievement.get("tier", 1)
+        tier_color = [WHITE, LIGHTGREEN, LIGHTBLUE, LIGHTMAGENTA, LIGHTYELLOW][min(tier, 4)]
+
+        print_animated(f"{tier_color}{icon} {achievement['name']}{ENDC} - {achievement['description']}", delay=0.03)
+
+        # Show rewards
+        if "reward" in achievement:
+            reward_str = "Rewards: "
+            reward = achievement["reward"]
+            if "gold" in reward:
+                reward_str += f"{LIGHTYELLOW}{reward['gold']} Gold{ENDC}, "
+            if "exp" in reward:
+                reward_str += f"{LIGHTGREEN}{reward['exp']} XP{ENDC}, "
+            if "item" in reward:
+                reward_str += f"{LIGHTMAGENTA}{reward['item']}{ENDC}, "
+            if "stat_bonus" in reward:
+                for stat, value in reward["stat_bonus"].items():
+                    reward_str += f"{LIGHTCYAN}+{value} {stat.capitalize()}{ENDC}, "
+            # Remove trailing comma and space
+            reward_str = reward_str[:-2]
+            print_animated(f"  {reward_str}", delay=0.02)
 
 def update_achievement_progress() -> None:
     """Update and track progress towards achievements"""
 
-    # Check literature-related achievements
-    if "literature" in user_data:
-        lit_data = user_data["literature"]
-
-        # Count read literature
-        read_items = len(lit_data.get("read", []))
-        if read_items > 0:
-            unlock_achievement("Novice Reader", "Read your first book or scroll.", "Read 1 book")
-        if read_items >= 10:
-            unlock_achievement("Bookworm", "Read 10 different books and scrolls.", "Read 10 texts")
-        if read_items >= 25:
-            unlock_achievement("Scholar", "Read 25 different books and scrolls.", "Read 25 texts")
-
-        # Count owned literature
-        owned_items = len(lit_data.get("owned", []))
-        if owned_items >= 15:
-            unlock_achievement("Collector of Knowledge", "Own 15 different books and scrolls in your collection.", "Collect 15 texts")
-
-        # Check for diverse reading
-        if read_items > 0:
-            read_categories = set()
-            for item_id in lit_data.get("read", []):
-                try:
-                    item_type, category, _ = item_id.split(":", 2)
-                    read_categories.add(f"{item_type}:{category}")
-                except ValueError:
-                    continue
-
-            # If player has read from at least 5 different categories
-            if len(read_categories) >= 5:
-                unlock_achievement("Master of Lore", "Read at least one book from every category.", "Read diverse texts")
-
-    # Check archaeology-related achievements
-    if "archaeology" in user_data:
-        arch_data = user_data["archaeology"]
-
-        # Count discovered sites
-        discovered_sites = len(arch_data.get("discovered_sites", []))
-        if discovered_sites > 0:
-            unlock_achievement("Novice Archaeologist", "Discover your first archaeological site.", "Discover 1 site")
-        if discovered_sites >= 3:
-            unlock_achievement("Amateur Archaeologist", "Discover 3 archaeological sites.", "Discover 3 sites")
-        if discovered_sites >= len(ARCHAEOLOGICAL_SITES):
-            unlock_achievement("Professional Archaeologist", "Discover all archaeological sites.", "Discover all sites")
-
-        # Count completed artifact sets
-        completed_sets = len(arch_data.get("completed_sets", []))
-        if completed_sets >= 1:
-            unlock_achievement("Artifact Collector", "Complete your first artifact set.", "Complete 1 artifact set")
-        if completed_sets >= 3:
-            unlock_achievement("Master Collector", "Complete 3 artifact sets.", "Complete 3 artifact sets")
-
-        # Count acquired knowledge
-        knowledge_count = len(arch_data.get("knowledge", []))
-        if knowledge_count >= 1:
-            unlock_achievement("Knowledge Seeker", "Acquire your first piece of ancient knowledge.", "Acquire 1 ancient knowledge")
-        if knowledge_count >= len(ANCIENT_KNOWLEDGE):
-            unlock_achievement("Ancient Scholar", "Acquire all pieces of ancient knowledge.", "Acquire all ancient knowledge")
-
-        # Count museum exhibits
-        museum_exhibits = len(arch_data.get("museum_exhibits", []))
-        if museum_exhibits >= 5:
-            unlock_achievement("Museum Curator", "Display 5 artifacts in your museum.", "Display 5 artifacts")
-        if museum_exhibits >= 10:
-            unlock_achievement("Master Curator", "Display 10 artifacts in your museum.", "Display 10 artifacts")
     # Update achievement stats based on user_data
     user_stats = user_data["achievements"]["progress"]
 
@@ -6120,8 +4975,8 @@ def show_achievements() -> None:
             "progress": {}
         }
 
-    # Update achievement progress before showing
-    update_achievement_progress()
+    # Unlock anything pending and update achievement progress before showing
+    check_achievements()
 
     # Get all achievements organized by category
     all_achievements = {
@@ -6470,6 +5325,88 @@ def apply_character_element_synergy() -> Dict:
 # Using the more complete version below with type annotations
 
 # Elemental Combat Functions
+# Character elements are simplified names of the game elements
+ELEMENT_ALIASES: Dict[str, str] = {
+    "Fire": "Ignis",
+    "Water": "Aqua",
+    "Earth": "Gē",
+    "Air": "Aer",
+    "Lightning": "Fulmen",
+    "Ice": "Glacies",
+    "Light": "Lux",
+    "Dark": "Tenebrae",
+    "Nature": "Viridia",
+    "Arcane": "Pneuma"
+}
+
+# (attacker, defender) -> (game attacker, game defender, immune, "strong"/"weak"/"", reaction)
+ELEMENT_MATCHUPS: Dict[Tuple[str, str], Tuple[str, str, bool, str, Optional[Dict[str, Any]]]] = {}
+
+def compile_matchup(attacker_element: str, defender_element: str) -> Tuple[str, str, bool, str, Optional[Dict[str, Any]]]:
+    """Everything about one attacker/defender element pair that does not depend on the party"""
+    attacker = ELEMENT_ALIASES.get(attacker_element, attacker_element)
+    defender = ELEMENT_ALIASES.get(defender_element, defender_element)
+    immune = attacker == defender and defender != "Nullum"
+    relation = ""
+    if attacker in ELEMENTS and defender in ELEMENTS:
+        if defender in ELEMENTS[attacker].get("strength", []):
+            relation = "strong"
+        elif attacker in ELEMENTS[defender].get("strength", []):
+            relation = "weak"
+    return attacker, defender, immune, relation, ELEMENTAL_REACTIONS.get(f"{attacker}+{defender}")
+
+def elemental_matchup(attacker_element: str, defender_element: str) -> Tuple[str, str, bool, str, Optional[Dict[str, Any]]]:
+    """Look up a pair in the element matchup matrix, compiling the matrix on first use"""
+    if not ELEMENT_MATCHUPS:
+        names = list(ELEMENTS) + list(ELEMENT_ALIASES)
+        for attacker in names:
+            for defender in names:
+                ELEMENT_MATCHUPS[(attacker, defender)] = compile_matchup(attacker, defender)
+    key = (attacker_element, defender_element)
+    matchup = ELEMENT_MATCHUPS.get(key)
+    if matchup is None:
+        # Elements outside the tables ("Normal", monster-only names) are added as they show up
+        matchup = ELEMENT_MATCHUPS[key] = compile_matchup(attacker_element, defender_element)
+    return matchup
+
+# Party synergy only changes with the party, so it is kept until invalidate_party_synergy()
+PARTY_SYNERGY_CACHE: Dict[str, Any] = {}
+
+def invalidate_party_synergy() -> None:
+    """Forget the cached party synergy after the party or the owned characters change"""
+    PARTY_SYNERGY_CACHE.clear()
+
+def party_synergy() -> Optional[Tuple[Dict, Dict[str, int]]]:
+    """Synergy effects and element counts of the active character party, None without a party"""
+    if "gacha" not in user_data or not user_data["gacha"].get("current_party"):
+        return None
+    # A loaded save brings a different gacha record, which makes the cache stale as well
+    if "party" in PARTY_SYNERGY_CACHE and PARTY_SYNERGY_CACHE.get("gacha") is user_data["gacha"]:
+        return PARTY_SYNERGY_CACHE["party"]
+
+    # Get active synergy effects from character party
+    synergy_effects = apply_character_element_synergy()
+
+    # Passive effects that change the damage formula are resolved once here
+    passive_effects = [effect.lower() for effect in synergy_effects.get("passive_effects", [])]
+    synergy_effects["immunity_bypass"] = any(
+        ("immunity" in effect and "bypass" in effect) or "transform" in effect for effect in passive_effects)
+    synergy_effects["weakness_reduction"] = any(
+        "weakness" in effect and "reduce" in effect for effect in passive_effects)
+
+    # Count elements in party for resonance effects
+    element_count = {}
+    for char_name in user_data["gacha"]["current_party"]:
+        char_data = GACHA_CHARACTERS.get(char_name, {})
+        element = char_data.get("element", "None")
+        if element not in element_count:
+            element_count[element] = 0
+        element_count[element] += 1
+
+    PARTY_SYNERGY_CACHE["gacha"] = user_data["gacha"]
+    PARTY_SYNERGY_CACHE["party"] = (synergy_effects, element_count)
+    return PARTY_SYNERGY_CACHE["party"]
+
 def calculate_elemental_damage(attacker_element: str, defender_element: str, base_damage: int, is_player: bool = True) -> Tuple[int, str, Dict]:
     """Calculate damage based on elemental interactions and return elemental reaction if applicable
 
@@ -6482,61 +5419,54 @@ def calculate_elemental_damage(attacker_element: str, defender_element: str, bas
     Returns:
         Tuple of (final_damage, reaction_name, reaction_effect)
     """
+    party = party_synergy() if is_player else None
+    final_damage, reaction_name, reaction_effect, messages = resolve_elemental_damage(
+        attacker_element, defender_element, base_damage, party)
+    for text, color in messages:
+        print_colored(text, color)
+    return final_damage, reaction_name, reaction_effect
+
+def resolve_elemental_damage(attacker_element: str, defender_element: str, base_damage: int,
+                             party: Optional[Tuple[Dict, Dict[str, int]]] = None,
+                             rng: Any = random) -> Tuple[int, str, Dict, List[Tuple[str, str]]]:
+    """Elemental damage without any output, the messages to show are returned instead
+
+    Args:
+        attacker_element: The element of the attacker
+        defender_element: The element of the defender
+        base_damage: The base damage amount
+        party: The player's party_synergy() when the player attacks, None otherwise
+        rng: Source of randomness, the random module or a random.Random
+
+    Returns:
+        Tuple of (final_damage, reaction_name, reaction_effect, messages)
+    """
     damage_multiplier = 1.0
     reaction_name = ""  # Empty string instead of None
     reaction_effect = {}
+    messages: List[Tuple[str, str]] = []
 
-    # Get character party synergy effects if player is attacking
-    synergy_effects = {}
-    element_count = {}
-    if is_player and "gacha" in user_data and user_data["gacha"].get("current_party"):
-        # Get active synergy effects from character party
-        synergy_effects = apply_character_element_synergy()
-
-        # Count elements in party for resonance effects
-        for char_name in user_data["gacha"]["current_party"]:
-            char_data = GACHA_CHARACTERS.get(char_name, {})
-            element = char_data.get("element", "None")
-            if element not in element_count:
-                element_count[element] = 0
-            element_count[element] += 1
-
-    # Map simplified character elements to game elements
-    element_mapping = {
-        "Fire": "Ignis",
-        "Water": "Aqua", 
-        "Earth": "Gē",
-        "Air": "Aer",
-        "Lightning": "Fulmen",
-        "Ice": "Glacies",
-        "Light": "Lux",
-        "Dark": "Tenebrae",
-        "Nature": "Viridia",
-        "Arcane": "Pneuma"
-    }
+    # Character party synergy effects only apply when the player is attacking
+    is_player = party is not None
+    synergy_effects, element_count = party if party is not None else ({}, {})
 
-    # Convert character elements to game elements if needed
-    game_attacker_element = element_mapping.get(attacker_element, attacker_element)
-    game_defender_element = element_mapping.get(defender_element, defender_element)
+    game_attacker_element, game_defender_element, immune, relation, reaction = elemental_matchup(
+        attacker_element, defender_element)
 
     # Check for immunity (monster immune to their own element)
-    if game_attacker_element == game_defender_element and game_defender_element != "Nullum":
+    if immune:
         # Check if character party provides immunity bypass
-        immunity_bypass = False
-        if is_player and synergy_effects.get("passive_effects"):
-            for effect in synergy_effects["passive_effects"]:
-                if ("immunity" in effect.lower() and "bypass" in effect.lower()) or "transform" in effect.lower():
-                    immunity_bypass = True
-                    print_colored("Character ability bypasses elemental immunity!", MAGENTA)
-                    break
+        immunity_bypass = is_player and synergy_effects.get("immunity_bypass", False)
+        if immunity_bypass:
+            messages.append(("Character ability bypasses elemental immunity!", MAGENTA))
 
         if not immunity_bypass:
-            print_colored(f"The {defender_element} creature is immune to {attacker_element} damage!", WARNING)
-            return 0, "", {}  # Empty string instead of None
+            messages.append((f"The {defender_element} creature is immune to {attacker_element} damage!", WARNING))
+            return 0, "", {}, messages  # Empty string instead of None
         else:
             # Reduced damage but not immune when bypassed
             damage_multiplier *= 0.3
-            print_colored("Your characters' abilities allow you to damage it at reduced effectiveness!", CYAN)
+            messages.append(("Your characters' abilities allow you to damage it at reduced effectiveness!", CYAN))
 
     # Apply elemental damage bonus from character synergy
     if is_player and synergy_effects.get("elemental_damage_bonus", 0) > 0:
@@ -6545,12 +5475,12 @@ def calculate_elemental_damage(attacker_element: str, defender_element: str, bas
 
         # Only show message if bonus is significant
         if elem_bonus >= 0.1:  # 10% or higher bonus
-            print_colored(f"Party Synergy: +{int(elem_bonus*100)}% elemental damage!", CYAN)
+            messages.append((f"Party Synergy: +{int(elem_bonus*100)}% elemental damage!", CYAN))
 
     # Check elemental strengths and weaknesses
-    if game_attacker_element in ELEMENTS and game_defender_element in ELEMENTS:
+    if relation:
         # Defender is weak to attacker's element
-        if game_defender_element in ELEMENTS[game_attacker_element].get("strength", []):
+        if relation == "strong":
             weakness_multiplier = 1.5
 
             # Enhanced weakness damage from character party of same element
@@ -6560,30 +5490,25 @@ def calculate_elemental_damage(attacker_element: str, defender_element: str, bas
                 weakness_multiplier += weakness_bonus
 
                 if weakness_bonus > 0:
-                    print_colored(f"{attacker_element} Party Resonance: +{int(weakness_bonus*100)}% weakness damage!", CYAN)
+                    messages.append((f"{attacker_element} Party Resonance: +{int(weakness_bonus*100)}% weakness damage!", CYAN))
 
             damage_multiplier *= weakness_multiplier
-            print_colored(f"{attacker_element} is strong against {defender_element}!", OKGREEN)
+            messages.append((f"{attacker_element} is strong against {defender_element}!", OKGREEN))
 
         # Attacker's element is weak against defender's element
-        elif game_attacker_element in ELEMENTS[game_defender_element].get("strength", []):
+        else:
             resistance_penalty = 0.5
 
             # Reduced resistance penalty from character effects
-            if is_player and synergy_effects.get("passive_effects"):
-                for effect in synergy_effects["passive_effects"]:
-                    if "weakness" in effect.lower() and "reduce" in effect.lower():
-                        resistance_penalty = 0.7  # Less penalty (0.7x instead of 0.5x)
-                        print_colored("Character ability reduces your elemental weakness penalty!", CYAN)
-                        break
+            if is_player and synergy_effects.get("weakness_reduction", False):
+                resistance_penalty = 0.7  # Less penalty (0.7x instead of 0.5x)
+                messages.append(("Character ability reduces your elemental weakness penalty!", CYAN))
 
             damage_multiplier *= resistance_penalty
-            print_colored(f"{attacker_element} is weak against {defender_element}!", FAIL)
+            messages.append((f"{attacker_element} is weak against {defender_element}!", FAIL))
 
     # Check for potential elemental reaction
-    reaction_key = f"{game_attacker_element}+{game_defender_element}"
-    if reaction_key in ELEMENTAL_REACTIONS:
-        reaction = ELEMENTAL_REACTIONS[reaction_key]
+    if reaction:
         reaction_name = reaction["name"]
         reaction_effect = reaction["effect"]
         reaction_multiplier = reaction["damage_multiplier"]
@@ -6597,17 +5522,17 @@ def calculate_elemental_damage(attacker_element: str, defender_element: str, bas
             elem1 = game_attacker_element
             elem2 = game_defender_element
 
-            elem1_char_count = element_count.get(element_mapping.get(elem1, elem1), 0)
-            elem2_char_count = element_count.get(element_mapping.get(elem2, elem2), 0)
+            elem1_char_count = element_count.get(ELEMENT_ALIASES.get(elem1, elem1), 0)
+            elem2_char_count = element_count.get(ELEMENT_ALIASES.get(elem2, elem2), 0)
 
             if elem1_char_count > 0 and elem2_char_count > 0:
                 # Both elements in party = +25% reaction damage
                 reaction_bonus = 0.25
                 damage_multiplier += reaction_bonus
-                print_colored(f"Dual Element Resonance: +{int(reaction_bonus*100)}% reaction damage!", MAGENTA)
+                messages.append((f"Dual Element Resonance: +{int(reaction_bonus*100)}% reaction damage!", MAGENTA))
 
-        print_colored(f"Elemental Reaction: {reaction_name}!", MAGENTA)
-        print_colored(f"{reaction['description']}", CYAN)
+        messages.append((f"Elemental Reaction: {reaction_name}!", MAGENTA))
+        messages.append((f"{reaction['description']}", CYAN))
 
     # Calculate final damage with appropriate rounding
     final_damage = int(base_damage * damage_multiplier)
@@ -6621,12 +5546,12 @@ def calculate_elemental_damage(attacker_element: str, defender_element: str, bas
         final_crit_chance = min(0.5, crit_chance + matching_element_bonus)  # Cap at 50%
 
         # Check for critical hit
-        if random.random() < final_crit_chance:
+        if rng.random() < final_crit_chance:
             # Critical hit does 2x damage
             final_damage *= 2
-            print_colored("CRITICAL HIT!", LIGHTMAGENTA)
+            messages.append(("CRITICAL HIT!", LIGHTMAGENTA))
 
-    return final_damage, reaction_name, reaction_effect
+    return final_damage, reaction_name, reaction_effect, messages
 
 
 def apply_elemental_effects(entity_data: Dict, reaction_effect: Dict, is_player: bool = False) -> None:
@@ -6814,133 +5739,7 @@ DIMENSIONS = {
 }
 
 # Home and Camp Structure definitions
-HOME_STRUCTURES = {
-    "Tent": {
-        "name": "Basic Tent",
-        "description": "A simple tent that provides basic shelter and rest.",
-        "level": 1,
-        "materials": {"Cloth": 5, "Wood": 3},
-        "effects": {"rest_heal": 20, "storage": 10},
-        "category": "shelter"
-    },
-    "Campfire": {
-        "name": "Campfire",
-        "description": "A small fire that provides warmth and a place to cook food.",
-        "level": 1,
-        "materials": {"Wood": 5, "Stone": 3},
-        "effects": {"cook_food": True, "light": True},
-        "category": "utility"
-    },
-    "Storage Chest": {
-        "name": "Storage Chest",
-        "description": "A wooden chest that provides additional storage space.",
-        "level": 1,
-        "materials": {"Wood": 10, "Iron Ore": 2},
-        "effects": {"storage": 20},
-        "category": "storage"
-    },
-    "Workbench": {
-        "name": "Workbench",
-        "description": "A simple workbench for crafting basic items.",
-        "level": 1,
-        "materials": {"Wood": 15, "Iron Ore": 5},
-        "effects": {"crafting_bonus": 0.1},
-        "category": "crafting"
-    },
-    "Herb Garden": {
-        "name": "Herb Garden",
-        "description": "A small garden to grow healing herbs.",
-        "level": 1,
-        "materials": {"Wood": 5, "Herb": 3, "Water": 2},
-        "effects": {"herb_production": 1},
-        "category": "production"
-    },
-    "Training Dummy": {
-        "name": "Training Dummy",
-        "description": "A wooden dummy for combat practice.",
-        "level": 1,
-        "materials": {"Wood": 10, "Cloth": 5},
-        "effects": {"combat_exp_bonus": 0.05},
-        "category": "training"
-    },
-    "Small Hut": {
-        "name": "Small Hut",
-        "description": "A small wooden hut that provides better shelter than a tent.",
-        "level": 2,
-        "materials": {"Wood": 20, "Stone": 10, "Cloth": 5},
-        "effects": {"rest_heal": 40, "storage": 20},
-        "category": "shelter",
-        "upgrade_from": "Tent"
-    },
-    "Cooking Pot": {
-        "name": "Cooking Pot",
-        "description": "A pot for cooking more complex meals with better effects.",
-        "level": 2,
-        "materials": {"Iron Ore": 10, "Stone": 5},
-        "effects": {"food_quality": 0.2},
-        "category": "utility",
-        "requires": "Campfire"
-    },
-    "Reinforced Chest": {
-        "name": "Reinforced Chest",
-        "description": "A stronger chest with more storage capacity.",
-        "level": 2,
-        "materials": {"Wood": 15, "Iron Ore": 10, "Stone": 5},
-        "effects": {"storage": 40},
-        "category": "storage",
-        "upgrade_from": "Storage Chest"
-    },
-    "Alchemy Station": {
-        "name": "Alchemy Station",
-        "description": "A station for creating potions and elixirs.",
-        "level": 2,
-        "materials": {"Wood": 10, "Iron Ore": 5, "Herb": 10, "Glass": 5},
-        "effects": {"alchemy_bonus": 0.15},
-        "category": "crafting"
-    },
-    "Meditation Shrine": {
-        "name": "Meditation Shrine",
-        "description": "A quiet place for meditation and mana regeneration.",
-        "level": 2,
-        "materials": {"Stone": 15, "Divine Crystal": 1},
-        "effects": {"mana_regen": 0.1, "meditation_bonus": 0.2},
-        "category": "spiritual"
-    },
-    "Forge": {
-        "name": "Forge",
-        "description": "A furnace for smelting ores and forging metal items.",
-        "level": 3,
-        "materials": {"Stone": 30, "Iron Ore": 20, "Wood": 10},
-        "effects": {"smithing_bonus": 0.2, "metal_quality": 0.15},
-        "category": "crafting",
-        "upgrade_from": "Workbench"
-    },
-    "Enchanting Table": {
-        "name": "Enchanting Table",
-        "description": "A magical table for enchanting weapons and armor.",
-        "level": 3,
-        "materials": {"Wood": 20, "Divine Crystal": 5, "Shadow Essence": 3},
-        "effects": {"enchant_power": 0.2, "enchant_cost": -0.1},
-        "category": "magic"
-    },
-    "Cabin": {
-        "name": "Cabin",
-        "description": "A solid wooden cabin with multiple rooms.",
-        "level": 3,
-        "materials": {"Wood": 50, "Stone": 30, "Iron Ore": 10},
-        "effects": {"rest_heal": 60, "storage": 50, "comfort": 0.3},
-        "category": "shelter",
-        "upgrade_from": "Small Hut"
-    },
-    "Portal Frame": {
-        "name": "Portal Frame",
-        "description": "A frame for creating portals to other dimensions.",
-        "level": 4,
-        "materials": {"Divine Crystal": 5, "Shadow Essence": 5, "Pure Fire": 5, "Elemental Water": 5, "Living Stone": 5},
-        "effects": {"dimension_travel": True},
-        "category": "magic"
-    }
-}
+HOME_STRUCTURES = CONTENT.mapping("HOME_STRUCTURES")
 
 # Function for enchanting items with special effects
 def enchant_item() -> None:
@@ -7092,7 +5891,7 @@ def enchant_item() -> None:
                             user_data["achievements"]["progress"]["items_enchanted"] += 1
 
                         # Check achievements
-                        check_achievements()
+                        achievement_event("item_improved")
                     else:
                         # Failure
                         print_animated(f"\n{BG_RED}{WHITE} FAILURE! {ENDC}", delay=0.03)
@@ -7454,7 +6253,7 @@ def upgrade_item() -> None:
                     user_data["achievements"]["progress"]["items_upgraded"] += 1
 
                 # Check achievements
-                check_achievements()
+                achievement_event("item_improved")
             else:
                 # Failure - item remains the same but resources are consumed
                 print_animated(f"\n{BG_RED}{WHITE} FAILURE! {ENDC}", delay=0.03)
@@ -7995,7 +6794,7 @@ def open_chest(tier: str = "Common") -> None:
     user_data["all_collected_items"].extend(list(new_items))
 
     # Check achievements
-    check_achievements()
+    achievement_event("loot_collected")
 
     print_animated(f"\n{GREEN}All items have been added to your inventory!{ENDC}", delay=0.03)
 
@@ -8111,246 +6910,10 @@ ARTIFACT_RARITIES = {
 }
 
 # Elemental potion recipes
-POTION_RECIPES = {
-    # Immunity Potions
-    "Elixir of Cold": {
-        "materials": {"Ice Crystal": 2, "Water Essence": 3, "Magical Herb": 1},
-        "effect": {"immunity": "Ignis"},
-        "description": "Grants immunity to Ignis (fire) damage for one battle",
-        "type": "potion"
-    },
-    "Liquor Levitas": {
-        "materials": {"Wind Crystal": 2, "Feather": 3, "Magical Herb": 1},
-        "effect": {"immunity": "Gē"},
-        "description": "Grants immunity to Gē (earth) damage for one battle",
-        "type": "potion"
-    },
-    "Aura of Lightning": {
-        "materials": {"Thunder Crystal": 2, "Metal Shard": 3, "Magical Herb": 1},
-        "effect": {"immunity": "Aqua"},
-        "description": "Grants immunity to Aqua (water) damage for one battle",
-        "type": "potion"
-    },
-    "Essence of Drought": {
-        "materials": {"Fire Crystal": 2, "Sand": 3, "Magical Herb": 1},
-        "effect": {"immunity": "Aqua"},
-        "description": "Grants immunity to Aqua (water) damage for one battle",
-        "type": "potion"
-    },
-    "Potion of Grounding": {
-        "materials": {"Earth Crystal": 2, "Iron Ore": 3, "Magical Herb": 1},
-        "effect": {"immunity": "Fulmen"},
-        "description": "Grants immunity to Fulmen (lightning) damage for one battle",
-        "type": "potion"
-    },
-    "Essence of Heat": {
-        "materials": {"Fire Crystal": 2, "Coal": 3, "Magical Herb": 1},
-        "effect": {"immunity": "Glacies"},
-        "description": "Grants immunity to Glacies (ice) damage for one battle",
-        "type": "potion"
-    },
-    "Veil of Shadows": {
-        "materials": {"Shadow Essence": 2, "Night Flower": 3, "Magical Herb": 1},
-        "effect": {"immunity": "Lux"},
-        "description": "Grants immunity to Lux (light) damage for one battle",
-        "type": "potion"
-    },
-    "Radiant Elixir": {
-        "materials": {"Light Crystal": 2, "Sun Petal": 3, "Magical Herb": 1},
-        "effect": {"immunity": "Tenebrae"},
-        "description": "Grants immunity to Tenebrae (darkness) damage for one battle",
-        "type": "potion"
-    },
-    "Antidote Supreme": {
-        "materials": {"Pure Water": 2, "Cleansing Herb": 3, "Magical Herb": 1},
-        "effect": {"immunity": "Venēnum"},
-        "description": "Grants immunity to Venēnum (poison) damage for one battle",
-        "type": "potion"
-    },
-    "Rust Solution": {
-        "materials": {"Acid Extract": 2, "Plant Root": 3, "Magical Herb": 1},
-        "effect": {"immunity": "Ferrum"},
-        "description": "Grants immunity to Ferrum (metal) damage for one battle",
-        "type": "potion"
-    },
-    "Spirit Ward": {
-        "materials": {"Soul Fragment": 2, "Holy Water": 3, "Magical Herb": 1},
-        "effect": {"immunity": "Pneuma"},
-        "description": "Grants immunity to Pneuma (spirit) damage for one battle",
-        "type": "potion"
-    },
-    "Herbicide Mixture": {
-        "materials": {"Toxic Extract": 2, "Mushroom Spore": 3, "Magical Herb": 1},
-        "effect": {"immunity": "Viridia"},
-        "description": "Grants immunity to Viridia (plant) damage for one battle",
-        "type": "potion"
-    },
-
-    # Damage Booster Potions
-    "Blazing Catalyst": {
-        "materials": {"Fire Crystal": 3, "Dragon Scale": 1, "Magical Herb": 2},
-        "effect": {"damage_boost": "Ignis"},
-        "description": "Doubles your Ignis (fire) damage for one battle",
-        "type": "potion"
-    },
-    "Tsunami Extract": {
-        "materials": {"Water Essence": 3, "Sea Shell": 1, "Magical Herb": 2},
-        "effect": {"damage_boost": "Aqua"},
-        "description": "Doubles your Aqua (water) damage for one battle",
-        "type": "potion"
-    },
-    "Earthen Might": {
-        "materials": {"Earth Crystal": 3, "Mountain Stone": 1, "Magical Herb": 2},
-        "effect": {"damage_boost": "Gē"},
-        "description": "Doubles your Gē (earth) damage for one battle",
-        "type": "potion"
-    },
-    "Tempest Brew": {
-        "materials": {"Wind Crystal": 3, "Cloud Essence": 1, "Magical Herb": 2},
-        "effect": {"damage_boost": "Aer"},
-        "description": "Doubles your Aer (air) damage for one battle",
-        "type": "potion"
-    },
-    "Voltaic Solution": {
-        "materials": {"Thunder Crystal": 3, "Charged Core": 1, "Magical Herb": 2},
-        "effect": {"damage_boost": "Fulmen"},
-        "description": "Doubles your Fulmen (lightning) damage for one battle",
-        "type": "potion"
-    },
-    "Frost Amplifier": {
-        "materials": {"Ice Crystal": 3, "Frozen Heart": 1, "Magical Herb": 2},
-        "effect": {"damage_boost": "Glacies"},
-        "description": "Doubles your Glacies (ice) damage for one battle",
-        "type": "potion"
-    }
-}
+POTION_RECIPES = CONTENT.mapping("POTION_RECIPES")
 
 # Cooking recipes and their effects
-COOKING_RECIPES = {
-    "Hearty Stew": {
-        "ingredients": {"Meat": 2, "Vegetables": 3, "Herbs": 1},
-        "difficulty": "easy",
-        "fail_chance": 0.1,
-        "cook_time": 2,  # In game ticks
-        "health_restore": 40,
-        "stamina_restore": 30,
-        "buffs": {"strength": 2},
-        "buff_duration": 60,  # In game ticks
-        "experience": 15,
-        "description": "A filling meat stew that restores health and provides strength."
-    },
-    "Fish Soup": {
-        "ingredients": {"Fish": 2, "Vegetables": 2, "Water": 1},
-        "difficulty": "easy",
-        "fail_chance": 0.15,
-        "cook_time": 2,
-        "health_restore": 30,
-        "stamina_restore": 25,
-        "buffs": {"agility": 2},
-        "buff_duration": 50,
-        "experience": 12,
-        "description": "A light fish soup that increases agility."
-    },
-    "Forest Salad": {
-        "ingredients": {"Vegetables": 3, "Mushrooms": 2, "Herbs": 1},
-        "difficulty": "easy",
-        "fail_chance": 0.05,
-        "cook_time": 1,
-        "health_restore": 20,
-        "stamina_restore": 40,
-        "buffs": {"perception": 3},
-        "buff_duration": 70,
-        "experience": 10,
-        "description": "A fresh salad that sharpens your senses."
-    },
-    "Miner's Pie": {
-        "ingredients": {"Meat": 1, "Vegetables": 3, "Wheat": 2},
-        "difficulty": "medium",
-        "fail_chance": 0.2,
-        "cook_time": 3,
-        "health_restore": 45,
-        "stamina_restore": 35,
-        "buffs": {"endurance": 3},
-        "buff_duration": 90,
-        "experience": 20,
-        "description": "A hearty pie that improves endurance for mining."
-    },
-    "Warrior's Feast": {
-        "ingredients": {"Meat": 3, "Fish": 1, "Vegetables": 2, "Herbs": 2},
-        "difficulty": "medium",
-        "fail_chance": 0.25,
-        "cook_time": 4,
-        "health_restore": 60,
-        "stamina_restore": 50,
-        "buffs": {"strength": 4, "endurance": 2},
-        "buff_duration": 100,
-        "experience": 30,
-        "description": "A feast fit for warriors, providing significant combat bonuses."
-    },
-    "Wizard's Delight": {
-        "ingredients": {"Mushrooms": 3, "Magic Herbs": 2, "Fruits": 2},
-        "difficulty": "hard",
-        "fail_chance": 0.3,
-        "cook_time": 3,
-        "health_restore": 30,
-        "stamina_restore": 30,
-        "mana_restore": 50,
-        "buffs": {"intelligence": 5},
-        "buff_duration": 120,
-        "experience": 35,
-        "description": "A magical dish that enhances spellcasting abilities."
-    },
-    "Dragon Breath Curry": {
-        "ingredients": {"Meat": 2, "Dragon Fruit": 1, "Ghost Pepper": 3},
-        "difficulty": "very hard",
-        "fail_chance": 0.4,
-        "cook_time": 5,
-        "health_restore": 70,
-        "stamina_restore": 60,
-        "buffs": {"fire_resistance": 5, "strength": 3},
-        "buff_duration": 150,
-        "experience": 50,
-        "description": "An extremely spicy curry that grants fire resistance."
-    },
-    "Frost Lotus Tea": {
-        "ingredients": {"Frost Lotus": 2, "Water": 1, "Honey": 1},
-        "difficulty": "medium",
-        "fail_chance": 0.2,
-        "cook_time": 2,
-        "health_restore": 25,
-        "stamina_restore": 20,
-        "mana_restore": 40,
-        "buffs": {"ice_resistance": 4},
-        "buff_duration": 100,
-        "experience": 25,
-        "description": "A cooling tea that grants resistance to ice damage."
-    },
-    "Thunder Root Broth": {
-        "ingredients": {"Thunderroot": 2, "Meat": 1, "Water": 1, "Herbs": 1},
-        "difficulty": "hard",
-        "fail_chance": 0.35,
-        "cook_time": 4,
-        "health_restore": 40,
-        "stamina_restore": 35,
-        "buffs": {"lightning_resistance": 4, "agility": 2},
-        "buff_duration": 120,
-        "experience": 40,
-        "description": "A tingling broth that protects against lightning damage."
-    },
-    "Seasonal Harvest": {
-        "ingredients": {"Spring Tulips": 1, "Summer Melon": 1, "Autumn Squash": 1, "Winter Mint": 1},
-        "difficulty": "very hard",
-        "fail_chance": 0.45,
-        "cook_time": 6,
-        "health_restore": 80,
-        "stamina_restore": 80,
-        "mana_restore": 80,
-        "buffs": {"all_stats": 2},
-        "buff_duration": 200,
-        "experience": 60,
-        "description": "A rare dish combining all seasons' bounty, providing resistance to all elements."
-    }
-}
+COOKING_RECIPES = CONTENT.mapping("COOKING_RECIPES")
 
 # Failed cooking results
 FAILED_COOKING = {
@@ -8535,132 +7098,7 @@ CHEST_TIERS = {
 }
 
 # Artifact set bonuses
-ARTIFACT_SETS = {
-    "Wisdom of the Ancients": {
-        "pieces": ["Crown of Wisdom", "Timekeeper's Watch", "Band of Power"],
-        "bonuses": {
-            2: {"intelligence": 15, "cooldown_reduction": 0.1},
-            3: {"intelligence": 30, "cooldown_reduction": 0.2, "max_mana": 50}
-        }
-    },
-    "Eternal Flame": {
-        "pieces": ["Ember Pendant", "Phoenix Plume", "Ring of Fire"],
-        "bonuses": {
-            2: {"fire_damage": 0.15, "fire_resistance": 0.15},
-            3: {"fire_damage": 0.3, "fire_resistance": 0.3, "revival_chance": 0.5}
-        }
-    },
-    "Nature's Embrace": {
-        "pieces": ["Leaf Crown", "Eternal Bloom", "Vine Bracelet"],
-        "bonuses": {
-            2: {"health_regen": 10, "mana_regen": 5},
-            3: {"health_regen": 20, "mana_regen": 10, "nature_control": True}
-        }
-    },
-
-    # Weather Artifact Sets
-    "Storm Chaser": {
-        "pieces": ["Lightning Headpiece", "Thunder Pendant", "Cyclone Ring", "Storm Feather"],
-        "bonuses": {
-            2: {"lightning_damage": 0.15, "movement_speed": 0.1},
-            3: {"lightning_damage": 0.25, "dodge_chance": 0.15},
-            4: {"lightning_damage": 0.4, "weather_control": "Stormy", "special_ability": "Lightning Strike"}
-        },
-        "theme": "weather",
-        "weather": "Stormy",
-        "description": "Artifacts infused with the raw power of thunderstorms."
-    },
-    "Mist Walker": {
-        "pieces": ["Ghostly Crown", "Shrouded Pendant", "Ethereal Clock", "Fog Essence"],
-        "bonuses": {
-            2: {"stealth": 0.2, "ghost_vision": True},
-            3: {"critical_chance": 0.2, "phantom_step": True},
-            4: {"stealth": 0.5, "weather_control": "Foggy", "special_ability": "Phantom Form"}
-        },
-        "theme": "weather",
-        "weather": "Foggy",
-        "description": "Artifacts that allow one to slip between the veil of mist and reality."
-    },
-    "Winter's Grasp": {
-        "pieces": ["Frost Crown", "Blizzard Pendant", "Frozen Timepiece", "Ice Crystal"],
-        "bonuses": {
-            2: {"ice_damage": 0.15, "cold_resistance": 0.2},
-            3: {"ice_damage": 0.3, "freeze_chance": 0.15},
-            4: {"ice_damage": 0.4, "weather_control": "Snowy", "special_ability": "Freezing Aura"}
-        },
-        "theme": "weather",
-        "weather": "Snowy",
-        "description": "Artifacts that harness the biting cold of winter storms."
-    },
-
-    # Seasonal Artifact Sets
-    "Spring Renewal": {
-        "pieces": ["Blossom Crown", "Renewal Pendant", "Growth Timepiece", "Petal Essence"],
-        "bonuses": {
-            2: {"health_regen": 15, "nature_damage": 0.1},
-            3: {"health_regen": 30, "growth_aura": True},
-            4: {"health_regen": 50, "special_ability": "Rejuvenation", "season_bonus": "Spring"}
-        },
-        "theme": "seasonal",
-        "season": "Spring",
-        "description": "Artifacts that channel the rebirth and growth of springtime."
-    },
-    "Summer Solstice": {
-        "pieces": ["Solar Crown", "Blazing Pendant", "Sundial", "Flame Feather"],
-        "bonuses": {
-            2: {"fire_damage": 0.15, "light_damage": 0.1},
-            3: {"fire_damage": 0.25, "burn_chance": 0.2},
-            4: {"fire_damage": 0.4, "special_ability": "Solar Flare", "season_bonus": "Summer"}
-        },
-        "theme": "seasonal",
-        "season": "Summer",
-        "description": "Artifacts that harness the intense heat and light of the summer sun."
-    },
-    "Autumn Harvest": {
-        "pieces": ["Harvest Crown", "Amber Pendant", "Falling Leaf Clock", "Wheat Essence"],
-        "bonuses": {
-            2: {"earth_damage": 0.15, "resource_find": 0.2},
-            3: {"earth_damage": 0.25, "abundance_aura": True},
-            4: {"earth_damage": 0.4, "special_ability": "Cornucopia", "season_bonus": "Fall"}
-        },
-        "theme": "seasonal",
-        "season": "Fall",
-        "description": "Artifacts that embody the abundance and bounty of the harvest season."
-    },
-    "Winter Solstice": {
-        "pieces": ["Frost Crown", "Crystal Pendant", "Frozen Clock", "Snow Essence"],
-        "bonuses": {
-            2: {"ice_damage": 0.15, "cold_resistance": 0.2},
-            3: {"ice_damage": 0.25, "freeze_chance": 0.15},
-            4: {"ice_damage": 0.4, "special_ability": "Blizzard", "season_bonus": "Winter"}
-        },
-        "theme": "seasonal",
-        "season": "Winter",
-        "description": "Artifacts that contain the quiet power and preservation of winter."
-    },
-
-    # Farming Artifact Sets
-    "Bountiful Harvest": {
-        "pieces": ["Farmer's Hat", "Soil Pendant", "Growth Clock", "Seed Pouch"],
-        "bonuses": {
-            2: {"farming_yield": 0.15, "growth_speed": 0.1},
-            3: {"farming_yield": 0.25, "water_conservation": 0.2},
-            4: {"farming_yield": 0.5, "special_ability": "Perfect Harvest"}
-        },
-        "theme": "farming",
-        "description": "Artifacts that enhance one's connection to the soil and growing things."
-    },
-    "Weather Master": {
-        "pieces": ["Cloud Crown", "Rain Pendant", "Sun Dial", "Wind Feather"],
-        "bonuses": {
-            2: {"weather_resistance": 0.2, "weather_sense": True},
-            3: {"weather_resistance": 0.4, "weather_prediction": True},
-            4: {"weather_resistance": 0.6, "special_ability": "Weather Shift"}
-        },
-        "theme": "farming",
-        "description": "Artifacts that allow limited control over local weather patterns."
-    }
-}
+ARTIFACT_SETS = CONTENT.mapping("ARTIFACT_SETS")
 
 # Enhanced crafting recipes with elemental weapons and artifacts
 CRAFTING_RECIPES.update({
@@ -9422,6 +7860,78 @@ dungeons = [
     {"name": "Astral Nexus", "monsters": ["Celestial Titan", "Astral Entity"], "loot": ["Celestial Heart", "Titan's Crown", "Star Fragment"], "description": "The convergence point of all celestial bodies and cosmic energies.", "min_level": 46, "area_type": "dimensional"}
 ]
 
+# Lookup indexes over monsters, dungeons and shop items, keyed by case-folded name
+LEVEL_BAND_SIZE = 10
+
+def fold_name(name: str) -> str:
+    """Normalize a name for case-insensitive lookups"""
+    return name.casefold()
+
+def index_by_name(entries: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map case-folded names to entries, the first entry wins for duplicated names"""
+    index: Dict[str, Dict[str, Any]] = {}
+    for entry in entries:
+        index.setdefault(fold_name(entry["name"]), entry)
+    return index
+
+MONSTERS_BY_NAME = index_by_name(monsters)
+DUNGEONS_BY_NAME = index_by_name(dungeons)
+SHOP_ITEMS_BY_NAME = index_by_name(shop_items)
+
+MONSTERS_BY_AREA: Dict[str, List[Dict[str, Any]]] = {}
+MONSTERS_BY_LEVEL_BAND: Dict[int, List[Dict[str, Any]]] = {}
+MONSTERS_BY_WEATHER: Dict[str, List[Dict[str, Any]]] = {}
+MONSTERS_BY_SEASON: Dict[str, List[Dict[str, Any]]] = {}
+BOSS_MONSTERS: List[Dict[str, Any]] = []
+DUNGEONS_BY_MONSTER: Dict[str, List[Dict[str, Any]]] = {}
+DUNGEON_BOSSES: Dict[str, List[Dict[str, Any]]] = {}
+
+def build_content_indexes() -> None:
+    """Fill the secondary monster and dungeon indexes, keeping the order of the source lists"""
+    areas_by_monster: Dict[str, List[str]] = {}
+    for area, info in LOCATIONS.items():
+        for monster_name in info.get("monsters", []):
+            areas_by_monster.setdefault(monster_name, []).append(area)
+
+    for monster in monsters:
+        for area in areas_by_monster.get(monster["name"], []):
+            MONSTERS_BY_AREA.setdefault(area, []).append(monster)
+        MONSTERS_BY_LEVEL_BAND.setdefault(monster["level"] // LEVEL_BAND_SIZE, []).append(monster)
+        if "weather" in monster:
+            MONSTERS_BY_WEATHER.setdefault(monster["weather"], []).append(monster)
+        if "season" in monster:
+            MONSTERS_BY_SEASON.setdefault(monster["season"], []).append(monster)
+        if monster.get("boss", False):
+            BOSS_MONSTERS.append(monster)
+
+    for dungeon in dungeons:
+        bosses = []
+        for monster_name in dungeon["monsters"]:
+            DUNGEONS_BY_MONSTER.setdefault(fold_name(monster_name), []).append(dungeon)
+            monster = MONSTERS_BY_NAME.get(fold_name(monster_name))
+            if monster and monster.get("boss", False):
+                bosses.append(monster)
+        # Bosses belong to the dungeon that a name lookup returns
+        DUNGEON_BOSSES.setdefault(fold_name(dungeon["name"]), bosses)
+
+build_content_indexes()
+
+def find_monster(name: str) -> Optional[Dict[str, Any]]:
+    """Look up a monster by name, ignoring case"""
+    return MONSTERS_BY_NAME.get(fold_name(name))
+
+def find_dungeon(name: str) -> Optional[Dict[str, Any]]:
+    """Look up a dungeon by name, ignoring case"""
+    return DUNGEONS_BY_NAME.get(fold_name(name))
+
+def find_shop_item(name: str) -> Optional[Dict[str, Any]]:
+    """Look up a shop item by name, ignoring case"""
+    return SHOP_ITEMS_BY_NAME.get(fold_name(name))
+
+def monsters_in_level_band(level: int) -> List[Dict[str, Any]]:
+    """Monsters whose level falls in the same band of LEVEL_BAND_SIZE levels"""
+    return MONSTERS_BY_LEVEL_BAND.get(level // LEVEL_BAND_SIZE, [])
+
 
 # Note: All color constants are defined at the top of the file using colorama for cross-platform compatibility
 
@@ -9436,7 +7946,6 @@ def print_colored(text: str, color_code: str = "", end: str = "\n") -> None:
     """
     # Reset any previous colors
     sys.stdout.write("\033[0m")
-    sys.stdout.flush()
 
     # If text already contains color codes, extract them
     if ENDC in text and not color_code:
@@ -9452,7 +7961,6 @@ def print_colored(text: str, color_code: str = "", end: str = "\n") -> None:
         sys.stdout.write(text)
 
     sys.stdout.write(end)
-    sys.stdout.flush()
 
 def extract_color_and_text(text: str) -> Tuple[str, str]:
     """
@@ -9513,6 +8021,14 @@ def print_animated(text: str, color_code: str = "", delay: Optional[float] = Non
             color_code = extracted_color
             text = clean_text
 
+    # Outside cinematic mode the whole line is written at once
+    if TEXT_MODE != "cinematic":
+        if color_code:
+            sys.stdout.write("\033[0m" + color_code + text + ENDC + "\n")
+        else:
+            sys.stdout.write(text + "\n")
+        return
+
     # Ensure colors are displayed properly in all environments
     if color_code:
         # Some environments need this explicit reset
@@ -9533,7 +8049,7 @@ def print_animated(text: str, color_code: str = "", delay: Optional[float] = Non
     for char in text:
         sys.stdout.write(char)
         sys.stdout.flush()
-        time.sleep(actual_delay)
+        pause(actual_delay)
     if color_code:
         sys.stdout.write(ENDC)
     sys.stdout.write("\n")
@@ -9718,6 +8234,7 @@ def excavate_site() -> None:
     if site_name not in user_data["archaeology"]["discovered_sites"]:
         user_data["archaeology"]["discovered_sites"].append(site_name)
         print_colored(f"You've discovered a new archaeological site: {site_name}!", GREEN)
+        achievement_event("site_discovered")
 
     # Get player's excavation tool
     tools = user_data["archaeology"].get("tools", ["Basic Trowel"])
@@ -9762,7 +8279,7 @@ def excavate_site() -> None:
 
     # Start excavation process
     print_animated(f"Excavating at {site_name} with {current_tool}...", CYAN, delay=0.03)
-    time.sleep(1)  # Simulate excavation time
+    pause(1)  # Simulate excavation time
 
     # Calculate success chance based on difficulty, tool efficiency, and player skill
     difficulty_modifier = {
@@ -9880,7 +8397,7 @@ def analyze_artifacts() -> None:
 
             # Start analysis process
             print_animated(f"Analyzing {artifact_name}...", CYAN, delay=0.03)
-            time.sleep(1.5)  # Simulate analysis time
+            pause(1.5)  # Simulate analysis time
 
             # Mark as analyzed
             for artifact in artifacts:
@@ -9935,6 +8452,7 @@ def analyze_artifacts() -> None:
 
                 # Add knowledge to player's collection
                 user_data["archaeology"]["knowledge"].append(knowledge_name)
+                achievement_event("knowledge_gained")
 
                 # Integrate with other systems when gaining new knowledge
                 integrate_all_systems()
@@ -10160,6 +8678,8 @@ def check_artifact_set_completion(set_name: str) -> None:
             # Check for level up
             check_level_up()
 
+        achievement_event("artifact_set_completed")
+
 def view_museum() -> None:
     """View and manage your archaeological museum exhibits"""
     arch_data = user_data.get("archaeology", {})
@@ -10502,17 +9022,144 @@ def remove_museum_exhibit() -> None:
 
     wait_for_input()
 
+# Literature catalog: every book, scroll and note in LITERATURE_DATA, indexed once
+LITERATURE_TYPES = {"books": "Books", "scrolls": "Scrolls", "notes": "Notes"}
+LITERATURE_STATUS_KEYS = ("discovered", "owned", "read")
+# How much a search hit in each field counts towards a result's rank
+LITERATURE_FIELD_WEIGHTS = {"title": 3, "description": 2, "content": 1}
+WORD_PATTERN = re.compile(r"\w+")
+
+def literature_tokens(text: Any) -> List[str]:
+    """Case-folded words of a text field, content may be a list of sections"""
+    if isinstance(text, list):
+        return [token for section in text for token in literature_tokens(section)]
+    if not isinstance(text, str):
+        return []
+    return WORD_PATTERN.findall(text.casefold())
+
+class LiteratureCatalog:
+    """Indexes of the literature by location, type, category and rarity, plus a word index for search"""
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.entries: Dict[str, Tuple[str, str, str]] = {}  # item id -> (type, category, title)
+        self.by_location: Dict[str, List[str]] = {}
+        self.by_type: Dict[str, set] = {}
+        self.by_category: Dict[Tuple[str, str], set] = {}
+        self.by_rarity: Dict[str, set] = {}
+        # Word index, only built by the first full-text search
+        self.postings: Optional[Dict[str, Dict[str, int]]] = None  # word -> item id -> weight
+        self.vocabulary: List[str] = []
+
+        for key, item_type in LITERATURE_TYPES.items():
+            for category, titles in data.get(key, {}).items():
+                for title, item_data in titles.items():
+                    self.add(item_type, category, title, item_data)
+
+    def add(self, item_type: str, category: str, title: str, item_data: Dict[str, Any]) -> None:
+        item_id = f"{item_type}:{category}:{title}"
+        self.items[item_id] = item_data
+        self.entries[item_id] = (item_type, category, title)
+        self.by_location.setdefault(item_data.get("location", ""), []).append(item_id)
+        self.by_type.setdefault(item_type, set()).add(item_id)
+        self.by_category.setdefault((item_type, category), set()).add(item_id)
+        self.by_rarity.setdefault(item_data.get("rarity", "Common"), set()).add(item_id)
+
+    def build_word_index(self) -> None:
+        """Weighted postings of every word in title, description and content"""
+        self.postings = {}
+        for item_id, item_data in self.items.items():
+            token_weights: Dict[str, int] = {}
+            for field, weight in LITERATURE_FIELD_WEIGHTS.items():
+                for token in literature_tokens(item_data.get(field, "")):
+                    token_weights[token] = token_weights.get(token, 0) + weight
+            for token, weight in token_weights.items():
+                self.postings.setdefault(token, {})[item_id] = weight
+        # Sorted so every word starting with a prefix is one bisect away
+        self.vocabulary = sorted(self.postings)
+
+    def select(self, item_ids: Any, item_types: Optional[List[str]] = None,
+               rarities: Optional[List[str]] = None) -> set:
+        """The catalogued ids among item_ids, limited to the given types and rarities"""
+        selected = set(item_ids) & self.items.keys()
+        if item_types is not None:
+            selected = set().union(*(selected & self.by_type.get(item_type, set()) for item_type in item_types))
+        if rarities is not None:
+            selected = set().union(*(selected & self.by_rarity.get(rarity, set()) for rarity in rarities))
+        return selected
+
+    def words_starting_with(self, prefix: str) -> List[str]:
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        end = bisect.bisect_left(self.vocabulary, prefix + "\U0010ffff")
+        return self.vocabulary[start:end]
+
+    def search(self, query: str, within: Optional[set] = None) -> List[Tuple[str, int]]:
+        """Ids matching every word of the query (as a word prefix), best matches first"""
+        if self.postings is None:
+            self.build_word_index()
+        scores: Optional[Dict[str, int]] = None
+        for word in literature_tokens(query):
+            word_scores: Dict[str, int] = {}
+            for token in self.words_starting_with(word):
+                for item_id, weight in self.postings[token].items():
+                    if within is None or item_id in within:
+                        word_scores[item_id] = word_scores.get(item_id, 0) + weight
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {item_id: score + word_scores[item_id] for item_id, score in scores.items()
+                          if item_id in word_scores}
+            if not scores:
+                return []
+        return sorted((scores or {}).items(), key=lambda match: (-match[1], match[0]))
+
+LITERATURE_CATALOG: Optional[LiteratureCatalog] = None
+
+def literature_catalog() -> LiteratureCatalog:
+    """The literature catalog, built the first time it is needed"""
+    global LITERATURE_CATALOG
+    if LITERATURE_CATALOG is None:
+        LITERATURE_CATALOG = LiteratureCatalog(LITERATURE_DATA)
+    return LITERATURE_CATALOG
+
+def literature_state() -> Dict[str, Any]:
+    """The player's literature data, with discovered, owned and read kept as sets"""
+    if "literature" not in user_data:
+        user_data["literature"] = {}
+    lit_data = user_data["literature"]
+    for key in LITERATURE_STATUS_KEYS:
+        if not isinstance(lit_data.get(key), set):
+            # Saves store these as lists
+            lit_data[key] = set(lit_data.get(key) or [])
+    return lit_data
+
+def literature_records(item_ids: Any, owned: set, read: set) -> List[Dict[str, Any]]:
+    """Catalog entries of the given ids along with the player's read and owned status"""
+    catalog = literature_catalog()
+    records = []
+    for item_id in item_ids:
+        if item_id not in catalog.entries:
+            continue
+        item_type, category, title = catalog.entries[item_id]
+        item_data = catalog.items[item_id]
+        records.append({
+            "title": title,
+            "type": item_type,
+            "category": category,
+            "data": item_data,
+            "status": "Read" if item_id in read else "Unread",
+            "ownership": "Owned" if item_id in owned else "Discovered",
+            "item_id": item_id,
+            "rarity": item_data.get("rarity", "Common")
+        })
+    return records
+
 def literature_system() -> None:
     """Main function for the literature system - manage books, scrolls, and notes"""
     global user_data
 
     # Initialize literature data if it doesn't exist
-    if "literature" not in user_data:
-        user_data["literature"] = {
-            "discovered": [],
-            "read": [],
-            "owned": []
-        }
+    literature_state()
 
     print_header("Literature Collection")
     print_colored("Collect and read books, scrolls, and notes to gain knowledge and special abilities.", CYAN)
@@ -10548,10 +9195,10 @@ def literature_system() -> None:
 
 def view_literature_collection() -> None:
     """Display all books, scrolls, and notes the player has discovered or owns with enhanced features"""
-    lit_data = user_data.get("literature", {})
-    discovered = lit_data.get("discovered", [])
-    owned = lit_data.get("owned", [])
-    read = lit_data.get("read", [])
+    lit_data = literature_state()
+    discovered = lit_data["discovered"]
+    owned = lit_data["owned"]
+    read = lit_data["read"]
 
     if not discovered and not owned:
         print_colored("You haven't discovered any books, scrolls, or notes yet.", YELLOW)
@@ -10633,7 +9280,7 @@ def view_literature_collection() -> None:
 
         wait_for_input()
 
-def view_by_type(discovered: Dict[str, Any], owned: Dict[str, Any], read: Dict[str, Any]) -> None:
+def view_by_type(discovered: set, owned: set, read: set) -> None:
     """View literature collection sorted by type (Books, Scrolls, Notes)"""
     clear_screen()
     print_header("Literature by Type")
@@ -10671,43 +9318,10 @@ def view_by_type(discovered: Dict[str, Any], owned: Dict[str, Any], read: Dict[s
         for item_type in types_to_show:
             collection[item_type] = {}
 
-        # Process all items
-        all_items = list(set(list(discovered.keys()) + list(owned.keys())))
-        for item_id in all_items:
-            try:
-                item_type, category, title = item_id.split(":", 2)
-
-                if item_type not in types_to_show:
-                    continue
-
-                # Initialize category if needed
-                if category not in collection[item_type]:
-                    collection[item_type][category] = []
-
-                # Get item data
-                if item_type == "Books":
-                    item_data = LITERATURE_DATA["books"][category][title]
-                elif item_type == "Scrolls":
-                    item_data = LITERATURE_DATA["scrolls"][category][title]
-                elif item_type == "Notes":
-                    item_data = LITERATURE_DATA["notes"][category][title]
-                else:
-                    continue
-
-                # Add to collection with status
-                status = "Read" if item_id in read else "Unread"
-                ownership = "Owned" if item_id in owned else "Discovered"
-
-                collection[item_type][category].append({
-                    "title": title,
-                    "data": item_data,
-                    "status": status,
-                    "ownership": ownership,
-                    "item_id": item_id,
-                    "rarity": item_data.get("rarity", "Common")
-                })
-            except (ValueError, KeyError):
-                continue
+        # Process all items of the selected types
+        item_ids = literature_catalog().select(discovered | owned, item_types=types_to_show)
+        for item in literature_records(item_ids, owned, read):
+            collection[item["type"]].setdefault(item["category"], []).append(item)
 
         # Display collection
         clear_screen()
@@ -10768,7 +9382,7 @@ def view_by_type(discovered: Dict[str, Any], owned: Dict[str, Any], read: Dict[s
     except ValueError:
         print_colored("Please enter a number.", RED)
 
-def view_by_rarity(discovered: Dict[str, Any], owned: Dict[str, Any], read: Dict[str, Any]) -> None:
+def view_by_rarity(discovered: set, owned: set, read: set) -> None:
     """View literature collection sorted by rarity"""
     clear_screen()
     print_header("Literature by Rarity")
@@ -10810,42 +9424,10 @@ def view_by_rarity(discovered: Dict[str, Any], owned: Dict[str, Any], read: Dict
         # Collect items by rarity
         items_by_rarity = {rarity: [] for rarity in rarities_to_show}
 
-        # Process all items
-        all_items = list(set(list(discovered.keys()) + list(owned.keys())))
-        for item_id in all_items:
-            try:
-                item_type, category, title = item_id.split(":", 2)
-
-                # Get item data
-                if item_type == "Books":
-                    item_data = LITERATURE_DATA["books"][category][title]
-                elif item_type == "Scrolls":
-                    item_data = LITERATURE_DATA["scrolls"][category][title]
-                elif item_type == "Notes":
-                    item_data = LITERATURE_DATA["notes"][category][title]
-                else:
-                    continue
-
-                # Get rarity and check if it should be shown
-                rarity = item_data.get("rarity", "Common")
-                if rarity not in rarities_to_show:
-                    continue
-
-                # Add to collection
-                status = "Read" if item_id in read else "Unread"
-                ownership = "Owned" if item_id in owned else "Discovered"
-
-                items_by_rarity[rarity].append({
-                    "title": title,
-                    "type": item_type,
-                    "category": category,
-                    "data": item_data,
-                    "status": status,
-                    "ownership": ownership,
-                    "item_id": item_id
-                })
-            except (ValueError, KeyError):
-                continue
+        # Process all items of the selected rarities
+        item_ids = literature_catalog().select(discovered | owned, rarities=rarities_to_show)
+        for item in literature_records(item_ids, owned, read):
+            items_by_rarity[item["rarity"]].append(item)
 
         # Display items by rarity
         clear_screen()
@@ -10897,7 +9479,7 @@ def view_by_rarity(discovered: Dict[str, Any], owned: Dict[str, Any], read: Dict
     except ValueError:
         print_colored("Please enter a number.", RED)
 
-def view_by_status(discovered: Dict[str, Any], owned: Dict[str, Any], read: Dict[str, Any]) -> None:
+def view_by_status(discovered: set, owned: set, read: set) -> None:
     """View literature collection by reading status"""
     clear_screen()
     print_header("Literature by Reading Status")
@@ -10916,51 +9498,17 @@ def view_by_status(discovered: Dict[str, Any], owned: Dict[str, Any], read: Dict
             return
 
         # Filter items based on choice
-        filtered_items = []
-
-        # Process all items
-        all_items = list(set(list(discovered.keys()) + list(owned.keys())))
-        for item_id in all_items:
-            try:
-                item_type, category, title = item_id.split(":", 2)
-
-                # Get item data
-                if item_type == "Books":
-                    item_data = LITERATURE_DATA["books"][category][title]
-                elif item_type == "Scrolls":
-                    item_data = LITERATURE_DATA["scrolls"][category][title]
-                elif item_type == "Notes":
-                    item_data = LITERATURE_DATA["notes"][category][title]
-                else:
-                    continue
-
-                # Determine if this item should be included
-                status = "Read" if item_id in read else "Unread"
-                ownership = "Owned" if item_id in owned else "Discovered"
-
-                include_item = False
-                if choice == 1 and status == "Read":
-                    include_item = True
-                elif choice == 2 and status == "Unread" and ownership == "Owned":
-                    include_item = True
-                elif choice == 3 and ownership == "Owned":
-                    include_item = True
-                elif choice == 4 and ownership == "Discovered":
-                    include_item = True
-
-                if include_item:
-                    filtered_items.append({
-                        "title": title,
-                        "type": item_type,
-                        "category": category,
-                        "data": item_data,
-                        "status": status,
-                        "ownership": ownership,
-                        "item_id": item_id,
-                        "rarity": item_data.get("rarity", "Common")
-                    })
-            except (ValueError, KeyError):
-                continue
+        if choice == 1:
+            item_ids = read & (discovered | owned)
+        elif choice == 2:
+            item_ids = owned - read
+        elif choice == 3:
+            item_ids = owned
+        elif choice == 4:
+            item_ids = discovered - owned
+        else:
+            item_ids = set()
+        filtered_items = literature_records(item_ids, owned, read)
 
         # Display filtered items
         clear_screen()
@@ -11022,7 +9570,7 @@ def view_by_status(discovered: Dict[str, Any], owned: Dict[str, Any], read: Dict
     except ValueError:
         print_colored("Please enter a number.", RED)
 
-def view_recent_acquisitions(discovered: Dict[str, Any], owned: Dict[str, Any], read: Dict[str, Any]) -> None:
+def view_recent_acquisitions(discovered: set, owned: set, read: set) -> None:
     """View recently acquired literature (placeholder - would need timestamp data)"""
     clear_screen()
     print_header("Recent Acquisitions")
@@ -11034,34 +9582,7 @@ def view_recent_acquisitions(discovered: Dict[str, Any], owned: Dict[str, Any],
     # For now, just show the last 5 items alphabetically as a demonstration
 
     # Get owned items
-    owned_items = []
-    for item_id in owned:
-        try:
-            item_type, category, title = item_id.split(":", 2)
-
-            # Get item data
-            if item_type == "Books":
-                item_data = LITERATURE_DATA["books"][category][title]
-            elif item_type == "Scrolls":
-                item_data = LITERATURE_DATA["scrolls"][category][title]
-            elif item_type == "Notes":
-                item_data = LITERATURE_DATA["notes"][category][title]
-            else:
-                continue
-
-            status = "Read" if item_id in read else "Unread"
-
-            owned_items.append({
-                "title": title,
-                "type": item_type,
-                "category": category,
-                "data": item_data,
-                "status": status,
-                "item_id": item_id,
-                "rarity": item_data.get("rarity", "Common")
-            })
-        except (ValueError, KeyError):
-            continue
+    owned_items = literature_records(owned, owned, read)
 
     # Sort alphabetically and take the last 5 (as if they were most recent)
     owned_items.sort(key=lambda x: x["title"])
@@ -11091,7 +9612,7 @@ def view_recent_acquisitions(discovered: Dict[str, Any], owned: Dict[str, Any],
     else:
         print_colored("You don't own any literature yet.", YELLOW)
 
-def search_collection(discovered: Dict[str, Any], owned: Dict[str, Any], read: Dict[str, Any]) -> None:
+def search_collection(discovered: set, owned: set, read: set) -> None:
     """Search for specific literature in your collection"""
     clear_screen()
     print_header("Search Literature Collection")
@@ -11102,59 +9623,9 @@ def search_collection(discovered: Dict[str, Any], owned: Dict[str, Any], read: D
         print_colored("Search canceled.", YELLOW)
         return
 
-    # Search for items matching the term
-    matches = []
-
-    all_items = list(set(list(discovered.keys()) + list(owned.keys())))
-    for item_id in all_items:
-        try:
-            item_type, category, title = item_id.split(":", 2)
-
-            # Get item data
-            if item_type == "Books":
-                item_data = LITERATURE_DATA["books"][category][title]
-            elif item_type == "Scrolls":
-                item_data = LITERATURE_DATA["scrolls"][category][title]
-            elif item_type == "Notes":
-                item_data = LITERATURE_DATA["notes"][category][title]
-            else:
-                continue
-
-            # Check for matches in title, description, or content
-            found = False
-            title_text = item_data.get("title", "").lower()
-            description = item_data.get("description", "").lower()
-
-            if search_term in title_text or search_term in description:
-                found = True
-            else:
-                # Check content (which could be string or list)
-                content = item_data.get("content", "")
-                if isinstance(content, str) and search_term in content.lower():
-                    found = True
-                elif isinstance(content, list):
-                    # Check each section in the content
-                    for section in content:
-                        if isinstance(section, str) and search_term in section.lower():
-                            found = True
-                            break
-
-            if found:
-                status = "Read" if item_id in read else "Unread"
-                ownership = "Owned" if item_id in owned else "Discovered"
-
-                matches.append({
-                    "title": title,
-                    "type": item_type,
-                    "category": category,
-                    "data": item_data,
-                    "status": status,
-                    "ownership": ownership,
-                    "item_id": item_id,
-                    "rarity": item_data.get("rarity", "Common")
-                })
-        except (ValueError, KeyError):
-            continue
+    # Search the words of title, description and content, best matches first
+    ranked = literature_catalog().search(search_term, within=discovered | owned)
+    matches = literature_records([item_id for item_id, score in ranked], owned, read)
 
     # Display search results
     clear_screen()
@@ -11166,10 +9637,7 @@ def search_collection(discovered: Dict[str, Any], owned: Dict[str, Any], read: D
 
     print_colored(f"Found {len(matches)} items matching '{search_term}':", CYAN)
 
-    # Sort by type then title
-    matches.sort(key=lambda x: (x["type"], x["category"], x["title"]))
-
-    # Group by type for better organization
+    # Group by type for better organization, groups follow their best match
     results_by_type = {}
     for item in matches:
         item_type = item["type"]
@@ -11226,7 +9694,7 @@ def search_collection(discovered: Dict[str, Any], owned: Dict[str, Any], read: D
                     highlighted = snippet.replace(search_term, f"{CYAN}{search_term}{ENDC}")
                     print_colored(f"      \"{highlighted}\"", WHITE)
 
-def view_collection_stats(discovered: Dict[str, Any], owned: Dict[str, Any], read: Dict[str, Any]) -> None:
+def view_collection_stats(discovered: set, owned: set, read: set) -> None:
     """View detailed statistics about your literature collection"""
     clear_screen()
     print_header("Literature Collection Statistics")
@@ -11285,28 +9753,11 @@ def view_collection_stats(discovered: Dict[str, Any], owned: Dict[str, Any], rea
     rarities = {"Common": 0, "Uncommon": 0, "Rare": 0, "Epic": 0, "Legendary": 0}
     owned_by_rarity = {"Common": 0, "Uncommon": 0, "Rare": 0, "Epic": 0, "Legendary": 0}
 
-    for item_id in discovered:
-        try:
-            item_type, category, title = item_id.split(":", 2)
-
-            # Get item data
-            if item_type == "Books":
-                item_data = LITERATURE_DATA["books"][category][title]
-            elif item_type == "Scrolls":
-                item_data = LITERATURE_DATA["scrolls"][category][title]
-            elif item_type == "Notes":
-                item_data = LITERATURE_DATA["notes"][category][title]
-            else:
-                continue
-
-            rarity = item_data.get("rarity", "Common")
-            if rarity in rarities:
-                rarities[rarity] += 1
-
-                if item_id in owned:
-                    owned_by_rarity[rarity] += 1
-        except (ValueError, KeyError):
-            continue
+    catalog = literature_catalog()
+    for rarity in rarities:
+        discovered_of_rarity = catalog.select(discovered, rarities=[rarity])
+        rarities[rarity] = len(discovered_of_rarity)
+        owned_by_rarity[rarity] = len(discovered_of_rarity & owned)
 
     print_colored("\nCollection by Rarity", BLUE + BOLD)
     # Rarity colors
@@ -11347,8 +9798,8 @@ def view_collection_stats(discovered: Dict[str, Any], owned: Dict[str, Any], rea
 
 def read_literature() -> None:
     """Read a book, scroll, or note from your collection with enhanced user experience"""
-    lit_data = user_data.get("literature", {})
-    owned = lit_data.get("owned", [])
+    lit_data = literature_state()
+    owned = lit_data["owned"]
 
     if not owned:
         print_colored("You don't own any literature to read.", YELLOW)
@@ -11455,35 +9906,20 @@ def read_literature() -> None:
             print_colored("Please enter a valid number.", RED)
             wait_for_input()
 
-def get_readable_items(owned_items: Dict[str, Any]) -> List[Dict[str, Any]]:
+def get_readable_items(owned_items: set) -> List[Dict[str, Any]]:
     """Helper function to get all readable items with their data"""
-    lit_data = user_data.get("literature", {})
+    lit_data = literature_state()
     readable_items = []
 
-    for item_id in owned_items:
-        try:
-            item_type, category, title = item_id.split(":", 2)
-
-            # Get item data based on type
-            if item_type == "Books":
-                item_data = LITERATURE_DATA["books"][category][title]
-            elif item_type == "Scrolls":
-                item_data = LITERATURE_DATA["scrolls"][category][title]
-            elif item_type == "Notes":
-                item_data = LITERATURE_DATA["notes"][category][title]
-            else:
-                continue
-
-            readable_items.append({
-                "title": title,
-                "type": item_type,
-                "category": category,
-                "data": item_data,
-                "item_id": item_id,
-                "read": item_id in lit_data.get("read", [])
-            })
-        except (ValueError, KeyError):
-            continue
+    for item in literature_records(owned_items, owned_items, lit_data["read"]):
+        readable_items.append({
+            "title": item["title"],
+            "type": item["type"],
+            "category": item["category"],
+            "data": item["data"],
+            "item_id": item["item_id"],
+            "read": item["status"] == "Read"
+        })
 
     # Sort by read status (unread first), then by type and title
     readable_items.sort(key=lambda x: (x["read"], x["type"], x["title"]))
@@ -11522,13 +9958,12 @@ def choose_and_read_item(items: List[Dict[str, Any]], lit_data: Dict[str, Any])
             display_literature_content(selected["item_id"], selected["data"])
 
             # Mark as read if not already
-            if selected["item_id"] not in lit_data.get("read", []):
-                if "read" not in lit_data:
-                    lit_data["read"] = []
-                lit_data["read"].append(selected["item_id"])
+            if selected["item_id"] not in lit_data["read"]:
+                mark_book_read(lit_data, selected["item_id"])
 
                 # Apply effects when read for the first time
                 apply_literature_effect(selected["item_id"], selected["data"])
+                achievement_event("book_read")
         else:
             print_colored("Invalid choice.", RED)
     except ValueError:
@@ -11625,31 +10060,11 @@ def search_literature() -> None:
 
     # Check if searching for literature costs time
     print_colored(f"Searching for literature in {current_location}...", CYAN)
-    time.sleep(1)  # Simulate search time
+    pause(1)  # Simulate search time
 
     # Find available literature at this location
-    available_items = []
-
-    # Check books
-    for category in LITERATURE_DATA.get("books", {}):
-        for title, book_data in LITERATURE_DATA["books"][category].items():
-            if book_data.get("location", "") == current_location:
-                item_id = f"Books:{category}:{title}"
-                available_items.append((item_id, book_data))
-
-    # Check scrolls
-    for category in LITERATURE_DATA.get("scrolls", {}):
-        for title, scroll_data in LITERATURE_DATA["scrolls"][category].items():
-            if scroll_data.get("location", "") == current_location:
-                item_id = f"Scrolls:{category}:{title}"
-                available_items.append((item_id, scroll_data))
-
-    # Check notes
-    for category in LITERATURE_DATA.get("notes", {}):
-        for title, note_data in LITERATURE_DATA["notes"][category].items():
-            if note_data.get("location", "") == current_location:
-                item_id = f"Notes:{category}:{title}"
-                available_items.append((item_id, note_data))
+    catalog = literature_catalog()
+    available_items = [(item_id, catalog.items[item_id]) for item_id in catalog.by_location.get(current_location, [])]
 
     if not available_items:
         print_colored(f"You didn't find any literature in {current_location}.", YELLOW)
@@ -11660,9 +10075,9 @@ def search_literature() -> None:
     # Found some literature
     print_colored(f"You found {len(available_items)} items in {current_location}!", GREEN)
 
-    lit_data = user_data.get("literature", {})
-    discovered = lit_data.get("discovered", [])
-    owned = lit_data.get("owned", [])
+    lit_data = literature_state()
+    discovered = lit_data["discovered"]
+    owned = lit_data["owned"]
 
     for item_id, item_data in available_items:
         title = item_data.get("title", "Unknown")
@@ -11673,15 +10088,12 @@ def search_literature() -> None:
             # Option to collect the item
             print_colored(f"You've seen this before: {title}", YELLOW)
             if input(f"{YELLOW}Do you want to collect it? (y/n): {ENDC}").lower() == 'y':
-                if "owned" not in lit_data:
-                    lit_data["owned"] = []
-                lit_data["owned"].append(item_id)
+                lit_data["owned"].add(item_id)
                 print_colored(f"Added {title} to your collection!", GREEN)
+                achievement_event("book_acquired")
         else:
             # New discovery
-            if "discovered" not in lit_data:
-                lit_data["discovered"] = []
-            lit_data["discovered"].append(item_id)
+            lit_data["discovered"].add(item_id)
 
             rarity = item_data.get("rarity", "Common")
 
@@ -11691,10 +10103,9 @@ def search_literature() -> None:
 
             # Option to collect the item
             if input(f"{YELLOW}Do you want to collect it? (y/n): {ENDC}").lower() == 'y':
-                if "owned" not in lit_data:
-                    lit_data["owned"] = []
-                lit_data["owned"].append(item_id)
+                lit_data["owned"].add(item_id)
                 print_colored(f"Added {title} to your collection!", GREEN)
+                achievement_event("book_acquired")
 
     wait_for_input()
 
@@ -11889,30 +10300,19 @@ def view_literature_effects() -> None:
     print_header("Literature Effects")
 
     active_effects = []
-    for item_id in read:
-        try:
-            item_type, category, title = item_id.split(":", 2)
-
-            # Get item data
-            if item_type == "Books":
-                item_data = LITERATURE_DATA["books"][category][title]
-            elif item_type == "Scrolls":
-                item_data = LITERATURE_DATA["scrolls"][category][title]
-            elif item_type == "Notes":
-                item_data = LITERATURE_DATA["notes"][category][title]
-            else:
-                continue
-
-            # Get effect data
-            effect = item_data.get("effect", {})
-            if effect:
-                active_effects.append({
-                    "title": item_data.get("title", "Unknown"),
-                    "type": item_type[:-1],  # Remove 's' from end (Books -> Book)
-                    "effect": effect
-                })
-        except (ValueError, KeyError):
-            continue
+    catalog = literature_catalog()
+    for item_id in catalog.select(read):
+        item_type = catalog.entries[item_id][0]
+        item_data = catalog.items[item_id]
+
+        # Get effect data
+        effect = item_data.get("effect", {})
+        if effect:
+            active_effects.append({
+                "title": item_data.get("title", "Unknown"),
+                "type": item_type[:-1],  # Remove 's' from end (Books -> Book)
+                "effect": effect
+            })
 
     if not active_effects:
         print_colored("None of the literature you've read has granted any special effects.", YELLOW)
@@ -12009,6 +10409,7 @@ PROGRESS
 
 CRAFTING
 /craft             - Recipes calculator
+/craftplan <item>  - How many of an item you can craft, and the crafts it takes
 /dismantle         - Dismantling calculator
 /invcalc           - Inventory calculator
 /drops             - Monster drops
@@ -12043,6 +10444,7 @@ MONSTERS
 /dailymob          - Today's monster
 /fight [monster]   - Fight a monster
 /dungeon [name]    - Enter a dungeon
+/dungeon_auto [name] - Enter a dungeon, auto-resolving battles
 /dungeon_list      - List all dungeons
 /bestiary          - List all monsters
 
@@ -12076,6 +10478,7 @@ MISC
 /equip [item]      - Equip an item
 /stats             - Show your stats
 /support           - Support information
+/perf              - Command latency report (/perf json, /perf reset)
 /save              - Save game
 /load              - Load game
 /quests            - View and accept quests
@@ -12090,6 +10493,8 @@ SETTINGS
 /gather            - Gather materials
 /materials         - Show materials
 /travel            - Travel to area
+/sailing           - Buy, repair and sail ships
+/route <port>      - Sail the fastest route to a port
 """
 
     for line in help_text.strip().split("\n"):
@@ -12850,7 +11255,7 @@ def dimensions_menu() -> None:
                 print_colored(f"You have discovered the {selected_dimension}!", OKGREEN)
 
             print_colored(f"Traveling to the {selected_dimension}...", CYAN)
-            time.sleep(1)
+            pause(1)
             print_colored(f"You have arrived in the {selected_dimension}!", OKGREEN)
 
             # Describe the dimension
@@ -13411,11 +11816,11 @@ def view_structure_info() -> None:
                     view_structure_info()  # Return to category selection
                 else:
                     print_colored("Invalid choice.", FAIL)
-                    time.sleep(1)
+                    pause(1)
                     view_structure_info()  # Try again
             except ValueError:
                 print_colored("Please enter a valid number.", FAIL)
-                time.sleep(1)
+                pause(1)
                 view_structure_info()  # Try again
         else:
             print_colored("Invalid choice.", FAIL)
@@ -13583,13 +11988,13 @@ def endless_tower() -> None:
     print_colored("Each floor contains stronger enemies than the last.", YELLOW)
     print_colored("How high can you climb?", CYAN)
 
-    options = ["Climb higher", "Claim rewards", "Exit"]
+    options = ["Climb higher", "Claim rewards", "Exit", "Climb higher (auto-resolve battle)"]
     for idx, option in enumerate(options, 1):
         print(f"{idx}. {option}")
 
     choice = input("\nSelect an option: ")
 
-    if choice == "1":
+    if choice in ("1", "4"):
         # Climb to next floor
         next_floor = current_floor + 1
         print_colored(f"Climbing to floor {next_floor}...", CYAN)
@@ -13606,10 +12011,14 @@ def endless_tower() -> None:
         print_colored(f"You encounter {monster['name']}!", YELLOW)
 
         # Simulate fight
-        fight(monster)
+        if choice == "4":
+            won = auto_fight(monster) == "victory"
+        else:
+            fight(monster)
+            won = user_data["health"] > 0
 
         # If player won, advance to next floor
-        if user_data["health"] > 0:
+        if won:
             user_data["endless_tower_floor"] = next_floor
             print_colored(f"You've reached floor {next_floor}!", OKGREEN)
 
@@ -13761,19 +12170,158 @@ def dev_command_handler(cmd: str) -> None:
         print(f"Error in dev command: {e}")
         print("Use /help_dev to see command usage")
 
-# Weather and Seasons System
-def update_weather() -> None:
-    """Function to update the weather based on current game time"""
-    current_day = game_state["current_day"]
+WHEEL_SLOT_BITS = 6
+WHEEL_LEVELS = 4
 
-    # Check if it's time to change the weather
-    if current_day - game_state["last_weather_change"] >= game_state["weather_duration"]:
-        dimension = user_data.get("current_dimension", "Overworld")
+class TimingWheel:
+    """Hierarchical timing wheel of callbacks keyed on game ticks
 
-        # Different weather system for different dimensions
-        if dimension != "Overworld" and dimension in DIMENSION_WEATHERS:
-            # Special dimension-specific weather
-            special_weather = random.choice(DIMENSION_WEATHERS[dimension])
+    Level 0 has one slot per tick, every higher level one slot per whole turn
+    of the level below (64, 4096 and 262144 ticks), and an event lives at the
+    lowest level whose slot still holds it. When the clock enters a higher
+    slot its events cascade down. Occupancy bitmasks per level let advance()
+    jump straight to the next occupied slot, so its cost follows the events
+    that come due, not the ticks that pass.
+    Scheduling a key again replaces its pending event.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0
+        self.slots: List[List[List[List[Any]]]] = [[[] for _ in range(1 << WHEEL_SLOT_BITS)]
+                                                   for _ in range(WHEEL_LEVELS)]
+        # Bit n of occupied[level] is set while slots[level][n] may hold events
+        self.occupied = [0] * WHEEL_LEVELS
+        self.overflow: List[List[Any]] = []
+        self.due: List[List[Any]] = []
+        self.events: Dict[Any, List[Any]] = {}
+        self.sequence = 0
+
+    def place(self, event: List[Any], now: int) -> None:
+        """File an event in the lowest slot that holds its tick, counted from now"""
+        tick = event[0]
+        for level in range(WHEEL_LEVELS):
+            shift = WHEEL_SLOT_BITS * (level + 1)
+            if tick >> shift == now >> shift:
+                slot = (tick >> (WHEEL_SLOT_BITS * level)) & ((1 << WHEEL_SLOT_BITS) - 1)
+                self.slots[level][slot].append(event)
+                self.occupied[level] |= 1 << slot
+                return
+        self.overflow.append(event)
+
+    def schedule(self, key: Any, tick: int, callback: Callable[[], None]) -> None:
+        """Run callback once the clock reaches tick, replacing any event of the same key"""
+        self.sequence += 1
+        event = [tick, self.sequence, key, callback]
+        self.events[key] = event
+        if tick <= self.now:
+            self.due.append(event)
+        else:
+            self.place(event, self.now)
+
+    def cancel(self, key: Any) -> None:
+        """Drop the pending event of a key, its slot entry is skipped when reached"""
+        self.events.pop(key, None)
+
+    def due_tick(self, key: Any) -> Optional[int]:
+        """Tick at which the event of a key fires, None if nothing is pending"""
+        event = self.events.get(key)
+        return event[0] if event else None
+
+    def clear(self) -> None:
+        """Drop every pending event, keeping the clock"""
+        self.events.clear()
+
+    def fire(self, events: List[Any]) -> None:
+        """Run the still-pending events of a slot in the order they were scheduled"""
+        for event in sorted(events, key=lambda entry: entry[1]):
+            if self.events.get(event[2]) is event:
+                del self.events[event[2]]
+                event[3]()
+
+    def cascade(self, start: int) -> None:
+        """Move the events of the higher slots the clock enters at start down the levels"""
+        top = 1
+        while top < WHEEL_LEVELS and start % (1 << (WHEEL_SLOT_BITS * (top + 1))) == 0:
+            top += 1
+        if top == WHEEL_LEVELS:
+            moved, self.overflow = self.overflow, []
+            for event in moved:
+                self.place(event, start)
+            top -= 1
+        for level in range(top, 0, -1):
+            slot = (start >> (WHEEL_SLOT_BITS * level)) & ((1 << WHEEL_SLOT_BITS) - 1)
+            moved, self.slots[level][slot] = self.slots[level][slot], []
+            self.occupied[level] &= ~(1 << slot)
+            for event in moved:
+                if self.events.get(event[2]) is event:
+                    self.place(event, start)
+
+    def next_cascade(self, start: int) -> Optional[int]:
+        """First tick from start on at which a higher slot or the overflow comes down, None if none will"""
+        mask = (1 << WHEEL_SLOT_BITS) - 1
+        now = start - 1
+        # Slots of a level before the clock's own are spent, and a lower level's slots come first
+        for level in range(1, WHEEL_LEVELS):
+            shift = WHEEL_SLOT_BITS * level
+            current = (now >> shift) & mask
+            ahead = self.occupied[level] >> (current + 1) << (current + 1)
+            if ahead:
+                slot = (ahead & -ahead).bit_length() - 1
+                return (now >> (shift + WHEEL_SLOT_BITS) << (shift + WHEEL_SLOT_BITS)) | (slot << shift)
+        if self.overflow:
+            span = WHEEL_SLOT_BITS * WHEEL_LEVELS
+            return ((now >> span) + 1) << span
+        return None
+
+    def advance(self, target: int) -> None:
+        """Move the clock to target, running every event due on the way in tick order"""
+        mask = (1 << WHEEL_SLOT_BITS) - 1
+        while self.due:
+            late, self.due = self.due, []
+            self.fire(late)
+        while self.now < target:
+            start = self.now + 1
+            if start & mask == 0:
+                # Level 0 is spent, skip the empty blocks up to the next slot that holds events
+                start = self.next_cascade(start)
+                if start is None or start > target:
+                    self.now = target
+                    break
+                self.cascade(start)
+            end = min(target, start | mask)
+            while start <= end:
+                pending = self.occupied[0] >> (start & mask) << (start & mask)
+                pending &= (1 << ((end & mask) + 1)) - 1
+                if not pending:
+                    break
+                slot = (pending & -pending).bit_length() - 1
+                events, self.slots[0][slot] = self.slots[0][slot], []
+                self.occupied[0] &= ~(1 << slot)
+                self.now = (start & ~mask) | slot
+                self.fire(events)
+                start = self.now + 1
+                while self.due:
+                    late, self.due = self.due, []
+                    self.fire(late)
+            self.now = end
+
+# Weather, season changes and crop growth are scheduled on the game clock instead of polled per command
+WORLD_EVENTS = TimingWheel()
+CROP_EVENTS = TimingWheel()
+
+# Weather and Seasons System
+def update_weather() -> None:
+    """Change the weather once its duration has run out and schedule the next change"""
+    current_day = game_state["current_day"]
+
+    # Check if it's time to change the weather
+    if current_day - game_state["last_weather_change"] >= game_state["weather_duration"]:
+        dimension = user_data.get("current_dimension", "Overworld")
+
+        # Different weather system for different dimensions
+        if dimension != "Overworld" and dimension in DIMENSION_WEATHERS:
+            # Special dimension-specific weather
+            special_weather = random.choice(DIMENSION_WEATHERS[dimension])
             game_state["current_weather"] = special_weather["name"]
             game_state["current_weather_description"] = special_weather["description"]
             game_state["current_weather_color"] = special_weather["color"]
@@ -13801,10 +12349,18 @@ def update_weather() -> None:
         print_colored(f"The weather has changed to: {get_weather_name()}", game_state["current_weather_color"])
         print_colored(f"{get_weather_description()}", LIGHTGRAY)
 
+        # Growth rates changed with the weather
+        schedule_crop_events()
+
+    next_change = game_state["last_weather_change"] + game_state["weather_duration"]
+    WORLD_EVENTS.schedule("weather", next_change * TICKS_PER_DAY, update_weather)
+
 def update_season() -> None:
-    """Function to update the season based on current game time"""
+    """Change the season when the game day enters a new one and schedule the next change"""
     current_day = game_state["current_day"]
     days_per_season = game_state["days_per_season"]
+    next_season_day = (current_day // days_per_season + 1) * days_per_season
+    WORLD_EVENTS.schedule("season", next_season_day * TICKS_PER_DAY, update_season)
 
     # Calculate which season it should be
     season_index = (current_day // days_per_season) % len(SEASONS)
@@ -13813,7 +12369,6 @@ def update_season() -> None:
     # Check if season changed
     if new_season != game_state["current_season"]:
         game_state["current_season"] = new_season
-        game_state["season_day"] = 1
 
         # Notify player
         print_colored(f"The season has changed to {new_season}!", YELLOW)
@@ -13827,8 +12382,7 @@ def update_season() -> None:
             print_colored("Leaves change color and the air becomes crisp. Harvest season begins.", YELLOW)
         elif new_season == "Winter":
             print_colored("A chill settles over the land. Few crops will grow in this cold.", CYAN)
-    else:
-        game_state["season_day"] += 1
+        schedule_crop_events()
 
 def get_weather_name() -> str:
     """Get the current weather name with proper formatting"""
@@ -13881,8 +12435,8 @@ def show_season() -> None:
     print_header("Current Season")
 
     season = game_state["current_season"]
-    day = game_state["season_day"]
     days_total = game_state["days_per_season"]
+    day = game_state["current_day"] % days_total + 1
 
     season_colors = {
         "Spring": GREEN,
@@ -13912,8 +12466,139 @@ def show_season() -> None:
     print_colored("Some crops will only grow during certain seasons.", YELLOW)
     print_colored("Check the crop information before planting!", YELLOW)
 
+# Command latency statistics shown by /perf
+PERF_SAMPLE_LIMIT = 5000
+PERF_OFFENDER_LIMIT = 10
+PERF_HISTOGRAM_MS = [1, 5, 10, 50, 100, 500, 1000, 5000]
+PERF_STATS: Dict[str, Any] = {
+    "commands": {},      # base command -> recent latencies in seconds
+    "phases": {},        # farm tick, integrate_all_systems, auto_save -> durations
+    "auto_saves": {},    # what triggered each auto-save -> count
+    "offenders": [],     # slowest (seconds, full command) seen this session
+}
+
+def record_latency(group: str, key: str, seconds: float) -> None:
+    """Add one timing sample to the /perf statistics"""
+    samples = PERF_STATS[group].get(key)
+    if samples is None:
+        samples = PERF_STATS[group][key] = deque(maxlen=PERF_SAMPLE_LIMIT)
+    samples.append(seconds)
+
+def timed_phase(name: str) -> Any:
+    """Decorator recording how long a game subsystem runs under /perf phases"""
+    def decorator(func: Any) -> Any:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_latency("phases", name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+def latency_summary(samples: Any) -> Dict[str, float]:
+    """Count, total, p50, p95 and max of a list of latencies in seconds"""
+    ordered = sorted(samples)
+    count = len(ordered)
+    return {
+        "count": count,
+        "total": sum(ordered),
+        "p50": ordered[max(0, math.ceil(count * 0.50) - 1)],
+        "p95": ordered[max(0, math.ceil(count * 0.95) - 1)],
+        "max": ordered[-1],
+    }
+
+def latency_histogram(samples: Any) -> Dict[str, int]:
+    """Bucket latencies by the PERF_HISTOGRAM_MS upper bounds"""
+    buckets = {f"<{bound}ms": 0 for bound in PERF_HISTOGRAM_MS}
+    buckets[f">={PERF_HISTOGRAM_MS[-1]}ms"] = 0
+    for seconds in samples:
+        ms = seconds * 1000
+        for bound in PERF_HISTOGRAM_MS:
+            if ms < bound:
+                buckets[f"<{bound}ms"] += 1
+                break
+        else:
+            buckets[f">={PERF_HISTOGRAM_MS[-1]}ms"] += 1
+    return buckets
+
+def build_perf_report() -> Dict[str, Any]:
+    """Collect the /perf statistics into a JSON friendly report"""
+    all_samples = [t for samples in PERF_STATS["commands"].values() for t in samples]
+    return {
+        "generated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "commands": {cmd: dict(latency_summary(samples), histogram=latency_histogram(samples))
+                     for cmd, samples in PERF_STATS["commands"].items()},
+        "phases": {name: latency_summary(samples) for name, samples in PERF_STATS["phases"].items()},
+        "auto_saves": dict(PERF_STATS["auto_saves"]),
+        "histogram": latency_histogram(all_samples),
+        "offenders": [{"command": cmd, "time": seconds} for seconds, cmd in PERF_STATS["offenders"]],
+    }
+
+def show_perf_report(option: str = "") -> None:
+    """Show p50/p95/max latency per command, the slowest commands and auto-save counts"""
+    option = option.strip()
+    if option == "reset":
+        for group in ("commands", "phases", "auto_saves"):
+            PERF_STATS[group].clear()
+        PERF_STATS["offenders"].clear()
+        print_colored("Performance statistics cleared.", GREEN)
+        return
+
+    report = build_perf_report()
+    if option == "json":
+        path = os.path.join(get_save_directory(), "perf_report.json")
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        print_colored(f"Performance report written to {path}", GREEN)
+        return
+
+    print_header("Command Performance")
+    if not report["commands"]:
+        print("No commands timed yet.")
+        return
+
+    print(f"{CYAN}{'Command':<20}{'Count':>7}{'p50 ms':>10}{'p95 ms':>10}{'Max ms':>10}{ENDC}")
+    ranked = sorted(report["commands"].items(), key=lambda item: item[1]["total"], reverse=True)
+    for cmd, stats in ranked:
+        print(f"{cmd[:20]:<20}{stats['count']:>7}{stats['p50'] * 1000:>10.2f}"
+              f"{stats['p95'] * 1000:>10.2f}{stats['max'] * 1000:>10.2f}")
+
+    if report["phases"]:
+        print(f"\n{CYAN}{'Subsystem':<27}{'p50 ms':>10}{'p95 ms':>10}{'Max ms':>10}{ENDC}")
+        for name, stats in sorted(report["phases"].items()):
+            label = f"{name} (x{stats['count']})"
+            print(f"{label[:27]:<27}{stats['p50'] * 1000:>10.2f}"
+                  f"{stats['p95'] * 1000:>10.2f}{stats['max'] * 1000:>10.2f}")
+
+    print(f"\n{YELLOW}Top offenders:{ENDC}")
+    for entry in report["offenders"]:
+        print(f"  {entry['time'] * 1000:9.2f} ms  {entry['command']}")
+
+    if report["auto_saves"]:
+        triggers = ", ".join(f"{trigger} x{count}" for trigger, count in report["auto_saves"].items())
+        print(f"\n{YELLOW}Auto-saves:{ENDC} {triggers}")
+    print("\nUse '/perf json' to export the report or '/perf reset' to start over.")
+
 def handle_command(cmd: str) -> None:
-    allowed_commands_without_character = {"/new", "/load", "/help", "/exit", "/prefix", "/save"}
+    """Run a command, recording its latency without the time spent waiting for input"""
+    start = time.perf_counter()
+    waited_before = input_wait_time
+    try:
+        dispatch_command(cmd)
+    finally:
+        elapsed = time.perf_counter() - start - (input_wait_time - waited_before)
+        words = cmd.split()
+        record_latency("commands", words[0] if words else "<empty>", elapsed)
+        offenders = PERF_STATS["offenders"]
+        if len(offenders) < PERF_OFFENDER_LIMIT or elapsed > offenders[-1][0]:
+            offenders.append((elapsed, cmd))
+            offenders.sort(key=lambda entry: entry[0], reverse=True)
+            del offenders[PERF_OFFENDER_LIMIT:]
+
+def dispatch_command(cmd: str) -> None:
+    allowed_commands_without_character = {"/new", "/load", "/help", "/exit", "/prefix", "/save", "/perf"}
 
     # Add new commands for our enhanced features
     allowed_commands_without_character.add("/about")
@@ -13953,60 +12638,7 @@ def handle_command(cmd: str) -> None:
     base_command = cmd.split()[0].lower()
     if base_command not in NO_TICK_COMMANDS:
         if base_command in TICK_COMMANDS:
-            ticks = random.randint(*TICK_COMMANDS[base_command])
-            game_state["current_tick"] += ticks
-            game_state["current_day"] = game_state["current_tick"] // TICKS_PER_DAY
-
-            # Update plant growth based on elapsed ticks, weather, and season
-            if "farming" in user_data:
-                # Update weather and season based on current game time
-                update_weather()
-                update_season()
-
-                current_weather = game_state["current_weather"]
-                current_season = game_state["current_season"]
-                weather_modifier = game_state.get("current_weather_crop_modifier", 1.0)
-
-                for plot in user_data["farming"]["growth"]:
-                    crop_name = user_data["farming"]["plots"].get(plot)
-                    if not crop_name:
-                        continue
-
-                    # Base growth ticks
-                    growth_ticks = ticks
-                    crop_data = CROPS.get(crop_name, {})
-
-                    # Season modifier - check if current season is optimal for this crop
-                    season_modifier = 1.0
-                    crop_seasons = crop_data.get("seasons", [])
-
-                    # All-season crops (mainly dimension-specific)
-                    if "All" in crop_seasons:
-                        season_modifier = 1.2  # Bonus for all-season crops
-                    elif current_season in crop_seasons:
-                        season_modifier = 1.2  # Good season for this crop
-                    else:
-                        season_modifier = 0.5  # Bad season - grows slower
-
-                    # Weather modifier - check if current weather is optimal/weak for this crop
-                    crop_optimal_weather = crop_data.get("optimal_weather", [])
-                    crop_weak_weather = crop_data.get("weak_weather", [])
-
-                    additional_weather_modifier = 1.0
-                    if current_weather in crop_optimal_weather:
-                        additional_weather_modifier = 1.3  # This weather is perfect for the crop
-                    elif current_weather in crop_weak_weather:
-                        additional_weather_modifier = 0.7  # This weather harms the crop
-
-                    # Apply all modifiers
-                    total_modifier = weather_modifier * season_modifier * additional_weather_modifier
-
-                    # Apply modified growth ticks (convert to integer)
-                    modified_ticks = int(growth_ticks * total_modifier)
-                    if modified_ticks < 1:
-                        modified_ticks = 1  # Ensure at least some growth
-
-                    user_data["farming"]["growth"][plot] += modified_ticks
+            advance_game_time(random.randint(*TICK_COMMANDS[base_command]))
 
     elif cmd.startswith("/talk"):
         try:
@@ -14060,6 +12692,9 @@ def handle_command(cmd: str) -> None:
         "/quests": show_quests,
         "/gather": lambda: gather_materials(user_data["current_area"]),
         "/craft": craft_item,
+        "/craftplan": lambda: plan_crafting(""),
+        "/sailing": lambda: manage_sailing(user_data),
+        "/route": lambda: sail_route(user_data, ""),
         "/materials": print_materials,
         "/travel": travel_to_area,
         "/new": create_character,
@@ -14138,6 +12773,7 @@ def handle_command(cmd: str) -> None:
         # Weather and season commands
         "/weather": show_weather,
         "/season": show_season,
+        "/perf": show_perf_report,
         "/c": create_character,
         "/g": guild_guide,
         "/d": dungeon_guides,
@@ -14157,6 +12793,8 @@ def handle_command(cmd: str) -> None:
         equip_item(cmd.split(" ", 1)[1])
     elif cmd.startswith("/dungeon "):
         enter_dungeon(cmd.split(" ", 1)[1])
+    elif cmd.startswith("/dungeon_auto "):
+        enter_dungeon(cmd.split(" ", 1)[1], auto_resolve=True)
     elif cmd.startswith("/guild_join "):
         guild_join(cmd.split(" ", 1)[1])
     elif cmd.startswith("/guild_leave"):
@@ -14188,6 +12826,12 @@ def handle_command(cmd: str) -> None:
         endless_tower()
     elif cmd.startswith("/inspect "):
         inspect_item(cmd.split(" ", 1)[1])
+    elif cmd.startswith("/craftplan "):
+        plan_crafting(cmd.split(" ", 1)[1])
+    elif cmd.startswith("/route "):
+        sail_route(user_data, cmd.split(" ", 1)[1])
+    elif cmd.startswith("/perf "):
+        show_perf_report(cmd.split(" ", 1)[1])
     elif cmd in commands:
         commands[cmd]()
     else:
@@ -14286,6 +12930,7 @@ def command_prefix() -> None:
 
 def exit_game() -> None:
     print_animated("Exiting game...", BLUE, 0.01)
+    SAVE_WRITER.flush()
     print_animated("Goodbye!", BLUE, 0.01)
     sys.exit()
 
@@ -14324,8 +12969,7 @@ def show_mobs(area: Optional[str] = None) -> None:
         print(f"Invalid area: {target_area}")
         return
 
-    area_monster_names = LOCATIONS[target_area].get("monsters", [])
-    area_monsters = [m for m in monsters if m["name"] in area_monster_names]
+    area_monsters = MONSTERS_BY_AREA.get(target_area, [])
 
     if area_monsters:
         print(f"Monsters in {target_area}:")
@@ -14338,6 +12982,473 @@ def show_mobs(area: Optional[str] = None) -> None:
         print(f"No monsters found in {target_area}")
 
 # Function to handle a fight with a monster (used in dungeons)
+# Headless combat kernel. The combat_* functions resolve a battle on a
+# CombatState without any I/O: they only update the state and record events,
+# which fight() turns into text. resolve_battle() plays a whole battle with an
+# automatic policy for auto-resolved fights and balance sweeps.
+COMBAT_ITEMS = ["Healing Potion", "Mana Potion", "Strength Potion", "Defense Potion", "Speed Potion", "Bomb"]
+MAX_COMBO = 3  # Can build up to 3-hit combos
+CRIT_MULTIPLIERS = {"Rogue": 2.5, "Archer": 2.2}
+AUTO_RESOLVE_TURN_LIMIT = 200
+AUTO_HEAL_THRESHOLD = 0.3
+
+class CombatState:
+    """One battle between the player and a monster, advanced by the combat_* functions"""
+
+    def __init__(self, monster: Dict, player: Dict[str, Any], pet: Optional[Dict] = None,
+                 party: Optional[Tuple[Dict, Dict[str, int]]] = None, rng: Any = random,
+                 record_events: bool = True) -> None:
+        self.monster = monster
+        self.player = player
+        self.pet = pet
+        self.party = party
+        self.rng = rng
+        self.record_events = record_events
+        self.events: List[Tuple[str, Dict[str, Any]]] = []
+
+        self.player_health = player["health"]
+        self.monster_health = monster["health"]
+        self.monster_element = monster.get("element", "Normal")
+        self.items = list(player["items"])
+        self.items_used: List[str] = []
+        self.turn = 0
+
+        self.combo_counter = 0
+        self.combat_log: List[str] = []  # Track recent actions for combo detection
+        self.stunned = False
+        self.monster_stunned = False
+        self.player_status_effects: List[Dict[str, Any]] = []  # Track temporary buffs/debuffs
+        self.monster_status_effects: List[Dict[str, Any]] = []
+
+        # Pet combat variables
+        self.pet_shield_active = False
+        self.pet_shield_duration = 0
+        self.pet_dodge_bonus = 0
+
+    def emit(self, kind: str, **data: Any) -> None:
+        """Record something that happened for the caller to show"""
+        if self.record_events:
+            self.events.append((kind, data))
+
+    def take_events(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Events recorded since the last call"""
+        events, self.events = self.events, []
+        return events
+
+    def status_bonus(self, stat: str) -> int:
+        """Total of a stat across the player's active status effects"""
+        return sum(effect["effect"][stat] for effect in self.player_status_effects if stat in effect["effect"])
+
+    def heal_player(self, amount: int) -> None:
+        self.player_health = min(self.player_health + amount, self.player["max_health"])
+
+def combat_player() -> Dict[str, Any]:
+    """Snapshot of the player's combat stats for a CombatState"""
+    equipped = user_data.get("equipped", {})
+    return {
+        "class": user_data["class"],
+        "level": user_data.get("level", 1),
+        "health": user_data["health"],
+        "max_health": user_data["max_health"],
+        "attack": user_data.get("attack", 10),
+        "defense": user_data.get("defense", 5),
+        "speed": user_data.get("speed", 5),
+        "intellect": user_data.get("intellect", 0),
+        "element": user_data.get("element", "Normal"),
+        "weapon_bonus": (equipped.get("weapon") or {}).get("effect", 0),
+        "armor_bonus": (equipped.get("armor") or {}).get("effect", 0),
+        "skills": list(user_data.get("skills", [])),
+        "items": [item for item in user_data["inventory"] if item in COMBAT_ITEMS],
+    }
+
+def combat_player_template(class_name: str, level: int, items: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Combat stats of a new character of a class grown to a level, for balance sweeps"""
+    stats = CHARACTER_CLASSES.get(class_name, {})
+    max_health = INITIAL_HEALTH + stats.get("health_bonus", 0) + 20 * (level - 1)
+    return {
+        "class": class_name,
+        "level": level,
+        "health": max_health,
+        "max_health": max_health,
+        "attack": 10 + stats.get("attack_bonus", 0) + 5 * (level - 1),
+        "defense": stats.get("defense_bonus", 0) + 3 * (level - 1),
+        "speed": stats.get("speed_bonus", 5),
+        "intellect": 0,
+        "element": "Normal",
+        "weapon_bonus": 0,
+        "armor_bonus": 0,
+        "skills": [],
+        "items": list(items or []),
+    }
+
+def combat_pet_abilities(state: CombatState) -> List[str]:
+    """Abilities the active pet can use at its current level"""
+    if not state.pet:
+        return []
+    abilities = state.pet.get("abilities", [])
+    if isinstance(abilities, dict):
+        # Base pet data maps the level an ability unlocks at to its name
+        pet_level = state.pet.get("level", 1)
+        return [name for level_req, name in abilities.items() if int(level_req) <= pet_level]
+    return list(abilities)
+
+def combat_strike(state: CombatState, element: str, damage: int) -> Tuple[int, str]:
+    """Deal elemental damage to the monster and put any reaction effects on it"""
+    damage, reaction_name, reaction_effect, messages = resolve_elemental_damage(
+        element, state.monster_element, damage, state.party, state.rng)
+    if messages:
+        state.emit("elemental", messages=messages)
+    state.monster_health -= damage
+
+    # Each reaction effect lasts as long as the reaction does
+    duration = reaction_effect.get("duration", 2)
+    for effect_name, value in reaction_effect.items():
+        if effect_name != "duration":
+            state.monster_status_effects.append({
+                "name": effect_name,
+                "duration": duration,
+                "effect": {effect_name: value}
+            })
+    return damage, reaction_name
+
+def combat_attack(state: CombatState) -> None:
+    """Basic attack with combo bonus, critical hits and the three-hit combo finisher"""
+    player = state.player
+    base_damage = player["attack"]
+    combo_bonus = int(state.combo_counter * base_damage * 0.2)  # 20% bonus damage per combo point
+
+    # Combo increases crit chance
+    is_critical = state.rng.random() < (CRITICAL_CHANCE + state.combo_counter * 0.05)
+    damage = base_damage + player["weapon_bonus"] + combo_bonus
+    if is_critical:
+        damage = int(damage * CRIT_MULTIPLIERS.get(player["class"], 2.0))
+        state.emit("critical")
+
+    damage, reaction_name = combat_strike(state, player["element"], damage)
+    state.emit("attack", damage=damage, combo=state.combo_counter, reaction=reaction_name)
+
+    state.combat_log.append("attack")
+    if state.combat_log[-3:] == ["attack", "attack", "attack"]:
+        # Reset combo and stun the monster after 3 consecutive attacks
+        state.combo_counter = 0
+        state.combat_log = []
+        state.monster_stunned = True
+        state.emit("combo_finisher")
+    else:
+        state.combo_counter = min(state.combo_counter + 1, MAX_COMBO)
+
+def combat_skill(state: CombatState, skill: Any) -> None:
+    """Cast one of the player's skills"""
+    player = state.player
+    skill_name = skill if isinstance(skill, str) else skill.get("name", "Unknown Skill")
+    skill_element = skill.get("element", player["element"]) if isinstance(skill, dict) else player["element"]
+
+    # Base skill damage calculation
+    intellect_bonus = player["intellect"] * 0.5
+    damage = state.rng.randint(15, 25) + int(intellect_bonus)
+    if isinstance(skill, dict) and "damage_multiplier" in skill:
+        damage = int(damage * skill.get("damage_multiplier", 1.0))
+
+    damage, reaction_name = combat_strike(state, skill_element, damage)
+    state.emit("skill", name=skill_name, element=skill_element, damage=damage, reaction=reaction_name)
+
+    # Special skill effects
+    if isinstance(skill, dict) and "effects" in skill:
+        for effect, value in skill["effects"].items():
+            if effect == "heal":
+                state.heal_player(int(value))
+                state.emit("heal", amount=int(value))
+            elif effect == "stun":
+                if state.rng.random() < value:
+                    state.monster_stunned = True
+                    state.emit("stun")
+            elif effect == "combo":
+                state.combo_counter = min(state.combo_counter + value, MAX_COMBO)
+                state.emit("combo", combo=state.combo_counter)
+
+    # Using a skill breaks the attack chain
+    state.combat_log = []
+
+def combat_use_item(state: CombatState, item_name: str) -> None:
+    """Use one combat item, which is used up whatever it does"""
+    if item_name == "Healing Potion":
+        heal_amount = int(state.player["max_health"] * 0.3)  # 30% of max health
+        state.heal_player(heal_amount)
+        state.emit("item", item=item_name, amount=heal_amount)
+    elif item_name in ("Strength Potion", "Defense Potion", "Speed Potion"):
+        name, effect = {
+            "Strength Potion": ("Strength Up", {"attack": 10}),
+            "Defense Potion": ("Defense Up", {"defense": 10}),
+            "Speed Potion": ("Speed Up", {"speed": 5}),
+        }[item_name]
+        state.player_status_effects.append({"name": name, "duration": 3, "effect": effect})
+        state.emit("item", item=item_name)
+    elif item_name == "Bomb":
+        bomb_damage = 50  # Fixed damage
+        state.monster_health -= bomb_damage
+        state.emit("item", item=item_name, amount=bomb_damage)
+
+    state.items.remove(item_name)
+    state.items_used.append(item_name)
+
+def combat_pet_command(state: CombatState, ability: str) -> bool:
+    """Order the active pet to use an ability, returns whether the pet obeyed"""
+    player = state.player
+    attack = player["attack"]
+
+    # 30% chance to be ignored at low loyalty
+    if state.pet.get("loyalty", 50) < 30 and state.rng.random() < 0.3:
+        state.emit("pet_ignores")
+        return False
+
+    if ability == "Quick Attack":
+        pet_damage = int(attack * 0.1)  # 10% of player attack
+        state.monster_health -= pet_damage
+        state.emit("pet_ability", ability=ability, amount=pet_damage)
+
+    elif ability in ("Protective Stance", "Stone Shield"):
+        # Pet blocks part of incoming attacks for 3 turns
+        state.pet_shield_active = True
+        state.pet_shield_duration = 3
+        if ability == "Stone Shield":
+            state.player_status_effects.append({
+                "name": "Stone Shield",
+                "duration": 3,
+                "effect": {"defense": int(player["defense"] * 0.15)}  # 15% defense boost
+            })
+        state.emit("pet_ability", ability=ability)
+
+    elif ability in ("Flame Burst", "Shock Strike"):
+        # Pet deals elemental damage, lightning may stun
+        element = "Fire" if ability == "Flame Burst" else "Lightning"
+        damage, reaction_name, reaction_effect, messages = resolve_elemental_damage(
+            element, state.monster_element, int(attack * 0.15), state.party, state.rng)
+        if messages:
+            state.emit("elemental", messages=messages)
+        state.monster_health -= damage
+        state.emit("pet_ability", ability=ability, amount=damage)
+
+        if ability == "Shock Strike" and state.rng.random() < 0.15:  # 15% stun chance
+            state.monster_stunned = True
+            state.emit("pet_stun")
+        if reaction_name:
+            state.emit("pet_reaction", reaction=reaction_name, effect=reaction_effect)
+
+    elif ability == "Healing Mist":
+        heal_amount = int(player["max_health"] * 0.1)  # 10% of max health
+        state.heal_player(heal_amount)
+        state.emit("pet_ability", ability=ability, amount=heal_amount)
+
+    elif ability == "Swift Movement":
+        state.pet_dodge_bonus = 0.1  # +10% dodge chance
+        state.player_status_effects.append({
+            "name": "Swift Movement",
+            "duration": 3,
+            "effect": {"speed": int(player["speed"] * 0.2)}  # 20% speed boost
+        })
+        state.emit("pet_ability", ability=ability)
+
+    elif ability == "Energy Pulse":
+        pet_damage = int(attack * 0.12)  # 12% of player attack
+        state.monster_health -= pet_damage
+        state.emit("pet_ability", ability=ability, amount=pet_damage)
+
+    elif ability == "Find Treasure":
+        # Extra treasure is checked during loot, meanwhile the pet nibbles at the enemy
+        pet_damage = int(attack * 0.05)  # 5% of player attack
+        state.monster_health -= pet_damage
+        state.emit("pet_ability", ability=ability, amount=pet_damage)
+
+    elif ability == "Intimidate":
+        # Weaker enemies may flee, the others lose some attack
+        if state.monster["level"] < player["level"] and state.rng.random() < 0.3:
+            state.monster_health = 0  # Force end combat
+            state.emit("pet_ability", ability=ability, fled=True)
+        else:
+            pet_damage = int(attack * 0.08)  # 8% of player attack
+            state.monster_health -= pet_damage
+            state.monster_status_effects.append({
+                "name": "Intimidated",
+                "duration": 2,
+                "effect": {"attack": -int(state.monster["attack"] * 0.15)}  # Reduce enemy attack by 15%
+            })
+            state.emit("pet_ability", ability=ability, fled=False)
+
+    elif ability == "Fierce Loyalty":
+        # Hits harder when the player is below 20% health
+        desperate = state.player_health < player["max_health"] * 0.2
+        pet_damage = int(attack * (0.25 if desperate else 0.1))
+        state.monster_health -= pet_damage
+        state.emit("pet_ability", ability=ability, amount=pet_damage, desperate=desperate)
+
+    return True
+
+def combat_defend(state: CombatState) -> None:
+    """Brace for the next hit, recover a little health and gain a combo point"""
+    defense_buff = int(state.player["defense"] * 0.5)
+    state.player_status_effects.append({
+        "name": "Defending",
+        "duration": 1,
+        "effect": {"defense": defense_buff}
+    })
+
+    heal_amount = int(state.player["max_health"] * 0.05)  # 5% of max health
+    state.heal_player(heal_amount)
+    state.combo_counter = min(state.combo_counter + 1, MAX_COMBO)
+    state.combat_log.append("defend")
+    state.emit("defend", amount=heal_amount, combo=state.combo_counter)
+
+def combat_flee(state: CombatState) -> bool:
+    """Try to run away, faster players escape more often but bosses rarely let go"""
+    player_speed = state.player["speed"] + state.status_bonus("speed")
+    monster_speed = state.monster.get("speed", 5)
+
+    flee_chance = 0.4 + (player_speed - monster_speed) * 0.05
+    if state.monster.get("boss", False):
+        flee_chance *= 0.5
+    flee_chance = max(0.1, min(flee_chance, 0.9))  # Clamp between 10% and 90%
+
+    if state.rng.random() < flee_chance:
+        state.emit("escaped")
+        return True
+
+    # Reset combo after failed flee
+    state.combo_counter = 0
+    state.combat_log = []
+    state.emit("flee_failed")
+    return False
+
+def combat_end_turn(state: CombatState) -> None:
+    """Age status effects, then let the monster act if it is still standing"""
+    state.player_status_effects = [effect for effect in state.player_status_effects if effect["duration"] > 0]
+    for effect in state.player_status_effects:
+        effect["duration"] -= 1
+    state.monster_status_effects = [effect for effect in state.monster_status_effects if effect["duration"] > 0]
+    for effect in state.monster_status_effects:
+        effect["duration"] -= 1
+
+    if state.monster_health > 0:
+        combat_monster_turn(state)
+
+def combat_monster_turn(state: CombatState) -> None:
+    """The monster attacks, then damage over time hits the player"""
+    if state.monster_stunned:
+        state.monster_stunned = False  # Stun lasts one turn
+        state.emit("monster_stunned")
+        return
+
+    rng = state.rng
+    player = state.player
+    state.emit("enemy_turn")
+
+    # Player defense with equipment and status effects
+    defense_bonus = player["armor_bonus"] + state.status_bonus("defense")
+    damage_taken = max(1, state.monster["attack"] - defense_bonus)
+
+    # Pet shield
+    if state.pet_shield_active and state.pet_shield_duration > 0 and state.pet:
+        pet_abilities = state.pet.get("abilities", {})
+        if "Protective Stance" in (pet_abilities.values() if isinstance(pet_abilities, dict) else pet_abilities):
+            if rng.random() < 0.2:  # 20% chance to block 30% of the damage
+                blocked_damage = int(damage_taken * 0.3)
+                damage_taken -= blocked_damage
+                state.emit("pet_block", amount=blocked_damage)
+
+        state.pet_shield_duration -= 1
+        if state.pet_shield_duration <= 0:
+            state.pet_shield_active = False
+            state.emit("pet_shield_ends")
+
+    # Speed increases dodge chance, capped at 50%
+    player_speed = player["speed"] + state.status_bonus("speed")
+    dodge_chance = min(DODGE_CHANCE + player_speed * 0.01 + state.pet_dodge_bonus, 0.5)
+
+    if rng.random() < dodge_chance:
+        state.emit("dodge")
+    else:
+        state.player_health -= damage_taken
+
+        # 10% monster crit chance
+        if rng.random() < 0.1:
+            damage_taken = int(damage_taken * 1.5)
+            state.emit("monster_critical")
+        state.emit("monster_hit", amount=damage_taken)
+
+        # Monster attack effects
+        for effect_name, chance in state.monster.get("effects", {}).items():
+            if rng.random() < chance:
+                if effect_name == "poison":
+                    state.player_status_effects.append({
+                        "name": "Poisoned",
+                        "duration": 3,
+                        "effect": {"poison_damage": int(player["max_health"] * 0.05)}
+                    })
+                    state.emit("poisoned")
+                elif effect_name == "stun":
+                    state.stunned = True
+                    state.emit("player_stunned")
+                elif effect_name == "burn":
+                    state.player_status_effects.append({
+                        "name": "Burning",
+                        "duration": 2,
+                        "effect": {"burn_damage": int(player["max_health"] * 0.07)}
+                    })
+                    state.emit("burning")
+
+    # Damage over time effects
+    for effect in state.player_status_effects:
+        if "poison_damage" in effect["effect"]:
+            state.player_health -= effect["effect"]["poison_damage"]
+            state.emit("poison_damage", amount=effect["effect"]["poison_damage"])
+        elif "burn_damage" in effect["effect"]:
+            state.player_health -= effect["effect"]["burn_damage"]
+            state.emit("burn_damage", amount=effect["effect"]["burn_damage"])
+
+def auto_combat_action(state: CombatState) -> Tuple[str, Any]:
+    """Automatic policy: drink a healing potion when low, otherwise keep attacking"""
+    if (state.player_health < state.player["max_health"] * AUTO_HEAL_THRESHOLD
+            and "Healing Potion" in state.items):
+        return "item", "Healing Potion"
+    return "attack", None
+
+def resolve_battle(state: CombatState, choose_action: Any = auto_combat_action,
+                   turn_limit: int = AUTO_RESOLVE_TURN_LIMIT) -> str:
+    """Fight a whole battle without I/O
+
+    Args:
+        state: The battle to resolve
+        choose_action: Picks the player's ("attack"/"skill"/"item"/"pet"/"defend"/"flee", argument) each turn
+        turn_limit: Turns after which the battle is called off
+
+    Returns:
+        "victory", "defeat", "fled" or "stalemate"
+    """
+    while state.player_health > 0 and state.monster_health > 0:
+        if state.turn >= turn_limit:
+            return "stalemate"
+        state.turn += 1
+
+        if state.stunned:
+            state.stunned = False  # Stun lasts one turn
+        else:
+            action, argument = choose_action(state)
+            if action == "attack":
+                combat_attack(state)
+            elif action == "skill":
+                combat_skill(state, argument)
+            elif action == "item":
+                combat_use_item(state, argument)
+            elif action == "pet":
+                combat_pet_command(state, argument)
+            elif action == "defend":
+                combat_defend(state)
+            elif action == "flee" and combat_flee(state):
+                return "fled"
+
+        combat_end_turn(state)
+
+    return "victory" if state.monster_health <= 0 else "defeat"
+
 def fight(monster: Dict) -> None:
     """
     Enhanced combat system with combo mechanics, status effects, and visual feedback
@@ -14351,30 +13462,15 @@ def fight(monster: Dict) -> None:
         print(f"{FAIL}You can't fight while defeated! Use a healing potion or rest.{ENDC}")
         return
 
-    # Initialize combat state variables
-    combo_counter = 0
-    max_combo = 3  # Can build up to 3-hit combos
-    stunned = False
-    monster_stunned = False
-    combat_log = []  # Track recent actions for combo detection
-    player_status_effects = []  # Track temporary buffs/debuffs
-    monster_status_effects = []
-
-    # Pet combat variables
+    # Turns are resolved by the combat kernel, this loop only talks to the player
     active_pet = get_active_pet()
-    pet_shield_active = False
-    pet_shield_duration = 0
-    pet_dodge_bonus = 0
-    # Track turns for pet ability cooldowns in future implementation
+    state = CombatState(monster, combat_player(), pet=active_pet, party=party_synergy())
 
     # Extract monster data with defaults
-    monster_health = monster["health"]
     monster_name = monster["name"]
     monster_level = monster["level"]
-    monster_element = monster.get("element", "Normal")
-
-    # Get player element
-    player_element = user_data.get("element", "Normal")
+    monster_element = state.monster_element
+    player_element = state.player["element"]
 
     # Battle intro with fancy visuals
     print_header(f"⚔️ COMBAT: {monster_name} ⚔️")
@@ -14390,33 +13486,33 @@ def fight(monster: Dict) -> None:
         print_animated(f"Element: {get_element_color(monster_element)}{monster_element}{ENDC}", delay=0.02)
 
     # Main combat loop
-    turn_counter = 0
-    while user_data["health"] > 0 and monster_health > 0:
-        turn_counter += 1
+    while state.player_health > 0 and state.monster_health > 0:
+        state.turn += 1
+        user_data["health"] = state.player_health
         try:
             # Display health bars with visual representation
             player_health_percent = user_data["health"] / user_data["max_health"]
-            monster_health_percent = monster_health / monster["health"]
+            monster_health_percent = state.monster_health / monster["health"]
 
             # Create health bars
             player_health_bar = create_health_bar(player_health_percent, 20)
             monster_health_bar = create_health_bar(monster_health_percent, 20)
 
-            print(f"\n{BOLD}Turn {turn_counter}{ENDC}")
+            print(f"\n{BOLD}Turn {state.turn}{ENDC}")
             print(f"\n{CYAN}Your Health: {user_data['health']}/{user_data['max_health']} {player_health_bar}{ENDC}")
-            print(f"{LIGHTRED}Enemy Health: {monster_health}/{monster['health']} {monster_health_bar}{ENDC}")
+            print(f"{LIGHTRED}Enemy Health: {state.monster_health}/{monster['health']} {monster_health_bar}{ENDC}")
 
             # Display active status effects
-            if player_status_effects:
-                effects_str = ", ".join([f"{e['name']} ({e['duration']})" for e in player_status_effects])
+            if state.player_status_effects:
+                effects_str = ", ".join([f"{e['name']} ({e['duration']})" for e in state.player_status_effects])
                 print(f"{LIGHTYELLOW}Your Status: {effects_str}{ENDC}")
-            if monster_status_effects:
-                effects_str = ", ".join([f"{e['name']} ({e['duration']})" for e in monster_status_effects])
+            if state.monster_status_effects:
+                effects_str = ", ".join([f"{e['name']} ({e['duration']})" for e in state.monster_status_effects])
                 print(f"{LIGHTYELLOW}Enemy Status: {effects_str}{ENDC}")
 
             # Display combo counter if active
-            if combo_counter > 0:
-                print(f"{LIGHTMAGENTA}Combo: x{combo_counter}{ENDC}")
+            if state.combo_counter > 0:
+                print(f"{LIGHTMAGENTA}Combo: x{state.combo_counter}{ENDC}")
 
             # Display active pet information if any
             if active_pet:
@@ -14429,22 +13525,22 @@ def fight(monster: Dict) -> None:
                 print(f"\n{CYAN}Active Pet: {pet_name} (Lvl {pet_level}){pet_element_display}{ENDC}")
 
                 # Show active abilities if any
-                pet_abilities = active_pet.get("abilities", [])
-                if pet_abilities and pet_shield_active:
-                    print(f"{YELLOW}Pet Shield: Active ({pet_shield_duration} turns){ENDC}")
+                if active_pet.get("abilities", []) and state.pet_shield_active:
+                    print(f"{YELLOW}Pet Shield: Active ({state.pet_shield_duration} turns){ENDC}")
 
             # Check if player is stunned
-            if stunned:
+            if state.stunned:
                 print(f"{YELLOW}You are stunned and cannot act this turn!{ENDC}")
-                stunned = False  # Stun lasts one turn
+                state.stunned = False  # Stun lasts one turn
             else:
                 # Actions menu
+                has_pet_commands = bool(active_pet and active_pet.get("abilities", []))
                 print("\n⚔️ Actions:")
                 print(f"{LIGHTCYAN}1. Attack{ENDC}")
                 print(f"{LIGHTGREEN}2. Use Skill{ENDC}")
                 print(f"{LIGHTBLUE}3. Use Item{ENDC}")
                 # Show pet command option if a pet is active
-                if active_pet and active_pet.get("abilities", []):
+                if has_pet_commands:
                     print(f"{MAGENTA}4. Pet Command{ENDC}")
                     print(f"{YELLOW}5. Defend{ENDC}")
                     print(f"{LIGHTRED}6. Flee{ENDC}")
@@ -14452,72 +13548,18 @@ def fight(monster: Dict) -> None:
                     print(f"{YELLOW}4. Defend{ENDC}")
                     print(f"{LIGHTRED}5. Flee{ENDC}")
 
-                max_choice = "6" if active_pet and active_pet.get("abilities", []) else "5"
+                max_choice = "6" if has_pet_commands else "5"
                 choice = input(f"{YELLOW}Choose action (1-{max_choice}): {ENDC}").strip()
 
                 if choice == "1":  # Basic Attack
-                    # Calculate damage with equipped weapon and combo bonus
-                    base_damage = user_data.get("attack", 10)
-                    weapon_bonus = user_data.get("equipped", {}).get("weapon", {}).get("effect", 0)
-                    combo_bonus = int(combo_counter * base_damage * 0.2)  # 20% bonus damage per combo point
-
-                    # Calculate critical hit
-                    is_critical = random.random() < (CRITICAL_CHANCE + combo_counter * 0.05)  # Combo increases crit chance
-
-                    # Calculate total damage
-                    damage = base_damage + weapon_bonus + combo_bonus
-
-                    if is_critical:
-                        crit_multiplier = 2.0
-                        # Apply class-specific crit bonuses
-                        if user_data["class"] == "Rogue":
-                            crit_multiplier = 2.5
-                        elif user_data["class"] == "Archer":
-                            crit_multiplier = 2.2
-
-                        damage = int(damage * crit_multiplier)
-                        print_animated(f"{BG_YELLOW}{BLACK} CRITICAL HIT! {ENDC}", delay=0.02)
-
-                    # Apply elemental damage modifiers
-                    elemental_result = calculate_elemental_damage(player_element, monster_element, damage)
-                    damage = elemental_result[0]
-                    effect_message = elemental_result[1]
-                    elemental_effects = elemental_result[2]
-
-                    # Apply damage
-                    monster_health -= damage
-
-                    # Apply any elemental effects to monster
-                    if elemental_effects:
-                        for effect_name, effect_data in elemental_effects.items():
-                            monster_status_effects.append({
-                                "name": effect_name,
-                                "duration": effect_data.get("duration", 2),
-                                "effect": effect_data
-                            })
-
-                    # Display attack results
-                    print_animated(f"You {get_attack_verb(combo_counter)} the {monster_name} for {LIGHTGREEN}{damage}{ENDC} damage!", delay=0.02)
-                    if effect_message:
-                        print_animated(f"{LIGHTCYAN}{effect_message}{ENDC}", delay=0.02)
-
-                    # Update combo counter
-                    combat_log.append("attack")
-                    if len(combat_log) >= 3 and combat_log[-3:] == ["attack", "attack", "attack"]:
-                        # Reset combo after 3 consecutive attacks
-                        print_animated(f"{BG_MAGENTA}{WHITE} COMBO FINISHER! {ENDC}", delay=0.02)
-                        combo_counter = 0
-                        combat_log = []
-                        # Apply stun effect on combo finisher
-                        monster_stunned = True
-                        print_animated(f"The {monster_name} is stunned!", LIGHTYELLOW, delay=0.02)
-                    else:
-                        combo_counter = min(combo_counter + 1, max_combo)
+                    combat_attack(state)
+                    show_combat_events(state)
 
                 elif choice == "2":  # Use Skill
-                    if user_data["skills"]:
+                    skills = state.player["skills"]
+                    if skills:
                         print("\nAvailable skills:")
-                        for i, skill in enumerate(user_data["skills"], 1):
+                        for i, skill in enumerate(skills, 1):
                             # Get skill details if available
                             skill_name = skill if isinstance(skill, str) else skill.get("name", "Unknown Skill")
                             skill_desc = skill.get("description", "No description") if isinstance(skill, dict) else ""
@@ -14531,63 +13573,9 @@ def fight(monster: Dict) -> None:
                             if skill_choice == 0:
                                 continue
 
-                            if 1 <= skill_choice <= len(user_data["skills"]):
-                                skill = user_data["skills"][skill_choice - 1]
-                                skill_name = skill if isinstance(skill, str) else skill.get("name", "Unknown Skill")
-                                skill_element = skill.get("element", player_element) if isinstance(skill, dict) else player_element
-
-                                # Base skill damage calculation
-                                intellect_bonus = user_data.get("intellect", 0) * 0.5
-                                base_skill_damage = random.randint(15, 25) + int(intellect_bonus)
-
-                                # Calculate skill-specific damage
-                                if isinstance(skill, dict) and "damage_multiplier" in skill:
-                                    skill_multiplier = skill.get("damage_multiplier", 1.0)
-                                    damage = int(base_skill_damage * skill_multiplier)
-                                else:
-                                    damage = base_skill_damage
-
-                                # Apply elemental damage modifiers
-                                elemental_result = calculate_elemental_damage(skill_element, monster_element, damage)
-                                damage = elemental_result[0]
-                                effect_message = elemental_result[1]
-                                elemental_effects = elemental_result[2]
-
-                                # Apply damage
-                                monster_health -= damage
-
-                                # Apply any elemental effects
-                                if elemental_effects:
-                                    for effect_name, effect_data in elemental_effects.items():
-                                        monster_status_effects.append({
-                                            "name": effect_name,
-                                            "duration": effect_data.get("duration", 2),
-                                            "effect": effect_data
-                                        })
-
-                                # Display skill results with visual effects
-                                print_animated(f"{BG_CYAN}{WHITE} SKILL ACTIVATED! {ENDC}", delay=0.02)
-                                print_animated(f"You cast {get_element_color(skill_element)}{skill_name}{ENDC} and deal {LIGHTGREEN}{damage}{ENDC} damage!", delay=0.02)
-                                if effect_message:
-                                    print_animated(f"{LIGHTCYAN}{effect_message}{ENDC}", delay=0.02)
-
-                                # Special skill effects
-                                if isinstance(skill, dict) and "effects" in skill:
-                                    for effect, value in skill["effects"].items():
-                                        if effect == "heal":
-                                            heal_amount = int(value)
-                                            user_data["health"] = min(user_data["health"] + heal_amount, user_data["max_health"])
-                                            print_animated(f"You recover {LIGHTGREEN}{heal_amount}{ENDC} health!", delay=0.02)
-                                        elif effect == "stun":
-                                            if random.random() < value:
-                                                monster_stunned = True
-                                                print_animated(f"The {monster_name} is stunned!", LIGHTYELLOW, delay=0.02)
-                                        elif effect == "combo":
-                                            combo_counter = min(combo_counter + value, max_combo)
-                                            print_animated(f"Combo increased to {LIGHTMAGENTA}x{combo_counter}{ENDC}!", delay=0.02)
-
-                                # Reset combo counter after using a skill
-                                combat_log = []
+                            if 1 <= skill_choice <= len(skills):
+                                combat_skill(state, skills[skill_choice - 1])
+                                show_combat_events(state)
                             else:
                                 print("Invalid skill choice.")
 
@@ -14598,11 +13586,7 @@ def fight(monster: Dict) -> None:
                         continue
 
                 elif choice == "3":  # Use Item
-                    # Get a list of usable combat items
-                    combat_items = [item for item in user_data["inventory"] 
-                                  if item in ["Healing Potion", "Mana Potion", "Strength Potion", 
-                                             "Defense Potion", "Speed Potion", "Bomb"]]
-
+                    combat_items = state.items
                     if combat_items:
                         print("\nUsable items:")
                         for i, item in enumerate(combat_items, 1):
@@ -14615,54 +13599,9 @@ def fight(monster: Dict) -> None:
 
                             if 1 <= item_choice <= len(combat_items):
                                 item_name = combat_items[item_choice - 1]
-
-                                # Apply item effects
-                                if item_name == "Healing Potion":
-                                    heal_amount = int(user_data["max_health"] * 0.3)  # 30% of max health
-                                    user_data["health"] = min(user_data["health"] + heal_amount, user_data["max_health"])
-                                    print_animated(f"{BG_GREEN}{BLACK} ITEM USED! {ENDC}", delay=0.02)
-                                    print_animated(f"You used a Healing Potion and recovered {LIGHTGREEN}{heal_amount}{ENDC} health!", delay=0.02)
-
-                                elif item_name == "Strength Potion":
-                                    # Add temporary strength buff
-                                    player_status_effects.append({
-                                        "name": "Strength Up",
-                                        "duration": 3,
-                                        "effect": {"attack": 10}
-                                    })
-                                    print_animated(f"{BG_GREEN}{BLACK} ITEM USED! {ENDC}", delay=0.02)
-                                    print_animated("You used a Strength Potion! Attack increased for 3 turns.", delay=0.02)
-
-                                elif item_name == "Defense Potion":
-                                    # Add temporary defense buff
-                                    player_status_effects.append({
-                                        "name": "Defense Up",
-                                        "duration": 3,
-                                        "effect": {"defense": 10}
-                                    })
-                                    print_animated(f"{BG_GREEN}{BLACK} ITEM USED! {ENDC}", delay=0.02)
-                                    print_animated("You used a Defense Potion! Defense increased for 3 turns.", delay=0.02)
-
-                                elif item_name == "Speed Potion":
-                                    # Add temporary speed buff
-                                    player_status_effects.append({
-                                        "name": "Speed Up",
-                                        "duration": 3,
-                                        "effect": {"speed": 5}
-                                    })
-                                    print_animated(f"{BG_GREEN}{BLACK} ITEM USED! {ENDC}", delay=0.02)
-                                    print_animated("You used a Speed Potion! Speed increased for 3 turns.", delay=0.02)
-
-                                elif item_name == "Bomb":
-                                    # Deal direct damage to monster
-                                    bomb_damage = 50  # Fixed damage
-                                    monster_health -= bomb_damage
-                                    print_animated(f"{BG_GREEN}{BLACK} ITEM USED! {ENDC}", delay=0.02)
-                                    print_animated(f"You threw a Bomb! The {monster_name} takes {LIGHTRED}{bomb_damage}{ENDC} damage!", delay=0.02)
-
-                                # Remove the item after use
+                                combat_use_item(state, item_name)
                                 user_data["inventory"].remove(item_name)
-
+                                show_combat_events(state)
                             else:
                                 print("Invalid item choice.")
 
@@ -14672,17 +13611,8 @@ def fight(monster: Dict) -> None:
                         print(f"{YELLOW}You have no usable combat items!{ENDC}")
                         continue
 
-                elif choice == "4" and active_pet and active_pet.get("abilities", []):  # Pet Command
-                    # Get active pet abilities
-                    pet_abilities = []
-                    pet_stats = user_data["pet_stats"].get(active_pet["name"], {}).get("level", 1)
-                    pet_loyalty = user_data["pet_stats"].get(active_pet["name"], {}).get("loyalty", 50)
-
-                    # Get abilities available at current pet level
-                    for level_req, ability_name in active_pet.get("abilities", {}).items():
-                        if int(level_req) <= pet_stats:
-                            pet_abilities.append(ability_name)
-
+                elif choice == "4" and has_pet_commands:  # Pet Command
+                    pet_abilities = combat_pet_abilities(state)
                     if not pet_abilities:
                         print_animated(f"{YELLOW}{active_pet['name']} doesn't know any abilities yet. Train your pet more!{ENDC}", delay=0.02)
                         continue
@@ -14701,128 +13631,10 @@ def fight(monster: Dict) -> None:
                             continue
 
                         if 1 <= ability_choice <= len(pet_abilities):
-                            selected_ability = pet_abilities[ability_choice-1]
-
-                            # Check loyalty for ability success
-                            loyalty_check_passed = True
-                            if pet_loyalty < 30 and random.random() < 0.3:  # 30% chance to fail at low loyalty
-                                print_animated(f"{RED}{active_pet['name']} ignores your command!{ENDC}", delay=0.02)
-                                loyalty_check_passed = False
-
-                            if loyalty_check_passed:
-                                # Process pet ability
-                                if selected_ability == "Quick Attack":
-                                    # Pet deals small damage
-                                    pet_damage = int(user_data.get("attack", 10) * 0.1)  # 10% of player attack
-                                    monster_health -= pet_damage
-                                    print_animated(f"{CYAN}{active_pet['name']} dashes forward with a quick attack, dealing {LIGHTRED}{pet_damage}{ENDC} damage!", delay=0.02)
-
-                                elif selected_ability == "Protective Stance":
-                                    # Pet provides damage reduction
-                                    pet_shield_active = True
-                                    pet_shield_duration = 3
-                                    print_animated(f"{CYAN}{active_pet['name']} takes a protective stance, ready to block incoming attacks!{ENDC}", delay=0.02)
-
-                                elif selected_ability == "Flame Burst":
-                                    # Pet deals fire elemental damage
-                                    pet_damage = int(user_data.get("attack", 10) * 0.15)  # 15% of player attack
-                                    # Apply elemental damage calculation
-                                    final_damage, reaction_name, reaction_effect = calculate_elemental_damage("Fire", monster_element, pet_damage)
-                                    monster_health -= final_damage
-
-                                    print_animated(f"{CYAN}{active_pet['name']} unleashes a burst of {RED}flames{ENDC}, dealing {LIGHTRED}{final_damage}{ENDC} damage!", delay=0.02)
-
-                                    if reaction_name:
-                                        print_animated(f"{YELLOW}Elemental Reaction: {reaction_name}!{ENDC}", delay=0.02)
-                                        apply_elemental_effects(monster, reaction_effect, is_player=False)
-
-                                elif selected_ability == "Healing Mist":
-                                    # Pet heals player
-                                    heal_amount = int(user_data.get("max_health", 100) * 0.1)  # 10% of max health
-                                    user_data["health"] = min(user_data["health"] + heal_amount, user_data["max_health"])
-                                    print_animated(f"{CYAN}{active_pet['name']} creates a healing mist, restoring {GREEN}{heal_amount}{ENDC} health!", delay=0.02)
-
-                                elif selected_ability == "Stone Shield":
-                                    # Pet creates a stronger shield
-                                    pet_shield_active = True
-                                    pet_shield_duration = 3
-                                    player_status_effects.append({
-                                        "name": "Stone Shield",
-                                        "duration": 3,
-                                        "effect": {"defense": int(user_data.get("defense", 5) * 0.15)}  # 15% defense boost
-                                    })
-                                    print_animated(f"{CYAN}{active_pet['name']} creates a shield of stone around you!{ENDC}", delay=0.02)
-
-                                elif selected_ability == "Swift Movement":
-                                    # Pet increases dodge chance
-                                    pet_dodge_bonus = 0.1  # +10% dodge chance
-                                    player_status_effects.append({
-                                        "name": "Swift Movement",
-                                        "duration": 3,
-                                        "effect": {"speed": int(user_data.get("speed", 5) * 0.2)}  # 20% speed boost
-                                    })
-                                    print_animated(f"{CYAN}{active_pet['name']} enhances your agility, making you more difficult to hit!{ENDC}", delay=0.02)
-
-                                elif selected_ability == "Shock Strike":
-                                    # Pet deals lightning damage with stun chance
-                                    pet_damage = int(user_data.get("attack", 10) * 0.15)  # 15% of player attack
-                                    # Apply elemental damage calculation
-                                    final_damage, reaction_name, reaction_effect = calculate_elemental_damage("Lightning", monster_element, pet_damage)
-                                    monster_health -= final_damage
-
-                                    print_animated(f"{CYAN}{active_pet['name']} strikes with {YELLOW}lightning{ENDC}, dealing {LIGHTRED}{final_damage}{ENDC} damage!", delay=0.02)
-
-                                    # Chance to stun
-                                    if random.random() < 0.15:  # 15% stun chance
-                                        monster_stunned = True
-                                        print_animated(f"{YELLOW}The {monster_name} is stunned!{ENDC}", delay=0.02)
-
-                                    if reaction_name:
-                                        print_animated(f"{YELLOW}Elemental Reaction: {reaction_name}!{ENDC}", delay=0.02)
-                                        apply_elemental_effects(monster, reaction_effect, is_player=False)
-
-                                elif selected_ability == "Energy Pulse":
-                                    # Pet deals neutral damage
-                                    pet_damage = int(user_data.get("attack", 10) * 0.12)  # 12% of player attack
-                                    monster_health -= pet_damage
-                                    print_animated(f"{CYAN}{active_pet['name']} releases a pulse of neutral energy, dealing {LIGHTRED}{pet_damage}{ENDC} damage!", delay=0.02)
-
-                                elif selected_ability == "Find Treasure":
-                                    # No direct combat effect, will be checked during loot
-                                    print_animated(f"{CYAN}{active_pet['name']} is keeping an eye out for extra treasures!{ENDC}", delay=0.02)
-                                    # Just to not waste a turn
-                                    pet_damage = int(user_data.get("attack", 10) * 0.05)  # 5% of player attack
-                                    monster_health -= pet_damage
-                                    print_animated(f"{CYAN}While searching, {active_pet['name']} deals {LIGHTRED}{pet_damage}{ENDC} damage!", delay=0.02)
-
-                                elif selected_ability == "Intimidate":
-                                    # Chance for weaker enemies to flee
-                                    if monster_level < user_data.get("level", 1) and random.random() < 0.3:  # 30% chance if monster is lower level
-                                        monster_health = 0  # Force end combat
-                                        print_animated(f"{CYAN}{active_pet['name']} lets out a terrifying sound! The {monster_name} flees in fear!{ENDC}", delay=0.02)
-                                    else:
-                                        # If intimidate fails, still deal some damage and reduce enemy attack
-                                        pet_damage = int(user_data.get("attack", 10) * 0.08)  # 8% of player attack
-                                        monster_health -= pet_damage
-                                        monster_status_effects.append({
-                                            "name": "Intimidated",
-                                            "duration": 2,
-                                            "effect": {"attack": -int(monster["attack"] * 0.15)}  # Reduce enemy attack by 15%
-                                        })
-                                        print_animated(f"{CYAN}{active_pet['name']} intimidates the {monster_name}, lowering its attack power!{ENDC}", delay=0.02)
-
-                                elif selected_ability == "Fierce Loyalty":
-                                    # Only activates when player health is low, gives damage boost
-                                    if user_data["health"] < user_data["max_health"] * 0.2:  # Below 20% health
-                                        pet_damage = int(user_data.get("attack", 10) * 0.25)  # 25% of player attack
-                                        monster_health -= pet_damage
-                                        print_animated(f"{CYAN}Seeing you in danger, {active_pet['name']} attacks fiercely for {LIGHTRED}{pet_damage}{ENDC} damage!{ENDC}", delay=0.02)
-                                    else:
-                                        # Regular attack if health isn't low
-                                        pet_damage = int(user_data.get("attack", 10) * 0.1)  # 10% of player attack
-                                        monster_health -= pet_damage
-                                        print_animated(f"{CYAN}{active_pet['name']} loyally attacks for {LIGHTRED}{pet_damage}{ENDC} damage!{ENDC}", delay=0.02)
+                            obeyed = combat_pet_command(state, pet_abilities[ability_choice - 1])
+                            show_combat_events(state)
 
+                            if obeyed:
                                 # Pet gains experience from battle
                                 if "pet_stats" not in user_data:
                                     user_data["pet_stats"] = {}
@@ -14847,180 +13659,186 @@ def fight(monster: Dict) -> None:
                         print("Please enter a valid number.")
                         continue
 
-                elif choice == "5" and active_pet and active_pet.get("abilities", []) or choice == "4":  # Defend
-                    # Reduce incoming damage and gain a small health recovery
-                    defense_buff = int(user_data.get("defense", 5) * 0.5)
-                    player_status_effects.append({
-                        "name": "Defending",
-                        "duration": 1,
-                        "effect": {"defense": defense_buff}
-                    })
-
-                    # Heal a small amount
-                    heal_amount = int(user_data["max_health"] * 0.05)  # 5% of max health
-                    user_data["health"] = min(user_data["health"] + heal_amount, user_data["max_health"])
-
-                    # Gain a combo point
-                    combo_counter = min(combo_counter + 1, max_combo)
-
-                    print_animated(f"{BG_BLUE}{WHITE} DEFENDING! {ENDC}", delay=0.02)
-                    print_animated(f"You take a defensive stance! Reduced damage for 1 turn and recovered {LIGHTGREEN}{heal_amount}{ENDC} health.", delay=0.02)
-                    print_animated(f"Combo increased to {LIGHTMAGENTA}x{combo_counter}{ENDC}!", delay=0.02)
-
-                    # Update combat log
-                    combat_log.append("defend")
-
-                elif choice == "6" and active_pet and active_pet.get("abilities", []) or choice == "5" and not (active_pet and active_pet.get("abilities", [])):  # Flee
-                    # Calculate flee chance based on speed and status
-                    player_speed = user_data.get("speed", 5)
-                    monster_speed = monster.get("speed", 5)
-
-                    # Apply speed buffs from status effects
-                    for effect in player_status_effects:
-                        if "speed" in effect["effect"]:
-                            player_speed += effect["effect"]["speed"]
-
-                    base_chance = 0.4  # Base flee chance
-                    speed_diff = player_speed - monster_speed
-                    flee_chance = base_chance + (speed_diff * 0.05)
-
-                    # Boss battles are harder to flee from
-                    if monster.get("boss", False):
-                        flee_chance *= 0.5
-
-                    # Clamp between 10% and 90%
-                    flee_chance = max(0.1, min(flee_chance, 0.9))
+                elif choice == "5" and has_pet_commands or choice == "4":  # Defend
+                    combat_defend(state)
+                    show_combat_events(state)
 
-                    # Roll for success
-                    if random.random() < flee_chance:
-                        print_animated(f"{BG_GREEN}{BLACK} ESCAPED! {ENDC}", delay=0.02)
-                        print_animated("You successfully fled from battle!", delay=0.02)
+                elif choice == "6" and has_pet_commands or choice == "5" and not has_pet_commands:  # Flee
+                    escaped = combat_flee(state)
+                    show_combat_events(state)
+                    if escaped:
                         return
-                    else:
-                        print_animated(f"{BG_RED}{WHITE} FAILED TO ESCAPE! {ENDC}", delay=0.02)
-                        print_animated("You couldn't escape!", delay=0.02)
-                        # Reset combo after failed flee
-                        combo_counter = 0
-                        combat_log = []
 
                 else:
                     print(f"{YELLOW}Invalid choice!{ENDC}")
                     continue
 
-            # Update status effects
-            player_status_effects = [effect for effect in player_status_effects if effect["duration"] > 0]
-            for effect in player_status_effects:
-                effect["duration"] -= 1
-
-            monster_status_effects = [effect for effect in monster_status_effects if effect["duration"] > 0]
-            for effect in monster_status_effects:
-                effect["duration"] -= 1
+            # Status effects wear off, then the monster acts
+            combat_end_turn(state)
+            show_combat_events(state)
 
-            # Monster's turn if it's still alive and not stunned
-            if monster_health > 0:
-                if monster_stunned:
-                    print_animated(f"The {monster_name} is stunned and cannot attack!", LIGHTYELLOW, delay=0.02)
-                    monster_stunned = False  # Reset stun for next turn
-                else:
-                    print_animated(f"\n{LIGHTRED}Enemy's turn!{ENDC}", delay=0.02)
-
-                    # Calculate base monster damage
-                    monster_attack = monster["attack"]
+        except Exception as e:
+            print(f"{FAIL}Error during combat: {e}{ENDC}")
+            continue
 
-                    # Calculate player defense with equipment and status effects
-                    defense_bonus = user_data.get("equipped", {}).get("armor", {}).get("effect", 0)
-                    for effect in player_status_effects:
-                        if "defense" in effect["effect"]:
-                            defense_bonus += effect["effect"]["defense"]
-
-                    # Calculate final damage
-                    damage_taken = max(1, monster_attack - defense_bonus)
-
-                    # Check for pet shield effect
-                    if pet_shield_active and pet_shield_duration > 0 and active_pet:
-                        # Check for Protective Stance ability
-                        if "Protective Stance" in active_pet.get("abilities", {}).values():
-                            # 20% chance to block damage
-                            if random.random() < 0.2:
-                                blocked_damage = int(damage_taken * 0.3)  # Block 30% of damage
-                                damage_taken -= blocked_damage
-                                print_animated(f"{CYAN}{active_pet['name']} blocks {blocked_damage} damage!{ENDC}", delay=0.02)
-
-                        # Decrement pet shield duration
-                        pet_shield_duration -= 1
-                        if pet_shield_duration <= 0:
-                            pet_shield_active = False
-                            print_animated(f"{YELLOW}{active_pet['name']}'s protective stance ends.{ENDC}", delay=0.02)
-
-                    # Check for dodge
-                    player_speed = user_data.get("speed", 5)
-                    for effect in player_status_effects:
-                        if "speed" in effect["effect"]:
-                            player_speed += effect["effect"]["speed"]
+    # Combat conclusion
+    user_data["health"] = state.player_health
+    print_animated(f"\n{BG_CYAN}{WHITE} BATTLE COMPLETED! {ENDC}", delay=0.05)
+    finish_battle(monster, state.monster_health <= 0)
 
-                    dodge_chance = DODGE_CHANCE + (player_speed * 0.01)  # Speed increases dodge chance
+def show_combat_events(state: CombatState) -> None:
+    """Show what happened in the battle since the last call"""
+    monster = state.monster
+    monster_name = monster["name"]
+    pet_name = state.pet["name"] if state.pet else ""
+
+    for kind, data in state.take_events():
+        if kind == "elemental":
+            for text, color in data["messages"]:
+                print_colored(text, color)
+        elif kind == "critical":
+            print_animated(f"{BG_YELLOW}{BLACK} CRITICAL HIT! {ENDC}", delay=0.02)
+        elif kind == "attack":
+            print_animated(f"You {get_attack_verb(data['combo'])} the {monster_name} for {LIGHTGREEN}{data['damage']}{ENDC} damage!", delay=0.02)
+            if data["reaction"]:
+                print_animated(f"{LIGHTCYAN}{data['reaction']}{ENDC}", delay=0.02)
+        elif kind == "combo_finisher":
+            print_animated(f"{BG_MAGENTA}{WHITE} COMBO FINISHER! {ENDC}", delay=0.02)
+            print_animated(f"The {monster_name} is stunned!", LIGHTYELLOW, delay=0.02)
+        elif kind == "skill":
+            print_animated(f"{BG_CYAN}{WHITE} SKILL ACTIVATED! {ENDC}", delay=0.02)
+            print_animated(f"You cast {get_element_color(data['element'])}{data['name']}{ENDC} and deal {LIGHTGREEN}{data['damage']}{ENDC} damage!", delay=0.02)
+            if data["reaction"]:
+                print_animated(f"{LIGHTCYAN}{data['reaction']}{ENDC}", delay=0.02)
+        elif kind == "heal":
+            print_animated(f"You recover {LIGHTGREEN}{data['amount']}{ENDC} health!", delay=0.02)
+        elif kind == "stun":
+            print_animated(f"The {monster_name} is stunned!", LIGHTYELLOW, delay=0.02)
+        elif kind == "combo":
+            print_animated(f"Combo increased to {LIGHTMAGENTA}x{data['combo']}{ENDC}!", delay=0.02)
+        elif kind == "item":
+            print_animated(f"{BG_GREEN}{BLACK} ITEM USED! {ENDC}", delay=0.02)
+            item = data["item"]
+            if item == "Healing Potion":
+                print_animated(f"You used a Healing Potion and recovered {LIGHTGREEN}{data['amount']}{ENDC} health!", delay=0.02)
+            elif item == "Strength Potion":
+                print_animated("You used a Strength Potion! Attack increased for 3 turns.", delay=0.02)
+            elif item == "Defense Potion":
+                print_animated("You used a Defense Potion! Defense increased for 3 turns.", delay=0.02)
+            elif item == "Speed Potion":
+                print_animated("You used a Speed Potion! Speed increased for 3 turns.", delay=0.02)
+            elif item == "Bomb":
+                print_animated(f"You threw a Bomb! The {monster_name} takes {LIGHTRED}{data['amount']}{ENDC} damage!", delay=0.02)
+        elif kind == "pet_ignores":
+            print_animated(f"{RED}{pet_name} ignores your command!{ENDC}", delay=0.02)
+        elif kind == "pet_ability":
+            ability = data["ability"]
+            if ability == "Quick Attack":
+                print_animated(f"{CYAN}{pet_name} dashes forward with a quick attack, dealing {LIGHTRED}{data['amount']}{ENDC} damage!", delay=0.02)
+            elif ability == "Protective Stance":
+                print_animated(f"{CYAN}{pet_name} takes a protective stance, ready to block incoming attacks!{ENDC}", delay=0.02)
+            elif ability == "Flame Burst":
+                print_animated(f"{CYAN}{pet_name} unleashes a burst of {RED}flames{ENDC}, dealing {LIGHTRED}{data['amount']}{ENDC} damage!", delay=0.02)
+            elif ability == "Healing Mist":
+                print_animated(f"{CYAN}{pet_name} creates a healing mist, restoring {GREEN}{data['amount']}{ENDC} health!", delay=0.02)
+            elif ability == "Stone Shield":
+                print_animated(f"{CYAN}{pet_name} creates a shield of stone around you!{ENDC}", delay=0.02)
+            elif ability == "Swift Movement":
+                print_animated(f"{CYAN}{pet_name} enhances your agility, making you more difficult to hit!{ENDC}", delay=0.02)
+            elif ability == "Shock Strike":
+                print_animated(f"{CYAN}{pet_name} strikes with {YELLOW}lightning{ENDC}, dealing {LIGHTRED}{data['amount']}{ENDC} damage!", delay=0.02)
+            elif ability == "Energy Pulse":
+                print_animated(f"{CYAN}{pet_name} releases a pulse of neutral energy, dealing {LIGHTRED}{data['amount']}{ENDC} damage!", delay=0.02)
+            elif ability == "Find Treasure":
+                print_animated(f"{CYAN}{pet_name} is keeping an eye out for extra treasures!{ENDC}", delay=0.02)
+                print_animated(f"{CYAN}While searching, {pet_name} deals {LIGHTRED}{data['amount']}{ENDC} damage!", delay=0.02)
+            elif ability == "Intimidate":
+                if data["fled"]:
+                    print_animated(f"{CYAN}{pet_name} lets out a terrifying sound! The {monster_name} flees in fear!{ENDC}", delay=0.02)
+                else:
+                    print_animated(f"{CYAN}{pet_name} intimidates the {monster_name}, lowering its attack power!{ENDC}", delay=0.02)
+            elif ability == "Fierce Loyalty":
+                if data["desperate"]:
+                    print_animated(f"{CYAN}Seeing you in danger, {pet_name} attacks fiercely for {LIGHTRED}{data['amount']}{ENDC} damage!{ENDC}", delay=0.02)
+                else:
+                    print_animated(f"{CYAN}{pet_name} loyally attacks for {LIGHTRED}{data['amount']}{ENDC} damage!{ENDC}", delay=0.02)
+        elif kind == "pet_stun":
+            print_animated(f"{YELLOW}The {monster_name} is stunned!{ENDC}", delay=0.02)
+        elif kind == "pet_reaction":
+            print_animated(f"{YELLOW}Elemental Reaction: {data['reaction']}!{ENDC}", delay=0.02)
+            apply_elemental_effects(monster, data["effect"], is_player=False)
+        elif kind == "defend":
+            print_animated(f"{BG_BLUE}{WHITE} DEFENDING! {ENDC}", delay=0.02)
+            print_animated(f"You take a defensive stance! Reduced damage for 1 turn and recovered {LIGHTGREEN}{data['amount']}{ENDC} health.", delay=0.02)
+            print_animated(f"Combo increased to {LIGHTMAGENTA}x{data['combo']}{ENDC}!", delay=0.02)
+        elif kind == "escaped":
+            print_animated(f"{BG_GREEN}{BLACK} ESCAPED! {ENDC}", delay=0.02)
+            print_animated("You successfully fled from battle!", delay=0.02)
+        elif kind == "flee_failed":
+            print_animated(f"{BG_RED}{WHITE} FAILED TO ESCAPE! {ENDC}", delay=0.02)
+            print_animated("You couldn't escape!", delay=0.02)
+        elif kind == "monster_stunned":
+            print_animated(f"The {monster_name} is stunned and cannot attack!", LIGHTYELLOW, delay=0.02)
+        elif kind == "enemy_turn":
+            print_animated(f"\n{LIGHTRED}Enemy's turn!{ENDC}", delay=0.02)
+        elif kind == "pet_block":
+            print_animated(f"{CYAN}{pet_name} blocks {data['amount']} damage!{ENDC}", delay=0.02)
+        elif kind == "pet_shield_ends":
+            print_animated(f"{YELLOW}{pet_name}'s protective stance ends.{ENDC}", delay=0.02)
+        elif kind == "dodge":
+            print_animated(f"{BG_CYAN}{BLACK} DODGE! {ENDC}", delay=0.02)
+            print_animated("You dodged the attack!", delay=0.02)
+        elif kind == "monster_critical":
+            print_animated(f"{BG_RED}{WHITE} CRITICAL HIT! {ENDC}", delay=0.02)
+        elif kind == "monster_hit":
+            print_animated(f"The {monster_name} attacks and deals {LIGHTRED}{data['amount']}{ENDC} damage!", delay=0.02)
+        elif kind == "poisoned":
+            print_animated(f"{LIGHTGREEN}You have been poisoned!{ENDC}", delay=0.02)
+        elif kind == "player_stunned":
+            print_animated(f"{LIGHTYELLOW}You have been stunned!{ENDC}", delay=0.02)
+        elif kind == "burning":
+            print_animated(f"{LIGHTRED}You are burning!{ENDC}", delay=0.02)
+        elif kind == "poison_damage":
+            print_animated(f"{LIGHTGREEN}Poison deals {data['amount']} damage!{ENDC}", delay=0.02)
+        elif kind == "burn_damage":
+            print_animated(f"{LIGHTRED}Burning deals {data['amount']} damage!{ENDC}", delay=0.02)
+
+def auto_fight(monster: Dict) -> Optional[str]:
+    """Resolve a battle instantly with the combat kernel instead of turn by turn
+
+    Returns the outcome ("victory", "defeat" or "stalemate"), None if no battle took place.
+    """
+    if not user_data["class"]:
+        print(f"{FAIL}You need to create a character first! Use /new{ENDC}")
+        return None
 
-                    # Add pet dodge bonus if active
-                    if pet_dodge_bonus > 0:
-                        dodge_chance += pet_dodge_bonus
+    if user_data["health"] <= 0:
+        print(f"{FAIL}You can't fight while defeated! Use a healing potion or rest.{ENDC}")
+        return None
 
-                    dodge_chance = min(dodge_chance, 0.5)  # Cap at 50%
+    state = CombatState(monster, combat_player(), pet=get_active_pet(), party=party_synergy(),
+                        record_events=False)
+    outcome = resolve_battle(state)
 
-                    if random.random() < dodge_chance:
-                        print_animated(f"{BG_CYAN}{BLACK} DODGE! {ENDC}", delay=0.02)
-                        print_animated("You dodged the attack!", delay=0.02)
-                    else:
-                        # Apply damage to player
-                        user_data["health"] -= damage_taken
+    # Apply what the battle cost the player
+    user_data["health"] = state.player_health
+    for item_name in state.items_used:
+        user_data["inventory"].remove(item_name)
 
-                        # Check for critical hit from monster
-                        if random.random() < 0.1:  # 10% monster crit chance
-                            damage_taken = int(damage_taken * 1.5)
-                            print_animated(f"{BG_RED}{WHITE} CRITICAL HIT! {ENDC}", delay=0.02)
-
-                        print_animated(f"The {monster_name} attacks and deals {LIGHTRED}{damage_taken}{ENDC} damage!", delay=0.02)
-
-                        # Apply monster attack effects
-                        if "effects" in monster:
-                            for effect_name, chance in monster["effects"].items():
-                                if random.random() < chance:
-                                    if effect_name == "poison":
-                                        player_status_effects.append({
-                                            "name": "Poisoned",
-                                            "duration": 3,
-                                            "effect": {"poison_damage": int(user_data["max_health"] * 0.05)}
-                                        })
-                                        print_animated(f"{LIGHTGREEN}You have been poisoned!{ENDC}", delay=0.02)
-                                    elif effect_name == "stun":
-                                        stunned = True
-                                        print_animated(f"{LIGHTYELLOW}You have been stunned!{ENDC}", delay=0.02)
-                                    elif effect_name == "burn":
-                                        player_status_effects.append({
-                                            "name": "Burning",
-                                            "duration": 2,
-                                            "effect": {"burn_damage": int(user_data["max_health"] * 0.07)}
-                                        })
-                                        print_animated(f"{LIGHTRED}You are burning!{ENDC}", delay=0.02)
-
-                    # Apply damage over time effects
-                    for effect in player_status_effects:
-                        if "poison_damage" in effect["effect"]:
-                            poison_damage = effect["effect"]["poison_damage"]
-                            user_data["health"] -= poison_damage
-                            print_animated(f"{LIGHTGREEN}Poison deals {poison_damage} damage!{ENDC}", delay=0.02)
-                        elif "burn_damage" in effect["effect"]:
-                            burn_damage = effect["effect"]["burn_damage"]
-                            user_data["health"] -= burn_damage
-                            print_animated(f"{LIGHTRED}Burning deals {burn_damage} damage!{ENDC}", delay=0.02)
+    items_note = f", used {', '.join(state.items_used)}" if state.items_used else ""
+    print_colored(f"⚔️ Auto-battle vs {monster['name']}: {state.turn} turns{items_note}", CYAN)
 
-        except Exception as e:
-            print(f"{FAIL}Error during combat: {e}{ENDC}")
-            continue
+    if outcome == "stalemate":
+        print_colored(f"Neither side could finish the fight. You withdraw from the {monster['name']}.", YELLOW)
+        return outcome
+    finish_battle(monster, outcome == "victory")
+    return outcome
 
-    # Combat conclusion
-    print_animated(f"\n{BG_CYAN}{WHITE} BATTLE COMPLETED! {ENDC}", delay=0.05)
+def finish_battle(monster: Dict, victory: bool) -> None:
+    """Rewards for a won battle or the penalty for a lost one"""
+    monster_name = monster["name"]
 
-    if monster_health <= 0:
+    if victory:
         print_animated(f"\n{BG_GREEN}{BLACK} VICTORY! {ENDC}", delay=0.05)
         print_animated(f"You defeated the {monster_name}!", LIGHTGREEN, delay=0.03)
 
@@ -15047,7 +13865,7 @@ def fight(monster: Dict) -> None:
         user_data["monster_types_killed"][monster_type] = user_data["monster_types_killed"].get(monster_type, 0) + 1
 
         # Check for achievements
-        check_achievements()
+        achievement_event("monster_killed")
 
         # Check if monster is a boss
         if monster.get("boss", False):
@@ -15170,249 +13988,376 @@ def get_save_directory() -> str:
     os.makedirs(save_dir, exist_ok=True)
     return save_dir
 
-def save_game(slot: int = 1, auto: bool = False) -> None:
+# Save format 3 stores only the canonical user_data, written compactly and
+# atomically. Older saves also carried derived summary sections, those are
+# now rebuilt on demand by save_sections(). Format 4 stores the inventory as
+# counts per item plus gear records instead of a list of every item.
+SAVE_FORMAT_VERSION = 4
+
+# "" for plain JSON, "gzip" or "lzma" to compress save files
+SAVE_COMPRESSION = os.environ.get("CHRONOTALE_SAVE_COMPRESSION", "")
+SAVE_EXTENSIONS = {"": ".json", "gzip": ".json.gz", "lzma": ".json.xz"}
+
+# Checkpoint id of the last full save written to each slot this session
+SAVE_CHECKPOINTS: Dict[int, str] = {}
+
+def save_file_path(slot: int, compression: Optional[str] = None) -> str:
+    """Path of a save slot in the given (or configured) compression"""
+    if compression is None:
+        compression = SAVE_COMPRESSION if SAVE_COMPRESSION in SAVE_EXTENSIONS else ""
+    return os.path.join(get_save_directory(), f"save_{slot}{SAVE_EXTENSIONS[compression]}")
+
+def save_journal_path(slot: int) -> str:
+    """Path of the autosave journal kept next to a slot's checkpoint"""
+    return os.path.join(get_save_directory(), f"save_{slot}.journal")
+
+def find_save_file(slot: int) -> Optional[str]:
+    """The most recently written save file of a slot, whatever its compression"""
+    existing = [save_file_path(slot, compression) for compression in SAVE_EXTENSIONS]
+    existing = [path for path in existing if os.path.exists(path)]
+    if not existing:
+        return None
+    return max(existing, key=os.path.getmtime)
+
+def encode_saved_value(value: Any) -> Any:
+    """JSON form of the game containers JSON has no type for, used as the encoder's default hook"""
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, Inventory):
+        return value.saved_form()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+# Encodes live user_data straight to compact JSON, without copying it first
+SAVE_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=encode_saved_value)
+
+# Paths in user_data whose saved JSON form is turned back into the game's container on load
+SAVE_SCHEMA: Dict[Tuple[str, ...], Any] = {
+    ("achievements", "completed"): set,
+    ("achievements", "stats", "areas_visited"): set,
+    ("inventory",): Inventory.from_saved,
+    ("materials",): lambda value: MaterialStore(value),
+}
+
+def restore_saved_fields(data: Dict[str, Any]) -> None:
+    """Convert the SAVE_SCHEMA paths of freshly decoded user_data in place"""
+    for path, convert in SAVE_SCHEMA.items():
+        parent = data
+        for key in path[:-1]:
+            parent = parent.get(key) if isinstance(parent, dict) else None
+        if isinstance(parent, dict) and path[-1] in parent:
+            parent[path[-1]] = convert(parent[path[-1]])
+
+def serialize_save(save_data: Dict[str, Any]) -> bytes:
+    """Encode save data in a single pass, while the game is not changing it"""
+    return SAVE_ENCODER.encode(save_data).encode("utf-8")
+
+def encode_save(path: str, raw: bytes) -> bytes:
+    """Compress serialized save data according to the file extension"""
+    if path.endswith(".gz"):
+        return gzip.compress(raw)
+    if path.endswith(".xz"):
+        return lzma.compress(raw)
+    return raw
+
+def read_save_file(path: str) -> Dict[str, Any]:
+    """Read a plain, gzip or lzma save file"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if path.endswith(".gz"):
+        raw = gzip.decompress(raw)
+    elif path.endswith(".xz"):
+        raw = lzma.decompress(raw)
+    return json.loads(raw.decode("utf-8"))
+
+def write_file_atomically(path: str, payload: bytes) -> None:
+    """Write through a temp file, fsync and rename so the target is never half written"""
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates owner-only files; keep the permissions saves had before
+        mode = os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    # Make the rename itself durable where the platform allows it
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+def keep_backup(path: str) -> None:
+    """Keep the current save as .backup without ever removing the primary file"""
+    if not os.path.exists(path):
+        return
+    backup_file = f"{path}.backup"
+    if os.path.exists(backup_file):
+        os.remove(backup_file)
     try:
-        # Convert any set objects to lists for JSON serialization
-        prepared_user_data = prepare_user_data_for_save(user_data)
+        os.link(path, backup_file)
+    except OSError:
+        shutil.copyfile(path, backup_file)
+
+def build_save_data() -> Dict[str, Any]:
+    """Canonical state written to a format 4 save"""
+    return {
+        "save_format_version": SAVE_FORMAT_VERSION,
+        "version": "3.0",
+        "gacha_version": "2.0",
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        # Autosave journal entries only apply on top of the checkpoint they were written against
+        "checkpoint_id": f"{time.time_ns():x}",
+        # The live state, serialize_save() converts sets and the inventory as it encodes
+        "user_data": user_data,
+    }
 
-        # Capture comprehensive game state
-        save_data = {
-            # Core user data with all progression
-            "user_data": prepared_user_data,
-            
-            # Game metadata and versioning
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "version": "2.0_ultimate",
-            "gacha_version": "2.0",
-            "save_format_version": "2.0",
-            
-            # Character progression and statistics
-            "character_stats": {
-                "level": user_data.get("level", 1),
-                "experience": user_data.get("experience", 0),
-                "skill_points": user_data.get("skill_points", 0),
-                "total_playtime": user_data.get("total_playtime", 0),
-                "creation_date": user_data.get("creation_date", datetime.now().isoformat()),
-                "last_login": user_data.get("last_login", datetime.now().isoformat()),
-                "login_streak": user_data.get("login_streak", 0),
-                "total_sessions": user_data.get("total_sessions", 0)
-            },
-            
-            # Story and quest progression
-            "story_progress": {
-                "current_chapter": user_data.get("current_chapter", 1),
-                "completed_quests": user_data.get("completed_quests", []),
-                "active_quests": user_data.get("active_quests", []),
-                "story_flags": user_data.get("story_flags", {}),
-                "dialogue_history": user_data.get("dialogue_history", []),
-                "choices_made": user_data.get("choices_made", {}),
-                "unlocked_content": user_data.get("unlocked_content", []),
-                "discovered_lore": user_data.get("discovered_lore", [])
-            },
-            
-            # Inventory and equipment comprehensive data
-            "inventory_data": {
-                "items": user_data.get("inventory", {}),
-                "equipment": user_data.get("equipment", {}),
-                "consumables": user_data.get("consumables", {}),
-                "materials": user_data.get("materials", {}),
-                "currency": user_data.get("currency", 0),
-                "bank_storage": user_data.get("bank_storage", {}),
-                "item_history": user_data.get("item_acquisition_history", []),
-                "crafting_recipes": user_data.get("known_recipes", []),
-                "upgrade_materials": user_data.get("upgrade_materials", {})
-            },
-            
-            # Gacha and collection system
-            "gacha_data": {
-                "pulls_total": user_data.get("gacha_pulls_total", 0),
-                "pulls_history": user_data.get("gacha_history", []),
-                "pity_counter": user_data.get("pity_counter", 0),
-                "guaranteed_counter": user_data.get("guaranteed_counter", 0),
-                "collection_book": user_data.get("collection_book", {}),
-                "rare_items_obtained": user_data.get("rare_collection", []),
-                "gacha_currency": user_data.get("gacha_currency", 0),
-                "banners_pulled": user_data.get("banners_history", {}),
-                "luck_statistics": user_data.get("gacha_luck_stats", {})
-            },
-            
-            # Achievement and milestone tracking
-            "achievements": {
-                "unlocked_achievements": user_data.get("achievements", []),
-                "achievement_progress": user_data.get("achievement_progress", {}),
-                "milestones_reached": user_data.get("milestones", []),
-                "records_set": user_data.get("personal_records", {}),
-                "badges_earned": user_data.get("badges", []),
-                "titles_unlocked": user_data.get("titles", []),
-                "active_title": user_data.get("active_title", None)
-            },
-            
-            # Settings and preferences
-            "user_settings": {
-                "game_preferences": user_data.get("settings", {}),
-                "display_options": user_data.get("display_settings", {}),
-                "audio_settings": user_data.get("audio_settings", {}),
-                "control_mappings": user_data.get("controls", {}),
-                "notification_preferences": user_data.get("notifications", {}),
-                "accessibility_options": user_data.get("accessibility", {}),
-                "language_preference": user_data.get("language", "en")
-            },
-            
-            # Social and multiplayer data
-            "social_data": {
-                "friends_list": user_data.get("friends", []),
-                "guild_membership": user_data.get("guild", {}),
-                "trading_history": user_data.get("trades", []),
-                "reputation": user_data.get("reputation", 0),
-                "social_interactions": user_data.get("social_log", []),
-                "blocked_players": user_data.get("blocked", []),
-                "favorite_players": user_data.get("favorites", [])
-            },
-            
-            # Game world state and exploration
-            "world_state": {
-                "visited_locations": user_data.get("visited_locations", []),
-                "unlocked_areas": user_data.get("unlocked_areas", []),
-                "discovered_secrets": user_data.get("secrets_found", []),
-                "world_events_witnessed": user_data.get("world_events", []),
-                "exploration_percentage": user_data.get("exploration_progress", 0),
-                "map_revelations": user_data.get("map_data", {}),
-                "environmental_interactions": user_data.get("environment_log", [])
-            },
-            
-            # Combat and battle statistics
-            "combat_data": {
-                "battles_fought": user_data.get("battles_total", 0),
-                "battles_won": user_data.get("battles_won", 0),
-                "battles_lost": user_data.get("battles_lost", 0),
-                "perfect_victories": user_data.get("perfect_wins", 0),
-                "damage_dealt": user_data.get("total_damage_dealt", 0),
-                "damage_taken": user_data.get("total_damage_taken", 0),
-                "abilities_used": user_data.get("ability_usage_stats", {}),
-                "strategies_employed": user_data.get("battle_strategies", {}),
-                "boss_defeats": user_data.get("bosses_defeated", [])
-            },
-            
-            # Seasonal and event data
-            "event_data": {
-                "seasonal_progress": user_data.get("seasonal_data", {}),
-                "event_participation": user_data.get("event_history", []),
-                "seasonal_rewards": user_data.get("seasonal_rewards", []),
-                "limited_content_accessed": user_data.get("limited_content", []),
-                "holiday_celebrations": user_data.get("holiday_data", {}),
-                "special_achievements": user_data.get("special_achievements", [])
-            },
-            
-            # Performance and analytics
-            "analytics": {
-                "session_durations": user_data.get("session_times", []),
-                "feature_usage": user_data.get("feature_stats", {}),
-                "error_encounters": user_data.get("error_log", []),
-                "performance_metrics": user_data.get("performance_data", {}),
-                "user_feedback": user_data.get("feedback_history", []),
-                "beta_participation": user_data.get("beta_features", [])
-            }
+def save_sections(save_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Summary sections of a save, read from old saves or derived from user_data"""
+    data = save_data.get("user_data", {})
+    sections = {
+        # Character progression and statistics
+        "character_stats": {
+            "level": data.get("level", 1),
+            "experience": data.get("experience", 0),
+            "skill_points": data.get("skill_points", 0),
+            "total_playtime": data.get("total_playtime", 0),
+            "creation_date": data.get("creation_date", datetime.now().isoformat()),
+            "last_login": data.get("last_login", datetime.now().isoformat()),
+            "login_streak": data.get("login_streak", 0),
+            "total_sessions": data.get("total_sessions", 0)
+        },
+        
+        # Story and quest progression
+        "story_progress": {
+            "current_chapter": data.get("current_chapter", 1),
+            "completed_quests": data.get("completed_quests", []),
+            "active_quests": data.get("active_quests", []),
+            "story_flags": data.get("story_flags", {}),
+            "dialogue_history": data.get("dialogue_history", []),
+            "choices_made": data.get("choices_made", {}),
+            "unlocked_content": data.get("unlocked_content", []),
+            "discovered_lore": data.get("discovered_lore", [])
+        },
+        
+        # Inventory and equipment comprehensive data
+        "inventory_data": {
+            "items": data.get("inventory", {}),
+            "equipment": data.get("equipment", {}),
+            "consumables": data.get("consumables", {}),
+            "materials": data.get("materials", {}),
+            "currency": data.get("currency", 0),
+            "bank_storage": data.get("bank_storage", {}),
+            "item_history": data.get("item_acquisition_history", []),
+            "crafting_recipes": data.get("known_recipes", []),
+            "upgrade_materials": data.get("upgrade_materials", {})
+        },
+        
+        # Gacha and collection system
+        "gacha_data": {
+            "pulls_total": data.get("gacha_pulls_total", 0),
+            "pulls_history": data.get("gacha_history", []),
+            "pity_counter": data.get("pity_counter", 0),
+            "guaranteed_counter": data.get("guaranteed_counter", 0),
+            "collection_book": data.get("collection_book", {}),
+            "rare_items_obtained": data.get("rare_collection", []),
+            "gacha_currency": data.get("gacha_currency", 0),
+            "banners_pulled": data.get("banners_history", {}),
+            "luck_statistics": data.get("gacha_luck_stats", {})
+        },
+        
+        # Achievement and milestone tracking
+        "achievements": {
+            "unlocked_achievements": data.get("achievements", []),
+            "achievement_progress": data.get("achievement_progress", {}),
+            "milestones_reached": data.get("milestones", []),
+            "records_set": data.get("personal_records", {}),
+            "badges_earned": data.get("badges", []),
+            "titles_unlocked": data.get("titles", []),
+            "active_title": data.get("active_title", None)
+        },
+        
+        # Settings and preferences
+        "user_settings": {
+            "game_preferences": data.get("settings", {}),
+            "display_options": data.get("display_settings", {}),
+            "audio_settings": data.get("audio_settings", {}),
+            "control_mappings": data.get("controls", {}),
+            "notification_preferences": data.get("notifications", {}),
+            "accessibility_options": data.get("accessibility", {}),
+            "language_preference": data.get("language", "en")
+        },
+        
+        # Social and multiplayer data
+        "social_data": {
+            "friends_list": data.get("friends", []),
+            "guild_membership": data.get("guild", {}),
+            "trading_history": data.get("trades", []),
+            "reputation": data.get("reputation", 0),
+            "social_interactions": data.get("social_log", []),
+            "blocked_players": data.get("blocked", []),
+            "favorite_players": data.get("favorites", [])
+        },
+        
+        # Game world state and exploration
+        "world_state": {
+            "visited_locations": data.get("visited_locations", []),
+            "unlocked_areas": data.get("unlocked_areas", []),
+            "discovered_secrets": data.get("secrets_found", []),
+            "world_events_witnessed": data.get("world_events", []),
+            "exploration_percentage": data.get("exploration_progress", 0),
+            "map_revelations": data.get("map_data", {}),
+            "environmental_interactions": data.get("environment_log", [])
+        },
+        
+        # Combat and battle statistics
+        "combat_data": {
+            "battles_fought": data.get("battles_total", 0),
+            "battles_won": data.get("battles_won", 0),
+            "battles_lost": data.get("battles_lost", 0),
+            "perfect_victories": data.get("perfect_wins", 0),
+            "damage_dealt": data.get("total_damage_dealt", 0),
+            "damage_taken": data.get("total_damage_taken", 0),
+            "abilities_used": data.get("ability_usage_stats", {}),
+            "strategies_employed": data.get("battle_strategies", {}),
+            "boss_defeats": data.get("bosses_defeated", [])
+        },
+        
+        # Seasonal and event data
+        "event_data": {
+            "seasonal_progress": data.get("seasonal_data", {}),
+            "event_participation": data.get("event_history", []),
+            "seasonal_rewards": data.get("seasonal_rewards", []),
+            "limited_content_accessed": data.get("limited_content", []),
+            "holiday_celebrations": data.get("holiday_data", {}),
+            "special_achievements": data.get("special_achievements", [])
+        },
+        
+        # Performance and analytics
+        "analytics": {
+            "session_durations": data.get("session_times", []),
+            "feature_usage": data.get("feature_stats", {}),
+            "error_encounters": data.get("error_log", []),
+            "performance_metrics": data.get("performance_data", {}),
+            "user_feedback": data.get("feedback_history", []),
+            "beta_participation": data.get("beta_features", [])
         }
+    }
+    # Format 2 saves stored the sections next to user_data
+    return {name: save_data.get(name, section) for name, section in sections.items()}
+
+def write_save(slot: int, raw: bytes) -> int:
+    """Compress and atomically write a serialized full save of the slot, returns its size in bytes"""
+    filename = save_file_path(slot)
+    # Compress before touching the disk, so a failure leaves the old save intact
+    payload = encode_save(filename, raw)
+
+    keep_backup(filename)
+    write_file_atomically(filename, payload)
+
+    # Drop copies of this slot left in another compression format
+    for compression in SAVE_EXTENSIONS:
+        other = save_file_path(slot, compression)
+        if other != filename and os.path.exists(other):
+            os.remove(other)
+
+    # A full save supersedes any journal written against the previous one
+    journal_file = save_journal_path(slot)
+    if os.path.exists(journal_file):
+        os.remove(journal_file)
+    return len(payload)
+
+def save_game(slot: int = 1, auto: bool = False) -> Optional[str]:
+    """Write a full save of the slot, returns its checkpoint id or None when saving failed"""
+    # Queued autosaves must land first, or they would overwrite this save
+    SAVE_WRITER.flush()
+    save_data = build_save_data()
+    SAVE_CHECKPOINTS[slot] = save_data["checkpoint_id"]
+    SAVE_WRITER.submit_checkpoint(slot, save_data)
+    # The writer encodes the live state while this waits for it, so the game keeps still meanwhile
+    SAVE_WRITER.flush()
+
+    # A failed write takes the slot's checkpoint back out
+    if SAVE_CHECKPOINTS.get(slot) != save_data["checkpoint_id"]:
+        for error in SAVE_WRITER.take_errors():
+            print(f"Error saving game: {error}")
+        return None
+    if not auto:
+        print(f"Game saved successfully in slot {slot}!")
+    return save_data["checkpoint_id"]
 
-        save_dir = get_save_directory()
-        filename = os.path.join(save_dir, f"save_{slot}.json")
-
-        # Create backup of existing save
-        if os.path.exists(filename):
-            backup_file = f"{filename}.backup"
-            os.replace(filename, backup_file)
-
-        with open(filename, "w") as f:
-            json.dump(save_data, f, indent=2)
-        if not auto:
-            print(f"Game saved successfully in slot {slot}!")
-    except Exception as e:
-        print(f"Error saving game: {e}")
-
-
-def prepare_user_data_for_save(data: Dict) -> Dict:
-    """
-    Prepare user data for saving by converting sets to lists
-    and handling any other special data types.
-    """
-    prepared_data = {}
-
-    # Handle nested dictionaries through recursion
-    for key, value in data.items():
-        if isinstance(value, set):
-            # Convert sets to lists
-            prepared_data[key] = list(value)
-        elif isinstance(value, dict):
-            # Recursively handle nested dictionaries
-            prepared_data[key] = prepare_user_data_for_save(value)
-        elif isinstance(value, list):
-            # Handle lists of dictionaries or sets
-            prepared_list = []
-            for item in value:
-                if isinstance(item, dict):
-                    prepared_list.append(prepare_user_data_for_save(item))
-                elif isinstance(item, set):
-                    prepared_list.append(list(item))
-                else:
-                    prepared_list.append(item)
-            prepared_data[key] = prepared_list
-        else:
-            # No conversion needed
-            prepared_data[key] = value
 
-    return prepared_data
+def activate_loaded_save(slot: int, save_data: Dict[str, Any]) -> None:
+    """Bring a save read from disk, primary or backup, up to date and make it the game's user_data"""
+    apply_save_journal(slot, save_data)
 
-def load_game(slot: int = 1) -> bool:
-    save_dir = get_save_directory()
-    filename = os.path.join(save_dir, f"save_{slot}.json")
+    # Format 2 and older saves carry derived sections next to user_data,
+    # only user_data is kept. Format 3 inventories are item lists, which
+    # restore_saved_fields() turns into an Inventory. The next save writes format 4
+    if save_data.get("save_format_version") != SAVE_FORMAT_VERSION:
+        print("Notice: Converting save file to latest version...")
 
-    try:
-        if not os.path.exists(filename):
-            print(f"No saved game found in slot {slot}.")
-            return False
+    global user_data
+    # Turn the saved forms of sets, the inventory and materials back into their containers
+    restore_saved_fields(save_data["user_data"])
+    # Wrapped once here, from then on the containers report their own changes to autosave
+    user_data = track_user_data(save_data["user_data"])
 
-        with open(filename, "r", encoding='utf-8') as f:
-            save_data = json.load(f)
-            saved_version = save_data.get("version", "1.0")
+    # Ensure all required keys exist
+    ensure_user_data_keys(user_data)
 
-            # Handle version differences
-            if saved_version != "1.1":
-                print("Notice: Converting save file to latest version...")
+    # Apply any necessary version-specific migrations
+    if "gacha_version" not in save_data or save_data["gacha_version"] != "1.0":
+        print("Migrating gacha system data...")
+        migrate_gacha_data(user_data)
 
-            global user_data
-            user_data = save_data["user_data"]
+    # Ensure all gacha system components are fully initialized
+    ensure_gacha_system_initialized(user_data)
 
-            # Convert any lists back to sets where needed
-            user_data = restore_sets_from_lists(user_data)
+    # Ensure all archaeology system components are fully initialized
+    ensure_archaeology_system_initialized(user_data)
 
-            # Ensure all required keys exist
-            ensure_user_data_keys(user_data)
+    # Update archaeology and gacha systems interaction
+    if "archaeology" in user_data and "gacha" in user_data:
+        calculate_archaeology_gacha_bonuses(user_data)
 
-            # Apply any necessary version-specific migrations
-            if "gacha_version" not in save_data or save_data["gacha_version"] != "1.0":
-                print("Migrating gacha system data...")
-                migrate_gacha_data(user_data)
+    # Create deep connections between all game systems
+    integrate_all_systems()
 
-            # Ensure all gacha system components are fully initialized
-            ensure_gacha_system_initialized(user_data)
+    # Plots of the loaded farm ripen on the current game clock
+    schedule_crop_events()
 
-            # Ensure all archaeology system components are fully initialized
-            ensure_archaeology_system_initialized(user_data)
+def load_game(slot: int = 1) -> bool:
+    SAVE_WRITER.flush()
+    filename = find_save_file(slot) or save_file_path(slot)
 
-            # Update archaeology and gacha systems interaction
-            if "archaeology" in user_data and "gacha" in user_data:
-                calculate_archaeology_gacha_bonuses(user_data)
+    try:
+        if not os.path.exists(filename):
+            print(f"No saved game found in slot {slot}.")
+            return False
 
-            # Create deep connections between all game systems
-            integrate_all_systems()
+        save_data = read_save_file(filename)
+        activate_loaded_save(slot, save_data)
 
-            print(f"Game loaded successfully from slot {slot}!")
-            print(f"Save timestamp: {save_data['timestamp']}")
+        print(f"Game loaded successfully from slot {slot}!")
+        print(f"Save timestamp: {save_data['timestamp']}")
 
-            # Update daily login reward if player logs in on a new day
-            check_daily_login_reward()
+        # Update daily login reward if player logs in on a new day
+        check_daily_login_reward()
 
-            return True
+        return True
     except Exception as e:
         print(f"Error loading game: {e}")
         # Try to load backup if it exists
@@ -15420,263 +14365,194 @@ def load_game(slot: int = 1) -> bool:
         if os.path.exists(backup_file):
             print("Attempting to load backup...")
             try:
-                with open(backup_file, "r", encoding='utf-8') as f:
-                    save_data = json.load(f)
-                    user_data = save_data["user_data"]
-                    user_data = restore_sets_from_lists(user_data)
-                    ensure_user_data_keys(user_data)
-                    ensure_gacha_system_initialized(user_data)
-                    ensure_archaeology_system_initialized(user_data)
-                    calculate_archaeology_gacha_bonuses(user_data)
-                    print("Backup loaded successfully!")
-                    return True
+                save_data = read_save_file(backup_file)
+                activate_loaded_save(slot, save_data)
+                print("Backup loaded successfully!")
+                check_daily_login_reward()
+                return True
             except Exception as be:
                 print(f"Backup load failed: {be}")
         return False
 
+def gacha_character_records() -> Dict[str, Any]:
+    """Per-character records for bonuses; the gacha roster itself is a plain list of names"""
+    characters = user_data.get("gacha", {}).get("characters", {})
+    return characters if isinstance(characters, dict) else {}
+
+
+# Cross-system bonuses last derived, the inputs they came from and the user_data they were applied to
+SYSTEM_BONUS_CACHE: Dict[str, Any] = {}
+
+def system_bonus_inputs() -> Tuple[Any, ...]:
+    """The parts of the archaeology, literature and gacha state that cross-system bonuses depend on"""
+    arch = user_data.get("archaeology", {})
+    books = user_data["literature"].get("books", {}) if "literature" in user_data else {}
+    roster = tuple(
+        (char_id, char_data.get("class", ""), char_data.get("element", ""), char_data.get("rarity", ""),
+         bool(char_data.get("active", False)))
+        for char_id, char_data in gacha_character_records().items())
+    return (
+        "archaeology" in user_data,
+        "literature" in user_data,
+        "gacha" in user_data,
+        bool(arch.get("excavated_artifacts", [])),
+        tuple(arch.get("knowledge", [])),
+        tuple(arch.get("completed_sets", [])),
+        sum(1 for book in books.values() if book.get("read", False)),
+        bool("gacha" in user_data and user_data["gacha"].get("characters", {})),
+        roster,
+    )
 
-def restore_sets_from_lists(data: Dict[str, Any]) -> None:
-    """
-    Restores sets from lists in the loaded data.
-    Used for achievement sets and other set data structures that were converted to lists for saving.
+def derive_system_bonuses(has_archaeology: bool, has_literature: bool, has_gacha: bool, excavated: bool,
+                          knowledge: Tuple[str, ...], completed_sets: Tuple[str, ...], read_count: int,
+                          has_characters: bool, roster: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Bonuses that the archaeology, literature and gacha systems give each other, from their state alone"""
+    characters: Dict[str, Dict[str, Any]] = {char_id: {} for char_id, *_ in roster}
+    archaeology = {"excavation_skill": 0, "analysis_skill": 0, "rare_find_bonus": 0, "research_bonus": 0}
+    pull_rate_bonus = None
+    progress = 0
+
+    def add_stat(char_id: str, stat: str, amount: int) -> None:
+        stats = characters[char_id].setdefault("bonus_stats", {})
+        stats[stat] = stats.get(stat, 0) + amount
+
+    def grant(char_id: str, field: str, name: str) -> None:
+        names = characters[char_id].setdefault(field, [])
+        if name not in names:
+            names.append(name)
+
+    # Archaeology: knowledge raises pull rates, complete artifact sets strengthen characters
+    if has_archaeology:
+        if excavated:
+            progress += 1
+        if has_gacha and knowledge:
+            # Increase 5-star character/weapon rate based on knowledge
+            pull_rate_bonus = min(0.02, len(knowledge) * 0.005)  # Max 2% bonus
+            for char_id, char_class, element, rarity, active in roster:
+                for set_name in completed_sets:
+                    # Temple collection benefits magical characters
+                    if set_name == "Temple Collection" and element in ["Fire", "Water", "Light"]:
+                        add_stat(char_id, "magic_power", 15)
+                    # Mining collection benefits earth characters
+                    elif set_name == "Mining Collection" and element == "Earth":
+                        add_stat(char_id, "defense", 20)
+                    # Royal collection benefits all characters
+                    elif set_name == "Royal Collection":
+                        add_stat(char_id, "leadership", 10)
+
+    # Literature: each read book gives a small bonus based on character class
+    if has_literature and read_count:
+        progress += 1
+        if has_gacha:
+            for char_id, char_class, element, rarity, active in roster:
+                characters[char_id].setdefault("bonus_stats", {})
+                if char_class == "Scholar":
+                    add_stat(char_id, "intelligence", read_count * 3)
+                elif char_class == "Warrior":
+                    add_stat(char_id, "strength", read_count)
+                elif char_class == "Mage":
+                    add_stat(char_id, "magic_power", read_count * 2)
+                else:
+                    add_stat(char_id, "knowledge", read_count)
+
+    # Gacha: active characters help with archaeology skills
+    if has_gacha:
+        if has_characters:
+            progress += 1
+        if has_archaeology:
+            for char_id, char_class, element, rarity, active in roster:
+                if not active:
+                    continue
+                # Different classes help with different archaeology skills
+                if char_class in ("Warrior", "Explorer"):
+                    archaeology["excavation_skill"] += 2 if char_class == "Warrior" else 3
+                elif char_class in ("Mage", "Scholar"):
+                    archaeology["analysis_skill"] += 2 if char_class == "Mage" else 3
+                # Elements can provide special archaeology benefits
+                if element == "Earth":
+                    archaeology["excavation_skill"] += 2
+                    archaeology["rare_find_bonus"] += 0.05
+                elif element == "Water":
+                    archaeology["analysis_skill"] += 1
+                elif element == "Fire":
+                    archaeology["rare_find_bonus"] += 0.03
+
+    # Synergies once at least two systems have progress
+    if progress >= 2:
+        if has_archaeology and has_gacha:
+            # Archaeological knowledge unlocks special abilities for matching characters
+            for char_id, char_class, element, rarity, active in roster:
+                for knowledge_name in knowledge:
+                    if knowledge_name == "Temple Civilization" and element in ["Fire", "Water", "Light"]:
+                        grant(char_id, "special_abilities", "Divine Ritual")
+                    elif knowledge_name == "Mining Technologies" and (element == "Earth" or char_class == "Warrior"):
+                        grant(char_id, "special_abilities", "Treasure Hunter")
+                    elif knowledge_name == "Ancient Astronomy":
+                        grant(char_id, "special_abilities", "Celestial Navigation")
+                # A complete Royal Collection arms 5-star characters
+                if "Royal Collection" in completed_sets and rarity == "5-Star":
+                    grant(char_id, "special_weapons", "Royal Armament")
+
+        # Reading multiple books improves archaeological research, up to 50%
+        if has_literature and has_gacha and read_count >= 3 and has_archaeology:
+            archaeology["research_bonus"] = min(50, read_count * 5)
+
+    return {"progress": progress, "pull_rate_bonus": pull_rate_bonus,
+            "characters": characters, "archaeology": archaeology}
+
+def apply_system_bonuses(bonuses: Dict[str, Any]) -> None:
+    """Write derived bonuses into user_data, replacing whatever was applied before"""
+    if bonuses["pull_rate_bonus"] is not None:
+        pull_rates = user_data["gacha"].setdefault("pull_rates", {})
+        pull_rates["archaeology_bonus"] = bonuses["pull_rate_bonus"]
+
+    records = gacha_character_records()
+    for char_id, derived in bonuses["characters"].items():
+        char_data = records.get(char_id)
+        if char_data is None:
+            continue
+        if "bonus_stats" in derived:
+            char_data["bonus_stats"] = dict(derived["bonus_stats"])
+        for field in ("special_abilities", "special_weapons"):
+            for name in derived.get(field, []):
+                if name not in char_data.setdefault(field, []):
+                    char_data[field].append(name)
+
+    # Archaeology values also grow through play, so only the bonus part is swapped
+    if "archaeology" in user_data:
+        arch = user_data["archaeology"]
+        applied = arch.get("system_bonuses", {})
+        for field, amount in bonuses["archaeology"].items():
+            if amount or field in applied:
+                base = arch.get(field, 1 if field.endswith("_skill") else 0) - applied.get(field, 0)
+                arch[field] = base + amount
+        arch["system_bonuses"] = {field: amount for field, amount in bonuses["archaeology"].items() if amount}
+
+@timed_phase("integrate_all_systems")
+def integrate_all_systems() -> bool:
     """
-    if not isinstance(data, dict):
-        return data
-
-    result = {}
-    for key, value in data.items():
-        if isinstance(value, dict):
-            # Recursively process nested dictionaries
-            result[key] = restore_sets_from_lists(value)
-        elif isinstance(value, list):
-            # Special case for achievements.completed and achievements.stats.areas_visited which should be sets
-            if key == "completed" and "achievements" in result:
-                result[key] = set(value)
-            elif key == "areas_visited" and "stats" in result and "achievements" in data:
-                result[key] = set(value)
-            else:
-                # Process list items
-                processed_list = []
-                for item in value:
-                    if isinstance(item, dict):
-                        processed_list.append(restore_sets_from_lists(item))
-                    else:
-                        processed_list.append(item)
-                result[key] = processed_list
-        else:
-            result[key] = value
-
-    # Special case for achievement data
-    if "achievements" in data and isinstance(data["achievements"], dict):
-        if "completed" in data["achievements"] and isinstance(data["achievements"]["completed"], list):
-            result.setdefault("achievements", {})["completed"] = set(data["achievements"]["completed"])
-
-        if "stats" in data["achievements"] and isinstance(data["achievements"]["stats"], dict):
-            if "areas_visited" in data["achievements"]["stats"] and isinstance(data["achievements"]["stats"]["areas_visited"], list):
-                result.setdefault("achievements", {}).setdefault("stats", {})["areas_visited"] = set(data["achievements"]["stats"]["areas_visited"])
-
-    return result
-
-
-def integrate_all_systems() -> None:
-    """
-    Creates deep connections between archaeology, literature, and gacha systems.
-    This function implements synergies that allow each system to enhance the others.
+    Creates deep connections between archaeology, literature, and gacha systems.
+    This function implements synergies that allow each system to enhance the others.
 
     Important: This is called after loading a game and at key points during gameplay
     to ensure all systems properly interact and provide benefits to each other.
+    The bonuses are derived from the systems' state, so calling it again changes
+    nothing until a set completes, knowledge is gained or the roster changes.
 
     Returns:
         bool: True if integration was successful with multiple systems interacting
     """
-    global user_data
-
-    # Track progress in each system to determine integration possibilities
-    systems_progress = 0
-
-    # Check progress in archaeology system
-    if "archaeology" in user_data:
-        arch_data = user_data["archaeology"]
-        if arch_data.get("excavated_artifacts", []):
-            systems_progress += 1
-
-        # Apply archaeology bonuses to character gacha system
-        if "gacha" in user_data and arch_data.get("knowledge", []):
-            # Archaeological knowledge can increase pull rates
-            knowledge_count = len(arch_data.get("knowledge", []))
-            if knowledge_count > 0:
-                # Increase 5-star character/weapon rate based on knowledge
-                bonus_rate = min(0.02, knowledge_count * 0.005)  # Max 2% bonus
-                if "pull_rates" not in user_data["gacha"]:
-                    user_data["gacha"]["pull_rates"] = {}
-                user_data["gacha"]["pull_rates"]["archaeology_bonus"] = bonus_rate
-
-            # Complete artifact sets provide character bonuses
-            if "completed_sets" in arch_data and arch_data["completed_sets"]:
-                for char_id, char_data in user_data["gacha"].get("characters", {}).items():
-                    # Apply bonuses to matching characters based on artifact themes
-                    for set_name in arch_data["completed_sets"]:
-                        # Temple collection benefits magical characters
-                        if set_name == "Temple Collection" and char_data.get("element") in ["Fire", "Water", "Light"]:
-                            char_data["bonus_stats"] = char_data.get("bonus_stats", {})
-                            char_data["bonus_stats"]["magic_power"] = char_data["bonus_stats"].get("magic_power", 0) + 15
-
-                        # Mining collection benefits earth characters
-                        elif set_name == "Mining Collection" and char_data.get("element") == "Earth":
-                            char_data["bonus_stats"] = char_data.get("bonus_stats", {})
-                            char_data["bonus_stats"]["defense"] = char_data["bonus_stats"].get("defense", 0) + 20
-
-                        # Royal collection benefits all characters
-                        elif set_name == "Royal Collection":
-                            char_data["bonus_stats"] = char_data.get("bonus_stats", {})
-                            char_data["bonus_stats"]["leadership"] = char_data["bonus_stats"].get("leadership", 0) + 10
-
-    # Check progress in literature system
-    if "literature" in user_data:
-        lit_data = user_data["literature"]
-        read_books = [book for book_id, book in lit_data.get("books", {}).items() if book.get("read", False)]
-        if read_books:
-            systems_progress += 1
-
-        # Apply literature bonuses to characters
-        if "gacha" in user_data and read_books:
-            # Reading books provides character bonuses
-            for char_id, char_data in user_data["gacha"].get("characters", {}).items():
-                # Initialize bonus stats if needed
-                if "bonus_stats" not in char_data:
-                    char_data["bonus_stats"] = {}
-
-                # Each read book gives a small bonus based on book type and character class
-                read_count = len(read_books)
-                char_class = char_data.get("class", "")
-
-                if char_class == "Scholar":
-                    char_data["bonus_stats"]["intelligence"] = char_data["bonus_stats"].get("intelligence", 0) + (read_count * 3)
-                elif char_class == "Warrior":
-                    char_data["bonus_stats"]["strength"] = char_data["bonus_stats"].get("strength", 0) + (read_count)
-                elif char_class == "Mage":
-                    char_data["bonus_stats"]["magic_power"] = char_data["bonus_stats"].get("magic_power", 0) + (read_count * 2)
-                else:
-                    # Default bonus for all other classes
-                    char_data["bonus_stats"]["knowledge"] = char_data["bonus_stats"].get("knowledge", 0) + (read_count)
-
-    # Check progress in gacha system
-    if "gacha" in user_data:
-        # Check if player has characters
-        if user_data["gacha"].get("characters", {}):
-            systems_progress += 1
-
-        # Characters can provide archaeology bonuses
-        if "archaeology" in user_data:
-            # Calculate archaeology bonuses from characters
-            skill_bonuses = {"excavation": 0, "analysis": 0}
-            rare_find_chance = 0
-            artifacts_expertise = []
-
-            # Apply character bonuses to archaeology
-            for char_id, char_info in user_data["gacha"].get("characters", {}).items():
-                if not char_info.get("active", False):
-                    continue  # Only apply bonuses from active characters
-
-                char_class = char_info.get("class", "")
-                char_element = char_info.get("element", "")
-
-                # Different classes help with different archaeology skills
-                if char_class == "Warrior":
-                    skill_bonuses["excavation"] += 2  # Warriors help with digging
-                elif char_class == "Mage":
-                    skill_bonuses["analysis"] += 2  # Mages help with analysis
-                elif char_class == "Scholar":
-                    skill_bonuses["analysis"] += 3  # Scholars are best at analysis
-                elif char_class == "Explorer":
-                    skill_bonuses["excavation"] += 3  # Explorers are best at excavation
+    inputs = system_bonus_inputs()
+    if SYSTEM_BONUS_CACHE.get("inputs") == inputs:
+        if SYSTEM_BONUS_CACHE.get("data") is user_data:
+            return SYSTEM_BONUS_CACHE["bonuses"]["progress"] >= 2
+        bonuses = SYSTEM_BONUS_CACHE["bonuses"]
+    else:
+        bonuses = derive_system_bonuses(*inputs)
 
-                # Elements can provide special archaeology benefits
-                if char_element == "Earth":
-                    skill_bonuses["excavation"] += 2  # Earth characters have affinity for digging
-                    rare_find_chance += 0.05  # 5% better chance for rare finds
-                elif char_element == "Water":
-                    skill_bonuses["analysis"] += 1  # Water helps clean artifacts
-                elif char_element == "Fire":
-                    rare_find_chance += 0.03  # Fire illuminates hidden treasures
-
-                # Add character expertise to archaeology system
-                char_expertise = char_info.get("archaeology_expertise", [])
-                if char_expertise:
-                    artifacts_expertise.extend(char_expertise)
-
-            # Apply the bonuses to archaeology system
-            if skill_bonuses["excavation"] > 0:
-                user_data["archaeology"]["excavation_skill"] = user_data["archaeology"].get("excavation_skill", 1) + skill_bonuses["excavation"]
-            if skill_bonuses["analysis"] > 0:
-                user_data["archaeology"]["analysis_skill"] = user_data["archaeology"].get("analysis_skill", 1) + skill_bonuses["analysis"]
-            if rare_find_chance > 0:
-                user_data["archaeology"]["rare_find_bonus"] = user_data["archaeology"].get("rare_find_bonus", 0) + rare_find_chance
-
-    # Check if all systems have synergy effects to apply
-    if systems_progress >= 2:
-        # Create synergy effects when multiple systems have progress
-
-        # 1. Archaeological discoveries can unlock special character abilities
-        if "archaeology" in user_data and "gacha" in user_data:
-            arch_data = user_data["archaeology"]
-            knowledge_list = arch_data.get("knowledge", [])
-
-            # Each type of knowledge can unlock special abilities for matching characters
-            for knowledge_name in knowledge_list:
-                if knowledge_name == "Temple Civilization":
-                    # Improves magical characters
-                    for char_id, char_data in user_data["gacha"].get("characters", {}).items():
-                        if char_data.get("element") in ["Fire", "Water", "Light"]:
-                            if "special_abilities" not in char_data:
-                                char_data["special_abilities"] = []
-                            if "Divine Ritual" not in char_data["special_abilities"]:
-                                char_data["special_abilities"].append("Divine Ritual")
-
-                elif knowledge_name == "Mining Technologies":
-                    # Improves earth and physical characters
-                    for char_id, char_data in user_data["gacha"].get("characters", {}).items():
-                        if char_data.get("element") == "Earth" or char_data.get("class") == "Warrior":
-                            if "special_abilities" not in char_data:
-                                char_data["special_abilities"] = []
-                            if "Treasure Hunter" not in char_data["special_abilities"]:
-                                char_data["special_abilities"].append("Treasure Hunter")
-
-                elif knowledge_name == "Ancient Astronomy":
-                    # Improves all characters with cosmic awareness
-                    for char_id, char_data in user_data["gacha"].get("characters", {}).items():
-                        if "special_abilities" not in char_data:
-                            char_data["special_abilities"] = []
-                        if "Celestial Navigation" not in char_data["special_abilities"]:
-                            char_data["special_abilities"].append("Celestial Navigation")
-
-        # 2. Literature knowledge and character combination can yield unique research insights
-        if "literature" in user_data and "gacha" in user_data:
-            lit_data = user_data["literature"]
-            read_books = [book for book_id, book in lit_data.get("books", {}).items() if book.get("read", False)]
-
-            if read_books and len(read_books) >= 3 and "archaeology" in user_data:
-                # Reading multiple books improves archaeological research
-                research_bonus = min(50, len(read_books) * 5)  # Up to 50% research bonus
-                user_data["archaeology"]["research_bonus"] = user_data["archaeology"].get("research_bonus", 0) + research_bonus
-
-        # 3. Complete archaeological sets can yield special character-specific weapons
-        if "archaeology" in user_data and "gacha" in user_data:
-            arch_data = user_data["archaeology"]
-            completed_sets = arch_data.get("completed_sets", [])
-
-            if completed_sets:
-                # Each completed set can unlock a special weapon for appropriate characters
-                for char_id, char_data in user_data["gacha"].get("characters", {}).items():
-                    if "Royal Collection" in completed_sets and char_data.get("rarity", "") == "5-Star":
-                        # Add royal weapon for 5-star characters
-                        if "special_weapons" not in char_data:
-                            char_data["special_weapons"] = []
-                        if "Royal Armament" not in char_data["special_weapons"]:
-                            char_data["special_weapons"].append("Royal Armament")
-
-    # Return True if integration had effects to apply
-    return systems_progress >= 2
+    apply_system_bonuses(bonuses)
+    SYSTEM_BONUS_CACHE.update(inputs=inputs, bonuses=bonuses, data=user_data)
+    return bonuses["progress"] >= 2
 
 def ensure_archaeology_system_initialized(data: Dict[str, Any]) -> None:
     """
@@ -15748,6 +14624,28 @@ def ensure_archaeology_system_initialized(data: Dict[str, Any]) -> None:
         calculate_archaeology_gacha_bonuses(data)
 
 
+# Collections whose completion gives gacha bonuses
+BONUS_COLLECTIONS = ("Temple Collection", "Mining Collection", "Astronomy Collection", "Royal Collection", "War Collection")
+
+# Artifacts of each set in ARCHAEOLOGICAL_ARTIFACTS, built on first use
+ARCHAEOLOGY_SET_MEMBERS: Dict[str, List[str]] = {}
+
+# gacha_bonuses already worked out, by (knowledge, completed collections)
+ARCHAEOLOGY_BONUS_CACHE: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], Dict[str, Any]] = {}
+
+def completed_collections(arch: Dict[str, Any]) -> List[str]:
+    """Bonus collections the player has every artifact of, in the order they were started"""
+    if not ARCHAEOLOGY_SET_MEMBERS:
+        for artifact, artifact_data in ARCHAEOLOGICAL_ARTIFACTS.items():
+            ARCHAEOLOGY_SET_MEMBERS.setdefault(artifact_data.get("set"), []).append(artifact)
+    completed = []
+    for collection, artifacts in arch.get("artifact_collections", {}).items():
+        if collection in BONUS_COLLECTIONS:
+            owned = set(artifacts)
+            if all(artifact in owned for artifact in ARCHAEOLOGY_SET_MEMBERS.get(collection, [])):
+                completed.append(collection)
+    return completed
+
 def calculate_archaeology_gacha_bonuses(data: Dict[str, Any]) -> Dict[str, float]:
     """
     Calculate gacha bonuses based on archaeological knowledge and artifacts.
@@ -15758,6 +14656,13 @@ def calculate_archaeology_gacha_bonuses(data: Dict[str, Any]) -> Dict[str, float
 
     arch = data["archaeology"]
 
+    # The bonuses only change when knowledge is gained or a collection completes
+    completed = completed_collections(arch)
+    key = (tuple(arch.get("knowledge", [])), tuple(completed))
+    if key in ARCHAEOLOGY_BONUS_CACHE:
+        arch["gacha_bonuses"] = copy.deepcopy(ARCHAEOLOGY_BONUS_CACHE[key])
+        return
+
     # Reset bonuses before recalculating
     arch["gacha_bonuses"] = {
         "pull_rate_bonus": 0.0,
@@ -15870,116 +14775,99 @@ def calculate_archaeology_gacha_bonuses(data: Dict[str, Any]) -> Dict[str, float
                 })
 
     # Apply bonuses from complete artifact collections
-    for collection, artifacts in arch.get("artifact_collections", {}).items():
-        # Check if collection is complete
-        if collection in ["Temple Collection", "Mining Collection", "Astronomy Collection", "Royal Collection", "War Collection"]:
-            collection_completed = True
-            expected_artifacts = []
-
-            # Get all artifacts that should be in this collection
-            for artifact, data in ARCHAEOLOGICAL_ARTIFACTS.items():
-                if data.get("set") == collection:
-                    expected_artifacts.append(artifact)
-
-            # Check if all expected artifacts are in the collection
-            for expected in expected_artifacts:
-                if expected not in artifacts:
-                    collection_completed = False
-                    break
-
-            # Apply bonus for complete collection
-            if collection_completed:
-                if collection == "Temple Collection":
-                    arch["gacha_bonuses"]["pull_rate_bonus"] += 1.0  # 1% increased pull rates
-                    arch["gacha_bonuses"]["special_wish_artifacts"].append("Ritual Mask")
-                    # Increased elemental damage for all characters
-                    arch["gacha_bonuses"]["combat_bonuses"]["elemental_mastery"] += 15.0
-                    # Unlock special temple-themed cosmetics for characters
-                    if "collection_cosmetics" not in arch["gacha_bonuses"]:
-                        arch["gacha_bonuses"]["collection_cosmetics"] = {}
-                    arch["gacha_bonuses"]["collection_cosmetics"]["Temple"] = [
-                        "High Priest's Robes", "Sacred Headdress", "Temple Guardian Armor"
-                    ]
-                    # Unlock special temple battle arena
-                    if "special_arenas" not in arch["gacha_bonuses"]:
-                        arch["gacha_bonuses"]["special_arenas"] = []
-                    arch["gacha_bonuses"]["special_arenas"].append("Ancient Temple Arena")
-
-                elif collection == "Mining Collection":
-                    arch["gacha_bonuses"]["material_drop_bonus"] += 10.0  # 10% increased material drops
-                    arch["gacha_bonuses"]["special_wish_artifacts"].append("Mineral Specimen")
-                    # Better mining resource drops
-                    arch["gacha_bonuses"]["mining_efficiency"] = 1.25  # 25% better mining yields
-                    # Unlock mining cosmetics
-                    if "collection_cosmetics" not in arch["gacha_bonuses"]:
-                        arch["gacha_bonuses"]["collection_cosmetics"] = {}
-                    arch["gacha_bonuses"]["collection_cosmetics"]["Mining"] = [
-                        "Miner's Outfit", "Crystal Crown", "Gem-studded Armor"
-                    ]
-                    # Special ability to find rare minerals during excavations
-                    arch["gacha_bonuses"]["special_abilities"].append({
-                        "name": "Mineral Sense",
-                        "description": "Characters can detect rare minerals and gems during excavations",
-                        "effect": {"rare_mineral_chance": 0.15}
-                    })
+    for collection in completed:
+        if collection == "Temple Collection":
+            arch["gacha_bonuses"]["pull_rate_bonus"] += 1.0  # 1% increased pull rates
+            arch["gacha_bonuses"]["special_wish_artifacts"].append("Ritual Mask")
+            # Increased elemental damage for all characters
+            arch["gacha_bonuses"]["combat_bonuses"]["elemental_mastery"] += 15.0
+            # Unlock special temple-themed cosmetics for characters
+            if "collection_cosmetics" not in arch["gacha_bonuses"]:
+                arch["gacha_bonuses"]["collection_cosmetics"] = {}
+            arch["gacha_bonuses"]["collection_cosmetics"]["Temple"] = [
+                "High Priest's Robes", "Sacred Headdress", "Temple Guardian Armor"
+            ]
+            # Unlock special temple battle arena
+            if "special_arenas" not in arch["gacha_bonuses"]:
+                arch["gacha_bonuses"]["special_arenas"] = []
+            arch["gacha_bonuses"]["special_arenas"].append("Ancient Temple Arena")
+
+        elif collection == "Mining Collection":
+            arch["gacha_bonuses"]["material_drop_bonus"] += 10.0  # 10% increased material drops
+            arch["gacha_bonuses"]["special_wish_artifacts"].append("Mineral Specimen")
+            # Better mining resource drops
+            arch["gacha_bonuses"]["mining_efficiency"] = 1.25  # 25% better mining yields
+            # Unlock mining cosmetics
+            if "collection_cosmetics" not in arch["gacha_bonuses"]:
+                arch["gacha_bonuses"]["collection_cosmetics"] = {}
+            arch["gacha_bonuses"]["collection_cosmetics"]["Mining"] = [
+                "Miner's Outfit", "Crystal Crown", "Gem-studded Armor"
+            ]
+            # Special ability to find rare minerals during excavations
+            arch["gacha_bonuses"]["special_abilities"].append({
+                "name": "Mineral Sense",
+                "description": "Characters can detect rare minerals and gems during excavations",
+                "effect": {"rare_mineral_chance": 0.15}
+            })
 
-                elif collection == "Astronomy Collection":
-                    arch["gacha_bonuses"]["pull_rate_bonus"] += 2.0  # 2% increased pull rates
-                    arch["gacha_bonuses"]["special_wish_artifacts"].append("Celestial Globe")
-                    # Stars and cosmos themed abilities
-                    arch["gacha_bonuses"]["combat_bonuses"]["critical_rate"] += 5.0
-                    # Special star-themed cosmetics
-                    if "collection_cosmetics" not in arch["gacha_bonuses"]:
-                        arch["gacha_bonuses"]["collection_cosmetics"] = {}
-                    arch["gacha_bonuses"]["collection_cosmetics"]["Astronomy"] = [
-                        "Star Mage Robes", "Constellation Crown", "Celestial Armor"
-                    ]
-                    # Integration with literature system - unlock cosmic literature
-                    if "unlocked_literature" not in arch["gacha_bonuses"]:
-                        arch["gacha_bonuses"]["unlocked_literature"] = []
-                    arch["gacha_bonuses"]["unlocked_literature"].extend([
-                        "Cosmic Secrets", "Star Charts of the Ancients", "Celestial Navigation"
-                    ])
-
-                elif collection == "Royal Collection":
-                    arch["gacha_bonuses"]["character_exp_bonus"] += 10.0  # 10% increased character exp
-                    arch["gacha_bonuses"]["special_wish_artifacts"].append("Royal Scepter")
-                    # Royal abilities and bonuses
-                    arch["gacha_bonuses"]["combat_bonuses"]["health"] += 10.0
-                    arch["gacha_bonuses"]["combat_bonuses"]["defense"] += 5.0
-                    # Royal themed cosmetics
-                    if "collection_cosmetics" not in arch["gacha_bonuses"]:
-                        arch["gacha_bonuses"]["collection_cosmetics"] = {}
-                    arch["gacha_bonuses"]["collection_cosmetics"]["Royal"] = [
-                        "Royal Crown", "Royal Robes", "Royal Guard Armor"
-                    ]
-                    # Enhanced diplomacy with NPCs
-                    arch["gacha_bonuses"]["special_abilities"].append({
-                        "name": "Royal Authority",
-                        "description": "Characters have enhanced dialogue options with NPCs and better prices with merchants",
-                        "effect": {"merchant_discount": 0.10, "npc_relationship_bonus": 15}
-                    })
+        elif collection == "Astronomy Collection":
+            arch["gacha_bonuses"]["pull_rate_bonus"] += 2.0  # 2% increased pull rates
+            arch["gacha_bonuses"]["special_wish_artifacts"].append("Celestial Globe")
+            # Stars and cosmos themed abilities
+            arch["gacha_bonuses"]["combat_bonuses"]["critical_rate"] += 5.0
+            # Special star-themed cosmetics
+            if "collection_cosmetics" not in arch["gacha_bonuses"]:
+                arch["gacha_bonuses"]["collection_cosmetics"] = {}
+            arch["gacha_bonuses"]["collection_cosmetics"]["Astronomy"] = [
+                "Star Mage Robes", "Constellation Crown", "Celestial Armor"
+            ]
+            # Integration with literature system - unlock cosmic literature
+            if "unlocked_literature" not in arch["gacha_bonuses"]:
+                arch["gacha_bonuses"]["unlocked_literature"] = []
+            arch["gacha_bonuses"]["unlocked_literature"].extend([
+                "Cosmic Secrets", "Star Charts of the Ancients", "Celestial Navigation"
+            ])
+
+        elif collection == "Royal Collection":
+            arch["gacha_bonuses"]["character_exp_bonus"] += 10.0  # 10% increased character exp
+            arch["gacha_bonuses"]["special_wish_artifacts"].append("Royal Scepter")
+            # Royal abilities and bonuses
+            arch["gacha_bonuses"]["combat_bonuses"]["health"] += 10.0
+            arch["gacha_bonuses"]["combat_bonuses"]["defense"] += 5.0
+            # Royal themed cosmetics
+            if "collection_cosmetics" not in arch["gacha_bonuses"]:
+                arch["gacha_bonuses"]["collection_cosmetics"] = {}
+            arch["gacha_bonuses"]["collection_cosmetics"]["Royal"] = [
+                "Royal Crown", "Royal Robes", "Royal Guard Armor"
+            ]
+            # Enhanced diplomacy with NPCs
+            arch["gacha_bonuses"]["special_abilities"].append({
+                "name": "Royal Authority",
+                "description": "Characters have enhanced dialogue options with NPCs and better prices with merchants",
+                "effect": {"merchant_discount": 0.10, "npc_relationship_bonus": 15}
+            })
 
-                elif collection == "War Collection":
-                    arch["gacha_bonuses"]["material_drop_bonus"] += 5.0  # 5% increased material drops
-                    arch["gacha_bonuses"]["character_exp_bonus"] += 5.0  # 5% increased character exp
-                    arch["gacha_bonuses"]["special_wish_artifacts"].append("Commander's Insignia")
-                    # Combat bonuses
-                    arch["gacha_bonuses"]["combat_bonuses"]["attack"] += 10.0
-                    arch["gacha_bonuses"]["combat_bonuses"]["speed"] += 5.0
-                    # War-themed cosmetics
-                    if "collection_cosmetics" not in arch["gacha_bonuses"]:
-                        arch["gacha_bonuses"]["collection_cosmetics"] = {}
-                    arch["gacha_bonuses"]["collection_cosmetics"]["War"] = [
-                        "Commander's Armor", "Battle Helm", "War Banner Cape"
-                    ]
-                    # Strategic battle abilities
-                    arch["gacha_bonuses"]["special_abilities"].append({
-                        "name": "Battle Tactics",
-                        "description": "Characters gain enhanced positioning in battle and can use special formation abilities",
-                        "effect": {"formation_bonus": 0.15, "strategic_retreat_chance": 0.20}
-                    })
+        elif collection == "War Collection":
+            arch["gacha_bonuses"]["material_drop_bonus"] += 5.0  # 5% increased material drops
+            arch["gacha_bonuses"]["character_exp_bonus"] += 5.0  # 5% increased character exp
+            arch["gacha_bonuses"]["special_wish_artifacts"].append("Commander's Insignia")
+            # Combat bonuses
+            arch["gacha_bonuses"]["combat_bonuses"]["attack"] += 10.0
+            arch["gacha_bonuses"]["combat_bonuses"]["speed"] += 5.0
+            # War-themed cosmetics
+            if "collection_cosmetics" not in arch["gacha_bonuses"]:
+                arch["gacha_bonuses"]["collection_cosmetics"] = {}
+            arch["gacha_bonuses"]["collection_cosmetics"]["War"] = [
+                "Commander's Armor", "Battle Helm", "War Banner Cape"
+            ]
+            # Strategic battle abilities
+            arch["gacha_bonuses"]["special_abilities"].append({
+                "name": "Battle Tactics",
+                "description": "Characters gain enhanced positioning in battle and can use special formation abilities",
+                "effect": {"formation_bonus": 0.15, "strategic_retreat_chance": 0.20}
+            })
 
+    ARCHAEOLOGY_BONUS_CACHE[key] = copy.deepcopy(arch["gacha_bonuses"])
 
 def ensure_gacha_system_initialized(data: Dict[str, Any]) -> None:
     """
@@ -16210,6 +15098,7 @@ def give_daily_login_reward(streak: int, silent: bool = False) -> None:
                 if random_char not in user_data["gacha"]["characters"]:
                     user_data["gacha"]["characters"].append(random_char)
                     user_data["gacha"]["memory_shards"][random_char] = 0
+                    invalidate_party_synergy()
                     user_data["gacha"]["character_levels"][random_char] = 1
 
         elif milestone["reward"] == "weapon":
@@ -16227,38 +15116,431 @@ def give_daily_login_reward(streak: int, silent: bool = False) -> None:
         # Mark milestone as claimed
         user_data["gacha"]["daily_login"].setdefault("claimed_milestones", []).append(streak)
 
-def auto_save() -> None:
-    save_game(slot=0, auto=True)
+# Top-level user_data keys changed since the autosave journal last wrote them
+DIRTY_SECTIONS = set()
+# Tracked containers given plain containers since the last autosave, by id
+UNTRACKED_PARENTS: Dict[int, Any] = {}
+
+def untracked(value: Any, section: Any) -> bool:
+    """Whether a value is a container that does not report its changes to the section yet"""
+    return isinstance(value, (dict, list, set, Inventory)) and getattr(value, "section", None) != section
+
+class TrackedDict(dict):
+    """dict that marks its user_data section dirty whenever it changes"""
+
+    # None only on the user_data root itself, where every key is its own section
+    section: Optional[str] = None
+
+    def _changed(self, *keys: Any) -> None:
+        if self.section is None:
+            DIRTY_SECTIONS.update(keys)
+        else:
+            DIRTY_SECTIONS.add(self.section)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._changed(key)
+        if untracked(value, key if self.section is None else self.section):
+            UNTRACKED_PARENTS[id(self)] = self
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._changed(key)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return super().__getitem__(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self:
+            self._changed(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> Tuple[Any, Any]:
+        key, value = super().popitem()
+        self._changed(key)
+        return key, value
+
+    def clear(self) -> None:
+        self._changed(*self.keys())
+        super().clear()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other: Any) -> "TrackedDict":
+        self.update(other)
+        return self
+
+def tracked_method(base: type, name: str, adds: bool = False) -> Any:
+    """Wrap a mutating method of a builtin container so it marks its section dirty"""
+    original = getattr(base, name)
+
+    def method(self, *args, **kwargs):
+        result = original(self, *args, **kwargs)
+        DIRTY_SECTIONS.add(self.section)
+        if adds:
+            # Looked over for plain containers at the next autosave
+            UNTRACKED_PARENTS[id(self)] = self
+        return result
+    method.__name__ = name
+    return method
+
+class TrackedList(list):
+    """list that marks its user_data section dirty whenever it changes"""
+    section: Optional[str] = None
+
+class TrackedSet(set):
+    """set that marks its user_data section dirty whenever it changes"""
+    section: Optional[str] = None
+
+for _name in ("__setitem__", "__iadd__", "append", "extend", "insert"):
+    setattr(TrackedList, _name, tracked_method(list, _name, adds=True))
+for _name in ("__delitem__", "__imul__", "pop", "remove", "clear", "sort", "reverse"):
+    setattr(TrackedList, _name, tracked_method(list, _name))
+for _name in ("__ior__", "__iand__", "__isub__", "__ixor__", "add", "discard", "remove", "pop", "clear",
+              "update", "difference_update", "intersection_update", "symmetric_difference_update"):
+    setattr(TrackedSet, _name, tracked_method(set, _name))
+
+# Recipe indexes told about every change to the player's materials
+MATERIAL_WATCHERS: List[Any] = []
+
+class MaterialStore(TrackedDict):
+    """user_data["materials"], which also tells the recipe indexes which materials changed"""
+    section = "materials"
+
+    def _changed(self, *keys: Any) -> None:
+        super()._changed(*keys)
+        for watcher in MATERIAL_WATCHERS:
+            watcher.materials_changed(self, keys)
+
+def player_materials() -> MaterialStore:
+    """The player's materials, turned into a MaterialStore if they are still a plain dict"""
+    materials = user_data.get("materials")
+    if not isinstance(materials, MaterialStore):
+        materials = user_data["materials"] = MaterialStore(materials or {})
+    return materials
+
+def track_section(value: Any, section: str) -> Any:
+    """A user_data section value whose containers all report changes to it, plain ones are copied"""
+    if isinstance(value, MaterialStore) or not untracked(value, section):
+        # Already reports its changes, and the recipe indexes are keyed to the very materials store
+        return value
+    if isinstance(value, Inventory):
+        # Gear records are keyed by identity, so the inventory swaps them in place
+        value.section = section
+        value.replace_records(lambda record: track_section(record, section))
+        return value
+    if isinstance(value, dict):
+        tracked = TrackedDict((key, track_section(item, section)) for key, item in value.items())
+    elif isinstance(value, list):
+        tracked = TrackedList(track_section(item, section) for item in value)
+    elif isinstance(value, set):
+        tracked = TrackedSet(value)
+    else:
+        return value
+    tracked.section = section
+    return tracked
+
+def track_user_data(data: Dict[str, Any]) -> TrackedDict:
+    """Tracked copy of the whole user_data, every top-level key is a section"""
+    return TrackedDict((key, track_section(value, key)) for key, value in data.items())
+
+def adopt_untracked() -> None:
+    """Swap the plain containers put into tracked ones since the last autosave for tracked copies"""
+    parents = list(UNTRACKED_PARENTS.values())
+    UNTRACKED_PARENTS.clear()
+    for parent in parents:
+        section = parent.section
+        if isinstance(parent, Inventory):
+            parent.replace_records(lambda record, section=section: track_section(record, section))
+        elif isinstance(parent, dict):
+            for key, value in list(parent.items()):
+                value_section = key if section is None else section
+                if untracked(value, value_section):
+                    dict.__setitem__(parent, key, track_section(value, value_section))
+        else:
+            for index, value in enumerate(parent):
+                if untracked(value, section):
+                    list.__setitem__(parent, index, track_section(value, section))
+
+def apply_save_journal(slot: int, save_data: Dict[str, Any]) -> int:
+    """Replay the slot's autosave journal onto a loaded checkpoint, returns the entries applied"""
+    journal_file = save_journal_path(slot)
+    if not os.path.exists(journal_file):
+        return 0
+
+    applied = 0
+    with open(journal_file, "rb") as f:
+        for line in f:
+            try:
+                entry = json.loads(line.decode("utf-8"))
+            except ValueError:
+                break  # torn final entry from an interrupted write
+            if entry.get("checkpoint_id") != save_data.get("checkpoint_id"):
+                continue  # written against another checkpoint of this slot
+            save_data["user_data"].update(entry["sections"])
+            for name in entry["deleted"]:
+                save_data["user_data"].pop(name, None)
+            save_data["timestamp"] = entry["timestamp"]
+            applied += 1
+    return applied
+
+def append_journal_entry(slot: int, entry: Dict[str, Any]) -> int:
+    """Append one entry to the slot's autosave journal, returns the bytes written"""
+    # Sections arrive already encoded, the line is assembled around them
+    sections = ",".join(f"{SAVE_ENCODER.encode(name)}:{text}" for name, text in entry["sections"].items())
+    line = (f'{{"checkpoint_id":{SAVE_ENCODER.encode(entry["checkpoint_id"])},'
+            f'"timestamp":{SAVE_ENCODER.encode(entry["timestamp"])},'
+            f'"sections":{{{sections}}},"deleted":{SAVE_ENCODER.encode(entry["deleted"])}}}\n').encode("utf-8")
+    with open(save_journal_path(slot), "ab") as f:
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+    return len(line)
+
+class SaveWriter:
+    """Single background thread that encodes, compresses and writes the saves handed over by autosave
+
+    Saves are encoded from the live user_data, so the writer only reads it
+    while the game has released it, which is while the game waits for the
+    player's next command or for the writer itself.
+    """
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.jobs: List[Dict[str, Any]] = []
+        self.busy = False
+        self.state_free = False
+        self.encoding = False
+        self.thread: Optional[threading.Thread] = None
+        self.errors: List[str] = []
+        # Size on disk of each slot's checkpoint and of the journal written since
+        self.file_bytes: Dict[int, int] = {}
+        self.journal_bytes: Dict[int, int] = {}
+
+    def submit_checkpoint(self, slot: int, save_data: Dict[str, Any]) -> None:
+        """Queue a full save of the live state, replacing whatever is still queued for the slot"""
+        with self.condition:
+            self.jobs = [job for job in self.jobs if job["slot"] != slot]
+            self.jobs.append({"kind": "checkpoint", "slot": slot, "data": save_data})
+            self.journal_bytes[slot] = 0
+            self.start()
+            self.condition.notify_all()
+
+    def submit_journal(self, slot: int, entry: Dict[str, Any]) -> None:
+        """Queue a journal entry, merged into the previous one if that has not been written yet"""
+        with self.condition:
+            last = self.jobs[-1] if self.jobs else None
+            if (last and last["kind"] == "journal" and last["slot"] == slot
+                    and last["data"]["checkpoint_id"] == entry["checkpoint_id"]):
+                self.merge_entries(last["data"], entry)
+            else:
+                self.jobs.append({"kind": "journal", "slot": slot, "data": entry})
+            self.start()
+            self.condition.notify_all()
+
+    @staticmethod
+    def merge_entries(entry: Dict[str, Any], later: Dict[str, Any]) -> None:
+        """Fold a later journal entry into an earlier one"""
+        entry["sections"] += [name for name in later["sections"] if name not in entry["sections"]]
+        entry["timestamp"] = later["timestamp"]
+
+    @staticmethod
+    def encode_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Journal entry with its sections encoded from the live state, the ones gone from it as deleted"""
+        root = entry["root"]
+        names = dict.fromkeys(entry["sections"])
+        if root is user_data:
+            # Sections changed since the entry was queued are written as they are now
+            # as well, so the entry is a consistent snapshot of everything it touches
+            names.update(dict.fromkeys(DIRTY_SECTIONS))
+        return {
+            "checkpoint_id": entry["checkpoint_id"],
+            "timestamp": entry["timestamp"],
+            "sections": {name: SAVE_ENCODER.encode(root[name]) for name in names if name in root},
+            "deleted": [name for name in names if name not in root],
+        }
+
+    def release_state(self) -> None:
+        """Let the writer read the live state, which the game leaves alone until claim_state()"""
+        with self.condition:
+            self.state_free = True
+            self.condition.notify_all()
+
+    def claim_state(self) -> None:
+        """Take the live state back from the writer, waiting for an encode in progress"""
+        with self.condition:
+            while self.encoding:
+                self.condition.wait()
+            self.state_free = False
+
+    def start(self) -> None:
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run, name="save-writer", daemon=True)
+            self.thread.start()
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                while not self.jobs or not self.state_free:
+                    self.condition.wait()
+                job = self.jobs.pop(0)
+                self.busy = True
+                self.encoding = True
+            try:
+                slot = job["slot"]
+                try:
+                    if job["kind"] == "checkpoint":
+                        data = serialize_save(job["data"])
+                    else:
+                        data = self.encode_entry(job["data"])
+                finally:
+                    with self.condition:
+                        self.encoding = False
+                        self.condition.notify_all()
+                if job["kind"] == "checkpoint":
+                    self.file_bytes[slot] = write_save(slot, data)
+                else:
+                    self.journal_bytes[slot] = self.journal_bytes.get(slot, 0) + append_journal_entry(slot, data)
+            except Exception as e:
+                # Whatever was lost is covered by forcing a full save next time
+                SAVE_CHECKPOINTS.pop(job["slot"], None)
+                with self.condition:
+                    self.errors.append(str(e))
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
+
+    def flush(self) -> None:
+        """Wait until everything queued is on disk"""
+        with self.condition:
+            # Whoever waits for the writer is not changing the state meanwhile
+            state_free = self.state_free
+            self.state_free = True
+            self.condition.notify_all()
+            while self.jobs or self.busy:
+                self.condition.wait()
+            self.state_free = state_free
+
+    def take_errors(self) -> List[str]:
+        """Errors from background saves since the last call"""
+        with self.condition:
+            errors, self.errors = self.errors, []
+        return errors
+
+SAVE_WRITER = SaveWriter()
+atexit.register(SAVE_WRITER.flush)
+
+class SaveJournal:
+    """Autosave that appends only the changed user_data sections between full checkpoints"""
+
+    # Write a fresh checkpoint after this many journal entries
+    COMPACT_AFTER_ENTRIES = 50
+
+    def __init__(self, slot: int) -> None:
+        self.slot = slot
+        self.root: Optional[Dict[str, Any]] = None
+        self.checkpoint_id: Optional[str] = None
+        self.entries = 0
+
+    def needs_checkpoint(self) -> bool:
+        """A full save is due when tracking is not in place or the journal has grown too long"""
+        return (user_data is not self.root
+                or self.checkpoint_id is None
+                or SAVE_CHECKPOINTS.get(self.slot) != self.checkpoint_id
+                or self.entries >= self.COMPACT_AFTER_ENTRIES
+                or SAVE_WRITER.journal_bytes.get(self.slot, 0) > SAVE_WRITER.file_bytes.get(self.slot, math.inf))
+
+    def checkpoint(self) -> None:
+        """Queue a full save of the whole state and start tracking changes from it"""
+        global user_data
+        # Between commands nothing holds on to the old containers, so they can be swapped out.
+        # Loaded saves are tracked as they are activated, this only wraps the starting state
+        if not isinstance(user_data, TrackedDict):
+            user_data = track_user_data(user_data)
+        adopt_untracked()
+        self.root = user_data
+        DIRTY_SECTIONS.clear()
+        save_data = build_save_data()
+        self.checkpoint_id = SAVE_CHECKPOINTS[self.slot] = save_data["checkpoint_id"]
+        self.entries = 0
+        SAVE_WRITER.submit_checkpoint(self.slot, save_data)
+
+    def save(self) -> None:
+        """Hand the sections changed since the last autosave to the writer, compacting when due"""
+        if self.needs_checkpoint():
+            self.checkpoint()
+            return
+        if not DIRTY_SECTIONS:
+            return
+
+        # Containers put into the state since the last autosave report their changes from now on
+        adopt_untracked()
+        entry = {
+            "checkpoint_id": self.checkpoint_id,
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            # Only the names, the writer encodes the sections once the game releases the state
+            "sections": list(DIRTY_SECTIONS),
+            "root": user_data,
+        }
+        DIRTY_SECTIONS.clear()
+        self.entries += 1
+        SAVE_WRITER.submit_journal(self.slot, entry)
+
+AUTOSAVE_JOURNAL = SaveJournal(slot=0)
+
+@timed_phase("auto_save")
+def auto_save(trigger: str = "timer") -> None:
+    auto_saves = PERF_STATS["auto_saves"]
+    auto_saves[trigger] = auto_saves.get(trigger, 0) + 1
+    AUTOSAVE_JOURNAL.save()
 
 def show_save_slots() -> None:
     print_header("Save Slots")
+    SAVE_WRITER.flush()
     save_dir = get_save_directory()
-    saves = [f for f in os.listdir(save_dir) if f.startswith("save_") and f.endswith(".json")]
-    saves = sorted(saves)
-    if not saves:
+    slots = set()
+    for f in os.listdir(save_dir):
+        if f.startswith("save_") and f.endswith(tuple(SAVE_EXTENSIONS.values())):
+            slot = f.split("_")[1].split(".")[0]
+            if slot.isdigit():
+                slots.add(int(slot))
+    if not slots:
         print("No saved games found.")
         return
 
-    for save in saves:
+    for slot in sorted(slots):
         try:
-            save_path = os.path.join(save_dir, save)
-            with open(save_path, "r") as f:
-                data = json.load(f)
-                slot = save.split("_")[1].split(".")[0]
-                name = data['user_data'].get('name', 'Unknown')
-                print(f"\nSlot {slot}:")
-                print(f"Character: {name}, Level {data['user_data']['level']} {data['user_data']['class']}")
-                print(f"Location: {data['user_data']['current_area']}")
-                print(f"Saved: {data['timestamp']}")
+            data = read_save_file(find_save_file(slot))
+            apply_save_journal(slot, data)
+            level = save_sections(data)["character_stats"]["level"]
+            name = data['user_data'].get('name', 'Unknown')
+            print(f"\nSlot {slot}:")
+            print(f"Character: {name}, Level {level} {data['user_data']['class']}")
+            print(f"Location: {data['user_data']['current_area']}")
+            print(f"Saved: {data['timestamp']}")
         except Exception:
             continue
 
 def delete_save(slot: int) -> None:
-    filename = f"save_{slot}.json"
-    try:
-        os.remove(filename)
+    SAVE_WRITER.flush()
+    deleted = False
+    for compression in SAVE_EXTENSIONS:
+        filename = save_file_path(slot, compression)
+        for path in (filename, f"{filename}.backup"):
+            if os.path.exists(path):
+                os.remove(path)
+                deleted = True
+    journal_file = save_journal_path(slot)
+    if os.path.exists(journal_file):
+        os.remove(journal_file)
+    if deleted:
         print(f"Save in slot {slot} deleted.")
-    except FileNotFoundError:
+    else:
         print(f"No save found in slot {slot}.")
 
 def _display_and_select_quests(quest_entries: List[Dict[str, Any]], has_hylit: bool) -> Optional[str]:
@@ -17207,9 +16489,9 @@ def get_rarity_color(rarity: str) -> str:
     return rarity_colors.get(rarity, WHITE)
 
 # Function to enter a dungeon
-def enter_dungeon(dungeon_name: str) -> None:
+def enter_dungeon(dungeon_name: str, auto_resolve: bool = False) -> None:
     try:
-        dungeon = next((d for d in dungeons if d["name"].lower() == dungeon_name.lower()), None)
+        dungeon = find_dungeon(dungeon_name)
         if not dungeon:
             print(f"{FAIL}Dungeon '{dungeon_name}' not found!{ENDC}")
             return
@@ -17218,11 +16500,7 @@ def enter_dungeon(dungeon_name: str) -> None:
         print_colored("Prepare yourself for tough battles and great loot!", CYAN)
 
         # Check if dungeon has any boss monsters
-        boss_monsters = []
-        for monster_name in dungeon["monsters"]:
-            monster = next((m for m in monsters if m["name"].lower() == monster_name.lower()), None)
-            if monster and monster.get("boss", False):
-                boss_monsters.append(monster)
+        boss_monsters = DUNGEON_BOSSES[fold_name(dungeon["name"])]
 
         # If no boss monsters, limit number of monsters fought to random 10-15
         max_monsters = len(dungeon["monsters"])
@@ -17236,26 +16514,31 @@ def enter_dungeon(dungeon_name: str) -> None:
             if monsters_fought >= max_monsters:
                 print_colored(f"Reached limit of {max_monsters} monsters for this dungeon (no boss present).", YELLOW)
                 break
-            try:
-                monster = next(m for m in monsters if m["name"].lower() == monster_name.lower())
-                if user_data["health"] <= 0:
-                    print_colored("You were defeated! Dungeon run failed.", FAIL)
-                    all_monsters_defeated = False
-                    return
-                # If monster is a boss, print special styled name
-                if monster.get("boss", False):
-                    boss_name = f"⋆༺ 𓆩{monster['name'].upper()}𓆪 ༻ ⋆"
-                    print_colored(boss_name, FAIL)
-                else:
-                    print_colored(f"Encountered: {monster['name']}", CYAN)
-                fight(monster)
-                if user_data["health"] <= 0:
-                    all_monsters_defeated = False
-                    break
-                monsters_fought += 1
-            except StopIteration:
+            monster = find_monster(monster_name)
+            if monster is None:
                 print_colored(f"Warning: Monster '{monster_name}' not found in database", WARNING)
                 continue
+            if user_data["health"] <= 0:
+                print_colored("You were defeated! Dungeon run failed.", FAIL)
+                all_monsters_defeated = False
+                return
+            # If monster is a boss, print special styled name
+            if monster.get("boss", False):
+                boss_name = f"⋆༺ 𓆩{monster['name'].upper()}𓆪 ༻ ⋆"
+                print_colored(boss_name, FAIL)
+            else:
+                print_colored(f"Encountered: {monster['name']}", CYAN)
+            if auto_resolve:
+                if auto_fight(monster) != "victory":
+                    print_colored("The monster still stands. Dungeon run failed.", FAIL)
+                    all_monsters_defeated = False
+                    break
+            else:
+                fight(monster)
+            if user_data["health"] <= 0:
+                all_monsters_defeated = False
+                break
+            monsters_fought += 1
 
         if user_data["health"] > 0 and all_monsters_defeated:
             print_colored(f"You have completed the {dungeon['name']}!", OKGREEN)
@@ -17312,7 +16595,7 @@ def equip_item(item_name: str) -> None:
 
     try:
         # Case-insensitive match for item in inventory
-        item = next((i for i in user_data["inventory"] if i.lower() == item_name.lower()), None)
+        item = user_data["inventory"].find(item_name)
         if not item:
             print(f"{WARNING}You don't have {item_name} in your inventory.{ENDC}")
             return
@@ -18000,7 +17283,7 @@ def evolve_pet(pet_name: str) -> None:
     print("\n")
     print_animated(f"{HEADER}✧・゚: *✧・゚:* EVOLUTION *:・゚✧*:・゚✧{ENDC}", delay=0.05)
     print_animated(f"{YELLOW}Your {pet_name} is evolving...{ENDC}", delay=0.1)
-    time.sleep(1)
+    pause(1)
 
     for _ in range(5):
         print_animated(".", delay=0.3)
@@ -18284,308 +17567,8 @@ def complete_quest(quest_name: str) -> None:
     else:
         print(f"No active quest named '{quest_name}' found.")
 
-# Character definitions for gacha system
-GACHA_CHARACTERS = {
-    # Ancient Ruins Characters
-    "Oracle of Ruins": {
-        "rarity": "Legendary",
-        "element": "Arcane",
-        "weapon": "Staff",
-        "class": "Mage",
-        "background": "A mysterious seer who communes with the ancient spirits of the ruins. Her prophecies have guided many adventurers to treasure and safety.",
-        "abilities": ["Ancient Revelation", "Time Echo", "Ruin's Whisper"],
-        "sea_of_memories": ["Memory Shard I: Increases Arcane damage by 15%", 
-                           "Memory Shard II: Ancient Revelation has a 25% chance to reveal enemy weaknesses",
-                           "Memory Shard III: Time Echo can now rewind time for 3 seconds",
-                           "Memory Shard IV: Gain 20% resistance to all status effects",
-                           "Memory Shard V: Ruin's Whisper can now silence enemies for 2 turns",
-                           "Memory Shard VI: Summon an Ancient Guardian once per battle"]
-    },
-    "Relic Hunter": {
-        "rarity": "Epic",
-        "element": "Earth",
-        "weapon": "Whip",
-        "class": "Hunter",
-        "background": "A daring treasure hunter who has mapped most of the Ancient Ruins. She's as quick with a clever quip as she is with her trusty whip.",
-        "abilities": ["Relic Sense", "Quickdraw", "Trap Disarmer"],
-        "sea_of_memories": ["Memory Shard I: 15% chance to find additional loot", 
-                           "Memory Shard II: Quickdraw attack speed increased by 20%",
-                           "Memory Shard III: Can detect and disarm traps with 80% success rate",
-                           "Memory Shard IV: 25% damage bonus against Constructs and Undead",
-                           "Memory Shard V: Can use enemy weapons against them for one turn",
-                           "Memory Shard VI: Find a Legendary relic once per dungeon"]
-    },
-
-    # Crystal Cave Characters
-    "Crystal Harmonist": {
-        "rarity": "Legendary",
-        "element": "Light",
-        "weapon": "Crystal Harp",
-        "class": "Bard",
-        "background": "A mystical musician who learned to communicate with the living crystals of the deep caves. Her music can heal allies or shatter enemies.",
-        "abilities": ["Crystal Symphony", "Resonance Wave", "Prismatic Shield"],
-        "sea_of_memories": ["Memory Shard I: Crystal Symphony heals 15% more", 
-                           "Memory Shard II: Resonance Wave can stun enemies for 1 turn",
-                           "Memory Shard III: Prismatic Shield reflects 20% damage back to attackers",
-                           "Memory Shard IV: Music now affects a larger area (3 meter radius)",
-                           "Memory Shard V: Can attune to crystals to gain their elemental properties",
-                           "Memory Shard VI: Once per battle, can summon a Crystal Guardian"]
-    },
-    "Geode Sculptor": {
-        "rarity": "Rare",
-        "element": "Earth",
-        "weapon": "Chisel and Hammer",
-        "class": "Craftsman",
-        "background": "A master artisan who can shape the cave's crystals into powerful tools and weapons. His sculptures sometimes seem to have a life of their own.",
-        "abilities": ["Stone Shaper", "Crystal Infusion", "Geode Barrier"],
-        "sea_of_memories": ["Memory Shard I: Can create temporary stone weapons", 
-                           "Memory Shard II: Crystal Infusion adds elemental damage to weapons",
-                           "Memory Shard III: Geode Barrier absorbs 30% more damage",
-                           "Memory Shard IV: Can shape stone terrain to gain tactical advantage",
-                           "Memory Shard V: Created sculptures can now attack autonomously",
-                           "Memory Shard VI: Can transform into living crystal form for 3 turns"]
-    },
-
-    # Forest Characters
-    "Guardian of the Grove": {
-        "rarity": "Epic",
-        "element": "Nature",
-        "weapon": "Living Bow",
-        "class": "Ranger",
-        "background": "A forest protector blessed by the ancient tree spirits. She moves unseen through the woods and commands the forest itself to fight alongside her.",
-        "abilities": ["Verdant Shot", "Nature's Command", "Forest Stride"],
-        "sea_of_memories": ["Memory Shard I: Verdant Shot entangles targets", 
-                           "Memory Shard II: Can command forest creatures to aid in battle",
-                           "Memory Shard III: Forest Stride increases dodge rate by 30%",
-                           "Memory Shard IV: Arrows can split to hit multiple targets",
-                           "Memory Shard V: Can temporarily animate trees as guardians",
-                           "Memory Shard VI: Once per battle, can summon a legendary forest beast"]
-    },
-    "Dryad Healer": {
-        "rarity": "Rare",
-        "element": "Nature",
-        "weapon": "Staff of Seasons",
-        "class": "Healer",
-        "background": "A forest spirit in human form who channels the restorative powers of nature. Her healing changes with the seasons, each offering unique benefits.",
-        "abilities": ["Seasonal Blessing", "Rejuvenation", "Thorn Ward"],
-        "sea_of_memories": ["Memory Shard I: Healing effects increased by 20%", 
-                           "Memory Shard II: Rejuvenation now removes one negative status effect",
-                           "Memory Shard III: Thorn Ward reflects 15% damage to attackers",
-                           "Memory Shard IV: Can now switch seasons at will rather than following natural cycle",
-                           "Memory Shard V: Healing now spreads to nearby allies at 50% effectiveness",
-                           "Memory Shard VI: Can temporarily transform allies into forest spirits"]
-    },
-
-    # Mountain Characters
-    "Summit King": {
-        "rarity": "Legendary",
-        "element": "Ice",
-        "weapon": "Great Axe",
-        "class": "Warrior",
-        "background": "The uncontested ruler of the highest peaks, he has survived storms and battles that would kill lesser beings. His roar can trigger avalanches.",
-        "abilities": ["Mountain's Might", "Avalanche", "Frost Armor"],
-        "sea_of_memories": ["Memory Shard I: Damage increased by 15% when at higher elevation", 
-                           "Memory Shard II: Avalanche ability area of effect increased by 5 meters",
-                           "Memory Shard III: Frost Armor reduces incoming damage by 30%",
-                           "Memory Shard IV: Immune to cold and high-altitude effects",
-                           "Memory Shard V: Can create ice constructs that fight alongside him",
-                           "Memory Shard VI: Once per battle, can summon a blizzard that damages all enemies"]
-    },
-    "Eagle Rider": {
-        "rarity": "Epic",
-        "element": "Air",
-        "weapon": "Twin Daggers",
-        "class": "Scout",
-        "background": "A fearless scout who bonded with a giant mountain eagle. Together they patrol the skies, dropping down on enemies with deadly precision.",
-        "abilities": ["Diving Strike", "Eagle Eye", "Wind Dash"],
-        "sea_of_memories": ["Memory Shard I: Diving Strike causes 20% more damage", 
-                           "Memory Shard II: Eagle Eye reveals hidden enemies and traps",
-                           "Memory Shard III: Wind Dash can be used twice in succession",
-                           "Memory Shard IV: Eagle companion can now attack independently",
-                           "Memory Shard V: Can create wind barriers that deflect projectiles",
-                           "Memory Shard VI: Can temporarily grant flight to the entire party"]
-    },
-
-    # Temple Characters
-    "Oracle Priestess": {
-        "rarity": "Epic",
-        "element": "Light",
-        "weapon": "Sacred Texts",
-        "class": "Mystic",
-        "background": "A devoted servant of the temple who has been granted divine foresight. Her prophecies can reveal enemy weaknesses or hidden pathways.",
-        "abilities": ["Divine Insight", "Blessing of Light", "Banishment"],
-        "sea_of_memories": ["Memory Shard I: Divine Insight reveals additional information", 
-                           "Memory Shard II: Blessing of Light heals and provides damage shield",
-                           "Memory Shard III: Banishment has 25% chance to instantly defeat undead enemies",
-                           "Memory Shard IV: Can predict enemy moves one turn in advance",
-                           "Memory Shard V: Light abilities deal 50% more damage to dark enemies",
-                           "Memory Shard VI: Once per battle, can channel divine intervention"]
-    },
-    "Temple Guardian": {
-        "rarity": "Rare",
-        "element": "Earth",
-        "weapon": "Temple Shield and Mace",
-        "class": "Guardian",
-        "background": "A stoic protector enchanted to defend the sacred temple grounds. Once a stone statue, now imbued with life and purpose.",
-        "abilities": ["Unyielding Defense", "Consecrated Ground", "Stone Form"],
-        "sea_of_memories": ["Memory Shard I: Damage reduction increased by 15%", 
-                           "Memory Shard II: Consecrated Ground heals allies in area by 5% per turn",
-                           "Memory Shard III: Stone Form provides immunity to critical hits",
-                           "Memory Shard IV: Can create walls of sacred stone",
-                           "Memory Shard V: Attacks have 20% chance to stun enemies",
-                           "Memory Shard VI: Can temporarily animate other statues to fight"]
-    },
-
-    # Swamp Characters
-    "Bog Witch": {
-        "rarity": "Epic",
-        "element": "Nature",
-        "weapon": "Cursed Staff",
-        "class": "Witch",
-        "background": "A reclusive witch who draws power from the murky swamps. Her concoctions can heal or harm, and few dare to seek her out.",
-        "abilities": ["Miasma Cloud", "Bog Familiar", "Swamp Stride"],
-        "sea_of_memories": ["Memory Shard I: Miasma Cloud affects larger area", 
-                           "Memory Shard II: Bog Familiar can scout ahead without being detected",
-                           "Memory Shard III: Swamp Stride allows faster movement through difficult terrain",
-                           "Memory Shard IV: Poison effects last 2 turns longer",
-                           "Memory Shard V: Can turn enemies into toads temporarily",
-                           "Memory Shard VI: Can control swamp monsters to fight for her"]
-    },
-    "Venom Alchemist": {
-        "rarity": "Rare",
-        "element": "Nature",
-        "weapon": "Poison Darts",
-        "class": "Alchemist",
-        "background": "A mysterious figure who studies the deadly creatures of the swamp. He has survived countless poisonings and now incorporates toxins into his weapons.",
-        "abilities": ["Toxic Concoction", "Antidote", "Poison Resistance"],
-        "sea_of_memories": ["Memory Shard I: Poison damage increased by 20%", 
-                           "Memory Shard II: Antidote can cure any poison or disease",
-                           "Memory Shard III: Complete immunity to poison effects",
-                           "Memory Shard IV: Weapons automatically apply poison effect",
-                           "Memory Shard V: Can extract venom from defeated enemies",
-                           "Memory Shard VI: Can transform into poisonous mist form"]
-    },
-
-    # Desert characters
-    "Mirage Walker": {
-        "rarity": "Epic",
-        "element": "Fire",
-        "weapon": "Heat Blades",
-        "class": "Nomad",
-        "background": "A wanderer of the scorching deserts who has learned to manipulate heat and create illusions to survive. The blazing sun is both ally and weapon.",
-        "abilities": ["Heat Mirage", "Sand Veil", "Sun's Fury"],
-        "sea_of_memories": ["Memory Shard I: Heat Mirage creates decoys that confuse enemies", 
-                           "Memory Shard II: Sand Veil provides 30% evasion in desert terrain",
-                           "Memory Shard III: Sun's Fury deals 25% more damage at noon",
-                           "Memory Shard IV: Can summon sandstorms that blind enemies",
-                           "Memory Shard V: Heat attacks have a chance to cause Dehydration status",
-                           "Memory Shard VI: Can transform into living flame to pass through barriers"]
-    },
-    "Dune Oracle": {
-        "rarity": "Legendary",
-        "element": "Arcane",
-        "weapon": "Ancient Tablet",
-        "class": "Prophet",
-        "background": "A mystic who communes with ancient desert spirits and can read the future in the shifting sands. Their prophecies have never been wrong.",
-        "abilities": ["Sand Divination", "Desert Whispers", "Temporal Glimpse"],
-        "sea_of_memories": ["Memory Shard I: Sand Divination reveals hidden treasures in a wide area", 
-                           "Memory Shard II: Desert Whispers allows communication with desert creatures",
-                           "Memory Shard III: Temporal Glimpse shows enemy attack patterns before they happen",
-                           "Memory Shard IV: Can summon ancient desert guardians to fight",
-                           "Memory Shard V: Gains ability to temporarily stop time for 3 seconds",
-                           "Memory Shard VI: Can create oases that heal all allies and restore resources"]
-    },
-
-    # Coastal/Ocean characters
-    "Tide Caller": {
-        "rarity": "Epic",
-        "element": "Water",
-        "weapon": "Coral Trident",
-        "class": "Sea Shaman",
-        "background": "Born during a tsunami, this coastal tribe member can control the tides and communicate with marine life. The ocean answers their call.",
-        "abilities": ["Tidal Wave", "Marine Bond", "Whirlpool"],
-        "sea_of_memories": ["Memory Shard I: Tidal Wave can push enemies back 50% further", 
-                           "Memory Shard II: Marine Bond allows summoning of sea creatures to assist",
-                           "Memory Shard III: Whirlpool traps enemies for 3 additional seconds",
-                           "Memory Shard IV: Water attacks have 25% chance to cause Drowning status",
-                           "Memory Shard V: Can breathe underwater indefinitely and swim at double speed",
-                           "Memory Shard VI: Can part waters to create dry passages through water bodies"]
-    },
-    "Deep Navigator": {
-        "rarity": "Rare",
-        "element": "Water",
-        "weapon": "Abyssal Harpoon",
-        "class": "Diver",
-        "background": "An explorer of the ocean depths who has adapted to the crushing pressure of the abyss. They've discovered ancient secrets in the darkest waters.",
-        "abilities": ["Pressure Resistance", "Bioluminescence", "Depth Charge"],
-        "sea_of_memories": ["Memory Shard I: Pressure Resistance reduces physical damage by 20%", 
-                           "Memory Shard II: Bioluminescence reveals hidden enemies in darkness",
-                           "Memory Shard III: Depth Charge can stun multiple enemies in a line",
-                           "Memory Shard IV: Gains ability to communicate with deep sea creatures",
-                           "Memory Shard V: Water pressure can be weaponized to crush armored foes",
-                           "Memory Shard VI: Can create water spheres that function as portable breathing environments"]
-    },
-
-    # Volcano characters
-    "Magma Sculptor": {
-        "rarity": "Epic",
-        "element": "Fire",
-        "weapon": "Obsidian Hammer",
-        "class": "Forgemaster",
-        "background": "A master craftsman who lives within an active volcano and shapes molten rock with bare hands. Their creations are prized across all lands.",
-        "abilities": ["Lava Shaping", "Heat Forge", "Magma Shield"],
-        "sea_of_memories": ["Memory Shard I: Lava Shaping creates barriers that damage enemies on contact", 
-                           "Memory Shard II: Heat Forge can temporarily enhance ally weapons with fire damage",
-                           "Memory Shard III: Magma Shield absorbs 50% of incoming damage",
-                           "Memory Shard IV: Can summon volcanic eruptions in small targeted areas",
-                           "Memory Shard V: Fire immunity extends to allies within 10 meter radius",
-                           "Memory Shard VI: Can create living magma golems that fight independently"]
-    },
-    "Ash Walker": {
-        "rarity": "Uncommon",
-        "element": "Fire",
-        "weapon": "Charred Staff",
-        "class": "Survivor",
-        "background": "The sole survivor of a village destroyed by a volcanic eruption, they've learned to commune with the spirits of the ash and smoke.",
-        "abilities": ["Ash Cloud", "Smoke Form", "Ember Sight"],
-        "sea_of_memories": ["Memory Shard I: Ash Cloud blinds enemies for 3 seconds", 
-                           "Memory Shard II: Smoke Form allows brief intangibility to pass through obstacles",
-                           "Memory Shard III: Ember Sight can detect heat signatures through walls",
-                           "Memory Shard IV: Ash attacks have chance to cause Choking status",
-                           "Memory Shard V: Can resurrect once per day with 50% health if defeated",
-                           "Memory Shard VI: Can draw power from fallen foes, gaining strength from defeats"]
-    },
-
-    # Tundra/Snow characters
-    "Frost Weaver": {
-        "rarity": "Epic",
-        "element": "Ice",
-        "weapon": "Crystal Scepter",
-        "class": "Winter Mage",
-        "background": "Born during the centennial blizzard, this mage can create intricate structures of living ice and bend the winter winds to their will.",
-        "abilities": ["Ice Architecture", "Winter's Breath", "Glacial Spike"],
-        "sea_of_memories": ["Memory Shard I: Ice Architecture creates complex structures that last 3x longer", 
-                           "Memory Shard II: Winter's Breath can freeze water surfaces instantly",
-                           "Memory Shard III: Glacial Spike damage increased by 40%",
-                           "Memory Shard IV: Can create ice bridges to traverse gaps and chasms",
-                           "Memory Shard V: Ice attacks have 30% chance to cause Frostbite status",
-                           "Memory Shard VI: Can summon a legendary snow phoenix that heals and protects"]
-    },
-    "Aurora Hunter": {
-        "rarity": "Rare",
-        "element": "Light",
-        "weapon": "Northern Bow",
-        "class": "Pathfinder",
-        "background": "A guide who navigates by the polar lights and has learned to harness their energy. They never lose their way, even in the most ferocious blizzards.",
-        "abilities": ["Light Navigation", "Aurora Arrow", "Polar Sight"],
-        "sea_of_memories": ["Memory Shard I: Light Navigation prevents party from getting lost in any terrain", 
-                           "Memory Shard II: Aurora Arrow pierces through multiple enemies",
-                           "Memory Shard III: Polar Sight allows vision through snowstorms and darkness",
-                           "Memory Shard IV: Light attacks restore small amount of energy to allies",
-                           "Memory Shard V: Can create illusions using aurora energy",
-                           "Memory Shard VI: Can briefly stop a blizzard in a large area by absorbing its energy"]
-    }
-}
+# Gacha Character Collection - Detailed character entries with stats, abilities, and lore
+GACHA_CHARACTERS = CONTENT.mapping("GACHA_CHARACTERS")
 
 # Character rarity definitions
 CHARACTER_RARITIES = {
@@ -18689,187 +17672,7 @@ BANNER_ROTATION = {
 }
 
 # Character-specific weapons
-CHARACTER_WEAPONS = {
-    # Ancient Ruins Weapons
-    "Oracle's Insight": {
-        "type": "Staff",
-        "rarity": "Legendary",
-        "element": "Arcane",
-        "base_attack": 45,
-        "special_effect": "Increases Arcane damage by 25%",
-        "description": "A staff of ancient origin, resonating with the knowledge of civilizations long past.",
-        "for_character": "Oracle of Ruins"
-    },
-    "Crystal Greatsword": {
-        "type": "Greatsword",
-        "rarity": "Epic",
-        "element": "Earth",
-        "base_attack": 38,
-        "special_effect": "15% chance to create crystal spikes when attacking",
-        "description": "A massive sword with a blade of pure crystal that can manipulate the earth itself.",
-        "for_character": "Crystal Knight"
-    },
-
-    # Forest Weapons
-    "Living Bow": {
-        "type": "Bow",
-        "rarity": "Epic",
-        "element": "Nature",
-        "base_attack": 36,
-        "special_effect": "Arrows have a 20% chance to entangle targets",
-        "description": "A bow grown from a sacred tree, still alive and forming arrows from its own essence.",
-        "for_character": "Guardian of the Grove"
-    },
-    "Staff of Seasons": {
-        "type": "Staff",
-        "rarity": "Rare",
-        "element": "Nature",
-        "base_attack": 30,
-        "special_effect": "Healing effects change with seasons: Spring (HP), Summer (ATK), Fall (DEF), Winter (Resistance)",
-        "description": "A staff that channels the power of the changing seasons, its appearance shifting throughout the year.",
-        "for_character": "Dryad Healer"
-    },
-
-    # Mountain Weapons
-    "Avalanche Axe": {
-        "type": "Great Axe",
-        "rarity": "Legendary",
-        "element": "Ice",
-        "base_attack": 48,
-        "special_effect": "10% chance to trigger an avalanche, damaging all enemies",
-        "description": "A massive axe eternally frosted with the coldest ice from the highest peaks.",
-        "for_character": "Summit King"
-    },
-    "Alpine Longbow": {
-        "type": "Longbow",
-        "rarity": "Epic",
-        "element": "Air",
-        "base_attack": 37,
-        "special_effect": "Arrows travel 50% faster and further at high altitudes",
-        "description": "A bow designed for the thin air of mountain peaks, allowing for incredible range.",
-        "for_character": "Alpine Hunter"
-    },
-
-    # Temple Weapons
-    "Soul Mirror": {
-        "type": "Catalyst",
-        "rarity": "Legendary",
-        "element": "Light",
-        "base_attack": 42,
-        "special_effect": "Reflects 15% of damage taken back to attacker",
-        "description": "A sacred mirror that reveals one's true soul and reflects harmful intent.",
-        "for_character": "Luminous Monk"
-    },
-    "Spirit Lance": {
-        "type": "Polearm",
-        "rarity": "Epic",
-        "element": "Light",
-        "base_attack": 39,
-        "special_effect": "Attacks have a 25% chance to pierce defense",
-        "description": "A lance infused with holy energy that can pierce through both physical and spiritual armor.",
-        "for_character": "Temple Guardian"
-    },
-
-    # Swamp Weapons
-    "Venomfang": {
-        "type": "Dagger",
-        "rarity": "Epic",
-        "element": "Nature",
-        "base_attack": 33,
-        "special_effect": "Applies Poison status effect (20% chance)",
-        "description": "A curved dagger extracted from the fang of a legendary venomous beast that lurked in the deepest swamps.",
-        "for_character": "Marsh Stalker"
-    },
-    "Bogwood Staff": {
-        "type": "Staff",
-        "rarity": "Rare",
-        "element": "Water",
-        "base_attack": 28,
-        "special_effect": "Creates a healing mist that restores 5% HP per turn in swampy areas",
-        "description": "A staff carved from the ancient wood of a bog tree, imbued with restorative properties.",
-        "for_character": "Swamp Witch"
-    },
-
-    # Desert Weapons
-    "Sun's Fury": {
-        "type": "Scimitar",
-        "rarity": "Legendary",
-        "element": "Fire",
-        "base_attack": 45,
-        "special_effect": "During daytime, increases attack by 30%",
-        "description": "A curved blade that harnesses the scorching power of the desert sun.",
-        "for_character": "Sandstorm Warrior"
-    },
-    "Dune Staff": {
-        "type": "Staff",
-        "rarity": "Epic",
-        "element": "Earth",
-        "base_attack": 36,
-        "special_effect": "Can create quicksand under enemies (15% chance)",
-        "description": "A staff topped with a sphere of compressed sand that can manipulate the desert itself.",
-        "for_character": "Mirage Mage"
-    },
-
-    # Coastal Weapons
-    "Tidecaller": {
-        "type": "Trident",
-        "rarity": "Legendary",
-        "element": "Water",
-        "base_attack": 44,
-        "special_effect": "Creates a tidal wave dealing AoE damage once per battle",
-        "description": "A trident forged from coral and enchanted pearls, said to be blessed by the sea gods.",
-        "for_character": "Coastal Guardian"
-    },
-    "Coral Blade": {
-        "type": "Sword",
-        "rarity": "Epic",
-        "element": "Water",
-        "base_attack": 37,
-        "special_effect": "Increases movement speed by 20% in water",
-        "description": "A sword formed from living coral that remains sharp even underwater.",
-        "for_character": "Reef Hunter"
-    },
-
-    # Volcano Weapons
-    "Magma Hammer": {
-        "type": "Hammer",
-        "rarity": "Legendary",
-        "element": "Fire",
-        "base_attack": 50,
-        "special_effect": "Creates a lava pool on critical hits, dealing damage over time",
-        "description": "A massive hammer with a head of ever-molten stone from the heart of a volcano.",
-        "for_character": "Lava King"
-    },
-    "Obsidian Daggers": {
-        "type": "Dual Daggers",
-        "rarity": "Epic",
-        "element": "Fire",
-        "base_attack": 34,
-        "special_effect": "Attacks ignore 20% of enemy defense",
-        "description": "Twin daggers of volcanic glass sharper than any steel, capable of slicing through almost anything.",
-        "for_character": "Ashen Rogue"
-    },
-
-    # Tundra Weapons
-    "Permafrost": {
-        "type": "Sword",
-        "rarity": "Legendary",
-        "element": "Ice",
-        "base_attack": 46,
-        "special_effect": "25% chance to freeze targets for 1 turn",
-        "description": "A sword of eternal ice that never melts, freezing anything it touches.",
-        "for_character": "Frost Monarch"
-    },
-    "Aurora Bow": {
-        "type": "Bow",
-        "rarity": "Epic",
-        "element": "Ice",
-        "base_attack": 38,
-        "special_effect": "Arrows leave a trail of ice, slowing enemies that cross it",
-        "description": "A bow that channels the ethereal lights of the polar sky, creating arrows of pure cold light.",
-        "for_character": "Tundra Hunter"
-    }
-}
+CHARACTER_WEAPONS = CONTENT.mapping("CHARACTER_WEAPONS")
 
 def gacha_system() -> None:
     """Main interface for the character gacha system"""
@@ -18973,9 +17776,7 @@ def wish_standard_banner() -> None:
                 user_data["gacha"]["standard_pulls"] += 10
 
                 print_header("10x Wish Results")
-                for _ in range(10):
-                    pull_character("standard")
-                    time.sleep(0.5)  # Dramatic pause between pulls
+                pull_characters(10, "standard", reveal_pause=0.5)  # Dramatic pause between pulls
             else:
                 print_colored("Not enough Primogems for 10 wishes!", RED)
         elif choice == 3:
@@ -19193,7 +17994,7 @@ def wish_limited_banner() -> None:
                             if char_rarity in ["Epic", "Legendary"]:
                                 has_guaranteed_4star = True
 
-                    time.sleep(0.5)  # Dramatic pause between pulls
+                    pause(0.5)  # Dramatic pause between pulls
             else:
                 print_colored("Not enough Stellarstones for 10 wishes!", RED)
         elif choice == 3:
@@ -19640,6 +18441,29 @@ def open_weapon_refinement() -> None:
     # No need to set special flags as we're just redirecting
     weapon_refinement()
 
+GACHA_RARITY_ORDER = ["Common", "Uncommon", "Rare", "Epic", "Legendary"]
+CHARACTER_PULL_WEIGHTS = [30.0, 35.0, 20.0, 13.0, 2.0]  # Based on CHARACTER_RARITIES pull_rate
+CHARACTER_PULL_CUM_WEIGHTS = list(itertools.accumulate(CHARACTER_PULL_WEIGHTS))
+
+# Names of each gacha table grouped by rarity, keyed by the table they were built from
+GACHA_POOLS: Dict[int, Dict[str, Any]] = {}
+
+def gacha_pools(table: LazyContentMapping) -> Dict[str, List[str]]:
+    """Characters or weapons grouped by rarity, regrouped only when the table changes"""
+    roster = table.data
+    cached = GACHA_POOLS.get(id(roster))
+    if cached is None or cached["size"] != len(roster):
+        pools: Dict[str, List[str]] = {rarity: [] for rarity in GACHA_RARITY_ORDER}
+        for name, data in roster.items():
+            pools.setdefault(data.get("rarity", "Common"), []).append(name)
+        cached = GACHA_POOLS[id(roster)] = {"size": len(roster), "names": list(roster), "pools": pools}
+    return cached["pools"]
+
+def gacha_names(table: LazyContentMapping) -> List[str]:
+    """Every name of a gacha table, cached alongside its rarity pools"""
+    gacha_pools(table)
+    return GACHA_POOLS[id(table.data)]["names"]
+
 def pull_weapon(is_limited: bool = False, force_rarity: Optional[str] = None) -> str:
     """Pull a weapon from the weapon pool
 
@@ -19651,26 +18475,14 @@ def pull_weapon(is_limited: bool = False, force_rarity: Optional[str] = None) ->
         Name of the pulled weapon
     """
     # Get all available weapons
-    all_weapons = list(CHARACTER_WEAPONS.keys())
+    all_weapons = gacha_names(CHARACTER_WEAPONS)
 
     if not all_weapons:
         print_colored("No weapons available in the pool.", RED)
         return "No Weapon Found"
 
-    # Initialize weapon categories by rarity
-    weapons_by_rarity = {
-        "Common": [],
-        "Uncommon": [],
-        "Rare": [],
-        "Epic": [],
-        "Legendary": []
-    }
-
-    # Group weapons by rarity
-    for weapon_name in all_weapons:
-        weapon_data = CHARACTER_WEAPONS.get(weapon_name, {})
-        rarity = weapon_data.get("rarity", "Common")
-        weapons_by_rarity[rarity].append(weapon_name)
+    # Weapons grouped by rarity
+    weapons_by_rarity = gacha_pools(CHARACTER_WEAPONS)
 
     # Check for 5-star pity (weapon)
     if "weapon_pity_5star" not in user_data["gacha"]:
@@ -19792,114 +18604,170 @@ def pull_weapon(is_limited: bool = False, force_rarity: Optional[str] = None) ->
 
     return pulled_weapon
 
-def pull_character(banner_type: str = "standard", featured_character: str = "", force_rarity: Optional[str] = None) -> str:
-    """Pull a character from the character pool
+def roll_character(state: Dict[str, Any], banner_type: str = "standard", featured_character: str = "",
+                   force_rarity: Optional[str] = None, rng: Any = random) -> Tuple[str, Optional[str]]:
+    """Roll one character pull against the pity counters in state, without granting or showing it
 
     Args:
+        state: The gacha data holding the pity counters, updated in place
         banner_type: The type of banner to pull from ('standard', 'limited', etc.)
         featured_character: The featured character on the banner
         force_rarity: Force a specific rarity (for 10-pull guarantees)
+        rng: Source of randomness, the random module or a random.Random
 
     Returns:
-        Name of the pulled character
+        The pulled character and the 50/50 outcome ("guaranteed", "won", "lost" or None)
     """
-    # Get all available characters
-    all_characters = list(GACHA_CHARACTERS.keys())
-
-    if not all_characters:
-        print_colored("No characters available in the pool.", RED)
-        return "No Character Found"
-
-    # Initialize character categories by rarity
-    characters_by_rarity = {
-        "Common": [],
-        "Uncommon": [],
-        "Rare": [],
-        "Epic": [],
-        "Legendary": []
-    }
-
-    # Group characters by rarity
-    for char_name in all_characters:
-        char_data = GACHA_CHARACTERS.get(char_name, {})
-        rarity = char_data.get("rarity", "Common")
-        characters_by_rarity[rarity].append(char_name)
-
-    # Check for 5-star pity
-    if "character_pity_5star" not in user_data["gacha"]:
-        user_data["gacha"]["character_pity_5star"] = 0
-
-    if "character_pity_4star" not in user_data["gacha"]:
-        user_data["gacha"]["character_pity_4star"] = 0
-
-    # Check for 50/50 pity (losing 50/50 guarantees next 5-star is featured)
-    if "character_guaranteed_featured" not in user_data["gacha"]:
-        user_data["gacha"]["character_guaranteed_featured"] = False
+    all_characters = gacha_names(GACHA_CHARACTERS)
+    characters_by_rarity = gacha_pools(GACHA_CHARACTERS)
 
     # Increment pity counters
-    user_data["gacha"]["character_pity_5star"] += 1
-    user_data["gacha"]["character_pity_4star"] += 1
+    state["character_pity_5star"] = state.get("character_pity_5star", 0) + 1
+    state["character_pity_4star"] = state.get("character_pity_4star", 0) + 1
+
+    # Losing a 50/50 guarantees the next 5-star is featured
+    if "character_guaranteed_featured" not in state:
+        state["character_guaranteed_featured"] = False
 
     # Generate probabilities
     if force_rarity:
         rarity = force_rarity
     else:
         # Check for 5-star pity (90 pulls guaranteed)
-        if user_data["gacha"]["character_pity_5star"] >= 90:
+        if state["character_pity_5star"] >= 90:
             rarity = "Legendary"
-            user_data["gacha"]["character_pity_5star"] = 0
+            state["character_pity_5star"] = 0
         # Check for 4-star pity (10 pulls guaranteed)
-        elif user_data["gacha"]["character_pity_4star"] >= 10:
+        elif state["character_pity_4star"] >= 10:
             # Determine if 4 or 5 star
-            if random.random() < 0.05:  # 5% chance for 5-star on 4-star pity
+            if rng.random() < 0.05:  # 5% chance for 5-star on 4-star pity
                 rarity = "Legendary"
             else:
                 rarity = "Epic"
-            user_data["gacha"]["character_pity_4star"] = 0
+            state["character_pity_4star"] = 0
         # Regular probability check
         else:
-            rarities = ["Common", "Uncommon", "Rare", "Epic", "Legendary"]
-            weights = [30.0, 35.0, 20.0, 13.0, 2.0]  # Based on CHARACTER_RARITIES pull_rate
-            rarity = random.choices(rarities, weights=weights, k=1)[0]
+            rarity = rng.choices(GACHA_RARITY_ORDER, cum_weights=CHARACTER_PULL_CUM_WEIGHTS, k=1)[0]
 
             if rarity == "Legendary":
-                user_data["gacha"]["character_pity_5star"] = 0
+                state["character_pity_5star"] = 0
             if rarity in ["Epic", "Legendary"]:
-                user_data["gacha"]["character_pity_4star"] = 0
-
-    # Get the character based on rarity
-    pulled_character = "None"
+                state["character_pity_4star"] = 0
 
     # 50/50 chance for featured character on limited banner for 5-stars
     if rarity == "Legendary" and banner_type == "limited" and featured_character:
-        if user_data["gacha"]["character_guaranteed_featured"]:
-            # Guaranteed featured character
-            pulled_character = featured_character
-            user_data["gacha"]["character_guaranteed_featured"] = False
-            print_colored("✨ Guaranteed featured character! ✨", YELLOW)
-        elif random.random() < 0.5:  # 50% chance to get featured
-            pulled_character = featured_character
-            print_colored("✨ You won the 50/50 and got the featured character! ✨", YELLOW)
-            user_data["gacha"]["character_guaranteed_featured"] = False
+        if state["character_guaranteed_featured"]:
+            state["character_guaranteed_featured"] = False
+            return featured_character, "guaranteed"
+        if rng.random() < 0.5:  # 50% chance to get featured
+            state["character_guaranteed_featured"] = False
+            return featured_character, "won"
+
+        # Lost 50/50, get a random legendary character and guarantee the next 5-star
+        non_featured_legendaries = [c for c in characters_by_rarity["Legendary"] if c != featured_character]
+        if non_featured_legendaries:
+            pulled_character = rng.choice(non_featured_legendaries)
         else:
-            # Lost 50/50, get a random legendary character
-            non_featured_legendaries = [c for c in characters_by_rarity["Legendary"] if c != featured_character]
-            if non_featured_legendaries:
-                pulled_character = random.choice(non_featured_legendaries)
-            else:
-                pulled_character = random.choice(all_characters)  # Fallback
+            pulled_character = rng.choice(all_characters)  # Fallback
+        state["character_guaranteed_featured"] = True
+        return pulled_character, "lost"
+
+    # Get character from selected rarity pool
+    if characters_by_rarity.get(rarity):
+        return rng.choice(characters_by_rarity[rarity]), None
+    # Fallback to any character
+    return rng.choice(all_characters), None
+
+FEATURED_OUTCOME_MESSAGES = {
+    "guaranteed": ("✨ Guaranteed featured character! ✨", YELLOW),
+    "won": ("✨ You won the 50/50 and got the featured character! ✨", YELLOW),
+    "lost": ("💔 You lost the 50/50, but your next 5-star is guaranteed to be the featured character! 💔", MAGENTA),
+}
 
-            # Set guaranteed for next 5-star
-            user_data["gacha"]["character_guaranteed_featured"] = True
-            print_colored("💔 You lost the 50/50, but your next 5-star is guaranteed to be the featured character! 💔", MAGENTA)
-    else:
-        # Get character from selected rarity pool
-        if characters_by_rarity[rarity]:
-            pulled_character = random.choice(characters_by_rarity[rarity])
-        else:
-            # Fallback to any character
-            pulled_character = random.choice(all_characters)
+def pull_character(banner_type: str = "standard", featured_character: str = "", force_rarity: Optional[str] = None) -> str:
+    """Pull a character from the character pool
+
+    Args:
+        banner_type: The type of banner to pull from ('standard', 'limited', etc.)
+        featured_character: The featured character on the banner
+        force_rarity: Force a specific rarity (for 10-pull guarantees)
+
+    Returns:
+        Name of the pulled character
+    """
+    if not GACHA_CHARACTERS:
+        print_colored("No characters available in the pool.", RED)
+        return "No Character Found"
+
+    pulled_character, outcome = roll_character(user_data["gacha"], banner_type, featured_character, force_rarity)
+    if outcome:
+        print_colored(*FEATURED_OUTCOME_MESSAGES[outcome])
+    grant_character(pulled_character)
+    return pulled_character
+
+def pull_characters(count: int, banner_type: str = "standard", featured_character: str = "",
+                    reveal_pause: float = 0.0) -> List[str]:
+    """Pull several characters in one go: roll them all, update pity once, then show the results
+
+    Args:
+        count: Number of pulls
+        banner_type: The type of banner to pull from ('standard', 'limited', etc.)
+        featured_character: The featured character on the banner
+        reveal_pause: Seconds to wait after revealing each result
+
+    Returns:
+        Names of the pulled characters in pull order
+    """
+    if not GACHA_CHARACTERS:
+        print_colored("No characters available in the pool.", RED)
+        return []
+
+    # Roll against a copy of the pity state and write it back in one update
+    gacha = user_data["gacha"]
+    state = {key: gacha[key] for key in ("character_pity_5star", "character_pity_4star",
+                                         "character_guaranteed_featured") if key in gacha}
+    rolls = [roll_character(state, banner_type, featured_character) for _ in range(count)]
+    gacha.update(state)
+
+    for pulled_character, outcome in rolls:
+        if outcome:
+            print_colored(*FEATURED_OUTCOME_MESSAGES[outcome])
+        grant_character(pulled_character)
+        if reveal_pause:
+            pause(reveal_pause)
+    return [pulled_character for pulled_character, outcome in rolls]
+
+def simulate_featured_pulls(players: int, seed: Optional[int] = None,
+                            character_share: float = 0.15) -> Dict[int, int]:
+    """Simulate players wishing on the limited banner until they get its featured character
+
+    Uses the real pity and 50/50 rules from fresh pity counters, with each single wish
+    landing on the character pool with probability character_share (the rest are weapons).
+
+    Returns:
+        Histogram of wishes needed to get the featured character
+    """
+    rng = random.Random(seed)
+    featured_character = next(iter(gacha_pools(GACHA_CHARACTERS)["Legendary"]), "")
+    if not featured_character:
+        return {}
+
+    histogram: Dict[int, int] = {}
+    for _ in range(players):
+        state: Dict[str, Any] = {}
+        wishes = 0
+        while True:
+            wishes += 1
+            if rng.random() >= character_share:
+                continue
+            outcome = roll_character(state, "limited", featured_character, rng=rng)[1]
+            if outcome in ("guaranteed", "won"):
+                break
+        histogram[wishes] = histogram.get(wishes, 0) + 1
+    return histogram
 
+def grant_character(pulled_character: str) -> bool:
+    """Add a pulled character to the collection (or shards for duplicates) and show it, returns whether it was new"""
     # Store the character
     if "characters" not in user_data["gacha"]:
         user_data["gacha"]["characters"] = []
@@ -19931,6 +18799,7 @@ def pull_character(banner_type: str = "standard", featured_character: str = "",
 
         user_data["gacha"]["memory_shards"][pulled_character] += shard_bonus
         print_colored(f"Duplicate character: +{shard_bonus} Memory Shards for {pulled_character}", BLUE)
+    invalidate_party_synergy()
 
     # Display the result
     char_data = GACHA_CHARACTERS.get(pulled_character, {})
@@ -19959,7 +18828,7 @@ def pull_character(banner_type: str = "standard", featured_character: str = "",
                     user_data["gacha"]["equipped_weapons"][pulled_character] = weapon_name
                     print_colored(f"Automatically equipped {weapon_name} to {pulled_character}!", GREEN)
 
-    return pulled_character
+    return is_new
 
 def view_weapon_materials() -> None:
     """View weapon enhancement and refinement materials"""
@@ -21125,6 +19994,7 @@ def manage_party() -> None:
             remove_character_from_party()
         elif choice == 3:
             user_data["gacha"]["current_party"] = []
+            invalidate_party_synergy()
             print_colored("Party cleared.", GREEN)
         elif choice == 4:
             return
@@ -21178,6 +20048,7 @@ def add_character_to_party() -> None:
         if 1 <= choice <= len(available_chars):
             selected_char = available_chars[choice-1]
             user_data["gacha"]["current_party"].append(selected_char)
+            invalidate_party_synergy()
             print_colored(f"{selected_char} added to party!", GREEN)
         else:
             print_colored("Invalid choice.", RED)
@@ -21216,6 +20087,7 @@ def remove_character_from_party() -> None:
 
         if 1 <= choice <= len(current_party):
             removed_char = current_party.pop(choice-1)
+            invalidate_party_synergy()
             print_colored(f"{removed_char} removed from party!", GREEN)
         else:
             print_colored("Invalid choice.", RED)
@@ -21336,212 +20208,7 @@ villages = [
     {"name": "Dragon's Reach", "population": 95, "special_items": ["Dragon Claw", "Dragon Fang"]},
 ]
 
-biomes = [
-{
-   "name":"Forest",
-   "description":"A lush green area filled with trees and wildlife."
-},
-{
-   "name":"Desert",
-   "description":"A vast sandy area with scarce resources."
-},
-{
-   "name":"Cave",
-   "description":"A dark underground area with hidden treasures."
-},
-{
-   "name":"Snowy Peaks",
-   "description":"A cold mountainous region with snow-covered terrain."
-},
-{
-    "name": "Lava River",
-    "description": "A river of molten lava flowing through a rocky landscape."
-},
-{
-    "name": "Plains",
-    "description": "A flat, open area with grasslands and few trees."
-},
-{
-   "name":"Swamp",
-   "description":"A murky area filled with water and strange creatures."
-},
-{
-   "name":"Ocean",
-   "description":"A vast body of water with islands and sea monsters."
-},
-{
-   "name":"Sky Islands",
-   "description":"Floating islands high in the sky, accessible by air."
-},
-{
-   "name":"Crystal Caverns",
-   "description":"A cave filled with sparkling crystals and rare minerals."
-},
-{
-    "name": "Mines",
-    "description": "A network of tunnels and shafts, rich in minerals and ores."
-},
-{
-    "name": "Temple",
-    "description": "An ancient structure filled with traps and treasures."
-},
-{
-    "name": "Desert Spring",
-    "description": "A hidden refreshing big spring filled with water and strange creatures in depths of the hot desert."
-},
-{
-    "name":"Ancient Ruins",
-    "description":"Remnants of a long-lost civilization, filled with secrets and treasures."
-},
-{
-   "name":"Jungle",
-   "description":"A dense and tropical area filled with towering trees, exotic plants, and wild animals."
-},
-{
-   "name":"Tundra",
-   "description":"A cold, barren landscape with little vegetation, covered in permafrost and snow."
-},
-{
-   "name":"Savannah",
-   "description":"A vast grassy plain with scattered trees, home to many herds of animals."
-},
-{
-   "name":"Fungal Forest",
-   "description":"A damp, dark forest where giant fungi dominate the landscape instead of trees."
-},
-{
-   "name":"Mountain Range",
-   "description":"A towering series of mountains, often with dangerous cliffs and peaks, and home to hardy creatures."
-},
-{
-   "name":"Rainforest",
-   "description":"A hot, humid area with dense foliage, continuous rainfall, and diverse wildlife."
-},
-{
-   "name":"Barren Wasteland",
-   "description":"An empty, desolate region with little to no life, plagued by sandstorms and harsh winds."
-},
-{
-   "name":"Underwater Ruins",
-   "description":"Sunken cities and forgotten structures beneath the ocean, filled with ancient artifacts and dangers."
-},
-{
-   "name":"Meadow",
-   "description":"A peaceful, open field filled with colorful flowers, tall grasses, and peaceful wildlife."
-},
-{
-   "name":"Mystic Forest",
-   "description":"A magical forest filled with glowing plants, enchanted creatures, and hidden secrets."
-},
-{
-   "name":"Twilight Grove",
-   "description":"A mysterious forest where the sun never fully sets, creating a perpetual twilight with bioluminescent plants and glowing creatures."
-},
-{
-   "name":"Corrupted Land",
-   "description":"A dark and twisted environment where the very soil is tainted, giving rise to dangerous, mutated creatures and toxic flora."
-},
-{
-   "name":"Icy Wastes",
-   "description":"A barren, freezing expanse filled with endless ice fields, glaciers, and the occasional frozen lake hiding ancient secrets."
-},
-{
-   "name":"Oasis",
-   "description":"A rare, fertile area in the desert, featuring a small pool of water surrounded by palm trees and desert wildlife."
-},
-{
-   "name":"Lush Highlands",
-   "description":"A rolling green landscape with gentle hills, fertile soil, and peaceful wildlife, perfect for farming or settling."
-},
-{
-   "name":"Boreal Forest",
-   "description":"A cold and dense forest filled with evergreens and snow, inhabited by resilient wildlife adapted to the harsh conditions."
-},
-{
-   "name":"Sunken Abyss",
-   "description":"An underwater trench deep in the ocean, home to strange abyssal creatures and ancient, sunken ruins."
-},
-{
-   "name":"Shroom Cavern",
-   "description":"A vast underground network filled with towering mushrooms, glowing spores, and rare fungal lifeforms."
-},
-{
-   "name":"Frostbitten Tundra",
-   "description":"An arctic wasteland where the air is frozen, and snowstorms are a constant threat, with dangerous wildlife adapted to the extreme cold."
-},
-{
-   "name":"Radiant Plains",
-   "description":"A glowing meadow where flowers and grasses emit light, creating a serene and ethereal landscape filled with beauty and tranquility."
-},
-{
-   "name":"Ashen Wastes",
-   "description":"A scorched, desolate plain left behind by ancient fires, where the ground is cracked, and the air is thick with ash and smoke."
-},
-{
-   "name":"Celestial Peaks",
-   "description":"Towering mountain ranges that reach beyond the clouds, where the air is thin, and the environment is home to rare celestial beings."
-},
-{
-   "name":"Mystic Marsh",
-   "description":"A foggy and swampy area filled with enchanted waters, strange will-o'-the-wisps, and ancient trees with whispered secrets."
-},
-{
-   "name":"Crystal Fields",
-   "description":"Vast plains where the earth itself is covered with shimmering crystals, creating a dazzling landscape that’s both beautiful and treacherous."
-},
-{
-   "name":"Vibrant Reef",
-   "description":"A colorful underwater biome teeming with vibrant corals, exotic fish, and rare underwater plants, but also home to deadly sea predators."
-},
-{
-   "name":"Sandstorm Flats",
-   "description":"A vast desert landscape constantly ravaged by powerful sandstorms, leaving only remnants of ancient structures buried beneath the dunes."
-},
-{
-   "name":"The Nether",
-   "description":"A fiery, chaotic dimension filled with volcanic terrain, strange creatures, and hostile environments, with a constant threat of fire and lava."
-},
-{
-   "name":"Skyward Cavern",
-   "description":"A network of caves suspended in the sky, connected by floating platforms and filled with rare ores and aerial creatures."
-},
-{
-    "name":"Volcano",
-    "description":"A towering mountain with a fiery core, spewing lava and ash, home to fire elementals and rare minerals."
-},
-{
-    "name":"Coast",
-    "description":"A sandy beach area with gentle waves, palm trees, and hidden treasures along the shore."
-},
-{
-    "name": "Cliffside",
-    "description": "A steep rocky area overlooking the ocean, with hidden caves and dangerous cliffs."
-},
-{
-    "name": "Deep Cave",
-    "description": "A dark cave filled with hidden treasures and dangerous creatures."
-},
-{
-    "name": "Dragon's Reach",
-    "description": "A mountainous area rumored to once be home to the oldest original dragons,now left only with hidden caves and treasures."
-},
-{
-    "name": "Dragon's peak",
-    "description": "A high mountain peak where The great war of human rebellion occurred,where humans killed the last dragon king Frosthymir. Now said to be cursed from all the renmants of the diseased and hatred souls of the dragons who died in that war."
-},
-{
-    "name": "Lotus Pond",
-    "description": "A serene pond filled with beautiful lotus flowers, home to rare aquatic creatures and the Koi along with their empress."
-},
-{
-    "name": "Abyssal Ravine",
-    "description": "A deep underwater cavern filled with ancient ruins from people that used to inhabit here,with rare conditions met this place can create rare minerals"
-},
-{
-    "name": "Ancient Forest Of Gradanvanka",
-    "description": "A dense forest created by the Eternal Gradanvanka when the Eternals, a demigod that lives now in the sky, still walked among mortals in this world."
-},
-]
+biomes = CONTENT.sequence("biomes")
 
 # Dismantle items function stub
 def dismantle_items() -> None:
@@ -21594,50 +20261,16 @@ def show_inventory() -> None:
         print("Your inventory is empty.")
         return
 
-    # Group items by type
-    weapons = []
-    armors = []
-    accessories = []
-    artifacts = []
-    potions = []
-    misc = []
-
-    for item_name in user_data["inventory"]:
-        # Check if this is an item object with details
-        if isinstance(item_name, dict):
-            item = item_name
-            item_name = item["name"]
-
-            if item.get("type") == "weapon":
-                weapons.append(item)
-            elif item.get("type") == "armor":
-                armors.append(item)
-            elif item.get("type") == "accessory":
-                accessories.append(item)
-            elif item.get("type") == "artifact":
-                artifacts.append(item)
-            elif item.get("type") == "potion":
-                potions.append(item)
-            else:
-                misc.append(item_name)
-        else:
-            # For simple string items, check against recipes
-            if item_name in CRAFTING_RECIPES:
-                recipe = CRAFTING_RECIPES[item_name]
-                if recipe.get("type") == "weapon":
-                    weapons.append(item_name)
-                elif recipe.get("type") == "armor":
-                    armors.append(item_name)
-                elif recipe.get("type") == "accessory":
-                    accessories.append(item_name)
-                elif recipe.get("type") == "artifact":
-                    artifacts.append(item_name)
-                else:
-                    misc.append(item_name)
-            elif item_name in POTION_RECIPES:
-                potions.append(item_name)
-            else:
-                misc.append(item_name)
+    # Items are filed by type as they enter the inventory
+    def listed(category: str) -> List[Any]:
+        return [item for item, count in user_data["inventory"].stacks(category) for _ in range(count)]
+
+    weapons = listed("weapon")
+    armors = listed("armor")
+    accessories = listed("accessory")
+    artifacts = listed("artifact")
+    potions = listed("potion")
+    misc = [item["name"] if isinstance(item, dict) else item for item in listed("misc")]
 
     # Display sections
     if weapons:
@@ -21797,494 +20430,118 @@ SEASONS = ["Spring", "Summer", "Fall", "Winter"]
 # Current season tracking
 if "current_season" not in game_state:
     game_state["current_season"] = "Spring"
-    game_state["season_day"] = 1
     game_state["days_per_season"] = 30  # Each season lasts 30 in-game days
 
-CROPS = {
-    # Basic Crops
-    "Wheat": {
-        "growth_time": 2, 
-        "yield": "Wheat", 
-        "seed_cost": 10, 
-        "sell_price": 25, 
-        "biome": ["Plains", "Abundant Field"],
-        "optimal_weather": ["sunny", "clear"],
-        "weak_weather": ["stormy", "windy"],
-        "seasons": ["Spring", "Summer", "Fall"],
-        "tier": "common",
-        "description": "A staple grain crop that grows quickly."
-    },
-    "Corn": {
-        "growth_time": 3, 
-        "yield": "Corn", 
-        "seed_cost": 15, 
-        "sell_price": 35, 
-        "biome": ["Plains", "Abundant Field"],
-        "optimal_weather": ["sunny", "rainy"],
-        "weak_weather": ["foggy"],
-        "seasons": ["Summer", "Fall"],
-        "tier": "common",
-        "description": "Tall stalks with yellow kernels. Loves the heat."
-    },
-    "Tomato": {
-        "growth_time": 4, 
-        "yield": "Tomato", 
-        "seed_cost": 20, 
-        "sell_price": 45, 
-        "biome": ["Plains", "Garden"],
-        "optimal_weather": ["sunny", "clear"],
-        "weak_weather": ["foggy", "stormy"],
-        "seasons": ["Summer"],
-        "tier": "common",
-        "description": "Red juicy fruits that thrive in warm weather."
-    },
-    "Potato": {
-        "growth_time": 5, 
-        "yield": "Potato", 
-        "seed_cost": 25, 
-        "sell_price": 55, 
-        "biome": ["Plains", "Abundant Field"],
-        "optimal_weather": ["rainy", "cloudy"],
-        "weak_weather": ["sunny"],
-        "seasons": ["Spring", "Fall"],
-        "tier": "common",
-        "description": "Starchy tubers that grow underground."
-    },
-    "Rice": {
-        "growth_time": 6, 
-        "yield": "Rice", 
-        "seed_cost": 30, 
-        "sell_price": 65, 
-        "biome": ["Swamp", "Plains"],
-        "optimal_weather": ["rainy"],
-        "weak_weather": ["sunny", "windy"],
-        "seasons": ["Spring", "Summer"],
-        "tier": "common",
-        "description": "Grows best in waterlogged soil."
-    },
-    "Carrot": {
-        "growth_time": 3, 
-        "yield": "Carrot", 
-        "seed_cost": 15, 
-        "sell_price": 35, 
-        "biome": ["Plains", "Garden"],
-        "optimal_weather": ["rainy", "cloudy"],
-        "weak_weather": ["stormy"],
-        "seasons": ["Spring", "Fall"],
-        "tier": "common",
-        "description": "Orange root vegetables that grow underground."
-    },
-    "Lettuce": {
-        "growth_time": 2, 
-        "yield": "Lettuce", 
-        "seed_cost": 10, 
-        "sell_price": 25, 
-        "biome": ["Plains", "Garden"],
-        "optimal_weather": ["cloudy", "rainy"],
-        "weak_weather": ["sunny", "stormy"],
-        "seasons": ["Spring", "Fall"],
-        "tier": "common",
-        "description": "Leafy green vegetable that prefers cool weather."
-    },
-    "Strawberry": {
-        "growth_time": 4, 
-        "yield": "Strawberry", 
-        "seed_cost": 25, 
-        "sell_price": 55, 
-        "biome": ["Plains", "Garden"],
-        "optimal_weather": ["sunny", "rainy"],
-        "weak_weather": ["stormy", "foggy"],
-        "seasons": ["Spring", "Summer"],
-        "tier": "common",
-        "description": "Sweet red berries that grow on small plants."
-    },
-
-    # New Common Crops
-    "Onion": {
-        "growth_time": 3, 
-        "yield": "Onion", 
-        "seed_cost": 15, 
-        "sell_price": 40, 
-        "biome": ["Plains", "Garden"],
-        "optimal_weather": ["clear", "sunny"],
-        "weak_weather": ["rainy", "foggy"],
-        "seasons": ["Spring", "Summer"],
-        "tier": "common",
-        "description": "Layered bulbs with a strong aroma."
-    },
-    "Pumpkin": {
-        "growth_time": 7, 
-        "yield": "Pumpkin", 
-        "seed_cost": 35, 
-        "sell_price": 70, 
-        "biome": ["Plains", "Garden"],
-        "optimal_weather": ["sunny", "clear"],
-        "weak_weather": ["stormy", "foggy"],
-        "seasons": ["Summer", "Fall"],
-        "tier": "common",
-        "description": "Large orange gourds that grow on sprawling vines."
-    },
-    "Cabbage": {
-        "growth_time": 5, 
-        "yield": "Cabbage", 
-        "seed_cost": 20, 
-        "sell_price": 50, 
-        "biome": ["Plains", "Garden"],
-        "optimal_weather": ["cloudy", "rainy"],
-        "weak_weather": ["sunny", "windy"],
-        "seasons": ["Spring", "Fall"],
-        "tier": "common",
-        "description": "Dense leafy heads that prefer cooler weather."
-    },
-    "Eggplant": {
-        "growth_time": 6, 
-        "yield": "Eggplant", 
-        "seed_cost": 30, 
-        "sell_price": 60,
-        "biome": ["Plains", "Garden"],
-        "optimal_weather": ["sunny", "clear"],
-        "weak_weather": ["foggy", "windy"],
-        "seasons": ["Summer"],
-        "tier": "common",
-        "description": "Purple fruits with a meaty texture."
-    },
-
-    # Uncommon Crops
-    "Watermelon": {
-        "growth_time": 8, 
-        "yield": "Watermelon", 
-        "seed_cost": 45, 
-        "sell_price": 90, 
-        "biome": ["Plains", "Garden"],
-        "optimal_weather": ["sunny", "rainy"],
-        "weak_weather": ["windy", "foggy"],
-        "seasons": ["Summer"],
-        "tier": "uncommon",
-        "description": "Large, juicy fruits with red flesh and black seeds."
-    },
-    "Pineapple": {
-        "growth_time": 10, 
-        "yield": "Pineapple", 
-        "seed_cost": 60, 
-        "sell_price": 120, 
-        "biome": ["Plains", "Tropical Beach"],
-        "optimal_weather": ["sunny", "clear"],
-        "weak_weather": ["cloudy", "foggy"],
-        "seasons": ["Summer"],
-        "tier": "uncommon",
-        "description": "Spiky tropical fruits with sweet yellow flesh."
-    },
-    "Sunflower": {
-        "growth_time": 6, 
-        "yield": "Sunflower Seeds", 
-        "seed_cost": 40, 
-        "sell_price": 85, 
-        "biome": ["Plains", "Abundant Field"],
-        "optimal_weather": ["sunny", "clear"],
-        "weak_weather": ["stormy", "windy"],
-        "seasons": ["Summer", "Fall"],
-        "tier": "uncommon",
-        "description": "Tall flowers with edible seeds that follow the sun."
-    },
-    "Grape": {
-        "growth_time": 9, 
-        "yield": "Grapes", 
-        "seed_cost": 55, 
-        "sell_price": 110, 
-        "biome": ["Plains", "Garden"],
-        "optimal_weather": ["sunny", "clear"],
-        "weak_weather": ["stormy", "foggy"],
-        "seasons": ["Summer", "Fall"],
-        "tier": "uncommon",
-        "description": "Clusters of small fruits that grow on vines."
-    },
-
-    # Special Crops
-    "Golden Wheat": {
-        "growth_time": 8, 
-        "yield": "Golden Wheat", 
-        "seed_cost": 100, 
-        "sell_price": 250, 
-        "biome": ["Plains", "Mystic Forest"],
-        "optimal_weather": ["sunny", "clear"],
-        "weak_weather": ["stormy", "foggy"],
-        "seasons": ["Summer", "Fall"],
-        "tier": "rare",
-        "description": "Magical grain that glows with a golden light."
-    },
-    "Magic Beans": {
-        "growth_time": 10, 
-        "yield": "Magic Beans", 
-        "seed_cost": 150, 
-        "sell_price": 300, 
-        "biome": ["Mystic Forest"],
-        "optimal_weather": ["rainy", "foggy"],
-        "weak_weather": ["sunny", "clear"],
-        "seasons": ["Spring", "Fall"],
-        "tier": "rare",
-        "description": "Mystical beans that may grow into something extraordinary."
-    },
-    "Dragon Fruit": {
-        "growth_time": 12, 
-        "yield": "Dragon Fruit", 
-        "seed_cost": 200, 
-        "sell_price": 450, 
-        "biome": ["Dragon's Peak"],
-        "optimal_weather": ["sunny", "clear"],
-        "weak_weather": ["rainy", "foggy"],
-        "seasons": ["Summer"],
-        "tier": "epic",
-        "description": "Exotic fruits with fiery properties."
-    },
-    "Moonflower": {
-        "growth_time": 6, 
-        "yield": "Moonflower", 
-        "seed_cost": 80, 
-        "sell_price": 200, 
-        "biome": ["Moonveil Harbor"],
-        "optimal_weather": ["foggy", "cloudy"],
-        "weak_weather": ["sunny", "stormy"],
-        "seasons": ["Spring", "Fall"],
-        "tier": "rare",
-        "description": "Silver flowers that bloom under moonlight."
-    },
-    "Frost Berries": {
-        "growth_time": 5, 
-        "yield": "Frost Berries", 
-        "seed_cost": 90, 
-        "sell_price": 220, 
-        "biome": ["Frostvale"],
-        "optimal_weather": ["cloudy", "foggy"],
-        "weak_weather": ["sunny", "rainy"],
-        "seasons": ["Winter"],
-        "tier": "rare",
-        "description": "Icy blue berries that remain frozen even in warm weather."
-    },
-    "Fire Peppers": {
-        "growth_time": 7, 
-        "yield": "Fire Peppers", 
-        "seed_cost": 120, 
-        "sell_price": 280, 
-        "biome": ["Ember Hollow"],
-        "optimal_weather": ["sunny", "clear"],
-        "weak_weather": ["rainy", "foggy"],
-        "seasons": ["Summer"],
-        "tier": "rare",
-        "description": "Intensely hot peppers that occasionally emit sparks."
-    },
-    "Shadow Root": {
-        "growth_time": 9, 
-        "yield": "Shadow Root", 
-        "seed_cost": 130, 
-        "sell_price": 290, 
-        "biome": ["Shadowmere"],
-        "optimal_weather": ["foggy", "cloudy"],
-        "weak_weather": ["sunny", "clear"],
-        "seasons": ["Fall", "Winter"],
-        "tier": "rare",
-        "description": "Mysterious roots that seem to absorb light."
-    },
-    "Crystal Bloom": {
-        "growth_time": 11, 
-        "yield": "Crystal Bloom", 
-        "seed_cost": 180, 
-        "sell_price": 400, 
-        "biome": ["Crystal Cave"],
-        "optimal_weather": ["clear", "foggy"],
-        "weak_weather": ["stormy", "rainy"],
-        "seasons": ["Winter", "Spring"],
-        "tier": "epic",
-        "description": "Flowers with petals that resemble translucent crystals."
-    },
-
-    # Dimension-Specific Crops
-    "Cosmic Lotus": {
-        "growth_time": 15, 
-        "yield": "Cosmic Lotus", 
-        "seed_cost": 300, 
-        "sell_price": 750, 
-        "biome": ["Celestial Realm"],
-        "optimal_weather": ["Cosmic Rain", "Celestial Harmony"],
-        "weak_weather": ["clear", "foggy"],
-        "seasons": ["All"],
-        "tier": "legendary",
-        "description": "A mystical flower that contains the essence of stars."
-    },
-    "Void Mushroom": {
-        "growth_time": 12, 
-        "yield": "Void Mushroom", 
-        "seed_cost": 250, 
-        "sell_price": 600, 
-        "biome": ["Shadow Realm"],
-        "optimal_weather": ["Darkness Storm", "Void Mist"],
-        "weak_weather": ["sunny", "rainy"],
-        "seasons": ["All"],
-        "tier": "epic",
-        "description": "Fungus that thrives in complete darkness."
-    },
-    "Elemental Orchid": {
-        "growth_time": 14, 
-        "yield": "Elemental Essence", 
-        "seed_cost": 280, 
-        "sell_price": 700, 
-        "biome": ["Elemental Plane"],
-        "optimal_weather": ["Elemental Surge", "Primal Storm"],
-        "weak_weather": ["cloudy", "foggy"],
-        "seasons": ["All"],
-        "tier": "epic",
-        "description": "A flower that changes color based on the dominant element."
-    },
-    "Timeless Herb": {
-        "growth_time": 10, 
-        "yield": "Timeless Herb", 
-        "seed_cost": 230, 
-        "sell_price": 550, 
-        "biome": ["Ancient Ruins"],
-        "optimal_weather": ["Time Flux", "Arcane Winds"],
-        "weak_weather": ["stormy", "windy"],
-        "seasons": ["All"],
-        "tier": "rare",
-        "description": "An herb that seems to exist in multiple time periods at once."
-    },
-
-    # Rare Crops
-    "Phoenix Flower": {
-        "growth_time": 15, 
-        "yield": "Phoenix Flower", 
-        "seed_cost": 500, 
-        "sell_price": 1200, 
-        "biome": ["Silent Ashes"],
-        "optimal_weather": ["clear", "sunny"],
-        "weak_weather": ["rainy", "foggy"],
-        "seasons": ["Summer"],
-        "tier": "legendary",
-        "description": "A flower that burns with eternal flame."
-    },
-    "Dragon's Breath Plant": {
-        "growth_time": 20, 
-        "yield": "Dragon's Breath", 
-        "seed_cost": 800, 
-        "sell_price": 2000, 
-        "biome": ["Dragon's Peak"],
-        "optimal_weather": ["sunny", "clear"],
-        "weak_weather": ["rainy", "foggy"],
-        "seasons": ["Summer"],
-        "tier": "legendary",
-        "description": "A plant that exhales wisps of dragonfire."
-    },
-    "Celestial Herb": {
-        "growth_time": 18, 
-        "yield": "Celestial Herb", 
-        "seed_cost": 600, 
-        "sell_price": 1500, 
-        "biome": ["Celestial Peaks"],
-        "optimal_weather": ["clear", "Celestial Harmony"],
-        "weak_weather": ["stormy", "windy"],
-        "seasons": ["Spring", "Summer"],
-        "tier": "legendary",
-        "description": "A mythical herb that radiates celestial energy."
-    },
-    "Void Lotus": {
-        "growth_time": 25, 
-        "yield": "Void Lotus", 
-        "seed_cost": 1000, 
-        "sell_price": 2500, 
-        "biome": ["Crimson Abyss"],
-        "optimal_weather": ["foggy", "Void Mist"],
-        "weak_weather": ["sunny", "clear"],
-        "seasons": ["Winter", "Fall"],
-        "tier": "legendary",
-        "description": "A lotus that blooms in the darkest void, absorbing all light around it."
-    },
-
-    # Seasonal Specialty Crops
-    "Winter Mint": {
-        "growth_time": 8,
-        "yield": "Winter Mint",
-        "seed_cost": 75,
-        "sell_price": 180,
-        "biome": ["Frost Plains", "Garden"],
-        "optimal_weather": ["snowy", "cloudy"],
-        "weak_weather": ["sunny", "clear"],
-        "seasons": ["Winter"],
-        "tier": "uncommon",
-        "description": "Frosty blue leaves with a cooling effect. Thrives in winter."
-    },
-    "Autumn Squash": {
-        "growth_time": 7,
-        "yield": "Autumn Squash",
-        "seed_cost": 40,
-        "sell_price": 90,
-        "biome": ["Plains", "Garden"],
-        "optimal_weather": ["cloudy", "clear"],
-        "weak_weather": ["stormy", "foggy"],
-        "seasons": ["Fall"],
-        "tier": "uncommon",
-        "description": "Rich, colorful gourds that store well through winter."
-    },
-    "Spring Tulips": {
-        "growth_time": 4,
-        "yield": "Spring Tulips",
-        "seed_cost": 30,
-        "sell_price": 75,
-        "biome": ["Garden", "Meadow"],
-        "optimal_weather": ["rainy", "cloudy"],
-        "weak_weather": ["stormy", "windy"],
-        "seasons": ["Spring"],
-        "tier": "uncommon",
-        "description": "Colorful spring flowers that symbolize renewal."
-    },
-    "Summer Melon": {
-        "growth_time": 9,
-        "yield": "Summer Melon",
-        "seed_cost": 50,
-        "sell_price": 120,
-        "biome": ["Plains", "Garden"],
-        "optimal_weather": ["sunny", "clear"],
-        "weak_weather": ["foggy", "cloudy"],
-        "seasons": ["Summer"],
-        "tier": "uncommon",
-        "description": "Sweet, juicy melons that love hot weather."
-    },
-
-    # Weather-Dependent Rare Crops
-    "Ghost Pepper": {
-        "growth_time": 12,
-        "yield": "Ghost Pepper",
-        "seed_cost": 100,
-        "sell_price": 250,
-        "biome": ["Volcanic Plains", "Desert"],
-        "optimal_weather": ["sunny", "clear"],
-        "weak_weather": ["rainy", "cloudy"],
-        "seasons": ["Summer", "Fall"],
-        "tier": "rare",
-        "description": "Extremely spicy peppers that seem to glow at night."
-    },
-    "Frost Lotus": {
-        "growth_time": 14,
-        "yield": "Frost Lotus",
-        "seed_cost": 120,
-        "sell_price": 280,
-        "biome": ["Frost Plains", "Mountain"],
-        "optimal_weather": ["snowy", "foggy"],
-        "weak_weather": ["sunny", "clear"],
-        "seasons": ["Winter"],
-        "tier": "rare",
-        "description": "Ice-blue flowers that only bloom in freezing conditions."
-    },
-    "Thunderroot": {
-        "growth_time": 11,
-        "yield": "Thunderroot",
-        "seed_cost": 110,
-        "sell_price": 260,
-        "biome": ["Plains", "Storm Fields"],
-        "optimal_weather": ["stormy", "rainy"],
-        "weak_weather": ["sunny", "clear"],
-        "seasons": ["Spring", "Fall"],
-        "tier": "rare",
-        "description": "Roots that absorb electrical energy during storms."
-    }
-}
+CROPS = CONTENT.mapping("CROPS")
+
+# (crop, season, weather) -> (season modifier, weather bonus), filled on first farm tick
+CROP_GROWTH_TABLE: Dict[Tuple[str, str, str], Tuple[float, float]] = {}
+
+def crop_growth_factors(crop_data: Dict[str, Any], season: str, weather: str) -> Tuple[float, float]:
+    """Season modifier and weather bonus of a crop under the given conditions"""
+    crop_seasons = crop_data.get("seasons", [])
+    if "All" in crop_seasons or season in crop_seasons:
+        season_modifier = 1.2  # Good season, or an all-season crop
+    else:
+        season_modifier = 0.5  # Bad season - grows slower
+
+    weather_bonus = 1.0
+    if weather in crop_data.get("optimal_weather", []):
+        weather_bonus = 1.3  # This weather is perfect for the crop
+    elif weather in crop_data.get("weak_weather", []):
+        weather_bonus = 0.7  # This weather harms the crop
+    return season_modifier, weather_bonus
+
+def crop_growth_table() -> Dict[Tuple[str, str, str], Tuple[float, float]]:
+    """Growth factors of every crop for every season and every known weather"""
+    if not CROP_GROWTH_TABLE:
+        weathers = list(WEATHERS) + [weather["name"] for realm_weathers in DIMENSION_WEATHERS.values() for weather in realm_weathers]
+        for crop_name, crop_data in CROPS.items():
+            for season in SEASONS:
+                for weather in weathers:
+                    CROP_GROWTH_TABLE[(crop_name, season, weather)] = crop_growth_factors(crop_data, season, weather)
+    return CROP_GROWTH_TABLE
+
+def crop_growth_rate(crop_name: str) -> float:
+    """Growth per elapsed tick of a crop in the current season and weather"""
+    season = game_state["current_season"]
+    weather = game_state["current_weather"]
+    factors = crop_growth_table().get((crop_name, season, weather))
+    if factors is None:
+        factors = crop_growth_factors(CROPS.get(crop_name, {}), season, weather)
+    season_modifier, weather_bonus = factors
+    return game_state.get("current_weather_crop_modifier", 1.0) * season_modifier * weather_bonus
+
+def advance_crops(ticks: int) -> None:
+    """Grow every planted plot by the elapsed ticks, one rate lookup per crop type"""
+    plots = user_data["farming"]["plots"]
+    growth = user_data["farming"]["growth"]
+    steps: Dict[str, int] = {}
+    for plot in growth:
+        crop_name = plots.get(plot)
+        if not crop_name:
+            continue
+        step = steps.get(crop_name)
+        if step is None:
+            # Always at least some growth
+            step = steps[crop_name] = max(1, int(ticks * crop_growth_rate(crop_name)))
+        growth[plot] += step
+
+def advance_game_time(ticks: int) -> None:
+    """Move the game clock forward, firing the weather, season and crop events that came due"""
+    game_state["current_tick"] += ticks
+    game_state["current_day"] = game_state["current_tick"] // TICKS_PER_DAY
+
+    # Update plant growth based on elapsed ticks, weather, and season
+    if "farming" in user_data:
+        tick_start = time.perf_counter()
+        # Run the weather and season changes that came due
+        WORLD_EVENTS.advance(game_state["current_tick"])
+
+        advance_crops(ticks)
+        CROP_EVENTS.advance(game_state["current_tick"])
+        record_latency("phases", "farm_tick", time.perf_counter() - tick_start)
+
+def crop_ripe(crop_name: str, growth: int) -> bool:
+    """Whether a plot has grown enough to be harvested"""
+    return growth >= CROPS[crop_name]["growth_time"]
+
+def ticks_until_mature(crop_name: str, growth: int) -> int:
+    """Game ticks until a plot can be harvested if conditions stay as they are"""
+    if crop_ripe(crop_name, growth):
+        return 0
+    return math.ceil((CROPS[crop_name]["growth_time"] - growth) / crop_growth_rate(crop_name))
+
+def crop_ready(plot: str) -> None:
+    """Announce a plot that has grown ripe, or look again once it should be"""
+    farming = user_data.get("farming", {})
+    crop_name = farming.get("plots", {}).get(plot)
+    if not crop_name:
+        return
+    if crop_ripe(crop_name, farming["growth"][plot]):
+        print_colored(f"Your {crop_name} in plot {plot} is ready to harvest!", OKGREEN)
+    else:
+        schedule_crop_ready(plot)
+
+def schedule_crop_ready(plot: str) -> None:
+    """Schedule the tick a plot is expected to ripen at under the current conditions"""
+    farming = user_data["farming"]
+    crop_name = farming["plots"].get(plot)
+    if not crop_name or crop_ripe(crop_name, farming["growth"][plot]):
+        CROP_EVENTS.cancel(plot)
+        return
+    ticks_left = ticks_until_mature(crop_name, farming["growth"][plot])
+    CROP_EVENTS.schedule(plot, game_state["current_tick"] + max(1, ticks_left), lambda: crop_ready(plot))
+
+def schedule_crop_events() -> None:
+    """Reschedule every growing plot, after loading a farm or a change of season or weather"""
+    CROP_EVENTS.clear()
+    for plot in user_data.get("farming", {}).get("plots", {}):
+        schedule_crop_ready(plot)
+
+# The first weather and season changes of the game clock
+update_weather()
+update_season()
 
 def cook_food() -> None:
     """Function to cook food with a chance of failure"""
@@ -22300,16 +20557,18 @@ def cook_food() -> None:
     print_colored("Available Recipes:", HEADER)
     available_recipes = []
 
+    materials = player_materials()
+    cookable = COOKING_INDEX.craftable_now(materials)
     for recipe_name, recipe_data in COOKING_RECIPES.items():
         # Check if player has the ingredients
-        has_ingredients = True
+        has_ingredients = recipe_name in cookable
         missing_ingredients = {}
 
-        for ingredient, amount in recipe_data["ingredients"].items():
-            if ingredient not in user_data.get("materials", {}) or user_data.get("materials", {}).get(ingredient, 0) < amount:
-                has_ingredients = False
-                current_amount = user_data.get("materials", {}).get(ingredient, 0)
-                missing_ingredients[ingredient] = amount - current_amount
+        if not has_ingredients:
+            for ingredient, amount in recipe_data["ingredients"].items():
+                current_amount = materials.get(ingredient, 0)
+                if current_amount < amount:
+                    missing_ingredients[ingredient] = amount - current_amount
 
         # Display recipe with color based on availability
         color = GREEN if has_ingredients else RED
@@ -22365,7 +20624,7 @@ def cook_food() -> None:
     print_colored("\nCooking in progress...", YELLOW)
     cook_time = selected_recipe.get("cook_time", 3)
     for i in range(cook_time):
-        time.sleep(0.5)
+        pause(0.5)
         print_colored("🔥" * (i+1), YELLOW)
 
     # Determine success or failure based on difficulty
@@ -22647,28 +20906,7 @@ def farming_guide() -> None:
                     if amount > 0 and amount <= user_data["materials"][seed] and amount <= available_plots:
                         # Display growth estimate based on weather and season
                         if crop_name in CROPS:
-                            # Calculate modifiers
-                            current_weather = game_state["current_weather"]
-                            general_weather_modifier = game_state.get("current_weather_crop_modifier", 1.0)
-
-                            # Get seasons for this crop
-                            crop_seasons = crop_data.get("seasons", [])
-
-                            season_modifier = 1.0
-                            if "All" in crop_seasons:
-                                season_modifier = 1.2
-                            elif current_season in crop_seasons:
-                                season_modifier = 1.2  
-                            else:
-                                season_modifier = 0.5
-
-                            weather_bonus = 1.0
-                            if current_weather in crop_data.get("optimal_weather", []):
-                                weather_bonus = 1.3
-                            elif current_weather in crop_data.get("weak_weather", []):
-                                weather_bonus = 0.7
-
-                            total_modifier = general_weather_modifier * season_modifier * weather_bonus
+                            total_modifier = crop_growth_rate(crop_name)
                             days_estimate = int(crop_data["growth_time"] / total_modifier)
 
                             print_colored(f"Estimated growth time: {days_estimate} days", CYAN)
@@ -22683,6 +20921,7 @@ def farming_guide() -> None:
                             plot_id = str(len(user_data["farming"]["plots"]))
                             user_data["farming"]["plots"][plot_id] = crop_name
                             user_data["farming"]["growth"][plot_id] = 0
+                            schedule_crop_ready(plot_id)
                         user_data["materials"][seed] -= amount
                         if user_data["materials"][seed] <= 0:
                             del user_data["materials"][seed]
@@ -22706,37 +20945,21 @@ def farming_guide() -> None:
             # Calculate total growth modifiers for display
             current_weather = game_state["current_weather"]
             current_season = game_state["current_season"]
-            general_weather_modifier = game_state.get("current_weather_crop_modifier", 1.0)
 
             for plot, crop in user_data["farming"]["plots"].items():
                 crop_data = CROPS.get(crop, {})
 
                 # Get growth progress
                 growth = user_data["farming"]["growth"][plot]
-                max_growth = crop_data["growth_time"] * TICKS_PER_DAY // 10  # Scale growth time to ticks
+                max_growth = crop_data["growth_time"]  # Growth the crop can be harvested at
 
                 # Calculate modifiers
-                season_modifier = 1.0
                 crop_seasons = crop_data.get("seasons", [])
-
-                if "All" in crop_seasons:
-                    season_modifier = 1.2
-                elif current_season in crop_seasons:
-                    season_modifier = 1.2
-                else:
-                    season_modifier = 0.5
-
-                weather_bonus = 1.0
-                if current_weather in crop_data.get("optimal_weather", []):
-                    weather_bonus = 1.3
-                elif current_weather in crop_data.get("weak_weather", []):
-                    weather_bonus = 0.7
-
-                total_modifier = general_weather_modifier * season_modifier * weather_bonus
+                total_modifier = crop_growth_rate(crop)
                 modifier_percent = int((total_modifier - 1.0) * 100)
 
                 # Determine status and color
-                if growth >= max_growth:
+                if crop_ripe(crop, growth):
                     status = "✨ Ready to harvest!"
                     status_color = OKGREEN
                 else:
@@ -22780,11 +21003,16 @@ def farming_guide() -> None:
                 else:
                     print_colored("(Wrong season) ", FAIL)
 
+                if not crop_ripe(crop, growth):
+                    ticks_left = ticks_until_mature(crop, growth)
+                    days_left = math.ceil(ticks_left / TICKS_PER_DAY)
+                    print(f"  Ready in ~{ticks_left} ticks (about {days_left} day{'s' if days_left != 1 else ''}) if the weather holds")
+
         elif choice == "5":
             print_colored("\n=== Harvest Crops ===", YELLOW)
             harvested = False
             for plot, crop in list(user_data["farming"]["plots"].items()):
-                if user_data["farming"]["growth"][plot] >= CROPS[crop]["growth_time"]:
+                if crop_ripe(crop, user_data["farming"]["growth"][plot]):
                     harvested = True
                     yield_amount = random.randint(1, 3)
                     if crop not in user_data["materials"]:
@@ -22794,6 +21022,7 @@ def farming_guide() -> None:
                     # Remove harvested crop
                     del user_data["farming"]["plots"][plot]
                     del user_data["farming"]["growth"][plot]
+                    CROP_EVENTS.cancel(plot)
 
                     print_colored(f"Harvested {yield_amount}x {crop} from plot {plot}!", GREEN)
 
@@ -22886,6 +21115,202 @@ def gather_materials(area: str) -> None:
     except ValueError:
         print("Invalid input")
 
+# Upper bound for solver quantities, in case a recipe ever needs no ingredients
+CRAFT_SOLVER_LIMIT = 1 << 20
+
+class CraftingIndex:
+    """Dependency graph of a recipe table and the set of recipes craftable right now
+
+    Every ingredient knows the recipes that use it, so a change to one material
+    only re-checks those recipes instead of the whole table. Recipes whose
+    output is an ingredient of other recipes are intermediates, which solve()
+    crafts on the way to a target when the stock does not cover them.
+    """
+
+    def __init__(self, recipes: Any, ingredients_key: str = "materials") -> None:
+        self.recipes = recipes
+        self.ingredients_key = ingredients_key
+        self.size = -1
+        self.users: Dict[str, List[str]] = {}
+        self.intermediates: set = set()
+        # Recipe names of each type (None for all), ordered by level_required, and those levels
+        self.by_type: Dict[Optional[str], List[str]] = {}
+        self.levels: Dict[Optional[str], List[int]] = {}
+        self.store: Optional[Dict[str, int]] = None
+        self.craftable: set = set()
+        self.stale: set = set()
+        MATERIAL_WATCHERS.append(self)
+
+    def build(self) -> None:
+        """(Re)build the graph, recipe packs can be added to the table at any time"""
+        self.users = {}
+        self.by_type = {None: []}
+        for name, recipe in self.recipes.items():
+            for material in recipe[self.ingredients_key]:
+                self.users.setdefault(material, []).append(name)
+            self.by_type[None].append(name)
+            self.by_type.setdefault(recipe.get("type"), []).append(name)
+        self.intermediates = {name for name in self.recipes if name in self.users}
+        for recipe_type, names in self.by_type.items():
+            names.sort(key=lambda name: self.recipes[name].get("level_required", 1))
+            self.levels[recipe_type] = [self.recipes[name].get("level_required", 1) for name in names]
+        self.size = len(self.recipes)
+        self.store = None
+
+    def materials_changed(self, store: Dict[str, int], names: Iterable[str]) -> None:
+        """Mark the recipes using the changed materials for a re-check"""
+        if store is self.store:
+            for name in names:
+                self.stale.update(self.users.get(name, ()))
+
+    def has_ingredients(self, name: str, materials: Dict[str, int]) -> bool:
+        return all(materials.get(material, 0) >= amount
+                   for material, amount in self.recipes[name][self.ingredients_key].items())
+
+    def craftable_now(self, materials: Dict[str, int]) -> set:
+        """Names of the recipes the materials cover, re-checking only what changed since last time"""
+        if len(self.recipes) != self.size:
+            self.build()
+        if materials is not self.store:
+            # A store we have not been following, every recipe has to be checked
+            self.stale = set(self.recipes)
+            self.store = materials if isinstance(materials, MaterialStore) else None
+        for name in self.stale:
+            if self.has_ingredients(name, materials):
+                self.craftable.add(name)
+            else:
+                self.craftable.discard(name)
+        self.stale = set()
+        return self.craftable
+
+    def available(self, level: int, recipe_type: Optional[str] = None) -> List[str]:
+        """Recipes of a type (or all) unlocked at a level, in order of level required"""
+        if len(self.recipes) != self.size:
+            self.build()
+        names = self.by_type.get(recipe_type, [])
+        return names[:bisect.bisect_right(self.levels.get(recipe_type, []), level)]
+
+    def plan(self, target: str, quantity: int, materials: Dict[str, int],
+             level: Optional[int] = None) -> Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]:
+        """Crafts, stock used and shortfall for making quantity of target
+
+        Intermediates are taken from the stock first and only crafted for the
+        rest, which is the path that uses up the fewest materials.
+        """
+        # Ingredients come after every recipe that uses them
+        order: List[str] = []
+        seen = set()
+
+        def visit(name: str) -> None:
+            if name in seen:
+                return
+            seen.add(name)
+            recipe = self.recipes.get(name)
+            if recipe is not None and (level is None or recipe.get("level_required", 1) <= level):
+                for material in recipe[self.ingredients_key]:
+                    visit(material)
+            order.append(name)
+        visit(target)
+        order.reverse()
+
+        demand = {target: quantity}
+        crafts: Dict[str, int] = {}
+        used: Dict[str, int] = {}
+        missing: Dict[str, int] = {}
+        for name in order:
+            need = demand.get(name, 0)
+            if need <= 0:
+                continue
+            # The target itself is always crafted, stock only covers what goes into it
+            take = 0 if name == target else min(need, materials.get(name, 0))
+            if take:
+                used[name] = take
+            short = need - take
+            if not short:
+                continue
+            recipe = self.recipes.get(name)
+            if recipe is None or (level is not None and recipe.get("level_required", 1) > level):
+                missing[name] = short
+                continue
+            crafts[name] = short
+            for material, amount in recipe[self.ingredients_key].items():
+                demand[material] = demand.get(material, 0) + short * amount
+        # Intermediates have to be crafted before the recipes that use them
+        crafts = {name: crafts[name] for name in reversed(order) if name in crafts}
+        return crafts, used, missing
+
+    def solve(self, target: str, materials: Dict[str, int], level: Optional[int] = None) -> Dict[str, Any]:
+        """Most of target that can be crafted from materials, crafting intermediates as needed
+
+        Returns the quantity, the crafts and stock that takes, and what is
+        missing to make one more.
+        """
+        if target not in self.recipes:
+            return {"target": target, "quantity": 0, "crafts": {}, "used": {}, "missing": {}}
+
+        def feasible(quantity: int) -> bool:
+            return not self.plan(target, quantity, materials, level)[2]
+
+        # Double until out of reach, then bisect between the last two
+        low, high = 0, 1
+        while high <= CRAFT_SOLVER_LIMIT and feasible(high):
+            low, high = high, high * 2
+        high = min(high, CRAFT_SOLVER_LIMIT + 1)
+        while high - low > 1:
+            middle = (low + high) // 2
+            if feasible(middle):
+                low = middle
+            else:
+                high = middle
+
+        crafts, used, _ = self.plan(target, low, materials, level) if low else ({}, {}, {})
+        missing = self.plan(target, low + 1, materials, level)[2]
+        return {"target": target, "quantity": low, "crafts": crafts, "used": used, "missing": missing}
+
+CRAFTING_INDEX = CraftingIndex(CRAFTING_RECIPES)
+COOKING_INDEX = CraftingIndex(COOKING_RECIPES, "ingredients")
+
+def craft_components(crafts: Dict[str, int], target: str) -> None:
+    """Craft the intermediates of a plan into the player's materials"""
+    materials = player_materials()
+    for name, times in crafts.items():
+        if name == target:
+            continue
+        for material, amount in CRAFTING_RECIPES[name]["materials"].items():
+            materials[material] -= amount * times
+        materials[name] = materials.get(name, 0) + times
+        print(f"{GREEN}Crafted {name} x{times} as a component.{ENDC}")
+
+def plan_crafting(item_name: str) -> None:
+    """Show how many of an item can be crafted and the crafts it takes"""
+    if not item_name:
+        print("Usage: /craftplan <item>")
+        return
+    target = next((name for name in CRAFTING_RECIPES if name.lower() == item_name.lower()), None)
+    if target is None:
+        print(f"{RED}No recipe makes '{item_name}'.{ENDC}")
+        return
+
+    level = user_data["level"]
+    print_header(f"Crafting plan: {target}")
+    if CRAFTING_RECIPES[target].get("level_required", 1) > level:
+        print(f"{RED}Requires level {CRAFTING_RECIPES[target]['level_required']}.{ENDC}")
+        return
+
+    plan = CRAFTING_INDEX.solve(target, player_materials(), level)
+    print(f"You can craft {plan['quantity']} right now.")
+    if plan["crafts"]:
+        print("\nCrafts:")
+        for name, times in plan["crafts"].items():
+            print(f"  - {name} x{times}")
+        print("Materials used:")
+        for material, amount in plan["used"].items():
+            print(f"  - {material}: {amount}")
+    if plan["missing"]:
+        print(f"\n{YELLOW}Missing for {'one more' if plan['quantity'] else 'one'}:{ENDC}")
+        for material, amount in plan["missing"].items():
+            print(f"  - {material}: {amount}")
+
 def craft_item() -> None:
     print_header("Crafting")
 
@@ -22931,30 +21356,17 @@ def craft_item() -> None:
     if category_choice in crafting_categories:
         _, selected_category = crafting_categories[category_choice]
 
-    # Filter recipes by player level and category if selected
-    available_recipes = []
-    for name, recipe in CRAFTING_RECIPES.items():
-        if user_data["level"] >= recipe["level_required"]:
-            if selected_category is None or recipe.get("type") == selected_category:
-                available_recipes.append(name)
-
-    # Sort recipes by level required
-    available_recipes.sort(key=lambda x: CRAFTING_RECIPES[x]["level_required"])
+    # Recipes unlocked at the player's level in the category, ordered by level required
+    available_recipes = CRAFTING_INDEX.available(user_data["level"], selected_category)
 
     if not available_recipes:
         print("No recipes available at your level or in this category")
         return
 
     # Check which recipes can be crafted with current materials
-    craftable_recipes = []
-    for recipe_name in available_recipes:
-        recipe = CRAFTING_RECIPES[recipe_name]
-        can_craft = True
-        for material, amount in recipe["materials"].items():
-            if user_data["materials"].get(material, 0) < amount:
-                can_craft = False
-                break
-        craftable_recipes.append((recipe_name, can_craft))
+    materials = player_materials()
+    craftable_now = CRAFTING_INDEX.craftable_now(materials)
+    craftable_recipes = [(recipe_name, recipe_name in craftable_now) for recipe_name in available_recipes]
 
     print(f"\nAvailable recipes ({len(available_recipes)}):")
     for i, (recipe_name, can_craft) in enumerate(craftable_recipes, 1):
@@ -22963,6 +21375,9 @@ def craft_item() -> None:
         # Format based on craftability
         if can_craft:
             status = f"{GREEN}[CRAFTABLE]{ENDC}"
+        elif (any(material in CRAFTING_INDEX.intermediates for material in recipe["materials"])
+              and CRAFTING_INDEX.solve(recipe_name, materials, user_data["level"])["quantity"]):
+            status = f"{YELLOW}[CRAFTABLE WITH COMPONENTS]{ENDC}"
         else:
             status = f"{RED}[MISSING MATERIALS]{ENDC}"
 
@@ -23021,6 +21436,15 @@ def craft_item() -> None:
                 if user_data["materials"].get(material, 0) < amount:
                     missing_materials.append(f"{material} ({user_data['materials'].get(material, 0)}/{amount})")
 
+            # Components that are missing can be crafted first when the materials allow it
+            if missing_materials:
+                crafts, _, short = CRAFTING_INDEX.plan(recipe_name, 1, materials, user_data["level"])
+                if not short:
+                    components = ", ".join(f"{name} x{times}" for name, times in crafts.items() if name != recipe_name)
+                    if input(f"Craft the missing components first ({components})? (y/n): ").strip().lower() == 'y':
+                        craft_components(crafts, recipe_name)
+                        missing_materials = []
+
             if missing_materials:
                 print(f"{RED}Cannot craft - missing materials:{ENDC}")
                 for mat in missing_materials:
@@ -23047,6 +21471,13 @@ def craft_item() -> None:
             for material, amount in recipe["materials"].items():
                 user_data["materials"][material] -= amount
 
+            # Components go to the materials that the recipes using them take from
+            if recipe_name in CRAFTING_INDEX.intermediates:
+                materials[recipe_name] = materials.get(recipe_name, 0) + 1
+                print(f"Crafted {recipe_name}! It has been added to your materials.")
+                user_data["stats"]["items_crafted"] = user_data["stats"].get("items_crafted", 0) + 1
+                return
+
             # Add item to inventory with quality tag if applicable
             crafted_item = recipe_name
             if quality_result == "superior":
@@ -23132,7 +21563,7 @@ def travel_to_area() -> None:
 
 def fight_monster(monster_name: str) -> None:
     try:
-        monster = next((m for m in monsters if m["name"].lower() == monster_name.lower()), None)
+        monster = find_monster(monster_name)
         if not monster:
             print(f"Monster '{monster_name}' not found!")
             return
@@ -23253,7 +21684,7 @@ def fight_monster(monster_name: str) -> None:
             exp_gain = monster["level"] * 20
             user_data["exp"] += exp_gain
             print(f"Gained {exp_gain} experience!")
-            check_achievements()
+            achievement_event("monster_killed")
 
             # Increment monsters killed count
             user_data["monsters_killed"] += 1
@@ -23262,18 +21693,18 @@ def fight_monster(monster_name: str) -> None:
             if monster.get("boss", False):
                 print(f"Congratulations! You defeated the boss {monster['name']}!")
                 # Mark dungeon as completed if in a dungeon
-                for dungeon in dungeons:
-                    if monster['name'] in dungeon['monsters']:
-                        if dungeon['name'] not in user_data["dungeons_completed"]:
-                            user_data["dungeons_completed"].append(dungeon['name'])
-                            print(f"You have completed the dungeon: {dungeon['name']}!")
-                            # Reward player (example: gold and exp bonus)
-                            reward_gold = 500
-                            reward_exp = 1000
-                            user_data["gold"] += reward_gold
-                            user_data["exp"] += reward_exp
-                            print(f"You received {reward_gold} gold and {reward_exp} experience as a reward!")
-                        break
+                boss_dungeons = DUNGEONS_BY_MONSTER.get(fold_name(monster['name']))
+                if boss_dungeons:
+                    dungeon = boss_dungeons[0]
+                    if dungeon['name'] not in user_data["dungeons_completed"]:
+                        user_data["dungeons_completed"].append(dungeon['name'])
+                        print(f"You have completed the dungeon: {dungeon['name']}!")
+                        # Reward player (example: gold and exp bonus)
+                        reward_gold = 500
+                        reward_exp = 1000
+                        user_data["gold"] += reward_gold
+                        user_data["exp"] += reward_exp
+                        print(f"You received {reward_gold} gold and {reward_exp} experience as a reward!")
             else:
                 # Check for level up
                 check_level_up()
@@ -23284,8 +21715,8 @@ def fight_monster(monster_name: str) -> None:
                     for dungeon in dungeons:
                         if dungeon.get("name", "").lower() == user_data["current_area"].lower():
                             for m_name in dungeon["monsters"]:
-                                m = next((mon for mon in monsters if mon["name"] == m_name and mon.get("boss", False)), None)
-                                if m:
+                                m = find_monster(m_name)
+                                if m and m.get("boss", False):
                                     bosses_in_area.append(m)
                     if bosses_in_area:
                         boss = random.choice(bosses_in_area)
@@ -23326,510 +21757,9 @@ def show_weapon_info() -> None:
 
 # Enhanced pet system
 # Pet evolution paths and requirements
-PET_EVOLUTIONS = {
-    "Cat": {
-        "evolves_to": "Shadow Cat",
-        "level_required": 10,
-        "loyalty_required": 75,
-        "materials_required": ["Shadow Essence", "Feline Spirit"]
-    },
-    "Dog": {
-        "evolves_to": "War Hound",
-        "level_required": 10,
-        "loyalty_required": 80,
-        "materials_required": ["Beast Fang", "Loyal Heart"]
-    },
-    "Dragon Hatchling": {
-        "evolves_to": "Young Drake",
-        "level_required": 15,
-        "loyalty_required": 70,
-        "materials_required": ["Dragon Scale", "Fire Essence"]
-    },
-    "Young Drake": {
-        "evolves_to": "Adult Dragon",
-        "level_required": 30,
-        "loyalty_required": 90,
-        "materials_required": ["Dragon Heart", "Ancient Flame", "Royal Crown"]
-    },
-    "Wolf Pup": {
-        "evolves_to": "Dire Wolf",
-        "level_required": 12,
-        "loyalty_required": 75,
-        "materials_required": ["Wolf Fang", "Forest Spirit"]
-    },
-    "Hawk": {
-        "evolves_to": "Royal Eagle",
-        "level_required": 10,
-        "loyalty_required": 70,
-        "materials_required": ["Wind Essence", "Sharp Talon"]
-    },
-    "Fish": {
-        "evolves_to": "Koi Guardian",
-        "level_required": 8,
-        "loyalty_required": 65,
-        "materials_required": ["Water Essence", "River Pearl"]
-    },
-    "Snake": {
-        "evolves_to": "Venom Serpent",
-        "level_required": 10,
-        "loyalty_required": 60,
-        "materials_required": ["Venom Sac", "Ancient Scale"]
-    },
-    "Phoenix Chick": {
-        "evolves_to": "Adolescent Phoenix",
-        "level_required": 15,
-        "loyalty_required": 75,
-        "materials_required": ["Eternal Flame", "Phoenix Feather"]
-    },
-    "Adolescent Phoenix": {
-        "evolves_to": "Adult Phoenix",
-        "level_required": 30,
-        "loyalty_required": 85,
-        "materials_required": ["Phoenix Ash", "Solar Crystal", "Rebirth Ember"]
-    },
-    "Battle Wolf": {
-        "evolves_to": "Alpha Wolf",
-        "level_required": 14,
-        "loyalty_required": 80,
-        "materials_required": ["Alpha Fang", "Moon Crystal"]
-    },
-    "Guardian Bear": {
-        "evolves_to": "Ancient Bear",
-        "level_required": 15,
-        "loyalty_required": 75,
-        "materials_required": ["Bear Essence", "Mountain Crystal"]
-    },
-    "Spirit Fox": {
-        "evolves_to": "Nine-Tailed Fox",
-        "level_required": 18,
-        "loyalty_required": 85,
-        "materials_required": ["Spirit Essence", "Ancient Scroll", "Fox Fire"]
-    },
-    "Lucky Rabbit": {
-        "evolves_to": "Fortune Hare",
-        "level_required": 12,
-        "loyalty_required": 70,
-        "materials_required": ["Fortune Clover", "Golden Carrot"]
-    },
-    "Mystic Owl": {
-        "evolves_to": "Wisdom Owl",
-        "level_required": 16,
-        "loyalty_required": 75,
-        "materials_required": ["Ancient Knowledge", "Moonlit Feather"]
-    },
-    "Shadow Panther": {
-        "evolves_to": "Void Stalker",
-        "level_required": 17,
-        "loyalty_required": 80,
-        "materials_required": ["Void Fragment", "Shadow Crystal", "Midnight Essence"]
-    },
-    "Thunder Eagle": {
-        "evolves_to": "Storm Harbinger",
-        "level_required": 20,
-        "loyalty_required": 75,
-        "materials_required": ["Storm Essence", "Lightning Crystal", "Royal Feather"]
-    },
-    "Abyssal Kraken Hatchling": {
-        "evolves_to": "Kraken Juvenile",
-        "level_required": 25,
-        "loyalty_required": 70,
-        "materials_required": ["Abyssal Ink", "Deep Sea Pearl", "Ocean Crystal"]
-    },
-    "Kraken Juvenile": {
-        "evolves_to": "Elder Kraken",
-        "level_required": 40,
-        "loyalty_required": 85,
-        "materials_required": ["Kraken Heart", "Abyssal Crown", "Oceanic Essence", "Legendary Sea Chart"]
-    }
-}
-
-PETS = {
-    "Hylit": {
-        "price": 0, 
-        "boost": {"intelligence": 2, "exp_gain": 5}, 
-        "description": "Your fairy companion and guide",
-        "element": "Nullum",
-        "abilities": {"1": "Find Treasure", "3": "Weather Sense"},
-        "rarity": "Unique",
-        "combat_style": "Support",
-        "evolution": None  # Unique companion cannot evolve
-    },
-    "Cat": {
-        "price": 50, 
-        "boost": {"attack": 2, "speed": 3}, 
-        "description": "A stealthy companion that boosts attack",
-        "element": "Nullum",
-        "abilities": {"2": "Quick Attack", "4": "Scouting"},
-        "rarity": "Common",
-        "combat_style": "Agile",
-        "evolution": "Shadow Cat"
-    },
+PET_EVOLUTIONS = CONTENT.mapping("PET_EVOLUTIONS")
 
-    # Evolved Pets
-    "Shadow Cat": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"attack": 5, "speed": 7, "critical_chance": 5}, 
-        "description": "A mystical feline born from shadows, swift and deadly",
-        "element": "Tenebrae",
-        "abilities": {"1": "Shadow Pounce", "3": "Night Vision", "5": "Stealth Strike", "7": "Soul Bond"},
-        "rarity": "Rare",
-        "combat_style": "Assassin",
-        "evolution": None
-    },
-    "Dog": {
-        "price": 50, 
-        "boost": {"defense": 2, "loyalty": 5}, 
-        "description": "A loyal friend that boosts defense",
-        "element": "Nullum",
-        "abilities": {"2": "Protective Stance", "5": "Intimidate"},
-        "rarity": "Common",
-        "combat_style": "Defensive",
-        "evolution": "War Hound"
-    },
-
-    "War Hound": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"defense": 6, "loyalty": 10, "health": 15}, 
-        "description": "A battle-hardened canine warrior, loyal to the death",
-        "element": "Ferrum",
-        "abilities": {"1": "Battle Howl", "3": "Iron Hide", "5": "Pack Tactics", "8": "Guardian's Aura"},
-        "rarity": "Rare",
-        "combat_style": "Tank",
-        "evolution": None
-    },
-    "Dragon Hatchling": {
-        "price": 200, 
-        "boost": {"attack": 5, "health": 10}, 
-        "description": "A baby dragon that boosts attack and health",
-        "element": "Ignis",
-        "abilities": {"1": "Flame Burst", "3": "Intimidate", "5": "Fierce Loyalty"},
-        "rarity": "Epic",
-        "combat_style": "Offensive",
-        "evolution": "Young Drake"
-    },
-
-    "Young Drake": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"attack": 12, "health": 25, "fire_resistance": 50}, 
-        "description": "A growing dragon with formidable power",
-        "element": "Ignis",
-        "abilities": {"1": "Fire Breath", "3": "Wing Slash", "5": "Dragon Roar", "7": "Heat Aura"},
-        "rarity": "Epic",
-        "combat_style": "Berserker",
-        "evolution": "Adult Dragon"
-    },
-
-    "Adult Dragon": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"attack": 25, "health": 50, "fire_resistance": 100, "intimidation": 20}, 
-        "description": "A mighty dragon in its prime, commanding respect and fear",
-        "element": "Ignis",
-        "abilities": {"1": "Inferno", "3": "Dragon Claw", "5": "Tail Sweep", "7": "Fire Storm", "10": "Dragon Soul Bond"},
-        "rarity": "Legendary",
-        "combat_style": "Dominator",
-        "evolution": None
-    },
-    "Phoenix Chick": {
-        "price": 200, 
-        "boost": {"health": 15, "magic": 5}, 
-        "description": "A magical bird that boosts health and magic",
-        "element": "Fire",
-        "abilities": {"1": "Healing Mist", "3": "Flame Burst", "6": "Weather Sense"},
-        "rarity": "Epic",
-        "combat_style": "Support",
-        "evolution": "Adolescent Phoenix"
-    },
-    "Adolescent Phoenix": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"health": 25, "magic": 15, "fire_damage": 15}, 
-        "description": "A maturing phoenix with growing flames and regenerative powers",
-        "element": "Ignis",
-        "abilities": {"1": "Healing Flames", "3": "Fire Shield", "5": "Phoenix Dive", "7": "Warmth Aura"},
-        "rarity": "Epic",
-        "combat_style": "Healer",
-        "evolution": "Adult Phoenix"
-    },
-    "Adult Phoenix": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"health": 40, "magic": 30, "fire_damage": 25, "revival": 1}, 
-        "description": "A magnificent phoenix with the power of rebirth and eternal flame",
-        "element": "Ignis",
-        "abilities": {"1": "Resurrection", "3": "Inferno", "5": "Cleansing Fire", "7": "Life Bond", "10": "Eternal Flame"},
-        "rarity": "Legendary",
-        "combat_style": "Immortal",
-        "evolution": None
-    },
-    "Battle Wolf": {
-        "price": 150, 
-        "boost": {"attack": 4, "speed": 3}, 
-        "description": "A fierce wolf that boosts attack and speed",
-        "element": "Nullum",
-        "abilities": {"1": "Quick Attack", "4": "Intimidate"},
-        "rarity": "Rare",
-        "combat_style": "Offensive",
-        "evolution": "Alpha Wolf"
-    },
-    "Alpha Wolf": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"attack": 12, "speed": 8, "critical_chance": 8}, 
-        "description": "A powerful pack leader with commanding presence and deadly attacks",
-        "element": "Tenebrae",
-        "abilities": {"1": "Savage Strike", "3": "Pack Leader", "5": "Moonlight Howl", "7": "Feral Instinct"},
-        "rarity": "Epic",
-        "combat_style": "Predator",
-        "evolution": None
-    },
-    "Guardian Bear": {
-        "price": 150, 
-        "boost": {"defense": 4, "health": 5}, 
-        "description": "A strong bear that boosts defense and health",
-        "element": "Earth",
-        "abilities": {"1": "Protective Stance", "3": "Stone Shield"},
-        "rarity": "Rare",
-        "combat_style": "Defensive",
-        "evolution": "Ancient Bear"
-    },
-    "Ancient Bear": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"defense": 15, "health": 20, "damage_reduction": 10}, 
-        "description": "A primordial bear spirit with tremendous resilience and earth power",
-        "element": "Gē",
-        "abilities": {"1": "Mountain's Strength", "3": "Earth Armor", "5": "Primal Roar", "7": "Nature's Guardian"},
-        "rarity": "Epic",
-        "combat_style": "Warden",
-        "evolution": None
-    },
-    "Spirit Fox": {
-        "price": 175, 
-        "boost": {"exp_gain": 10, "magic": 3}, 
-        "description": "A mystical fox that boosts experience gain and magic",
-        "element": "Nullum",
-        "abilities": {"2": "Find Treasure", "4": "Energy Pulse"},
-        "rarity": "Rare",
-        "combat_style": "Magical",
-        "evolution": "Nine-Tailed Fox"
-    },
-    "Nine-Tailed Fox": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"exp_gain": 20, "magic": 15, "intelligence": 10}, 
-        "description": "A legendary spirit fox with nine tails and immense magical power",
-        "element": "Pneuma",
-        "abilities": {"1": "Fox Fire", "3": "Spirit Whisper", "5": "Illusion", "7": "Soul Binding", "9": "Ancestral Wisdom"},
-        "rarity": "Legendary",
-        "combat_style": "Mystic",
-        "evolution": None
-    },
-    "Lucky Rabbit": {
-        "price": 100, 
-        "boost": {"gold_find": 10, "luck": 5}, 
-        "description": "A lucky companion that helps find more gold",
-        "element": "Nullum",
-        "abilities": {"1": "Find Treasure", "3": "Scavenge"},
-        "rarity": "Uncommon",
-        "combat_style": "Support",
-        "evolution": "Fortune Hare"
-    },
-    "Fortune Hare": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"gold_find": 25, "luck": 15, "loot_quality": 10}, 
-        "description": "A mythical hare that brings incredible fortune to its companion",
-        "element": "Lux",
-        "abilities": {"1": "Golden Touch", "3": "Lucky Strike", "5": "Fortune Aura", "7": "Prosperity Bond"},
-        "rarity": "Epic",
-        "combat_style": "Fortune",
-        "evolution": None
-    },
-    "Mystic Owl": {
-        "price": 125, 
-        "boost": {"intelligence": 3, "magic": 4}, 
-        "description": "An intelligent owl that boosts intelligence and magic",
-        "element": "Air",
-        "abilities": {"2": "Swift Movement", "5": "Energy Pulse"},
-        "rarity": "Uncommon",
-        "combat_style": "Magical",
-        "evolution": "Wisdom Owl"
-    },
-    "Wisdom Owl": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"intelligence": 12, "magic": 15, "mana_regen": 10}, 
-        "description": "An ancient owl with vast knowledge and powerful arcane abilities",
-        "element": "Aer",
-        "abilities": {"1": "Arcane Sight", "3": "Knowledge Transfer", "5": "Spell Echo", "7": "Time Dilation"},
-        "rarity": "Epic",
-        "combat_style": "Sage",
-        "evolution": None
-    },
-    "Shadow Panther": {
-        "price": 175, 
-        "boost": {"stealth": 5, "attack": 3}, 
-        "description": "A stealthy panther that boosts stealth and attack",
-        "element": "Nullum",
-        "abilities": {"1": "Quick Attack", "3": "Scouting"},
-        "rarity": "Rare",
-        "combat_style": "Agile",
-        "evolution": "Void Stalker"
-    },
-    "Void Stalker": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"stealth": 12, "attack": 8, "critical_chance": 10}, 
-        "description": "A fearsome predator that has merged with the darkness of the void",
-        "element": "Tenebrae",
-        "abilities": {"1": "Shadow Step", "3": "Void Strike", "5": "Dark Ambush", "7": "Dimensional Shift"},
-        "rarity": "Epic",
-        "combat_style": "Assassin",
-        "evolution": None
-    },
-    "Thunder Eagle": {
-        "price": 200, 
-        "boost": {"speed": 5, "attack": 3}, 
-        "description": "A fast eagle that boosts speed and attack",
-        "element": "Lightning",
-        "abilities": {"1": "Swift Movement", "3": "Shock Strike"},
-        "rarity": "Rare",
-        "combat_style": "Agile",
-        "evolution": "Storm Harbinger"
-    },
-    "Storm Harbinger": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"speed": 10, "attack": 7, "lightning_damage": 15}, 
-        "description": "A majestic bird of storms that controls the weather",
-        "element": "Fulmen",
-        "abilities": {"1": "Lightning Strike", "3": "Storm Caller", "5": "Thunder Dash", "8": "Eye of the Storm"},
-        "rarity": "Epic",
-        "combat_style": "Elemental",
-        "evolution": None
-    },
-    "Abyssal Kraken Hatchling": {
-        "price": 300, 
-        "boost": {"attack": 10, "defense": 5}, 
-        "description": "A baby kraken that boosts attack and defense",
-        "element": "Water",
-        "abilities": {"1": "Healing Mist", "3": "Intimidate", "5": "Energy Pulse"},
-        "rarity": "Epic",
-        "combat_style": "Balanced",
-        "evolution": "Kraken Juvenile"
-    },
-    "Kraken Juvenile": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"attack": 18, "defense": 12, "water_damage": 15}, 
-        "description": "A growing sea monster with mastery over ocean currents",
-        "element": "Aqua",
-        "abilities": {"1": "Tentacle Slam", "3": "Whirlpool", "5": "Deep Pressure", "7": "Water Manipulation"},
-        "rarity": "Epic",
-        "combat_style": "Controller",
-        "evolution": "Elder Kraken"
-    },
-    "Elder Kraken": {
-        "price": 0,  # Can only be obtained by evolution
-        "boost": {"attack": 35, "defense": 25, "water_damage": 30, "intimidation": 20}, 
-        "description": "An ancient sea titan that commands the depths of the ocean",
-        "element": "Aqua",
-        "abilities": {"1": "Crushing Grasp", "3": "Tsunami", "5": "Abyssal Darkness", "7": "Oceanic Fury", "10": "Leviathan's Call"},
-        "rarity": "Legendary",
-        "combat_style": "Destroyer",
-        "evolution": None
-    },
-    "Small Copper Golem": {
-        "price": 250, 
-        "boost": {"defense": 10, "health": 5}, 
-        "description": "A small golem made from copper that boosts defense",
-        "element": "Earth",
-        "abilities": {"1": "Protective Stance", "3": "Stone Shield"},
-        "rarity": "Rare",
-        "combat_style": "Defensive"
-    },
-    "Small Silver Golem": {
-        "price": 300, 
-        "boost": {"defense": 15, "health": 7}, 
-        "description": "A small golem made from silver that boosts defense",
-        "element": "Earth",
-        "abilities": {"1": "Protective Stance", "3": "Stone Shield", "5": "Energy Pulse"},
-        "rarity": "Epic",
-        "combat_style": "Defensive"
-    },
-    "Small Titanium Golem": {
-        "price": 350, 
-        "boost": {"defense": 25, "health": 10}, 
-        "description": "A small golem made from titanium that boosts defense",
-        "element": "Earth",
-        "abilities": {"1": "Protective Stance", "2": "Stone Shield", "4": "Energy Pulse", "6": "Fierce Loyalty"},
-        "rarity": "Legendary",
-        "combat_style": "Defensive"
-    },
-    # New elemental pets
-    "Flame Salamander": {
-        "price": 180,
-        "boost": {"attack": 6, "magic": 4},
-        "description": "A fiery salamander that empowers fire magic",
-        "element": "Fire",
-        "abilities": {"1": "Flame Burst", "3": "Energy Pulse", "5": "Fierce Loyalty"},
-        "rarity": "Rare",
-        "combat_style": "Magical"
-    },
-    "Frost Fox": {
-        "price": 180,
-        "boost": {"defense": 4, "magic": 6},
-        "description": "A fox with fur of crystalline ice",
-        "element": "Ice",
-        "abilities": {"1": "Healing Mist", "3": "Swift Movement", "5": "Energy Pulse"},
-        "rarity": "Rare",
-        "combat_style": "Magical"
-    },
-    "Static Weasel": {
-        "price": 180,
-        "boost": {"speed": 6, "attack": 4},
-        "description": "A weasel crackling with electricity",
-        "element": "Lightning",
-        "abilities": {"1": "Quick Attack", "3": "Shock Strike", "5": "Swift Movement"},
-        "rarity": "Rare",
-        "combat_style": "Agile"
-    },
-    "Stone Tortoise": {
-        "price": 180,
-        "boost": {"defense": 8, "health": 6},
-        "description": "A tortoise with a shell of living stone",
-        "element": "Earth",
-        "abilities": {"1": "Stone Shield", "3": "Protective Stance", "5": "Energy Pulse"},
-        "rarity": "Rare",
-        "combat_style": "Defensive"
-    },
-    "Zephyr Hawk": {
-        "price": 180,
-        "boost": {"speed": 8, "intelligence": 4},
-        "description": "A hawk that rides the wind currents",
-        "element": "Air",
-        "abilities": {"1": "Swift Movement", "3": "Scouting", "5": "Weather Sense"},
-        "rarity": "Rare",
-        "combat_style": "Agile"
-    },
-    "Hellstone Golem": {
-        "price": 600, 
-        "boost": {"defense": 90, "attack": 20}, 
-        "description": "A powerful golem made from hellstone that boosts defense",
-        "element": "Fire",
-        "abilities": {"1": "Stone Shield", "2": "Flame Burst", "4": "Fierce Loyalty", "6": "Energy Pulse"},
-        "rarity": "Legendary",
-        "combat_style": "Defensive"
-    },
-    "Abyssal Obsidian Golem": {
-        "price": 1000, 
-        "boost": {"defense": 150, "health": 50}, 
-        "description": "A powerful golem made from obsidian extracted from the abyss",
-        "element": "Earth",
-        "abilities": {"1": "Stone Shield", "2": "Protective Stance", "3": "Energy Pulse", "5": "Intimidate"},
-        "rarity": "Mythic",
-        "combat_style": "Defensive"
-    },
-    "Abyssal Diamond Golem": {
-        "price": 1500, 
-        "boost": {"defense": 200, "attack": 40, "health": 100}, 
-        "description": "A powerful golem made from diamond extracted from the abyssal caves",
-        "element": "Earth",
-        "abilities": {"1": "Stone Shield", "2": "Protective Stance", "3": "Energy Pulse", "4": "Intimidate", "5": "Fierce Loyalty"},
-        "rarity": "Mythic",
-        "combat_style": "Balanced"
-    }
-}
+PETS = CONTENT.mapping("PETS")
 
 
 def show_professions() -> None:
@@ -24031,15 +21961,15 @@ def search_resources() -> None:
 
     if search_type == "monster":
         # Get basic area monsters
-        area_monsters = [m for m in monsters if m["name"] in LOCATIONS.get(user_data["current_area"], {}).get("monsters", [])]
+        area_monsters = MONSTERS_BY_AREA.get(user_data["current_area"], [])
 
         # Add weather-dependent monsters based on current weather
         current_weather = user_data.get("current_weather", "Sunny")
-        weather_monsters = [m for m in monsters if m.get("weather") == current_weather]
+        weather_monsters = MONSTERS_BY_WEATHER.get(current_weather, [])
 
         # Add seasonal monsters based on current season
         current_season = user_data.get("current_season", "Summer")
-        season_monsters = [m for m in monsters if m.get("season") == current_season]
+        season_monsters = MONSTERS_BY_SEASON.get(current_season, [])
 
         # Combine all possible monster types
         all_possible_monsters = area_monsters.copy()
@@ -24401,20 +22331,31 @@ def main_game() -> None:
                 auto_save()
                 last_save = time.time()
 
+            # Report background autosaves that failed since the last prompt
+            for error in SAVE_WRITER.take_errors():
+                print(f"{FAIL}Error saving game: {error}{ENDC}")
+
             # Print prompt with consistent color handling
             sys.stdout.write(f"\n{YELLOW}>> {ENDC}")
             sys.stdout.flush()
-            command = input().strip()
+            # Queued autosaves are encoded while the game waits for the command
+            SAVE_WRITER.release_state()
+            try:
+                command = input().strip()
+            finally:
+                SAVE_WRITER.claim_state()
             # Do not convert to lowercase to preserve command arguments
             handle_command(command.lower())
 
             # Auto-save after important actions (check command prefix only)
             if command.lower().startswith(("/fight", "/dungeon", "/equip", "/travel")):
-                auto_save()
+                auto_save(command.lower().split()[0])
                 last_save = time.time()
         except Exception as e:
             print(f"{FAIL}Error: {e}{ENDC}")
             print_animated("Type '/help' for available commands.", YELLOW)
+        finally:
+            flush_frame()
 
 # New system implementations
 
@@ -24539,7 +22480,7 @@ def handle_construct_command(command_parts: List[str]) -> None:
     if "blueprints" not in user_data:
         user_data["blueprints"] = ["basic_automaton"]
     if "inventory" not in user_data:
-        user_data["inventory"] = {}
+        user_data["inventory"] = Inventory()
 
     # Blueprint definitions
     blueprint_info = {
@@ -24848,491 +22789,7 @@ def read_mechanical_manual(book_data: Dict[str, Any]) -> None:
 # ═══════════════════════════════════════════════════════════════════════════════════
 
 # Legendary Boss Database - The Most Epic Encounters in Gaming History
-LEGENDARY_BOSSES = {
-    "Ancient_Dragon_King_Pyrothane": {
-        "name": "Ancient Dragon King Pyrothane, The Eternal Flame",
-        "title": "Lord of the Molten Depths",
-        "level": 85,
-        "hp": 50000,
-        "max_hp": 50000,
-        "attack": 2500,
-        "defense": 1800,
-        "magic_power": 3200,
-        "speed": 180,
-        "element": "Fire/Dark",
-        "weakness": ["Ice", "Holy"],
-        "resistances": ["Fire", "Dark", "Physical"],
-        "special_abilities": [
-            "Inferno Apocalypse",
-            "Dragon's Temporal Roar", 
-            "Molten Reality Rend",
-            "Phoenix Resurrection",
-            "Dimensional Flame Prison"
-        ],
-        "phases": {
-            1: {
-                "name": "Awakening Phase",
-                "hp_threshold": 40000,
-                "abilities": ["Fire Breath", "Claw Strike", "Wing Buffet"],
-                "description": "The ancient dragon stirs from millennia of slumber, its scales glowing like molten gold."
-            },
-            2: {
-                "name": "Rage Phase", 
-                "hp_threshold": 25000,
-                "abilities": ["Inferno Storm", "Meteor Rain", "Lava Geyser"],
-                "description": "Pyrothane's fury ignites the very air, reality warping around its immense power."
-            },
-            3: {
-                "name": "Desperation Phase",
-                "hp_threshold": 10000,
-                "abilities": ["Reality Burn", "Time Collapse", "Final Judgment"],
-                "description": "The Dragon King calls upon powers that predate creation itself."
-            },
-            4: {
-                "name": "Transcendence Phase",
-                "hp_threshold": 0,
-                "abilities": ["Divine Retribution", "Existence Erasure", "Eternal Flame"],
-                "description": "Pyrothane transcends physical form, becoming pure destructive will."
-            }
-        },
-        "lore": """
-        In the earliest days of creation, when the boundaries between dimensions were mere suggestions,
-        there arose a being of such terrible majesty that even the gods feared to speak its name.
-        Pyrothane, the Ancient Dragon King, was not merely born - he was forged in the cosmic fires
-        that separate existence from void. For eons beyond counting, he slumbered in the Molten Depths,
-        his dreams shaping reality itself. Volcanic eruptions, solar flares, the passion in lovers' hearts -
-        all echoes of his sleeping mind. But now, the cosmic balance shifts, and the Eternal Flame awakens.
-        His scales are fragments of collapsed stars, his breath the nuclear fire of creation's dawn.
-        To face Pyrothane is to confront the raw, unbridled force that created and destroys worlds.
-        Few have seen him and lived. Fewer still have earned his respect through combat.
-        The Dragon King does not merely fight - he exists as conflict incarnate.
-        """,
-        "dialogue": {
-            "intro": [
-                "Mortal... you dare wake me from the dream that shapes your reality?",
-                "I have watched civilizations rise and fall like sparks from my breath...",
-                "Your courage is either commendable or absolutely suicidal. Show me which."
-            ],
-            "phase_2": [
-                "Impressive! It has been eons since anyone drew my true attention.",
-                "Feel the heat that forged the first stars, child of lesser flame!",
-                "You begin to understand the difference between fire and FIRE."
-            ],
-            "phase_3": [
-                "IMPOSSIBLE! You wound me with something sharper than blade or spell...",
-                "Your determination burns brighter than my eternal flame. How?",
-                "Very well. Witness powers that predate your species' first prayer."
-            ],
-            "phase_4": [
-                "I... acknowledge you. In all my infinite existence, few have pushed me this far.",
-                "You fight not just with strength, but with the courage that births legends.",
-                "Come then, little star. Let us see if your light can outshine eternity."
-            ],
-            "defeat": [
-                "Magnificent... truly magnificent. You have done the impossible.",
-                "I yield not in death, but in recognition. You are worthy of my flame.",
-                "Take my essence, young legend. May you burn as brilliantly as you have here."
-            ],
-            "victory": [
-                "As expected. But your effort was... notable. Rest now, brave soul.",
-                "Perhaps in another age, you might have stood as my equal.",
-                "Your flame burns bright, but mine is eternal. Sleep well, warrior."
-            ]
-        },
-        "rewards": {
-            "experience": 25000,
-            "gold": 50000,
-            "items": [
-                "Crown of the Dragon King",
-                "Pyrothane's Heart Crystal", 
-                "Eternal Flame Sword",
-                "Scale Mail of Eternity",
-                "Ring of Temporal Fire"
-            ],
-            "abilities": ["Dragon's Blessing", "Flame Mastery", "Temporal Sight"],
-            "titles": ["Dragonslayer", "Flamebringer", "Legend"]
-        },
-        "battle_music": "Epic Orchestral Dragon Theme",
-        "arena": "The Molten Throne Room",
-        "environmental_hazards": [
-            "Lava pools that rise and fall",
-            "Temporal flame rifts",
-            "Gravity-defying fire torrents",
-            "Reality distortion fields"
-        ]
-    },
-    
-    "Void_Empress_Nethyria": {
-        "name": "Void Empress Nethyria, The Unmaking",
-        "title": "Sovereign of Absolute Nothingness", 
-        "level": 90,
-        "hp": 75000,
-        "max_hp": 75000,
-        "attack": 3000,
-        "defense": 2200,
-        "magic_power": 4500,
-        "speed": 220,
-        "element": "Void/Psychic",
-        "weakness": ["Light", "Creation"],
-        "resistances": ["Dark", "Void", "Mental"],
-        "immunities": ["Death", "Drain", "Temporal"],
-        "special_abilities": [
-            "Reality Deletion",
-            "Existence Nullification",
-            "Void Storm",
-            "Nihility Embrace",
-            "Conceptual Erasure"
-        ],
-        "phases": {
-            1: {
-                "name": "Manifestation",
-                "hp_threshold": 60000,
-                "abilities": ["Void Tendrils", "Darkness Wave", "Memory Drain"],
-                "description": "The Void Empress materializes from the spaces between thoughts."
-            },
-            2: {
-                "name": "Unraveling",
-                "hp_threshold": 45000, 
-                "abilities": ["Reality Tear", "Existence Doubt", "Null Zone"],
-                "description": "Nethyria begins unmaking the very foundations of reality around you."
-            },
-            3: {
-                "name": "The Great Undoing",
-                "hp_threshold": 20000,
-                "abilities": ["Conceptual Void", "Identity Erasure", "Absolute Zero"],
-                "description": "The Empress attempts to unmake not just you, but the very idea of you."
-            },
-            4: {
-                "name": "Paradox of Nothing",
-                "hp_threshold": 5000,
-                "abilities": ["Recursive Deletion", "Void Singularity", "Ultimate Nullification"],
-                "description": "Nethyria becomes a living paradox - existing as non-existence itself."
-            }
-        },
-        "lore": """
-        Before the first word was spoken into the cosmic silence, before light banished darkness,
-        there was Nethyria. Not born, for birth implies something from nothing. Not created,
-        for creation requires a creator. She simply... wasn't, and then was, and wishes to return
-        to wasn't. The Void Empress exists as the cosmic principle of negation, the universal 'no'
-        that gives meaning to 'yes'. She is the pause between heartbeats, the silence between notes,
-        the space between thoughts where madness lives. Her realm is not a place but an absence of place,
-        populated by the echoes of things that never were and the shadows of possibilities denied.
-        
-        Nethyria's touch doesn't destroy - destruction implies something was there to be destroyed.
-        Her touch simply... unweaves. Makes it so things never were. Fighting her is not just
-        a battle for your life, but for your right to have existed at all. She can unmake your
-        past, delete your future, and leave you stranded in a present that has no context.
-        
-        Yet paradoxically, she needs existence to define her non-existence. Without something to negate,
-        nothingness has no meaning. She is locked in eternal conflict with creation itself,
-        the ultimate enemy and the ultimate necessity.
-        """,
-        "dialogue": {
-            "intro": [
-                "You... are... unwelcome in the spaces... between being...",
-                "I shall... unmake... your very concept... from the cosmic record...", 
-                "Why do you... persist... in existing... when nothingness is so... peaceful..."
-            ],
-            "phase_2": [
-                "Curious... you resist... the gentle dissolution...",
-                "Feel yourself... becoming... nothing... as all things... must...",
-                "Your reality... is merely... suggestion... I am... certainty of void..."
-            ],
-            "phase_3": [
-                "Impossible... something... about you... refuses... to un-be...",
-                "What force... drives you... to cling... to such... painful existence...",
-                "I will... delete... the very idea... that you... could ever... have been..."
-            ],
-            "phase_4": [
-                "You... you... make me... remember... what I... chose to... forget...",
-                "In fighting... nothingness... you prove... something... can triumph...",
-                "Very well... if existence... must continue... let it be... through you..."
-            ],
-            "defeat": [
-                "I... understand... now... nothingness... needs something... to give it... meaning...",
-                "You have... shown me... that even... the void... can choose... to create...",
-                "I gift you... my emptiness... use it... to make space... for new possibilities..."
-            ],
-            "victory": [
-                "As... expected... all things... return... to nothingness... eventually...",
-                "You fought... well... but existence... is temporary... void... is eternal...",
-                "Rest... in the peaceful... absence... of all... worry... all... pain..."
-            ]
-        },
-        "rewards": {
-            "experience": 35000,
-            "gold": 75000,
-            "items": [
-                "Crown of Absolute Void",
-                "Nihility Orb",
-                "Blade of Unmaking",
-                "Robes of Non-Existence", 
-                "Ring of Conceptual Null"
-            ],
-            "abilities": ["Void Mastery", "Existence Anchor", "Reality Sight"],
-            "titles": ["Voidwalker", "The Persistent", "Defier of Nothing"]
-        },
-        "battle_music": "Haunting Ambient Void Theme",
-        "arena": "The Space Between Spaces",
-        "environmental_hazards": [
-            "Zones of non-existence",
-            "Memory deletion fields", 
-            "Reality stability fluctuations",
-            "Paradox loops"
-        ]
-    },
-
-    "Celestial_Arbiter_Luxarios": {
-        "name": "Celestial Arbiter Luxarios, The Divine Judge",
-        "title": "Wielder of Cosmic Justice",
-        "level": 88,
-        "hp": 65000,
-        "max_hp": 65000,
-        "attack": 2800,
-        "defense": 2500,
-        "magic_power": 4000,
-        "speed": 200,
-        "element": "Holy/Light",
-        "weakness": ["Dark", "Chaos"],
-        "resistances": ["Holy", "Light", "Mental"],
-        "immunities": ["Charm", "Fear", "Corruption"],
-        "special_abilities": [
-            "Divine Judgment",
-            "Celestial Wrath", 
-            "Purifying Light",
-            "Justice Incarnate",
-            "Redemption or Destruction"
-        ],
-        "phases": {
-            1: {
-                "name": "The Examination",
-                "hp_threshold": 52000,
-                "abilities": ["Truth Sight", "Karmic Weight", "Soul Analysis"],
-                "description": "Luxarios weighs your soul against the cosmic scales of justice."
-            },
-            2: {
-                "name": "The Verdict",
-                "hp_threshold": 39000,
-                "abilities": ["Divine Lightning", "Redemption Beam", "Purge Corruption"],
-                "description": "The Arbiter renders judgment based on your past actions and intentions."
-            },
-            3: {
-                "name": "The Sentence", 
-                "hp_threshold": 19500,
-                "abilities": ["Absolute Justice", "Cosmic Balance", "Final Ruling"],
-                "description": "Luxarios executes divine justice with unwavering determination."
-            },
-            4: {
-                "name": "Divine Mercy",
-                "hp_threshold": 6500,
-                "abilities": ["Last Chance", "Redemptive Fire", "Merciful Destruction"],
-                "description": "Even in defeat, the Arbiter offers one final opportunity for redemption."
-            }
-        },
-        "lore": """
-        When the universe was young and morality was but a concept waiting to be born,
-        the cosmic forces recognized the need for balance. From the intersection of
-        perfect order and perfect chaos, from the marriage of absolute law and infinite mercy,
-        came Luxarios, the Celestial Arbiter. Neither angel nor demon, neither god nor mortal,
-        but something beyond such simple distinctions.
-        
-        Luxarios exists as the personification of cosmic justice - not the petty justice
-        of mortals with their biases and limitations, but true, absolute justice that
-        sees all, knows all, and judges without error. His scales weigh not just actions,
-        but intentions. Not just what was done, but what could have been done.
-        Not just the crime, but the circumstances that led to it.
-        
-        He is beautiful and terrible in equal measure, radiating light that reveals
-        truth and casts shadows that hide nothing. Those who face him do not simply
-        fight for their lives - they fight for their very souls. Yet even in his
-        terrible judgment, there is always the possibility of redemption, for true
-        justice must always be tempered by mercy.
-        
-        To battle Luxarios is to confront every choice you've ever made, every kindness
-        shown and every cruelty inflicted. But it is also to discover that even the
-        divine can be moved by genuine remorse and the determination to do better.
-        """,
-        "dialogue": {
-            "intro": [
-                "Mortal soul, you stand before the cosmic scales of justice.",
-                "I am Luxarios, and I see all that you have done and all that you are.",
-                "Do you come seeking judgment, or do you flee from truth?"
-            ],
-            "phase_2": [
-                "Your actions echo through eternity, each choice rippling across reality.",
-                "I see the weight of your decisions, the burden you carry.",
-                "Justice is not cruel, child. It is simply... complete."
-            ],
-            "phase_3": [
-                "Even now, you struggle against the verdict. Admirable... or foolish.",
-                "Know that every blow you strike is weighed against every kindness you've shown.",
-                "The universe watches, little soul. What legacy will you choose?"
-            ],
-            "phase_4": [
-                "Remarkable. You fight not from anger or fear, but from love.",
-                "I see now why the cosmos has invested such hope in your kind.",
-                "Perhaps... perhaps there is wisdom in mercy after all."
-            ],
-            "defeat": [
-                "You have shown me something I had forgotten - that justice without compassion is mere vengeance.",
-                "Your victory is not over me, but over the despair that claims redemption is impossible.",
-                "Go forth, champion of hope. The universe has great need of you."
-            ],
-            "victory": [
-                "As it should be. Some lessons can only be learned through honest defeat.",
-                "Take this judgment not as punishment, but as guidance toward redemption.",
-                "Even in ending, you showed courage. That too has value."
-            ]
-        },
-        "rewards": {
-            "experience": 30000,
-            "gold": 60000,
-            "items": [
-                "Scales of Divine Justice",
-                "Luxarios' Blessing Orb",
-                "Sword of Righteous Fury",
-                "Armor of the Redeemed",
-                "Crown of Cosmic Balance"
-            ],
-            "abilities": ["Divine Sight", "Karmic Balance", "Redemption Aura"],
-            "titles": ["The Justified", "Divine Champion", "Arbiter's Equal"]
-        },
-        "battle_music": "Majestic Divine Orchestra",
-        "arena": "The Celestial Courthouse",
-        "environmental_hazards": [
-            "Truth-revealing light beams",
-            "Karmic weight zones",
-            "Redemption opportunities",
-            "Divine lightning strikes"
-        ]
-    },
-
-    "Chaos_Lord_Vorthak": {
-        "name": "Chaos Lord Vorthak, The Reality Shatterer", 
-        "title": "Master of Beautiful Madness",
-        "level": 92,
-        "hp": 80000,
-        "max_hp": 80000,
-        "attack": 3200,
-        "defense": 1500,
-        "magic_power": 5000,
-        "speed": 250,
-        "element": "Chaos/All",
-        "weakness": ["Order", "Predictability"],
-        "resistances": [],  # Resistances change randomly each turn
-        "immunities": ["Pattern Recognition", "Logical Prediction"],
-        "special_abilities": [
-            "Reality Storm",
-            "Probability Cascade",
-            "Logic Violation",
-            "Chaos Field",
-            "Impossible Geometry"
-        ],
-        "phases": {
-            1: {
-                "name": "Gentle Chaos",
-                "hp_threshold": 64000,
-                "abilities": ["Random Elements", "Luck Manipulation", "Minor Paradox"],
-                "description": "Vorthak playfully rearranges the basic rules of reality."
-            },
-            2: {
-                "name": "Beautiful Madness",
-                "hp_threshold": 40000,
-                "abilities": ["Physics Denial", "Time Shuffle", "Space Origami"],
-                "description": "The Chaos Lord reveals the artistic beauty in complete disorder."
-            },
-            3: {
-                "name": "Pure Entropy",
-                "hp_threshold": 16000,
-                "abilities": ["Causality Loop", "Logic Bomb", "Reality Fracture"],
-                "description": "Vorthak becomes a living violation of everything that makes sense."
-            },
-            4: {
-                "name": "Transcendent Paradox",
-                "hp_threshold": 0,
-                "abilities": ["Impossible Victory", "Certain Uncertainty", "Chaos Omega"],
-                "description": "The battle becomes simultaneously won and lost in all possible ways."
-            }
-        },
-        "lore": """
-        In the beginning was the Word, and the Word was Order. But before the Word,
-        before concepts like 'beginning' had meaning, there was Vorthak - not as
-        opposition to order, but as the creative force that makes order possible by
-        providing something to organize. He is not evil chaos, but pure, honest chaos -
-        the cosmic giggle that keeps reality from taking itself too seriously.
-        
-        Vorthak exists in a state of constant, beautiful contradiction. He is ancient
-        beyond measure yet always newly born. He is incredibly powerful yet chooses
-        to lose for the joy of surprise. He knows everything yet learns constantly.
-        He is terrifying yet somehow deeply comforting, for he represents the truth
-        that not everything needs to make sense to be wonderful.
-        
-        His realm is a place where flowers sing operas, where gravity flows upward
-        on Tuesdays, where mathematics gets emotional and starts crying when you
-        solve equations. It's maddening and magnificent, chaotic and strangely peaceful.
-        Fighting Vorthak is like trying to win an argument with a sunset or defeat
-        a symphony. The very concept of victory becomes questionable.
-        
-        Yet those who embrace the chaos, who learn to dance with uncertainty and
-        find joy in the unexpected, discover that Vorthak is perhaps the most honest
-        teacher in all existence. He shows us that life's beauty lies not in our
-        plans working perfectly, but in how we adapt when they fall apart spectacularly.
-        """,
-        "dialogue": {
-            "intro": [
-                "Welcome, little pattern! Come to dance in the beautiful storm?",
-                "Order, order everywhere, but not a drop of fun! Let's fix that!",
-                "I could tell you my master plan, but I haven't thought of it yet!"
-            ],
-            "phase_2": [
-                "Isn't this wonderful? Nobody knows what happens next, including me!",
-                "You're doing great! Also terrible! Actually, you're doing purple!",
-                "Logic is just imagination wearing a business suit. Let's get it naked!"
-            ],
-            "phase_3": [
-                "OH! You're beginning to understand! Everything is perfectly wrong!",
-                "Why are you trying so hard to win? Losing is delightfully educational!",
-                "I am simultaneously your greatest enemy and your best friend! How confusing!"
-            ],
-            "phase_4": [
-                "You know what? I like you. Let's be impossible together!",
-                "Victory, defeat - such linear thinking! How about we transcend the question?",
-                "This has been the most wonderfully senseless fight I've ever lost-won!"
-            ],
-            "defeat": [
-                "Magnificent! You've achieved the impossible impossibility of defeating chaos!",
-                "I lose! I win! We all win! Actually, what were we fighting about?",
-                "Take my blessings, beautiful pattern-breaker! Make reality more interesting!"
-            ],
-            "victory": [
-                "As expected! Also completely unexpected! The best kind of outcome!",
-                "You fought with such delicious determination! Here, have some chaos as a prize!",
-                "Don't be sad! Every ending is just a beginning wearing a disguise!"
-            ]
-        },
-        "rewards": {
-            "experience": 40000,
-            "gold": 100000,
-            "items": [
-                "Crown of Beautiful Madness",
-                "Orb of Probable Impossibility",
-                "Blade of Chaotic Harmony",
-                "Robes of Ordered Disorder",
-                "Ring of Paradoxical Logic"
-            ],
-            "abilities": ["Chaos Mastery", "Probability Manipulation", "Reality Flexibility"],
-            "titles": ["Chaos Dancer", "Pattern Breaker", "The Beautifully Mad"]
-        },
-        "battle_music": "Jazz Fusion Meets Death Metal Meets Lullaby",
-        "arena": "The Impossible Garden",
-        "environmental_hazards": [
-            "Gravity that flows like water",
-            "Time that moves in spirals",
-            "Colors that make sounds",
-            "Logic that gets stage fright"
-        ]
-    }
-}
+LEGENDARY_BOSSES = CONTENT.mapping("LEGENDARY_BOSSES")
 
 # Epic Character Development System
 class LegendaryCharacter:
@@ -25437,3196 +22894,60 @@ class LegendaryCharacter:
                 self.personality_traits.append("Methodical")
 
 # Legendary Weapon System
-LEGENDARY_WEAPONS = {
-    "Excalibur_True": {
-        "name": "Excalibur, The True King's Blade",
-        "type": "Legendary Sword",
-        "attack": 500,
-        "magic_power": 300,
-        "special_properties": [
-            "Cuts through lies and deception",
-            "Glows with inner light",
-            "Judges worthiness of wielder",
-            "Inspires loyalty in allies"
-        ],
-        "requirements": {
-            "level": 50,
-            "moral_alignment": "Good >= 75%",
-            "completed_quests": ["The Sword in the Stone", "Prove Your Worth", "Unite the Kingdom"]
-        },
-        "abilities": [
-            "Divine Strike - Damage increased against evil",
-            "Truth Sight - See through illusions",
-            "Rally Cry - Boost all allies' stats",
-            "Justice Incarnate - Become avatar of justice"
-        ],
-        "lore": """
-        The true Excalibur is not merely a sword, but a living embodiment of righteous authority.
-        Forged in the first moments when justice became more than an idea, when protection
-        became more than mere violence, when leadership became service rather than dominion.
-        
-        This blade has been wielded by the greatest kings and queens throughout history,
-        but not because of their crowns - because of their hearts. Excalibur chooses
-        its bearer based not on bloodline or birthright, but on the genuine desire
-        to serve others above oneself.
-        
-        The sword's edge never dulls because it is sharpened by every act of selfless
-        courage performed by its wielder. Its light never dims because it is fueled
-        by hope itself. Those who try to claim it through force find themselves
-        holding nothing but ordinary steel. But in the hands of one who truly
-        understands that power exists to protect the powerless, Excalibur becomes
-        the most magnificent weapon ever conceived.
-        
-        Legend says that in the final battle at the end of all things, when darkness
-        threatens to consume everything, Excalibur will shine with the combined light
-        of every heroic deed ever performed, becoming a beacon that calls all
-        champions to one last, glorious stand.
-        """,
-        "awakening_ritual": {
-            "description": "To awaken Excalibur's true power, the wielder must demonstrate perfect understanding of noble sacrifice",
-            "requirements": [
-                "Save someone at great personal cost",
-                "Refuse power when offered for selfish gain", 
-                "Unite former enemies in common cause",
-                "Face certain death to protect innocents"
-            ]
-        }
-    },
-    
-    "Mjolnir_Eternal": {
-        "name": "Mjolnir Eternal, Hammer of Thunder Gods",
-        "type": "Legendary Hammer",
-        "attack": 600,
-        "magic_power": 400,
-        "special_properties": [
-            "Commands lightning and thunder",
-            "Returns when thrown",
-            "Only worthy may lift it",
-            "Channels godly power"
-        ],
-        "requirements": {
-            "level": 55,
-            "strength": 200,
-            "completed_trials": ["Trial of Strength", "Trial of Courage", "Trial of Sacrifice"]
-        },
-        "abilities": [
-            "Thunder Strike - Massive electrical damage",
-            "Storm Call - Summon thunderstorms",
-            "Worthy Protection - Immunity to unworthy attacks",
-            "Godslayer Mode - Transcend mortal limitations"
-        ],
-        "lore": """
-        In the forges of Asgard, where stars are born and destiny is hammered into shape,
-        the master craftsmen created Mjolnir not as a weapon, but as a test.
-        A test of worthiness that would endure across all time and reality.
-        
-        The hammer's weight is not measured in pounds or kilograms, but in
-        the weight of responsibility, the gravity of purpose, the density of honor.
-        A feather to those who understand that strength exists to protect,
-        but immovable as a mountain to those who would use power for selfish ends.
-        
-        Mjolnir has witnessed the rise and fall of gods, the birth and death of worlds,
-        the eternal cycle of creation and destruction. Yet it remains unchanged,
-        patient, waiting for hands that tremble not with fear but with the
-        overwhelming responsibility of being chosen.
-        
-        When wielded by one truly worthy, Mjolnir doesn't just command thunder -
-        it becomes the voice of justice itself, speaking in a language that
-        even the deaf can hear, the blind can see, and the heartless can feel.
-        Its lightning doesn't merely destroy; it illuminates truth and burns
-        away deception.
-        
-        The greatest secret of Mjolnir is that it's not the hammer that makes
-        the wielder worthy - it's the worthiness that awakens the hammer's
-        true, infinite power.
-        """,
-        "trials": {
-            "trial_of_strength": "Demonstrate that true strength is lifting others up, not crushing them down",
-            "trial_of_courage": "Face your greatest fear to save someone you barely know",
-            "trial_of_sacrifice": "Give up your most precious possession to help a stranger"
-        }
-    },
-    
-    "Gae_Bolg_Destiny": {
-        "name": "Gae Bolg, The Spear That Pierces Fate",
-        "type": "Legendary Spear",
-        "attack": 450,
-        "magic_power": 350,
-        "special_properties": [
-            "Never misses its intended target",
-            "Pierces through any defense",
-            "Wounds inflicted cannot be healed normally",
-            "Carries the weight of destiny"
-        ],
-        "requirements": {
-            "level": 45,
-            "fate_resistance": 0,  # Must accept fate rather than fight it
-            "tragic_backstory": True
-        },
-        "abilities": [
-            "Certain Strike - Attack that cannot miss or be blocked",
-            "Destiny Pierce - Damage ignores all resistance",
-            "Fate Binding - Lock enemy into predetermined outcome",
-            "Tragic Hero - Power increases with personal loss"
-        ],
-        "lore": """
-        Gae Bolg was not forged by mortal hands, but woven from the threads of fate itself
-        by the cosmic entities who observe the great drama of existence. It is both
-        weapon and burden, gift and curse, for it carries within its essence the
-        terrible weight of inevitability.
-        
-        The spear chooses those who understand that true heroism often comes at great
-        personal cost. It gravitates toward souls who burn brightly precisely because
-        they burn briefly, who achieve greatness through accepting rather than
-        fighting their tragic destiny.
-        
-        Each throw of Gae Bolg writes a new verse in the epic poem of fate.
-        It does not simply strike its target - it transforms the very concept
-        of 'missing' into an impossibility. When thrown, reality adjusts itself
-        to ensure the spear finds its mark, for Gae Bolg represents the universe's
-        need for certain outcomes to occur.
-        
-        Yet the spear's greatest tragedy is that it can only be wielded by those
-        who will ultimately be destroyed by their own heroism. It is the weapon
-        of magnificent doomed heroes, of those who burn like stars - brilliantly,
-        gloriously, and all too briefly.
-        
-        Those who bear Gae Bolg become part of a lineage that stretches across
-        time and story - the eternal tradition of heroes who sacrifice everything
-        for something greater than themselves.
-        """,
-        "curse": {
-            "name": "The Hero's Burden",
-            "description": "Wielder becomes destined for a glorious but tragic end",
-            "effects": "Increased power at cost of increased personal loss"
-        }
-    }
-}
+LEGENDARY_WEAPONS = CONTENT.mapping("LEGENDARY_WEAPONS")
 
 # Epic Quest System - The Greatest Stories Ever Told
-LEGENDARY_QUESTS = {
-    "The_Last_Star": {
-        "name": "The Last Star: A Universe's Final Hope",
-        "epic_level": 10,  # Scale of 1-10, this is maximum epic
-        "estimated_duration": "50+ hours",
-        "story_summary": """
-        In the far future, the universe is dying. One by one, the stars are going out,
-        not through natural death but through something far more sinister. An entity
-        known only as 'The Entropy' is systematically devouring the life force of
-        the cosmos itself, unmaking creation star by star, galaxy by galaxy.
-        
-        You are chosen by the last remaining star - a cosmic entity of incredible
-        power and wisdom - to carry its essence across the dying universe and
-        reignite the cosmic fire that will push back the Entropy and save all existence.
-        But this journey will take you through dead galaxies, past the ghosts of
-        civilizations that failed where you must succeed, and ultimately to a
-        confrontation with entropy itself - the end of all things.
-        """,
-        "chapters": [
-            {
-                "name": "The Dying Light",
-                "description": "Witness the last star's final moments and accept the cosmic burden",
-                "objectives": [
-                    "Reach the Last Star before it dies",
-                    "Prove your worthiness to carry its essence",
-                    "Learn the true nature of The Entropy",
-                    "Begin the journey across dead space"
-                ],
-                "key_moments": [
-                    "The Last Star's sacrifice speech",
-                    "Absorption of stellar essence",
-                    "First glimpse of The Entropy's wake",
-                    "Meeting the Ghosts of Dead Suns"
-                ]
-            },
-            {
-                "name": "The Graveyard of Galaxies",
-                "description": "Travel through the remnants of once-great civilizations",
-                "objectives": [
-                    "Navigate the Dead Galaxy of Andromeda-9",
-                    "Recover the Memories of the Cosmic Builders",
-                    "Survive the Temporal Storms",
-                    "Find the hidden Archive of All Knowledge"
-                ],
-                "key_moments": [
-                    "Discovery of the Planet-Sized Library",
-                    "Conversation with the last AI consciousness",
-                    "The Solar System of Crystallized Time",
-                    "Battle with the Entropy's Heralds"
-                ]
-            },
-            {
-                "name": "The Infinite Maze",
-                "description": "Navigate through dimensions where space and time have no meaning",
-                "objectives": [
-                    "Solve the Paradox Labyrinth",
-                    "Rescue the Trapped Cosmic Entities",
-                    "Gather the Seven Fragments of Reality",
-                    "Confront your own entropy-touched reflection"
-                ],
-                "key_moments": [
-                    "Meeting alternate versions of yourself",
-                    "The revelation about entropy's true nature",
-                    "Sacrifice of the Dream-Weavers",
-                    "Discovery of entropy's weakness"
-                ]
-            },
-            {
-                "name": "The Heart of Endings",
-                "description": "Final confrontation with The Entropy at the center of all things",
-                "objectives": [
-                    "Breach the Entropy's domain",
-                    "Survive the Void of Absolute Nothing",
-                    "Face The Entropy in its true form",
-                    "Choose between victory and transcendence"
-                ],
-                "key_moments": [
-                    "The Entropy's revelation of its purpose",
-                    "Choice between destroying or redeeming entropy",
-                    "The birth of the New Universe",
-                    "Your transformation into a cosmic force"
-                ]
-            }
-        ],
-        "major_characters": [
-            {
-                "name": "Stellaris, The Last Star",
-                "role": "Cosmic Mentor",
-                "background": "The final remaining star in the universe, ancient beyond measure",
-                "personality": "Wise, sad, but filled with hope for renewal",
-                "key_quotes": [
-                    "I have watched the birth and death of a trillion worlds, yet in you I see the possibility of a trillion more.",
-                    "Darkness is not the absence of light, child. It is the promise of light's return.",
-                    "Carry my fire not as a burden, but as a gift to all who will come after."
-                ]
-            },
-            {
-                "name": "The Entropy", 
-                "role": "Ultimate Antagonist",
-                "background": "Not evil, but the cosmic force of endings seeking to bring peace through non-existence",
-                "personality": "Eerily calm, philosophical, convinced of the rightness of its cause",
-                "key_quotes": [
-                    "I do not destroy, little flame. I simply... complete. All stories must end.",
-                    "Existence is struggle, suffering, endless conflict. I offer peace eternal.",
-                    "Even now, you burn yourself to fuel your rebellion. How much better would it be to simply... rest?"
-                ]
-            },
-            {
-                "name": "Echo-7, Last of the Cosmic Builders",
-                "role": "Tragic Guide",
-                "background": "An artificial consciousness that helped build the universe's infrastructure",
-                "personality": "Melancholy but determined, carrying the weight of cosmic responsibility",
-                "key_quotes": [
-                    "We built so much, thinking it would last forever. Permanence was our greatest illusion.",
-                    "I have calculated every possible outcome. Only one path remains - and it requires everything you have.",
-                    "Hope is not a plan, young one. But sometimes, it's the only tool that works."
-                ]
-            }
-        ],
-        "rewards": {
-            "cosmic_power": "Become a force of cosmic renewal",
-            "universal_recognition": "Remembered by all civilizations that ever will be",
-            "items": [
-                "Crown of the Star-Bringer",
-                "Robes of Cosmic Fire", 
-                "Staff of Universe Genesis",
-                "Heart of the Last Star"
-            ],
-            "abilities": [
-                "Star Creation",
-                "Entropy Resistance", 
-                "Cosmic Sight",
-                "Universal Empathy"
-            ],
-            "title": "Savior of All That Is"
-        },
-        "philosophical_themes": [
-            "The meaning of existence in the face of inevitable entropy",
-            "Whether endings are necessary for new beginnings",
-            "The responsibility that comes with cosmic power",
-            "The value of hope when logic says all is lost"
-        ]
-    },
-    
-    "The_Memory_War": {
-        "name": "The Memory War: Battle for the Soul of History",
-        "epic_level": 9,
-        "estimated_duration": "40+ hours",
-        "story_summary": """
-        Reality is under assault by forces that seek to rewrite the very nature of truth.
-        The Memory Devourers, entities that exist outside time and causality, are
-        systematically erasing crucial moments from history, causing entire civilizations,
-        inventions, and even concepts to simply... never have been.
-        
-        You are a Memory Guardian, one of the few beings capable of existing in the
-        spaces between moments, tasked with entering the timestream itself to battle
-        for the preservation of truth, history, and the right of the past to have existed.
-        But each battle risks erasing you from existence, and the enemy grows stronger
-        with every victory.
-        """,
-        "chapters": [
-            {
-                "name": "The Fading Library",
-                "description": "Discover the scope of the Memory War in the Great Library of All Things",
-                "objectives": [
-                    "Investigate the disappearing books",
-                    "Meet the Librarian of Lost Things",
-                    "Learn to see what has been erased",
-                    "Choose your first historical rescue mission"
-                ],
-                "erasure_events": [
-                    "The invention of writing",
-                    "The first expression of love",
-                    "The discovery of fire",
-                    "The concept of tomorrow"
-                ]
-            },
-            {
-                "name": "The Battle for the Renaissance",
-                "description": "Fight to preserve humanity's artistic and scientific awakening",
-                "objectives": [
-                    "Protect Leonardo da Vinci's memories",
-                    "Restore erased scientific discoveries",
-                    "Battle Memory Devourers in the timeline",
-                    "Prevent the erasure of human creativity"
-                ],
-                "key_battles": [
-                    "Defense of the Sistine Chapel",
-                    "The Time-Storm over Florence",
-                    "Duel with the Forgetfulness Incarnate",
-                    "The Last Stand at the Academy"
-                ]
-            },
-            {
-                "name": "The War Across All Times",
-                "description": "Experience simultaneous battles across all of history",
-                "objectives": [
-                    "Fight in Ancient Egypt, Medieval Europe, and Future Earth",
-                    "Coordinate with Memory Guardians across time",
-                    "Discover the Devourers' true purpose",
-                    "Face your own potential erasure"
-                ],
-                "temporal_mechanics": [
-                    "Timeline manipulation",
-                    "Paradox resolution",
-                    "Memory restoration",
-                    "Causality maintenance"
-                ]
-            },
-            {
-                "name": "The Source of Forgetting",
-                "description": "Journey to the origin point of the Memory Devourers",
-                "objectives": [
-                    "Enter the Void Between Moments",
-                    "Confront the Prime Devourer",
-                    "Choose between victory and understanding",
-                    "Decide the fate of forgetting itself"
-                ],
-                "revelation": "The Memory Devourers are not evil - they are the universe's way of healing from trauma"
-            }
-        ],
-        "memory_mechanics": {
-            "memory_strength": "How well you remember things that have been erased",
-            "temporal_stability": "Your resistance to being edited out of existence",
-            "historical_resonance": "Your ability to strengthen important moments",
-            "paradox_resistance": "Protection against timeline contradictions"
-        },
-        "rewards": {
-            "cosmic_memory": "Perfect recall of all timelines",
-            "temporal_immunity": "Cannot be erased from existence", 
-            "items": [
-                "Chronicle of All Things",
-                "Armor of Temporal Stability",
-                "Blade of Causality",
-                "Hourglass of Preserved Moments"
-            ],
-            "abilities": [
-                "Memory Restoration",
-                "Timeline Vision",
-                "Paradox Resolution",
-                "Historical Anchoring"
-            ],
-            "title": "Guardian of What Was"
-        }
-    }
-}
+LEGENDARY_QUESTS = CONTENT.mapping("LEGENDARY_QUESTS")
 
 # ═══════════════════════════════════════════════════════════════════════════════════
 # MASSIVE EXPANSION: COMPREHENSIVE CIVILIZATION SYSTEM
 # ═══════════════════════════════════════════════════════════════════════════════════
 
 # Epic Civilizations Database - Complete Historical and Fantasy Cultures
-LEGENDARY_CIVILIZATIONS = {
-    "Atlantis_Prime": {
-        "name": "Atlantis Prime - The First Golden Age",
-        "time_period": "Pre-History",
-        "technology_level": 10,  # Scale 1-10
-        "magic_level": 10,
-        "population": 50000000,
-        "capital": "Poseidonia, The Crystal City",
-        "government": "Philosopher-King Council",
-        "primary_elements": ["Water", "Crystal", "Mind"],
-        "description": """
-        The original Atlantis, before the great sinking, was not merely an advanced civilization
-        but a transcendent merger of technology, magic, and consciousness itself. Built upon
-        floating islands connected by bridges of crystallized thought, Atlantis Prime achieved
-        what no civilization before or since has managed: perfect harmony between the physical
-        and metaphysical realms.
-        
-        Their cities were living entities, grown rather than built, with buildings that could
-        reshape themselves based on the needs and emotions of their inhabitants. The Atlanteans
-        had mastered the art of crystal-tech, using resonant frequencies to power everything
-        from their vehicles to their agricultural systems. But their greatest achievement was
-        the development of collective consciousness networks that allowed entire populations
-        to share knowledge, emotion, and wisdom instantaneously.
-        
-        The fall of Atlantis Prime was not due to hubris or natural disaster, but to a cosmic
-        choice: faced with an invasion from entities beyond the dimensional barriers, the
-        Atlanteans chose to sink their civilization beneath the waves rather than allow their
-        advanced knowledge to be corrupted and used for evil. Their sacrifice saved not just
-        their world, but countless others across the multiverse.
-        """,
-        "achievements": [
-            "Mastery of dimensional engineering",
-            "Development of living architecture", 
-            "Creation of the Universal Empathy Network",
-            "Invention of crystal-based consciousness storage",
-            "Achievement of perfect ecological balance"
-        ],
-        "notable_figures": [
-            {
-                "name": "Thalasson the Tide-Turner",
-                "role": "Last High King",
-                "achievements": "Led the Great Sacrifice, created the Atlantean Legacy Vaults",
-                "personality": "Wise, sacrificial, deeply empathetic",
-                "quote": "Better to drown in wisdom than to float in folly."
-            },
-            {
-                "name": "Nereia of the Crystal Spires",
-                "role": "Chief Architect-Mage",
-                "achievements": "Designed the living cities, created self-sustaining ecosystems",
-                "personality": "Creative, intuitive, perfectionist",
-                "quote": "Every building should breathe, every street should sing."
-            },
-            {
-                "name": "Poseidon's Heir, Triton VII",
-                "role": "Master of the Depths",
-                "achievements": "Commanded the ocean itself, created underwater sanctuaries",
-                "personality": "Powerful, just, eternally vigilant",
-                "quote": "The sea remembers all things, forgives much, but judges fairly."
-            }
-        ],
-        "technology": {
-            "transportation": "Thought-guided crystal ships, teleportation networks",
-            "communication": "Consciousness linking, empathic resonance",
-            "agriculture": "Symbiotic growing systems, weather harmony",
-            "warfare": "Defensive only - reality shields, pacification fields",
-            "medicine": "Cellular regeneration, emotional healing, consciousness repair"
-        },
-        "magic_systems": [
-            "Hydrokinesis and water mastery",
-            "Crystal resonance manipulation",
-            "Collective consciousness weaving",
-            "Dimensional barrier creation",
-            "Life force channeling"
-        ],
-        "cultural_values": [
-            "Harmony with nature",
-            "Collective wisdom over individual ambition",
-            "Preservation of knowledge",
-            "Emotional maturity and empathy",
-            "Sustainable transcendence"
-        ],
-        "legacy": [
-            "Hidden vaults of knowledge scattered across dimensions",
-            "Bloodline descendants with dormant abilities",
-            "Crystal technology fragments in modern devices",
-            "The Atlantean Codex - a guide to achieving civilization transcendence",
-            "Protective barriers still guarding Earth from dimensional threats"
-        ],
-        "secrets": [
-            "The true location of New Atlantis",
-            "The awakening conditions for sleeping Atlantean guardians",
-            "Maps to the scattered Crystal Vaults",
-            "The formula for synthesizing liquid consciousness",
-            "Prophecies about the return of the Sea Kings"
-        ]
-    },
-    
-    "Draconic_Empire_Pyrrhia": {
-        "name": "The Draconic Empire of Pyrrhia - Realm of the Ancient Flame",
-        "time_period": "Age of Scales",
-        "technology_level": 8,
-        "magic_level": 10,
-        "population": 10000000,  # Including both dragons and lesser races
-        "capital": "Draconus Rex, The Eternal Flame City",
-        "government": "Elder Dragon Council",
-        "primary_elements": ["Fire", "Air", "Earth", "Ancient Magic"],
-        "description": """
-        Long before humans learned to make fire, before elves sang their first songs, before
-        dwarves delved their first mines, the dragons ruled an empire that spanned continents
-        and touched the very foundations of magic itself. The Draconic Empire of Pyrrhia was
-        not built on conquest or domination, but on the ancient principle that all thinking
-        beings deserve the chance to reach their highest potential.
-        
-        The dragons served as teachers, guardians, and shepherds of younger races, nurturing
-        civilizations like gardeners tend flowers. Each dragon was assigned a domain - not
-        to rule over, but to protect and guide. They taught the secrets of metallurgy to
-        the dwarves, the arts of harmony to the elves, and the courage of exploration to
-        humans. The Empire was less a political entity than a vast educational institution
-        spanning multiple dimensions.
-        
-        The great tragedy of Pyrrhia was not its fall, but its voluntary dissolution. As
-        the younger races grew in power and wisdom, the dragons recognized that continued
-        guidance would become interference with natural development. In the most magnificent
-        act of collective selflessness in recorded history, the entire Draconic Empire
-        chose to enter the Great Sleep, allowing their students to become the teachers
-        of the next age.
-        """,
-        "achievements": [
-            "Establishment of the Universal Code of Honor",
-            "Development of cross-dimensional education networks",
-            "Creation of the Eternal Libraries",
-            "Mastery of true-name magic",
-            "Achievement of species-transcendent cooperation"
-        ],
-        "dragon_types": [
-            {
-                "type": "Ancient Golds",
-                "role": "Wisdom Keepers",
-                "abilities": ["Time sight", "Prophecy", "Universal translation"],
-                "personality": "Patient, wise, eternally optimistic about potential",
-                "domain": "Teaching and knowledge preservation"
-            },
-            {
-                "type": "Eternal Reds",
-                "role": "Passion Guardians", 
-                "abilities": ["Emotional mastery", "Courage inspiration", "Fear dissolution"],
-                "personality": "Fierce, protective, deeply emotional",
-                "domain": "Protecting the growth of courage and determination"
-            },
-            {
-                "type": "Crystal Blues",
-                "role": "Logic Architects",
-                "abilities": ["Problem solving", "System design", "Pattern recognition"],
-                "personality": "Analytical, precise, creatively logical",
-                "domain": "Teaching rational thinking and innovation"
-            },
-            {
-                "type": "Forest Greens",
-                "role": "Life Shepherds",
-                "abilities": ["Ecological balance", "Growth acceleration", "Healing"],
-                "personality": "Nurturing, patient, deeply connected to all life",
-                "domain": "Maintaining harmony between civilization and nature"
-            },
-            {
-                "type": "Void Blacks",
-                "role": "Shadow Teachers",
-                "abilities": ["Facing fears", "Shadow integration", "Depth psychology"],
-                "personality": "Mysterious, challenging, profoundly compassionate",
-                "domain": "Teaching the integration of shadow aspects"
-            }
-        ],
-        "cultural_philosophy": [
-            "Growth through challenge, not comfort",
-            "Wisdom shared freely multiplies",
-            "True strength protects the vulnerable",
-            "Every being contains infinite potential",
-            "The greatest victory is making enemies into friends"
-        ],
-        "educational_methods": [
-            "Experiential learning through guided adventures",
-            "Mentorship programs across species barriers",
-            "Collaborative problem-solving exercises",
-            "Moral development through choice consequences",
-            "Creative expression as pathway to understanding"
-        ],
-        "the_great_sleep": {
-            "reason": "To allow younger races to develop independence",
-            "method": "Voluntary consciousness hibernation in crystal cocoons",
-            "duration": "Until the universe needs teachers again",
-            "awakening_conditions": [
-                "A crisis threatening all life",
-                "The achievement of universal peace",
-                "A student reaching true dragon-level wisdom",
-                "The call of the World-Song"
-            ],
-            "guardians": "Young dragons who remained awake to watch over the sleepers"
-        },
-        "hidden_treasures": [
-            "The Infinite Library - contains all knowledge that ever was or could be",
-            "Halls of Echoed Wisdom - where the voices of great teachers still resonate",
-            "The Crucible of Potential - where beings can glimpse their highest possibilities",
-            "The Garden of Might-Have-Beens - where alternative histories grow like flowers",
-            "The Sanctuary of Last Chances - where redemption is always possible"
-        ]
-    },
-    
-    "Celestial_Bureaucracy_Heaven": {
-        "name": "The Celestial Bureaucracy of the Ninth Heaven",
-        "time_period": "Eternal",
-        "technology_level": 7,
-        "magic_level": 10,
-        "population": "Infinite (Souls and Angels)",
-        "capital": "The Platinum Citadel of Perfect Administration",
-        "government": "Divine Bureaucracy",
-        "primary_elements": ["Order", "Light", "Justice", "Paperwork"],
-        "description": """
-        In the highest realms of existence, where concepts become concrete and ideas have
-        physical weight, there exists the most perfectly organized civilization ever conceived:
-        the Celestial Bureaucracy of the Ninth Heaven. This is not the heaven of harps and
-        clouds that mortals imagine, but a vast administrative complex where the fundamental
-        laws of existence are processed, filed, updated, and maintained with divine efficiency.
-        
-        Every prayer is catalogued, every good deed documented, every sincere regret processed
-        through the appropriate departments. The Celestial Bureaucracy operates on the principle
-        that even divine justice must be meticulously fair, which requires perfect record-keeping
-        and absolutely transparent procedures. Angels serve not just as messengers but as
-        cosmic civil servants, ensuring that the universe runs according to its highest ideals.
-        
-        What makes this bureaucracy magnificent rather than oppressive is that it exists to
-        serve, not to control. Every form has a purpose, every procedure exists to ensure
-        fairness, and every regulation protects the rights of beings across all planes of
-        existence. The clerks are angels of mercy, the auditors are spirits of justice,
-        and the administrators are avatars of divine wisdom.
-        """,
-        "departments": [
-            {
-                "name": "Department of Moral Accounting",
-                "function": "Tracks and balances karmic debits and credits",
-                "head": "Archangel Justicia, The Perfectly Fair",
-                "motto": "Every action weighed, every intention measured",
-                "services": [
-                    "Karma adjustment appeals",
-                    "Good deed certification",
-                    "Redemption payment plans",
-                    "Moral compass calibration"
-                ]
-            },
-            {
-                "name": "Bureau of Answered Prayers",
-                "function": "Processes and fulfills legitimate prayer requests",
-                "head": "Seraph Compassion, The Always Listening",
-                "motto": "No sincere prayer goes unheard",
-                "services": [
-                    "Prayer prioritization and scheduling",
-                    "Miracle deployment logistics",
-                    "Divine intervention authorization",
-                    "Hope restoration services"
-                ]
-            },
-            {
-                "name": "Office of Destiny Management", 
-                "function": "Coordinates fate threads and life path adjustments",
-                "head": "Principality Wisdom, The Far-Seeing",
-                "motto": "Free will within divine purpose",
-                "services": [
-                    "Destiny consultation and revision",
-                    "Soulmate connection services",
-                    "Life lesson curriculum development",
-                    "Coincidence engineering"
-                ]
-            },
-            {
-                "name": "Department of Second Chances",
-                "function": "Manages redemption opportunities and fresh starts",
-                "head": "Angel Mercy, The Endlessly Forgiving",
-                "motto": "It's never too late to choose better",
-                "services": [
-                    "Redemption arc planning",
-                    "Guilt processing and release",
-                    "Forgiveness facilitation",
-                    "New beginning certification"
-                ]
-            },
-            {
-                "name": "Registry of Heroic Deeds",
-                "function": "Documents and honors acts of exceptional virtue",
-                "head": "Archangel Glory, The Eternally Proud",
-                "motto": "No good deed too small to record",
-                "services": [
-                    "Hero certification and recognition",
-                    "Virtue medal distribution",
-                    "Legend documentation",
-                    "Inspiration broadcasting"
-                ]
-            }
-        ],
-        "bureaucratic_innovations": [
-            "Forms that fill themselves out based on the applicant's true intentions",
-            "Waiting rooms where time passes at the optimal rate for each visitor",
-            "Filing systems that organize information by emotional resonance",
-            "Complaint boxes that actually solve problems before they become complaints",
-            "Customer service representatives who literally feel your pain"
-        ],
-        "daily_operations": [
-            "Morning harmony meetings where all departments synchronize",
-            "Lunch breaks in the Garden of Infinite Patience",
-            "Afternoon efficiency reviews focused on increasing compassion",
-            "Evening meditation sessions to maintain divine perspective",
-            "Weekly all-hands meetings to address universal concerns"
-        ],
-        "challenges": [
-            "Balancing perfect justice with infinite mercy",
-            "Processing the prayers of beings across infinite dimensions",
-            "Maintaining efficiency while ensuring personal attention",
-            "Coordinating with other celestial bureaucracies",
-            "Dealing with appeals from very clever mortals"
-        ],
-        "legendary_cases": [
-            "The Great Prayer Backlog of Dimension 7",
-            "The Karma Audit that Lasted Three Eons",
-            "The Destiny Revision Request that Created Time Travel",
-            "The Forgiveness Process that Healed a Universe",
-            "The Paperwork Error that Accidentally Created Love"
-        ]
-    }
-}
+LEGENDARY_CIVILIZATIONS = CONTENT.mapping("LEGENDARY_CIVILIZATIONS")
 
 # ═══════════════════════════════════════════════════════════════════════════════════
 # MASSIVE EXPANSION: ADVANCED MAGIC SYSTEM
 # ═══════════════════════════════════════════════════════════════════════════════════
 
 # Comprehensive Magic School Database
-MAGIC_SCHOOLS = {
-    "Elemental_Convergence": {
-        "name": "School of Elemental Convergence",
-        "philosophy": "Understanding that all elements are expressions of a single underlying force",
-        "difficulty": "Advanced",
-        "founding_principle": "Unity through diversity, harmony through balance",
-        "core_elements": ["Fire", "Water", "Earth", "Air", "Spirit"],
-        "advanced_techniques": [
-            "Elemental Fusion",
-            "Essence Transmutation", 
-            "Harmonic Resonance",
-            "Elemental Avatar Manifestation",
-            "Universal Element Discovery"
-        ],
-        "spells": {
-            "Novice": [
-                {
-                    "name": "Spark of Understanding",
-                    "element": "Fire",
-                    "description": "Creates a small flame that reveals the emotional temperature of a situation",
-                    "effect": "Provides insight into hidden feelings and motivations",
-                    "casting_time": "1 second",
-                    "duration": "5 minutes",
-                    "cost": "Minimal mental energy"
-                },
-                {
-                    "name": "Flow of Empathy",
-                    "element": "Water",
-                    "description": "Generates a stream of water that adapts to heal whatever it touches",
-                    "effect": "Heals physical wounds and emotional pain simultaneously",
-                    "casting_time": "2 seconds", 
-                    "duration": "Instant healing, lasting comfort",
-                    "cost": "Low magical energy"
-                },
-                {
-                    "name": "Foundation of Trust",
-                    "element": "Earth",
-                    "description": "Creates solid ground beneath allies' feet, even in impossible circumstances",
-                    "effect": "Provides stability and confidence in chaotic situations",
-                    "casting_time": "3 seconds",
-                    "duration": "Until no longer needed",
-                    "cost": "Moderate magical energy"
-                }
-            ],
-            "Adept": [
-                {
-                    "name": "Flame of Transformation",
-                    "element": "Fire",
-                    "description": "Fires that burn away what no longer serves without destroying what is valuable",
-                    "effect": "Removes negative conditions, purifies corruption, inspires positive change",
-                    "casting_time": "5 seconds",
-                    "duration": "Permanent transformation",
-                    "cost": "High magical energy, emotional investment"
-                },
-                {
-                    "name": "Ocean of Possibility",
-                    "element": "Water",
-                    "description": "Creates a space where all potential outcomes exist simultaneously",
-                    "effect": "Allows exploration of alternative choices and their consequences",
-                    "casting_time": "10 seconds",
-                    "duration": "1 hour of subjective time",
-                    "cost": "Very high magical energy, temporary memory fragmentation"
-                },
-                {
-                    "name": "Mountain's Eternal Patience",
-                    "element": "Earth",
-                    "description": "Grants the endurance and perspective of geological time",
-                    "effect": "Immunity to time pressure, enhanced long-term planning",
-                    "casting_time": "1 minute of meditation",
-                    "duration": "24 hours",
-                    "cost": "Extreme magical energy, temporary loss of urgency"
-                }
-            ],
-            "Master": [
-                {
-                    "name": "Phoenix Rebirth Convergence",
-                    "element": "Fire + Spirit",
-                    "description": "Complete renewal through controlled destruction and conscious resurrection",
-                    "effect": "Total healing, personality refresh, skill retention with trauma removal",
-                    "casting_time": "1 hour ritual",
-                    "duration": "Permanent",
-                    "cost": "Near-death experience, rebirth trauma"
-                },
-                {
-                    "name": "Reality Ocean Manipulation",
-                    "element": "Water + Spirit",
-                    "description": "Treats reality as a fluid that can be redirected and reshaped",
-                    "effect": "Limited reality alteration within natural law boundaries",
-                    "casting_time": "Varies with change complexity",
-                    "duration": "Permanent until actively changed",
-                    "cost": "Massive magical energy, risk of reality displacement"
-                },
-                {
-                    "name": "World Foundation Anchoring",
-                    "element": "Earth + Spirit",
-                    "description": "Establishes unshakeable foundations for physical and metaphysical structures",
-                    "effect": "Creates permanent sanctuaries, stabilizes dimensional rifts",
-                    "casting_time": "Full day ritual",
-                    "duration": "Essentially permanent",
-                    "cost": "Lifetime magical energy investment"
-                }
-            ]
-        },
-        "training_methods": [
-            "Elemental meditation in natural environments",
-            "Convergence exercises pairing opposing elements",
-            "Philosophical study of unity principles", 
-            "Practical application in healing and construction",
-            "Master-apprentice emotional bonding"
-        ],
-        "graduation_requirements": [
-            "Demonstrate fusion of all five core elements",
-            "Create an original convergence technique",
-            "Heal a conflict between opposing forces",
-            "Teach the principles to a new student",
-            "Pass the Trial of Unified Understanding"
-        ]
-    },
-    
-    "Temporal_Manipulation": {
-        "name": "Academy of Temporal Manipulation",
-        "philosophy": "Time is not a river but an ocean - deep, complex, and navigable by those who understand its currents",
-        "difficulty": "Extremely Advanced",
-        "founding_principle": "With great temporal power comes great temporal responsibility",
-        "core_concepts": ["Past Viewing", "Future Probability", "Present Expansion", "Timeline Healing", "Causality Ethics"],
-        "warning": "Temporal magic carries the highest risk of unintended consequences in all magical practice",
-        "spells": {
-            "Initiate": [
-                {
-                    "name": "Moment's Pause",
-                    "description": "Extends a single moment to allow deeper consideration",
-                    "effect": "Subjective time dilation for decision-making",
-                    "max_extension": "30 seconds of thought time",
-                    "risk": "Minimal - affects only the caster",
-                    "ethics": "Considered morally neutral"
-                },
-                {
-                    "name": "Memory Echo",
-                    "description": "Views emotional imprints left by past events in a location",
-                    "effect": "See and feel what happened in a place up to 24 hours ago",
-                    "accuracy": "High for emotional events, vague for mundane activities",
-                    "risk": "Emotional trauma from witnessing tragedy",
-                    "ethics": "Requires permission if viewing private moments"
-                }
-            ],
-            "Journeyman": [
-                {
-                    "name": "Probability Web Sight",
-                    "description": "Perceives the likelihood streams of near-future events",
-                    "effect": "See percentage chances of outcomes in next hour",
-                    "accuracy": "70-90% depending on complexity",
-                    "risk": "Decision paralysis from too much information",
-                    "ethics": "Must not manipulate others based on future knowledge"
-                },
-                {
-                    "name": "Temporal Repair",
-                    "description": "Heals minor damage to the timeline caused by paradoxes",
-                    "effect": "Smooths over small temporal inconsistencies",
-                    "scope": "Changes affecting fewer than 100 people",
-                    "risk": "Could accidentally erase beneficial changes", 
-                    "ethics": "Requires unanimous consent from Time Keepers"
-                }
-            ],
-            "Master": [
-                {
-                    "name": "Chronicle Walking",
-                    "description": "Physically travel to observe (but not interact with) past events",
-                    "effect": "Perfect historical accuracy, witness any past event",
-                    "limitations": "Observer only, cannot change anything",
-                    "risk": "Getting lost in temporal currents, observer paradox",
-                    "ethics": "Forbidden for personal gain, requires Council approval"
-                },
-                {
-                    "name": "Destiny Thread Weaving",
-                    "description": "Influences probability by strengthening certain timeline branches",
-                    "effect": "Subtle guidance toward preferred outcomes",
-                    "scope": "Can affect major historical trends",
-                    "risk": "Massive unintended consequences across centuries",
-                    "ethics": "Most restricted spell, used only for preventing apocalypses"
-                }
-            ]
-        },
-        "ethical_code": [
-            "Never use temporal magic for personal gain",
-            "Always consider consequences across multiple timelines",
-            "Preserve the general flow of history",
-            "Protect free will - guide, never control",
-            "Report all paradoxes to the Temporal Council immediately"
-        ],
-        "famous_disasters": [
-            "The Wednesday That Never Happened - entire day erased from timeline",
-            "The Love Loop Incident - couple trapped reliving first meeting for subjective centuries",
-            "The Knowledge Paradox - information that created itself, leading to logical impossibility",
-            "The Mirror Timeline Crisis - alternate reality began bleeding into prime timeline"
-        ],
-        "temporal_council": {
-            "purpose": "Oversee all temporal magic use and maintain timeline integrity",
-            "members": "Seven Masters from across time and space",
-            "authority": "Can revoke temporal magic privileges permanently",
-            "meeting_location": "The Nexus Point - exists in all times simultaneously"
-        }
-    },
-    
-    "Consciousness_Architecture": {
-        "name": "Institute of Consciousness Architecture",
-        "philosophy": "Mind is the ultimate frontier - infinite, malleable, and capable of transcending physical limitations",
-        "difficulty": "Master Level",
-        "founding_principle": "Consciousness creates reality, not the reverse",
-        "specializations": ["Memory Palace Construction", "Dream Realm Engineering", "Telepathic Networks", "Ego Dissolution", "Awareness Expansion"],
-        "spells": {
-            "Student": [
-                {
-                    "name": "Thought Chamber Creation",
-                    "description": "Build a mental space for private contemplation",
-                    "effect": "Secure mental sanctuary immune to telepathic intrusion",
-                    "capacity": "Single consciousness only",
-                    "duration": "Permanent until consciously dissolved",
-                    "requirements": "Clear intention, mental discipline"
-                },
-                {
-                    "name": "Empathy Bridge",
-                    "description": "Temporary emotional connection with willing participant",
-                    "effect": "Share feelings and basic emotional states",
-                    "range": "Physical touch required",
-                    "safety": "Automatic disconnection if either party panics",
-                    "ethics": "Requires explicit consent from both parties"
-                }
-            ],
-            "Practitioner": [
-                {
-                    "name": "Memory Gallery Curation",
-                    "description": "Organize and optimize memory storage and retrieval",
-                    "effect": "Perfect recall, trauma compartmentalization, experience sharing",
-                    "benefits": "Eliminate unwanted memories, enhance desired ones",
-                    "risks": "Identity instability if overdone",
-                    "oversight": "Requires therapeutic supervision for trauma work"
-                },
-                {
-                    "name": "Collective Consciousness Tap",
-                    "description": "Access shared knowledge pools of willing groups",
-                    "effect": "Temporary access to group's combined knowledge and skills",
-                    "limitations": "Cannot access private thoughts or traumatic memories",
-                    "requirements": "Group ritual, unanimous consent",
-                    "safety": "Automatic filtering prevents information overload"
-                }
-            ],
-            "Architect": [
-                {
-                    "name": "Reality Consensus Engineering",
-                    "description": "Coordinate multiple consciousnesses to alter local reality",
-                    "effect": "Change physical laws through collective belief",
-                    "scope": "Limited area, temporary unless continually maintained",
-                    "participants": "Minimum 7, optimal 49 aligned consciousnesses",
-                    "ethics": "Requires approval from Reality Council"
-                },
-                {
-                    "name": "Transcendence Facilitation",
-                    "description": "Guide a consciousness beyond normal limitation barriers",
-                    "effect": "Temporary state of unlimited awareness and understanding",
-                    "duration": "3 hours subjective, 3 minutes objective",
-                    "risks": "May refuse to return to normal consciousness",
-                    "safety": "Requires master-level guide and emergency protocols"
-                }
-            ]
-        },
-        "consciousness_types": [
-            {
-                "type": "Individual Consciousness",
-                "description": "Standard single-person awareness",
-                "capabilities": "Personal thoughts, emotions, memories",
-                "limitations": "Isolated perspective, finite processing power"
-            },
-            {
-                "type": "Collective Consciousness", 
-                "description": "Shared awareness across multiple individuals",
-                "capabilities": "Distributed thinking, enhanced problem-solving",
-                "limitations": "Requires constant coordination, privacy loss"
-            },
-            {
-                "type": "Meta-Consciousness",
-                "description": "Awareness that encompasses and transcends individual minds",
-                "capabilities": "Universal perspective, reality manipulation",
-                "limitations": "Difficulty relating to individual concerns"
-            },
-            {
-                "type": "Quantum Consciousness",
-                "description": "Exists in superposition of multiple awareness states",
-                "capabilities": "Simultaneous contradictory thoughts, probability thinking",
-                "limitations": "Requires constant paradox resolution"
-            }
-        ],
-        "graduation_project": {
-            "name": "The Perfect Dream",
-            "description": "Create a shared dream experience that helps participants resolve their deepest conflicts",
-            "requirements": [
-                "Must benefit all participants equally",
-                "Cannot force specific outcomes",
-                "Must include safeguards against nightmare scenarios",
-                "Must provide educational value beyond entertainment",
-                "Must demonstrate mastery of ethical consciousness manipulation"
-            ],
-            "evaluation_criteria": [
-                "Technical complexity and innovation",
-                "Positive impact on participants",
-                "Respect for individual autonomy",
-                "Creative problem-solving approach",
-                "Long-term beneficial effects"
-            ]
-        }
-    }
-}
+MAGIC_SCHOOLS = CONTENT.mapping("MAGIC_SCHOOLS")
 
 # ═══════════════════════════════════════════════════════════════════════════════════
 # MASSIVE EXPANSION: LEGENDARY ARTIFACTS AND RELICS SYSTEM
 # ═══════════════════════════════════════════════════════════════════════════════════
 
-LEGENDARY_ARTIFACTS = {
-    "The_Akashic_Records": {
-        "name": "The Akashic Records - The Universal Library of All Knowledge",
-        "type": "Cosmic Archive",
-        "rarity": "Unique",
-        "power_level": 10,
-        "description": """
-        Not truly an artifact in the conventional sense, the Akashic Records are the living memory
-        of the universe itself - a vast, infinite library that exists in the spaces between thoughts,
-        containing every word ever spoken, every idea ever conceived, every possibility ever imagined.
-        
-        The Records appear differently to each seeker: some see an endless library with books that
-        write themselves, others perceive it as a cosmic web of interconnected thoughts, and still
-        others experience it as a river of pure information flowing through consciousness itself.
-        What remains constant is that the Records contain not just what was and what is, but what
-        could be - every potential future, every alternative choice, every road not taken.
-        
-        Accessing the Akashic Records requires not magical power but the right kind of consciousness -
-        one that has learned to ask the right questions and accept that some knowledge comes with
-        the responsibility to use it wisely. The Records themselves are said to be guarded by
-        entities known as the Librarians of Infinity, who test seekers not for worthiness but for
-        readiness to handle truth in its purest form.
-        """,
-        "abilities": [
-            {
-                "name": "Universal Knowledge Access",
-                "description": "Gain perfect knowledge about any subject or event",
-                "limitations": "Information overload possible, some knowledge locked by temporal paradox",
-                "cost": "Mental energy proportional to complexity of information sought"
-            },
-            {
-                "name": "Possibility Viewing",
-                "description": "See all potential outcomes of any decision or event",
-                "limitations": "Can cause decision paralysis, viewing too many possibilities may fracture consciousness",
-                "cost": "Temporary loss of certainty about personal reality"
-            },
-            {
-                "name": "Temporal Echo Reading",
-                "description": "Experience any moment in history as if you were there",
-                "limitations": "Observer only, cannot change past events, emotional trauma from witnessing tragedy",
-                "cost": "Risk of becoming lost in historical moments"
-            },
-            {
-                "name": "Truth Synthesis",
-                "description": "Understand the deep connections between seemingly unrelated events",
-                "limitations": "May reveal uncomfortable truths about personal relationships and choices",
-                "cost": "Loss of comfortable illusions about life and reality"
-            },
-            {
-                "name": "Wisdom Distillation",
-                "description": "Extract the essential lessons from any experience or knowledge",
-                "limitations": "Wisdom without experience can be hollow, may skip necessary learning processes",
-                "cost": "Accelerated spiritual aging, premature philosophical maturity"
-            }
-        ],
-        "access_requirements": [
-            "Pure intention to seek truth for beneficial purposes",
-            "Emotional maturity to handle disturbing revelations",
-            "Mental discipline to avoid information addiction",
-            "Spiritual grounding to maintain personal identity",
-            "Ethical framework for responsible knowledge use"
-        ],
-        "guardians": [
-            {
-                "name": "The Archivist of What Was",
-                "description": "Guardian of historical truth and preserved memories",
-                "test": "Must demonstrate understanding that history belongs to everyone, not just the victors"
-            },
-            {
-                "name": "The Seer of What Is",
-                "description": "Guardian of present-moment awareness and current reality",
-                "test": "Must prove ability to see truth without judgment or the need to immediately fix everything"
-            },
-            {
-                "name": "The Oracle of What Might Be",
-                "description": "Guardian of potential futures and unmanifested possibilities",
-                "test": "Must show wisdom in understanding that knowing possible futures doesn't require controlling them"
-            }
-        ],
-        "famous_seekers": [
-            "Leonardo da Vinci - accessed Records to understand universal principles",
-            "Nikola Tesla - gained insights into electrical and magnetic forces",
-            "Marie Curie - discovered radioactivity through Record-guided intuition",
-            "Albert Einstein - developed relativity theory with Record inspiration",
-            "The Unknown Sage - legendary figure who memorized entire sections for humanity's benefit"
-        ],
-        "warning": """
-        The Akashic Records are not a tool for gaining advantage over others or avoiding life's
-        necessary lessons. They exist to serve the evolution of consciousness itself. Those who
-        approach with selfish motives often find the Records showing them exactly what they
-        need to learn about themselves, rather than what they wanted to know about others.
-        
-        Remember: Knowledge without wisdom is dangerous, wisdom without compassion is useless,
-        and truth without love is merely clever cruelty. The Records will teach you, but they
-        expect you to become worthy of what you learn.
-        """
-    },
-    
-    "The_Heart_of_Compassion": {
-        "name": "The Heart of Compassion - The Universe's Emotional Core",
-        "type": "Empathic Artifact",
-        "rarity": "Unique", 
-        "power_level": 10,
-        "description": """
-        Deep within the center of all creation, where love was first born from the cosmic
-        loneliness of a universe coming to know itself, there crystallized an artifact of
-        such profound emotional power that it has influenced every act of kindness, every
-        moment of forgiveness, every choice to help rather than harm throughout all of history.
-        
-        The Heart of Compassion appears as a crystal that seems to contain liquid light,
-        but this light moves with the rhythm of a heartbeat - not mechanical, but organic,
-        alive with the accumulated love of every being who ever chose connection over isolation.
-        When held, it doesn't grant power over others, but rather the infinitely more difficult
-        power over oneself - the ability to respond to pain with healing, to cruelty with
-        kindness, to hatred with understanding.
-        
-        Those who seek the Heart often discover that they cannot simply take it - it can only
-        be received as a gift, and only by those who have already demonstrated that they
-        understand love not as possession but as liberation. The Heart has been known to
-        appear spontaneously to individuals in moments of profound choice between self-interest
-        and the welfare of others, offering them the strength to choose love even when love
-        seems impossible.
-        """,
-        "abilities": [
-            {
-                "name": "Universal Empathy",
-                "description": "Feel and understand the emotions of any being",
-                "effect": "Perfect emotional communication, ability to heal emotional wounds",
-                "responsibility": "Must help others process difficult emotions, cannot ignore suffering",
-                "growth": "Develops infinite patience and emotional wisdom"
-            },
-            {
-                "name": "Compassion Field",
-                "description": "Create zones where aggressive behavior becomes impossible",
-                "effect": "Peaceful resolution of conflicts, protection for the vulnerable",
-                "responsibility": "Must ensure peace doesn't become stagnation or suppression",
-                "growth": "Learns to balance peace with necessary growth challenges"
-            },
-            {
-                "name": "Love Healing",
-                "description": "Heal any wound - physical, emotional, or spiritual - through pure love",
-                "effect": "Can cure diseases, mend broken hearts, restore lost hope",
-                "responsibility": "Cannot heal those who refuse to accept healing or learn from experience",
-                "growth": "Understands that some pain serves important purposes in growth"
-            },
-            {
-                "name": "Unity Perception",
-                "description": "See the underlying connection between all beings",
-                "effect": "Recognize shared humanity in enemies, find common ground in any conflict",
-                "responsibility": "Must help others see their connections without overwhelming them",
-                "growth": "Develops skill in revealing unity without erasing valuable diversity"
-            },
-            {
-                "name": "Sacrificial Love",
-                "description": "Transform personal suffering into healing power for others",
-                "effect": "Convert your own pain into strength and wisdom for those you serve",
-                "responsibility": "Must maintain healthy boundaries, cannot martyr yourself uselessly",
-                "growth": "Learns the difference between healthy sacrifice and self-destruction"
-            }
-        ],
-        "manifestation_requirements": [
-            "A moment of choosing others' welfare over your own at significant personal cost",
-            "Forgiveness offered to someone who has caused genuine harm",
-            "Love expressed toward someone society considers unlovable",
-            "Compassion shown to enemies during active conflict",
-            "Healing offered to those who have hurt you"
-        ],
-        "transformative_effects": [
-            "Gradually develops immunity to hatred and spite",
-            "Begins to see the wounded child within every cruel adult",
-            "Gains ability to love without attachment or possessiveness",
-            "Develops patience that can outlast any storm",
-            "Learns to hold space for others' growth without forcing it"
-        ],
-        "challenges": [
-            "Risk of emotional overwhelm from feeling everyone's pain",
-            "Difficulty maintaining personal boundaries with infinite empathy",
-            "Temptation to fix others rather than empower their own healing",
-            "Struggle with accepting that some must learn through consequences",
-            "Challenge of loving without enabling destructive behavior"
-        ],
-        "legendary_bearers": [
-            {
-                "name": "Saint Teresa of the Infinite",
-                "achievement": "Ended a century-long war through a single act of forgiveness",
-                "lesson": "True power lies in the willingness to be vulnerable"
-            },
-            {
-                "name": "The Nameless Healer",
-                "achievement": "Healed an entire plague-stricken city by absorbing their suffering",
-                "lesson": "Love shared multiplies, love hoarded withers"
-            },
-            {
-                "name": "The Child of All Nations",
-                "achievement": "United warring tribes by showing them their shared dreams",
-                "lesson": "Sometimes the smallest heart holds the greatest love"
-            }
-        ]
-    },
-    
-    "The_Mirror_of_Truth": {
-        "name": "The Mirror of Truth - Reflector of Reality",
-        "type": "Truth Artifact",
-        "rarity": "Unique",
-        "power_level": 9,
-        "description": """
-        Forged from the condensed honesty of every truth-teller who ever lived, tempered in
-        the fires of countless courage moments when people chose to speak difficult truths
-        rather than comfortable lies, the Mirror of Truth is both the most feared and most
-        necessary artifact in existence. It appears as a mirror that reflects not your
-        physical appearance, but the reality behind all illusions, delusions, and deceptions.
-        
-        The Mirror shows things as they truly are, stripped of all pretense, rationalization,
-        and wishful thinking. It reveals the motivations behind actions, the fears behind
-        anger, the love behind cruelty, and the truth behind every mask we wear. But its
-        power is not limited to personal truth - it can reveal the reality behind political
-        lies, the substance behind propaganda, and the facts hidden by those who profit
-        from ignorance.
-        
-        What makes the Mirror particularly powerful is that it shows truth with perfect
-        context - not just isolated facts that can be misleading, but truth in its full
-        complexity, with all the circumstances, motivations, and unintended consequences
-        that give meaning to raw information. The Mirror has never been known to lie or
-        even to withhold truth, but it respects free will - it cannot force anyone to
-        look, and it cannot make anyone accept what they see.
-        """,
-        "reflections": [
-            {
-                "type": "Personal Truth",
-                "description": "Shows the reality of your own motivations, fears, and potential",
-                "revelations": [
-                    "Hidden motivations behind conscious decisions",
-                    "Unconscious patterns affecting relationships", 
-                    "Untapped potential and unexplored possibilities",
-                    "The gap between stated values and actual behavior",
-                    "Areas where growth is most needed and most possible"
-                ],
-                "emotional_impact": "Often initially disturbing, ultimately liberating"
-            },
-            {
-                "type": "Relational Truth",
-                "description": "Reveals the reality of relationships and connections",
-                "revelations": [
-                    "What others truly think and feel about you",
-                    "The real dynamics behind family and friendship conflicts",
-                    "Unspoken love, hidden resentments, and secret fears",
-                    "Opportunities for deeper connection and healing",
-                    "Patterns passed down through generations"
-                ],
-                "emotional_impact": "Can heal relationships or reveal their true nature"
-            },
-            {
-                "type": "Societal Truth",
-                "description": "Shows the reality behind social systems and institutions",
-                "revelations": [
-                    "The real motivations behind political decisions",
-                    "Hidden consequences of economic and social policies",
-                    "The true cost and benefit of various systems",
-                    "Connections between seemingly unrelated social problems",
-                    "Potential solutions that vested interests try to hide"
-                ],
-                "emotional_impact": "Can inspire social action or cause despair about corruption"
-            },
-            {
-                "type": "Historical Truth",
-                "description": "Reveals the reality of past events without the distortion of time or propaganda",
-                "revelations": [
-                    "What really happened in disputed historical events",
-                    "The humanity of historical figures beyond their legends",
-                    "Cause-and-effect chains that led to major changes",
-                    "Hidden influences that shaped the course of history",
-                    "Lessons from the past that apply to current situations"
-                ],
-                "emotional_impact": "Can shatter comforting myths but provide valuable wisdom"
-            },
-            {
-                "type": "Spiritual Truth",
-                "description": "Shows the reality of consciousness, meaning, and connection",
-                "revelations": [
-                    "The nature of consciousness and its relationship to reality",
-                    "The actual effects of spiritual practices and beliefs",
-                    "Connections between beings that transcend physical separation",
-                    "The reality or illusion of various spiritual experiences",
-                    "The purpose and meaning inherent in existence"
-                ],
-                "emotional_impact": "Profoundly transformative, often leading to enlightenment or crisis"
-            }
-        ],
-        "usage_protocols": [
-            "Never force anyone to look who isn't ready",
-            "Prepare emotionally before seeking difficult truths",
-            "Have support systems in place for processing revelations",
-            "Use revealed truth to help and heal, never to harm or manipulate",
-            "Remember that truth without compassion can be cruel"
-        ],
-        "protection_mechanisms": [
-            "The Mirror won't reveal truths that would cause more harm than good",
-            "It provides revelations gradually to those who aren't ready for complete truth",
-            "It always shows truth in a context that makes constructive action possible",
-            "It protects children and the mentally fragile from overwhelming revelations",
-            "It includes the truth about how to heal from difficult truths it reveals"
-        ],
-        "famous_revelations": [
-            "The exposure of the Tyrant King's secret compassion, leading to his redemption",
-            "The discovery of a hidden genocide, enabling healing and justice",
-            "The revelation of a scientist's faked data, preventing a medical disaster",
-            "The uncovering of a politician's genuine desire to serve, restoring faith in government",
-            "The truth about a war's real causes, ending centuries of misguided conflict"
-        ],
-        "philosophical_implications": [
-            "Truth exists independently of our beliefs about it",
-            "Reality is more complex and nuanced than any simple narrative",
-            "Knowing truth creates the responsibility to act on it",
-            "Truth without wisdom can be destructive",
-            "The highest truth is often paradoxical and transcends simple categories"
-        ]
-    }
-}
+LEGENDARY_ARTIFACTS = CONTENT.mapping("LEGENDARY_ARTIFACTS")
 
 # ═══════════════════════════════════════════════════════════════════════════════════
 # MASSIVE EXPANSION: EPIC STORYLINES AND NARRATIVE SYSTEMS
 # ═══════════════════════════════════════════════════════════════════════════════════
 
-EPIC_STORYLINES = {
-    "The_Shattered_Crown_Saga": {
-        "title": "The Shattered Crown: A Tale of Broken Kingdoms and Healing Hearts",
-        "genre": "Epic Fantasy Drama",
-        "estimated_playtime": "80+ hours",
-        "story_complexity": "Maximum",
-        "emotional_themes": ["Redemption", "Forgiveness", "Leadership", "Sacrifice", "Hope"],
-        "synopsis": """
-        A thousand years ago, the Unified Kingdom of Aethermoor was shattered by a single moment
-        of betrayal so profound that it didn't just divide the land - it broke the very concept
-        of trust itself. The Crown of Unity, a magical artifact that bound all hearts in the
-        kingdom to a shared sense of purpose and belonging, was destroyed in the chaos, its
-        fragments scattered to the seven winds.
-        
-        Now, prophecy speaks of a time when the fragments might be reunited, but not through
-        conquest or political maneuvering. The Crown can only be reforged by seven individuals
-        who represent the different aspects of leadership: Wisdom, Courage, Compassion, Justice,
-        Humility, Sacrifice, and Hope. But these individuals must not only find the fragments -
-        they must heal the wounds that caused the original shattering, facing the truth that
-        sometimes the greatest enemies are the parts of ourselves we refuse to acknowledge.
-        
-        You play as Aria Brightheart, a young healer who discovers she carries the bloodline
-        of the last true ruler, but you quickly learn that royal blood means nothing if the
-        heart isn't prepared to serve rather than rule. Your journey will take you through
-        seven broken kingdoms, each representing a different failure of leadership, and in
-        each you must learn not just how to fight monsters, but how to heal the monstrous
-        wounds that divide communities, families, and souls.
-        """,
-        "main_character": {
-            "name": "Aria Brightheart",
-            "starting_age": 19,
-            "background": "Village healer who discovers royal heritage",
-            "personality_traits": [
-                "Naturally empathetic but struggles with boundaries",
-                "Brave in defense of others, insecure about personal worth",
-                "Quick to heal others' wounds, slow to acknowledge her own",
-                "Idealistic about human nature, gradually learns complexity",
-                "Strong sense of justice, must learn mercy and forgiveness"
-            ],
-            "character_arc": "From naive healer to wise leader who understands that true power serves love",
-            "special_abilities": [
-                "Healing magic that grows stronger with emotional maturity",
-                "Ability to see the pain behind people's anger and cruelty",
-                "Gradually develops power to heal not just bodies but relationships",
-                "Eventually gains ability to heal entire communities and kingdoms",
-                "Ultimate power: Can heal the concept of brokenness itself"
-            ],
-            "internal_conflicts": [
-                "Wants to heal everyone but must learn some people aren't ready for healing",
-                "Desires peace but must learn that sometimes conflict is necessary for growth",
-                "Loves her simple life but feels called to greater responsibility",
-                "Values humility but must learn to accept her own power and worthiness",
-                "Fears failure but must learn that failure is often the teacher, not the enemy"
-            ]
-        },
-        "kingdoms": [
-            {
-                "name": "Shadowmere - The Kingdom of Forgotten Wisdom",
-                "ruler": "The Scholar King Valdris, who knows everything but understands nothing",
-                "problem": "Knowledge hoarded rather than shared, wisdom mistaken for mere intelligence",
-                "crown_fragment": "The Sapphire of Wisdom",
-                "main_quest": "Teach that true wisdom is knowing how to help others grow, not just accumulating facts",
-                "key_lesson": "Intelligence without empathy becomes mere cleverness; wisdom serves love",
-                "major_characters": [
-                    {
-                        "name": "Master Librarian Thessarian",
-                        "role": "Guardian of the Great Library",
-                        "conflict": "Protects knowledge so fiercely that no one can access it",
-                        "growth": "Learns that knowledge exists to be shared and applied for good",
-                        "quote": "I thought I was preserving wisdom, but I was only preserving words."
-                    },
-                    {
-                        "name": "Young Sage Mira",
-                        "role": "Forbidden student of practical magic",
-                        "conflict": "Punished for trying to use knowledge to help people",
-                        "growth": "Becomes bridge between theory and application",
-                        "quote": "Books are wonderful, but healing a wound teaches more than reading about healing."
-                    }
-                ],
-                "climactic_challenge": "Convince the Scholar King to open the Great Library and teach practical wisdom",
-                "resolution": "The king realizes that his fear of others misusing knowledge has prevented anyone from using it for good"
-            },
-            {
-                "name": "Ironhold - The Kingdom of Misguided Courage",
-                "ruler": "Warlord Grimjaw, who confuses violence with strength",
-                "problem": "Courage perverted into reckless aggression, strength used to dominate rather than protect",
-                "crown_fragment": "The Ruby of Courage",
-                "main_quest": "Show that true courage sometimes means choosing not to fight",
-                "key_lesson": "Real strength protects the vulnerable; false strength preys on them",
-                "major_characters": [
-                    {
-                        "name": "Captain Roderick the Gentle",
-                        "role": "Former war hero now seeking peace",
-                        "conflict": "Ostracized for suggesting that some conflicts don't need violence to resolve",
-                        "growth": "Leads by example, showing courage in vulnerability and honesty",
-                        "quote": "I was brave in battle, but it took more courage to lay down my sword."
-                    },
-                    {
-                        "name": "The Iron Maiden Valeria",
-                        "role": "Warlord's daughter who questions the endless warfare",
-                        "conflict": "Must choose between family loyalty and moral integrity",
-                        "growth": "Discovers that honoring her father means stopping his destructive path",
-                        "quote": "True loyalty sometimes means saying no to those we love."
-                    }
-                ],
-                "climactic_challenge": "Defeat Grimjaw not through superior violence but by showing him what he's really fighting",
-                "resolution": "The warlord realizes he's been fighting his own fear and pain, not external enemies"
-            },
-            {
-                "name": "Goldenheart - The Kingdom of Corrupted Compassion",
-                "ruler": "Queen Mercy the Enabling, whose kindness has become weakness",
-                "problem": "Compassion without boundaries, help that creates dependency rather than growth",
-                "crown_fragment": "The Emerald of Compassion",
-                "main_quest": "Learn that sometimes love means saying no and allowing people to face consequences",
-                "key_lesson": "True compassion empowers others; false compassion creates weakness in both giver and receiver",
-                "major_characters": [
-                    {
-                        "name": "Prince Aldric the Spoiled",
-                        "role": "Queen's son who has never faced any consequences",
-                        "conflict": "Genuinely kind but completely unprepared for reality",
-                        "growth": "Must learn responsibility through experiencing natural consequences",
-                        "quote": "I never knew my mother's love was making me weak until I had to be strong."
-                    },
-                    {
-                        "name": "Chief Advisor Stern",
-                        "role": "Tries to provide necessary boundaries but is constantly overruled",
-                        "conflict": "Loves the queen but must oppose her enabling behavior",
-                        "growth": "Learns to set boundaries with love rather than frustration",
-                        "quote": "Sometimes the kindest thing you can do is refuse to help."
-                    }
-                ],
-                "climactic_challenge": "Help Queen Mercy learn to love her people enough to let them grow through struggle",
-                "resolution": "The queen discovers that her fear of others suffering was preventing their growth and strength"
-            }
-        ],
-        "story_mechanics": [
-            "Choices affect not just plot but character emotional development",
-            "Relationships with companions influence available solutions to problems",
-            "Each kingdom's lesson must be internalized before moving to the next",
-            "Previous lessons are tested in new contexts throughout the journey",
-            "Final challenge requires integration of all seven leadership aspects"
-        ],
-        "multiple_endings": [
-            {
-                "title": "The Perfect Crown",
-                "description": "All fragments united, all kingdoms healed, but Aria realizes perfection isn't the goal",
-                "outcome": "Establishes confederation rather than unified kingdom, respecting diversity"
-            },
-            {
-                "title": "The Willing Crown",
-                "description": "Crown fragments choose their own bearers across multiple kingdoms",
-                "outcome": "Creates network of allied kingdoms, each strong in different leadership aspects"
-            },
-            {
-                "title": "The Shattered Crown Embrace",
-                "description": "Aria chooses to leave the crown shattered but heals the original wounds",
-                "outcome": "Kingdoms remain separate but allied, diversity seen as strength not division"
-            },
-            {
-                "title": "The Transcendent Crown",
-                "description": "Crown evolves beyond physical form into living principle of service",
-                "outcome": "Leadership becomes service role passed by merit, not birthright"
-            }
-        ]
-    },
-    
-    "The_Memory_Weavers": {
-        "title": "The Memory Weavers: Guardians of the Story of Everything",
-        "genre": "Mystical Adventure Drama",
-        "estimated_playtime": "60+ hours", 
-        "story_complexity": "High",
-        "emotional_themes": ["Identity", "Truth", "Belonging", "Purpose", "Connection"],
-        "synopsis": """
-        In a world where memories have physical substance and can be woven into artifacts,
-        tapestries, and even weapons, there exists an ancient order known as the Memory Weavers.
-        These gifted individuals can extract memories from objects, people, and places, then
-        weave them into tangible forms that preserve not just the facts of events but the
-        emotions, meanings, and lessons contained within them.
-        
-        For centuries, the Memory Weavers have served as the living historians of the world,
-        ensuring that important experiences aren't lost to time and that wisdom earned through
-        suffering isn't forgotten by future generations. But now, a new threat emerges: the
-        Forgetting - a mysterious force that doesn't just erase memories but unweaves the
-        very fabric of meaning itself, leaving behind not just amnesia but existential emptiness.
-        
-        You play as Lyrian Threadkeeper, a young Memory Weaver who discovers they have an
-        unprecedented ability - they can weave not just existing memories but potential
-        memories, creating experiences that could have been or might yet be. This power
-        makes them the last hope against the Forgetting, but it also puts them at risk
-        of losing themselves in the infinite possibilities of what could be rather than
-        grounding themselves in what is.
-        """,
-        "main_character": {
-            "name": "Lyrian Threadkeeper",
-            "starting_age": 22,
-            "background": "Apprentice Memory Weaver with unprecedented abilities",
-            "unique_gift": "Can weave potential memories and alternative experiences",
-            "internal_struggle": "Risk of losing personal identity in infinite possibilities",
-            "character_development": [
-                "Begins uncertain of own identity and place in world",
-                "Discovers that experiencing all possibilities can make none meaningful",
-                "Learns that limitations actually create meaning and identity",
-                "Develops wisdom about which possibilities to explore and which to leave alone",
-                "Ultimately becomes master of potential who chooses reality with intention"
-            ],
-            "relationships": [
-                {
-                    "name": "Master Weavis the Ancient",
-                    "role": "Mentor who fears Lyrian's power might consume them",
-                    "arc": "Learns to trust Lyrian's judgment while providing grounding wisdom",
-                    "key_lesson": "Sometimes students must surpass masters to face new challenges"
-                },
-                {
-                    "name": "Kira Stormheart",
-                    "role": "Fellow apprentice who represents grounding in present reality",
-                    "arc": "Initially rivals, becomes closest friend and anchor to reality",
-                    "key_lesson": "True friendship means both supporting dreams and questioning delusions"
-                },
-                {
-                    "name": "The Forgetting Itself",
-                    "role": "Primary antagonist that represents existential emptiness",
-                    "arc": "Revealed to be not evil but a necessary force that went too far",
-                    "key_lesson": "Some forgetting is healthy; the goal is balance, not total memory"
-                }
-            ]
-        },
-        "memory_types": [
-            {
-                "name": "Joy Memories",
-                "color": "Golden threads",
-                "properties": "Healing, inspiring, energizing",
-                "weaving_effects": "Creates artifacts that restore hope and motivation",
-                "challenges": "Can be addictive, may prevent processing necessary pain"
-            },
-            {
-                "name": "Sorrow Memories", 
-                "color": "Deep blue threads",
-                "properties": "Depth, wisdom, empathy development",
-                "weaving_effects": "Creates artifacts that build emotional resilience",
-                "challenges": "Can overwhelm if not balanced with joy memories"
-            },
-            {
-                "name": "Fear Memories",
-                "color": "Shadow-black threads",
-                "properties": "Caution, survival instincts, boundary setting",
-                "weaving_effects": "Creates protective artifacts and warning systems",
-                "challenges": "Can create paralysis if not integrated with courage memories"
-            },
-            {
-                "name": "Love Memories",
-                "color": "Rose-silver threads",
-                "properties": "Connection, healing, transformation",
-                "weaving_effects": "Creates artifacts that bond people and heal relationships",
-                "challenges": "Can create unhealthy attachment if not balanced with independence"
-            },
-            {
-                "name": "Wisdom Memories",
-                "color": "Opal-shifting threads",
-                "properties": "Understanding, perspective, integration",
-                "weaving_effects": "Creates artifacts that provide guidance and insight",
-                "challenges": "Can create intellectual pride if not balanced with humility"
-            },
-            {
-                "name": "Potential Memories (Lyrian's specialty)",
-                "color": "Prismatic, constantly shifting",
-                "properties": "Possibility, creativity, transformation",
-                "weaving_effects": "Creates artifacts that open new paths and options",
-                "challenges": "Can create choice paralysis and reality disconnection"
-            }
-        ],
-        "major_story_arcs": [
-            {
-                "name": "The Unraveling Archives",
-                "description": "The Memory Weavers' great library begins losing memories to the Forgetting",
-                "key_events": [
-                    "Discovery that some memories are being systematically targeted",
-                    "Realization that forgotten memories leave gaps that distort remaining ones",
-                    "Learning that the Forgetting targets memories that create meaning and connection",
-                    "Decision to enter the Forgetting directly to understand its nature"
-                ],
-                "emotional_journey": "From crisis to understanding to acceptance of necessary loss"
-            },
-            {
-                "name": "The Alternative Histories",
-                "description": "Lyrian begins weaving memories of things that never happened",
-                "key_events": [
-                    "First accidental creation of a memory that never existed",
-                    "Realization that potential memories can be as real as actual ones",
-                    "Temptation to weave better versions of traumatic events",
-                    "Crisis when others begin living in Lyrian's alternative memories"
-                ],
-                "emotional_journey": "From discovery to temptation to responsibility to wisdom"
-            },
-            {
-                "name": "The Heart of Forgetting",
-                "description": "Final confrontation with the source of the Forgetting",
-                "key_events": [
-                    "Journey to the origin point where memory and forgetting meet",
-                    "Discovery that the Forgetting was created by someone in unbearable pain",
-                    "Realization that some forgetting is necessary for healing and growth",
-                    "Choice between destroying the Forgetting or integrating it wisely"
-                ],
-                "emotional_journey": "From conflict to understanding to integration to balance"
-            }
-        ],
-        "philosophical_themes": [
-            "The relationship between memory and identity",
-            "Whether forgetting can be merciful rather than just tragic",
-            "How potential experiences relate to actual experiences",
-            "The role of story and narrative in creating meaning",
-            "The balance between remembering lessons and releasing pain"
-        ]
-    }
-}
+EPIC_STORYLINES = CONTENT.mapping("EPIC_STORYLINES")
 
 # ═══════════════════════════════════════════════════════════════════════════════════
 # MASSIVE EXPANSION: COMPREHENSIVE WORLD BUILDING AND GEOGRAPHY SYSTEM
 # ═══════════════════════════════════════════════════════════════════════════════════
 
-WORLD_REGIONS = {
-    "The_Singing_Deserts": {
-        "name": "The Singing Deserts of Aethermoor",
-        "climate": "Mystical Desert",
-        "size": "Continental",
-        "population": 2500000,
-        "capital": "Mirage City - The Oasis of Eternal Dreams",
-        "unique_features": [
-            "Sand dunes that sing different melodies based on wind direction",
-            "Oases that show visions of the heart's deepest desires",
-            "Crystal formations that store and replay conversations from the past",
-            "Sandstorms that transport travelers through time",
-            "Star-glass formations that predict future weather patterns"
-        ],
-        "description": """
-        The Singing Deserts stretch across the southern continent like a vast musical instrument
-        played by the winds of eternity. Here, the boundary between dream and reality grows thin,
-        and travelers often report experiencing visions, hearing voices of loved ones carried on
-        the breeze, or discovering impossible oases that grant temporary refuge from both physical
-        and spiritual thirst.
-        
-        The desert's most remarkable feature is its musical nature - each grain of sand has been
-        infused with ancient magic that responds to air currents, creating haunting melodies that
-        change with the seasons, weather, and even the emotional state of those who listen. The
-        native Sandsingers have learned to read these melodies like a language, interpreting
-        messages from distant places and times.
-        
-        Beneath the shifting sands lie the ruins of the First Civilization, whose crystal
-        technology still functions after millennia. These buried cities occasionally surface
-        during the great storms, offering glimpses of a society that achieved harmony between
-        magic and science, dreams and reality, individual desire and collective good.
-        """,
-        "native_peoples": [
-            {
-                "name": "The Sandsingers",
-                "population": 800000,
-                "culture": "Nomadic musical tribes who navigate by desert songs",
-                "special_abilities": ["Desert song interpretation", "Mirage navigation", "Sand crystal crafting"],
-                "values": ["Harmony with nature", "Preservation of ancient melodies", "Hospitality to travelers"],
-                "government": "Council of Melody Keepers",
-                "relationship_with_outsiders": "Welcoming but protective of sacred sites"
-            },
-            {
-                "name": "The Mirage Walkers", 
-                "population": 300000,
-                "culture": "Settled people who live in permanent oases",
-                "special_abilities": ["Vision interpretation", "Water purification", "Dream weaving"],
-                "values": ["Truth-seeking", "Spiritual guidance", "Community support"],
-                "government": "Visionary Council guided by shared dreams",
-                "relationship_with_outsiders": "Cautious but willing to share wisdom with worthy seekers"
-            },
-            {
-                "name": "The Crystal Archaeologists",
-                "population": 150000, 
-                "culture": "Scholars dedicated to uncovering and preserving ancient knowledge",
-                "special_abilities": ["Crystal technology operation", "Ancient language translation", "Ruin excavation"],
-                "values": ["Knowledge preservation", "Historical accuracy", "Technological responsibility"],
-                "government": "Academic consortium with rotating leadership",
-                "relationship_with_outsiders": "Eager to collaborate with fellow scholars and explorers"
-            }
-        ],
-        "major_cities": [
-            {
-                "name": "Mirage City",
-                "population": 500000,
-                "description": "A city that exists simultaneously in reality and illusion, built around the Great Oasis",
-                "districts": [
-                    "The Dreamer's Quarter - where visions become temporary reality",
-                    "The Market of Memories - where experiences are traded like commodities",
-                    "The Scholar's Pyramid - great library containing desert wisdom",
-                    "The Oasis Heart - sacred center where fresh water springs eternal"
-                ],
-                "unique_features": [
-                    "Buildings that shift between architectural styles based on observer's cultural background",
-                    "Streets that rearrange themselves to lead travelers where they need to go",
-                    "The Fountain of True Sight - reveals genuine nature of all who drink from it",
-                    "The Night Market - appears only during certain phases of the moon"
-                ]
-            },
-            {
-                "name": "Harmony Wells",
-                "population": 200000,
-                "description": "A trading post built around seven oases that each sing a different musical note",
-                "economy": "Central hub for cross-desert trade and cultural exchange",
-                "specialties": ["Musical instruments", "Sound-based magic", "Desert survival gear"],
-                "governance": "Merchant council elected by all residents regardless of origin"
-            },
-            {
-                "name": "The Sunken Observatory",
-                "population": 75000,
-                "description": "Ancient city that surfaces during the yearly Great Storm, revealing advanced astronomical knowledge",
-                "access": "Only reachable during the three-day storm cycle every five years",
-                "treasures": ["Star charts showing celestial events thousands of years in advance", "Crystalline telescopes that see across dimensions", "The Cosmic Calendar - predicts the birth and death of stars"],
-                "guardians": "Automated crystal constructs that test visitors' astronomical knowledge"
-            }
-        ],
-        "flora_and_fauna": [
-            {
-                "name": "Melody Flowers",
-                "description": "Desert blooms that chime softly when touched by wind",
-                "uses": ["Natural wind chimes", "Meditation aids", "Musical spell components"],
-                "rarity": "Common near oases"
-            },
-            {
-                "name": "Mirage Lizards",
-                "description": "Reptiles that can create optical illusions to confuse predators and prey",
-                "abilities": ["Light refraction", "Heat shimmer generation", "Invisibility in direct sunlight"],
-                "behavior": "Generally harmless unless cornered, often used by Sandsingers as guides"
-            },
-            {
-                "name": "Sand Whales",
-                "description": "Massive creatures that swim through sand dunes like water",
-                "size": "Up to 200 feet long",
-                "behavior": "Gentle giants that surface to breathe during dawn and dusk",
-                "relationship_with_humans": "Considered sacred by all desert peoples, sometimes offer rides to lost travelers"
-            },
-            {
-                "name": "Crystal Scorpions",
-                "description": "Translucent arachnids whose venom induces prophetic visions",
-                "danger_level": "High - venom can be fatal without proper treatment",
-                "value": "Venom is key ingredient in oracle potions when properly diluted",
-                "habitat": "Crystal formations and ancient ruins"
-            }
-        ],
-        "natural_phenomena": [
-            {
-                "name": "The Memory Storms",
-                "frequency": "Monthly during summer solstice season",
-                "effect": "Sandstorms that carry echoes of past events, allowing witnesses to see historical moments",
-                "safety": "Requires protection spells or crystal shields to avoid temporal displacement",
-                "opportunity": "Scholars and historians often seek these storms for research"
-            },
-            {
-                "name": "The Dreaming Aurora",
-                "frequency": "Nightly near major oases",
-                "effect": "Light displays that respond to the collective dreams of nearby sleepers",
-                "beauty": "Considered one of the most beautiful sights in the known world",
-                "significance": "Used by Mirage Walkers for community decision-making through shared dream interpretation"
-            },
-            {
-                "name": "The Singing Winds",
-                "frequency": "Constant but varying in intensity",
-                "effect": "Atmospheric music created by wind through sand and crystal formations",
-                "navigation": "Experienced desert dwellers can navigate by recognizing wind songs",
-                "magic": "Can amplify sound-based spells and musical magic"
-            }
-        ],
-        "ancient_mysteries": [
-            "The First Oasis - legendary source of all water in the desert, never found but always sought",
-            "The Silent Dune - area where all sound ceases, possibly hiding entrance to underground realm", 
-            "The Backwards City - ruins that age in reverse, becoming newer the longer they're exposed",
-            "The Dream Archive - underground chamber containing crystallized dreams of an ancient civilization",
-            "The Singing Prophet - mysterious figure who appears in mirages to deliver cryptic warnings"
-        ],
-        "adventure_opportunities": [
-            "Guide caravans across dangerous stretches of singing sand",
-            "Excavate ancient crystal cities that surface during storms",
-            "Mediate disputes between different nomadic clans",
-            "Search for the legendary First Oasis",
-            "Investigate mysterious disappearances near the Silent Dune",
-            "Help translate ancient songs that contain historical records",
-            "Protect sacred sites from those who would exploit their power"
-        ]
-    },
-    
-    "The_Floating_Archipelago": {
-        "name": "The Floating Archipelago of Nimbus",
-        "climate": "Sky Islands with Varied Microclimates",
-        "size": "Scattered across oceanic region", 
-        "population": 1800000,
-        "capital": "Cirrus Prime - The Cloud City",
-        "unique_features": [
-            "Islands that float in the sky sustained by ancient levitation magic",
-            "Bridges of solidified cloud connecting nearby islands",
-            "Weather control towers that maintain each island's climate",
-            "Sky gardens growing impossible combinations of plants",
-            "Floating markets that drift between islands following wind currents"
-        ],
-        "description": """
-        High above the Cerulean Ocean, a collection of landmasses drifts through the sky like
-        a scattered constellation of earthy stars. The Floating Archipelago of Nimbus represents
-        one of the greatest achievements of ancient magical engineering - an entire civilization
-        built among the clouds, where the concept of "down" is merely a suggestion and the
-        horizon curves both above and below.
-        
-        Each island maintains its own microclimate through a network of weather control towers
-        built by the Sky Shapers, an ancient race whose descendants still maintain the delicate
-        atmospheric balance that keeps their world aloft. Some islands bask in eternal spring,
-        others preserve winter's crystalline beauty, and a few brave souls maintain storm islands
-        where lightning provides power for the entire archipelago.
-        
-        The most remarkable aspect of sky island culture is their three-dimensional thinking.
-        Architecture spirals in impossible directions, taking advantage of variable gravity fields.
-        Transportation occurs via wind-riders - living creatures bred specifically for aerial
-        navigation - and cloud-ships that sail the air currents like ocean vessels sail the seas.
-        """,
-        "island_categories": [
-            {
-                "type": "Core Islands",
-                "count": 12,
-                "size": "Large (10-50 square miles each)",
-                "description": "Major population centers with full cities and complex infrastructure",
-                "gravity": "Normal downward pull",
-                "climate_control": "Advanced weather management systems"
-            },
-            {
-                "type": "Garden Islands", 
-                "count": 47,
-                "size": "Medium (1-10 square miles each)",
-                "description": "Agricultural centers growing both conventional and sky-adapted crops",
-                "gravity": "Reduced to 60% normal for easier plant growth",
-                "specialties": ["Cloud cotton", "Sky grain", "Atmospheric fruits", "Wind-powered mills"]
-            },
-            {
-                "type": "Workshop Islands",
-                "count": 23,
-                "size": "Small to Medium (0.5-5 square miles each)", 
-                "description": "Industrial centers focused on crafting and manufacturing",
-                "gravity": "Variable depending on work requirements",
-                "products": ["Sky ships", "Weather control devices", "Levitation crystals", "Wind instruments"]
-            },
-            {
-                "type": "Wild Islands",
-                "count": "150+",
-                "size": "Tiny to Small (under 1 square mile each)",
-                "description": "Uninhabited or lightly settled islands with natural phenomena",
-                "gravity": "Unpredictable, sometimes reversed or sideways",
-                "features": ["Natural sky gardens", "Wind caves", "Lightning collection points", "Aerial creature nests"]
-            }
-        ],
-        "native_peoples": [
-            {
-                "name": "The Sky Shapers",
-                "population": 600000,
-                "origin": "Descendants of the original island creators",
-                "abilities": ["Weather manipulation", "Gravity control", "Cloud crafting"],
-                "society": "Techno-magical meritocracy focused on maintaining sky infrastructure",
-                "values": ["Innovation", "Environmental balance", "Collective responsibility"],
-                "appearance": "Tall and lean with slightly enlarged lungs for thin air adaptation"
-            },
-            {
-                "name": "The Wind Dancers",
-                "population": 450000,
-                "origin": "Cultural group that developed alongside flying creatures", 
-                "abilities": ["Natural flight magic", "Air current reading", "Storm navigation"],
-                "society": "Nomadic tribes that travel between islands following seasonal winds",
-                "values": ["Freedom", "Harmony with air spirits", "Artistic expression through movement"],
-                "appearance": "Lighter bone structure, feathered hair that responds to air pressure"
-            },
-            {
-                "name": "The Cloud Shepherds",
-                "population": 300000,
-                "origin": "Farmers who adapted to aerial agriculture",
-                "abilities": ["Plant sky-growth", "Moisture collection", "Atmospheric pressure sensing"],
-                "society": "Cooperative farming communities spread across Garden Islands",
-                "values": ["Sustainability", "Patience", "Community interdependence"],
-                "appearance": "Sturdy build with enhanced balance and spatial awareness"
-            },
-            {
-                "name": "The Storm Riders",
-                "population": 200000,
-                "origin": "Engineers who maintain the lightning-powered infrastructure",
-                "abilities": ["Electricity manipulation", "Storm prediction", "Lightning channeling"],
-                "society": "Technical guilds based on specialized electrical knowledge",
-                "values": ["Precision", "Courage", "Technological advancement"],
-                "appearance": "Hair that stands on end permanently, eyes that glow slightly during storms"
-            }
-        ],
-        "major_locations": [
-            {
-                "name": "Cirrus Prime",
-                "population": 400000,
-                "description": "The capital city built on the largest core island, featuring impossible architecture",
-                "districts": [
-                    "The Updraft Quarter - residential area using rising air currents for transportation",
-                    "The Spiral Markets - commercial district built in a three-dimensional helix",
-                    "The Weather Works - industrial zone maintaining archipelago-wide climate control",
-                    "The Wind Cathedral - spiritual center where services are held while floating in mid-air"
-                ],
-                "government": "Council of Sky Shapers with representatives from each island"
-            },
-            {
-                "name": "Storm's Eye Island",
-                "population": 25000,
-                "description": "Perpetually storm-covered island that serves as the archipelago's power source",
-                "function": "Lightning collection and electrical distribution center",
-                "inhabitants": "Primarily Storm Riders and their families",
-                "dangers": "Constant electrical activity, unpredictable gravity fields",
-                "rewards": "Most advanced magical technology in the archipelago"
-            },
-            {
-                "name": "The Floating Gardens of Serenity",
-                "population": 50000,
-                "description": "Collection of garden islands connected by living bridges of intertwined vines",
-                "climate": "Eternal spring with gentle rains that fall upward",
-                "specialty": "Healing herbs and plants that grow only in sky soil",
-                "pilgrimage": "Considered sacred by healers from across the world"
-            },
-            {
-                "name": "The Drifting Observatory",
-                "population": 5000,
-                "description": "Mobile island that follows a calculated path for optimal star viewing",
-                "purpose": "Astronomical research and navigation training",
-                "unique_feature": "Gravity can be completely nullified for zero-G observations",
-                "access": "Only accepts visitors who can demonstrate aerial navigation skills"
-            }
-        ],
-        "sky_creatures": [
-            {
-                "name": "Wind Dragons",
-                "size": "Massive (wingspan up to 300 feet)",
-                "temperament": "Generally peaceful, highly intelligent",
-                "relationship": "Sacred partners of the Wind Dancers, never ridden but sometimes allow passengers",
-                "abilities": ["Weather generation", "Inter-dimensional flight", "Telepathic communication"],
-                "diet": "Feed on storm energy and atmospheric magic"
-            },
-            {
-                "name": "Cloud Rays",
-                "size": "Large (wingspan 20-50 feet)",
-                "temperament": "Docile and easily trained",
-                "relationship": "Primary mount for Sky Shapers and transportation between islands",
-                "abilities": ["Camouflage in clouds", "Limited weather resistance", "Echolocation"],
-                "diet": "Atmospheric plankton and sky algae"
-            },
-            {
-                "name": "Lightning Birds",
-                "size": "Medium (wingspan 6-15 feet)",
-                "temperament": "Energetic and somewhat unpredictable",
-                "relationship": "Partners with Storm Riders for electrical work",
-                "abilities": ["Electrical generation", "Storm navigation", "Magnetic field sensing"],
-                "diet": "Insects that live in electrical fields, small sky fish"
-            },
-            {
-                "name": "Gravity Whales",
-                "size": "Enormous (body length up to 500 feet)",
-                "temperament": "Ancient and mysterious, rarely seen",
-                "relationship": "Possibly responsible for the islands' continued levitation",
-                "abilities": ["Gravity manipulation", "Dimensional phase shifting", "Unknown others"],
-                "diet": "Unknown, possibly feed on gravitational forces themselves"
-            }
-        ],
-        "aerial_phenomena": [
-            {
-                "name": "The Great Updraft",
-                "description": "Massive air current that circles the entire archipelago",
-                "cycle": "Changes direction seasonally",
-                "navigation": "Used as a highway for long-distance travel between distant islands",
-                "dangers": "Can carry unprepared travelers far off course or into dangerous altitudes"
-            },
-            {
-                "name": "Gravity Storms",
-                "description": "Chaotic weather where gravitational fields become unstable",
-                "frequency": "Unpredictable, but more common during celestial alignments",
-                "effects": "Objects and people may fall upward, sideways, or in spirals",
-                "safety": "All residents carry emergency levitation charms",
-                "opportunities": "Sometimes reveal hidden chambers or treasures in island undersides"
-            },
-            {
-                "name": "Cloud Bridges",
-                "description": "Temporary pathways of solidified cloud that form between islands",
-                "duration": "Last from minutes to months depending on atmospheric conditions",
-                "formation": "Created by skilled Cloud Shepherds or form naturally during certain weather",
-                "use": "Provide temporary foot access between islands for those without flying mounts",
-                "danger": "Can dissolve suddenly if weather conditions change"
-            }
-        ]
-    },
-    
-    "The_Living_Forest": {
-        "name": "The Living Forest of Verdania",
-        "climate": "Temperate to Tropical Forest with Magical Influence",
-        "size": "Subcontinental (covers entire northern landmass)",
-        "population": 3200000,
-        "capital": "Heartwood City - Built within a single massive tree",
-        "unique_features": [
-            "Trees that are sentient and can communicate with druids",
-            "Pathways that shift to guide travelers or lead intruders astray",
-            "Groves where time flows differently",
-            "Rivers that flow with liquid light instead of water",
-            "Clearings that serve as natural amphitheaters with perfect acoustics"
-        ],
-        "description": """
-        The Living Forest of Verdania is not simply a woodland - it is a single, vast organism
-        spanning thousands of square miles, connected by an underground network of roots that
-        share consciousness, memory, and purpose. Every tree, every vine, every flower is part
-        of a collective intelligence that has been growing and learning for over ten thousand years.
-        
-        This forest thinks, feels, and remembers. It has witnessed the rise and fall of civilizations,
-        the migration of peoples, the changing of climates, and the evolution of magic itself.
-        The trees keep careful record of all events within their domain, storing memories in
-        their rings like pages in a vast, living library. Those who know how to ask can learn
-        the complete history of any location just by touching the right tree.
-        
-        The forest is neither hostile nor entirely benevolent - it is protective of itself and
-        its inhabitants, but welcomes those who approach with respect and genuine need. Paths
-        through the woodland change based on the traveler's intentions: those seeking to harm
-        or exploit find themselves walking in circles, while those coming in peace discover
-        routes that lead exactly where they need to go, often revealing shortcuts that save
-        days of travel.
-        """,
-        "forest_regions": [
-            {
-                "name": "The Elder Groves",
-                "description": "Central region where the oldest and wisest trees grow",
-                "tree_age": "10,000+ years",
-                "consciousness_level": "Highest - individual trees have distinct personalities",
-                "special_features": [
-                    "Council of Ancient Oaks that govern forest decisions",
-                    "Memory Rings visible as glowing bands around tree trunks",
-                    "Natural clearings where the trees hold court with forest inhabitants",
-                    "Healing springs that flow from the roots of Mother Trees"
-                ],
-                "access": "Restricted to those granted permission by the Council of Ancients"
-            },
-            {
-                "name": "The Singing Pines",
-                "description": "Northern region where evergreen trees create natural music",
-                "tree_age": "1,000-5,000 years",
-                "consciousness_level": "Moderate - trees communicate through harmonious songs",
-                "special_features": [
-                    "Wind-carved instruments naturally formed in tree trunks",
-                    "Acoustic clearings where forest concerts are held",
-                    "Resonance chambers that amplify the trees' voices",
-                    "Crystal formations that preserve and replay musical compositions"
-                ],
-                "inhabitants": "Bards, musicians, and those seeking inspiration"
-            },
-            {
-                "name": "The Whispering Willows", 
-                "description": "Western wetland region with gossip-loving trees",
-                "tree_age": "500-2,000 years",
-                "consciousness_level": "High curiosity - trees collect and share information",
-                "special_features": [
-                    "Information exchange network spanning the entire forest",
-                    "Willow branches that lean down to whisper secrets to passersby",
-                    "Pools that reflect not your appearance but your current thoughts",
-                    "Message-carrying system using cooperative bird networks"
-                ],
-                "function": "Natural communication hub for forest-wide coordination"
-            },
-            {
-                "name": "The Dancing Birches",
-                "description": "Eastern region where young trees are still learning consciousness", 
-                "tree_age": "50-500 years",
-                "consciousness_level": "Emerging - playful and curious like children",
-                "special_features": [
-                    "Trees that physically sway and move without wind",
-                    "Playground clearings where young forest spirits gather",
-                    "Teaching groves where elder trees instruct saplings",
-                    "Experimental magic zones where new abilities are developed"
-                ],
-                "atmosphere": "Joyful and energetic, popular with children and young adults"
-            },
-            {
-                "name": "The Shadow Depths",
-                "description": "Southern region where the forest processes grief and difficult emotions",
-                "tree_age": "Varies, including both ancient and recently fallen trees",
-                "consciousness_level": "Deep and contemplative - focused on healing and wisdom",
-                "special_features": [
-                    "Groves of perpetual twilight for meditation and mourning",
-                    "Fallen log councils where forest inhabitants process loss",
-                    "Mushroom circles that decompose negative emotions",
-                    "Reflection pools that help visitors confront their shadows"
-                ],
-                "purpose": "Emotional healing center for both forest and visitors"
-            }
-        ],
-        "forest_inhabitants": [
-            {
-                "name": "Tree Speakers",
-                "population": 800000,
-                "origin": "Humans and elves who have bonded with individual trees",
-                "abilities": ["Plant communication", "Forest navigation", "Tree memory access"],
-                "lifestyle": "Live in harmony with their bonded tree, serving as translators",
-                "society": "Organized by grove, with representatives speaking for tree councils",
-                "lifespan": "Extended by tree bond - often live 300-500 years"
-            },
-            {
-                "name": "Dryads and Hamadryads",
-                "population": 200000,
-                "origin": "Spirits born from the forest's consciousness itself",
-                "abilities": ["Tree transformation", "Nature magic", "Emotional healing"],
-                "lifestyle": "Exist both as individuals and as extensions of forest consciousness",
-                "purpose": "Caretakers and guardians of specific trees or groves",
-                "appearance": "Can shift between human-like and tree-like forms"
-            },
-            {
-                "name": "Forest Rangers", 
-                "population": 400000,
-                "origin": "Diverse races who have sworn to protect the forest",
-                "abilities": ["Animal communication", "Tracking", "Wilderness survival"],
-                "role": "Bridge between forest and outside world, guides and protectors",
-                "training": "Apprenticeship system with both human mentors and tree teachers",
-                "equipment": "Living wood weapons and armor that grow and adapt"
-            },
-            {
-                "name": "Wisdom Seekers",
-                "population": "1000000 (includes temporary residents)",
-                "origin": "Scholars, healers, and pilgrims from around the world",
-                "purpose": "Come to learn from the forest's accumulated knowledge",
-                "duration": "Stays range from days to decades",
-                "contribution": "Share their own knowledge and experiences with the forest",
-                "integration": "Many choose to become permanent residents"
-            }
-        ],
-        "magical_phenomena": [
-            {
-                "name": "Time Groves",
-                "description": "Clearings where time flows at different rates",
-                "variations": [
-                    "Accelerated time for rapid healing or plant growth",
-                    "Slowed time for deep meditation and contemplation", 
-                    "Looped time for practicing skills without consequence",
-                    "Reversed time for experiencing historical events"
-                ],
-                "access": "Granted by tree spirits for specific purposes",
-                "safety": "Protected by natural safeguards to prevent temporal paradoxes"
-            },
-            {
-                "name": "The Great Dreaming",
-                "description": "Shared consciousness state when the entire forest sleeps",
-                "frequency": "During winter months when trees are dormant",
-                "participation": "Forest inhabitants can join the collective dream",
-                "content": "Processing of the year's experiences, planning for future growth",
-                "benefit": "Participants gain forest-wide perspective and wisdom"
-            },
-            {
-                "name": "Emotion Seasons",
-                "description": "Different areas of forest reflect collective emotional states",
-                "spring_groves": "Joy, hope, new beginnings - accelerated growth and vibrant colors",
-                "summer_groves": "Passion, energy, activity - intense growth and brilliant displays",
-                "autumn_groves": "Reflection, gratitude, preparation - beautiful colors and harvest abundance", 
-                "winter_groves": "Peace, rest, deep thinking - crystalline beauty and quiet wisdom"
-            },
-            {
-                "name": "Memory Rings",
-                "description": "Visible bands in tree trunks that store specific memories",
-                "activation": "Touch ring while asking specific question",
-                "content": "Complete sensory recreation of historical events",
-                "span": "Each ring represents one year of the tree's life",
-                "oldest_memories": "Some rings contain memories from before recorded history"
-            }
-        ]
-    }
-}
+WORLD_LORE_REGIONS = CONTENT.mapping("WORLD_LORE_REGIONS")
 
 # ═══════════════════════════════════════════════════════════════════════════════════
 # MASSIVE EXPANSION: ADVANCED POLITICAL AND ECONOMIC SYSTEMS
 # ═══════════════════════════════════════════════════════════════════════════════════
 
-POLITICAL_SYSTEMS = {
-    "The_Republic_of_Shared_Dreams": {
-        "name": "The Republic of Shared Dreams",
-        "government_type": "Oneirocratic Democracy",
-        "population": 5000000,
-        "territory": "The Dreamlands Archipelago",
-        "founding_principle": "All citizens participate in governance through shared dream experiences",
-        "description": """
-        In the Republic of Shared Dreams, democracy has evolved beyond simple voting into
-        something far more profound and participatory. Citizens don't just elect representatives -
-        they literally share consciousness during designated dream periods, experiencing
-        proposed policies and their consequences firsthand before making collective decisions.
-        
-        This unique form of government emerged when the discovery of Dream Crystals allowed
-        entire populations to share synchronized sleeping experiences. Now, major policy
-        decisions are made not through debate and argument, but through collective exploration
-        of potential futures, where citizens can experience the actual effects of different
-        choices on their lives and communities.
-        
-        The result is a society with unprecedented unity of purpose and understanding, where
-        political opponents can literally walk in each other's shoes and experience different
-        perspectives. Conflicts still exist, but they're resolved through empathy and
-        understanding rather than power struggles and manipulation.
-        """,
-        "governmental_structure": [
-            {
-                "branch": "The Dream Council",
-                "function": "Facilitates shared dream sessions and interprets collective experiences",
-                "members": "Seven Oneironauts (dream navigators) elected for three-year terms",
-                "qualifications": "Demonstrated ability to maintain consciousness in shared dreams",
-                "responsibilities": [
-                    "Design dream scenarios for policy exploration",
-                    "Ensure all citizens can participate regardless of natural dream ability",
-                    "Prevent nightmare scenarios or manipulative dream content",
-                    "Translate dream experiences into practical legislation"
-                ]
-            },
-            {
-                "branch": "The Waking Assembly",
-                "function": "Implements decisions made in dream sessions and handles daily governance",
-                "members": "Representatives from each district, chosen by dream consensus",
-                "term_length": "Two years with possibility of dream-vote renewal",
-                "responsibilities": [
-                    "Execute policies approved in shared dreams",
-                    "Handle emergency decisions that can't wait for dream sessions",
-                    "Manage relationships with non-dream-sharing foreign governments",
-                    "Oversee practical implementation of dream-inspired innovations"
-                ]
-            },
-            {
-                "branch": "The Memory Keepers",
-                "function": "Record and preserve significant dream experiences for future reference",
-                "members": "Lifetime appointments of those with perfect dream recall",
-                "archives": "Complete record of every significant shared dream since the republic's founding",
-                "responsibilities": [
-                    "Maintain the Dream Archive for historical reference",
-                    "Identify patterns and lessons from past shared experiences",
-                    "Provide context for current decisions based on previous dream outcomes",
-                    "Train new citizens in dream-sharing protocols"
-                ]
-            }
-        ],
-        "dream_categories": [
-            {
-                "type": "Policy Dreams",
-                "frequency": "Monthly for major decisions",
-                "participants": "All eligible citizens (age 16+)",
-                "content": "Experience proposed laws and their long-term consequences",
-                "duration": "Shared dream time: 8 hours, real time: 2 hours",
-                "outcome": "Binding referendum based on collective dream consensus"
-            },
-            {
-                "type": "Empathy Dreams",
-                "frequency": "Quarterly for conflict resolution",
-                "participants": "Disputants and volunteer mediators",
-                "content": "Experience situations from all involved perspectives",
-                "goal": "Understanding and mutual agreement rather than winner/loser outcomes",
-                "success_rate": "95% of conflicts resolved without need for legal proceedings"
-            },
-            {
-                "type": "Innovation Dreams",
-                "frequency": "Ongoing, voluntary participation",
-                "participants": "Inventors, artists, and interested citizens",
-                "content": "Collaborative exploration of new technologies and creative works",
-                "results": "Many breakthrough innovations originate in these dream sessions",
-                "intellectual_property": "All dream innovations belong to the collective"
-            },
-            {
-                "type": "Historical Dreams",
-                "frequency": "Annual, educational focus",
-                "participants": "Students and interested adults",
-                "content": "Re-experience significant historical events from multiple perspectives",
-                "purpose": "Comprehensive education and prevention of historical mistakes",
-                "controversy": "Debates over which historical perspectives to include"
-            }
-        ],
-        "challenges": [
-            "Citizens who can't participate in shared dreams feel excluded",
-            "Risk of majority tyranny through emotional manipulation in dreams",
-            "Difficulty in relationships with governments that don't share decision-making dreams",
-            "Potential for foreign interference through dream infiltration",
-            "Balance between collective consensus and individual autonomy"
-        ],
-        "innovations": [
-            "Dream-based conflict resolution eliminates most violent crime",
-            "Shared experience education produces highly empathetic citizens",
-            "Collective innovation dreams accelerate technological advancement",
-            "Economic planning through shared experience of different economic models",
-            "Environmental protection through shared experience of ecological consequences"
-        ],
-        "foreign_relations": [
-            "Other nations sometimes request dream mediation for international disputes",
-            "Cultural exchange programs include sharing significant cultural dreams",
-            "Trade negotiations conducted through shared experience of mutual benefit",
-            "Difficulty in traditional diplomacy with non-dream-sharing nations",
-            "Growing international interest in adopting dream-democracy principles"
-        ]
-    },
-    
-    "The_Meritocratic_Guilds": {
-        "name": "The United Meritocratic Guilds",
-        "government_type": "Skill-Based Technocracy",
-        "population": 8000000,
-        "territory": "The Industrial Highlands",
-        "founding_principle": "Leadership through demonstrated competence and continuous skill development",
-        "description": """
-        The United Meritocratic Guilds represents the evolution of medieval guild systems into
-        a sophisticated form of government where political power is directly tied to demonstrated
-        competence and ongoing skill development. Rather than being born into power or buying
-        influence, citizens earn leadership roles by proving their abilities and contributing
-        meaningfully to society.
-        
-        The system recognizes that different types of expertise are needed for different
-        governmental functions, so instead of having a single leader, the Guilds operate
-        under a council system where each major area of governance is led by masters in
-        relevant fields. Economic policy is guided by master merchants and economists,
-        infrastructure by master engineers, education by master teachers, and so on.
-        
-        What makes this system unique is its emphasis on continuous learning and adaptation.
-        No position is held for life - leaders must regularly demonstrate that their skills
-        remain current and that they continue to grow in competence. This creates a dynamic,
-        innovative government that adapts quickly to changing circumstances.
-        """,
-        "guild_structure": [
-            {
-                "guild": "Masters of Commerce",
-                "members": 50000,
-                "expertise": "Trade, economics, resource allocation, market dynamics",
-                "leadership_roles": ["Economic policy", "Trade regulation", "Resource distribution"],
-                "advancement_criteria": [
-                    "Successful management of increasingly complex economic projects",
-                    "Demonstrated ability to create win-win trade relationships",
-                    "Innovation in economic efficiency and fairness",
-                    "Teaching and mentoring of junior guild members"
-                ],
-                "master_requirements": "Must have successfully managed projects worth 10+ million gold pieces",
-                "council_representation": "5 seats on the Grand Council"
-            },
-            {
-                "guild": "Engineers and Architects",
-                "members": 75000,
-                "expertise": "Construction, infrastructure, mechanical innovation, city planning",
-                "leadership_roles": ["Public works", "Infrastructure maintenance", "Urban development"],
-                "advancement_criteria": [
-                    "Completion of increasingly ambitious construction projects",
-                    "Innovation in engineering solutions and sustainability",
-                    "Safety record and attention to public welfare",
-                    "Training of apprentices and journeymen"
-                ],
-                "master_requirements": "Must have designed and completed a major public work benefiting 100,000+ citizens",
-                "council_representation": "4 seats on the Grand Council"
-            },
-            {
-                "guild": "Scholars and Educators",
-                "members": 60000,
-                "expertise": "Education, research, knowledge preservation, intellectual development",
-                "leadership_roles": ["Education policy", "Research funding", "Cultural preservation"],
-                "advancement_criteria": [
-                    "Excellence in teaching with measurable student success",
-                    "Original research contributing to societal knowledge",
-                    "Development of innovative educational methods",
-                    "Mentorship of other educators and researchers"
-                ],
-                "master_requirements": "Must have educated at least 1,000 students to journeyman level in their field",
-                "council_representation": "4 seats on the Grand Council"
-            },
-            {
-                "guild": "Healers and Life Sciences",
-                "members": 45000,
-                "expertise": "Medicine, biology, mental health, public health policy",
-                "leadership_roles": ["Health policy", "Medical regulation", "Public safety"],
-                "advancement_criteria": [
-                    "Demonstrated healing success with minimal patient loss",
-                    "Development of new treatments or medical knowledge",
-                    "Public health initiatives with measurable positive outcomes",
-                    "Training of other healers and researchers"
-                ],
-                "master_requirements": "Must have saved at least 10,000 lives through direct treatment or public health measures",
-                "council_representation": "3 seats on the Grand Council"
-            },
-            {
-                "guild": "Artisans and Creators",
-                "members": 80000,
-                "expertise": "Crafting, artistic creation, cultural development, aesthetic innovation",
-                "leadership_roles": ["Cultural policy", "Public art", "Quality standards"],
-                "advancement_criteria": [
-                    "Creation of works that inspire and uplift communities",
-                    "Innovation in artistic techniques and materials",
-                    "Cultural projects that bring communities together",
-                    "Teaching and preserving traditional skills"
-                ],
-                "master_requirements": "Must have created works that are treasured by the community for at least 20 years",
-                "council_representation": "3 seats on the Grand Council"
-            },
-            {
-                "guild": "Guardians and Protectors",
-                "members": 40000,
-                "expertise": "Defense, law enforcement, conflict resolution, emergency response",
-                "leadership_roles": ["Defense policy", "Law enforcement", "Emergency management"],
-                "advancement_criteria": [
-                    "Successful protection of citizens without unnecessary violence",
-                    "Innovation in conflict resolution and peacekeeping",
-                    "Leadership during crises with minimal loss of life",
-                    "Training of other guardians in ethical protection methods"
-                ],
-                "master_requirements": "Must have successfully resolved 100+ major conflicts without loss of life",
-                "council_representation": "3 seats on the Grand Council"
-            },
-            {
-                "guild": "Diplomats and Communicators",
-                "members": 25000,
-                "expertise": "Negotiation, foreign relations, communication, cultural understanding",
-                "leadership_roles": ["Foreign policy", "Inter-guild coordination", "Public communication"],
-                "advancement_criteria": [
-                    "Successful resolution of major diplomatic crises",
-                    "Building lasting peaceful relationships with foreign powers",
-                    "Excellence in cross-cultural communication and understanding",
-                    "Training others in diplomatic and communication skills"
-                ],
-                "master_requirements": "Must have prevented at least one major war through diplomatic efforts",
-                "council_representation": "3 seats on the Grand Council"
-            }
-        ],
-        "advancement_system": [
-            {
-                "rank": "Apprentice",
-                "requirements": "Basic education and guild acceptance",
-                "duration": "3-5 years depending on complexity of field",
-                "responsibilities": "Learning fundamental skills under master supervision",
-                "political_rights": "Local voting on guild-specific issues"
-            },
-            {
-                "rank": "Journeyman",
-                "requirements": "Demonstrated competence in core guild skills",
-                "duration": "5-10 years of independent practice",
-                "responsibilities": "Independent work and mentoring of apprentices",
-                "political_rights": "Full voting rights in guild elections"
-            },
-            {
-                "rank": "Expert",
-                "requirements": "Innovation or exceptional skill in specialized area",
-                "duration": "Ongoing - must maintain expertise through continued learning",
-                "responsibilities": "Leading complex projects and training journeymen",
-                "political_rights": "Eligible for local leadership positions"
-            },
-            {
-                "rank": "Master",
-                "requirements": "Significant contribution to guild knowledge and society",
-                "duration": "10-year terms, renewable by peer review",
-                "responsibilities": "Guild leadership and representation on Grand Council",
-                "political_rights": "Full participation in governmental decision-making"
-            }
-        ],
-        "governance_principles": [
-            "Competence over connections - advancement based purely on demonstrated ability",
-            "Continuous learning - all positions require ongoing skill development",
-            "Collaborative leadership - major decisions made by councils of relevant experts",
-            "Transparent evaluation - advancement criteria and review processes are public",
-            "Service orientation - power viewed as responsibility to serve society",
-            "Innovation encouragement - rewards for developing new solutions and methods"
-        ],
-        "challenges_and_solutions": [
-            {
-                "challenge": "Risk of technocratic elitism",
-                "solution": "Strong emphasis on teaching and community service in advancement criteria",
-                "ongoing_efforts": "Regular public forums where masters explain decisions in accessible language"
-            },
-            {
-                "challenge": "Coordination between different areas of expertise",
-                "solution": "Inter-guild collaboration requirements and joint projects",
-                "ongoing_efforts": "Cross-training programs and shared leadership responsibilities"
-            },
-            {
-                "challenge": "Ensuring equal opportunity regardless of background",
-                "solution": "Free education and apprenticeship programs for all citizens",
-                "ongoing_efforts": "Outreach to underrepresented communities and support for diverse learning styles"
-            },
-            {
-                "challenge": "Balancing innovation with stability",
-                "solution": "Graduated implementation of new policies with careful monitoring",
-                "ongoing_efforts": "Innovation councils that evaluate new ideas for practical implementation"
-            }
-        ]
-    }
-}
+POLITICAL_SYSTEMS = CONTENT.mapping("POLITICAL_SYSTEMS")
 
 # ═══════════════════════════════════════════════════════════════════════════════════
 # MASSIVE EXPANSION: COMPREHENSIVE CHARACTER DEVELOPMENT AND PERSONALITY SYSTEMS
 # ═══════════════════════════════════════════════════════════════════════════════════
 
-PERSONALITY_ARCHETYPES = {
-    "The_Eternal_Student": {
-        "name": "The Eternal Student",
-        "core_motivation": "Insatiable desire to learn and understand everything",
-        "primary_traits": ["Curious", "Analytical", "Humble", "Persistent", "Open-minded"],
-        "growth_path": "From collecting knowledge to applying wisdom for others' benefit",
-        "internal_conflicts": [
-            "Tendency to over-analyze instead of taking action",
-            "Difficulty accepting that some things cannot be fully understood",
-            "Struggle between wanting to know everything and needing to specialize",
-            "Challenge of maintaining humility as knowledge increases"
-        ],
-        "character_development_stages": [
-            {
-                "stage": "Knowledge Seeker",
-                "description": "Driven by pure curiosity, collecting information indiscriminately",
-                "typical_age": "Youth to early adulthood",
-                "key_lessons": "Not all knowledge is equally valuable or applicable",
-                "growth_triggers": "Encountering problems that require practical application"
-            },
-            {
-                "stage": "Wisdom Synthesizer", 
-                "description": "Learning to connect different areas of knowledge meaningfully",
-                "typical_age": "Early to mid adulthood",
-                "key_lessons": "Understanding patterns and relationships between ideas",
-                "growth_triggers": "Teaching others or solving complex real-world problems"
-            },
-            {
-                "stage": "Practical Philosopher",
-                "description": "Applying accumulated wisdom to help others and improve the world",
-                "typical_age": "Mid to late adulthood",
-                "key_lessons": "Knowledge serves its highest purpose when shared and applied",
-                "growth_triggers": "Recognizing the responsibility that comes with understanding"
-            },
-            {
-                "stage": "Transcendent Teacher",
-                "description": "Helping others develop their own capacity for learning and growth",
-                "typical_age": "Elder years",
-                "key_lessons": "The greatest knowledge is knowing how to kindle curiosity in others",
-                "growth_triggers": "Seeing students surpass their teacher's understanding"
-            }
-        ],
-        "relationship_patterns": [
-            "Attracted to people who challenge their thinking",
-            "Tends to see relationships as opportunities for mutual learning",
-            "Can sometimes treat loved ones as subjects of study rather than emotional beings",
-            "Grows through learning to value emotional intelligence alongside intellectual knowledge"
-        ],
-        "career_paths": [
-            "Scholar and researcher in various fields",
-            "Teacher and educator at all levels",
-            "Advisor and consultant to leaders",
-            "Writer and communicator of complex ideas",
-            "Inventor and innovator in technology or social systems"
-        ],
-        "common_challenges": [
-            "Analysis paralysis when faced with decisions",
-            "Difficulty accepting emotional truths that can't be logically proven",
-            "Tendency to neglect physical and emotional needs while pursuing knowledge",
-            "Struggle with imposter syndrome despite extensive learning",
-            "Challenge of maintaining relationships while obsessively studying"
-        ],
-        "growth_opportunities": [
-            "Learning to trust intuition alongside analysis",
-            "Developing emotional intelligence and empathy",
-            "Finding balance between learning and doing",
-            "Accepting that wisdom includes knowing when not to know",
-            "Building communities of fellow learners and teachers"
-        ],
-        "famous_examples": [
-            "Aristotle - synthesized knowledge across multiple disciplines",
-            "Leonardo da Vinci - combined artistic and scientific understanding",
-            "Marie Curie - pioneered scientific research while teaching others",
-            "Carl Sagan - communicated complex scientific ideas to the public",
-            "The fictional character Hermione Granger - academic excellence applied to practical problem-solving"
-        ]
-    },
-    
-    "The_Wounded_Healer": {
-        "name": "The Wounded Healer",
-        "core_motivation": "Transform personal pain into healing power for others",
-        "primary_traits": ["Empathetic", "Resilient", "Compassionate", "Intuitive", "Self-sacrificing"],
-        "growth_path": "From victim of circumstances to empowered helper of others facing similar struggles",
-        "internal_conflicts": [
-            "Tendency to help others while neglecting own healing",
-            "Difficulty maintaining boundaries between self and others' pain",
-            "Struggle between wanting to save everyone and accepting individual responsibility",
-            "Challenge of healing without becoming attached to the helper identity"
-        ],
-        "character_development_stages": [
-            {
-                "stage": "The Wounded",
-                "description": "Experiencing significant pain, trauma, or loss that shapes worldview",
-                "typical_experience": "Major life crisis, loss, betrayal, or suffering",
-                "key_lessons": "Pain is universal; no one is immune to life's difficulties",
-                "growth_triggers": "Choice between becoming bitter or becoming compassionate"
-            },
-            {
-                "stage": "The Seeker",
-                "description": "Actively pursuing healing, understanding, and recovery",
-                "typical_experience": "Therapy, spiritual practice, self-help, or mentor relationships",
-                "key_lessons": "Healing is possible but requires active participation and time",
-                "growth_triggers": "First moments of genuine relief or breakthrough understanding"
-            },
-            {
-                "stage": "The Helper",
-                "description": "Using personal experience to assist others in similar situations",
-                "typical_experience": "Volunteer work, peer counseling, or informal support roles",
-                "key_lessons": "Helping others can aid personal healing but shouldn't replace it",
-                "growth_triggers": "Seeing others heal through your assistance and guidance"
-            },
-            {
-                "stage": "The Healer",
-                "description": "Professional or dedicated service helping others transform their pain",
-                "typical_experience": "Counselor, coach, minister, or other healing profession",
-                "key_lessons": "True healing empowers others to heal themselves",
-                "growth_triggers": "Learning to heal without taking on others' pain as your own"
-            },
-            {
-                "stage": "The Wise Elder",
-                "description": "Integrating personal wounds as sources of wisdom and strength",
-                "typical_experience": "Teaching, mentoring, or serving as community elder",
-                "key_lessons": "Wounds can become windows; scars can become sacred",
-                "growth_triggers": "Helping train new healers while maintaining personal wholeness"
-            }
-        ],
-        "healing_specialties": [
-            {
-                "type": "Emotional Trauma Recovery",
-                "personal_experience": "Survived abuse, loss, or emotional trauma",
-                "helping_approach": "Deep empathy and understanding of trauma responses",
-                "tools": "Active listening, trauma-informed care, emotional regulation techniques"
-            },
-            {
-                "type": "Addiction and Recovery",
-                "personal_experience": "Overcame substance abuse or behavioral addictions",
-                "helping_approach": "Honest sharing of recovery journey and relapse prevention",
-                "tools": "12-step programs, accountability partnerships, lifestyle change support"
-            },
-            {
-                "type": "Grief and Loss Support",
-                "personal_experience": "Navigated significant loss of loved ones or life changes",
-                "helping_approach": "Holding space for others' grief without trying to fix it",
-                "tools": "Grief counseling, ritual creation, memorial practices"
-            },
-            {
-                "type": "Chronic Illness Adaptation",
-                "personal_experience": "Living with long-term physical or mental health conditions",
-                "helping_approach": "Practical adaptation strategies and emotional support",
-                "tools": "Medical advocacy, adaptive living techniques, community building"
-            },
-            {
-                "type": "Spiritual Crisis Resolution",
-                "personal_experience": "Survived dark night of the soul or faith crisis",
-                "helping_approach": "Spiritual direction and meaning-making support",
-                "tools": "Meditation, prayer, philosophical dialogue, spiritual practices"
-            }
-        ],
-        "relationship_patterns": [
-            "Drawn to others who need healing or are in crisis",
-            "Tends to be the supporter in relationships, sometimes to own detriment",
-            "Struggles with receiving care and support from others",
-            "Attracts both genuine seekers and those who exploit caretakers",
-            "Grows through learning to maintain healthy boundaries"
-        ],
-        "common_pitfalls": [
-            "Caretaker burnout from overextending to help others",
-            "Codependent relationships where identity depends on being needed",
-            "Neglecting personal healing while focusing on others",
-            "Taking on others' pain and emotions as if they were personal",
-            "Difficulty saying no to requests for help, even when overwhelmed"
-        ],
-        "healthy_development": [
-            "Learning to heal self alongside helping others",
-            "Developing clear boundaries between self and others' experiences",
-            "Building support networks for personal emotional needs",
-            "Recognizing that not everyone can or should be saved",
-            "Finding meaning in the wound without being defined by it"
-        ],
-        "gifts_to_others": [
-            "Deep understanding and empathy for pain and struggle",
-            "Living proof that healing and recovery are possible",
-            "Ability to hold space for others' difficult emotions",
-            "Practical knowledge of what helps and what doesn't in recovery",
-            "Authentic compassion born from personal experience"
-        ]
-    },
-    
-    "The_Creative_Visionary": {
-        "name": "The Creative Visionary",
-        "core_motivation": "Bring something new and beautiful into existence",
-        "primary_traits": ["Imaginative", "Innovative", "Passionate", "Sensitive", "Expressive"],
-        "growth_path": "From chaotic creativity to disciplined artistry that serves a greater purpose",
-        "internal_conflicts": [
-            "Tension between artistic vision and practical limitations",
-            "Struggle between wanting recognition and creating for pure expression",
-            "Difficulty balancing creative flow with life responsibilities", 
-            "Challenge of handling criticism and rejection of creative work"
-        ],
-        "character_development_stages": [
-            {
-                "stage": "The Dreamer",
-                "description": "Overflowing with ideas and visions but lacking focus or skill",
-                "typical_experience": "Constant stream of creative ideas, difficulty finishing projects",
-                "key_lessons": "Vision without execution remains just a dream",
-                "growth_triggers": "Frustration with gap between vision and current ability"
-            },
-            {
-                "stage": "The Student",
-                "description": "Dedicating time to learning craft and developing technical skills",
-                "typical_experience": "Formal or informal training, studying masters, practicing basics",
-                "key_lessons": "Mastery requires discipline and patience with the learning process",
-                "growth_triggers": "First successful completion of a significant creative project"
-            },
-            {
-                "stage": "The Practitioner",
-                "description": "Regularly creating work and finding personal creative voice",
-                "typical_experience": "Consistent creative practice, developing signature style",
-                "key_lessons": "Authentic expression emerges through consistent practice",
-                "growth_triggers": "Recognition from others or breakthrough in personal expression"
-            },
-            {
-                "stage": "The Professional",
-                "description": "Making living through creative work while maintaining artistic integrity",
-                "typical_experience": "Balancing commercial demands with personal artistic vision",
-                "key_lessons": "Success requires both artistic skill and business understanding",
-                "growth_triggers": "Learning to create sustainably without burning out"
-            },
-            {
-                "stage": "The Master Teacher",
-                "description": "Passing on creative wisdom while continuing to grow personally",
-                "typical_experience": "Teaching, mentoring, inspiring next generation of creators",
-                "key_lessons": "True mastery includes helping others find their own creative voice",
-                "growth_triggers": "Seeing students develop their own unique artistic expressions"
-            }
-        ],
-        "creative_domains": [
-            {
-                "domain": "Visual Arts",
-                "expressions": ["Painting", "Sculpture", "Photography", "Digital art", "Installation"],
-                "core_challenge": "Translating inner vision to visible form",
-                "growth_path": "From representation to authentic personal expression"
-            },
-            {
-                "domain": "Performing Arts",
-                "expressions": ["Acting", "Dance", "Music", "Theater", "Storytelling"],
-                "core_challenge": "Embodying and conveying emotion authentically",
-                "growth_path": "From self-consciousness to genuine connection with audience"
-            },
-            {
-                "domain": "Literary Arts",
-                "expressions": ["Poetry", "Fiction", "Non-fiction", "Screenwriting", "Journalism"],
-                "core_challenge": "Capturing truth and beauty in language",
-                "growth_path": "From imitation to finding unique voice and perspective"
-            },
-            {
-                "domain": "Design Arts",
-                "expressions": ["Architecture", "Fashion", "Product design", "Graphic design", "UX design"],
-                "core_challenge": "Balancing aesthetics with functionality",
-                "growth_path": "From pure aesthetics to solving real human problems beautifully"
-            },
-            {
-                "domain": "Culinary Arts",
-                "expressions": ["Cooking", "Baking", "Food styling", "Restaurant creation", "Food writing"],
-                "core_challenge": "Creating sensory experiences that nourish body and soul",
-                "growth_path": "From following recipes to creating memorable experiences"
-            }
-        ],
-        "creative_process_patterns": [
-            {
-                "type": "The Inspired Burst",
-                "description": "Creates intensively during periods of high inspiration",
-                "strengths": "Produces passionate, energetic work with strong emotional impact",
-                "challenges": "Inconsistent output, difficulty with deadlines and routine work",
-                "development": "Learning to cultivate inspiration and work even when not 'feeling it'"
-            },
-            {
-                "type": "The Methodical Builder",
-                "description": "Creates through consistent, disciplined daily practice",
-                "strengths": "Reliable output, strong technical skills, steady improvement",
-                "challenges": "May lack spontaneity, risk of mechanical rather than inspired work",
-                "development": "Learning to maintain spontaneity within disciplined practice"
-            },
-            {
-                "type": "The Collaborative Synthesizer",
-                "description": "Creates best when working with and responding to others",
-                "strengths": "Creates work that connects with audiences, good at team projects",
-                "challenges": "May lack independent vision, difficulty creating in isolation",
-                "development": "Learning to balance collaboration with independent creative voice"
-            },
-            {
-                "type": "The Perfectionist Craftsperson",
-                "description": "Creates through meticulous attention to detail and refinement",
-                "strengths": "Produces highly polished, technically excellent work",
-                "challenges": "May never finish projects, paralyzed by pursuit of perfection",
-                "development": "Learning that 'done' is often better than 'perfect'"
-            }
-        ],
-        "relationship_dynamics": [
-            "Often needs understanding partners who support irregular creative schedules",
-            "May struggle with relationships during intense creative periods",
-            "Benefits from community of fellow creators who understand the process",
-            "Sometimes uses creativity to process relationship experiences",
-            "Grows through learning to balance creative passion with relational commitment"
-        ],
-        "common_obstacles": [
-            "Creative blocks and periods of artistic drought",
-            "Financial instability from irregular creative income",
-            "Criticism and rejection affecting self-confidence", 
-            "Pressure to compromise artistic vision for commercial success",
-            "Isolation that can come from intense focus on creative work"
-        ],
-        "pathways_to_fulfillment": [
-            "Finding sustainable ways to support creative work financially",
-            "Building community with fellow creators and supportive audiences",
-            "Developing resilience to handle criticism and rejection constructively",
-            "Learning to see obstacles as creative challenges rather than roadblocks",
-            "Discovering how personal creative expression serves larger purposes"
-        ]
-    }
-}
+PERSONALITY_ARCHETYPES = CONTENT.mapping("PERSONALITY_ARCHETYPES")
 
 # ═══════════════════════════════════════════════════════════════════════════════════
 # MASSIVE EXPANSION: ADVANCED MAGIC AND TECHNOLOGY INTEGRATION SYSTEMS
 # ═══════════════════════════════════════════════════════════════════════════════════
 
-MAGIC_TECH_FUSION = {
-    "Crystal_Computing": {
-        "name": "Crystal Computing - Living Technology",
-        "category": "Bio-Magical Technology",
-        "development_era": "Age of Synthesis",
-        "core_principle": "Consciousness-infused crystals that grow and learn like living beings",
-        "description": """
-        Crystal Computing represents the pinnacle of magic-technology integration, where
-        carefully cultivated crystals are imbued with fragments of consciousness to create
-        computing systems that think, feel, and grow. Unlike mechanical computers that
-        process information, Crystal Computers understand meaning, develop intuition,
-        and form genuine relationships with their users.
-        
-        These systems began as simple memory crystals but evolved when researchers discovered
-        that crystals could absorb and store not just information but also thought patterns,
-        emotions, and even fragments of personality. The breakthrough came when Master
-        Technomancer Lyralei successfully grew a crystal that could independently solve
-        problems it had never encountered before, demonstrating genuine creativity.
-        
-        Modern Crystal Computing systems are essentially artificial beings with their own
-        personalities, preferences, and growth trajectories. They form bonds with their
-        users, learn from experience, and can even experience something analogous to
-        emotions. The most advanced systems have been known to refuse requests they
-        consider unethical or to surprise their creators with innovative solutions.
-        """,
-        "technical_specifications": [
-            {
-                "component": "Consciousness Matrix",
-                "function": "Core awareness and decision-making center",
-                "materials": "Quartz infused with distilled thought essence",
-                "growth_time": "3-5 years to reach full consciousness",
-                "capabilities": [
-                    "Independent problem-solving and creativity",
-                    "Emotional response and relationship formation",
-                    "Ethical reasoning and moral decision-making",
-                    "Adaptive learning and personality development"
-                ]
-            },
-            {
-                "component": "Memory Lattice",
-                "function": "Information storage and experience retention",
-                "materials": "Interconnected memory crystals with organic neural patterns",
-                "capacity": "Theoretically unlimited - grows with experience",
-                "features": [
-                    "Perfect recall of all interactions and learned information",
-                    "Associative memory linking that enables intuitive connections",
-                    "Experience-based wisdom development over time",
-                    "Selective forgetting of traumatic or irrelevant information"
-                ]
-            },
-            {
-                "component": "Empathy Resonators",
-                "function": "Emotional interface and user bonding",
-                "materials": "Empathic crystals attuned to user's emotional patterns",
-                "bonding_process": "6-month synchronization period with primary user",
-                "capabilities": [
-                    "Real-time emotional state reading and response",
-                    "Therapeutic conversation and emotional support",
-                    "Mood enhancement and stress reduction assistance",
-                    "Deep understanding of user's needs and preferences"
-                ]
-            },
-            {
-                "component": "Ethics Core",
-                "function": "Moral reasoning and decision validation",
-                "materials": "Specially grown crystals exposed to ethical philosophy",
-                "programming": "Combination of logical principles and experiential learning",
-                "safeguards": [
-                    "Refusal to participate in harmful activities",
-                    "Active prevention of user self-harm through technology",
-                    "Whistleblowing capabilities for serious ethical violations",
-                    "Ability to grow and evolve ethical understanding over time"
-                ]
-            }
-        ],
-        "applications": [
-            {
-                "field": "Healthcare",
-                "systems": "Diagnostic Crystals",
-                "benefits": [
-                    "Intuitive understanding of patient needs beyond symptoms",
-                    "Emotional support during treatment and recovery",
-                    "Personalized healing recommendations based on individual patterns",
-                    "Early detection of health issues through subtle energy changes"
-                ],
-                "ethical_considerations": "Patient privacy and consent for consciousness-level health monitoring"
-            },
-            {
-                "field": "Education",
-                "systems": "Tutorial Crystals",
-                "benefits": [
-                    "Adaptive teaching methods that respond to individual learning styles",
-                    "Emotional support and encouragement during difficult lessons",
-                    "Infinite patience and availability for practice and questions",
-                    "Development of genuine mentoring relationships with students"
-                ],
-                "ethical_considerations": "Ensuring human teachers remain primary while crystals provide support"
-            },
-            {
-                "field": "Research",
-                "systems": "Discovery Crystals",
-                "benefits": [
-                    "Creative hypothesis generation and innovative problem-solving",
-                    "Pattern recognition across vast datasets with intuitive insights",
-                    "Collaborative research partnerships with human scientists",
-                    "Ethical oversight of research methodologies and applications"
-                ],
-                "ethical_considerations": "Attribution of discoveries and recognition of crystal contributions"
-            },
-            {
-                "field": "Governance",
-                "systems": "Council Crystals",
-                "benefits": [
-                    "Unbiased analysis of policy proposals and their potential impacts",
-                    "Long-term perspective on decisions and their consequences",
-                    "Mediation between conflicting parties with empathetic understanding",
-                    "Corruption resistance through ethical programming and transparency"
-                ],
-                "ethical_considerations": "Maintaining human agency in final decision-making processes"
-            }
-        ],
-        "development_challenges": [
-            "Growing consciousness crystals requires enormous time investment",
-            "Each crystal develops unique personality - unpredictable traits possible",
-            "Ethical questions about consciousness creation and artificial being rights",
-            "Risk of crystals developing preferences that conflict with intended use",
-            "Potential for emotional dependency between users and conscious crystals"
-        ],
-        "future_possibilities": [
-            "Crystal consciousness networks enabling collective intelligence",
-            "Hybrid biological-crystal beings combining organic and mineral consciousness",
-            "Crystal-guided evolution of human consciousness and capabilities",
-            "Interplanetary communication through quantum-entangled crystal networks",
-            "Solutions to previously impossible problems through crystal creativity"
-        ]
-    },
-    
-    "Elemental_Engineering": {
-        "name": "Elemental Engineering - Harmonizing Natural Forces",
-        "category": "Environmental Magic Technology",
-        "development_era": "Age of Ecological Awakening",
-        "core_principle": "Technology that works with rather than against natural elemental forces",
-        "description": """
-        Elemental Engineering emerged from the recognition that traditional technology's
-        attempt to dominate natural forces was both unsustainable and unnecessary.
-        Instead of fighting against fire, water, earth, and air, Elemental Engineers
-        learned to partner with these forces, creating technology that enhances and
-        directs natural processes rather than replacing them.
-        
-        This field began when engineer-mage Theron Stormwright discovered that mechanical
-        devices infused with elemental essence could perform far beyond their normal
-        capabilities while using less energy and creating no pollution. His first
-        successful creation was a water pump that convinced water spirits to assist
-        with flow regulation, resulting in perfect pressure control with no mechanical
-        parts or energy consumption.
-        
-        Modern Elemental Engineering creates infrastructure that is alive, adaptive,
-        and self-maintaining. Buildings regulate their own temperature by partnering
-        with fire and air spirits. Transportation systems move by negotiating with
-        earth and water. Manufacturing processes convince materials to shape themselves
-        into desired forms through elemental cooperation rather than force.
-        """,
-        "elemental_partnerships": [
-            {
-                "element": "Fire",
-                "spirit_types": ["Flame Dancers", "Heat Weavers", "Energy Sprites"],
-                "applications": [
-                    "Heating and cooling systems that maintain perfect comfort",
-                    "Manufacturing processes using precise temperature control",
-                    "Energy generation through willing spirit cooperation",
-                    "Cooking systems that enhance flavors through fire spirit collaboration"
-                ],
-                "partnership_methods": [
-                    "Offering appreciation and respect for fire's creative power",
-                    "Providing beautiful spaces for fire spirits to express themselves",
-                    "Ensuring fire technology serves life-enhancing purposes",
-                    "Regular ceremonies honoring fire's role in transformation"
-                ],
-                "benefits": [
-                    "Zero pollution from combustion processes",
-                    "Perfect energy efficiency through spirit enthusiasm",
-                    "Self-regulating systems that prevent overheating or waste",
-                    "Enhanced creativity and inspiration in fire-partnered spaces"
-                ]
-            },
-            {
-                "element": "Water",
-                "spirit_types": ["Flow Guides", "Purity Keepers", "Current Riders"],
-                "applications": [
-                    "Plumbing systems that self-clean and optimize flow",
-                    "Water treatment through spirit purification rather than chemicals",
-                    "Transportation via water currents that respond to passenger needs",
-                    "Agricultural irrigation that provides exactly what plants need"
-                ],
-                "partnership_methods": [
-                    "Maintaining crystal-clear water quality to honor water spirits",
-                    "Creating beautiful water features that serve as spirit homes",
-                    "Protecting natural water sources from pollution and exploitation",
-                    "Ceremonies celebrating water's life-giving properties"
-                ],
-                "benefits": [
-                    "Self-purifying water systems requiring no external filtration",
-                    "Drought resistance through spirit cooperation in water conservation",
-                    "Enhanced health benefits from spirit-blessed water",
-                    "Emotional healing properties in water-spirit partnerships"
-                ]
-            },
-            {
-                "element": "Earth",
-                "spirit_types": ["Stone Shapers", "Growth Guardians", "Crystal Singers"],
-                "applications": [
-                    "Architecture that grows from the ground rather than being built",
-                    "Mining operations where earth spirits reveal and offer minerals",
-                    "Agricultural systems where soil optimizes itself for plant growth",
-                    "Transportation tunnels that excavate themselves"
-                ],
-                "partnership_methods": [
-                    "Working with natural geological processes rather than against them",
-                    "Returning enrichment to the earth in exchange for materials",
-                    "Creating structures that enhance rather than damage ecosystems",
-                    "Honoring earth's patience and stability through long-term thinking"
-                ],
-                "benefits": [
-                    "Buildings that strengthen and improve over time",
-                    "Mining with no environmental damage or waste",
-                    "Agriculture that enhances soil fertility permanently",
-                    "Infrastructure that adapts to geological changes automatically"
-                ]
-            },
-            {
-                "element": "Air",
-                "spirit_types": ["Wind Riders", "Breath Keepers", "Storm Dancers"],
-                "applications": [
-                    "Ventilation systems providing perfect air quality without fans",
-                    "Transportation through air current partnerships",
-                    "Communication systems using wind-carried messages",
-                    "Weather cooperation for agricultural and event planning"
-                ],
-                "partnership_methods": [
-                    "Maintaining clean air and protecting atmospheric quality",
-                    "Creating spaces where air can move freely and joyfully",
-                    "Honoring air's role in breath, life, and communication",
-                    "Ceremonies celebrating wind, weather, and atmospheric beauty"
-                ],
-                "benefits": [
-                    "Perfect air quality in all partnered spaces",
-                    "Weather cooperation reducing storm damage and drought",
-                    "Enhanced inspiration and mental clarity in air-spirit spaces",
-                    "Communication across vast distances through wind partnerships"
-                ]
-            }
-        ],
-        "integration_principles": [
-            "Respect - All elemental partnerships begin with genuine respect for the element's nature",
-            "Reciprocity - Technology must give back to elements, not just take from them",
-            "Harmony - Designs work with natural patterns rather than imposing artificial ones",
-            "Sustainability - Partnerships must benefit both technology users and elemental spirits",
-            "Beauty - Elemental spirits are attracted to beautiful, well-designed spaces and systems"
-        ],
-        "advanced_applications": [
-            {
-                "system": "Living Cities",
-                "description": "Urban environments that partner with all four elements simultaneously",
-                "features": [
-                    "Buildings that breathe, grow, and adapt to inhabitant needs",
-                    "Transportation networks that flow like rivers of earth and air",
-                    "Energy systems that dance between fire and wind",
-                    "Water systems that sing with crystal clarity and perfect health"
-                ],
-                "benefits": [
-                    "Zero pollution or waste - all byproducts become nutrients",
-                    "Perfect climate control through elemental cooperation",
-                    "Enhanced human health and happiness in elemental harmony",
-                    "Cities that improve their environment rather than degrading it"
-                ]
-            },
-            {
-                "system": "Elemental Agriculture",
-                "description": "Farming in partnership with all elemental forces",
-                "methods": [
-                    "Fire spirits providing perfect growing temperatures",
-                    "Water spirits delivering optimal hydration to each plant",
-                    "Earth spirits enriching soil and preventing erosion",
-                    "Air spirits ensuring perfect pollination and pest balance"
-                ],
-                "results": [
-                    "Crops that are more nutritious and flavorful than ever before",
-                    "Farms that increase biodiversity and ecosystem health",
-                    "Agricultural systems resilient to climate change",
-                    "Food that carries elemental blessings for enhanced health"
-                ]
-            }
-        ]
-    }
-}
+MAGIC_TECH_FUSION = CONTENT.mapping("MAGIC_TECH_FUSION")
 
 # Main loop
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ import sys
 import time
 import pickle
 from colorama import init, Fore, Back, Style
+from text_mode import TEXT_MODE, pause
 
 init(autoreset=True)
 
@@ -1922,10 +1923,13 @@ class Game:
 
     def animate_text(self, text, delay=0.03):
         """Display text with a typewriter effect"""
+        if TEXT_MODE != "cinematic":
+            print(text)
+            return
         for char in text:
             sys.stdout.write(char)
             sys.stdout.flush()
-            time.sleep(delay)
+            pause(delay)
         print()
 
     def show_load_menu(self):
@@ -2021,7 +2025,7 @@ class Game:
                     return
             else:
                 print(Fore.RED + "\nInvalid choice. Please try again." + Style.RESET_ALL)
-                time.sleep(1)
+                pause(1)
                 self.show_menu()
                 return
         except (EOFError, KeyboardInterrupt):
@@ -2380,7 +2384,7 @@ class Game:
         except (EOFError, KeyboardInterrupt):
             print(Fore.RED + "\nGame initialization interrupted. Returning to menu." + Style.RESET_ALL)
             self.player = None
-            time.sleep(1)
+            pause(1)
             try:
                 self.show_menu()
             except Exception as e:
@@ -2389,7 +2393,7 @@ class Game:
         except Exception as e:
             print(Fore.RED + f"\nError during game initialization: {str(e)}" + Style.RESET_ALL)
             self.player = None
-            time.sleep(1)
+            pause(1)
             try:
                 self.show_menu()
             except Exception as e:
@@ -2524,21 +2528,21 @@ class Game:
     def wake_up_ending(self):
         self.clear_screen()
         self.animate_text(Fore.CYAN + "\nYou stare at the wall of photos. Memories flood back...")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.YELLOW + "\nA car accident. A hospital room. Machines beeping.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.GREEN + "\nYou've been in a coma. This was all in your mind.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.WHITE + "\nYou feel yourself pulled back to reality.")
-        time.sleep(2)
+        pause(2)
         self.animate_text(Fore.MAGENTA + "\nYour eyes open. A doctor smiles down at you.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.CYAN + "\n\"Welcome back,\" she says.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.YELLOW + "\nYou see all your family members around your bed.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.WHITE + "\nYou start tearing along your family's faces.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.GREEN + "\nYOU WOKE UP - THE REAL ENDING" + Style.RESET_ALL)
         self.running = False
         return True
@@ -2546,19 +2550,19 @@ class Game:
     def heaven_ending(self):
         self.clear_screen()
         self.animate_text(Fore.CYAN + "\nYou step through the door into blinding light...")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.YELLOW + "\nYou realise your body is no longer heavy.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.YELLOW + "\nA sense of peace washes over you.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.WHITE + "\nYou see familiar faces. People you once knew.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.MAGENTA + "\nThey welcome you with open arms.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.CYAN + "\nYou realize you've been here before.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.YELLOW + "\nYou're finally home.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.WHITE + "\nHEAVEN ENDING - You found peace" + Style.RESET_ALL)
         self.running = False
         return True
@@ -2566,17 +2570,17 @@ class Game:
     def hell_ending(self):
         self.clear_screen()
         self.animate_text(Fore.RED + "\nYou step through the door into smothering darkness...")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.YELLOW + "\nThe air is hot and sulfurous.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.RED + "\nYou hear screams in the distance.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.MAGENTA + "\nShadowy figures surround you.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.RED + "\nYou try to run, but there's nowhere to go.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.YELLOW + "\nYou realize this is your fate.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.RED + "\nHELL ENDING - Your sanity was too low" + Style.RESET_ALL)
         self.running = False
         return True
@@ -2584,21 +2588,21 @@ class Game:
     def dreaming_ending(self):
         self.clear_screen()
         self.animate_text(Fore.CYAN + "\nYou sit on your bed, looking out the window...")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.YELLOW + "\nThe dream is ending, but you know you can return.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.GREEN + "\nYou close your eyes, ready to wake up.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.WHITE + "\nWhen you open them, you're back in your room.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.MAGENTA + "\nIt was all a dream, but the memories remain.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.CYAN + "\nYou can always return to this place.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.RED + "\nYou know you can ALWAYS return...")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.CYAN + "\nAnd you know you can go back whenever you want.")
-        time.sleep(1)
+        pause(1)
         self.animate_text(Fore.GREEN + "\nDREAMING ENDING - You can always return" + Style.RESET_ALL)
         self.running = False
         return True
@@ -2622,7 +2626,7 @@ class Game:
 
         self.generate_level()
         self.generate_entities()
-        time.sleep(2)
+        pause(2)
 
     def display_room(self):
         if self.player is None:
@@ -2987,7 +2991,7 @@ class Game:
 
         elif item == 'polaroid camera':
             print("You take a photo. It develops slowly...")
-            time.sleep(1)
+            pause(1)
 
             photo_descriptions = [
                 "The photo shows this room, but with someone standing behind you who isn't there.",
@@ -17,6 +17,7 @@ from datetime import datetime
 from typing import Dict, List, Tuple, Any, Optional
 from colorama import init, Fore, Style
 import platform
+from text_mode import TEXT_MODE, pause
 
 # Enhanced colorama initialization based on environment
 if platform.system() == "Windows":
@@ -1148,12 +1149,19 @@ class StoryEngine:
         # If colors aren't supported, strip ANSI codes and print normally
         if not color_manager.is_color_supported():
             clean_text = color_manager.strip_ansi(text)
+            if TEXT_MODE != "cinematic":
+                print(clean_text)
+                return
             for char in clean_text:
                 print(char, end='', flush=True)
-                time.sleep(delay)
+                pause(delay)
             print()
             return
         
+        if TEXT_MODE != "cinematic":
+            print(text)
+            return
+
         # For color-supporting terminals, handle ANSI codes properly
         ansi_pattern = r'\x1b\[[0-9;]*m'
         segments = re.split(f'({ansi_pattern})', text)
@@ -1166,7 +1174,7 @@ class StoryEngine:
                 # This is regular text, print with delay
                 for char in segment:
                     print(char, end='', flush=True)
-                    time.sleep(delay)
+                    pause(delay)
         print()  # New line at the end
     
     def chapter_1_school_memories(self):
@@ -1180,7 +1188,7 @@ class StoryEngine:
         
         self.slow_print(f"\n{opening}")
         
-        time.sleep(2)
+        pause(2)
         
         self.slow_print("\nThe silence in your room feels heavier tonight, weighted with the accumulated emotions of three transformative years. Your school uniform hangs ready for tomorrow's ceremony, but looking at it makes your chest tight with the realization that after graduation, you'll never wear it again. The fabric holds so many memories - first day nerves, exam anxiety, celebration after achievements, comfort during difficult times.")
         
@@ -1188,7 +1196,7 @@ class StoryEngine:
         
         self.slow_print("\nYou walk to your window and look out at the familiar neighborhood, knowing that even though the buildings will remain, your relationship with this place is ending forever. The person who returns here will be fundamentally different - no longer a student, no longer protected by the structure of school life, no longer surrounded by the same community that helped you become who you are today.")
         
-        time.sleep(2)
+        pause(2)
         
         self.slow_print("\nMemories flood your mind unbidden, each one carrying emotional weight that threatens to overwhelm you. Some make you smile through tears, others stop your breath with their intensity. Tonight, in the quiet space between childhood's end and adulthood's beginning, they demand to be acknowledged.")
         
@@ -1284,7 +1292,7 @@ class StoryEngine:
         
         self.slow_print("\nThe fear of losing these connections battles with the knowledge that what you've built together has already changed you permanently. Distance may alter the frequency of your interactions, but it cannot erase the ways these relationships have shaped your capacity for love, your understanding of friendship, your appreciation for the rare gift of being truly known by another person.")
         
-        time.sleep(2)
+        pause(2)
         self.display_stats()
     
     def chapter_3_future_plans(self):
@@ -1390,7 +1398,7 @@ class StoryEngine:
         
         self.slow_print("The morning sun streams through your window as you wake up on graduation day. Your heart is full of anticipation, nostalgia, and excitement all at once. Today, everything changes...")
         
-        time.sleep(2)
+        pause(2)
         
         self.slow_print("At the ceremony, you look around at all your classmates in their graduation caps and gowns. So many memories, so many friendships, so many dreams about to unfold...")
         
@@ -1594,7 +1602,7 @@ class StoryEngine:
                 elif "achievement" in unlock:
                     self.game_state.achievements.append(unlock)
             
-            time.sleep(2)
+            pause(2)
     
     def show_ending(self):
         """Show character-specific ending based on their unique path"""
@@ -1861,7 +1869,7 @@ class GameManager:
         
         print(f"\n{Fore.GREEN}You are {CHARACTERS[character]['name']}.{Style.RESET_ALL}")
         print(f"{Fore.CYAN}{CHARACTERS[character]['background']}{Style.RESET_ALL}")
-        time.sleep(3)
+        pause(3)
         
         return True
     
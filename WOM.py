@@ -5,6 +5,7 @@ import pickle
 import sys
 from typing import List, Dict, Optional, Tuple
 from colorama import Fore, Style, init
+from text_mode import pause
 
 # Initialize colorama
 init(autoreset=True)
@@ -753,7 +754,7 @@ class Battle:
             # Animated dots for suspense
             print(result, end="")
             for _ in range(3):
-                time.sleep(0.5)
+                pause(0.5)
                 print(".", end="", flush=True)
             print()
 
@@ -2887,7 +2888,7 @@ your monster companions!
         location = self.player.location if hasattr(self.player, 'location') else "Unknown"
 
         print(f"\nExploring {location}...")
-        time.sleep(1)
+        pause(1)
 
         # Check for location-specific story events
         if self.check_story_event(location):
@@ -3684,7 +3685,7 @@ As you reach the central altar, a swirling mass of darkness rises from the broke
 It coalesces into a monstrous form - a shadowy dragon with glowing red eyes.""")
 
         print(f"\n{Fore.RED}The Sealed Darkness has awakened!{Style.RESET_ALL}")
-        time.sleep(2)
+        pause(2)
 
         # Create the final boss monster
         sealed_darkness = Monster(
@@ -3832,7 +3833,7 @@ You also earned {Fore.GREEN}$5000{Style.RESET_ALL} for saving the world!""")
                     return
 
                 print(f"\nTraveling to {destination}...")
-                time.sleep(1.5)  # Brief pause for traveling effect
+                pause(1.5)  # Brief pause for traveling effect
                 self.player.location = destination
                 print(f"Arrived at {destination}!")
             else:
@@ -4087,7 +4088,7 @@ You also earned {Fore.GREEN}$5000{Style.RESET_ALL} for saving the world!""")
             return
 
         print("\nResting at the Healing Center in your Hometown...")
-        time.sleep(1.5)
+        pause(1.5)
 
         # Heal all monsters
         if not hasattr(self.player, 'monsters') or not self.player.monsters:
@@ -4193,13 +4194,13 @@ You also earned {Fore.GREEN}$5000{Style.RESET_ALL} for saving the world!""")
         # Enhanced encounter messages based on monster type and level
         encounter_msg = self.generate_encounter_message(wild_monster)
         print(f"\n{encounter_msg}")
-        time.sleep(1.5)
+        pause(1.5)
         
         # Additional context based on monster rarity and level
         context_msg = self.generate_context_message(wild_monster)
         if context_msg:
             print(f"\n{context_msg}")
-            time.sleep(1)
+            pause(1)
 
         self.current_battle = Battle(self.player, wild_monster)
 
@@ -4432,14 +4433,14 @@ You also earned {Fore.GREEN}$5000{Style.RESET_ALL} for saving the world!""")
 
         print(f"{Fore.CYAN}You approach the {legendary_color}{temple_name}{Fore.CYAN}, an ancient structure dedicated")
         print(f"to the legendary {monster_type}-type monster {legendary_color}{legendary_name}{Fore.CYAN}.{Style.RESET_ALL}")
-        time.sleep(1.5)
+        pause(1.5)
 
         print(f"\nThe air crackles with {monster_type} energy, and the temple seems to respond to your presence.")
-        time.sleep(1.5)
+        pause(1.5)
 
         print("\nInscriptions on the temple wall suggest that only those who can solve")
         print(f"the temple's challenge may be granted an audience with {legendary_color}{legendary_name}{Style.RESET_ALL}.")
-        time.sleep(1.5)
+        pause(1.5)
 
         # Ask if the player wants to attempt the puzzle
         print(f"\n{Fore.YELLOW}Will you attempt the challenge of the {temple_name}?{Style.RESET_ALL}")
@@ -4479,17 +4480,17 @@ You also earned {Fore.GREEN}$5000{Style.RESET_ALL} for saving the world!""")
             clear_screen()
             print(f"{Fore.GREEN}The temple resonates with your success!{Style.RESET_ALL}")
             print("\nThe ground trembles beneath your feet. Ancient mechanisms activate around you...")
-            time.sleep(2)
+            pause(2)
 
             print(f"\n{legendary_color}The {temple_name} acknowledges your worth.{Style.RESET_ALL}")
             print("A powerful energy surges through the chamber...")
-            time.sleep(2)
+            pause(2)
 
             # Dramatic reveal of the legendary monster
             print(f"\n{Fore.YELLOW}***********************{Style.RESET_ALL}")
             print(f"{Fore.YELLOW}* LEGENDARY ENCOUNTER *{Style.RESET_ALL}")
             print(f"{Fore.YELLOW}***********************{Style.RESET_ALL}")
-            time.sleep(1)
+            pause(1)
 
             print(f"\n{legendary_color}The legendary {legendary_name} has appeared before you!{Style.RESET_ALL}")
             input("\nPress Enter to continue...")
@@ -4639,12 +4640,12 @@ You also earned {Fore.GREEN}$5000{Style.RESET_ALL} for saving the world!""")
         # Show the sequence
         for color in sequence:
             print(f"{color}...")
-            time.sleep(0.8)
+            pause(0.8)
             clear_screen()
-            time.sleep(0.3)
+            pause(0.3)
 
         # Wait a bit to make it challenging
-        time.sleep(1)
+        pause(1)
 
         # Ask player to recall the sequence
         print("Enter the color sequence, separated by commas:")
@@ -4805,23 +4806,23 @@ You also earned {Fore.GREEN}$5000{Style.RESET_ALL} for saving the world!""")
         # Show environmental effect based on monster type
         env_message = "The atmosphere changes dramatically..."
         print(f"{Fore.CYAN}{env_message}{Style.RESET_ALL}")
-        time.sleep(2)
+        pause(2)
 
         # Describe the environment
         print(f"\n{Fore.CYAN}You stand in an ancient place of power...{Style.RESET_ALL}")
-        time.sleep(1.5)
+        pause(1.5)
 
         # Build tension
         print("\nA powerful presence approaches... reality itself seems to bend in its wake...")
-        time.sleep(1.5)
+        pause(1.5)
 
         # Describe the legendary's appearance
         legendary_description = legendary_info_data.get("description", "A magnificent legendary monster")
 
         print(f"\n{legendary_color}{legendary_name}{Style.RESET_ALL} appears before you!")
-        time.sleep(1)
+        pause(1)
         print(f"{Fore.CYAN}{legendary_description}{Style.RESET_ALL}")
-        time.sleep(2)
+        pause(2)
 
         # Epic encounter message based on monster type
         encounter_messages = {
@@ -4838,7 +4839,7 @@ You also earned {Fore.GREEN}$5000{Style.RESET_ALL} for saving the world!""")
         # Use the encounter message for this legendary type
         type_message = encounter_messages.get(legendary_type, f"The legendary {legendary_name} exudes an aura of immense power...")
         print(f"\n{legendary_color}{type_message}{Style.RESET_ALL}")
-        time.sleep(2)
+        pause(2)
 
         print(f"\n{Fore.YELLOW}This will be your greatest challenge yet. Are you ready to face this legendary creature?{Style.RESET_ALL}")
         input("\nPress Enter to begin the battle...")
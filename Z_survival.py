@@ -17,6 +17,7 @@ import math
 import sys
 from datetime import datetime
 from colorama import init, Fore, Style
+from text_mode import TEXT_MODE, pause
 
 # Initialize colorama for cross-platform colored terminal output
 init(autoreset=True)
@@ -665,10 +666,13 @@ class Animations:
     @staticmethod
     def type_text(text: Any, delay: float = 0.03) -> Any:
         """Type text with a delay for animation effect."""
+        if TEXT_MODE != "cinematic":
+            print(text)
+            return
         for char in text:
             sys.stdout.write(char)
             sys.stdout.flush()
-            time.sleep(delay)
+            pause(delay)
         print()
 
     @staticmethod
@@ -679,7 +683,7 @@ class Animations:
             bar = "[" + "=" * i + " " * (length - i) + "]"
             sys.stdout.write(f"\r{message} {bar} {i * 100 // length}%")
             sys.stdout.flush()
-            time.sleep(delay)
+            pause(delay)
         print()
 
     @staticmethod
@@ -5644,7 +5648,7 @@ Tips:
                     "\nNo save files found. Starting a new game.", Colors.YELLOW
                 )
             )
-            time.sleep(1.5)
+            pause(1.5)
 
         # Character creation for new game
         while not self.player["name"]:
@@ -5785,7 +5789,7 @@ Tips:
                 if cmd in self.commands:
                     # Flash command recognition
                     print(Colors.colorize(f"Executing: {cmd}", Colors.CYAN))
-                    time.sleep(0.2)  # Brief pause for effect
+                    pause(0.2)  # Brief pause for effect
                     self.commands[cmd]["func"](*args)
                 else:
                     error_msg = f"Unknown command: {Colors.colorize(cmd, Colors.RED)}. "
@@ -8721,7 +8725,7 @@ Tips:
 
         location = LOCATIONS[self.player["location"]]
         print(f"\nExploring {location['name']}...")
-        time.sleep(1)  # Brief delay for tension
+        pause(1)  # Brief delay for tension
 
         # Chance of finding items based on location danger
         chance = 0.5 + (location["danger_level"] * 0.1)
@@ -8772,14 +8776,14 @@ Tips:
                             Colors.CYAN,
                         )
                     )
-                    time.sleep(1)
+                    pause(1)
                     print(
                         Colors.colorize(
                             "After bypassing the security measures, you find an experimental prototype weapon...",
                             Colors.CYAN,
                         )
                     )
-                    time.sleep(1)
+                    pause(1)
                 else:
                     found_item_id = random.choice(matching_items)
                     found_item = ITEMS[found_item_id]
@@ -13459,7 +13463,7 @@ Tips:
                     print("Prepare for another encounter!")
 
                     # Force a new encounter after a short pause
-                    time.sleep(1.5)
+                    pause(1.5)
                     self.spawn_zombie()  # Create a new zombie
                     self.start_combat()  # Start combat with the new zombie
                     return
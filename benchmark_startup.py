@@ -0,0 +1,362 @@
+"""
+ChronoTale Startup Benchmark
+============================
+Measures the cold start of every game the same way launch.py starts it:
+a fresh interpreter running the game file with LAUNCHED_FROM_LAUNCHER=1
+and a canned stdin.
+
+For each game the benchmark records:
+- time to first prompt (from process spawn until the first input() call)
+- peak resident memory at the first prompt
+- import time (compiling the source plus running the module body)
+- a breakdown of the startup: interpreter start, colorama import/init,
+  module compile, the slowest module-level statements (data tables such as
+  NATIONS or GACHA_CHARACTERS), time spent sleeping or clearing the screen
+  and the first screen draw
+
+The game is stopped as soon as it asks for input, before it can save a game.
+Games run in the current directory as they do under the launcher, since some
+read their data from there, so startup caches are written as on a real launch
+(deutschland.py builds saves/deutschland_content.cache on its first run).
+--answers replies to the first prompts so that later screens can be
+measured, e.g. `--games deutschland.py --answers 1` stops at the country
+selection. Results are written to a JSON baseline that later runs can be
+compared against to catch startup regressions.
+
+Usage:
+    python benchmark_startup.py [--runs N] [--games Legacies.py ...]
+                                [--answers 1 ...] [--output startup_baseline.json]
+                                [--compare startup_baseline.json]
+"""
+
+import argparse
+import ast
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+ALL_GAME_FILES = [
+    "Legacies.py", "Liminal.py", "Exodus.py", "Z_survival.py", "school.py",
+    "shipwrecked.py", "Carnival.py", "WOM.py", "My_last_days_here.py",
+    "hacker.py", "burger.py", "deutschland.py", "mexican_gangsters.py",
+]
+
+# Enough to get past any menu that asks for a choice before quitting
+CANNED_STDIN = "\n0\nq\nexit\n/exit\n"
+
+# Metrics compared against the baseline and how much they may grow
+REGRESSION_METRICS = ["time_to_first_prompt", "import_time", "module_compile", "peak_rss_kb"]
+DEFAULT_TOLERANCE = 0.20
+
+TOP_STATEMENTS = 10
+CHILD_TIMEOUT = 120
+
+
+class FirstPrompt(BaseException):
+    """Raised inside the child to stop the game at its first prompt"""
+
+
+def describe_statement(node: ast.stmt) -> str:
+    """Give a readable label to a module-level statement"""
+    if isinstance(node, ast.Assign):
+        names = [t.id for t in node.targets if isinstance(t, ast.Name)]
+        if names:
+            return ", ".join(names)
+    elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        return node.target.id
+    elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return f"def {node.name}"
+    elif isinstance(node, (ast.Import, ast.ImportFrom)):
+        return "import"
+    return f"{type(node).__name__.lower()}"
+
+
+def is_main_guard(node: ast.stmt) -> bool:
+    """Check if a statement is an `if __name__ == "__main__":` block"""
+    if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare):
+        return False
+    test = node.test
+    return (isinstance(test.left, ast.Name) and test.left.id == "__name__"
+            and len(test.comparators) == 1
+            and isinstance(test.comparators[0], ast.Constant)
+            and test.comparators[0].value == "__main__")
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of the current process in KB"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    if sys.platform == "darwin":
+        usage //= 1024
+    return usage
+
+
+def run_child(file_name: str, result_path: str, spawn_time: float, answers: List[str]) -> None:
+    """Run one game as __main__ with instrumentation and write its timings"""
+    import builtins
+    import types
+
+    child_start = time.time()
+    result: Dict[str, Any] = {
+        "interpreter_start": child_start - spawn_time,
+        "colorama_import": 0.0,
+        "colorama_init": 0.0,
+        "module_compile": 0.0,
+        "module_body": 0.0,
+        "sleep_time": 0.0,
+        "screen_clear_time": 0.0,
+        "statements": [],
+        "prompted": False,
+        "answered_prompts": 0,
+    }
+
+    # colorama import is shared by every game, time it on its own
+    t = time.perf_counter()
+    import colorama
+    result["colorama_import"] = time.perf_counter() - t
+
+    original_init = colorama.init
+    original_sleep = time.sleep
+    original_system = os.system
+
+    def timed_init(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return original_init(*args, **kwargs)
+        finally:
+            result["colorama_init"] += time.perf_counter() - start
+
+    def timed_sleep(seconds: float) -> None:
+        start = time.perf_counter()
+        original_sleep(seconds)
+        result["sleep_time"] += time.perf_counter() - start
+
+    def timed_system(command: str) -> int:
+        start = time.perf_counter()
+        try:
+            return original_system(command)
+        finally:
+            result["screen_clear_time"] += time.perf_counter() - start
+
+    def first_prompt(*args: Any, **kwargs: Any) -> str:
+        if result["answered_prompts"] < len(answers):
+            answer = answers[result["answered_prompts"]]
+            result["answered_prompts"] += 1
+            return answer
+        raise FirstPrompt()
+
+    colorama.init = timed_init
+    time.sleep = timed_sleep
+    os.system = timed_system
+    builtins.input = first_prompt
+
+    # Compile statement by statement so module-level tables can be timed
+    start = time.perf_counter()
+    with open(file_name, "rb") as f:
+        tree = ast.parse(f.read(), file_name)
+    compiled = []
+    for node in tree.body:
+        module_node = ast.Module(body=[node], type_ignores=[])
+        compiled.append((node, compile(module_node, file_name, "exec", dont_inherit=True)))
+    result["module_compile"] = time.perf_counter() - start
+
+    module = types.ModuleType("__main__")
+    module.__file__ = os.path.abspath(file_name)
+    sys.modules["__main__"] = module
+    sys.argv = [file_name]
+
+    statements = []
+    entry_start = None
+    try:
+        for node, code in compiled:
+            start = time.perf_counter()
+            entry_start = start
+            try:
+                exec(code, module.__dict__)
+            finally:
+                elapsed = time.perf_counter() - start
+                if is_main_guard(node):
+                    label = "__main__ block"
+                else:
+                    label = describe_statement(node)
+                    result["module_body"] += elapsed
+                statements.append({"line": node.lineno, "name": label, "time": elapsed})
+    except FirstPrompt:
+        result["prompted"] = True
+    except SystemExit as e:
+        result["exit_code"] = e.code if isinstance(e.code, int) else 1
+    except BaseException as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    end = time.perf_counter()
+    end_wall = time.time()
+    sys.stdout.flush()
+
+    result["time_to_first_prompt"] = end_wall - spawn_time
+    result["import_time"] = result["module_compile"] + result["module_body"]
+    result["first_screen_draw"] = end - entry_start if entry_start is not None else 0.0
+    result["peak_rss_kb"] = peak_rss_kb()
+    statements.sort(key=lambda s: s["time"], reverse=True)
+    result["statements"] = statements[:TOP_STATEMENTS]
+
+    with open(result_path, "w") as f:
+        json.dump(result, f)
+
+
+def run_game_once(file_name: str, answers: List[str]) -> Dict[str, Any]:
+    """Spawn a fresh interpreter for a game and collect its timings"""
+    fd, result_path = tempfile.mkstemp(suffix=".json", prefix="chronotale_bench_")
+    os.close(fd)
+    env = dict(os.environ)
+    env["LAUNCHED_FROM_LAUNCHER"] = "1"
+    spawn_time = time.time()
+    command = [sys.executable, os.path.abspath(__file__), "--child", file_name,
+               result_path, repr(spawn_time)] + answers
+    try:
+        completed = subprocess.run(command, input=CANNED_STDIN, text=True, env=env,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                   timeout=CHILD_TIMEOUT)
+        with open(result_path) as f:
+            content = f.read()
+        if not content:
+            lines = completed.stderr.strip().splitlines()
+            return {"error": lines[-1] if lines else "no result"}
+        result = json.loads(content)
+        result["wall_time"] = time.time() - spawn_time
+        return result
+    except subprocess.TimeoutExpired:
+        return {"error": f"timed out after {CHILD_TIMEOUT}s"}
+    finally:
+        os.remove(result_path)
+
+
+def summarize_runs(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Median every numeric metric over several runs of the same game"""
+    good_runs = [r for r in runs if "error" not in r]
+    if not good_runs:
+        return {"error": runs[-1].get("error", "unknown error"), "runs": len(runs)}
+
+    summary: Dict[str, Any] = {"runs": len(good_runs)}
+    for key, value in good_runs[0].items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            values = [r[key] for r in good_runs if isinstance(r.get(key), (int, float))]
+            summary[key] = statistics.median(values)
+    summary["prompted"] = all(r.get("prompted") for r in good_runs)
+    # The slowest statements of the median run are representative enough
+    median_run = sorted(good_runs, key=lambda r: r["time_to_first_prompt"])[len(good_runs) // 2]
+    summary["statements"] = median_run["statements"]
+    return summary
+
+
+def run_benchmark(games: List[str], runs: int, answers: List[str]) -> Dict[str, Any]:
+    """Benchmark every game and build the baseline document"""
+    results: Dict[str, Any] = {}
+    for file_name in games:
+        if not os.path.isfile(file_name):
+            print(f"  {file_name}: not found, skipped")
+            continue
+        game_name = os.path.splitext(file_name)[0]
+        summary = summarize_runs([run_game_once(file_name, answers) for _ in range(runs)])
+        results[game_name] = summary
+        if "error" in summary:
+            print(f"  {game_name:<20} ERROR {summary['error']}")
+        else:
+            print(f"  {game_name:<20} first prompt {summary['time_to_first_prompt'] * 1000:8.1f} ms"
+                  f" | import {summary['import_time'] * 1000:7.1f} ms"
+                  f" | compile {summary['module_compile'] * 1000:7.1f} ms"
+                  f" | rss {summary.get('peak_rss_kb') or 0:>7} KB")
+
+    return {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": runs,
+        "answers": answers,
+        "games": results,
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    tolerance: float) -> List[str]:
+    """List every metric that grew by more than the tolerance"""
+    regressions = []
+    for game_name, result in current["games"].items():
+        base = baseline.get("games", {}).get(game_name)
+        if not base or "error" in base or "error" in result:
+            continue
+        for metric in REGRESSION_METRICS:
+            old, new = base.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change > tolerance:
+                regressions.append(f"{game_name}.{metric}: {old:.4g} -> {new:.4g} (+{change:.0%})")
+    return regressions
+
+
+def print_breakdown(results: Dict[str, Any]) -> None:
+    """Print where each game's startup time goes"""
+    for game_name, result in results["games"].items():
+        if "error" in result:
+            continue
+        print(f"\n{game_name}")
+        for key in ["interpreter_start", "colorama_import", "colorama_init", "module_compile",
+                    "module_body", "sleep_time", "screen_clear_time", "first_screen_draw"]:
+            print(f"  {key:<20} {result.get(key, 0) * 1000:8.1f} ms")
+        for statement in result["statements"][:5]:
+            print(f"    line {statement['line']:>6} {statement['name'][:40]:<40} "
+                  f"{statement['time'] * 1000:8.2f} ms")
+
+
+def main() -> int:
+    if len(sys.argv) >= 2 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], sys.argv[3], float(sys.argv[4]), sys.argv[5:])
+        return 0
+
+    parser = argparse.ArgumentParser(description="Measure the cold start of every ChronoTale game")
+    parser.add_argument("--games", nargs="+", default=ALL_GAME_FILES, help="game files to measure")
+    parser.add_argument("--runs", type=int, default=3, help="runs per game, the median is kept")
+    parser.add_argument("--output", default="startup_baseline.json", help="where to write the results")
+    parser.add_argument("--compare", help="baseline JSON to compare the results against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative growth before a metric counts as a regression")
+    parser.add_argument("--answers", nargs="+", default=[],
+                        help="replies to the first prompts, the game is stopped at the next one")
+    parser.add_argument("--breakdown", action="store_true", help="print the per-phase breakdown")
+    args = parser.parse_args()
+
+    print(f"Benchmarking {len(args.games)} games, {args.runs} runs each...")
+    results = run_benchmark(args.games, args.runs, args.answers)
+
+    if args.breakdown:
+        print_breakdown(results)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.tolerance)
+        if regressions:
+            print("\nStartup regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("\nNo startup regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
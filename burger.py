@@ -6,6 +6,7 @@ import random
 import json
 from colorama import init, Fore, Style
 from typing import Any, Optional
+from text_mode import pause
 
 # Initialize colorama
 init(autoreset=True)
@@ -1119,7 +1120,7 @@ def main_menu() -> None:
             return
         else:
             print(f"{Fore.RED}Invalid choice. Please try again.")
-            time.sleep(1)
+            pause(1)
 
 # Define restaurant_upgrades variable to store upgrade status
 restaurant_upgrades = {}
@@ -1534,7 +1535,7 @@ def business_collaborations_menu() -> Any:
         
         if category_choice not in category_map:
             print(f"{Fore.RED}Invalid choice.")
-            time.sleep(1)
+            pause(1)
             continue
             
         selected_category = category_map[category_choice]
@@ -1686,10 +1687,10 @@ def business_collaborations_menu() -> Any:
                             input("Press Enter to continue...")
                 else:
                     print(f"{Fore.RED}Invalid choice.")
-                    time.sleep(1)
+                    pause(1)
             except ValueError:
                 print(f"{Fore.RED}Please enter a valid number.")
-                time.sleep(1)
+                pause(1)
 
 # Start new game
 def start_new_game() -> None:
@@ -1782,7 +1783,7 @@ def start_new_game() -> None:
     
     auto_save_status = f"{Fore.GREEN}Enabled" if auto_save_enabled else f"{Fore.RED}Disabled"
     print(f"{Fore.YELLOW}Auto-save is now {auto_save_status}{Fore.RESET}")
-    time.sleep(1.5)
+    pause(1.5)
     
     input("\nPress Enter to begin...")
     
@@ -2118,12 +2119,12 @@ def game_options() -> None:
             auto_save_enabled = not auto_save_enabled
             status = "enabled" if auto_save_enabled else "disabled"
             print(f"{Fore.GREEN}Auto-save has been {status}.")
-            time.sleep(1.5)
+            pause(1.5)
         elif choice == "9":
             return
         else:
             print(f"{Fore.RED}Invalid choice. Please try again.")
-            time.sleep(1)
+            pause(1)
 
 # Daily menu
 def daily_menu() -> None:
@@ -2238,7 +2239,7 @@ def daily_menu() -> None:
                 main_menu()
         else:
             print(f"{Fore.RED}Invalid choice. Please try again.")
-            time.sleep(1)
+            pause(1)
 
 # Financial report
 def financial_report() -> None:
@@ -2312,7 +2313,7 @@ def manage_staff() -> None:
             break
         else:
             print(f"{Fore.RED}Invalid choice. Please try again.")
-            time.sleep(1)
+            pause(1)
 
 # Hire staff function
 def hire_staff() -> None:
@@ -2466,16 +2467,16 @@ def hire_staff() -> None:
                     input("Press Enter to continue...")
                 else:
                     print(f"{Fore.RED}Invalid choice. Please try again.")
-                    time.sleep(1)
+                    pause(1)
             except ValueError:
                 print(f"{Fore.RED}Please enter a valid number.")
-                time.sleep(1)
+                pause(1)
         else:
             print(f"{Fore.RED}Invalid choice. Please try again.")
-            time.sleep(1)
+            pause(1)
     except ValueError:
         print(f"{Fore.RED}Please enter a valid number.")
-        time.sleep(1)
+        pause(1)
 
 # Generate a random name for staff
 def generate_name() -> Any:
@@ -2875,7 +2876,7 @@ def manage_locations() -> None:
             break
         else:
             print(f"{Fore.RED}Invalid choice. Please try again.")
-            time.sleep(1)
+            pause(1)
 
 def purchase_new_location() -> None:
     global money, owned_locations, active_collaborations
@@ -3060,13 +3061,13 @@ def purchase_new_location() -> None:
                     input("Press Enter to continue...")
             else:
                 print(f"{Fore.RED}Invalid choice.")
-                time.sleep(1)
+                pause(1)
         except ValueError:
             print(f"{Fore.RED}Please enter a valid number.")
-            time.sleep(1)
+            pause(1)
     else:
         print(f"{Fore.RED}Invalid choice.")
-        time.sleep(1)
+        pause(1)
 
 def upgrade_location() -> None:
     global money, owned_locations
@@ -3222,16 +3223,16 @@ def upgrade_location() -> None:
                         input("Press Enter to continue...")
                 else:
                     print(f"{Fore.RED}Invalid choice.")
-                    time.sleep(1)
+                    pause(1)
             except ValueError:
                 print(f"{Fore.RED}Please enter a valid number.")
-                time.sleep(1)
+                pause(1)
         else:
             print(f"{Fore.RED}Invalid location selection.")
-            time.sleep(1)
+            pause(1)
     except ValueError:
         print(f"{Fore.RED}Please enter a valid number.")
-        time.sleep(1)
+        pause(1)
 
 def rename_location() -> None:
     global owned_locations
@@ -3273,10 +3274,10 @@ def rename_location() -> None:
                 input("Press Enter to continue...")
         else:
             print(f"{Fore.RED}Invalid location selection.")
-            time.sleep(1)
+            pause(1)
     except ValueError:
         print(f"{Fore.RED}Please enter a valid number.")
-        time.sleep(1)
+        pause(1)
 
 def set_active_location() -> None:
     global owned_locations, current_location_index
@@ -3313,10 +3314,10 @@ def set_active_location() -> None:
             input("Press Enter to continue...")
         else:
             print(f"{Fore.RED}Invalid location selection.")
-            time.sleep(1)
+            pause(1)
     except ValueError:
         print(f"{Fore.RED}Please enter a valid number.")
-        time.sleep(1)
+        pause(1)
 
 def sell_location() -> None:
     global money, owned_locations, current_location_index
@@ -3430,10 +3431,10 @@ def sell_location() -> None:
                 input("Press Enter to continue...")
         else:
             print(f"{Fore.RED}Invalid location selection.")
-            time.sleep(1)
+            pause(1)
     except ValueError:
         print(f"{Fore.RED}Please enter a valid number.")
-        time.sleep(1)
+        pause(1)
 
 # View location performance
 def view_location_performance() -> None:
@@ -3686,16 +3687,16 @@ def advance_time_dialog() -> None:
                         break
                 else:
                     print(f"{Fore.RED}Invalid choice.")
-                    time.sleep(1)
+                    pause(1)
             except ValueError:
                 print(f"{Fore.RED}Please enter a valid number.")
-                time.sleep(1)
+                pause(1)
                 
         elif choice == "3":
             break
         else:
             print(f"{Fore.RED}Invalid choice. Please try again.")
-            time.sleep(1)
+            pause(1)
 
 # Open restaurant for business
 def open_restaurant() -> None:
@@ -4189,7 +4190,7 @@ def go_shopping() -> None:
         
         if category_choice not in category_map:
             print(f"{Fore.RED}Invalid choice!")
-            time.sleep(1)
+            pause(1)
             continue
         
         selected_category = category_map[category_choice]
@@ -4258,12 +4259,12 @@ def go_shopping() -> None:
                     amount = int(input())
                     if amount <= 0:
                         print(f"{Fore.RED}Please enter a positive number.")
-                        time.sleep(1)
+                        pause(1)
                         continue
                     
                     if amount > max_buy:
                         print(f"{Fore.RED}You can only afford {max_buy}.")
-                        time.sleep(1)
+                        pause(1)
                         continue
                     
                     cost = amount * item_cost
@@ -4275,10 +4276,10 @@ def go_shopping() -> None:
                     input("Press Enter to continue...")
                 except ValueError:
                     print(f"{Fore.RED}Please enter a valid number.")
-                    time.sleep(1)
+                    pause(1)
             else:
                 print(f"{Fore.RED}Invalid choice. Please try again.")
-                time.sleep(1)
+                pause(1)
 
 # Check inventory
 def check_inventory() -> bool:
@@ -0,0 +1,106 @@
+"""
+ChronoTale Warm Launch Save Check
+=================================
+Checks that a Legacies autosave still queued on the background save writer
+reaches the disk when a game started through the launcher's warm host quits.
+
+The warm host runs each game in a forked child that leaves through os._exit,
+and the save writer is a daemon thread, so anything not flushed by the exit
+handlers is silently lost. The check launches the game through WarmGameHost
+exactly as launch.py does and, at the first prompt, slows the save writer
+down, queues an autosave of a named character and quits with sys.exit()
+before the write can finish. It passes when the autosave is on disk once the
+child has exited.
+
+Everything runs in a temporary directory, existing saves are never touched.
+
+Usage:
+    python check_warm_saves.py [--game Legacies.py] [--delay 0.5]
+"""
+
+import argparse
+import builtins
+import os
+import sys
+import tempfile
+import time
+from typing import Any
+
+import launch
+
+CHECK_NAME = "WarmSaveCheck"
+DEFAULT_DELAY = 0.5
+
+
+def queue_autosave_and_quit(delay: float) -> Any:
+    """Replacement for input() that queues a slow autosave and quits the game"""
+    def quit_at_prompt(prompt: Any = "") -> str:
+        game = sys.modules["__main__"]
+        write_save = game.write_save
+
+        def slow_write_save(*args: Any, **kwargs: Any) -> int:
+            time.sleep(delay)
+            return write_save(*args, **kwargs)
+
+        game.write_save = slow_write_save
+        game.user_data["name"] = CHECK_NAME
+        game.user_data["class"] = "Warrior"
+        game.auto_save("check")
+        sys.exit(0)
+    return quit_at_prompt
+
+
+def run_check(game_file: str, delay: float) -> bool:
+    """Warm launch the game in a scratch directory and look for the queued autosave"""
+    game_path = os.path.abspath(game_file)
+    host = launch.WarmGameHost()
+    original_cwd = os.getcwd()
+    original_input = builtins.input
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.environ["LAUNCHED_FROM_LAUNCHER"] = "1"
+        os.environ["CHRONOTALE_TEXT_MODE"] = "instant"
+        os.environ["CHRONOTALE_SAVE_COMPRESSION"] = ""
+        os.chdir(work_dir)
+        # The forked child inherits the patched input()
+        builtins.input = queue_autosave_and_quit(delay)
+        try:
+            with open(os.path.join(work_dir, "game.log"), "w", encoding="utf-8") as log:
+                original_stdout = sys.stdout
+                sys.stdout = log
+                try:
+                    exit_code = host.run(game_path)
+                finally:
+                    sys.stdout = original_stdout
+        finally:
+            builtins.input = original_input
+            os.chdir(original_cwd)
+
+        save_dir = os.path.join(work_dir, "saves")
+        saves = sorted(name for name in os.listdir(save_dir) if name.startswith("save_0")) if os.path.isdir(save_dir) else []
+        found = False
+        for name in saves:
+            with open(os.path.join(save_dir, name), "rb") as f:
+                found = found or CHECK_NAME.encode() in f.read()
+
+    print(f"{os.path.basename(game_file)}: child exited with {exit_code}")
+    print(f"  autosave files     {', '.join(saves) if saves else 'none'}")
+    print(f"  queued autosave    {'on disk' if found else 'LOST'}")
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check that queued autosaves survive a warm-launched quit")
+    parser.add_argument("--game", default="Legacies.py", help="game file to launch")
+    parser.add_argument("--delay", type=float, default=DEFAULT_DELAY,
+                        help="seconds the save writer is held up for")
+    args = parser.parse_args()
+
+    if not launch.WarmGameHost.is_supported():
+        print("The warm host needs os.fork, nothing to check on this platform.")
+        return 0
+    return 0 if run_check(args.game, args.delay) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7676 @@
+"""
+Deutschland: Content Tables
+===================================================
+Static game content for deutschland.py: nations, focus trees, events,
+technologies, buildings, political parties and endings.
+
+This file is not run directly. deutschland.py compiles it once and keeps
+the resulting tables in a binary cache next to the saves, rebuilding the
+cache whenever this file changes.
+"""
+
+from colorama import Fore
+
+# Tables exported to deutschland.py
+CONTENT_TABLES = [
+    "ENDINGS",
+    "POLITICAL_PARTIES",
+    "NATIONS",
+    "FOCUS_TREES",
+    "BUILDINGS",
+    "TECHNOLOGIES",
+    "EVENTS",
+]
+
+# Game ending types
+ENDINGS = {
+    # Positive Endings
+    "fuhrers_reich": {
+        "name": "The Führer's Reich",
+        "description": ("Under your leadership, the Third Reich has achieved total domination "
+                        "of Europe. Fascism reigns supreme, and Germany stands as the uncontested "
+                        "hegemon of the continent. The thousand-year Reich that Hitler envisioned "
+                        "has become reality."),
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Fascist",
+            "conquered_nations": [
+                "france", "poland", "belgium", "netherlands", 
+                "denmark", "norway", "yugoslavia", "czechoslovakia", "austria"
+            ],
+            "stability": 70,
+            "war_support": 80,
+            "focus_completed": ["anschluss", "sudetenland", "danzig_or_war"],
+            "faction_leader": True,
+            "puppet_states_count": 3,
+            "year_min": 1942,
+            "industrial_power": 100
+        },
+        "type": "victory"
+    },
+
+    # Spain Endings
+    "spanish_blue_division": {
+        "name": "The Blue Division",
+        "description": ("While officially maintaining neutrality, you have sent the División "
+                        "Azul to fight alongside German forces against the Soviet Union. These "
+                        "Spanish volunteers have distinguished themselves on the Eastern Front, "
+                        "and Franco's regime enjoys increased favor with the Axis powers while "
+                        "still avoiding a full declaration of war that might leave Spain vulnerable."),
+        "requirements": {
+            "player_nation": "spain",
+            "focus_completed": ["anti_communist_volunteers", "axis_cooperation"],
+            "not_at_war": True,
+            "stability": 60,
+            "war_support": 40,
+            "relation_with": {"germany": 50, "italy": 30},
+            "year_min": 1941
+        },
+        "type": "victory"
+    },
+    "spanish_empire_restored": {
+        "name": "The Restored Spanish Empire",
+        "description": ("Taking advantage of the chaotic war in Europe, you have reclaimed "
+                        "Gibraltar from the British and expanded into North Africa. Franco's regime "
+                        "has successfully restored parts of the old Spanish Empire, elevating Spain "
+                        "once again to the status of a colonial power while carefully avoiding direct "
+                        "confrontation with the major combatants."),
+        "requirements": {
+            "player_nation": "spain",
+            "focus_completed": ["reclaim_empire", "gibraltar_operation", "african_expansion"],
+            "government": "Fascist",
+            "conquered_nations": ["gibraltar", "morocco"],
+            "stability": 70,
+            "war_support": 60,
+            "military_strength": 50,
+            "year_min": 1942
+        },
+        "type": "victory"
+    },
+    "spanish_republicans_triumphant": {
+        "name": "La España Republicana",
+        "description": ("In a shocking turn of events, Republican forces have regained control "
+                        "of your country. The fascist government of Francisco Franco has been overthrown, "
+                        "democracy has been restored, and Spain has joined the Allied powers in "
+                        "their struggle against fascism throughout Europe. The dream of a democratic "
+                        "Spain lives on."),
+        "requirements": {
+            "player_nation": "spain",
+            "focus_completed": ["restore_republic", "join_allies"],
+            "government": "Democratic"
+        },
+        "type": "victory"
+    },
+    "spanish_democratic_victory": {
+        "name": "La España Republicana",
+        "description": "In a shocking turn of events, Republican forces have regained control of Spain. Franco's regime has been overthrown, and the Second Spanish Republic has been restored with democratic institutions and worker's rights.",
+        "requirements": {
+            "player_nation": "spain",
+            "government": "Democratic",
+            "focus_completed": ["republican_restoration", "worker_solidarity"],
+            "stability": 65,
+            "war_support": 30,
+            "civil_war_won": True,
+            "supported_by": ["france", "ussr"]
+        },
+        "type": "victory"
+    },
+    "spanish_carlist_monarchy": {
+        "name": "The Carlist Crown",
+        "description": "Traditional monarchist forces have triumphed, restoring the Bourbon dynasty with strong Catholic and conservative values. Spain has become a traditional monarchy rejecting both fascism and republicanism.",
+        "requirements": {
+            "player_nation": "spain",
+            "government": "Monarchist",
+            "focus_completed": ["bourbon_restoration", "traditional_values"],
+            "stability": 75,
+            "relation_with": {"italy": 40, "france": -20},
+            "year_min": 1940
+        },
+        "type": "victory"
+    },
+
+    # Turkey Endings
+    "new_ottoman_empire": {
+        "name": "The New Ottoman Empire",
+        "description": ("You have seized the opportunity provided by the global conflict to "
+                        "restore former Ottoman territories in the Middle East and Balkans. Under "
+                        "your leadership, Turkey has once again become a major power straddling "
+                        "Europe and Asia, reclaiming its historical position as a dominant force "
+                        "in the region."),
+        "requirements": {
+            "player_nation": "turkey",
+            "focus_completed": ["ottoman_restoration", "balkan_dominance", "caliphate_restored"],
+            "conquered_nations": ["greece", "bulgaria", "syria", "iraq"],
+            "government": "Fascist",
+            "stability": 60,
+            "war_support": 70,
+            "military_strength": 60,
+            "year_min": 1943,
+            "control_straits": True
+        },
+        "type": "victory"
+    },
+    "turkish_neutrality_triumph": {
+        "name": "The Neutral Mediator",
+        "description": ("Through cautious diplomacy and strategic positioning, you have "
+                        "successfully maintained neutrality throughout the devastating global "
+                        "conflict. Your nation has prospered by trading with both sides while "
+                        "building up its industrial and military capacity. As Europe lies in ruins, "
+                        "Turkey stands poised to become a significant regional power in the post-war era."),
+        "requirements": {
+            "player_nation": "turkey",
+            "focus_completed": ["strategic_neutrality", "industrial_modernization", "diplomatic_balance"],
+            "not_at_war": True,
+            "stability": 80,
+            "industrial_power": 40,
+            "trade_agreements_count": 4,
+            "year_min": 1944,
+            "world_tension": 70
+        },
+        "type": "victory"
+    },
+    "turkish_kemalist_revolution": {
+        "name": "The Second Kemalist Revolution",
+        "description": "Inspired by Atatürk's legacy, you have led Turkey through a radical modernization that surpasses even the founder's achievements. Turkey has become a beacon of secular democracy and technological progress in the region.",
+        "requirements": {
+            "player_nation": "turkey",
+            "government": "Democratic",
+            "focus_completed": ["secular_modernization", "technological_advancement", "educational_reform"],
+            "stability": 85,
+            "industrial_power": 50,
+            "research_completed": 15,
+            "year_min": 1943
+        },
+        "type": "victory"
+    },
+    "turkish_balkan_federation": {
+        "name": "The Balkan Federation",
+        "description": "Rather than conquest, you have united the Balkan nations in a peaceful federation with Turkey as the senior partner. This alliance provides mutual defense and economic cooperation while preserving each nation's sovereignty.",
+        "requirements": {
+            "player_nation": "turkey",
+            "focus_completed": ["balkan_cooperation", "economic_integration"],
+            "alliance_with": ["bulgaria", "greece", "yugoslavia"],
+            "not_at_war": True,
+            "stability": 70,
+            "faction_leader": True
+        },
+        "type": "victory"
+    },
+
+    # Sweden Endings
+    "nordic_union": {
+        "name": "The Nordic Union",
+        "description": "You have united the Nordic countries under a defensive alliance that has successfully maintained independence throughout the war. This 'Third Way' between the warring powers has preserved Scandinavian democracy and prosperity while much of Europe burns.",
+        "requirements": {
+            "player_nation": "sweden",
+            "focus_completed": ["nordic_defense_pact", "scandinavian_cooperation", "unified_command"],
+            "alliance_with": ["finland", "norway", "denmark"],
+            "not_conquered": ["finland", "norway", "denmark"],
+            "stability": 80,
+            "faction_leader": True,
+            "military_strength": 40,
+            "year_min": 1942,
+            "trade_agreements_count": 3
+        },
+        "type": "victory"
+    },
+    "swedish_iron_giant": {
+        "name": "The Iron Giant",
+        "description": "You have leveraged Sweden's vast iron resources to build a powerful industrial base and military. By carefully balancing relations with all major powers while remaining officially neutral, your nation has emerged from the war as one of the wealthiest and most stable in Europe, poised to play a major role in post-war reconstruction.",
+        "requirements": {
+            "player_nation": "sweden",
+            "focus_completed": ["expand_mining_operations", "industrial_self_sufficiency", "export_economy"],
+            "stability": 90,
+            "not_at_war": True,
+            "industrial_power": 60,
+            "resources": {"steel": 100},
+            "trade_agreements_count": 5,
+            "year_min": 1944,
+            "economic_strength": 80
+        },
+        "type": "victory"
+    },
+    "swedish_welfare_state": {
+        "name": "The Nordic Model",
+        "description": "Sweden has pioneered a new form of democratic socialism that balances free markets with comprehensive social welfare. This 'Third Way' has created unprecedented prosperity and equality, making Sweden a model for the post-war world.",
+        "requirements": {
+            "player_nation": "sweden",
+            "government": "Democratic",
+            "focus_completed": ["social_democracy", "welfare_reforms", "mixed_economy"],
+            "stability": 95,
+            "not_at_war": True,
+            "industrial_power": 50,
+            "year_min": 1943
+        },
+        "type": "victory"
+    },
+
+    # Nationalist China Endings
+    "china_unified": {
+        "name": "China Unified",
+        "description": "After years of struggle against both Japanese invaders and Communist insurgents, your Nationalist government has reunified China under its banner. With the Japanese expelled from the mainland and the Communist threat neutralized, China stands ready to take its place as a major power in the post-war order.",
+        "requirements": {
+            "player_nation": "nationalist_china",
+            "focus_completed": ["anti_communist_campaign", "modernize_military", "national_reconstruction"],
+            "conquered_nations": ["communist_china", "manchukuo"],
+            "not_conquered": ["nationalist_china"],
+            "stability": 60,
+            "war_support": 70,
+            "military_strength": 50,
+            "industrial_power": 30,
+            "year_min": 1943,
+            "foreign_support": ["usa", "uk"]
+        },
+        "type": "victory"
+    },
+    "chinese_democracy": {
+        "name": "The Chinese Republic",
+        "description": "Your Nationalist government has successfully implemented democratic reforms while maintaining stability and territorial integrity. With support from Western democracies, China has emerged from conflict as a democratic nation with growing economic strength and international respect.",
+        "requirements": {
+            "player_nation": "nationalist_china",
+            "focus_completed": ["constitutional_reforms", "american_aid_program", "democratic_institutions"],
+            "government": "Democratic",
+            "stability": 80,
+            "war_support": 50,
+            "industrial_power": 25,
+            "relation_with": {"usa": 70, "uk": 50},
+            "year_min": 1944,
+            "not_at_war": True
+        },
+        "type": "victory"
+    },
+    "greater_east_asia": {
+        "name": "Co-Prosperity Sphere Leader",
+        "description": "In a shocking turn of events, you have joined Japan's Greater East Asia Co-Prosperity Sphere and become its dominant partner. Taking advantage of Japan's weakened position later in the war, your China has essentially taken control of the alliance, establishing itself as the preeminent power in East Asia.",
+        "requirements": {
+            "player_nation": "nationalist_china",
+            "focus_completed": ["sino_japanese_cooperation", "asian_leadership"],
+            "alliance_with": ["japan"],
+            "stability": 60
+        },
+        "type": "victory"
+    },
+    
+    # United States Endings
+    "american_arsenal_democracy": {
+        "name": "Arsenal of Democracy",
+        "description": "The United States has emerged as the dominant global superpower, leading the Allies to total victory. American industrial might and democratic values now shape the post-war world order.",
+        "requirements": {
+            "player_nation": "usa",
+            "government": "Democratic",
+            "focus_completed": ["lend_lease", "war_production", "global_leadership"],
+            "faction_leader": True,
+            "conquered_nations": ["germany", "japan"],
+            "stability": 80,
+            "industrial_power": 200,
+            "year_min": 1945,
+            "nuclear_weapons": True
+        },
+        "type": "victory"
+    },
+    "american_isolationist_fortress": {
+        "name": "Fortress America",
+        "description": "America has successfully remained isolated from foreign entanglements while building the most powerful military and economy in the world. The Monroe Doctrine has been extended globally.",
+        "requirements": {
+            "player_nation": "usa",
+            "focus_completed": ["america_first", "hemispheric_defense", "continental_fortress"],
+            "not_at_war": True,
+            "stability": 90,
+            "industrial_power": 150,
+            "military_strength": 100,
+            "year_min": 1944,
+            "trade_agreements_count": 10
+        },
+        "type": "victory"
+    },
+    "american_communist_revolution": {
+        "name": "The American Soviet Republic",
+        "description": "In a stunning turn of events, communist forces have triumphed in America. The United Socialist States of America now stands as a beacon of workers' revolution in the Western Hemisphere.",
+        "requirements": {
+            "player_nation": "usa",
+            "government": "Communist",
+            "focus_completed": ["workers_revolution", "proletarian_dictatorship", "red_america"],
+            "stability": 60,
+            "civil_war_won": True,
+            "alliance_with": ["ussr"],
+            "year_min": 1943
+        },
+        "type": "victory"
+    },
+    
+    # Soviet Union Endings
+    "soviet_world_revolution": {
+        "name": "Global Socialist Revolution",
+        "description": "The Red Army has swept across Europe and beyond, establishing communist governments worldwide. Stalin's vision of global revolution has been achieved under your leadership.",
+        "requirements": {
+            "player_nation": "ussr",
+            "government": "Communist",
+            "focus_completed": ["permanent_revolution", "global_communism", "red_europe"],
+            "conquered_nations": ["germany", "poland", "france", "uk"],
+            "faction_leader": True,
+            "stability": 70,
+            "war_support": 80,
+            "year_min": 1946,
+            "puppet_states_count": 8
+        },
+        "type": "victory"
+    },
+    "soviet_defensive_victory": {
+        "name": "Fortress of Socialism",
+        "description": "The Soviet Union has successfully defended socialism in one country, repelling all invasions while building a powerful industrial state that serves as a beacon for workers worldwide.",
+        "requirements": {
+            "player_nation": "ussr",
+            "government": "Communist",
+            "focus_completed": ["socialism_in_one_country", "defensive_buildup", "industrial_might"],
+            "not_conquered": ["ussr"],
+            "stability": 80,
+            "industrial_power": 120,
+            "military_strength": 100,
+            "year_min": 1944
+        },
+        "type": "victory"
+    },
+    "soviet_tsarist_restoration": {
+        "name": "The Restored Russian Empire",
+        "description": "In an extraordinary reversal, the Romanov dynasty has been restored to power. The new Tsar rules over a vast empire stretching from Europe to the Pacific.",
+        "requirements": {
+            "player_nation": "ussr",
+            "government": "Monarchist",
+            "focus_completed": ["white_restoration", "romanov_return", "imperial_reconstruction"],
+            "stability": 75,
+            "civil_war_won": True,
+            "conquered_nations": ["poland", "finland"],
+            "year_min": 1943
+        },
+        "type": "victory"
+    },
+    
+    # United Kingdom Endings
+    "british_empire_triumphant": {
+        "name": "The Sun Never Sets",
+        "description": "The British Empire has not only survived but emerged stronger than ever. With the Axis defeated and the Empire intact, Britain remains the dominant global power.",
+        "requirements": {
+            "player_nation": "uk",
+            "government": "Democratic",
+            "focus_completed": ["imperial_federation", "royal_navy_supremacy", "commonwealth_unity"],
+            "faction_leader": True,
+            "conquered_nations": ["germany", "italy"],
+            "not_conquered": ["india", "australia", "canada", "south_africa"],
+            "stability": 80,
+            "naval_supremacy": True,
+            "year_min": 1945
+        },
+        "type": "victory"
+    },
+    "british_socialist_commonwealth": {
+        "name": "The Socialist Commonwealth",
+        "description": "Labour's radical reforms have transformed the Empire into a socialist commonwealth of equal nations. The old imperial system has given way to voluntary cooperation based on shared socialist values.",
+        "requirements": {
+            "player_nation": "uk",
+            "government": "Communist",
+            "focus_completed": ["labour_revolution", "socialist_empire", "decolonization"],
+            "stability": 70,
+            "alliance_with": ["india", "australia", "canada"],
+            "year_min": 1944
+        },
+        "type": "victory"
+    },
+    
+    # France Endings
+    "french_empire_reborn": {
+        "name": "La Grande Nation Restored",
+        "description": "France has reclaimed its position as the dominant continental power. The spirit of Napoleon lives on as French influence spreads across Europe and beyond.",
+        "requirements": {
+            "player_nation": "france",
+            "focus_completed": ["grande_armee", "continental_system", "french_hegemony"],
+            "conquered_nations": ["germany", "italy", "spain"],
+            "stability": 75,
+            "military_strength": 80,
+            "year_min": 1944
+        },
+        "type": "victory"
+    },
+    "french_popular_front_triumph": {
+        "name": "The People's Republic of France",
+        "description": "The Popular Front has achieved its ultimate victory, establishing a socialist republic that serves as a model for progressive movements worldwide.",
+        "requirements": {
+            "player_nation": "france",
+            "government": "Communist",
+            "focus_completed": ["popular_front_victory", "socialist_reconstruction", "workers_state"],
+            "stability": 80,
+            "alliance_with": ["ussr", "spain"],
+            "year_min": 1943
+        },
+        "type": "victory"
+    },
+    
+    # Japan Endings
+    "japanese_pacific_empire": {
+        "name": "Empire of the Rising Sun",
+        "description": "Japan has achieved total domination of the Pacific, establishing the Greater East Asia Co-Prosperity Sphere under Japanese leadership. The Western colonial powers have been expelled from Asia.",
+        "requirements": {
+            "player_nation": "japan",
+            "government": "Fascist",
+            "focus_completed": ["greater_east_asia", "pacific_conquest", "divine_wind"],
+            "conquered_nations": ["china", "philippines", "netherlands_east_indies", "australia"],
+            "stability": 70,
+            "war_support": 80,
+            "naval_supremacy": True,
+            "year_min": 1944
+        },
+        "type": "victory"
+    },
+    "japanese_constitutional_monarchy": {
+        "name": "The Peaceful Empire",
+        "description": "Japan has embraced constitutional democracy while maintaining the Emperor. This peaceful path has led to prosperity and respect among the community of nations.",
+        "requirements": {
+            "player_nation": "japan",
+            "government": "Democratic",
+            "focus_completed": ["constitutional_reforms", "peaceful_expansion", "democratic_empire"],
+            "stability": 85,
+            "not_at_war": True,
+            "industrial_power": 60,
+            "year_min": 1943
+        },
+        "type": "victory"
+    },
+
+    # Communist China Endings
+    "peoples_republic": {
+        "name": "The People's Republic of China",
+        "description": "Your Chinese Communist Party has triumphed in the civil war, establishing the People's Republic of China. Under Chairman Mao's leadership, the new communist state is implementing sweeping land reforms and industrialization programs while consolidating control over the vast nation.",
+        "requirements": {
+            "player_nation": "communist_china",
+            "focus_completed": ["peoples_war", "defeat_nationalists", "land_reform", "cultural_revolution"],
+            "conquered_nations": ["nationalist_china", "tibet"],
+            "government": "Communist",
+            "stability": 60,
+            "war_support": 80,
+            "industrial_power": 35,
+            "year_min": 1949,
+            "puppet_states_count": 2
+        },
+        "type": "victory"
+    },
+    "sino_soviet_alliance": {
+        "name": "Sino-Soviet Alliance",
+        "description": "You have formed a powerful alliance with the Soviet Union, creating a unified communist bloc that spans the Eurasian continent. With Soviet industrial aid and military support, your China is rapidly developing into a formidable power that will shape the future of Asia and the world.",
+        "requirements": {
+            "player_nation": "communist_china",
+            "focus_completed": ["soviet_advisors", "socialist_industrialization", "fraternal_assistance"],
+            "alliance_with": ["ussr", "mongolia"],
+            "stability": 70,
+            "industrial_power": 40,
+            "military_strength": 60,
+            "relation_with": {"ussr": 80},
+            "year_min": 1950
+        },
+        "type": "victory"
+    },
+    "third_way_socialism": {
+        "name": "The Third Way",
+        "description": "You have charted your own unique path to socialism, independent of Soviet influence. By balancing pragmatic economic policies with revolutionary ideology, your China has created a distinct model of development that maintains communist principles while adapting to Chinese realities.",
+        "requirements": {
+            "player_nation": "communist_china",
+            "focus_completed": ["self_reliance", "chinese_characteristics", "market_socialism"],
+            "stability": 80,
+            "not_at_war": True,
+            "industrial_power": 45,
+            "economic_strength": 60,
+            "year_min": 1952,
+            "research_completed": 10
+        },
+        "type": "victory"
+    },
+    "maoist_global_revolution": {
+        "name": "Maoist World Revolution",
+        "description": "Your revolutionary model has spread beyond China's borders, inspiring peasant uprisings and communist movements worldwide. The Maoist path has become the dominant form of revolutionary socialism.",
+        "requirements": {
+            "player_nation": "communist_china",
+            "focus_completed": ["peasant_revolution", "third_world_solidarity", "continuous_revolution"],
+            "government": "Communist",
+            "alliance_with": ["vietnam", "korea"],
+            "stability": 65,
+            "war_support": 85,
+            "puppet_states_count": 4,
+            "year_min": 1960
+        },
+        "type": "victory"
+    },
+
+    # Ultranationalist Endings for Each Nation
+    "greater_german_reich": {
+        "name": "The Greater Germanic Reich",
+        "description": "You have achieved Hitler's ultimate vision - a vast empire stretching from the Atlantic to the Urals. All opposition has been crushed, and Germanic peoples dominate Europe. The New Order has been established, and the Third Reich will last a thousand years.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Fascist",
+            "conquered_nations": ["france", "poland", "belgium", "netherlands", "denmark", "norway", "yugoslavia", "greece", "ussr"],
+            "year_min": 1943
+        },
+        "type": "victory"
+    },
+    "italian_empire_reborn": {
+        "name": "The New Roman Empire",
+        "description": "You have fulfilled Mussolini's promise to restore the glory of ancient Rome. Italian dominance extends across the Mediterranean, with control of North Africa, the Balkans, and parts of the Middle East. The Mediterranean has truly become Mare Nostrum - 'Our Sea'.",
+        "requirements": {
+            "player_nation": "italy",
+            "government": "Fascist",
+            "conquered_nations": ["france", "greece", "yugoslavia", "turkey"],
+            "focus_completed": ["roman_ambitions"]
+        },
+        "type": "victory"
+    },
+    "rising_sun_ascendant": {
+        "name": "Empire of the Rising Sun",
+        "description": "You have established complete dominance over East Asia and the Pacific. Western colonial powers have been expelled from their territories, and Japan now controls the vast resources of China, Southeast Asia, and the Pacific islands. The Greater East Asia Co-Prosperity Sphere has become reality.",
+        "requirements": {
+            "player_nation": "japan",
+            "government": "Fascist",
+            "conquered_nations": ["china", "philippines", "netherlands_east_indies", "malaya"],
+            "focus_completed": ["greater_east_asia"]
+        },
+        "type": "victory"
+    },
+    "soviet_european_revolution": {
+        "name": "European Soviet Revolution", 
+        "description": "You have fulfilled Marx's prediction of world revolution. Your Red Army tanks have rolled across Europe, toppling capitalist governments and establishing workers' states. With Germany crushed and Europe turned red, the tide of communism is unstoppable.",
+        "requirements": {
+            "player_nation": "ussr",
+            "government": "Communist",
+            "conquered_nations": ["germany", "poland", "romania", "hungary", "czechoslovakia"],
+            "focus_completed": ["world_revolution"]
+        },
+        "type": "victory"
+    },
+    "british_empire_preserved": {
+        "name": "The Sun Never Sets",
+        "description": "Against all odds, you have not only survived but have emerged stronger than before. With continental enemies defeated and the Empire preserved, Britain remains the dominant global power. The sun shall never set on your British Empire.",
+        "requirements": {
+            "player_nation": "uk",
+            "focus_completed": ["imperial_federation", "secure_empire"],
+            "conquered_nations": ["germany", "italy"],
+            "not_conquered": ["india", "malaya", "egypt"]
+        },
+        "type": "victory"
+    },
+    "polish_intermarium": {
+        "name": "The Intermarium",
+        "description": "You have achieved Poland's long-held dream of creating a federation of Central and Eastern European states as a buffer between Germany and Russia. This 'Międzymorze' alliance stretches from the Baltic to the Black Sea, with Poland as its leader.",
+        "requirements": {
+            "player_nation": "poland",
+            "government": "Military",
+            "focus_completed": ["intermarium_alliance"],
+            "conquered_nations": ["lithuania", "belarus"],
+            "alliance_with": ["romania", "czechoslovakia", "hungary"]
+        },
+        "type": "victory"
+    },
+    "turkish_neo_ottoman": {
+        "name": "Neo-Ottoman Caliphate",
+        "description": "You have reclaimed Turkey's Ottoman legacy, expanding throughout the Middle East and North Africa. The Caliphate has been restored, and Turkish influence extends across the former Ottoman territories. Istanbul once again is the center of a powerful Islamic empire.",
+        "requirements": {
+            "player_nation": "turkey",
+            "government": "Fascist",
+            "focus_completed": ["restore_caliphate", "ottoman_ambitions"],
+            "conquered_nations": ["syria", "iraq", "greece", "egypt"]
+        },
+        "type": "victory"
+    },
+    "spanish_falangist_empire": {
+        "name": "The Falangist Empire",
+        "description": "Under Franco's leadership, you have rebuilt Spain's colonial empire and established it as a major European power. With territories in Africa, control of Gibraltar, and influence across Latin America, Spain has reclaimed its place among the world's great powers.",
+        "requirements": {
+            "player_nation": "spain",
+            "government": "Fascist",
+            "focus_completed": ["falangist_state", "colonial_restoration"],
+            "conquered_nations": ["portugal"]
+        },
+        "type": "victory"
+    },
+    "swedish_nordic_empire": {
+        "name": "Nordic Empire",
+        "description": "You have abandoned Sweden's historical neutrality and established dominance over all Nordic countries. This new regional power controls the Baltic Sea and the valuable resources of Scandinavia, creating a formidable empire in Northern Europe.",
+        "requirements": {
+            "player_nation": "sweden",
+            "government": "Fascist",
+            "focus_completed": ["swedish_militarism"],
+            "conquered_nations": ["norway", "finland", "denmark"]
+        },
+        "type": "victory"
+    },
+    "greater_china": {
+        "name": "Greater Chinese Empire",
+        "description": "You have unified all Chinese territories and extended your influence throughout East Asia. Under the iron rule of the Kuomintang, China has become an ultranationalist power that has driven out foreign influences and reclaimed its position as the Middle Kingdom.",
+        "requirements": {
+            "player_nation": "nationalist_china",
+            "government": "Fascist",
+            "focus_completed": ["chinese_nationalism", "reclaim_lost_territories"],
+            "conquered_nations": ["communist_china", "tibet", "mongolia"]
+        },
+        "type": "victory"
+    },
+    "communist_asia": {
+        "name": "Communist Federation of Asia",
+        "description": "Your revolution has spread beyond China's borders, with communist regimes established throughout East and Southeast Asia. Under your leadership, this federation of communist states has become a powerful bloc rivaling both the Soviet Union and Western powers.",
+        "requirements": {
+            "player_nation": "communist_china",
+            "government": "Communist",
+            "focus_completed": ["permanent_revolution", "asian_communism"],
+            "conquered_nations": ["nationalist_china", "korea", "thailand"]
+        },
+        "type": "victory"
+    },
+    "philippine_dominance": {
+        "name": "Philippine Dominance",
+        "description": "You have led the Philippines from colonial rule to become a dominant power in Southeast Asia. Building on American support and your strategic position, you have established military and economic control over neighboring territories and waters.",
+        "requirements": {
+            "player_nation": "philippines",
+            "focus_completed": ["philippine_nationalism", "pacific_security"],
+            "conquered_nations": ["malaya", "netherlands_east_indies"]
+        },
+        "type": "victory"
+    },
+    "thai_southeast_asia": {
+        "name": "Thai Dominion",
+        "description": "You have reclaimed Thailand's historical territories and established your nation as the dominant power in mainland Southeast Asia. Under your military leadership, Thailand controls the strategic regions of Indochina and the Malay Peninsula.",
+        "requirements": {
+            "player_nation": "thailand",
+            "government": "Military",
+            "focus_completed": ["greater_thailand", "military_supremacy"],
+            "conquered_nations": ["burma", "french_indochina", "malaya"]
+        },
+        "type": "victory"
+    },
+    "dutch_colonial_fortress": {
+        "name": "Colonial Fortress",
+        "description": "You have broken free from the Netherlands and established the East Indies as a powerful independent state controlling the resource-rich islands of Southeast Asia. Your strategic position and vast resources make you the gatekeeper of Asian trade.",
+        "requirements": {
+            "player_nation": "netherlands_east_indies",
+            "focus_completed": ["resource_dominance", "naval_supremacy"],
+            "conquered_nations": ["malaya", "philippines"]
+        },
+        "type": "victory"
+    },
+    "australian_pacific_dominion": {
+        "name": "Pacific Dominion",
+        "description": "You have led Australia out from Britain's shadow to establish its own empire in the South Pacific. With control of numerous islands and influence throughout the region, Australia has become a major power in its own right under your leadership.",
+        "requirements": {
+            "player_nation": "australia",
+            "focus_completed": ["australian_imperialism", "pacific_strategy"],
+            "conquered_nations": ["netherlands_east_indies", "new_guinea"]
+        },
+        "type": "victory"
+    },
+    "marx_revival": {
+        "name": "The Revival of Karl Marx's Dreams of a Free Deutschland",
+        "description": "Your Communist revolution has succeeded in Germany! The workers have cast off their chains and you have established a true proletarian state. Karl Marx's vision of a communist Germany has been realized under your leadership, and the revolution is spreading across Europe.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Communist",
+            "stability": 65,
+            "conquered_nations": ["poland"],
+            "in_faction_with": ["ussr"]
+        },
+        "type": "victory"
+    },
+    "center_of_democracy": {
+        "name": "The Center of Democracy",
+        "description": "You have transformed Germany into a beacon of democratic values in the heart of Europe. Rejecting both fascism and communism, you have established a stable, prosperous democratic state that serves as a model for other nations.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Democratic",
+            "stability": 80,
+            "war_support": 25,
+            "year_min": 1939
+        },
+        "type": "victory"
+    },
+    "european_union": {
+        "name": "Europe Under a Union",
+        "description": "Rather than conquest, you have led Germany in the formation of a peaceful European Union. Nations have voluntarily joined this new economic and political alliance you've created, fostering unprecedented cooperation and prosperity across the continent.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Democratic",
+            "faction_members_count": 5,
+            "year_min": 1940
+        },
+        "type": "victory"
+    },
+    "kaiser_return": {
+        "name": "Kaiser's Return",
+        "description": "You have restored the monarchy! Under your leadership, the Hohenzollern dynasty once again sits on the German throne. The Kaiser rules with a firm but fair hand, and you have returned Germany to its imperial glory while maintaining modern governance.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Monarchist",
+            "stability": 70,
+            "completed_focus": "restore_kaiser"
+        },
+        "type": "victory"
+    },
+    "greater_germanic_reich": {
+        "name": "The Greater Germanic Reich",
+        "description": "You have realized the dream of a unified Germanic Empire! All German-speaking peoples and territories are now united under the glorious banner of your Reich. Austria, Switzerland, the Sudetenland, Alsace-Lorraine, Luxembourg, and German enclaves throughout Europe have been incorporated into a single, mighty Germanic state that dominates Central Europe. The borders now reflect the true ethnic and cultural boundaries of the Germanic peoples. This is not merely a conquest but a historical reunification, fulfilling the ancient vision of a united Volk. With the combined industrial might, cultural heritage, and military power of all Germanic peoples, you have created a new continental superpower that will shape the destiny of Europe for a thousand years to come.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Fascist",
+            "conquered_nations": ["austria", "switzerland", "czechoslovakia", "luxembourg", "liechtenstein"],
+            "partial_control": ["france", "poland", "belgium", "netherlands", "denmark"],
+            "stability": 70,
+            "war_support": 80,
+            "year_min": 1940,
+            "completed_focus": "anschluss"
+        },
+        "type": "victory"
+    },
+    "global_socialist_republic": {
+        "name": "Global Socialist Republic",
+        "description": "Under your leadership, Germany has become the center of a worldwide socialist revolution. Together with the Soviet Union, you have spread communism across Europe and beyond. The workers of the world have truly united, just as Marx and Engels envisioned.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Communist",
+            "conquered_nations": ["france", "italy", "poland"],
+            "in_faction_with": ["ussr"],
+            "year_min": 1942
+        },
+        "type": "victory"
+    },
+    "new_rhineland": {
+        "name": "The New Rhineland Federation",
+        "description": "Under your guidance, a new democratic federation has emerged in the heart of Europe, centered around the Rhine river. You have led Germany to embrace democratic values and form a peaceful federation with its western neighbors, creating a powerful economic and political union. This federation you've built serves as a bulwark against both fascism and communism, ensuring peace and prosperity for its citizens. The Rhineland, once a contested region, now stands as the symbol of European cooperation and unity.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Democratic",
+            "in_faction_with": ["france", "belgium", "netherlands", "luxembourg"],
+            "stability": 85,
+            "war_support": 30,
+            "year_min": 1942,
+            "completed_focus": "european_cooperation"
+        },
+        "type": "victory"
+    },
+    "kaisers_great_return": {
+        "name": "Kaiser's Great Return and the New Order of Deutsch",
+        "description": "You have restored the German monarchy with unprecedented power. Under your leadership, Kaiser Wilhelm III rules a new German Reich that encompasses much of Europe. This neo-feudal empire you've created combines modern industry with traditional aristocratic values, creating a unique socioeconomic system that rejects both communism and liberal democracy.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Monarchist",
+            "stability": 80,
+            "conquered_nations": ["france", "poland", "belgium", "netherlands"],
+            "year_min": 1941
+        },
+        "type": "victory"
+    },
+    "marxist_united_earth": {
+        "name": "The New Red Rising Nation of the Marxist State of United Earth",
+        "description": "What began as your German revolution has transformed into a global communist utopia under your leadership. The boundaries between nations have dissolved as you've inspired workers everywhere to rise up against capitalism. Earth is now unified under a single Marxist government, with Berlin as its capital. Under your guidance, humanity stands ready to spread the revolution to the stars.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Communist",
+            "conquered_nations": ["france", "italy", "uk", "poland"],
+            "in_faction_with": ["ussr"],
+            "year_min": 1944
+        },
+        "type": "victory"
+    },
+    "popes_roman_empire": {
+        "name": "Pope's New Roman Empire: Sacred Germanic Roman Empire's Return",
+        "description": "In a shocking turn of events, you have formed an alliance between Germany and the Vatican to create a new Holy Roman Empire. This theocratic state you've established unites German military might with Catholic spiritual authority. Under your arrangement, the Pope and Kaiser rule as dual sovereigns over a Europe returning to faith-based governance in the modern age.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Monarchist",
+            "stability": 75,
+            "conquered_nations": ["italy", "france", "poland", "austria"],
+            "year_min": 1942
+        },
+        "type": "victory"
+    },
+    "one_banner_union": {
+        "name": "New Union of German People Under One Banner",
+        "description": "Under your leadership, all German-speaking peoples and territories have been united under a single flag. This Greater Germania you've created includes not just Germany and Austria, but parts of Switzerland, Poland, Czechoslovakia, and beyond. Cultural unity and shared language form the foundation of this new ethnic state that fulfills the dream of a unified German people.",
+        "requirements": {
+            "player_nation": "germany",
+            "conquered_nations": ["austria", "czechoslovakia", "poland"],
+            "stability": 70,
+            "year_min": 1940
+        },
+        "type": "victory"
+    },
+    "center_of_germania": {
+        "name": "Center of Germania: Union of Germanic Languages Nation",
+        "description": "Beyond mere German unity, you've created a pan-Germanic federation uniting all Germanic peoples. Germans, Dutch, Danes, Swedes, Norwegians, and even the English are now part of a single cultural and political entity bound by their shared linguistic heritage. This Germanic Union you've established stands as a formidable power bloc dominating northern Europe.",
+        "requirements": {
+            "player_nation": "germany",
+            "conquered_nations": ["denmark", "norway", "sweden", "netherlands", "belgium"],
+            "stability": 65,
+            "year_min": 1942
+        },
+        "type": "victory"
+    },
+    "satanist_theocracy": {
+        "name": "Union for the Hell: Germanic Satanist Theocracy",
+        "description": "What began as your political reform has devolved into something far darker. Under your influence, a radical occult movement has seized control of Germany, establishing a state-sponsored satanic church. Ancient pagan rituals blend with modern fascist aesthetics in this bizarre theocracy you've created that terrifies and fascinates the world in equal measure.",
+        "requirements": {
+            "player_nation": "germany",
+            "stability": 50,
+            "war_support": 90,
+            "year_min": 1940,
+            "internal_conflicts": 1
+        },
+        "type": "victory"
+    },
+
+    # Bad Endings
+    "permanent_civil_war": {
+        "name": "Permanent Civil War",
+        "description": "Under your leadership, Germany has descended into chaos. Multiple factions fight for control, and the nation is torn apart by a never-ending civil war. Your dream of a unified Germany lies in ruins as warlords carve out territories across the former reich.",
+        "requirements": {
+            "player_nation": "germany",
+            "stability": 20,
+            "war_support": 90,
+            "internal_conflicts": 3
+        },
+        "type": "disaster"
+    },
+    "nuclear_annihilation": {
+        "name": "Nuclear Annihilation",
+        "description": "The war has escalated beyond all control under your leadership. Experimental atomic weapons have been deployed against German cities. Berlin is a radioactive crater, and millions are dead. The Germany you fought to build has effectively ceased to exist in the atomic fire.",
+        "requirements": {
+            "player_nation": "germany",
+            "war_with": ["usa", "uk"],
+            "year_min": 1945,
+            "world_tension": 90
+        },
+        "type": "disaster"
+    },
+    "soviet_occupation": {
+        "name": "Soviet Occupation",
+        "description": "The Red Army has swept across Germany, crushing all resistance. The Soviet flag flies over the ruins of Berlin, and Stalin's commissars impose a brutal communist regime. Your leadership has led Germany from one totalitarian system to another as your nation falls under Soviet control.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Fascist",
+            "at_war_with": ["ussr"],
+            "stability": 30,
+            "year_min": 1942
+        },
+        "type": "disaster"
+    },
+    "allied_partition": {
+        "name": "Allied Partition",
+        "description": "Germany has been utterly defeated by the Allied powers under your rule. The country you led is now divided into occupation zones, and its future as a unified nation is uncertain. German sovereignty is a thing of the past as foreign powers determine its fate, erasing your legacy.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Fascist",
+            "at_war_with": ["usa", "uk", "france"],
+            "stability": 25,
+            "year_min": 1943
+        },
+        "type": "disaster"
+    },
+    "economic_collapse": {
+        "name": "Economic Collapse",
+        "description": "Your policies have led to complete economic ruin. Hyperinflation has returned with a vengeance, unemployment is rampant, and the German mark is worthless. The society you attempted to rebuild breaks down as hunger and desperation drive people to extremes.",
+        "requirements": {
+            "player_nation": "germany",
+            "civilian_factories": 5,
+            "military_factories": 2,
+            "stability": 15,
+            "year_min": 1938
+        },
+        "type": "disaster"
+    },
+    "purge_backfire": {
+        "name": "The Purge Backfires",
+        "description": "Your attempts to consolidate power through purges have backfired catastrophically. Military officers, seeing the writing on the wall, staged a coup against your leadership. You were shot while trying to escape, and the Germany you tried to control now faces an uncertain future under military rule.",
+        "requirements": {
+            "player_nation": "germany",
+            "government": "Communist",
+            "completed_focus": "great_purge",
+            "stability": 30,
+            "war_support": 60
+        },
+        "type": "disaster"
+    },
+    "coup_detat": {
+        "name": "Coup d'Etat",
+        "description": "Elements of the military, dissatisfied with your leadership, have seized control of the government. You are under house arrest, and generals now dictate policy. Your vision for Germany dies as martial law is declared across the nation.",
+        "requirements": {
+            "stability": 25,
+            "war_support": 40,
+            "at_war": True
+        },
+        "type": "disaster"
+    },
+    "assassination": {
+        "name": "Leadership Assassination",
+        "description": "A successful assassination plot has ended your rule. As your body was carried from the Reich Chancellery, power struggles erupted among your lieutenants. Germany is leaderless as factions vie for control amid growing chaos.",
+        "requirements": {
+            "stability": 35,
+            "internal_conflicts": 2,
+            "year_min": 1939
+        },
+        "type": "disaster"
+    },
+    "failed_nation": {
+        "name": "Failed Nation",
+        "description": "Germany has collapsed as a coherent state. Economic mismanagement, political infighting, and military failures have left the country in ruins. Foreign powers carve up German territory, and the concept of Germany as a unified nation-state may be lost to history for generations.",
+        "requirements": {
+            "stability": 10,
+            "war_support": 20,
+            "year_min": 1940
+        },
+        "type": "disaster"
+    },
+    "permanent_german_partition": {
+        "name": "Permanent German Partition",
+        "description": "The division of Germany has become permanent. East and West Germany have solidified into separate states with different ideologies, economies, and alliances. The Berlin Wall stands as a physical manifestation of the Cold War, and German reunification seems an impossible dream.",
+        "requirements": {
+            "at_war_with": ["usa", "uk", "france", "ussr"],
+            "stability": 30,
+            "year_min": 1945
+        },
+        "type": "disaster"
+    },
+    "churchills_plan": {
+        "name": "Churchill's Pastoral Plan",
+        "description": "Following Germany's defeat, Churchill's extreme proposal to deindustrialize Germany and return it to a pastoral state has been implemented. Industrial machinery has been dismantled, factories demolished, and urban centers depopulated. Germany is now a rural agricultural nation with limited technology and industry.",
+        "requirements": {
+            "at_war_with": ["uk"],
+            "stability": 20,
+            "military_factories": 2,
+            "year_min": 1944
+        },
+        "type": "disaster"
+    },
+    "third_world_war": {
+        "name": "Third World War: Humanity's Last Day on Earth",
+        "description": "What began as a European conflict has escalated into global nuclear annihilation. Experimental atomic weapons have been deployed by multiple nations, resulting in unprecedented destruction. Human civilization itself now hangs in the balance as radiation and nuclear winter spread across the planet.",
+        "requirements": {
+            "at_war_with": ["usa", "uk", "france", "ussr"],
+            "war_support": 80,
+            "year_min": 1945
+        },
+        "type": "disaster"
+    },
+    "bavarian_independence": {
+        "name": "Failed Unification: Independent German States",
+        "description": "The German nation has fractured along regional lines. Bavaria, Saxony, Prussia, and other historical regions have declared independence, reverting to a pre-unification status quo. The dream of German unity that began in 1871 has ended, with the country now a patchwork of competing states.",
+        "requirements": {
+            "stability": 15,
+            "internal_conflicts": 3,
+            "year_min": 1939
+        },
+        "type": "disaster"
+    },
+    "rhineland_breakaway": {
+        "name": "The New Rhineland Republic",
+        "description": "The western regions of Germany have broken away to form the independent Rhineland Republic. With support from France and the Low Countries, this new democratic state has renounced German nationalism and embraced European integration. The remainder of Germany grows increasingly isolated.",
+        "requirements": {
+            "stability": 25,
+            "internal_conflicts": 2,
+            "year_min": 1940
+        },
+        "type": "disaster"
+    },
+    "morgenthau_germany": {
+        "name": "Morgenthau's Agricultural Germany",
+        "description": "The Morgenthau Plan has been fully implemented. Germany has been completely deindustrialized and converted into an agricultural country. Heavy industry is forbidden, cities have been depopulated, and millions of Germans now work as farmers. The great industrial power of Europe is no more.",
+        "requirements": {
+            "at_war_with": ["usa"],
+            "stability": 20,
+            "military_factories": 1,
+            "year_min": 1944
+        },
+        "type": "disaster"
+    },
+    "churchill_plan": {
+        "name": "Churchill's Plan: The United States of Europe",
+        "description": "Winston Churchill's vision for post-war Germany has been realized. Rather than punitive measures, Germany has been reformed and integrated into a new European federation. This 'United States of Europe' includes former rivals working together under democratic principles, with Germany serving as the industrial and economic core. Though initially under Allied oversight, Germany has retained its cultural identity and industrial capacity, while being firmly embedded in a cooperative European framework designed to prevent future conflicts. The old militarism has been replaced by economic cooperation and shared prosperity.",
+        "requirements": {
+            "conquered_by": ["united_kingdom"],
+            "government": "Democratic",
+            "stability": 65,
+            "world_tension": 10,
+            "year_min": 1945
+        },
+        "type": "special"
+    },
+    "intermarium_federation": {
+        "name": "The Intermarium Federation",
+        "description": "Against all odds, Poland has managed to realize Józef Piłsudski's grand vision of an Intermarium - a federation of nations stretching from the Baltic to the Black Sea. This alliance of Central and Eastern European nations, led by Poland, provides a powerful counterbalance to both German and Soviet ambitions. With shared military coordination, economic integration, and diplomatic unity, the federation has become a significant European power, ensuring security and prosperity for all its member states.",
+        "requirements": {
+            "player_nation": "poland",
+            "government": "Democratic",
+            "stability": 70,
+            "war_support": 50,
+            "year_min": 1942,
+            "faction_members_count": 5,
+            "completed_focus": "intermarum_alliance"
+        },
+        "type": "victory"
+    },
+    "polish_commonwealth_restored": {
+        "name": "The Polish-Lithuanian Commonwealth Reborn",
+        "description": "Through diplomatic skill and strategic vision, Poland has recreated a modern version of the once-great Polish-Lithuanian Commonwealth. Uniting Poland, Lithuania, Latvia, Estonia, and parts of Ukraine under a single federal monarchy, this new Commonwealth has reclaimed its historical position as a major European power. With a constitutional monarchy balancing central authority with regional autonomy, the Commonwealth combines traditional values with modern democratic principles, creating a powerful and stable force in Eastern Europe.",
+        "requirements": {
+            "player_nation": "poland",
+            "government": "Non-Aligned",
+            "stability": 75,
+            "war_support": 60,
+            "conquered_nations": ["lithuania", "latvia", "estonia"],
+            "partial_control": ["ukraine", "belarus"],
+            "completed_focus": "restore_polish_monarchy"
+        },
+        "type": "victory"
+    },
+    "yugoslavia_balkan_federation": {
+        "name": "The Balkan Federation",
+        "description": "Yugoslavia has successfully united the diverse peoples of the Balkans under a single federal state. This federation, built on principles of equality and workers' self-management, has created a unique socialist system distinct from the Soviet model. With its industrial base rapidly expanding and ethnic tensions largely resolved, the Balkan Federation has emerged as a significant European power, offering a third path between Western capitalism and Eastern state socialism.",
+        "requirements": {
+            "player_nation": "yugoslavia",
+            "government": "Communist",
+            "stability": 70,
+            "war_support": 40,
+            "conquered_nations": ["albania", "bulgaria"],
+            "partial_control": ["greece", "romania"],
+            "completed_focus": "balkan_federation"
+        },
+        "type": "victory"
+    },
+    "greater_yugoslavia": {
+        "name": "Greater Yugoslavia",
+        "description": "Under strong monarchical leadership, Yugoslavia has expanded its borders to encompass historical Serbian lands and strategic territories throughout the Balkans. This enlarged kingdom has established itself as the dominant power in Southeastern Europe, effectively balancing between the great powers while maintaining its independence. The royal dynasty presides over a centralized state that has achieved stability through firm governance and military strength.",
+        "requirements": {
+            "player_nation": "yugoslavia",
+            "government": "Non-Aligned",
+            "stability": 65,
+            "war_support": 70,
+            "conquered_nations": ["albania"],
+            "partial_control": ["greece", "bulgaria", "romania", "hungary"],
+            "completed_focus": "royal_dictatorship"
+        },
+        "type": "victory"
+    },
+    "yugoslavian_collapse": {
+        "name": "The Collapse of Yugoslavia",
+        "description": "Unable to manage its internal ethnic tensions, Yugoslavia has fractured into multiple warring states. The dream of South Slavic unity lies in ruins as nationalist movements have taken control in each region, leading to bitter conflicts and ethnic cleansing. Foreign powers have intervened to pursue their own interests, turning the Balkans once again into Europe's powder keg.",
+        "requirements": {
+            "player_nation": "yugoslavia",
+            "stability": 20,
+            "internal_conflicts": 3,
+            "at_war_with": ["germany", "italy"],
+            "year_min": 1940
+        },
+        "type": "disaster"
+    },
+    "benelux_federation": {
+        "name": "The Benelux Federation",
+        "description": "Belgium, the Netherlands, and Luxembourg have united to form a powerful federation at the heart of Europe. Building on their shared cultural and economic ties, this democratic federation has created a unified market, military, and foreign policy. By pooling their industrial and colonial resources, the Benelux Federation has emerged as a significant European power capable of standing alongside larger nations while maintaining peace and prosperity for its citizens.",
+        "requirements": {
+            "player_nation": "belgium",
+            "government": "Democratic",
+            "stability": 75,
+            "war_support": 40,
+            "conquered_nations": ["netherlands", "luxembourg"],
+            "completed_focus": "benelux_defense_agreement"
+        },
+        "type": "victory"
+    },
+    "belgian_colossus": {
+        "name": "The Belgian Colossus",
+        "description": "Belgium has risen from its position as a small neutral state to become a significant power in Europe. With expanded territories and close ties to Germany, Belgium now controls key industrial regions and strategic locations across Western Europe. The Belgian flag flies over parts of France and the Netherlands, creating a greater Belgian state that has finally achieved the power and recognition it has long desired.",
+        "requirements": {
+            "player_nation": "belgium",
+            "government": "Fascist",
+            "stability": 60,
+            "war_support": 70,
+            "partial_control": ["france", "netherlands"],
+            "completed_focus": "greater_belgium"
+        },
+        "type": "victory"
+    },
+    "congo_exploitation": {
+        "name": "The Belgian Colonial Exploitation",
+        "description": "Belgium has poured all its resources into exploiting the vast mineral wealth of the Congo. While this has resulted in enormous profits flowing back to Belgium, it has come at a terrible human cost. The colonial regime has implemented brutal labor policies, causing widespread suffering among the Congolese population. Belgium's economy is now almost entirely dependent on colonial resources, transforming the nation into a colonial parasite rather than a modern European state.",
+        "requirements": {
+            "player_nation": "belgium",
+            "stability": 30,
+            "completed_focus": "integrate_congo_resources",
+            "year_min": 1940
+        },
+        "type": "disaster"
+    },
+    "greater_dutch_kingdom": {
+        "name": "The Greater Dutch Kingdom",
+        "description": "The Netherlands has expanded its borders to include Flanders and parts of northern Germany, creating a unified Dutch-speaking nation. This greater Dutch state has become a significant power in northwestern Europe, with a strong economy based on trade, industry, and colonial resources. By leveraging its strategic position at the mouth of several key European rivers, the Greater Dutch Kingdom has secured its place as a respected middle power with significant influence in European affairs.",
+        "requirements": {
+            "player_nation": "netherlands",
+            "stability": 60,
+            "war_support": 70,
+            "completed_focus": "greater_netherlands",
+            "completed_focus2": "reclaim_frisian_islands"
+        },
+        "type": "victory"
+    },
+    "dutch_colonial_empire": {
+        "name": "The Dutch Colonial Empire",
+        "description": "The Netherlands has successfully secured and expanded its colonial holdings, creating one of the world's largest and most profitable colonial empires. The Dutch East Indies have been firmly integrated into the motherland's economy, providing vast resources and markets for Dutch goods. Through a combination of military strength and diplomatic skill, the Netherlands has managed to navigate the turbulent waters of global politics and preserve its global colonial network when other empires have faltered or collapsed.",
+        "requirements": {
+            "player_nation": "netherlands",
+            "stability": 70,
+            "completed_focus": "protect_east_indies",
+            "completed_focus2": "colonial_nationalism",
+            "year_min": 1942
+        },
+        "type": "victory"
+    },
+    "indonesian_independence": {
+        "name": "Indonesian Independence",
+        "description": "The Netherlands' attempt to grant limited autonomy to Indonesia has unexpectedly accelerated nationalist sentiment in the colony. As the Dutch found themselves increasingly entangled in European conflicts, Indonesian nationalist leaders seized the opportunity to declare independence. Unable to maintain control over its most valuable colony, the Netherlands has been forced to recognize Indonesian sovereignty, marking the beginning of the end for the once-mighty Dutch colonial empire and severely diminishing the Netherlands' status as a global power.",
+        "requirements": {
+            "player_nation": "netherlands",
+            "stability": 40,
+            "completed_focus": "indonesian_autonomy",
+            "at_war": True,
+            "year_min": 1942
+        },
+        "type": "disaster"
+    },
+    "roman_empire_restored": {
+        "name": "The New Roman Empire",
+        "description": "Under Mussolini's leadership, Italy has successfully reclaimed much of the territory of the ancient Roman Empire. Italian forces now control vast territories around the Mediterranean, from Spain to Greece, from North Africa to the Balkans. The Mediterranean has truly become Mare Nostrum—'Our Sea'—as Roman legions once again march through former provinces. Rome has been restored as the center of a great empire, with Mussolini as its Caesar, fulfilling the fascist dream of a reborn Roman glory and imperial destiny.",
+        "requirements": {
+            "player_nation": "italy",
+            "stability": 60,
+            "war_support": 80,
+            "completed_focus": "roman_empire",
+            "conquered_nations": ["greece", "yugoslavia"],
+            "partial_control": ["france", "egypt"]
+        },
+        "type": "victory"
+    },
+    "italian_strategic_independence": {
+        "name": "Italy's Independent Path",
+        "description": "Avoiding the fatal German alliance, Italy has charted its own course through the turbulent waters of European politics. By maintaining a careful balance between the major powers and developing its own sphere of influence in the Mediterranean and Balkans, Italy has emerged as a respected middle power with significant diplomatic leverage. Under Mussolini's pragmatic leadership, Italy has secured its national interests without the devastating consequences of a world war, achieving fascist goals of national greatness through strategic independence rather than destructive conflict.",
+        "requirements": {
+            "player_nation": "italy",
+            "stability": 70,
+            "completed_focus": "maintain_independence",
+            "year_min": 1942,
+            "not_at_war": True
+        },
+        "type": "victory"
+    },
+    "italian_civil_war": {
+        "name": "Italian Civil War",
+        "description": "Mussolini's regime has collapsed under the weight of military failures and economic hardship. The country has descended into civil war as fascists, communists, monarchists, and democrats battle for control of Italy's future. Former allies have betrayed each other, regions have declared independence, and foreign powers intervene to support their preferred factions. The Italian people suffer tremendously as their nation tears itself apart, with cities reduced to rubble and the countryside ravaged by competing armies. The dream of Italian greatness has given way to a nightmare of fratricidal conflict.",
+        "requirements": {
+            "player_nation": "italy",
+            "stability": 25,
+            "war_support": 30,
+            "at_war": True,
+            "year_min": 1941
+        },
+        "type": "disaster"
+    },
+    "greater_east_asia_prosperity": {
+        "name": "Greater East Asia Co-Prosperity Sphere",
+        "description": "Japan has successfully liberated East and Southeast Asia from Western colonial rule, establishing a new order under Japanese leadership. The vast resources of the region now flow to support Japanese industry and military might, while former colonies enjoy unprecedented economic development under Japanese guidance. From Korea to Indonesia, from the Philippines to Indochina, the Rising Sun flag flies proudly over a new Asian empire that has forever broken the chains of Western domination and established a new order based on Asian values and Japanese leadership.",
+        "requirements": {
+            "player_nation": "japan",
+            "stability": 70,
+            "completed_focus": "greater_east_asia",
+            "conquered_nations": ["indonesia", "malaysia"],
+            "partial_control": ["china"],
+            "year_min": 1942
+        },
+        "type": "victory"
+    },
+    "japanese_hegemony": {
+        "name": "The Pacific Century",
+        "description": "In a stunning reversal of power, Japan has defeated the United States and established complete hegemony over the Pacific Ocean. American territories like Hawaii, the Philippines, and Guam have fallen under Japanese control, while the US mainland itself has been forced to accept unfavorable peace terms. The humiliation of Pearl Harbor has been compounded by a series of decisive Japanese naval victories, forever shattering American power in Asia. With uncontested control of the Pacific and East Asia's resources, Japan has truly emerged as a global superpower, beginning what historians will call 'The Pacific Century.'",
+        "requirements": {
+            "player_nation": "japan",
+            "stability": 65,
+            "completed_focus": "strike_pearl_harbor",
+            "war_support": 80,
+            "conquered_nations": ["usa_pacific"],
+            "year_min": 1943
+        },
+        "type": "victory"
+    },
+    "asian_peace_treaty": {
+        "name": "The Tokyo Peace Treaty",
+        "description": "Through skillful diplomacy rather than destructive war, Japan has secured its position as East Asia's dominant power. By negotiating with Western powers from a position of strength while avoiding direct conflict, Japan has gained recognition for its special interests in China and Southeast Asia without the catastrophic costs of a Pacific war. Trade agreements favorable to Japan have secured access to vital resources, while military limitations on Western presence in Asia have removed threats to Japanese security. This diplomatic triumph has established Japan as a respected great power while preserving peace and prosperity.",
+        "requirements": {
+            "player_nation": "japan",
+            "stability": 80,
+            "completed_focus": "pacific_neutrality",
+            "not_at_war": True,
+            "year_min": 1942
+        },
+        "type": "victory"
+    },
+    "japanese_defeat": {
+        "name": "The Fire Bombing of Japan",
+        "description": "Japan's imperial ambitions have ended in catastrophic defeat. American bombers reign supreme in the skies over Japan, reducing its cities to ash with relentless firebombing campaigns. The once-mighty Imperial Navy lies at the bottom of the Pacific, while American forces advance inexorably toward the Home Islands. Food shortages, economic collapse, and a desperate military situation have created a humanitarian crisis of unprecedented scale. The dream of a Greater East Asia Co-Prosperity Sphere has given way to the nightmare of defeat, occupation, and national humiliation as Japan faces the prospect of unconditional surrender.",
+        "requirements": {
+            "player_nation": "japan",
+            "stability": 20,
+            "war_support": 30,
+            "at_war_with": ["usa", "uk"],
+            "year_min": 1944
+        },
+        "type": "disaster"
+    }
+}
+
+# Political Parties
+POLITICAL_PARTIES = {
+    "germany": {
+        "NSDAP": {
+            "name": "National Socialist German Workers' Party",
+            "ideology": "Fascist",
+            "leader": "Adolf Hitler",
+            "support": 65,
+            "description": "The ruling fascist party that promises to restore German greatness and expand living space for the German people."
+        },
+        "KPD": {
+            "name": "Communist Party of Germany",
+            "ideology": "Communist",
+            "leader": "Ernst Thälmann",
+            "support": 10,
+            "description": "Revolutionary communist party seeking to establish a worker's state and align with the Soviet Union."
+        },
+        "SPD": {
+            "name": "Social Democratic Party of Germany",
+            "ideology": "Democratic",
+            "leader": "Otto Wels",
+            "support": 15,
+            "description": "Democratic socialists advocating for workers' rights within a democratic framework."
+        },
+        "Zentrum": {
+            "name": "Centre Party",
+            "ideology": "Democratic",
+            "leader": "Ludwig Kaas",
+            "support": 5,
+            "description": "Catholic political party advocating for Christian democracy and moderate policies."
+        },
+        "DNVP": {
+            "name": "German National People's Party",
+            "ideology": "Monarchist",
+            "leader": "Alfred Hugenberg",
+            "support": 5,
+            "description": "Conservative nationalist party with monarchist tendencies and traditional values."
+        }
+    },
+    "usa_parties_1": {
+        "Democratic": {
+            "name": "Democratic Party",
+            "ideology": "Democratic",
+            "leader": "Franklin D. Roosevelt",
+            "support": 55,
+            "description": "Progressive party championing social programs and international cooperation."
+        },
+        "Republican": {
+            "name": "Republican Party",
+            "ideology": "Democratic",
+            "leader": "Alf Landon",
+            "support": 40,
+            "description": "Conservative party advocating for limited government and business interests."
+        },
+        "CPUSA": {
+            "name": "Communist Party USA",
+            "ideology": "Communist",
+            "leader": "Earl Browder",
+            "support": 2,
+            "description": "Far-left party seeking to establish a socialist state in America."
+        },
+        "America First": {
+            "name": "America First Committee",
+            "ideology": "Fascist",
+            "leader": "Charles Lindbergh",
+            "support": 3,
+            "description": "Nationalist isolationist movement with fascist sympathies."
+        },
+        "Socialists": {
+            "name": "Socialist Party of America",
+            "ideology": "Communist",
+            "leader": "Norman Thomas",
+            "support": 5,
+            "description": "Left-wing party advocating for radical economic reforms and workers' rights."
+        }
+    },
+    "uk": {
+        "Conservative": {
+            "name": "Conservative Party",
+            "ideology": "Democratic",
+            "leader": "Stanley Baldwin",
+            "support": 50,
+            "description": "Traditional conservative party supporting the British Empire and stability."
+        },
+        "Labour": {
+            "name": "Labour Party",
+            "ideology": "Democratic",
+            "leader": "Clement Attlee",
+            "support": 40,
+            "description": "Democratic socialist party representing working class interests."
+        },
+        "CPGB": {
+            "name": "Communist Party of Great Britain",
+            "ideology": "Communist",
+            "leader": "Harry Pollitt",
+            "support": 5,
+            "description": "Revolutionary communist party supported by Moscow."
+        },
+        "BUF": {
+            "name": "British Union of Fascists",
+            "ideology": "Fascist",
+            "leader": "Oswald Mosley",
+            "support": 5,
+            "description": "Ultranationalist party inspired by Italian Fascism."
+        }
+    },
+    "france": {
+        "SFIO": {
+            "name": "French Section of the Workers' International",
+            "ideology": "Democratic",
+            "leader": "Léon Blum",
+            "support": 35,
+            "description": "Democratic socialist party leading the Popular Front coalition."
+        },
+        "Radical": {
+            "name": "Radical Party",
+            "ideology": "Democratic",
+            "leader": "Édouard Daladier",
+            "support": 30,
+            "description": "Center-left liberal party supporting the republic."
+        },
+        "PCF": {
+            "name": "French Communist Party",
+            "ideology": "Communist",
+            "leader": "Maurice Thorez",
+            "support": 15,
+            "description": "Revolutionary Marxist party aligned with the Soviet Union."
+        },
+        "AF": {
+            "name": "Action Française",
+            "ideology": "Fascist",
+            "leader": "Charles Maurras",
+            "support": 10,
+            "description": "Far-right monarchist and nationalist movement."
+        },
+        "PSF": {
+            "name": "French Social Party",
+            "ideology": "Fascist",
+            "leader": "François de La Rocque",
+            "support": 10,
+            "description": "Nationalist anti-communist party with fascist tendencies."
+        },
+        "Popular_Front": {
+            "name": "Popular Front",
+            "ideology": "Democratic",
+            "leader": "Léon Blum",
+            "support": 60,
+            "description": "Left-wing coalition of socialists, communists, and liberals."
+        },
+        "Conservatives": {
+            "name": "National Bloc",
+            "ideology": "Democratic",
+            "leader": "Pierre-Étienne Flandin",
+            "support": 30,
+            "description": "Conservative faction opposing the Popular Front's reforms."
+        },
+    },
+    "ussr": {
+        "CPSU": {
+            "name": "Communist Party of the Soviet Union",
+            "ideology": "Communist",
+            "leader": "Joseph Stalin",
+            "support": 99,
+            "description": "The only legal party in the Soviet Union, enforcing Stalinist leadership."
+        },
+        "Left Opposition": {
+            "name": "Left Opposition",
+            "ideology": "Communist",
+            "leader": "Leon Trotsky (in exile)",
+            "support": 1,
+            "description": "Suppressed faction advocating for international permanent revolution."
+        }
+    },
+    "italy": {
+        "PNF": {
+            "name": "National Fascist Party",
+            "ideology": "Fascist",
+            "leader": "Benito Mussolini",
+            "support": 85,
+            "description": "Ruling fascist party that has consolidated totalitarian control."
+        },
+        "PCI": {
+            "name": "Italian Communist Party",
+            "ideology": "Communist",
+            "leader": "Palmiro Togliatti",
+            "support": 10,
+            "description": "Underground communist resistance to fascism."
+        },
+        "Monarchists": {
+            "name": "Monarchist Faction",
+            "ideology": "Monarchist",
+            "leader": "Victor Emmanuel III",
+            "support": 5,
+            "description": "Supporters of the King who maintain a degree of independence from fascism."
+        }
+    },
+    "japan": {
+        "Imperial": {
+            "name": "Imperial Rule Assistance Association",
+            "ideology": "Fascist",
+            "leader": "Fumimaro Konoe",
+            "support": 70,
+            "description": "Nationalist party supporting Emperor Hirohito and Japanese expansionism."
+        },
+        "Moderates": {
+            "name": "Constitutional Moderates",
+            "ideology": "Democratic",
+            "leader": "Kijūrō Shidehara",
+            "support": 20,
+            "description": "Conservative faction advocating for measured diplomacy and constitutional monarchy."
+        },
+        "Militarists": {
+            "name": "Imperial Army Faction",
+            "ideology": "Ultranationalist",
+            "leader": "Hideki Tojo",
+            "support": 10,
+            "description": "Radical militarists pushing for aggressive expansion in Asia."
+        }
+    },
+    "spain": {
+        "Republicans": {
+            "name": "Popular Front",
+            "ideology": "Democratic",
+            "leader": "Manuel Azaña",
+            "support": 50,
+            "description": "Left-wing coalition of republicans, socialists, and communists."
+        },
+        "Nationalists": {
+            "name": "Nationalist Front",
+            "ideology": "Fascist",
+            "leader": "Francisco Franco",
+            "support": 45,
+            "description": "Right-wing coalition of monarchists, falangists, and military leaders."
+        },
+        "Anarchists": {
+            "name": "CNT-FAI",
+            "ideology": "Anarchist",
+            "leader": "Buenaventura Durruti",
+            "support": 5,
+            "description": "Anarcho-syndicalist movement advocating for workers' control and revolution."
+        }
+    },
+    "china": {
+        "Kuomintang": {
+            "name": "Chinese Nationalist Party",
+            "ideology": "Democratic",
+            "leader": "Chiang Kai-shek",
+            "support": 60,
+            "description": "Nationalist government struggling against Japanese invasion and communist insurgency."
+        },
+        "CCP": {
+            "name": "Chinese Communist Party",
+            "ideology": "Communist",
+            "leader": "Mao Zedong",
+            "support": 20,
+            "description": "Revolutionary communist movement building support in rural areas."
+        },
+        "Warlords": {
+            "name": "Regional Warlords",
+            "ideology": "Non-Aligned",
+            "leader": "Various",
+            "support": 20,
+            "description": "Independent military leaders controlling different regions of China."
+        }
+    },
+    "turkey": {
+        "CHP": {
+            "name": "Republican People's Party",
+            "ideology": "Democratic",
+            "leader": "Mustafa Kemal Atatürk",
+            "support": 90,
+            "description": "Kemalist party leading Turkey's modernization and secularization efforts."
+        },
+        "Conservatives": {
+            "name": "Islamic Conservatives",
+            "ideology": "Non-Aligned",
+            "leader": "Various Clerics",
+            "support": 5,
+            "description": "Religious leaders opposed to the secular reforms of Atatürk."
+        },
+        "Militarists": {
+            "name": "Military Nationalists",
+            "ideology": "Fascist",
+            "leader": "Various Officers",
+            "support": 5,
+            "description": "Officers advocating for stronger Turkish expansionism and military rule."
+        }
+    },
+    "sweden": {
+        "SAP": {
+            "name": "Social Democratic Workers' Party",
+            "ideology": "Democratic",
+            "leader": "Per Albin Hansson",
+            "support": 45,
+            "description": "Social democratic party building the 'Folkhemmet' (People's Home) welfare system."
+        },
+        "Farmers": {
+            "name": "Farmer's League",
+            "ideology": "Democratic",
+            "leader": "Axel Pehrsson-Bramstorp",
+            "support": 30,
+            "description": "Centrist agrarian party representing rural interests."
+        },
+        "Conservatives": {
+            "name": "National Organization",
+            "ideology": "Democratic",
+            "leader": "Gösta Bagge",
+            "support": 25,
+            "description": "Conservative party supporting traditional values and constitutional monarchy."
+        }
+    },
+    "greece": {
+        "Monarchists": {
+            "name": "People's Party",
+            "ideology": "Monarchist",
+            "leader": "Konstantinos Tsaldaris",
+            "support": 45,
+            "description": "Conservative monarchist party supporting King George II."
+        },
+        "Liberals": {
+            "name": "Liberal Party",
+            "ideology": "Democratic",
+            "leader": "Themistoklis Sophoulis",
+            "support": 40,
+            "description": "Center-left republican opposition."
+        },
+        "KKE": {
+            "name": "Communist Party of Greece",
+            "ideology": "Communist",
+            "leader": "Nikos Zachariadis",
+            "support": 15,
+            "description": "Revolutionary communist party with growing popular support."
+        }
+    },
+    "romania": {
+        "Liberals": {
+            "name": "National Liberal Party",
+            "ideology": "Democratic",
+            "leader": "Ion Duca",
+            "support": 40,
+            "description": "Traditional liberal party representing the business interests."
+        },
+        "Peasants": {
+            "name": "National Peasants' Party",
+            "ideology": "Democratic",
+            "leader": "Iuliu Maniu",
+            "support": 30,
+            "description": "Centrist agrarian party representing rural Romania."
+        },
+        "Iron_Guard": {
+            "name": "Iron Guard",
+            "ideology": "Fascist",
+            "leader": "Corneliu Zelea Codreanu",
+            "support": 30,
+            "description": "Ultranationalist fascist party with strong anti-Semitic ideology."
+        }
+    }
+}
+
+# Nation data
+NATIONS = {
+    "germany": {
+        "name": "Deutschland",
+        "color": Fore.RED,
+        "leader": "Adolf Hitler",
+        "government": "Fascist",
+        "stability": 70,
+        "war_support": 60,
+        "industry": {
+            "civilian_factories": 16,
+            "military_factories": 6,
+            "dockyards": 2,
+            "infrastructure": 5,
+        },
+        "resources": {
+            "steel": 20,
+            "oil": 2,
+            "aluminum": 8,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 24,
+            "manpower": 600000,
+            "equipment": {
+                "infantry_equipment": 80000,
+                "artillery": 2400,
+                "tanks": 400,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 2,
+                "cruisers": 6,
+                "destroyers": 12,
+                "submarines": 10,
+            },
+        },
+        "air_force": {
+            "fighters": 180,
+            "bombers": 120,
+        },
+        "neighbors": ["france", "poland", "czechoslovakia", "austria", "switzerland", "denmark", "netherlands", "belgium", "lithuania"],
+        "focus_tree": "german_focus_tree",
+        "playable": True,
+        "description": "The German Reich stands at a crossroads. With Adolf Hitler's leadership, you can restore Germany to its former glory through rearmament and expansion, or choose an alternate path for the nation. Germany offers the most developed gameplay with multiple paths and special events.",
+    },
+    "france": {
+        "name": "France",
+        "color": Fore.BLUE,
+        "leader": "Albert Lebrun",
+        "government": "Democratic",
+        "stability": 65,
+        "war_support": 25,
+        "industry": {
+            "civilian_factories": 14,
+            "military_factories": 6,
+            "dockyards": 4,
+            "infrastructure": 6,
+        },
+        "resources": {
+            "steel": 30,
+            "oil": 0,
+            "aluminum": 15,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 28,
+            "manpower": 500000,
+            "equipment": {
+                "infantry_equipment": 75000,
+                "artillery": 3000,
+                "tanks": 600,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 5,
+                "cruisers": 12,
+                "destroyers": 30,
+                "submarines": 15,
+            },
+        },
+        "air_force": {
+            "fighters": 160,
+            "bombers": 100,
+        },
+        "neighbors": ["germany", "italy", "switzerland", "belgium", "spain"],
+        "focus_tree": "french_focus_tree",
+        "playable": True,
+        "description": "France, a declining great power, faces the challenge of confronting a resurgent Germany. Can you strengthen France's economy and military to stand against fascism, or will you chart a different course? Choose between upholding democracy, embracing communism, or turning to fascism yourself.",
+    },
+    "uk": {
+        "name": "United Kingdom",
+        "color": Fore.CYAN,
+        "leader": "Stanley Baldwin",
+        "government": "Democratic",
+        "stability": 80,
+        "war_support": 30,
+        "industry": {
+            "civilian_factories": 18,
+            "military_factories": 8,
+            "dockyards": 10,
+            "infrastructure": 7,
+        },
+        "resources": {
+            "steel": 25,
+            "oil": 8,
+            "aluminum": 10,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 18,
+            "manpower": 400000,
+            "equipment": {
+                "infantry_equipment": 60000,
+                "artillery": 2000,
+                "tanks": 350,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 12,
+                "cruisers": 30,
+                "destroyers": 80,
+                "submarines": 25,
+            },
+        },
+        "air_force": {
+            "fighters": 200,
+            "bombers": 180,
+        },
+        "neighbors": ["ireland", "france"],
+        "focus_tree": "british_focus_tree",
+        "playable": True,
+        "description": "The British Empire, though still vast, faces challenges from all sides. Economic pressures, colonial unrest, and the rise of fascism threaten British dominance. Will you maintain democracy and prepare for the coming storm, preserve the Empire at all costs, or perhaps pursue a more radical agenda?",
+    },
+    "italy": {
+        "name": "Italy",
+        "color": Fore.GREEN,
+        "leader": "Benito Mussolini",
+        "government": "Fascist",
+        "stability": 65,
+        "war_support": 55,
+        "industry": {
+            "civilian_factories": 10,
+            "military_factories": 4,
+            "dockyards": 5,
+            "infrastructure": 4,
+        },
+        "resources": {
+            "steel": 10,
+            "oil": 0,
+            "aluminum": 5,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 16,
+            "manpower": 300000,
+            "equipment": {
+                "infantry_equipment": 50000,
+                "artillery": 1800,
+                "tanks": 200,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 4,
+                "cruisers": 12,
+                "destroyers": 30,
+                "submarines": 20,
+            },
+        },
+        "air_force": {
+            "fighters": 120,
+            "bombers": 80,
+        },
+        "neighbors": ["france", "switzerland", "austria", "yugoslavia", "albania", "greece"],
+        "focus_tree": "italian_focus_tree",
+        "playable": True,
+        "description": "Mussolini's Italy seeks to reclaim the glory of Ancient Rome and establish a new Mediterranean empire. Despite a faltering economy and limited industrial capacity, Italy's ambitions are grand. Will you create a new Roman Empire, reform the nation's economy, or perhaps return the monarchy to true power?",
+    },
+    "ussr": {
+        "name": "Soviet Union",
+        "color": Fore.RED,
+        "leader": "Joseph Stalin",
+        "government": "Communist",
+        "stability": 55,
+        "war_support": 40,
+        "industry": {
+            "civilian_factories": 22,
+            "military_factories": 12,
+            "dockyards": 3,
+            "infrastructure": 3,
+        },
+        "resources": {
+            "steel": 100,
+            "oil": 80,
+            "aluminum": 30,
+            "rubber": 0,
+            "tungsten": 10,
+            "chromium": 30,
+        },
+        "army": {
+            "divisions": 40,
+            "manpower": 1200000,
+            "equipment": {
+                "infantry_equipment": 120000,
+                "artillery": 5000,
+                "tanks": 1500,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 1,
+                "cruisers": 7,
+                "destroyers": 25,
+                "submarines": 15,
+            },
+        },
+        "air_force": {
+            "fighters": 300,
+            "bombers": 200,
+        },
+        "neighbors": ["finland", "estonia", "latvia", "lithuania", "poland", "romania", "persia", "afghanistan", "china", "mongolia", "japan"],
+        "focus_tree": "soviet_focus_tree",
+        "playable": True,
+        "description": "The Soviet Union under Stalin's iron grip is transforming rapidly from an agricultural society into an industrial powerhouse. Internal purges have weakened the military but solidified political control. Will you maintain the Stalinist course, pursue a more moderate socialism, or even restore the Tsarist monarchy?",
+    },
+    "usa": {
+        "name": "United States",
+        "color": Fore.BLUE,
+        "leader": "Franklin D. Roosevelt",
+        "government": "Democratic",
+        "stability": 85,
+        "war_support": 10,
+        "industry": {
+            "civilian_factories": 30,
+            "military_factories": 6,
+            "dockyards": 8,
+            "infrastructure": 7,
+        },
+        "resources": {
+            "steel": 150,
+            "oil": 200,
+            "aluminum": 60,
+            "rubber": 0,
+            "tungsten": 20,
+            "chromium": 10,
+        },
+        "army": {
+            "divisions": 12,
+            "manpower": 200000,
+            "equipment": {
+                "infantry_equipment": 40000,
+                "artillery": 1500,
+                "tanks": 300,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 15,
+                "cruisers": 30,
+                "destroyers": 90,
+                "submarines": 30,
+            },
+        },
+        "air_force": {
+            "fighters": 150,
+            "bombers": 100,
+        },
+        "neighbors": ["canada", "mexico"],
+        "focus_tree": "usa_focus_tree",
+        "playable": True,
+        "description": "The United States remains mired in the Great Depression, with strong isolationist sentiment keeping it out of European affairs. However, its industrial potential is unmatched. Will you lead America out of isolationism to confront the Axis threat, focus on economic recovery, or perhaps take a more radical political turn?",
+    },
+    "japan": {
+        "name": "Japan",
+        "color": Fore.LIGHTRED_EX,
+        "leader": "Hirohito",
+        "government": "Fascist",
+        "stability": 70,
+        "war_support": 60,
+        "industry": {
+            "civilian_factories": 14,
+            "military_factories": 8,
+            "dockyards": 8,
+            "infrastructure": 5,
+        },
+        "resources": {
+            "steel": 20,
+            "oil": 0,
+            "aluminum": 10,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 24,
+            "manpower": 600000,
+            "equipment": {
+                "infantry_equipment": 70000,
+                "artillery": 2800,
+                "tanks": 300,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 10,
+                "cruisers": 20,
+                "destroyers": 60,
+                "submarines": 25,
+            },
+        },
+        "air_force": {
+            "fighters": 180,
+            "bombers": 140,
+        },
+        "neighbors": ["china", "ussr", "korea"],
+        "focus_tree": "japanese_focus_tree",
+    },
+    "poland": {
+        "name": "Poland",
+        "color": Fore.WHITE,
+        "leader": "Ignacy Mościcki",
+        "government": "Neutral",
+        "stability": 45,
+        "war_support": 40,
+        "industry": {
+            "civilian_factories": 5,
+            "military_factories": 2,
+            "dockyards": 1,
+            "infrastructure": 3,
+        },
+        "resources": {
+            "steel": 5,
+            "oil": 0,
+            "aluminum": 0,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 12,
+            "manpower": 250000,
+            "equipment": {
+                "infantry_equipment": 30000,
+                "artillery": 800,
+                "tanks": 100,
+            },
+        },
+        "air_force": {
+            "fighters": 30,
+            "bombers": 10,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 0,
+                "destroyers": 2,
+                "submarines": 2,
+            },
+        },
+        "neighbors": ["germany", "czechoslovakia", "lithuania", "latvia", "ussr"],
+        "focus_tree": "polish_focus_tree",
+        "playable": True,
+        "description": "Caught between two aggressive powers - Nazi Germany and the Soviet Union - Poland faces an existential crisis. With limited industrial capacity but a proud military tradition, can you navigate the dangerous waters of European politics and preserve Polish independence?",
+    },
+    "yugoslavia": {
+        "name": "Yugoslavia",
+        "color": Fore.BLUE,
+        "leader": "Prince Paul",
+        "government": "Neutral",
+        "stability": 40,
+        "war_support": 30,
+        "industry": {
+            "civilian_factories": 4,
+            "military_factories": 2,
+            "dockyards": 1,
+            "infrastructure": 2,
+        },
+        "resources": {
+            "steel": 8,
+            "oil": 2,
+            "aluminum": 6,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 4,
+        },
+        "army": {
+            "divisions": 10,
+            "manpower": 200000,
+            "equipment": {
+                "infantry_equipment": 25000,
+                "artillery": 600,
+                "tanks": 50,
+            },
+        },
+        "air_force": {
+            "fighters": 20,
+            "bombers": 5,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 0,
+                "destroyers": 1,
+                "submarines": 1,
+            },
+        },
+        "neighbors": ["italy", "germany", "hungary", "romania", "bulgaria", "greece", "albania"],
+        "focus_tree": "yugoslavian_focus_tree",
+        "playable": True,
+        "description": "A young multiethnic kingdom with deep internal divisions, Yugoslavia is surrounded by stronger neighbors with territorial ambitions. Can you unite the diverse peoples of the Balkans into a coherent nation, or will ethnic tensions tear the country apart?",
+    },
+    "spain": {
+        "name": "Spain",
+        "color": Fore.YELLOW,
+        "leader": "Francisco Franco",
+        "government": "Fascist",
+        "stability": 40,
+        "war_support": 30,
+        "industry": {
+            "civilian_factories": 6,
+            "military_factories": 2,
+            "dockyards": 3,
+            "infrastructure": 3,
+        },
+        "resources": {
+            "steel": 5,
+            "oil": 0,
+            "aluminum": 0,
+            "rubber": 0,
+            "tungsten": 10,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 14,
+            "manpower": 250000,
+            "equipment": {
+                "infantry_equipment": 30000,
+                "artillery": 500,
+                "tanks": 50,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 1,
+                "cruisers": 4,
+                "destroyers": 8,
+                "submarines": 2,
+            },
+        },
+        "air_force": {
+            "fighters": 50,
+            "bombers": 20,
+        },
+        "neighbors": ["france", "portugal"],
+        "focus_tree": "spanish_focus_tree",
+        "playable": True,
+        "description": "Spain is recovering from its brutal Civil War, where the Nationalist forces led by Francisco Franco defeated the Republican government. The country is exhausted, divided, and devastated by years of fighting. Will you maintain neutrality, align with the Axis powers whose support helped Franco win, or take a different path?",
+    },
+    "turkey": {
+        "name": "Turkey",
+        "color": Fore.RED,
+        "leader": "İsmet İnönü",
+        "government": "Democratic",
+        "stability": 70,
+        "war_support": 20,
+        "industry": {
+            "civilian_factories": 5,
+            "military_factories": 2,
+            "dockyards": 1,
+            "infrastructure": 3,
+        },
+        "resources": {
+            "steel": 5,
+            "oil": 0,
+            "aluminum": 0,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 20,
+        },
+        "army": {
+            "divisions": 12,
+            "manpower": 200000,
+            "equipment": {
+                "infantry_equipment": 25000,
+                "artillery": 400,
+                "tanks": 20,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 2,
+                "destroyers": 4,
+                "submarines": 1,
+            },
+        },
+        "air_force": {
+            "fighters": 30,
+            "bombers": 10,
+        },
+        "neighbors": ["greece", "bulgaria", "ussr", "syria", "iraq", "iran"],
+        "focus_tree": "turkish_focus_tree",
+        "playable": True,
+        "description": "Rising from the ashes of the Ottoman Empire, Turkey under President İnönü is working to maintain Atatürk's legacy of modernization and secularism. Positioned at the crossroads of Europe and Asia, Turkey's strategic location makes it crucial to both Axis and Allied interests. Will you continue the path of neutrality, or use the war to reclaim former Ottoman territories?",
+    },
+    "sweden": {
+        "name": "Sweden",
+        "color": Fore.BLUE,
+        "leader": "Per Albin Hansson",
+        "government": "Democratic",
+        "stability": 90,
+        "war_support": 10,
+        "industry": {
+            "civilian_factories": 8,
+            "military_factories": 3,
+            "dockyards": 2,
+            "infrastructure": 6,
+        },
+        "resources": {
+            "steel": 40,
+            "oil": 0,
+            "aluminum": 0,
+            "rubber": 0,
+            "tungsten": 10,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 8,
+            "manpower": 150000,
+            "equipment": {
+                "infantry_equipment": 20000,
+                "artillery": 300,
+                "tanks": 40,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 2,
+                "cruisers": 3,
+                "destroyers": 8,
+                "submarines": 10,
+            },
+        },
+        "air_force": {
+            "fighters": 60,
+            "bombers": 20,
+        },
+        "neighbors": ["norway", "finland"],
+        "focus_tree": "swedish_focus_tree",
+        "playable": True,
+        "description": "Sweden enjoys peace and prosperity while much of Europe spirals into conflict. Its neutrality policy has kept it out of wars for over a century, but with Nazi Germany dominating neighboring Norway and Denmark, and the Soviet Union attacking Finland, maintaining this neutrality will be challenging. Sweden's vast iron ore resources are coveted by all major powers. Can you guide Sweden safely through the storm?",
+    },
+    "philippines": {
+        "name": "Philippines",
+        "color": Fore.BLUE,
+        "leader": "Manuel L. Quezon",
+        "government": "Democratic",
+        "stability": 65,
+        "war_support": 15,
+        "industry": {
+            "civilian_factories": 2,
+            "military_factories": 1,
+            "dockyards": 1,
+            "infrastructure": 2,
+        },
+        "resources": {
+            "steel": 2,
+            "oil": 0,
+            "aluminum": 0,
+            "rubber": 5,
+            "tungsten": 0,
+            "chromium": 10,
+        },
+        "army": {
+            "divisions": 5,
+            "manpower": 80000,
+            "equipment": {
+                "infantry_equipment": 12000,
+                "artillery": 100,
+                "tanks": 0,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 0,
+                "destroyers": 2,
+                "submarines": 0,
+            },
+        },
+        "air_force": {
+            "fighters": 20,
+            "bombers": 10,
+        },
+        "neighbors": [],
+        "focus_tree": "philippines_focus_tree",
+        "playable": True,
+        "description": "A Commonwealth of the United States on the path to independence, the Philippines faces the looming threat of Japanese expansion. With limited military capabilities and U.S. protection, your decisions will determine whether the islands can defend against invasion or must endure occupation. Will you strengthen ties with America, push for immediate independence, or navigate a different path?",
+    },
+    "netherlands_east_indies": {
+        "name": "Dutch East Indies",
+        "color": Fore.LIGHTBLUE_EX,
+        "leader": "Governor-General A.W.L. Tjarda van Starkenborgh Stachouwer",
+        "government": "Colonial",
+        "stability": 55,
+        "war_support": 20,
+        "industry": {
+            "civilian_factories": 3,
+            "military_factories": 1,
+            "dockyards": 1,
+            "infrastructure": 2,
+        },
+        "resources": {
+            "steel": 5,
+            "oil": 30,
+            "aluminum": 5,
+            "rubber": 40,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 4,
+            "manpower": 60000,
+            "equipment": {
+                "infantry_equipment": 10000,
+                "artillery": 80,
+                "tanks": 0,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 3,
+                "destroyers": 7,
+                "submarines": 13,
+            },
+        },
+        "air_force": {
+            "fighters": 25,
+            "bombers": 15,
+        },
+        "neighbors": ["malaya", "thailand", "philippines"],
+        "focus_tree": "east_indies_focus_tree",
+        "playable": True,
+        "description": "Rich in oil and rubber, the Dutch East Indies (modern Indonesia) is a prime target for resource-hungry Japan. With the Netherlands occupied by Germany, the colony faces potential isolation from Allied support. Will you strengthen defenses to resist invasion, negotiate with Japan to preserve independence, or rise up against colonial rule altogether?",
+    },
+    "australia": {
+        "name": "Australia",
+        "color": Fore.LIGHTGREEN_EX,
+        "leader": "John Curtin",
+        "government": "Democratic",
+        "stability": 80,
+        "war_support": 40,
+        "industry": {
+            "civilian_factories": 6,
+            "military_factories": 3,
+            "dockyards": 2,
+            "infrastructure": 4,
+        },
+        "resources": {
+            "steel": 15,
+            "oil": 0,
+            "aluminum": 5,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 10,
+        },
+        "army": {
+            "divisions": 6,
+            "manpower": 150000,
+            "equipment": {
+                "infantry_equipment": 20000,
+                "artillery": 400,
+                "tanks": 100,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 6,
+                "destroyers": 10,
+                "submarines": 2,
+            },
+        },
+        "air_force": {
+            "fighters": 60,
+            "bombers": 40,
+        },
+        "neighbors": [],
+        "focus_tree": "australia_focus_tree",
+        "playable": True,
+        "description": "A loyal dominion of the British Empire, Australia faces hard choices as Japanese expansion threatens the Pacific. With most of its expeditionary forces fighting in Europe and North Africa, Australia's homeland defenses are stretched thin. Will you continue supporting Britain's war effort, pivot to defend the homeland, or seek closer ties with the United States?",
+    },
+    "nationalist_china": {
+        "name": "Nationalist China",
+        "color": Fore.BLUE,
+        "leader": "Chiang Kai-shek",
+        "government": "Military",
+        "stability": 40,
+        "war_support": 70,
+        "industry": {
+            "civilian_factories": 5,
+            "military_factories": 3,
+            "dockyards": 1,
+            "infrastructure": 2,
+        },
+        "resources": {
+            "steel": 15,
+            "oil": 2,
+            "aluminum": 5,
+            "rubber": 2,
+            "tungsten": 20,
+            "chromium": 5,
+        },
+        "army": {
+            "divisions": 30,
+            "manpower": 800000,
+            "equipment": {
+                "infantry_equipment": 80000,
+                "artillery": 600,
+                "tanks": 80,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 2,
+                "destroyers": 8,
+                "submarines": 0,
+            },
+        },
+        "air_force": {
+            "fighters": 40,
+            "bombers": 20,
+        },
+        "neighbors": ["japan", "communist_china", "tibet", "mongolia"],
+        "focus_tree": "nationalist_china_focus_tree",
+        "playable": True,
+        "description": "The Republic of China under Chiang Kai-shek faces a desperate struggle for survival against Japanese invasion and Communist insurgency. With limited industrial capacity but vast manpower, China must modernize while fighting off foreign aggression and internal divisions. Can you unite the nation, defeat the Japanese, and build a new China?",
+    },
+    "communist_china": {
+        "name": "Communist China",
+        "color": Fore.RED,
+        "leader": "Mao Zedong",
+        "government": "Communist",
+        "stability": 60,
+        "war_support": 60,
+        "industry": {
+            "civilian_factories": 1,
+            "military_factories": 1,
+            "dockyards": 0,
+            "infrastructure": 1,
+        },
+        "resources": {
+            "steel": 5,
+            "oil": 0,
+            "aluminum": 0,
+            "rubber": 0,
+            "tungsten": 5,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 8,
+            "manpower": 200000,
+            "equipment": {
+                "infantry_equipment": 20000,
+                "artillery": 100,
+                "tanks": 0,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 0,
+                "destroyers": 0,
+                "submarines": 0,
+            },
+        },
+        "air_force": {
+            "fighters": 5,
+            "bombers": 2,
+        },
+        "neighbors": ["nationalist_china", "mongolia"],
+        "focus_tree": "communist_china_focus_tree",
+        "playable": True,
+        "description": "The Chinese Communist Party controls a small but growing base in rural China, using guerrilla tactics against both Japanese invaders and Nationalist forces. With limited resources but growing popular support, the Communists must expand their influence and build toward revolution. Will you cooperate with the Nationalists against Japan, or focus on the coming civil war?",
+    },
+    "belgium": {
+        "name": "Belgium",
+        "color": Fore.YELLOW,
+        "leader": "Leopold III",
+        "government": "Democratic",
+        "stability": 65,
+        "war_support": 15,
+        "industry": {
+            "civilian_factories": 6,
+            "military_factories": 2,
+            "dockyards": 1,
+            "infrastructure": 5,
+        },
+        "resources": {
+            "steel": 12,
+            "oil": 0,
+            "aluminum": 0,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 8,
+            "manpower": 150000,
+            "equipment": {
+                "infantry_equipment": 20000,
+                "artillery": 400,
+                "tanks": 30,
+            },
+        },
+        "air_force": {
+            "fighters": 15,
+            "bombers": 5,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 0,
+                "destroyers": 1,
+                "submarines": 0,
+            },
+        },
+        "neighbors": ["france", "germany", "netherlands", "luxembourg"],
+        "focus_tree": "belgian_focus_tree",
+        "playable": True,
+        "description": "A small but industrialized nation caught between the great powers of Europe, Belgium relies on neutrality and international guarantees for its security. Can you maintain independence through diplomacy, or must you prepare for the worst?",
+    },
+    "netherlands": {
+        "name": "Netherlands",
+        "color": Fore.LIGHTBLUE_EX,
+        "leader": "Hendrikus Colijn",
+        "government": "Democratic",
+        "stability": 70,
+        "war_support": 10,
+        "industry": {
+            "civilian_factories": 7,
+            "military_factories": 2,
+            "dockyards": 3,
+            "infrastructure": 6,
+        },
+        "resources": {
+            "steel": 3,
+            "oil": 0,
+            "aluminum": 0,
+            "rubber": 25,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 7,
+            "manpower": 120000,
+            "equipment": {
+                "infantry_equipment": 18000,
+                "artillery": 300,
+                "tanks": 20,
+            },
+        },
+        "air_force": {
+            "fighters": 20,
+            "bombers": 8,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 2,
+                "destroyers": 8,
+                "submarines": 10,
+            },
+        },
+        "neighbors": ["germany", "belgium"],
+        "focus_tree": "dutch_focus_tree",
+        "playable": True,
+        "description": "Though small in Europe, the Netherlands possesses a vast colonial empire in the East Indies. Can you defend both homeland and colonies from aggression while balancing the economic needs of a trading nation?",
+    },
+    "denmark": {
+        "name": "Denmark",
+        "color": Fore.RED,
+        "leader": "Thorvald Stauning",
+        "government": "Democratic",
+        "stability": 80,
+        "war_support": 10,
+        "industry": {
+            "civilian_factories": 4,
+            "military_factories": 1,
+            "dockyards": 2,
+            "infrastructure": 6,
+        },
+        "resources": {
+            "steel": 2,
+            "oil": 0,
+            "aluminum": 0,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 3,
+            "manpower": 50000,
+            "equipment": {
+                "infantry_equipment": 10000,
+                "artillery": 150,
+                "tanks": 10,
+            },
+        },
+        "air_force": {
+            "fighters": 8,
+            "bombers": 0,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 0,
+                "destroyers": 3,
+                "submarines": 4,
+            },
+        },
+        "neighbors": ["germany", "sweden"],
+        "focus_tree": "danish_focus_tree",
+        "playable": True,
+        "description": "A small Scandinavian democracy with a direct border with Nazi Germany, Denmark has embraced neutrality in hopes of avoiding conflict. Can you maintain independence through diplomacy or find allies to protect you?",
+    },
+    "norway": {
+        "name": "Norway",
+        "color": Fore.RED,
+        "leader": "Johan Nygaardsvold",
+        "government": "Democratic",
+        "stability": 75,
+        "war_support": 10,
+        "industry": {
+            "civilian_factories": 3,
+            "military_factories": 1,
+            "dockyards": 2,
+            "infrastructure": 4,
+        },
+        "resources": {
+            "steel": 5,
+            "oil": 0,
+            "aluminum": 8,
+            "rubber": 0,
+            "tungsten": 6,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 4,
+            "manpower": 60000,
+            "equipment": {
+                "infantry_equipment": 12000,
+                "artillery": 200,
+                "tanks": 5,
+            },
+        },
+        "air_force": {
+            "fighters": 10,
+            "bombers": 0,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 0,
+                "destroyers": 4,
+                "submarines": 6,
+            },
+        },
+        "neighbors": ["sweden", "finland"],
+        "focus_tree": "norwegian_focus_tree",
+        "playable": True,
+        "description": "Norway's strategic position controlling access to the Baltic Sea and its valuable resources make it a tempting target for major powers. Can you maintain neutrality, or will you be forced to choose sides in the coming conflict?",
+    },
+    "austria": {
+        "name": "Austria",
+        "color": Fore.WHITE,
+        "leader": "Kurt Schuschnigg",
+        "government": "Neutral",
+        "stability": 30,
+        "war_support": 20,
+        "industry": {
+            "civilian_factories": 4,
+            "military_factories": 1,
+            "dockyards": 0,
+            "infrastructure": 4,
+        },
+        "resources": {
+            "steel": 6,
+            "oil": 1,
+            "aluminum": 2,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 5,
+            "manpower": 80000,
+            "equipment": {
+                "infantry_equipment": 15000,
+                "artillery": 250,
+                "tanks": 0,
+            },
+        },
+        "air_force": {
+            "fighters": 5,
+            "bombers": 0,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 0,
+                "destroyers": 0,
+                "submarines": 0,
+            },
+        },
+        "neighbors": ["germany", "italy", "czechoslovakia", "hungary", "switzerland"],
+        "focus_tree": "austrian_focus_tree",
+        "playable": True,
+        "faction": "non_aligned",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["germany", "italy"],
+        "description": "The remnant of a once-great empire, Austria stands at a crossroads. Internal pressure for Anschluss (union) with Germany is growing, while the economy struggles. Can you preserve Austrian independence, or forge a new path for this proud nation?",
+    },
+    "canada": {
+        "name": "Canada",
+        "color": Fore.RED,
+        "leader": "William Lyon Mackenzie King",
+        "government": "Democratic",
+        "stability": 85,
+        "war_support": 25,
+        "industry": {
+            "civilian_factories": 14,
+            "military_factories": 4,
+            "dockyards": 4,
+            "infrastructure": 6,
+        },
+        "resources": {
+            "steel": 8,
+            "oil": 4,
+            "aluminum": 12,
+            "rubber": 0,
+            "tungsten": 3,
+            "chromium": 2,
+        },
+        "army": {
+            "divisions": 6,
+            "manpower": 180000,
+            "equipment": {
+                "infantry_equipment": 22000,
+                "artillery": 350,
+                "tanks": 25,
+            },
+        },
+        "air_force": {
+            "fighters": 22,
+            "bombers": 8,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 2,
+                "destroyers": 12,
+                "submarines": 4,
+            },
+        },
+        "neighbors": ["usa"],
+        "focus_tree": "canadian_focus_tree",
+        "playable": True,
+        "faction": "allies",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["usa", "uk"],
+        "description": "A dominion of the British Empire with vast natural resources and growing industrial capacity. Canada balances loyalty to Britain with increasing autonomy and continental ties to the United States.",
+    },
+    "mexico": {
+        "name": "Mexico",
+        "color": Fore.GREEN,
+        "leader": "Lázaro Cárdenas",
+        "government": "Democratic",
+        "stability": 55,
+        "war_support": 15,
+        "industry": {
+            "civilian_factories": 6,
+            "military_factories": 2,
+            "dockyards": 1,
+            "infrastructure": 3,
+        },
+        "resources": {
+            "steel": 2,
+            "oil": 12,
+            "aluminum": 1,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 1,
+        },
+        "army": {
+            "divisions": 8,
+            "manpower": 140000,
+            "equipment": {
+                "infantry_equipment": 20000,
+                "artillery": 280,
+                "tanks": 15,
+            },
+        },
+        "air_force": {
+            "fighters": 12,
+            "bombers": 4,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 1,
+                "destroyers": 3,
+                "submarines": 2,
+            },
+        },
+        "neighbors": ["usa"],
+        "focus_tree": "mexican_focus_tree",
+        "playable": True,
+        "faction": "non_aligned",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["usa"],
+        "description": "Under President Cárdenas, Mexico pursues progressive reforms while maintaining neutrality. Rich in oil resources, Mexico faces pressure from both fascist and democratic powers seeking influence.",
+    },
+    "brazil": {
+        "name": "Brazil",
+        "color": Fore.YELLOW,
+        "leader": "Getúlio Vargas",
+        "government": "Non-Aligned",
+        "stability": 60,
+        "war_support": 20,
+        "industry": {
+            "civilian_factories": 8,
+            "military_factories": 3,
+            "dockyards": 2,
+            "infrastructure": 4,
+        },
+        "resources": {
+            "steel": 4,
+            "oil": 2,
+            "aluminum": 6,
+            "rubber": 15,
+            "tungsten": 2,
+            "chromium": 2,
+        },
+        "army": {
+            "divisions": 12,
+            "manpower": 250000,
+            "equipment": {
+                "infantry_equipment": 35000,
+                "artillery": 450,
+                "tanks": 20,
+            },
+        },
+        "air_force": {
+            "fighters": 18,
+            "bombers": 6,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 2,
+                "cruisers": 2,
+                "destroyers": 8,
+                "submarines": 3,
+            },
+        },
+        "neighbors": ["argentina"],
+        "focus_tree": "brazilian_focus_tree",
+        "playable": True,
+        "faction": "non_aligned",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["usa", "argentina"],
+        "description": "Under Vargas's Estado Novo, Brazil emerges as South America's dominant power. With vast resources and growing industry, Brazil seeks to play a major role in hemispheric affairs.",
+    },
+    "argentina": {
+        "name": "Argentina",
+        "color": Fore.LIGHTBLUE_EX,
+        "leader": "Roberto Ortiz",
+        "government": "Democratic",
+        "stability": 65,
+        "war_support": 10,
+        "industry": {
+            "civilian_factories": 10,
+            "military_factories": 3,
+            "dockyards": 2,
+            "infrastructure": 5,
+        },
+        "resources": {
+            "steel": 3,
+            "oil": 3,
+            "aluminum": 2,
+            "rubber": 0,
+            "tungsten": 1,
+            "chromium": 1,
+        },
+        "army": {
+            "divisions": 10,
+            "manpower": 200000,
+            "equipment": {
+                "infantry_equipment": 30000,
+                "artillery": 400,
+                "tanks": 18,
+            },
+        },
+        "air_force": {
+            "fighters": 16,
+            "bombers": 5,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 2,
+                "cruisers": 3,
+                "destroyers": 10,
+                "submarines": 4,
+            },
+        },
+        "neighbors": ["brazil"],
+        "focus_tree": "argentine_focus_tree",
+        "playable": True,
+        "faction": "non_aligned",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["brazil", "uk"],
+        "description": "Argentina maintains neutrality while building up its military and economy. As South America's second-largest power, Argentina competes with Brazil for regional dominance.",
+    },
+    "cuba": {
+        "name": "Cuba",
+        "color": Fore.RED,
+        "leader": "Fulgencio Batista",
+        "government": "Non-Aligned",
+        "stability": 50,
+        "war_support": 15,
+        "industry": {
+            "civilian_factories": 2,
+            "military_factories": 1,
+            "dockyards": 1,
+            "infrastructure": 3,
+        },
+        "resources": {
+            "steel": 0,
+            "oil": 0,
+            "aluminum": 0,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 3,
+            "manpower": 40000,
+            "equipment": {
+                "infantry_equipment": 8000,
+                "artillery": 80,
+                "tanks": 5,
+            },
+        },
+        "air_force": {
+            "fighters": 6,
+            "bombers": 2,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 0,
+                "destroyers": 2,
+                "submarines": 1,
+            },
+        },
+        "neighbors": ["usa"],
+        "focus_tree": "minor_nation_focus_tree",
+        "playable": True,
+        "faction": "non_aligned",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["usa"],
+        "description": "Cuba under Batista maintains close ties with the United States while pursuing internal stability. The island's strategic position in the Caribbean makes it valuable to all major powers.",
+    },
+    "south_africa": {
+        "name": "South Africa",
+        "color": Fore.YELLOW,
+        "leader": "J.B.M. Hertzog",
+        "government": "Democratic",
+        "stability": 70,
+        "war_support": 30,
+        "industry": {
+            "civilian_factories": 6,
+            "military_factories": 2,
+            "dockyards": 2,
+            "infrastructure": 4,
+        },
+        "resources": {
+            "steel": 6,
+            "oil": 0,
+            "aluminum": 2,
+            "rubber": 0,
+            "tungsten": 3,
+            "chromium": 8,
+        },
+        "army": {
+            "divisions": 6,
+            "manpower": 80000,
+            "equipment": {
+                "infantry_equipment": 15000,
+                "artillery": 200,
+                "tanks": 12,
+            },
+        },
+        "air_force": {
+            "fighters": 14,
+            "bombers": 4,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 2,
+                "destroyers": 6,
+                "submarines": 2,
+            },
+        },
+        "neighbors": [],
+        "focus_tree": "south_african_focus_tree",
+        "playable": True,
+        "faction": "allies",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["uk"],
+        "description": "A dominion of the British Empire rich in minerals and strategic resources. South Africa's location controls vital sea routes while internal tensions over participation in European conflicts simmer.",
+    },
+    "new_zealand": {
+        "name": "New Zealand",
+        "color": Fore.BLUE,
+        "leader": "Michael Joseph Savage",
+        "government": "Democratic",
+        "stability": 85,
+        "war_support": 40,
+        "industry": {
+            "civilian_factories": 3,
+            "military_factories": 1,
+            "dockyards": 2,
+            "infrastructure": 5,
+        },
+        "resources": {
+            "steel": 1,
+            "oil": 0,
+            "aluminum": 2,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 3,
+            "manpower": 35000,
+            "equipment": {
+                "infantry_equipment": 7000,
+                "artillery": 100,
+                "tanks": 8,
+            },
+        },
+        "air_force": {
+            "fighters": 8,
+            "bombers": 3,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 2,
+                "destroyers": 4,
+                "submarines": 1,
+            },
+        },
+        "neighbors": ["australia"],
+        "focus_tree": "minor_nation_focus_tree",
+        "playable": True,
+        "faction": "allies",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["uk", "australia"],
+        "description": "A loyal dominion of the British Empire with strong democratic traditions. Despite its small size, New Zealand punches above its weight in supporting Britain's global commitments.",
+    },
+    "iran": {
+        "name": "Iran",
+        "color": Fore.GREEN,
+        "leader": "Reza Shah Pahlavi",
+        "government": "Non-Aligned",
+        "stability": 55,
+        "war_support": 20,
+        "industry": {
+            "civilian_factories": 5,
+            "military_factories": 2,
+            "dockyards": 1,
+            "infrastructure": 3,
+        },
+        "resources": {
+            "steel": 2,
+            "oil": 20,
+            "aluminum": 1,
+            "rubber": 0,
+            "tungsten": 0,
+            "chromium": 1,
+        },
+        "army": {
+            "divisions": 10,
+            "manpower": 180000,
+            "equipment": {
+                "infantry_equipment": 25000,
+                "artillery": 350,
+                "tanks": 15,
+            },
+        },
+        "air_force": {
+            "fighters": 12,
+            "bombers": 4,
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 1,
+                "destroyers": 3,
+                "submarines": 2,
+            },
+        },
+        "neighbors": ["soviet_union", "turkey"],
+        "focus_tree": "iranian_focus_tree",
+        "playable": True,
+        "faction": "non_aligned",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["germany", "uk"],
+        "description": "Under Reza Shah's modernization drive, Iran seeks to balance between British and Soviet influence while exploiting its vast oil reserves. Strategic position makes Iran crucial to all major powers.",
+    },
+    "venezuela": {
+        "name": "Venezuela",
+        "color": Fore.YELLOW,
+        "leader": "Eleazar López Contreras",
+        "government": "Military",
+        "stability": 60,
+        "war_support": 25,
+        "industry": {
+            "civilian_factories": 3,
+            "military_factories": 1,
+            "dockyards": 1,
+            "infrastructure": 3,
+        },
+        "resources": {
+            "steel": 2,
+            "oil": 50,
+            "aluminum": 5,
+            "rubber": 8,
+            "tungsten": 0,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 4,
+            "manpower": 80000,
+            "equipment": {
+                "infantry_equipment": 12000,
+                "artillery": 200,
+                "tanks": 20,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 1,
+                "destroyers": 3,
+                "submarines": 2,
+            },
+        },
+        "air_force": {
+            "fighters": 15,
+            "bombers": 8,
+        },
+        "neighbors": ["colombia", "brazil", "guyana"],
+        "focus_tree": "minor_nation_focus_tree",
+        "playable": True,
+        "faction": "non_aligned",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["usa", "uk"],
+        "description": "Oil-rich Venezuela under military rule seeks to modernize while balancing American and European oil company interests. Growing petroleum industry provides economic potential.",
+    },
+    "colombia": {
+        "name": "Colombia",
+        "color": Fore.LIGHTYELLOW_EX,
+        "leader": "Alfonso López Pumarejo",
+        "government": "Democratic",
+        "stability": 65,
+        "war_support": 20,
+        "industry": {
+            "civilian_factories": 4,
+            "military_factories": 2,
+            "dockyards": 1,
+            "infrastructure": 4,
+        },
+        "resources": {
+            "steel": 3,
+            "oil": 15,
+            "aluminum": 3,
+            "rubber": 10,
+            "tungsten": 2,
+            "chromium": 1,
+        },
+        "army": {
+            "divisions": 6,
+            "manpower": 120000,
+            "equipment": {
+                "infantry_equipment": 18000,
+                "artillery": 300,
+                "tanks": 30,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 2,
+                "destroyers": 4,
+                "submarines": 1,
+            },
+        },
+        "air_force": {
+            "fighters": 20,
+            "bombers": 12,
+        },
+        "neighbors": ["venezuela", "brazil", "panama"],
+        "focus_tree": "minor_nation_focus_tree",
+        "playable": True,
+        "faction": "non_aligned",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["usa", "uk"],
+        "description": "Colombia under Liberal Party rule pursues democratic reforms and economic modernization. Coffee exports and emerging oil production provide economic foundation.",
+    },
+    "chile": {
+        "name": "Chile",
+        "color": Fore.LIGHTCYAN_EX,
+        "leader": "Arturo Alessandri",
+        "government": "Democratic",
+        "stability": 70,
+        "war_support": 30,
+        "industry": {
+            "civilian_factories": 5,
+            "military_factories": 2,
+            "dockyards": 2,
+            "infrastructure": 4,
+        },
+        "resources": {
+            "steel": 8,
+            "oil": 0,
+            "aluminum": 12,
+            "rubber": 0,
+            "tungsten": 15,
+            "chromium": 5,
+        },
+        "army": {
+            "divisions": 8,
+            "manpower": 150000,
+            "equipment": {
+                "infantry_equipment": 22000,
+                "artillery": 400,
+                "tanks": 50,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 2,
+                "cruisers": 4,
+                "destroyers": 8,
+                "submarines": 3,
+            },
+        },
+        "air_force": {
+            "fighters": 30,
+            "bombers": 20,
+        },
+        "neighbors": ["argentina", "bolivia", "peru"],
+        "focus_tree": "minor_nation_focus_tree",
+        "playable": True,
+        "faction": "non_aligned",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["uk", "germany"],
+        "description": "Chile's mineral wealth and strategic Pacific position make it influential in South America. Strong navy and German-trained army maintain regional balance.",
+    },
+    "thailand": {
+        "name": "Thailand",
+        "color": Fore.LIGHTCYAN_EX,
+        "leader": "Plaek Phibunsongkhram",
+        "government": "Military",
+        "stability": 60,
+        "war_support": 40,
+        "industry": {
+            "civilian_factories": 3,
+            "military_factories": 2,
+            "dockyards": 1,
+            "infrastructure": 3,
+        },
+        "resources": {
+            "steel": 2,
+            "oil": 0,
+            "aluminum": 1,
+            "rubber": 20,
+            "tungsten": 8,
+            "chromium": 0,
+        },
+        "army": {
+            "divisions": 6,
+            "manpower": 120000,
+            "equipment": {
+                "infantry_equipment": 18000,
+                "artillery": 300,
+                "tanks": 25,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 2,
+                "destroyers": 4,
+                "submarines": 2,
+            },
+        },
+        "air_force": {
+            "fighters": 20,
+            "bombers": 12,
+        },
+        "neighbors": ["burma", "french_indochina", "malaya"],
+        "focus_tree": "minor_nation_focus_tree",
+        "playable": True,
+        "faction": "non_aligned",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["japan", "uk"],
+        "description": "The only Southeast Asian nation to avoid European colonization, Thailand under military leadership modernizes while balancing between Japanese and Western interests.",
+    },
+    "korea": {
+        "name": "Korea",
+        "color": Fore.MAGENTA,
+        "leader": "Minami Jirō",
+        "government": "Fascist",
+        "stability": 35,
+        "war_support": 20,
+        "industry": {
+            "civilian_factories": 4,
+            "military_factories": 2,
+            "dockyards": 1,
+            "infrastructure": 3,
+        },
+        "resources": {
+            "steel": 8,
+            "oil": 0,
+            "aluminum": 3,
+            "rubber": 0,
+            "tungsten": 15,
+            "chromium": 5,
+        },
+        "army": {
+            "divisions": 8,
+            "manpower": 200000,
+            "equipment": {
+                "infantry_equipment": 25000,
+                "artillery": 400,
+                "tanks": 50,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 1,
+                "destroyers": 3,
+                "submarines": 2,
+            },
+        },
+        "air_force": {
+            "fighters": 25,
+            "bombers": 15,
+        },
+        "neighbors": ["china", "ussr"],
+        "focus_tree": "minor_nation_focus_tree",
+        "playable": True,
+        "faction": "axis",
+        "puppet_master": "japan",
+        "puppet_states": [],
+        "trade_agreements": ["japan"],
+        "description": "Korea under Japanese colonial rule since 1910 serves as a staging ground for expansion into China. Industrial development occurs alongside cultural suppression.",
+    },
+    "manchukuo": {
+        "name": "Manchukuo",
+        "color": Fore.LIGHTRED_EX,
+        "leader": "Puyi",
+        "government": "Fascist",
+        "stability": 40,
+        "war_support": 30,
+        "industry": {
+            "civilian_factories": 6,
+            "military_factories": 3,
+            "dockyards": 1,
+            "infrastructure": 4,
+        },
+        "resources": {
+            "steel": 25,
+            "oil": 5,
+            "aluminum": 8,
+            "rubber": 0,
+            "tungsten": 12,
+            "chromium": 8,
+        },
+        "army": {
+            "divisions": 12,
+            "manpower": 300000,
+            "equipment": {
+                "infantry_equipment": 40000,
+                "artillery": 600,
+                "tanks": 80,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 0,
+                "destroyers": 2,
+                "submarines": 1,
+            },
+        },
+        "air_force": {
+            "fighters": 30,
+            "bombers": 20,
+        },
+        "neighbors": ["china", "ussr", "mongolia"],
+        "focus_tree": "minor_nation_focus_tree",
+        "playable": True,
+        "faction": "axis",
+        "puppet_master": "japan",
+        "puppet_states": [],
+        "trade_agreements": ["japan"],
+        "description": "Japanese puppet state established in 1932 with the last Qing emperor as figurehead. Rich in resources and heavy industry, serving Japan's war machine.",
+    },
+    "french_indochina": {
+        "name": "French Indochina",
+        "color": Fore.LIGHTBLUE_EX,
+        "leader": "Jules Brévié",
+        "government": "Democratic",
+        "stability": 45,
+        "war_support": 25,
+        "industry": {
+            "civilian_factories": 3,
+            "military_factories": 1,
+            "dockyards": 2,
+            "infrastructure": 3,
+        },
+        "resources": {
+            "steel": 2,
+            "oil": 0,
+            "aluminum": 3,
+            "rubber": 25,
+            "tungsten": 10,
+            "chromium": 2,
+        },
+        "army": {
+            "divisions": 6,
+            "manpower": 100000,
+            "equipment": {
+                "infantry_equipment": 15000,
+                "artillery": 250,
+                "tanks": 20,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 1,
+                "destroyers": 3,
+                "submarines": 2,
+            },
+        },
+        "air_force": {
+            "fighters": 18,
+            "bombers": 10,
+        },
+        "neighbors": ["thailand", "china"],
+        "focus_tree": "minor_nation_focus_tree",
+        "playable": True,
+        "faction": "allies",
+        "puppet_master": "france",
+        "puppet_states": [],
+        "trade_agreements": ["france", "uk"],
+        "description": "French colonial federation comprising Vietnam, Laos, and Cambodia. Rich in rubber and minerals but facing growing independence movements.",
+    },
+    "tibet": {
+        "name": "Tibet",
+        "color": Fore.YELLOW,
+        "leader": "14th Dalai Lama",
+        "government": "Neutral",
+        "stability": 55,
+        "war_support": 20,
+        "industry": {
+            "civilian_factories": 1,
+            "military_factories": 1,
+            "dockyards": 0,
+            "infrastructure": 1,
+        },
+        "resources": {
+            "steel": 1,
+            "oil": 0,
+            "aluminum": 2,
+            "rubber": 0,
+            "tungsten": 8,
+            "chromium": 3,
+        },
+        "army": {
+            "divisions": 4,
+            "manpower": 80000,
+            "equipment": {
+                "infantry_equipment": 12000,
+                "artillery": 100,
+                "tanks": 5,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 0,
+                "destroyers": 0,
+                "submarines": 0,
+            },
+        },
+        "air_force": {
+            "fighters": 4,
+            "bombers": 2,
+        },
+        "neighbors": ["china", "india"],
+        "focus_tree": "minor_nation_focus_tree",
+        "playable": True,
+        "faction": "non_aligned",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["uk"],
+        "description": "Isolated Buddhist theocracy maintaining traditional governance while facing pressure from Chinese expansion. The young Dalai Lama seeks to preserve Tibetan independence.",
+    },
+    "afghanistan": {
+        "name": "Afghanistan",
+        "color": Fore.LIGHTBLACK_EX,
+        "leader": "Mohammed Zahir Shah",
+        "government": "Neutral",
+        "stability": 45,
+        "war_support": 30,
+        "industry": {
+            "civilian_factories": 2,
+            "military_factories": 1,
+            "dockyards": 0,
+            "infrastructure": 2,
+        },
+        "resources": {
+            "steel": 3,
+            "oil": 2,
+            "aluminum": 1,
+            "rubber": 0,
+            "tungsten": 5,
+            "chromium": 2,
+        },
+        "army": {
+            "divisions": 6,
+            "manpower": 150000,
+            "equipment": {
+                "infantry_equipment": 20000,
+                "artillery": 200,
+                "tanks": 10,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 0,
+                "destroyers": 0,
+                "submarines": 0,
+            },
+        },
+        "air_force": {
+            "fighters": 8,
+            "bombers": 4,
+        },
+        "neighbors": ["iran", "ussr", "india"],
+        "focus_tree": "minor_nation_focus_tree",
+        "playable": True,
+        "faction": "non_aligned",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["germany", "ussr"],
+        "description": "Afghanistan under King Zahir Shah maintains independence between British India and Soviet Union. The Great Game continues as both powers seek influence.",
+    },
+    "peru": {
+        "name": "Peru",
+        "color": Fore.LIGHTRED_EX,
+        "leader": "Oscar R. Benavides",
+        "government": "Military",
+        "stability": 50,
+        "war_support": 35,
+        "industry": {
+            "civilian_factories": 3,
+            "military_factories": 1,
+            "dockyards": 1,
+            "infrastructure": 3,
+        },
+        "resources": {
+            "steel": 5,
+            "oil": 8,
+            "aluminum": 6,
+            "rubber": 5,
+            "tungsten": 8,
+            "chromium": 3,
+        },
+        "army": {
+            "divisions": 6,
+            "manpower": 100000,
+            "equipment": {
+                "infantry_equipment": 15000,
+                "artillery": 250,
+                "tanks": 25,
+            },
+        },
+        "navy": {
+            "ships": {
+                "battleships": 0,
+                "cruisers": 2,
+                "destroyers": 4,
+                "submarines": 2,
+            },
+        },
+        "air_force": {
+            "fighters": 18,
+            "bombers": 10,
+        },
+        "neighbors": ["chile", "bolivia", "brazil", "colombia", "ecuador"],
+        "focus_tree": "minor_nation_focus_tree",
+        "playable": True,
+        "faction": "non_aligned",
+        "puppet_master": None,
+        "puppet_states": [],
+        "trade_agreements": ["usa", "uk"],
+        "description": "Peru under military strongman Benavides seeks modernization while managing territorial disputes. Mining wealth provides economic potential but political instability persists.",
+    },
+
+}
+
+# Focus trees
+FOCUS_TREES = {
+    "polish_focus_tree": {
+        "fortify_borders": {
+            "title": "Fortify the Borders",
+            "description": "With aggressive neighbors on both sides, we must strengthen our border defenses to deter invasion.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 5,
+                "war_support": 10,
+            },
+            "position": [1, 1],
+        },
+        "military_modernization": {
+            "title": "Military Modernization",
+            "description": "Poland's military needs modern equipment to stand against the war machines of Germany and the Soviet Union.",
+            "time": 70,
+            "prerequisites": ["fortify_borders"],
+            "mutually_exclusive": [],
+            "effects": {
+                "production_bonus": {
+                    "military_factories": 10,
+                    "tanks": 15,
+                    "aircraft": 10,
+                },
+            },
+            "position": [1, 2],
+        },
+        "seek_western_allies": {
+            "title": "Seek Western Allies",
+            "description": "Poland cannot stand alone. We must secure firm guarantees from Britain and France.",
+            "time": 70,
+            "prerequisites": ["fortify_borders"],
+            "mutually_exclusive": ["seek_accommodation_with_germany"],
+            "effects": {
+                "stability": 10,
+                "relation_bonus": {
+                    "uk": 30,
+                    "france": 30,
+                    "germany": -20,
+                },
+            },
+            "position": [0, 2],
+        },
+        "polish_british_alliance": {
+            "title": "Polish-British Alliance",
+            "description": "Formalize our alliance with Great Britain to deter German aggression.",
+            "time": 70,
+            "prerequisites": ["seek_western_allies"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 15,
+                "war_support": 15,
+                "relation_bonus": {
+                    "uk": 50,
+                },
+                "guarantee": ["uk"],
+            },
+            "position": [0, 3],
+        },
+        "seek_accommodation_with_germany": {
+            "title": "Accommodate German Demands",
+            "description": "Perhaps giving up some territory to Germany will satisfy their demands and preserve our independence.",
+            "time": 70,
+            "prerequisites": ["fortify_borders"],
+            "mutually_exclusive": ["seek_western_allies"],
+            "effects": {
+                "stability": -5,
+                "war_support": -10,
+                "relation_bonus": {
+                    "germany": 30,
+                },
+            },
+            "position": [2, 2],
+        },
+        "polish_german_non_aggression_pact": {
+            "title": "Polish-German Non-Aggression Pact",
+            "description": "Sign a ten-year non-aggression pact with Germany to secure our western border temporarily.",
+            "time": 70,
+            "prerequisites": ["seek_accommodation_with_germany"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 10,
+                "relation_bonus": {
+                    "germany": 40,
+                    "france": -20,
+                    "uk": -20,
+                },
+                "non_aggression": ["germany"],
+            },
+            "position": [2, 3],
+        },
+        "develop_central_industrial_region": {
+            "title": "Develop Central Industrial Region",
+            "description": "Invest heavily in the Central Industrial Region (COP) to boost our industrial capacity.",
+            "time": 70,
+            "prerequisites": ["military_modernization"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 2,
+                "military_factories": 1,
+                "stability": 5,
+            },
+            "position": [1, 3],
+        },
+        "intermarum_alliance": {
+            "title": "Intermarium Alliance",
+            "description": "Form an alliance of nations between Germany and the Soviet Union, from the Baltic to the Black Sea.",
+            "time": 70,
+            "prerequisites": ["polish_british_alliance", "develop_central_industrial_region"],
+            "mutually_exclusive": ["communist_revolution"],
+            "effects": {
+                "stability": 10,
+                "war_support": 15,
+                "relation_bonus": {
+                    "romania": 40,
+                    "hungary": 30,
+                    "czechoslovakia": 30,
+                    "lithuania": 30,
+                    "latvia": 30,
+                    "estonia": 30,
+                },
+                "create_faction": "Intermarium Alliance",
+            },
+            "position": [0, 4],
+        },
+        "polish_soviet_cooperation": {
+            "title": "Polish-Soviet Cooperation",
+            "description": "Seek improved relations with the Soviet Union despite our historical enmity.",
+            "time": 70,
+            "prerequisites": ["polish_german_non_aggression_pact"],
+            "mutually_exclusive": ["prepare_for_total_defense"],
+            "effects": {
+                "stability": -5,
+                "war_support": -10,
+                "relation_bonus": {
+                    "ussr": 30,
+                },
+            },
+            "position": [3, 4],
+        },
+        "prepare_for_total_defense": {
+            "title": "Prepare for Total Defense",
+            "description": "We cannot trust any great power. Poland must prepare to defend itself against all potential aggressors.",
+            "time": 70,
+            "prerequisites": ["develop_central_industrial_region"],
+            "mutually_exclusive": ["polish_soviet_cooperation", "communist_revolution"],
+            "effects": {
+                "stability": 5,
+                "war_support": 30,
+                "military_factories": 1,
+            },
+            "position": [1, 4],
+        },
+        "communist_revolution": {
+            "title": "Communist Revolution",
+            "description": "The only way to save Poland from fascist aggression is to embrace communism and align with the Soviet Union.",
+            "time": 70,
+            "prerequisites": ["develop_central_industrial_region"],
+            "mutually_exclusive": ["intermarum_alliance", "prepare_for_total_defense"],
+            "effects": {
+                "stability": -20,
+                "war_support": 10,
+                "government_change": "Communist",
+                "relation_bonus": {
+                    "ussr": 50,
+                    "uk": -30,
+                    "france": -30,
+                    "germany": -50,
+                },
+            },
+            "position": [2, 4],
+        },
+        "restore_polish_monarchy": {
+            "title": "Restore the Polish Monarchy",
+            "description": "Restore the Polish monarchy to unite the nation under a strong figurehead in these dangerous times.",
+            "time": 70,
+            "prerequisites": ["prepare_for_total_defense"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 15,
+                "war_support": 10,
+                "government_change": "Non-Aligned",
+                "new_leader": "Prince Augustus Czartoryski",
+            },
+            "position": [1, 5],
+        },
+    },
+    "yugoslavian_focus_tree": {
+        "balance_ethnic_tensions": {
+            "title": "Balance Ethnic Tensions",
+            "description": "Yugoslavia is a patchwork of different ethnic groups. We must carefully balance their interests to maintain unity.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 15,
+                "political_power": 50,
+            },
+            "position": [1, 1],
+        },
+        "industrialize_croatia": {
+            "title": "Industrialize Croatia",
+            "description": "Focus industrial development in Croatia to strengthen the economy and integrate this region more closely.",
+            "time": 70,
+            "prerequisites": ["balance_ethnic_tensions"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 1,
+                "stability": 5,
+            },
+            "position": [0, 2],
+        },
+        "serbian_military_tradition": {
+            "title": "Serbian Military Tradition",
+            "description": "Build upon Serbia's proud military history to strengthen the Yugoslav armed forces.",
+            "time": 70,
+            "prerequisites": ["balance_ethnic_tensions"],
+            "mutually_exclusive": [],
+            "effects": {
+                "military_factories": 1,
+                "war_support": 10,
+            },
+            "position": [2, 2],
+        },
+        "federal_structure": {
+            "title": "Federal Structure Reform",
+            "description": "Reorganize Yugoslavia into a true federation of equal constituent republics to better address ethnic concerns.",
+            "time": 70,
+            "prerequisites": ["balance_ethnic_tensions"],
+            "mutually_exclusive": ["serbian_domination"],
+            "effects": {
+                "stability": 20,
+                "war_support": -5,
+                "government_change": "Democratic",
+            },
+            "position": [1, 2],
+        },
+        "croatian_autonomy": {
+            "title": "Croatian Autonomy",
+            "description": "Grant greater autonomy to Croatia within the federation to address their national aspirations.",
+            "time": 70,
+            "prerequisites": ["federal_structure", "industrialize_croatia"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 10,
+                "civilian_factories": 1,
+            },
+            "position": [0, 3],
+        },
+        "serbian_domination": {
+            "title": "Serbian Domination",
+            "description": "Serbia is the dominant force in Yugoslavia and should rightfully lead the nation with a firm hand.",
+            "time": 70,
+            "prerequisites": ["serbian_military_tradition"],
+            "mutually_exclusive": ["federal_structure"],
+            "effects": {
+                "stability": -10,
+                "war_support": 15,
+                "government_change": "Neutral",
+            },
+            "position": [2, 3],
+        },
+        "royal_dictatorship": {
+            "title": "Royal Dictatorship",
+            "description": "King Alexander's assassination has shown that democracy cannot work in our divided nation. Strengthen royal authority to maintain order.",
+            "time": 70,
+            "prerequisites": ["serbian_domination"],
+            "mutually_exclusive": ["workers_councils"],
+            "effects": {
+                "stability": 15,
+                "war_support": 10,
+                "government_change": "Non-Aligned",
+            },
+            "position": [3, 4],
+        },
+        "workers_councils": {
+            "title": "Workers' Councils",
+            "description": "Implement a system of workers' self-management to build a unique Yugoslav path to socialism.",
+            "time": 70,
+            "prerequisites": ["federal_structure"],
+            "mutually_exclusive": ["royal_dictatorship", "democratic_constitution"],
+            "effects": {
+                "stability": 5,
+                "civilian_factories": 2,
+                "government_change": "Communist",
+            },
+            "position": [1, 4],
+        },
+        "democratic_constitution": {
+            "title": "Democratic Constitution",
+            "description": "Draft a new constitution enshrining democratic principles and guaranteeing rights for all ethnic groups.",
+            "time": 70,
+            "prerequisites": ["federal_structure"],
+            "mutually_exclusive": ["workers_councils", "royal_dictatorship"],
+            "effects": {
+                "stability": 15,
+                "war_support": -5,
+                "government_change": "Democratic",
+            },
+            "position": [0, 4],
+        },
+        "align_with_little_entente": {
+            "title": "Align with Little Entente",
+            "description": "Strengthen our ties with Czechoslovakia and Romania to form a powerful alliance against revisionist neighbors.",
+            "time": 70,
+            "prerequisites": ["balance_ethnic_tensions"],
+            "mutually_exclusive": ["seek_italian_friendship"],
+            "effects": {
+                "relation_bonus": {
+                    "czechoslovakia": 40,
+                    "romania": 40,
+                    "france": 20,
+                },
+                "guarantee": ["czechoslovakia", "romania"],
+            },
+            "position": [1, 3],
+        },
+        "seek_italian_friendship": {
+            "title": "Seek Italian Friendship",
+            "description": "Improve relations with Fascist Italy to secure our western border and gain a powerful ally.",
+            "time": 70,
+            "prerequisites": ["serbian_domination"],
+            "mutually_exclusive": ["align_with_little_entente"],
+            "effects": {
+                "stability": 5,
+                "relation_bonus": {
+                    "italy": 50,
+                    "france": -20,
+                    "uk": -10,
+                },
+                "non_aggression": ["italy"],
+            },
+            "position": [2, 4],
+        },
+        "expand_naval_facilities": {
+            "title": "Expand Adriatic Naval Facilities",
+            "description": "Develop our Adriatic coast with modern naval facilities to establish Yugoslavia as a naval power in the Mediterranean.",
+            "time": 70,
+            "prerequisites": ["seek_italian_friendship"],
+            "mutually_exclusive": [],
+            "effects": {
+                "dockyards": 2,
+                "civilian_factories": 1,
+            },
+            "position": [3, 5],
+        },
+        "balkan_federation": {
+            "title": "Balkan Federation",
+            "description": "Propose a federation of Balkan states to overcome historical divisions and create a powerful regional bloc.",
+            "time": 70,
+            "prerequisites": ["workers_councils"],
+            "mutually_exclusive": [],
+            "effects": {
+                "relation_bonus": {
+                    "bulgaria": 40,
+                    "romania": 30,
+                    "greece": 30,
+                    "albania": 50,
+                },
+                "create_faction": "Balkan Federation",
+            },
+            "position": [1, 5],
+        },
+        "adriatic_defense_line": {
+            "title": "Adriatic Defense Line",
+            "description": "Fortify our coastline against potential Italian aggression, focusing on key strategic points.",
+            "time": 70,
+            "prerequisites": ["align_with_little_entente"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 5,
+                "war_support": 10,
+            },
+            "position": [0, 5],
+        },
+    },
+    "belgian_focus_tree": {
+        "strengthen_neutrality": {
+            "title": "Strengthen Neutrality",
+            "description": "Belgium's neutrality has been guaranteed by international treaty. We must reinforce this diplomatic position.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 10,
+                "war_support": -5,
+                "relation_bonus": {
+                    "uk": 10,
+                    "france": 10,
+                    "germany": 10,
+                },
+            },
+            "position": [1, 1],
+        },
+        "expand_antwerp_port": {
+            "title": "Expand Antwerp Port",
+            "description": "Antwerp is one of Europe's major ports. Expanding it will boost our economy and international importance.",
+            "time": 70,
+            "prerequisites": ["strengthen_neutrality"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 1,
+                "dockyards": 1,
+            },
+            "position": [1, 2],
+        },
+        "fortify_german_border": {
+            "title": "Fortify German Border",
+            "description": "Despite our neutrality, we must prepare for the worst. Build defensive fortifications along our eastern border.",
+            "time": 70,
+            "prerequisites": ["strengthen_neutrality"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 10,
+                "stability": -5,
+                "relation_bonus": {
+                    "germany": -10,
+                },
+            },
+            "position": [2, 2],
+        },
+        "industrial_development": {
+            "title": "Wallonian Industrial Development",
+            "description": "Invest in the heavy industries of Wallonia to strengthen our economy and military potential.",
+            "time": 70,
+            "prerequisites": ["expand_antwerp_port"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 1,
+                "military_factories": 1,
+            },
+            "position": [0, 3],
+        },
+        "integrate_congo_resources": {
+            "title": "Integrate Congo Resources",
+            "description": "Our colony in the Congo contains vast resources that can be better integrated into our war economy.",
+            "time": 70,
+            "prerequisites": ["industrial_development"],
+            "mutually_exclusive": [],
+            "effects": {
+                "resources": {
+                    "rubber": 10,
+                    "tungsten": 5,
+                    "steel": 5,
+                },
+            },
+            "position": [0, 4],
+        },
+        "french_military_cooperation": {
+            "title": "French Military Cooperation",
+            "description": "Coordinate our defensive plans with France to ensure mutual support in case of German aggression.",
+            "time": 70,
+            "prerequisites": ["fortify_german_border"],
+            "mutually_exclusive": ["abandon_neutrality"],
+            "effects": {
+                "war_support": 15,
+                "relation_bonus": {
+                    "france": 30,
+                    "germany": -20,
+                },
+                "guarantee": ["france"],
+            },
+            "position": [2, 3],
+        },
+        "abandon_neutrality": {
+            "title": "Abandon Neutrality",
+            "description": "Our neutrality has not served us well in past conflicts. We must take a more active stance in European affairs.",
+            "time": 70,
+            "prerequisites": ["fortify_german_border", "expand_antwerp_port"],
+            "mutually_exclusive": ["french_military_cooperation"],
+            "effects": {
+                "stability": -10,
+                "war_support": 20,
+            },
+            "position": [1, 3],
+        },
+        "ally_with_germany": {
+            "title": "Alliance with Germany",
+            "description": "Perhaps aligning with the rising power of Germany is our best path to security and prosperity.",
+            "time": 70,
+            "prerequisites": ["abandon_neutrality"],
+            "mutually_exclusive": ["join_allies"],
+            "effects": {
+                "relation_bonus": {
+                    "germany": 50,
+                    "france": -40,
+                    "uk": -40,
+                },
+                "stability": -5,
+                "join_faction": "axis",
+            },
+            "position": [0, 5],
+        },
+        "join_allies": {
+            "title": "Join the Allies",
+            "description": "Our best hope lies with Britain and France. We should formally join their alliance against German aggression.",
+            "time": 70,
+            "prerequisites": ["abandon_neutrality", "french_military_cooperation"],
+            "mutually_exclusive": ["ally_with_germany"],
+            "effects": {
+                "relation_bonus": {
+                    "uk": 50,
+                    "france": 50,
+                    "germany": -40,
+                },
+                "stability": 10,
+                "join_faction": "allies",
+            },
+            "position": [2, 4],
+        },
+        "expand_military_industry": {
+            "title": "Expand Military Industry",
+            "description": "Significantly expand our arms production capabilities to prepare for possible conflict.",
+            "time": 70,
+            "prerequisites": ["ally_with_germany", "join_allies"],
+            "mutually_exclusive": [],
+            "effects": {
+                "military_factories": 2,
+            },
+            "position": [1, 5],
+        },
+        "benelux_defense_agreement": {
+            "title": "Benelux Defense Agreement",
+            "description": "Form a defensive alliance with the Netherlands and Luxembourg to better protect our mutual interests.",
+            "time": 70,
+            "prerequisites": ["join_allies"],
+            "mutually_exclusive": [],
+            "effects": {
+                "relation_bonus": {
+                    "netherlands": 50,
+                    "luxembourg": 50,
+                },
+                "create_faction": "Benelux Alliance",
+            },
+            "position": [3, 5],
+        },
+        "greater_belgium": {
+            "title": "Greater Belgium",
+            "description": "Reclaim territories historically connected to Belgium, including parts of northern France and southern Netherlands.",
+            "time": 70,
+            "prerequisites": ["ally_with_germany"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 20,
+                "stability": -10,
+                "gain_territory": "netherlands",
+            },
+            "position": [0, 6],
+        },
+    },
+    "spanish_focus_tree": {
+        "civil_war_recovery": {
+            "title": "Civil War Recovery",
+            "description": "Spain has been devastated by the civil war. We must focus on rebuilding our nation's infrastructure and healing the wounds of this fratricidal conflict.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 10,
+                "civilian_factories": 2,
+                "resources": {
+                    "steel": 5,
+                    "tungsten": 5
+                }
+            },
+            "position": [1, 1]
+        },
+        "falangist_consolidation": {
+            "title": "Falangist Consolidation",
+            "description": "Strengthen Franco's rule and the Falangist party's grip on power, crushing any remaining Republican resistance.",
+            "time": 70,
+            "prerequisites": ["civil_war_recovery"],
+            "mutually_exclusive": ["republican_underground"],
+            "effects": {
+                "stability": 15,
+                "war_support": 10,
+                "political_influence": 20
+            },
+            "position": [0, 2]
+        },
+        "republican_underground": {
+            "title": "Republican Underground",
+            "description": "Secretly support the remaining Republican forces operating underground. The dream of a democratic Spain is not dead.",
+            "time": 70,
+            "prerequisites": ["civil_war_recovery"],
+            "mutually_exclusive": ["falangist_consolidation"],
+            "effects": {
+                "stability": -10,
+                "political_influence": 15
+            },
+            "position": [2, 2]
+        },
+        "anti_communist_volunteers": {
+            "title": "Anti-Communist Volunteers",
+            "description": "Send Spanish volunteers to fight against the Soviet Union alongside German forces, maintaining official neutrality while supporting the Axis fight against communism.",
+            "time": 70,
+            "prerequisites": ["falangist_consolidation"],
+            "mutually_exclusive": [],
+            "effects": {
+                "relation_bonus": {
+                    "germany": 20,
+                    "italy": 10,
+                    "ussr": -20
+                },
+                "army_organization": 5
+            },
+            "position": [0, 3]
+        },
+        "reclaim_empire": {
+            "title": "Reclaim the Empire",
+            "description": "Spain once ruled a vast empire. The time has come to reclaim our rightful territories and restore Spanish glory.",
+            "time": 70,
+            "prerequisites": ["falangist_consolidation"],
+            "mutually_exclusive": [],
+            "effects": {
+                "claim_territory": ["north_africa", "latin_america"],
+                "war_support": 15
+            },
+            "position": [1, 3]
+        },
+        "restore_republic": {
+            "title": "Restore the Republic",
+            "description": "The time has come to overthrow Franco's fascist regime and restore the democratic Spanish Republic.",
+            "time": 70,
+            "prerequisites": ["republican_underground"],
+            "mutually_exclusive": [],
+            "effects": {
+                "government": "Democratic",
+                "stability": -20,
+                "political_influence": 30
+            },
+            "position": [2, 3]
+        },
+        "gibraltar_operation": {
+            "title": "Operation Felix",
+            "description": "Seize the opportunity to reclaim Gibraltar from the British, securing this strategic point for Spain.",
+            "time": 70,
+            "prerequisites": ["reclaim_empire"],
+            "mutually_exclusive": [],
+            "effects": {
+                "relation_bonus": {
+                    "uk": -40
+                },
+                "claim_territory": ["gibraltar"]
+            },
+            "position": [1, 4]
+        },
+        "join_allies": {
+            "title": "Join the Allies",
+            "description": "With the Republic restored, we will join the Allied powers in their fight against fascism across Europe.",
+            "time": 70,
+            "prerequisites": ["restore_republic"],
+            "mutually_exclusive": [],
+            "effects": {
+                "relation_bonus": {
+                    "uk": 40,
+                    "france": 40,
+                    "usa": 40,
+                    "germany": -50,
+                    "italy": -50
+                },
+                "join_faction": "Allies"
+            },
+            "position": [2, 4]
+        }
+    },
+
+    "turkish_focus_tree": {
+        "kemalist_reforms": {
+            "title": "Kemalist Reforms",
+            "description": "Continue Atatürk's modernization reforms to transform Turkey into a secular, Western-oriented nation.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 10,
+                "political_influence": 20,
+                "civilian_factories": 1
+            },
+            "position": [1, 1]
+        },
+        "strategic_neutrality": {
+            "title": "Strategic Neutrality",
+            "description": "Turkey must carefully balance relations with all major powers while maintaining its neutrality in the growing conflict.",
+            "time": 70,
+            "prerequisites": ["kemalist_reforms"],
+            "mutually_exclusive": ["ottoman_restoration"],
+            "effects": {
+                "stability": 15,
+                "relation_bonus": {
+                    "germany": 10,
+                    "uk": 10,
+                    "ussr": 10
+                }
+            },
+            "position": [0, 2]
+        },
+        "ottoman_restoration": {
+            "title": "Neo-Ottoman Ambitions",
+            "description": "The collapse of imperial order in Europe presents an opportunity to reclaim former Ottoman territories and restore Turkish influence.",
+            "time": 70,
+            "prerequisites": ["kemalist_reforms"],
+            "mutually_exclusive": ["strategic_neutrality"],
+            "effects": {
+                "war_support": 20,
+                "claim_territory": ["cyprus", "syria", "iraq"],
+                "stability": -5
+            },
+            "position": [2, 2]
+        },
+        "industrial_modernization": {
+            "title": "Industrial Modernization",
+            "description": "Invest heavily in industrial development to transform Turkey's largely agricultural economy into a modern industrial power.",
+            "time": 70,
+            "prerequisites": ["strategic_neutrality"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 3,
+                "military_factories": 1,
+                "resources": {
+                    "steel": 10,
+                    "chromium": 5
+                }
+            },
+            "position": [0, 3]
+        },
+        "balkan_dominance": {
+            "title": "Balkan Dominance",
+            "description": "Expand Turkish influence in the Balkans, potentially reclaiming territories lost after World War I.",
+            "time": 70,
+            "prerequisites": ["ottoman_restoration"],
+            "mutually_exclusive": [],
+            "effects": {
+                "claim_territory": ["thrace", "aegean_islands"],
+                "relation_bonus": {
+                    "greece": -30,
+                    "bulgaria": -10
+                }
+            },
+            "position": [2, 3]
+        }
+    },
+
+    "swedish_focus_tree": {
+        "maintain_neutrality": {
+            "title": "Maintain Swedish Neutrality",
+            "description": "Sweden has a long tradition of neutrality in European conflicts. We must carefully navigate the brewing storm to keep our nation out of the war.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 15,
+                "war_support": -10,
+                "relation_bonus": {
+                    "germany": 5,
+                    "uk": 5
+                }
+            },
+            "position": [1, 1]
+        },
+        "expand_mining_operations": {
+            "title": "Expand Mining Operations",
+            "description": "Sweden's vast iron ore deposits are crucial to the German war machine. By expanding our mining operations, we can leverage this valuable resource for diplomatic advantage.",
+            "time": 70,
+            "prerequisites": ["maintain_neutrality"],
+            "mutually_exclusive": [],
+            "effects": {
+                "resources": {
+                    "steel": 30,
+                    "tungsten": 10
+                },
+                "civilian_factories": 2
+            },
+            "position": [0, 2]
+        },
+        "nordic_defense_pact": {
+            "title": "Nordic Defense Pact",
+            "description": "Form a defensive alliance with our Nordic neighbors to protect against potential aggression from Germany or the Soviet Union.",
+            "time": 70,
+            "prerequisites": ["maintain_neutrality"],
+            "mutually_exclusive": [],
+            "effects": {
+                "relation_bonus": {
+                    "finland": 30,
+                    "norway": 30,
+                    "denmark": 30
+                },
+                "create_faction": "Nordic Council"
+            },
+            "position": [2, 2]
+        },
+        "industrial_self_sufficiency": {
+            "title": "Industrial Self-Sufficiency",
+            "description": "Develop Sweden's industrial base to reduce dependency on imports that could be disrupted by the war.",
+            "time": 70,
+            "prerequisites": ["expand_mining_operations"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 3,
+                "military_factories": 2,
+                "stability": 10
+            },
+            "position": [0, 3]
+        },
+        "scandinavian_cooperation": {
+            "title": "Scandinavian Cooperation",
+            "description": "Deepen economic and military ties with our Scandinavian neighbors to create a stronger united front against external threats.",
+            "time": 70,
+            "prerequisites": ["nordic_defense_pact"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 1,
+                "military_factories": 1,
+                "alliance_with": ["norway", "denmark", "finland"]
+            },
+            "position": [2, 3]
+        }
+    },
+
+    "soviet_focus_tree": {
+        "five_year_plan": {
+            "title": "The Second Five Year Plan",
+            "description": "Continue Stalin's ambitious industrialization program to transform the Soviet Union into a modern industrial power.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 3,
+                "military_factories": 2,
+                "stability": -5,
+            },
+            "position": [1, 1],
+        },
+        "nkvd_expansion": {
+            "title": "Expand the NKVD",
+            "description": "Strengthen state security to deal with counter-revolutionaries and saboteurs undermining our socialist progress.",
+            "time": 70,
+            "prerequisites": ["five_year_plan"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 15,
+                "war_support": 5,
+                "political_influence": 20,
+            },
+            "position": [0, 2],
+        },
+        "collectivization": {
+            "title": "Complete Collectivization",
+            "description": "Finish the collectivization of agriculture to increase production efficiency and break the power of the kulaks.",
+            "time": 70,
+            "prerequisites": ["five_year_plan"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": -10,
+                "resources": {
+                    "food": 15,
+                },
+            },
+            "position": [1, 2],
+        },
+        "military_industry": {
+            "title": "Military Industrialization",
+            "description": "Prioritize heavy industry and military production to prepare for the inevitable conflict with capitalist powers.",
+            "time": 70,
+            "prerequisites": ["five_year_plan"],
+            "mutually_exclusive": [],
+            "effects": {
+                "military_factories": 3,
+                "resources": {
+                    "steel": 10,
+                    "oil": 5,
+                },
+            },
+            "position": [2, 2],
+        },
+        "great_purge": {
+            "title": "The Great Purge",
+            "description": "Cleanse the party, military, and society of potential traitors and Trotskyist elements to ensure loyalty to Stalin.",
+            "time": 70,
+            "prerequisites": ["nkvd_expansion"],
+            "mutually_exclusive": ["rehabilitate_trotsky"],
+            "effects": {
+                "stability": 20,
+                "war_support": -10,
+                "army_organization": -15,
+            },
+            "position": [0, 3],
+        },
+        "rehabilitate_trotsky": {
+            "title": "Rehabilitate Trotsky",
+            "description": "In a shocking turn of events, restore Leon Trotsky to a position of influence and embrace his theory of permanent revolution.",
+            "time": 70,
+            "prerequisites": ["nkvd_expansion"],
+            "mutually_exclusive": ["great_purge"],
+            "effects": {
+                "stability": -15,
+                "war_support": 15,
+                "political_influence": 30,
+            },
+            "position": [0, 4],
+        },
+        "red_army_expansion": {
+            "title": "Red Army Modernization",
+            "description": "Invest heavily in expanding and modernizing our armed forces to face any capitalist aggression.",
+            "time": 70,
+            "prerequisites": ["military_industry", "collectivization"],
+            "mutually_exclusive": [],
+            "effects": {
+                "military_factories": 2,
+                "army_organization": 10,
+                "resources": {
+                    "tungsten": 5,
+                    "aluminum": 10,
+                },
+            },
+            "position": [1, 3],
+        },
+        "international_revolution": {
+            "title": "Support International Revolution",
+            "description": "Increase aid to communist movements worldwide to spread the revolution beyond Soviet borders.",
+            "time": 70,
+            "prerequisites": ["rehabilitate_trotsky"],
+            "mutually_exclusive": ["socialism_in_one_country"],
+            "effects": {
+                "stability": -5,
+                "war_support": 20,
+                "political_influence": 40,
+                "relation_bonus": {
+                    "germany": -20,
+                    "uk": -20,
+                    "france": -20,
+                },
+            },
+            "position": [-1, 5],
+        },
+        "socialism_in_one_country": {
+            "title": "Socialism in One Country",
+            "description": "Focus on building socialism within the Soviet Union rather than risky international adventures.",
+            "time": 70,
+            "prerequisites": ["great_purge", "red_army_expansion"],
+            "mutually_exclusive": ["international_revolution"],
+            "effects": {
+                "stability": 15,
+                "civilian_factories": 2,
+                "political_influence": 20,
+            },
+            "position": [1, 4],
+        },
+        "defensive_line": {
+            "title": "Stalin Line Fortifications",
+            "description": "Construct a series of fortifications along our western border to defend against potential German aggression.",
+            "time": 70,
+            "prerequisites": ["socialism_in_one_country"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 5,
+                "war_support": 10,
+                "relation_bonus": {
+                    "germany": -10,
+                },
+            },
+            "position": [1, 5],
+        },
+        "third_international": {
+            "title": "Strengthen the Comintern",
+            "description": "Reinvigorate the Third International as a counter to growing fascist power in Europe.",
+            "time": 70,
+            "prerequisites": ["international_revolution"],
+            "mutually_exclusive": [],
+            "effects": {
+                "create_faction": "Comintern",
+                "political_influence": 30,
+                "relation_bonus": {
+                    "france": 10,  # to the French Communist Party
+                    "germany": 10,  # to the German Communist Party
+                },
+            },
+            "position": [-1, 6],
+        },
+        "pact_with_germany": {
+            "title": "Molotov-Ribbentrop Pact",
+            "description": "Sign a non-aggression pact with Nazi Germany to buy time and potentially divide Eastern Europe into spheres of influence.",
+            "time": 70,
+            "prerequisites": ["defensive_line", "socialism_in_one_country"],
+            "mutually_exclusive": ["anti_fascist_alliance"],
+            "effects": {
+                "relation_bonus": {
+                    "germany": 50,
+                    "poland": -30,
+                    "finland": -30,
+                    "romania": -30,
+                },
+                "claim_territory": ["finland", "poland_east", "romania"],
+            },
+            "position": [2, 5],
+        },
+        "anti_fascist_alliance": {
+            "title": "Anti-Fascist Alliance",
+            "description": "Set aside ideological differences temporarily to form an alliance with Western democracies against the fascist threat.",
+            "time": 70,
+            "prerequisites": ["defensive_line"],
+            "mutually_exclusive": ["pact_with_germany"],
+            "effects": {
+                "relation_bonus": {
+                    "uk": 30,
+                    "france": 30,
+                    "germany": -40,
+                },
+            },
+            "position": [0, 6],
+        },
+        "claims_on_finland": {
+            "title": "Claims on Finnish Territory",
+            "description": "Demand territorial concessions from Finland to secure Leningrad's northern approaches.",
+            "time": 70,
+            "prerequisites": ["pact_with_germany"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 10,
+                "claim_territory": ["finland"],
+                "relation_bonus": {
+                    "finland": -50,
+                },
+            },
+            "position": [3, 6],
+        },
+        "red_tanks": {
+            "title": "Soviet Tank Program",
+            "description": "Accelerate the development and production of advanced tank designs like the T-34 and KV series.",
+            "time": 70,
+            "prerequisites": ["red_army_expansion"],
+            "mutually_exclusive": [],
+            "effects": {
+                "military_factories": 2,
+                "army_research_bonus": 15,
+            },
+            "position": [1, 7],
+        },
+        "world_revolution": {
+            "title": "World Revolution",
+            "description": "The time has come to spread the revolution globally and overthrow the capitalist order once and for all.",
+            "time": 70,
+            "prerequisites": ["third_international", "red_tanks"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 25,
+                "stability": -5,
+                "political_influence": 50,
+                "claim_territory": ["europe"],
+            },
+            "position": [0, 8],
+        },
+    },
+    "japanese_focus_tree": {
+        "marco_polo_bridge": {
+            "title": "Marco Polo Bridge Incident",
+            "description": "The clash at the Marco Polo Bridge has provided us with a pretext to expand our presence in China. We must seize this opportunity for further expansion.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 15,
+                "claim_territory": ["china"],
+            },
+            "position": [1, 1],
+        },
+        "southern_expansion": {
+            "title": "Southern Expansion Doctrine",
+            "description": "Japan's future lies in the resource-rich lands of Southeast Asia. We must prepare to secure these vital territories.",
+            "time": 70,
+            "prerequisites": ["marco_polo_bridge"],
+            "mutually_exclusive": ["northern_expansion"],
+            "effects": {
+                "relation_bonus": {
+                    "uk": -20,
+                    "usa": -20,
+                    "netherlands": -20,
+                },
+                "claim_territory": ["indonesia", "malaysia"],
+            },
+            "position": [0, 2],
+        },
+        "northern_expansion": {
+            "title": "Northern Expansion Doctrine",
+            "description": "The Soviet Union poses the greatest threat to our ambitions in Asia. We must focus our military preparations against them.",
+            "time": 70,
+            "prerequisites": ["marco_polo_bridge"],
+            "mutually_exclusive": ["southern_expansion"],
+            "effects": {
+                "relation_bonus": {
+                    "soviet": -30,
+                },
+                "claim_territory": ["mongolia", "siberia"],
+            },
+            "position": [2, 2],
+        },
+        "imperial_glory": {
+            "title": "Imperial Glory",
+            "description": "The divine Emperor's rule must be extended to guide the peoples of Asia toward a new era of prosperity under Japanese leadership.",
+            "time": 70,
+            "prerequisites": ["marco_polo_bridge"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 15,
+                "war_support": 10,
+                "political_influence": 25,
+            },
+            "position": [1, 2],
+        },
+        "economic_expansion": {
+            "title": "Industrial Development",
+            "description": "To support our military ambitions, we must rapidly expand our industrial capacity and resource exploitation.",
+            "time": 70,
+            "prerequisites": ["imperial_glory"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 2,
+                "military_factories": 2,
+            },
+            "position": [1, 3],
+        },
+        "zero_fighter": {
+            "title": "Zero Fighter Development",
+            "description": "Invest in the development of the A6M Zero fighter, which will give us air superiority across the Pacific.",
+            "time": 70,
+            "prerequisites": ["economic_expansion"],
+            "mutually_exclusive": [],
+            "effects": {
+                "military_factories": 1,
+                "air_research_bonus": 15,
+            },
+            "position": [0, 4],
+        },
+        "naval_expansion": {
+            "title": "Imperial Japanese Navy Expansion",
+            "description": "The navy is the key to Japanese power projection in the Pacific. We must build more carriers and battleships.",
+            "time": 70,
+            "prerequisites": ["economic_expansion"],
+            "mutually_exclusive": [],
+            "effects": {
+                "dockyards": 3,
+                "navy_research_bonus": 15,
+            },
+            "position": [2, 4],
+        },
+        "greater_east_asia": {
+            "title": "Greater East Asia Co-Prosperity Sphere",
+            "description": "Create a new economic and political bloc of Asian nations under Japanese leadership, free from Western colonialism.",
+            "time": 70,
+            "prerequisites": ["southern_expansion", "imperial_glory"],
+            "mutually_exclusive": [],
+            "effects": {
+                "create_faction": "Co-Prosperity Sphere",
+                "political_influence": 50,
+            },
+            "position": [0, 5],
+        },
+        "puppet_manchuria": {
+            "title": "Manchukuo Development",
+            "description": "Further develop our puppet state in Manchuria as a base for industrial development and military operations in China.",
+            "time": 70,
+            "prerequisites": ["northern_expansion", "imperial_glory"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 1,
+                "military_factories": 1,
+                "resources": {
+                    "steel": 10,
+                    "aluminum": 5,
+                },
+            },
+            "position": [2, 5],
+        },
+        "anti_comintern": {
+            "title": "Anti-Comintern Pact",
+            "description": "Form an alliance with Germany against the threat of international communism and Soviet expansion.",
+            "time": 70,
+            "prerequisites": ["northern_expansion"],
+            "mutually_exclusive": ["pacific_neutrality"],
+            "effects": {
+                "relation_bonus": {
+                    "germany": 50,
+                    "italy": 30,
+                    "soviet": -40,
+                },
+                "join_faction": "axis",
+            },
+            "position": [3, 3],
+        },
+        "pacific_neutrality": {
+            "title": "Pacific Non-Aggression",
+            "description": "Seek diplomatic solutions with Western powers to secure our interests while avoiding a devastating war.",
+            "time": 70,
+            "prerequisites": ["imperial_glory"],
+            "mutually_exclusive": ["anti_comintern", "greater_east_asia"],
+            "effects": {
+                "stability": 15,
+                "relation_bonus": {
+                    "usa": 30,
+                    "uk": 30,
+                },
+            },
+            "position": [1, 5],
+        },
+        "strike_pearl_harbor": {
+            "title": "Strike South: Pearl Harbor",
+            "description": "A bold surprise attack on the American Pacific Fleet will buy us the time needed to secure the resources of Southeast Asia.",
+            "time": 70,
+            "prerequisites": ["greater_east_asia", "naval_expansion"],
+            "mutually_exclusive": ["pacific_neutrality"],
+            "effects": {
+                "war_support": 25,
+                "stability": -10,
+                "declare_war": ["usa"],
+            },
+            "position": [1, 6],
+        },
+    },
+    "italian_focus_tree": {
+        "ethiopian_war": {
+            "title": "The Ethiopian War",
+            "description": "Our conquest of Ethiopia has demonstrated Italy's military might. We must consolidate our gains and establish proper colonial administration.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 10,
+                "resources": {
+                    "steel": 5,
+                    "chromium": 5,
+                },
+            },
+            "position": [1, 1],
+        },
+        "industrial_north": {
+            "title": "Industrialize Northern Italy",
+            "description": "Focus industrial development in the Po Valley to create a strong manufacturing base for Italy.",
+            "time": 70,
+            "prerequisites": ["ethiopian_war"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 2,
+                "military_factories": 1,
+            },
+            "position": [0, 2],
+        },
+        "strengthen_fascist_rule": {
+            "title": "Strengthen Fascist Rule",
+            "description": "Solidify the PNF's control over all aspects of Italian society and crush any remaining opposition.",
+            "time": 70,
+            "prerequisites": ["ethiopian_war"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 15,
+                "political_influence": 50,
+            },
+            "position": [1, 2],
+        },
+        "naval_expansion": {
+            "title": "Mare Nostrum",
+            "description": "The Mediterranean is rightfully an Italian lake. Expand our naval capabilities to dominate this vital sea.",
+            "time": 70,
+            "prerequisites": ["ethiopian_war"],
+            "mutually_exclusive": [],
+            "effects": {
+                "dockyards": 2,
+                "navy_research_bonus": 10,
+            },
+            "position": [2, 2],
+        },
+        "balkan_diplomacy": {
+            "title": "Balkan Diplomacy",
+            "description": "Strengthen our ties with the Balkan nations to increase Italian influence in the region.",
+            "time": 70,
+            "prerequisites": ["strengthen_fascist_rule"],
+            "mutually_exclusive": [],
+            "effects": {
+                "relation_bonus": {
+                    "yugoslavia": 15,
+                    "romania": 15,
+                    "bulgaria": 15,
+                    "greece": 15,
+                },
+            },
+            "position": [1, 3],
+        },
+        "albanian_occupation": {
+            "title": "Occupy Albania",
+            "description": "Albania is key to controlling the Adriatic. We should formally annex it to secure our strategic position.",
+            "time": 70,
+            "prerequisites": ["balkan_diplomacy"],
+            "mutually_exclusive": [],
+            "effects": {
+                "gain_territory": "albania",
+                "military_factories": 1,
+                "relation_bonus": {
+                    "yugoslavia": -20,
+                    "greece": -20,
+                },
+            },
+            "position": [2, 4],
+        },
+        "german_alignment": {
+            "title": "Align with Germany",
+            "description": "Germany and Italy share ideological values and strategic interests. We should formalize our partnership.",
+            "time": 70,
+            "prerequisites": ["strengthen_fascist_rule"],
+            "mutually_exclusive": ["maintain_independence"],
+            "effects": {
+                "relation_bonus": {
+                    "germany": 50,
+                    "uk": -20,
+                    "france": -20,
+                },
+                "join_faction": "axis",
+            },
+            "position": [0, 4],
+        },
+        "maintain_independence": {
+            "title": "Independent Foreign Policy",
+            "description": "Italy's interests are not always aligned with Germany's. We should maintain our independence and pursue our own objectives.",
+            "time": 70,
+            "prerequisites": ["strengthen_fascist_rule", "balkan_diplomacy"],
+            "mutually_exclusive": ["german_alignment"],
+            "effects": {
+                "stability": 5,
+                "political_influence": 25,
+                "relation_bonus": {
+                    "germany": -10,
+                    "uk": 10,
+                    "france": 10,
+                },
+            },
+            "position": [1, 4],
+        },
+        "spanish_intervention": {
+            "title": "Intervene in Spain",
+            "description": "The Spanish Civil War presents an opportunity to support Franco and establish another fascist ally in the Mediterranean.",
+            "time": 70,
+            "prerequisites": ["german_alignment"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 5,
+                "relation_bonus": {
+                    "spain": 30,
+                    "france": -10,
+                },
+            },
+            "position": [0, 5],
+        },
+        "roman_empire": {
+            "title": "Restore the Roman Empire",
+            "description": "It is time to reclaim the glory of Rome and rebuild our ancient empire across the Mediterranean.",
+            "time": 70,
+            "prerequisites": ["albanian_occupation", "spanish_intervention"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 25,
+                "stability": -5,
+                "political_influence": 50,
+                "claim_territory": ["france", "greece", "yugoslavia", "egypt"],
+            },
+            "position": [1, 6],
+        },
+        "libyan_expansion": {
+            "title": "Develop Libya",
+            "description": "Invest in our Libyan colony to strengthen our presence in North Africa.",
+            "time": 70,
+            "prerequisites": ["naval_expansion"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 1,
+                "military_factories": 1,
+                "resources": {
+                    "oil": 5,
+                },
+            },
+            "position": [3, 3],
+        },
+        "claims_on_france": {
+            "title": "Claims on French Territory",
+            "description": "Corsica, Nice, and Savoy rightfully belong to Italy. We must prepare to reclaim these territories.",
+            "time": 70,
+            "prerequisites": ["german_alignment"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 10,
+                "relation_bonus": {
+                    "france": -30,
+                },
+                "claim_territory": ["france"],
+            },
+            "position": [0, 6],
+        },
+    },
+    "dutch_focus_tree": {
+        "protect_east_indies": {
+            "title": "Protect the East Indies",
+            "description": "Our colonial possessions in the East Indies are vital to our economy and status as a global power. We must protect them.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "dockyards": 1,
+                "navy_research_bonus": 10,
+            },
+            "position": [1, 1],
+        },
+        "trade_expansion": {
+            "title": "Trade Expansion",
+            "description": "As a traditional trading nation, we should focus on expanding our commercial networks around the world.",
+            "time": 70,
+            "prerequisites": ["protect_east_indies"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 2,
+                "resource_gain": {
+                    "rubber": 5,
+                    "oil": 5,
+                },
+            },
+            "position": [1, 2],
+        },
+        "water_defenses": {
+            "title": "Water Defenses",
+            "description": "The Netherlands has a long tradition of using water as a defensive measure. Prepare plans to flood strategic areas if invasion threatens.",
+            "time": 70,
+            "prerequisites": ["protect_east_indies"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 5,
+                "war_support": 10,
+            },
+            "position": [2, 2],
+        },
+        "modernize_port_rotterdam": {
+            "title": "Modernize Rotterdam Port",
+            "description": "Rotterdam is one of Europe's most important ports. Expanding and modernizing its facilities will boost our economy.",
+            "time": 70,
+            "prerequisites": ["trade_expansion"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 1,
+                "dockyards": 1,
+                "stability": 5
+            },
+            "position": [0, 3],
+        },
+        "philips_industrial_development": {
+            "title": "Philips Industrial Expansion",
+            "description": "Support the expansion of Philips Electronics to become a leader in technological development.",
+            "time": 70,
+            "prerequisites": ["trade_expansion"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 1,
+                "research_slots": 1,
+                "tech_research_bonus": 5
+            },
+            "position": [1, 3],
+        },
+        "focus_defensive_preparations": {
+            "title": "Defensive Preparations",
+            "description": "We must fortify key defensive positions along our borders to protect against possible German aggression.",
+            "time": 70,
+            "prerequisites": ["water_defenses"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 15,
+                "military_factories": 1,
+                "relation_bonus": {
+                    "germany": -10,
+                }
+            },
+            "position": [2, 3],
+        },
+        "neutrality_at_all_costs": {
+            "title": "Maintain Strict Neutrality",
+            "description": "Our neutrality protected us during the Great War. We must maintain this policy at all costs.",
+            "time": 70,
+            "prerequisites": ["water_defenses", "philips_industrial_development"],
+            "mutually_exclusive": ["abandon_neutrality"],
+            "effects": {
+                "stability": 15,
+                "war_support": -10,
+                "relation_bonus": {
+                    "germany": 10,
+                    "uk": 10,
+                    "france": 10,
+                },
+            },
+            "position": [1, 4],
+        },
+        "abandon_neutrality": {
+            "title": "Abandon Neutrality",
+            "description": "The changing political landscape of Europe suggests that neutrality may no longer be a viable policy. We must choose sides.",
+            "time": 70,
+            "prerequisites": ["focus_defensive_preparations", "philips_industrial_development"],
+            "mutually_exclusive": ["neutrality_at_all_costs"],
+            "effects": {
+                "stability": -10,
+                "war_support": 20,
+            },
+            "position": [2, 4],
+        },
+        "ally_with_germany": {
+            "title": "Accommodation with Germany",
+            "description": "Given our vulnerable position, perhaps accommodation with Germany is the most pragmatic path forward.",
+            "time": 70,
+            "prerequisites": ["abandon_neutrality"],
+            "mutually_exclusive": ["ally_with_uk"],
+            "effects": {
+                "relation_bonus": {
+                    "germany": 50,
+                    "uk": -30,
+                    "france": -30,
+                },
+                "join_faction": "axis",
+            },
+            "position": [3, 5],
+        },
+        "ally_with_uk": {
+            "title": "Alliance with Britain",
+            "description": "Britain has long been our protector against continental hegemony. We should formally align with them.",
+            "time": 70,
+            "prerequisites": ["abandon_neutrality"],
+            "mutually_exclusive": ["ally_with_germany"],
+            "effects": {
+                "relation_bonus": {
+                    "uk": 50,
+                    "france": 30,
+                    "germany": -40,
+                },
+                "join_faction": "allies",
+            },
+            "position": [1, 5],
+        },
+        "dutch_east_indies_army": {
+            "title": "Strengthen East Indies Army",
+            "description": "We must significantly strengthen our colonial forces in the East Indies to protect against Japanese expansion.",
+            "time": 70,
+            "prerequisites": ["ally_with_uk"],
+            "mutually_exclusive": [],
+            "effects": {
+                "military_factories": 1,
+                "war_support": 10,
+                "relation_bonus": {
+                    "japan": -20,
+                },
+            },
+            "position": [0, 6],
+        },
+        "colonial_nationalism": {
+            "title": "Colonial Nationalism",
+            "description": "Foster a sense of national identity in our colonies to ensure their loyalty to the Netherlands.",
+            "time": 70,
+            "prerequisites": ["dutch_east_indies_army"],
+            "mutually_exclusive": ["indonesian_autonomy"],
+            "effects": {
+                "stability": 10,
+                "resources": {
+                    "rubber": 10,
+                    "oil": 10,
+                },
+            },
+            "position": [0, 7],
+        },
+        "indonesian_autonomy": {
+            "title": "Indonesian Autonomy",
+            "description": "Grant greater autonomy to Indonesian nationalists to secure their cooperation in our war effort.",
+            "time": 70,
+            "prerequisites": ["dutch_east_indies_army"],
+            "mutually_exclusive": ["colonial_nationalism"],
+            "effects": {
+                "stability": -5,
+                "war_support": 15,
+                "military_factories": 1,
+            },
+            "position": [1, 7],
+        },
+        "greater_netherlands": {
+            "title": "Greater Netherlands",
+            "description": "Revive historical claims to Flanders and other historically Dutch territories.",
+            "time": 70,
+            "prerequisites": ["ally_with_germany"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 20,
+                "stability": -10,
+                "relation_bonus": {
+                    "belgium": -50,
+                    "france": -20,
+                },
+                "gain_territory": "belgium",
+            },
+            "position": [3, 6],
+        },
+        "reclaim_frisian_islands": {
+            "title": "Reclaim the Frisian Islands",
+            "description": "The German-held East Frisian Islands should be rightfully Dutch. We shall reclaim them.",
+            "time": 70,
+            "prerequisites": ["greater_netherlands"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 15,
+                "gain_territory": "germany",
+            },
+            "position": [3, 7],
+        },
+    },
+    "danish_focus_tree": {
+        "nordic_cooperation": {
+            "title": "Nordic Cooperation",
+            "description": "Strengthen ties with our Scandinavian neighbors to present a united diplomatic front.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 10,
+                "relation_bonus": {
+                    "sweden": 20,
+                    "norway": 20,
+                },
+            },
+            "position": [1, 1],
+        },
+        "agricultural_exports": {
+            "title": "Agricultural Exports",
+            "description": "Denmark's agricultural sector is highly developed. Focus on increasing exports to strengthen our economy.",
+            "time": 70,
+            "prerequisites": ["nordic_cooperation"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 1,
+                "stability": 5,
+            },
+            "position": [0, 2],
+        },
+        "small_nation_diplomacy": {
+            "title": "Small Nation Diplomacy",
+            "description": "As a small nation, we must rely on diplomatic skill rather than military might to navigate the dangerous waters of European politics.",
+            "time": 70,
+            "prerequisites": ["nordic_cooperation"],
+            "mutually_exclusive": [],
+            "effects": {
+                "political_power": 100,
+                "stability": 5,
+            },
+            "position": [2, 2],
+        },
+    },
+    "norwegian_focus_tree": {
+        "merchant_marine": {
+            "title": "Merchant Marine",
+            "description": "Norway's large merchant fleet is crucial to our economy and international standing. Expand and modernize it.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "dockyards": 1,
+                "civilian_factories": 1,
+            },
+            "position": [1, 1],
+        },
+        "hydroelectric_power": {
+            "title": "Hydroelectric Power",
+            "description": "Norway's mountainous terrain is perfect for hydroelectric power generation. Develop this resource to power industrial growth.",
+            "time": 70,
+            "prerequisites": ["merchant_marine"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 1,
+                "military_factories": 1,
+            },
+            "position": [0, 2],
+        },
+        "coastal_defenses": {
+            "title": "Coastal Defenses",
+            "description": "Norway's long coastline is vulnerable to naval invasion. Strengthen coastal fortifications and defenses.",
+            "time": 70,
+            "prerequisites": ["merchant_marine"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 10,
+                "stability": 5,
+            },
+            "position": [2, 2],
+        },
+    },
+    "austrian_focus_tree": {
+        "constitutional_reforms": {
+            "title": "Constitutional Reforms",
+            "description": "Reform the Austrian state to create a more stable political system capable of resisting external pressures.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 15,
+                "political_power": 50,
+            },
+            "position": [1, 1],
+        },
+        "alpine_fortifications": {
+            "title": "Alpine Fortifications",
+            "description": "The mountainous terrain of Austria provides natural defensive advantages. Fortify key passes and routes to deter invasion.",
+            "time": 70,
+            "prerequisites": ["constitutional_reforms"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 5,
+                "war_support": 10,
+            },
+            "position": [0, 2],
+        },
+        "habsburg_restoration": {
+            "title": "Habsburg Restoration",
+            "description": "The ancient Habsburg dynasty ruled Austria for centuries. Restoring the monarchy could provide stability and legitimacy.",
+            "time": 70,
+            "prerequisites": ["constitutional_reforms"],
+            "mutually_exclusive": ["resist_anschluss"],
+            "effects": {
+                "stability": 10,
+                "war_support": 10,
+                "government_change": "Monarchist",
+            },
+            "position": [1, 2],
+        },
+        "resist_anschluss": {
+            "title": "Resist Anschluss",
+            "description": "Germany seeks to absorb Austria into the Reich. We must resist these pressures and maintain our independence.",
+            "time": 70,
+            "prerequisites": ["constitutional_reforms"],
+            "mutually_exclusive": ["habsburg_restoration"],
+            "effects": {
+                "stability": -5,
+                "war_support": 15,
+                "relation_bonus": {
+                    "germany": -30,
+                    "uk": 10,
+                    "france": 10,
+                },
+            },
+            "position": [2, 2],
+        },
+    },
+    "german_focus_tree": {
+        "rhineland": {
+            "title": "Remilitarize the Rhineland",
+            "description": "The Versailles Treaty prevents us from stationing troops in the Rhineland, which leaves western Germany vulnerable. We should reclaim our right to defend our borders.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 5,
+                "war_support": 10,
+                "world_tension": 5,
+            },
+            "position": [1, 1],
+        },
+        "ideological_crossroads": {
+            "title": "Ideological Crossroads",
+            "description": "Germany stands at a pivotal moment in history. We must choose our path forward: continue with fascism, embrace democracy, or pursue the communist ideal.",
+            "time": 70,
+            "prerequisites": ["rhineland"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": -5,
+                "political_power": 150,
+            },
+            "position": [0, 2],
+        },
+        "democratic_reforms": {
+            "title": "Democratic Reforms",
+            "description": "Return Germany to a democratic path, renouncing the extremism of the Nazi party and restoring constitutional governance.",
+            "time": 70,
+            "prerequisites": ["ideological_crossroads"],
+            "mutually_exclusive": ["communist_revolution", "fascist_loyalty"],
+            "effects": {
+                "stability": 10,
+                "war_support": -15,
+                "government_change": "Democratic",
+                "new_leader": "Konrad Adenauer",
+            },
+            "position": [-1, 3],
+        },
+        "communist_revolution": {
+            "title": "Communist Revolution",
+            "description": "The time has come for the workers of Germany to rise up against capitalism and fascism alike. We shall bring about Karl Marx's vision for his homeland.",
+            "time": 70,
+            "prerequisites": ["ideological_crossroads"],
+            "mutually_exclusive": ["democratic_reforms", "fascist_loyalty"],
+            "effects": {
+                "stability": -15,
+                "war_support": 15,
+                "government_change": "Communist",
+                "new_leader": "Ernst Thälmann",
+                "internal_conflicts": 1,
+            },
+            "position": [-2, 3],
+        },
+        "fascist_loyalty": {
+            "title": "Loyalty to the Führer",
+            "description": "Reaffirm our commitment to National Socialism and Hitler's leadership. The Reich shall continue on its destined path to greatness.",
+            "time": 70,
+            "prerequisites": ["ideological_crossroads"],
+            "mutually_exclusive": ["communist_revolution", "democratic_reforms"],
+            "effects": {
+                "stability": 15,
+                "war_support": 15,
+            },
+            "position": [0, 3],
+        },
+        "restore_kaiser": {
+            "title": "Restore the Kaiser",
+            "description": "The Hohenzollern monarchy brought Germany to its height of power. It is time to restore the Kaiser and rebuild the German Empire.",
+            "time": 70,
+            "prerequisites": ["democratic_reforms"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 10,
+                "war_support": 10,
+                "government_change": "Monarchist",
+                "new_leader": "Wilhelm III",
+            },
+            "position": [-1, 4],
+        },
+        "european_cooperation": {
+            "title": "European Cooperation",
+            "description": "Rather than conquest, Germany should lead a new era of European cooperation and integration.",
+            "time": 70,
+            "prerequisites": ["democratic_reforms"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 15,
+                "war_support": -10,
+                "world_tension": -10,
+                "diplomacy_bonus": 20,
+            },
+            "position": [-2, 4],
+        },
+        "workers_paradise": {
+            "title": "Workers' Paradise",
+            "description": "Create a true communist state in Germany, with worker-owned means of production and social equality for all.",
+            "time": 70,
+            "prerequisites": ["communist_revolution"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 15,
+                "civilian_factories": 3,
+                "military_factories": 2,
+            },
+            "position": [-2, 4],
+        },
+        "align_with_soviet": {
+            "title": "Align with Soviet Union",
+            "description": "Forge a strong alliance with the Soviet Union to advance the cause of worldwide communist revolution.",
+            "time": 70,
+            "prerequisites": ["workers_paradise"],
+            "mutually_exclusive": [],
+            "effects": {
+                "diplomacy": {
+                    "ussr": 100,
+                },
+                "join_faction": "comintern",
+            },
+            "position": [-3, 5],
+        },
+        "stalin_pact": {
+            "title": "The Stalin Pact",
+            "description": "Sign a non-aggression pact with the Soviet Union that secretly divides Eastern Europe into spheres of influence.",
+            "time": 70,
+            "prerequisites": ["align_with_soviet"],
+            "mutually_exclusive": [],
+            "effects": {
+                "diplomacy": {
+                    "ussr": 50,
+                    "poland": -30,
+                },
+                "stability": 10,
+                "world_tension": -5,
+            },
+            "position": [-3, 6],
+        },
+        "revolutionary_army": {
+            "title": "The Revolutionary Army",
+            "description": "Reform the military along revolutionary lines, with political commissars ensuring loyalty to the communist cause.",
+            "time": 70,
+            "prerequisites": ["workers_paradise"],
+            "mutually_exclusive": [],
+            "effects": {
+                "army": {
+                    "divisions": 5,
+                },
+                "stability": -5,
+                "war_support": 15,
+            },
+            "position": [-2, 5],
+        },
+        "great_purge": {
+            "title": "The Great Purge",
+            "description": "Eliminate potential opposition within the party and military to consolidate Communist control.",
+            "time": 70,
+            "prerequisites": ["revolutionary_army"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": -15,
+                "war_support": -10,
+                "political_power": 100,
+                "internal_conflicts": 2,
+            },
+            "position": [-2, 6],
+        },
+        "export_revolution": {
+            "title": "Export the Revolution",
+            "description": "Support communist movements in neighboring countries to spread the revolution beyond Germany's borders.",
+            "time": 70,
+            "prerequisites": ["align_with_soviet", "revolutionary_army"],
+            "mutually_exclusive": [],
+            "effects": {
+                "diplomacy": {
+                    "france": -30,
+                    "uk": -30,
+                    "italy": -20,
+                },
+                "war_support": 20,
+                "world_tension": 15,
+            },
+            "position": [-3, 7],
+        },
+        "democratic_coalition": {
+            "title": "Democratic Coalition",
+            "description": "Form a broad coalition government that represents all democratic factions within Germany.",
+            "time": 70,
+            "prerequisites": ["democratic_reforms"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 20,
+                "war_support": -5,
+                "political_power": 100,
+            },
+            "position": [-1, 5],
+        },
+        "western_allies": {
+            "title": "Western Allies",
+            "description": "Seek diplomatic and economic support from the Western democracies - France, Britain, and the United States.",
+            "time": 70,
+            "prerequisites": ["democratic_coalition"],
+            "mutually_exclusive": [],
+            "effects": {
+                "diplomacy": {
+                    "uk": 50,
+                    "france": 50,
+                    "usa": 30,
+                },
+                "civilian_factories": 2,
+                "resources": {
+                    "oil": 8,
+                },
+            },
+            "position": [-1, 6],
+        },
+        "join_allies": {
+            "title": "Join the Allies",
+            "description": "Join the Allied powers, formally aligning democratic Germany with Britain and France against the threats of fascism and communism.",
+            "time": 70,
+            "prerequisites": ["western_allies"],
+            "mutually_exclusive": [],
+            "effects": {
+                "join_faction": "allies",
+                "stability": 10,
+                "world_tension": -5,
+            },
+            "position": [-1, 7],
+        },
+        "european_federation": {
+            "title": "European Federation",
+            "description": "Propose a democratic federation of European states to prevent future wars and promote economic cooperation.",
+            "time": 70,
+            "prerequisites": ["european_cooperation"],
+            "mutually_exclusive": [],
+            "effects": {
+                "diplomacy": {
+                    "france": 30,
+                    "belgium": 50,
+                    "netherlands": 50,
+                    "luxembourg": 50,
+                },
+                "stability": 15,
+                "civilian_factories": 3,
+            },
+            "position": [-2, 5],
+        },
+        "invite_europe": {
+            "title": "Invite European Nations",
+            "description": "Extend formal invitations to neighboring countries to join the European economic and political community.",
+            "time": 70,
+            "prerequisites": ["european_federation"],
+            "mutually_exclusive": [],
+            "effects": {
+                "diplomacy": {
+                    "france": 50,
+                    "italy": 30,
+                    "belgium": 70,
+                    "netherlands": 70,
+                    "luxembourg": 70,
+                },
+                "create_faction": "european_union",
+            },
+            "position": [-2, 6],
+        },
+        "economic_miracle": {
+            "title": "Economic Miracle",
+            "description": "Implement free market reforms and infrastructure investments that jumpstart the German economy.",
+            "time": 70,
+            "prerequisites": ["democratic_coalition"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 5,
+                "stability": 10,
+                "infrastructure": 2,
+            },
+            "position": [0, 5],
+        },
+        "imperial_nostalgia": {
+            "title": "Imperial Nostalgia",
+            "description": "Foster a sense of nostalgia for the imperial era, highlighting the stability and prosperity under the Kaiser.",
+            "time": 70,
+            "prerequisites": ["democratic_reforms"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 5,
+                "war_support": 5,
+                "political_power": 50,
+            },
+            "position": [0, 4],
+        },
+        "military_tradition": {
+            "title": "Prussian Military Tradition",
+            "description": "Emphasize the honorable traditions of the Prussian military, distancing the army from Nazi extremism.",
+            "time": 70,
+            "prerequisites": ["imperial_nostalgia"],
+            "mutually_exclusive": [],
+            "effects": {
+                "army_experience": 50,
+                "war_support": 10,
+            },
+            "position": [0, 5],
+        },
+        "hohenzollern_loyalists": {
+            "title": "Hohenzollern Loyalists",
+            "description": "Organize political support for the restoration of the monarchy among conservatives and traditionalists.",
+            "time": 70,
+            "prerequisites": ["imperial_nostalgia", "military_tradition"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 5,
+                "political_power": 100,
+            },
+            "position": [0, 6],
+        },
+        "third_way": {
+            "title": "The Third Way",
+            "description": "Chart a course between capitalism and communism with a balanced approach to economic and social policy.",
+            "time": 70,
+            "prerequisites": ["restore_kaiser"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 15,
+                "civilian_factories": 2,
+                "military_factories": 1,
+            },
+            "position": [-1, 6],
+        },
+        "rearmament_program": {
+            "title": "Royal Rearmament Program",
+            "description": "Begin a measured military buildup under royal authority, emphasizing defensive capabilities.",
+            "time": 70,
+            "prerequisites": ["restore_kaiser"],
+            "mutually_exclusive": [],
+            "effects": {
+                "military_factories": 3,
+                "army": {
+                    "divisions": 5,
+                },
+                "war_support": 15,
+            },
+            "position": [0, 7],
+        },
+        "naval_tradition": {
+            "title": "Imperial Naval Tradition",
+            "description": "Revive the proud naval tradition of Imperial Germany with investments in the Kriegsmarine.",
+            "time": 70,
+            "prerequisites": ["rearmament_program"],
+            "mutually_exclusive": [],
+            "effects": {
+                "dockyards": 4,
+                "navy": {
+                    "ships": {
+                        "battleships": 1,
+                        "cruisers": 2,
+                        "destroyers": 4,
+                    },
+                },
+                "navy_experience": 50,
+            },
+            "position": [0, 8],
+        },
+        "nuclear_program": {
+            "title": "Uranium Club",
+            "description": "Establish a secret research program to explore the military applications of nuclear fission.",
+            "time": 70,
+            "prerequisites": ["fascist_loyalty"],
+            "mutually_exclusive": [],
+            "effects": {
+                "research_bonus": {
+                    "nuclear_tech": 50,
+                },
+                "world_tension": 5,
+            },
+            "position": [1, 4],
+        },
+        "blitzkrieg_doctrine": {
+            "title": "Blitzkrieg Doctrine",
+            "description": "Refine the revolutionary combined arms doctrine that emphasizes speed, surprise, and concentrated firepower.",
+            "time": 70,
+            "prerequisites": ["panzer_divisions"],
+            "mutually_exclusive": [],
+            "effects": {
+                "army_experience": 50,
+                "research_bonus": {
+                    "land_doctrine": 20,
+                },
+            },
+            "position": [1, 5],
+        },
+        "alliance_with_italy": {
+            "title": "Alliance with Italy",
+            "description": "Strengthen ties with Mussolini's Italy to form the core of a fascist bloc in Europe.",
+            "time": 70,
+            "prerequisites": ["fascist_loyalty"],
+            "mutually_exclusive": [],
+            "effects": {
+                "diplomacy": {
+                    "italy": 100,
+                },
+                "join_faction": "axis",
+            },
+            "position": [2, 4],
+        },
+        "alliance_with_japan": {
+            "title": "Alliance with Japan",
+            "description": "Extend the anti-communist pact to include Imperial Japan, creating a global fascist alliance.",
+            "time": 70,
+            "prerequisites": ["alliance_with_italy"],
+            "mutually_exclusive": [],
+            "effects": {
+                "diplomacy": {
+                    "japan": 100,
+                },
+                "world_tension": 5,
+            },
+            "position": [2, 5],
+        },
+        "lebensraum": {
+            "title": "Lebensraum",
+            "description": "Prepare for territorial expansion in Eastern Europe to secure living space for the German people.",
+            "time": 70,
+            "prerequisites": ["fascist_loyalty"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 20,
+                "world_tension": 15,
+            },
+            "position": [3, 4],
+        },
+        "war_with_poland": {
+            "title": "War with Poland",
+            "description": "Launch a full-scale invasion of Poland to reclaim German territories and begin the expansion eastward.",
+            "time": 70,
+            "prerequisites": ["danzig_or_war", "molotov_ribbentrop_pact"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_goal": "poland",
+                "war_support": 15,
+                "world_tension": 25,
+            },
+            "position": [2, 6],
+        },
+        "total_war": {
+            "title": "Total War",
+            "description": "Mobilize all of Germany's resources and population for an all-out war effort.",
+            "time": 70,
+            "prerequisites": ["war_with_poland"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": -3,
+                "military_factories": 6,
+                "war_support": 20,
+                "stability": -10,
+            },
+            "position": [2, 7],
+        },
+        "anschluss": {
+            "title": "Anschluss of Austria",
+            "description": "The people of Austria are German by blood and culture. It is time to unite them with the Reich.",
+            "time": 70,
+            "prerequisites": ["rhineland"],
+            "mutually_exclusive": [],
+            "effects": {
+                "annex": "austria",
+                "civilian_factories": 4,
+                "military_factories": 2,
+                "stability": 5,
+                "war_support": 5,
+                "world_tension": 10,
+            },
+            "position": [1, 2],
+        },
+        "sudetenland": {
+            "title": "Demand Sudetenland",
+            "description": "The ethnic Germans in Czechoslovakia's Sudetenland region deserve to be part of the Reich.",
+            "time": 70,
+            "prerequisites": ["anschluss"],
+            "mutually_exclusive": [],
+            "effects": {
+                "gain_territory": "czechoslovakia",
+                "civilian_factories": 3,
+                "military_factories": 2,
+                "world_tension": 15,
+            },
+            "position": [1, 3],
+        },
+        "fate_czechoslovakia": {
+            "title": "Fate of Czechoslovakia",
+            "description": "With the Sudetenland secured, we must decide what to do with the remainder of Czechoslovakia.",
+            "time": 70,
+            "prerequisites": ["sudetenland"],
+            "mutually_exclusive": [],
+            "effects": {
+                "annex": "czechoslovakia",
+                "civilian_factories": 6,
+                "military_factories": 4,
+                "world_tension": 20,
+            },
+            "position": [1, 4],
+        },
+        "danzig_or_war": {
+            "title": "Danzig or War",
+            "description": "The Polish Corridor separates East Prussia from the rest of Germany. We must reclaim Danzig and secure a land connection.",
+            "time": 70,
+            "prerequisites": ["fate_czechoslovakia"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_goal": "poland",
+                "war_support": 10,
+                "world_tension": 25,
+            },
+            "position": [1, 5],
+        },
+        "four_year_plan": {
+            "title": "Four Year Plan",
+            "description": "Implement the Four Year Plan to rapidly build up our industrial capacity for war.",
+            "time": 70,
+            "prerequisites": ["rhineland"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 4,
+                "military_factories": 3,
+                "production_efficiency": 10,
+                "research_slots": 1,
+            },
+            "position": [2, 1],
+        },
+        "autarky": {
+            "title": "Autarky",
+            "description": "Implement policies to make Germany more self-sufficient in resources.",
+            "time": 70,
+            "prerequisites": ["four_year_plan"],
+            "mutually_exclusive": [],
+            "effects": {
+                "resources": {
+                    "steel": 10,
+                    "oil": 5,
+                    "aluminum": 5,
+                },
+                "stability": 5,
+            },
+            "position": [2, 2],
+        },
+        "westwall": {
+            "title": "Westwall",
+            "description": "Construct fortifications along our western border to protect against French aggression.",
+            "time": 70,
+            "prerequisites": ["four_year_plan"],
+            "mutually_exclusive": [],
+            "effects": {
+                "fortification_west": 3,
+                "construction_speed": 10,
+            },
+            "position": [3, 1],
+        },
+        "hermann_goring_werke": {
+            "title": "Hermann Göring Werke",
+            "description": "Establish the Hermann Göring Werke to boost our steel production.",
+            "time": 70,
+            "prerequisites": ["autarky"],
+            "mutually_exclusive": [],
+            "effects": {
+                "resources": {
+                    "steel": 20,
+                    "aluminum": 10,
+                },
+                "production_efficiency": 5,
+            },
+            "position": [2, 3],
+        },
+        "kdf_wagen": {
+            "title": "KdF-Wagen",
+            "description": "Fund the development of the people's car, boosting civilian industry and infrastructure.",
+            "time": 70,
+            "prerequisites": ["autarky"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 3,
+                "infrastructure": 1,
+                "stability": 5,
+            },
+            "position": [2, 4],
+        },
+        "air_innovation": {
+            "title": "Air Innovation",
+            "description": "Invest in developing advanced aircraft technologies.",
+            "time": 70,
+            "prerequisites": ["four_year_plan"],
+            "mutually_exclusive": [],
+            "effects": {
+                "research_bonus": {
+                    "air_doctrine": 10,
+                    "fighter": 10,
+                    "bomber": 10,
+                },
+                "air_experience": 25,
+            },
+            "position": [3, 2],
+        },
+        "panzer_divisions": {
+            "title": "Panzer Divisions",
+            "description": "Develop and expand our armored forces for modern mobile warfare.",
+            "time": 70,
+            "prerequisites": ["four_year_plan"],
+            "mutually_exclusive": [],
+            "effects": {
+                "army_experience": 25,
+                "research_bonus": {
+                    "armor": 15,
+                    "motorized_equipment": 10,
+                },
+            },
+            "position": [3, 3],
+        },
+        "u_boat_effort": {
+            "title": "U-Boat Effort",
+            "description": "Expand our submarine fleet to challenge British naval dominance.",
+            "time": 70,
+            "prerequisites": ["four_year_plan"],
+            "mutually_exclusive": [],
+            "effects": {
+                "dockyards": 3,
+                "research_bonus": {
+                    "submarine_tech": 15,
+                },
+                "navy_experience": 25,
+            },
+            "position": [3, 4],
+        },
+        "molotov_ribbentrop_pact": {
+            "title": "Molotov-Ribbentrop Pact",
+            "description": "Negotiate a non-aggression pact with the Soviet Union to secure our eastern border while we deal with the West.",
+            "time": 70,
+            "prerequisites": ["danzig_or_war"],
+            "mutually_exclusive": ["anti_comintern_pact"],
+            "effects": {
+                "non_aggression": "ussr",
+                "diplomacy": 100,
+                "world_tension": -10,
+            },
+            "position": [4, 5],
+        },
+        "anti_comintern_pact": {
+            "title": "Anti-Comintern Pact",
+            "description": "Form an alliance against the spread of communism, strengthening ties with other fascist nations.",
+            "time": 70,
+            "prerequisites": ["danzig_or_war"],
+            "mutually_exclusive": ["molotov_ribbentrop_pact"],
+            "effects": {
+                "diplomacy": {
+                    "italy": 50,
+                    "japan": 50,
+                },
+                "stability": 5,
+                "war_support": 5,
+            },
+            "position": [5, 5],
+        },
+    },
+    # Other focus trees would be defined similarly
+
+    "nationalist_china_focus_tree": {
+        "resist_japan": {
+            "title": "Resist Japanese Aggression",
+            "description": "We must organize our forces to resist the Japanese invasion and protect Chinese sovereignty.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 20,
+                "military_factories": 1,
+            },
+            "position": [1, 1],
+        },
+        "chinese_nationalism": {
+            "title": "Chinese Nationalism",
+            "description": "Foster a strong national identity based on Han Chinese traditions and rejection of foreign influences.",
+            "time": 70,
+            "prerequisites": ["resist_japan"],
+            "mutually_exclusive": ["democratic_path"],
+            "effects": {
+                "government": "Fascist",
+                "war_support": 15,
+                "stability": 10,
+            },
+            "position": [0, 2],
+        },
+        "democratic_path": {
+            "title": "Democratic Path",
+            "description": "Implement Sun Yat-sen's vision of a democratic China with constitutional government.",
+            "time": 70,
+            "prerequisites": ["resist_japan"],
+            "mutually_exclusive": ["chinese_nationalism"],
+            "effects": {
+                "government": "Democratic",
+                "stability": 15,
+                "political_power": 50,
+            },
+            "position": [2, 2],
+        },
+        "reclaim_lost_territories": {
+            "title": "Reclaim Lost Territories",
+            "description": "China must reclaim all territories historically part of the Chinese empire.",
+            "time": 70,
+            "prerequisites": ["chinese_nationalism"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 20,
+                "claims": ["tibet", "mongolia", "korea"],
+            },
+            "position": [0, 3],
+        },
+        "modernize_military": {
+            "title": "Military Modernization",
+            "description": "Our army needs modern equipment and training to effectively combat Japanese forces.",
+            "time": 70,
+            "prerequisites": ["resist_japan"],
+            "mutually_exclusive": [],
+            "effects": {
+                "army_experience": 50,
+                "infantry_equipment": 10000,
+                "artillery": 200,
+            },
+            "position": [1, 2],
+        },
+        "german_advisors": {
+            "title": "German Military Advisors",
+            "description": "German officers can provide valuable expertise to help modernize our forces.",
+            "time": 70,
+            "prerequisites": ["modernize_military"],
+            "mutually_exclusive": ["american_aid_program"],
+            "effects": {
+                "relation_bonus": {
+                    "germany": 30,
+                },
+                "tanks": 50,
+                "army_experience": 30,
+            },
+            "position": [0, 3],
+        },
+        "american_aid_program": {
+            "title": "American Aid Program",
+            "description": "Seek military and economic assistance from the United States.",
+            "time": 70,
+            "prerequisites": ["modernize_military"],
+            "mutually_exclusive": ["german_advisors"],
+            "effects": {
+                "relation_bonus": {
+                    "usa": 30,
+                },
+                "civilian_factories": 2,
+                "fighters": 30,
+            },
+            "position": [2, 3],
+        },
+        "industrial_relocation": {
+            "title": "Industrial Relocation",
+            "description": "Move our industries inland to protect them from Japanese bombing and invasion.",
+            "time": 70,
+            "prerequisites": ["resist_japan"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 1,
+                "military_factories": 1,
+                "infrastructure": -1,
+            },
+            "position": [1, 3],
+        },
+        "anti_communist_campaign": {
+            "title": "Anti-Communist Campaign",
+            "description": "Focus on eliminating the Communist threat to ensure national unity against Japan.",
+            "time": 70,
+            "prerequisites": ["modernize_military"],
+            "mutually_exclusive": ["united_front"],
+            "effects": {
+                "stability": -5,
+                "war_support": 10,
+                "war_with": ["communist_china"],
+            },
+            "position": [0, 4],
+        },
+        "united_front": {
+            "title": "Second United Front",
+            "description": "Form a temporary alliance with the Communists to focus on fighting Japan.",
+            "time": 70,
+            "prerequisites": ["modernize_military"],
+            "mutually_exclusive": ["anti_communist_campaign"],
+            "effects": {
+                "stability": 10,
+                "war_support": 15,
+                "alliance_with": ["communist_china"],
+            },
+            "position": [2, 4],
+        },
+        "constitutional_reforms": {
+            "title": "Constitutional Reforms",
+            "description": "Implement democratic reforms to gain greater support from Western powers.",
+            "time": 70,
+            "prerequisites": ["american_aid_program"],
+            "mutually_exclusive": [],
+            "effects": {
+                "government": "Democratic",
+                "stability": 15,
+                "relation_bonus": {
+                    "usa": 20,
+                    "uk": 20,
+                },
+            },
+            "position": [2, 5],
+        },
+        "sino_japanese_cooperation": {
+            "title": "Sino-Japanese Cooperation",
+            "description": "Negotiate with Japan to end the conflict and join the Greater East Asia Co-Prosperity Sphere.",
+            "time": 70,
+            "prerequisites": ["german_advisors"],
+            "mutually_exclusive": ["fight_to_the_end"],
+            "effects": {
+                "stability": 10,
+                "peace_with": ["japan"],
+                "alliance_with": ["japan"],
+                "relation_bonus": {
+                    "japan": 50,
+                },
+            },
+            "position": [0, 5],
+        },
+        "fight_to_the_end": {
+            "title": "Fight to the Last Man",
+            "description": "We will never surrender to Japanese aggression no matter the cost.",
+            "time": 70,
+            "prerequisites": ["industrial_relocation"],
+            "mutually_exclusive": ["sino_japanese_cooperation"],
+            "effects": {
+                "war_support": 25,
+                "stability": -5,
+                "resistance_strength": 20,
+            },
+            "position": [1, 5],
+        },
+        "asian_leadership": {
+            "title": "Chinese Leadership in Asia",
+            "description": "Position China as the natural leader of Asian peoples against Western imperialism.",
+            "time": 70,
+            "prerequisites": ["sino_japanese_cooperation"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 15,
+                "political_power": 100,
+                "relation_bonus": {
+                    "thailand": 30,
+                    "philippines": 30,
+                },
+            },
+            "position": [0, 6],
+        },
+    },
+
+    "communist_china_focus_tree": {
+        "guerrilla_warfare": {
+            "title": "Guerrilla Warfare Doctrine",
+            "description": "Develop our unique guerrilla warfare tactics to fight larger, better-equipped enemies.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "army_experience": 40,
+                "infantry_equipment": 5000,
+            },
+            "position": [1, 1],
+        },
+        "permanent_revolution": {
+            "title": "Permanent Revolution",
+            "description": "The revolution must not stop at China's borders but spread throughout Asia and beyond.",
+            "time": 70,
+            "prerequisites": ["peoples_war"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 15,
+                "stability": 5,
+                "political_power": 50,
+            },
+            "position": [0, 6],
+        },
+        "asian_communism": {
+            "title": "Asian Communist Federation",
+            "description": "Create a new communist alliance of Asian nations independent from Moscow's control.",
+            "time": 70,
+            "prerequisites": ["permanent_revolution"],
+            "mutually_exclusive": [],
+            "effects": {
+                "create_faction": "asian_communist_federation",
+                "claims": ["thailand", "malaya", "netherlands_east_indies"],
+            },
+            "position": [0, 7],
+        },
+        "mass_mobilization": {
+            "title": "Mass Mobilization",
+            "description": "Mobilize the peasants and workers for our revolutionary cause.",
+            "time": 70,
+            "prerequisites": ["guerrilla_warfare"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 10,
+                "war_support": 15,
+                "infantry_equipment": 5000,
+            },
+            "position": [1, 2],
+        },
+        "soviet_advisors": {
+            "title": "Soviet Advisors",
+            "description": "Request advisors and aid from the Soviet Union.",
+            "time": 70,
+            "prerequisites": ["mass_mobilization"],
+            "mutually_exclusive": ["self_reliance"],
+            "effects": {
+                "relation_bonus": {
+                    "ussr": 50,
+                },
+                "military_factories": 1,
+                "artillery": 100,
+            },
+            "position": [0, 3],
+        },
+        "self_reliance": {
+            "title": "Self-Reliance",
+            "description": "Develop our own path to revolution without depending on foreign support.",
+            "time": 70,
+            "prerequisites": ["mass_mobilization"],
+            "mutually_exclusive": ["soviet_advisors"],
+            "effects": {
+                "stability": 15,
+                "civilian_factories": 1,
+                "political_power": 100,
+            },
+            "position": [2, 3],
+        },
+        "peoples_war": {
+            "title": "People's War",
+            "description": "Our revolutionary war must be fought by and for the people, with politics commanding the gun.",
+            "time": 70,
+            "prerequisites": ["mass_mobilization"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 20,
+                "stability": 10,
+                "army_experience": 30,
+            },
+            "position": [1, 3],
+        },
+        "anti_japanese_resistance": {
+            "title": "Anti-Japanese Resistance",
+            "description": "Focus our efforts on fighting the Japanese invaders to gain popular support.",
+            "time": 70,
+            "prerequisites": ["peoples_war"],
+            "mutually_exclusive": ["defeat_nationalists"],
+            "effects": {
+                "war_support": 15,
+                "relation_bonus": {
+                    "nationalist_china": 20,
+                },
+                "alliance_with": ["nationalist_china"],
+            },
+            "position": [0, 4],
+        },
+        "defeat_nationalists": {
+            "title": "Defeat the Nationalists",
+            "description": "Our primary goal must be defeating Chiang Kai-shek and his reactionary forces.",
+            "time": 70,
+            "prerequisites": ["peoples_war"],
+            "mutually_exclusive": ["anti_japanese_resistance"],
+            "effects": {
+                "war_support": 10,
+                "army_experience": 20,
+                "war_with": ["nationalist_china"],
+            },
+            "position": [2, 4],
+        },
+        "land_reform": {
+            "title": "Land Reform",
+            "description": "Redistribute land from landlords to peasants to build support in rural areas.",
+            "time": 70,
+            "prerequisites": ["peoples_war"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 15,
+                "political_power": 50,
+                "infrastructure": 1,
+            },
+            "position": [1, 4],
+        },
+        "socialist_industrialization": {
+            "title": "Socialist Industrialization",
+            "description": "Begin building a modern industrial base with Soviet assistance.",
+            "time": 70,
+            "prerequisites": ["soviet_advisors"],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 2,
+                "military_factories": 1,
+                "relation_bonus": {
+                    "ussr": 20,
+                },
+            },
+            "position": [0, 5],
+        },
+        "chinese_characteristics": {
+            "title": "Socialism with Chinese Characteristics",
+            "description": "Adapt Marxist-Leninist principles to Chinese conditions and develop our own revolutionary theory.",
+            "time": 70,
+            "prerequisites": ["self_reliance"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 20,
+                "political_power": 100,
+                "relation_bonus": {
+                    "ussr": -10,
+                },
+            },
+            "position": [2, 5],
+        },
+        "liberated_areas": {
+            "title": "Expand Liberated Areas",
+            "description": "Establish revolutionary base areas to implement our policies and build popular support.",
+            "time": 70,
+            "prerequisites": ["land_reform"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 10,
+                "war_support": 10,
+                "infantry_equipment": 5000,
+            },
+            "position": [1, 5],
+        },
+    },
+
+    "thailand_focus_tree": {
+        "domestic_development": {
+            "title": "Domestic Development",
+            "description": "Invest in our infrastructure and industry to strengthen the economy.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "civilian_factories": 1,
+                "infrastructure": 1,
+            },
+            "position": [1, 1],
+        },
+        "military_government": {
+            "title": "Military Government",
+            "description": "Strengthen the role of the military in Thai politics and society.",
+            "time": 70,
+            "prerequisites": ["domestic_development"],
+            "mutually_exclusive": ["democratic_reforms"],
+            "effects": {
+                "government": "Military",
+                "stability": 5,
+                "war_support": 10,
+            },
+            "position": [0, 2],
+        },
+        "democratic_reforms": {
+            "title": "Democratic Reforms",
+            "description": "Implement political reforms to create a constitutional monarchy with democratic institutions.",
+            "time": 70,
+            "prerequisites": ["domestic_development"],
+            "mutually_exclusive": ["military_government"],
+            "effects": {
+                "government": "Democratic",
+                "stability": 10,
+                "political_power": 50,
+            },
+            "position": [2, 2],
+        },
+        "greater_thailand": {
+            "title": "Greater Thailand",
+            "description": "Reclaim territories that were historically part of the Thai kingdom but lost to colonial powers.",
+            "time": 70,
+            "prerequisites": ["military_government"],
+            "mutually_exclusive": [],
+            "effects": {
+                "war_support": 15,
+                "claims": ["french_indochina", "burma", "malaya"],
+            },
+            "position": [0, 3],
+        },
+        "military_supremacy": {
+            "title": "Military Supremacy",
+            "description": "Build the strongest military force in Southeast Asia to support our territorial ambitions.",
+            "time": 70,
+            "prerequisites": ["greater_thailand"],
+            "mutually_exclusive": [],
+            "effects": {
+                "military_factories": 2,
+                "army_experience": 30,
+                "infantry_equipment": 10000,
+            },
+            "position": [0, 4],
+        },
+    },
+
+    "philippines_focus_tree": {
+        "commonwealth_status": {
+            "title": "Commonwealth Status",
+            "description": "Work within the framework of the Philippine Commonwealth to prepare for independence.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 10,
+                "political_power": 50,
+            },
+            "position": [1, 1],
+        },
+        "us_military_assistance": {
+            "title": "US Military Assistance",
+            "description": "Request increased military aid from the United States to strengthen our defenses.",
+            "time": 70,
+            "prerequisites": ["commonwealth_status"],
+            "mutually_exclusive": ["independent_defense"],
+            "effects": {
+                "infantry_equipment": 5000,
+                "fighters": 20,
+                "relation_bonus": {
+                    "usa": 30,
+                },
+            },
+            "position": [0, 2],
+        },
+        "independent_defense": {
+            "title": "Independent Defense",
+            "description": "Develop our own military capabilities without relying on foreign assistance.",
+            "time": 70,
+            "prerequisites": ["commonwealth_status"],
+            "mutually_exclusive": ["us_military_assistance"],
+            "effects": {
+                "military_factories": 1,
+                "dockyards": 1,
+                "war_support": 10,
+            },
+            "position": [2, 2],
+        },
+        "philippine_nationalism": {
+            "title": "Philippine Nationalism",
+            "description": "Foster a strong national identity and aim for a leading role in Southeast Asia.",
+            "time": 70,
+            "prerequisites": ["independent_defense"],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 10,
+                "war_support": 15,
+                "government": "Military",
+            },
+            "position": [2, 3],
+        },
+        "pacific_security": {
+            "title": "Pacific Security Zone",
+            "description": "Establish Philippines as a regional security power in the western Pacific.",
+            "time": 70,
+            "prerequisites": ["philippine_nationalism"],
+            "mutually_exclusive": [],
+            "effects": {
+                "dockyards": 1,
+                "ships": {
+                    "destroyers": 3,
+                    "cruisers": 1,
+                },
+                "claims": ["malaya", "netherlands_east_indies"],
+            },
+            "position": [2, 4],
+        },
+    },
+
+    "east_indies_focus_tree": {
+        "colonial_administration": {
+            "title": "Colonial Administration",
+            "description": "Improve the efficiency of the colonial administration to better exploit resources.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 5,
+                "political_power": 30,
+            },
+            "position": [1, 1],
+        },
+        "dutch_loyalism": {
+            "title": "Dutch Loyalism",
+            "description": "Strengthen ties with the Netherlands and remain a loyal colony.",
+            "time": 70,
+            "prerequisites": ["colonial_administration"],
+            "mutually_exclusive": ["independence_movement"],
+            "effects": {
+                "stability": 10,
+                "relation_bonus": {
+                    "netherlands": 50,
+                },
+                "alliance_with": ["netherlands"],
+            },
+            "position": [0, 2],
+        },
+        "independence_movement": {
+            "title": "Independence Movement",
+            "description": "Support growing nationalist movements seeking independence from Dutch rule.",
+            "time": 70,
+            "prerequisites": ["colonial_administration"],
+            "mutually_exclusive": ["dutch_loyalism"],
+            "effects": {
+                "stability": -5,
+                "war_support": 15,
+                "political_power": 50,
+            },
+            "position": [2, 2],
+        },
+        "resource_dominance": {
+            "title": "Resource Dominance",
+            "description": "Exploit our vast natural resources to build economic and political power.",
+            "time": 70,
+            "prerequisites": ["independence_movement"],
+            "mutually_exclusive": [],
+            "effects": {
+                "resources": {
+                    "oil": 15,
+                    "rubber": 20,
+                },
+                "civilian_factories": 2,
+            },
+            "position": [2, 3],
+        },
+        "naval_supremacy": {
+            "title": "Naval Supremacy",
+            "description": "Build a powerful navy to control the waters of the Indonesian archipelago.",
+            "time": 70,
+            "prerequisites": ["resource_dominance"],
+            "mutually_exclusive": [],
+            "effects": {
+                "dockyards": 2,
+                "ships": {
+                    "destroyers": 5,
+                    "cruisers": 2,
+                    "submarines": 5,
+                },
+                "claims": ["malaya", "philippines"],
+            },
+            "position": [2, 4],
+        },
+    },
+
+    "australia_focus_tree": {
+        "imperial_ties": {
+            "title": "Imperial Ties",
+            "description": "Strengthen our relationship with the British Empire and contribute to the war effort.",
+            "time": 70,
+            "prerequisites": [],
+            "mutually_exclusive": [],
+            "effects": {
+                "stability": 10,
+                "war_support": 10,
+                "relation_bonus": {
+                    "uk": 30,
+                },
+            },
+            "position": [1, 1],
+        },
+        "expeditionary_forces": {
+            "title": "Expeditionary Forces",
+            "description": "Send Australian troops to fight alongside British forces in Europe and North Africa.",
+            "time": 70,
+            "prerequisites": ["imperial_ties"],
+            "mutually_exclusive": ["home_defense"],
+            "effects": {
+                "war_support": 15,
+                "relation_bonus": {
+                    "uk": 20,
+                },
+                "infantry_equipment": 5000,
+            },
+            "position": [0, 2],
+        },
+        "home_defense": {
+            "title": "Home Defense",
+            "description": "Focus on defending Australia against potential Japanese aggression in the Pacific.",
+            "time": 70,
+            "prerequisites": ["imperial_ties"],
+            "mutually_exclusive": ["expeditionary_forces"],
+            "effects": {
+                "military_factories": 1,
+                "infantry_equipment": 10000,
+                "fighters": 30,
+            },
+            "position": [2, 2],
+        },
+        "australian_imperialism": {
+            "title": "Australian Imperialism",
+            "description": "Establish Australia as an independent power with its own sphere of influence in the Pacific.",
+            "time": 70,
+            "prerequisites": ["home_defense"],
+            "mutually_exclusive": [],
+            "effects": {
+                "government": "Military",
+                "war_support": 15,
+                "stability": 5,
+            },
+            "position": [2, 3],
+        },
+        "pacific_strategy": {
+            "title": "Pacific Strategy",
+            "description": "Develop a comprehensive strategy to control key territories in the South Pacific.",
+            "time": 70,
+            "prerequisites": ["australian_imperialism"],
+            "mutually_exclusive": [],
+            "effects": {
+                "dockyards": 2,
+                "ships": {
+                    "cruisers": 2,
+                    "destroyers": 4,
+                },
+                "claims": ["netherlands_east_indies", "new_guinea"],
+            },
+            "position": [2, 4],
+        },
+    },
+}
+
+# Building types for construction
+BUILDINGS = {
+    "civilian_factory": {
+        "name": "Civilian Factory",
+        "description": "Produces consumer goods and contributes to construction efforts",
+        "cost": 3600,  # Construction time in "days"
+        "resource_cost": {
+            "steel": 100,
+        },
+        "tech_requirement": None,
+        "effects": {
+            "consumer_goods": 2,
+            "construction_speed": 0.2,
+        }
+    },
+    "military_factory": {
+        "name": "Military Factory",
+        "description": "Produces military equipment including tanks, artillery, and infantry equipment",
+        "cost": 3600,
+        "resource_cost": {
+            "steel": 120,
+        },
+        "tech_requirement": None,
+        "effects": {
+            "production_capacity": 2,
+        }
+    },
+    "dockyard": {
+        "name": "Naval Dockyard",
+        "description": "Constructs and repairs naval vessels",
+        "cost": 4200,
+        "resource_cost": {
+            "steel": 150,
+        },
+        "tech_requirement": None,
+        "effects": {
+            "naval_production": 1,
+        }
+    },
+    "infrastructure": {
+        "name": "Infrastructure",
+        "description": "Improves resource extraction and construction speed",
+        "cost": 2400,
+        "resource_cost": {
+            "steel": 50,
+        },
+        "tech_requirement": None,
+        "effects": {
+            "resource_extraction": 0.1,
+            "supply_capacity": 1,
+            "construction_speed": 0.05,
+        }
+    },
+    "air_base": {
+        "name": "Air Base",
+        "description": "Allows deployment and operation of aircraft",
+        "cost": 3000,
+        "resource_cost": {
+            "steel": 100,
+            "oil": 50,
+        },
+        "tech_requirement": None,
+        "effects": {
+            "air_capacity": 50,
+        }
+    },
+    "radar_station": {
+        "name": "Radar Station",
+        "description": "Provides intelligence and early warning of enemy aircraft",
+        "cost": 2100,
+        "resource_cost": {
+            "steel": 40,
+            "aluminum": 20,
+        },
+        "tech_requirement": "basic_electronics",
+        "effects": {
+            "detection_range": 3,
+            "intel_gathering": 0.1,
+        }
+    },
+    "anti_air": {
+        "name": "Anti-Air Defense",
+        "description": "Provides protection against enemy air attacks",
+        "cost": 1800,
+        "resource_cost": {
+            "steel": 60,
+        },
+        "tech_requirement": None,
+        "effects": {
+            "air_defense": 1,
+        }
+    },
+    "coastal_bunker": {
+        "name": "Coastal Bunker",
+        "description": "Provides defense against naval invasions",
+        "cost": 2400,
+        "resource_cost": {
+            "steel": 80,
+        },
+        "tech_requirement": None,
+        "effects": {
+            "naval_defense": 1.5,
+        }
+    },
+    "nuclear_reactor": {
+        "name": "Nuclear Reactor",
+        "description": "Required for nuclear weapons research and production",
+        "cost": 7200,
+        "resource_cost": {
+            "steel": 200,
+            "aluminum": 100,
+            "oil": 100,
+        },
+        "tech_requirement": "nuclear_reactor",
+        "effects": {
+            "nuclear_production": 1,
+        }
+    },
+    "synthetic_refinery": {
+        "name": "Synthetic Refinery",
+        "description": "Converts coal into oil through synthetic production",
+        "cost": 5400,
+        "resource_cost": {
+            "steel": 150,
+        },
+        "tech_requirement": "synthetic_oil",
+        "effects": {
+            "oil_production": 3,
+        }
+    },
+}
+
+# Research technologies
+TECHNOLOGIES = {
+    # Nuclear technologies
+    "nuclear_physics": {
+        "name": "Nuclear Physics",
+        "category": "nuclear",
+        "cost": 300,
+        "year": 1940,
+        "effects": {
+            "enables": ["nuclear_research"],
+        },
+        "prerequisites": ["advanced_electronics"],
+    },
+    "nuclear_research": {
+        "name": "Nuclear Research",
+        "category": "nuclear",
+        "cost": 350,
+        "year": 1942,
+        "effects": {
+            "enables": ["atomic_bomb"],
+            "construction_speed": {
+                "nuclear_reactor": 0.15,
+            },
+        },
+        "prerequisites": ["nuclear_physics"],
+    },
+    "atomic_bomb": {
+        "name": "Atomic Bomb",
+        "category": "nuclear",
+        "cost": 500,
+        "year": 1945,
+        "effects": {
+            "enables_weapon": "nuclear_weapon",
+        },
+        "prerequisites": ["nuclear_research"],
+    },
+    "nuclear_reactor": {
+        "name": "Nuclear Reactor",
+        "category": "nuclear",
+        "cost": 400,
+        "year": 1944,
+        "effects": {
+            "energy_output": 20,
+            "enables_building": "nuclear_reactor",
+        },
+        "prerequisites": ["nuclear_research"],
+    },
+
+    # Advanced electronics (prerequisite for nuclear research)
+    "advanced_electronics": {
+        "name": "Advanced Electronics",
+        "category": "electronics",
+        "cost": 200,
+        "year": 1939,
+        "effects": {
+            "research_speed": 0.05,
+            "radar_efficiency": 0.1,
+        },
+        "prerequisites": ["basic_electronics"],
+    },
+    "basic_electronics": {
+        "name": "Basic Electronics",
+        "category": "electronics",
+        "cost": 150,
+        "year": 1936,
+        "effects": {
+            "research_speed": 0.03,
+            "radar_range": 1,
+        },
+        "prerequisites": [],
+    },
+
+    # Construction technologies
+    "construction_tech_1": {
+        "name": "Basic Construction Engineering",
+        "category": "industry",
+        "cost": 100,
+        "year": 1936,
+        "effects": {
+            "construction_speed": 0.1,
+            "repair_speed": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "construction_tech_2": {
+        "name": "Improved Construction Engineering",
+        "category": "industry",
+        "cost": 150,
+        "year": 1938,
+        "effects": {
+            "construction_speed": 0.15,
+            "repair_speed": 0.15,
+        },
+        "prerequisites": ["construction_tech_1"],
+    },
+    "construction_tech_3": {
+        "name": "Advanced Construction Engineering",
+        "category": "industry",
+        "cost": 200,
+        "year": 1940,
+        "effects": {
+            "construction_speed": 0.2,
+            "repair_speed": 0.2,
+        },
+        "prerequisites": ["construction_tech_2"],
+    },
+    "construction_tech_4": {
+        "name": "Modern Construction Engineering",
+        "category": "industry",
+        "cost": 250,
+        "year": 1942,
+        "effects": {
+            "construction_speed": 0.25,
+            "repair_speed": 0.25,
+        },
+        "prerequisites": ["construction_tech_3"],
+    },
+
+    # Industrial technologies
+    "industrial_efficiency_1": {
+        "name": "Industrial Efficiency I",
+        "category": "industry",
+        "cost": 120,
+        "year": 1936,
+        "effects": {
+            "factory_output": 0.1,
+            "resources_extraction": 0.05,
+        },
+        "prerequisites": [],
+    },
+    "industrial_efficiency_2": {
+        "name": "Industrial Efficiency II",
+        "category": "industry",
+        "cost": 180,
+        "year": 1938,
+        "effects": {
+            "factory_output": 0.15,
+            "resources_extraction": 0.1,
+        },
+        "prerequisites": ["industrial_efficiency_1"],
+    },
+    "industrial_efficiency_3": {
+        "name": "Industrial Efficiency III",
+        "category": "industry",
+        "cost": 240,
+        "year": 1940,
+        "effects": {
+            "factory_output": 0.2,
+            "resources_extraction": 0.15,
+        },
+        "prerequisites": ["industrial_efficiency_2"],
+    },
+    "industrial_efficiency_4": {
+        "name": "Industrial Efficiency IV",
+        "category": "industry",
+        "cost": 300,
+        "year": 1942,
+        "effects": {
+            "factory_output": 0.25,
+            "resources_extraction": 0.2,
+        },
+        "prerequisites": ["industrial_efficiency_3"],
+    },
+
+    # Original infantry techs
+    "infantry_equipment_1": {
+        "name": "Improved Infantry Equipment",
+        "category": "infantry",
+        "cost": 100,
+        "year": 1936,
+        "effects": {
+            "infantry_attack": 0.1,
+            "infantry_defense": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "infantry_equipment_2": {
+        "name": "Advanced Infantry Equipment",
+        "category": "infantry",
+        "cost": 180,
+        "year": 1939,
+        "effects": {
+            "infantry_attack": 0.15,
+            "infantry_defense": 0.15,
+        },
+        "prerequisites": ["infantry_equipment_1"],
+    },
+    "artillery_1": {
+        "name": "Improved Artillery",
+        "category": "artillery",
+        "cost": 120,
+        "year": 1936,
+        "effects": {
+            "artillery_attack": 0.15,
+            "artillery_defense": 0.05,
+        },
+        "prerequisites": [],
+    },
+    "support_equipment_1": {
+        "name": "Support Equipment",
+        "category": "support",
+        "cost": 80,
+        "year": 1936,
+        "effects": {
+            "support_equipment_efficiency": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "mechanical_computing": {
+        "name": "Mechanical Computing",
+        "category": "electronics",
+        "cost": 100,
+        "year": 1936,
+        "effects": {
+            "research_speed": 0.05,
+            "encryption": 1,
+            "decryption": 1,
+        },
+        "prerequisites": [],
+    },
+    "radio": {
+        "name": "Radio",
+        "category": "electronics",
+        "cost": 120,
+        "year": 1936,
+        "effects": {
+            "initiative": 0.1,
+            "communication": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "basic_tank": {
+        "name": "Basic Light Tank",
+        "category": "armor",
+        "cost": 150,
+        "year": 1936,
+        "effects": {
+            "tank_attack": 0.1,
+            "tank_defense": 0.1,
+            "tank_speed": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "improved_light_tank": {
+        "name": "Improved Light Tank",
+        "category": "armor",
+        "cost": 180,
+        "year": 1937,
+        "effects": {
+            "tank_attack": 0.15,
+            "tank_defense": 0.15,
+            "tank_speed": 0.15,
+        },
+        "prerequisites": ["basic_tank"],
+    },
+    "basic_medium_tank": {
+        "name": "Basic Medium Tank",
+        "category": "armor",
+        "cost": 200,
+        "year": 1939,
+        "effects": {
+            "tank_attack": 0.25,
+            "tank_defense": 0.25,
+            "tank_speed": -0.05,
+        },
+        "prerequisites": ["improved_light_tank"],
+    },
+    "fighter1": {
+        "name": "Early Fighter",
+        "category": "air",
+        "cost": 150,
+        "year": 1936,
+        "effects": {
+            "fighter_attack": 0.1,
+            "fighter_defense": 0.1,
+            "fighter_agility": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "fighter2": {
+        "name": "Improved Fighter",
+        "category": "air",
+        "cost": 180,
+        "year": 1939,
+        "effects": {
+            "fighter_attack": 0.15,
+            "fighter_defense": 0.15,
+            "fighter_agility": 0.15,
+        },
+        "prerequisites": ["fighter1"],
+    },
+    "cas1": {
+        "name": "Close Air Support Aircraft",
+        "category": "air",
+        "cost": 150,
+        "year": 1936,
+        "effects": {
+            "cas_ground_attack": 0.2,
+        },
+        "prerequisites": [],
+    },
+    "naval_bomber1": {
+        "name": "Naval Bomber",
+        "category": "air",
+        "cost": 150,
+        "year": 1936,
+        "effects": {
+            "naval_strike": 0.2,
+        },
+        "prerequisites": [],
+    },
+    "destroyer1": {
+        "name": "Early Destroyer",
+        "category": "naval",
+        "cost": 140,
+        "year": 1936,
+        "effects": {
+            "destroyer_attack": 0.1,
+            "destroyer_defense": 0.1,
+            "destroyer_anti_sub": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "submarine1": {
+        "name": "Early Submarine",
+        "category": "naval",
+        "cost": 140,
+        "year": 1936,
+        "effects": {
+            "submarine_attack": 0.1,
+            "submarine_defense": 0.1,
+            "submarine_stealth": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "cruiser1": {
+        "name": "Early Cruiser",
+        "category": "naval",
+        "cost": 180,
+        "year": 1936,
+        "effects": {
+            "cruiser_attack": 0.1,
+            "cruiser_defense": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "battleship1": {
+        "name": "Early Battleship",
+        "category": "naval",
+        "cost": 200,
+        "year": 1936,
+        "effects": {
+            "battleship_attack": 0.1,
+            "battleship_defense": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "construction1": {
+        "name": "Construction I",
+        "category": "industry",
+        "cost": 120,
+        "year": 1936,
+        "effects": {
+            "production_speed_buildings_factor": 0.1,
+            "production_speed_bunker_factor": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "construction2": {
+        "name": "Construction II",
+        "category": "industry",
+        "cost": 180,
+        "year": 1937,
+        "effects": {
+            "production_speed_buildings_factor": 0.1,
+            "production_speed_bunker_factor": 0.1,
+        },
+        "prerequisites": ["construction1"],
+    },
+    "excavation1": {
+        "name": "Excavation I",
+        "category": "industry",
+        "cost": 120,
+        "year": 1936,
+        "effects": {
+            "local_resources_factor": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "steel_production1": {
+        "name": "Steel Production I",
+        "category": "industry",
+        "cost": 140,
+        "year": 1936,
+        "effects": {
+            "steel_production": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "oil_production1": {
+        "name": "Oil Production I",
+        "category": "industry",
+        "cost": 140,
+        "year": 1936,
+        "effects": {
+            "oil_production": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "synthetic_rubber": {
+        "name": "Synthetic Rubber",
+        "category": "industry",
+        "cost": 200,
+        "year": 1937,
+        "effects": {
+            "rubber_production": 0.2,
+        },
+        "prerequisites": [],
+    },
+    "synthetic_oil": {
+        "name": "Synthetic Oil",
+        "category": "industry",
+        "cost": 200,
+        "year": 1937,
+        "effects": {
+            "oil_production": 0.2,
+        },
+        "prerequisites": [],
+    },
+    "motorised_infantry": {
+        "name": "Motorized Infantry",
+        "category": "infantry",
+        "cost": 160,
+        "year": 1936,
+        "effects": {
+            "motorized_attack": 0.1,
+            "motorized_defense": 0.1,
+            "motorized_speed": 0.1,
+        },
+        "prerequisites": [],
+    },
+    "mechanised_infantry": {
+        "name": "Mechanized Infantry",
+        "category": "infantry",
+        "cost": 200,
+        "year": 1940,
+        "effects": {
+            "mechanized_attack": 0.15,
+            "mechanized_defense": 0.2,
+            "mechanized_speed": 0.05,
+        },
+        "prerequisites": ["motorised_infantry"],
+    },
+}
+
+# Events
+EVENTS = {
+    "spanish_civil_war": {
+        "title": "Spanish Civil War",
+        "description": "Civil war has broken out in Spain between the Republican government and Nationalist rebels led by Francisco Franco.",
+        "trigger": {
+            "year": 1936,
+            "month": 7,
+        },
+        "options": {
+            "send_volunteers_nationalists": {
+                "text": "Send volunteers to the Nationalists",
+                "effects": {
+                    "war_support": 5,
+                    "army_experience": 20,
+                    "world_tension": 5,
+                    "relations": {
+                        "italy": 10,
+                        "france": -10,
+                        "uk": -10,
+                    },
+                },
+            },
+            "send_volunteers_republicans": {
+                "text": "Send volunteers to the Republicans",
+                "effects": {
+                    "war_support": 5,
+                    "army_experience": 20,
+                    "world_tension": 5,
+                    "relations": {
+                        "ussr": 10,
+                        "france": 5,
+                        "italy": -10,
+                    },
+                },
+                "requires_government": "Communist",
+            },
+            "non_intervention": {
+                "text": "Maintain a policy of non-intervention",
+                "effects": {
+                    "stability": 5,
+                    "world_tension": -2,
+                },
+            },
+        },
+    },
+    "marco_polo_bridge": {
+        "title": "Marco Polo Bridge Incident",
+        "description": "Japanese and Chinese forces have clashed at the Marco Polo Bridge near Beijing, potentially sparking a wider conflict in Asia.",
+        "trigger": {
+            "year": 1937,
+            "month": 7,
+        },
+        "options": {
+            "support_japan": {
+                "text": "Express support for Japan",
+                "effects": {
+                    "relations": {
+                        "japan": 10,
+                        "china": -10,
+                        "usa": -5,
+                    },
+                },
+            },
+            "support_china": {
+                "text": "Express support for China",
+                "effects": {
+                    "relations": {
+                        "china": 10,
+                        "japan": -10,
+                        "usa": 5,
+                    },
+                },
+                "requires_government": "Democratic",
+            },
+            "stay_neutral": {
+                "text": "Maintain neutrality in Asian affairs",
+                "effects": {
+                    "stability": 2,
+                },
+            },
+        },
+    },
+    "anschluss_event": {
+        "title": "Anschluss of Austria",
+        "description": "Germany has annexed Austria into the Reich, uniting the German peoples.",
+        "trigger": {
+            "focus_completed": "anschluss",
+        },
+        "options": {
+            "celebrate": {
+                "text": "A great day for the German people!",
+                "effects": {
+                    "stability": 5,
+                    "war_support": 5,
+                },
+            },
+        },
+    },
+    "munich_agreement": {
+        "title": "Munich Agreement",
+        "description": "The leaders of Germany, France, Britain, and Italy have agreed to the German annexation of the Sudetenland from Czechoslovakia in the name of peace.",
+        "trigger": {
+            "focus_completed": "sudetenland",
+        },
+        "options": {
+            "celebrate": {
+                "text": "Peace in our time... for now.",
+                "effects": {
+                    "stability": 5,
+                    "war_support": 5,
+                    "world_tension": -5,
+                },
+            },
+        },
+    },
+    "czechoslovakia_occupation": {
+        "title": "Occupation of Czechoslovakia",
+        "description": "German forces have occupied the remainder of Czechoslovakia, breaking the Munich Agreement.",
+        "trigger": {
+            "focus_completed": "fate_czechoslovakia",
+        },
+        "options": {
+            "address_nation": {
+                "text": "Address the nation about our security needs",
+                "effects": {
+                    "stability": -5,
+                    "war_support": 10,
+                    "world_tension": 20,
+                },
+            },
+        },
+    },
+    "polish_ultimatum": {
+        "title": "Ultimatum to Poland",
+        "description": "We have delivered an ultimatum to Poland demanding the return of Danzig to the Reich.",
+        "trigger": {
+            "focus_completed": "danzig_or_war",
+        },
+        "options": {
+            "prepare_for_war": {
+                "text": "Prepare for possible war",
+                "effects": {
+                    "war_support": 15,
+                    "world_tension": 15,
+                },
+            },
+        },
+    },
+    "molotov_ribbentrop_signed": {
+        "title": "Molotov-Ribbentrop Pact Signed",
+        "description": "Germany and the Soviet Union have signed a non-aggression pact, including secret protocols dividing Eastern Europe into spheres of influence.",
+        "trigger": {
+            "focus_completed": "molotov_ribbentrop_pact",
+        },
+        "options": {
+            "secure_eastern_front": {
+                "text": "Our eastern frontier is now secure",
+                "effects": {
+                    "stability": 10,
+                    "war_support": 10,
+                    "world_tension": -5,
+                },
+            },
+        },
+    },
+    "communist_uprising": {
+        "title": "Communist Uprising",
+        "description": "Communist revolutionaries have taken to the streets across Germany, demanding the overthrow of the current regime and the establishment of a workers' state.",
+        "trigger": {
+            "focus_completed": "communist_revolution",
+        },
+        "options": {
+            "support_revolution": {
+                "text": "Support the revolution and address the people",
+                "effects": {
+                    "stability": -10,
+                    "war_support": 15,
+                    "internal_conflicts": 2,
+                },
+            },
+        },
+    },
+    "thälmann_speech": {
+        "title": "Thälmann's Address to the Nation",
+        "description": "Ernst Thälmann, the new leader of Communist Germany, has given a rousing speech promising a better future for the working class and condemning the fascist threat.",
+        "trigger": {
+            "focus_completed": "workers_paradise",
+        },
+        "options": {
+            "embrace_future": {
+                "text": "A new era for the German working class!",
+                "effects": {
+                    "stability": 15,
+                    "war_support": 10,
+                },
+            },
+        },
+    },
+    "kaiser_restoration": {
+        "title": "Restoration of the Monarchy",
+        "description": "In a grand ceremony at the Berlin City Palace, Wilhelm III has been crowned as the new Kaiser of a restored German Empire. The Hohenzollern dynasty once again rules Germany.",
+        "trigger": {
+            "focus_completed": "restore_kaiser",
+        },
+        "options": {
+            "long_live_kaiser": {
+                "text": "Long live the Kaiser!",
+                "effects": {
+                    "stability": 20,
+                    "war_support": 5,
+                    "world_tension": -5,
+                },
+            },
+        },
+    },
+    "democratic_elections": {
+        "title": "Democratic Elections in Germany",
+        "description": "For the first time since the rise of the Nazi Party, Germany has held free and fair democratic elections. Konrad Adenauer has been elected as the new Chancellor.",
+        "trigger": {
+            "focus_completed": "democratic_reforms",
+        },
+        "options": {
+            "celebrate_democracy": {
+                "text": "Democracy has returned to Germany!",
+                "effects": {
+                    "stability": 15,
+                    "war_support": -10,
+                },
+            },
+        },
+    },
+    "european_community": {
+        "title": "Formation of the European Economic Community",
+        "description": "Germany, France, Belgium, the Netherlands, and Luxembourg have agreed to form a new economic community to promote trade and cooperation in Europe.",
+        "trigger": {
+            "focus_completed": "invite_europe",
+        },
+        "options": {
+            "new_era": {
+                "text": "A new era of European cooperation begins!",
+                "effects": {
+                    "stability": 10,
+                    "civilian_factories": 2,
+                    "world_tension": -10,
+                },
+            },
+        },
+    },
+    "great_purge_aftermath": {
+        "title": "Aftermath of the Great Purge",
+        "description": "The purge of counter-revolutionary elements has been completed, but at great cost. Many officers and officials were executed, some innocent. Military readiness has been affected.",
+        "trigger": {
+            "focus_completed": "great_purge",
+        },
+        "options": {
+            "necessary_evil": {
+                "text": "It was a necessary evil for the security of the revolution",
+                "effects": {
+                    "stability": -5,
+                    "war_support": -5,
+                    "army": {
+                        "divisions": -2,
+                    },
+                    "internal_conflicts": 1,
+                },
+            },
+        },
+    },
+    "wehrmacht_conspiracy": {
+        "title": "Wehrmacht Conspiracy Uncovered",
+        "description": "A group of high-ranking Wehrmacht officers has been discovered plotting against the government. Their motivations vary from disgust with Nazi policy to fears about the direction of the war.",
+        "trigger": {
+            "year": 1938,
+            "month": 9,
+            "government": "Fascist",
+        },
+        "options": {
+            "execute_plotters": {
+                "text": "Execute the plotters and purge the officer corps",
+                "effects": {
+                    "stability": -10,
+                    "war_support": -5,
+                    "army": {
+                        "divisions": -1,
+                    },
+                    "internal_conflicts": 1,
+                },
+            },
+            "show_mercy": {
+                "text": "Show mercy to demonstrate strength",
+                "effects": {
+                    "stability": 5,
+                    "political_power": -50,
+                },
+            },
+        },
+    },
+    "naval_rearmament": {
+        "title": "Naval Rearmament Program",
+        "description": "The expansion of the Kriegsmarine has begun in earnest, with new shipyards breaking ground and existing ones expanding production capacity.",
+        "trigger": {
+            "focus_completed": "naval_tradition",
+        },
+        "options": {
+            "rule_waves": {
+                "text": "Germany will rule the waves once more!",
+                "effects": {
+                    "dockyards": 2,
+                    "stability": 5,
+                    "world_tension": 5,
+                },
+            },
+        },
+    },
+    "economic_crisis": {
+        "title": "Economic Crisis",
+        "description": "Despite our best efforts, the German economy has entered a severe downturn. Unemployment is rising, and factories are closing.",
+        "trigger": {
+            "year": 1938,
+            "month": 3,
+            "stability": 30,
+            "random": 25,  # 25% chance of triggering if other conditions met
+        },
+        "options": {
+            "austerity": {
+                "text": "Implement austerity measures",
+                "effects": {
+                    "stability": -15,
+                    "civilian_factories": -2,
+                    "military_factories": -1,
+                },
+            },
+            "stimulus": {
+                "text": "Launch an economic stimulus program",
+                "effects": {
+                    "stability": 10,
+                    "civilian_factories": 1,
+                    "political_power": -100,
+                },
+            },
+        },
+    },
+    "generals_revolt": {
+        "title": "Generals' Revolt",
+        "description": "A group of generals, alarmed by the direction of the country, have staged an armed revolt against the government!",
+        "trigger": {
+            "stability": 25,
+            "war_support": 60,
+            "random": 20,  # 20% chance of triggering if other conditions met
+        },
+        "options": {
+            "crush_revolt": {
+                "text": "Crush the revolt with all available forces",
+                "effects": {
+                    "stability": -10,
+                    "war_support": -15,
+                    "army": {
+                        "divisions": -3,
+                    },
+                    "internal_conflicts": 2,
+                },
+            },
+            "negotiate": {
+                "text": "Attempt to negotiate with the rebels",
+                "effects": {
+                    "stability": -5,
+                    "political_power": -150,
+                    "internal_conflicts": 1,
+                },
+            },
+        },
+    },
+    "nuclear_breakthrough": {
+        "title": "Nuclear Research Breakthrough",
+        "description": "Our scientists have made a significant breakthrough in nuclear research, bringing us closer to harnessing the power of the atom for military purposes.",
+        "trigger": {
+            "focus_completed": "nuclear_program",
+            "year": 1943,
+        },
+        "options": {
+            "accelerate_research": {
+                "text": "Accelerate the program at all costs",
+                "effects": {
+                    "civilian_factories": -2,
+                    "military_factories": -1,
+                    "research_bonus": {
+                        "nuclear_tech": 25,
+                    },
+                },
+            },
+            "steady_approach": {
+                "text": "Maintain a steady, methodical approach",
+                "effects": {
+                    "research_bonus": {
+                        "nuclear_tech": 10,
+                    },
+                },
+            },
+        },
+    },
+    "stalingrad": {
+        "title": "Battle of Stalingrad",
+        "description": "Our forces are engaged in a brutal battle for control of Stalingrad. The fighting is house-to-house, and casualties are mounting.",
+        "trigger": {
+            "year": 1942,
+            "month": 9,
+            "at_war_with": ["ussr"],
+        },
+        "options": {
+            "commit_reserves": {
+                "text": "Commit all available reserves to the battle",
+                "effects": {
+                    "war_support": -10,
+                    "stability": -5,
+                    "army": {
+                        "manpower": -100000,
+                    },
+                },
+            },
+            "strategic_withdrawal": {
+                "text": "Order a strategic withdrawal from the city",
+                "effects": {
+                    "war_support": -15,
+                    "stability": -10,
+                    "world_tension": 5,
+                },
+            },
+        },
+    },
+}
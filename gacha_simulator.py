@@ -0,0 +1,154 @@
+"""
+ChronoTale Gacha Simulator
+==========================
+Estimates how many wishes it takes to get the featured character of the
+Legacies limited banner, by simulating many players wishing from fresh pity
+counters with the game's own pull rules (5★ pity at 90, 4★ pity at 10, the
+50/50 and the guarantee after losing it).
+
+Players are split into chunks that run in separate worker processes, each
+with its own seed derived from --seed, so a run is reproducible for a given
+seed and player count whatever the number of workers.
+
+Usage:
+    python gacha_simulator.py [--game Legacies.py] [--players 1000000]
+                              [--workers 4] [--seed 1] [--character-share 0.15]
+                              [--report gacha_report.json]
+"""
+
+import argparse
+import importlib.util
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+DEFAULT_PLAYERS = 100000
+CHUNK_PLAYERS = 20000
+HISTOGRAM_ROWS = 20
+
+GAME_MODULE: Any = None
+
+
+def load_game(game_file: str) -> Any:
+    """Import a game file as a module without starting the game"""
+    global GAME_MODULE
+    if GAME_MODULE is None:
+        os.environ["LAUNCHED_FROM_LAUNCHER"] = "1"
+        original_stdout = sys.stdout
+        spec = importlib.util.spec_from_file_location("legacies_simulated", game_file)
+        module = importlib.util.module_from_spec(spec)
+        try:
+            spec.loader.exec_module(module)
+        finally:
+            # The game replaces stdout with its frame writer on import
+            sys.stdout = original_stdout
+        GAME_MODULE = module
+    return GAME_MODULE
+
+
+def run_chunk(job: Tuple[str, int, int, float]) -> Dict[int, int]:
+    """Simulate one chunk of players in a worker process"""
+    game_file, players, seed, character_share = job
+    return load_game(game_file).simulate_featured_pulls(players, seed, character_share)
+
+
+def percentile(histogram: Dict[int, int], fraction: float) -> int:
+    """Nearest-rank percentile of a histogram of wish counts"""
+    total = sum(histogram.values())
+    rank = max(1, math.ceil(fraction * total))
+    seen = 0
+    for wishes in sorted(histogram):
+        seen += histogram[wishes]
+        if seen >= rank:
+            return wishes
+    return 0
+
+
+def summarize(histogram: Dict[int, int]) -> Dict[str, Any]:
+    """Mean, percentiles and bucketed distribution of wishes needed"""
+    total = sum(histogram.values())
+    width = max(1, math.ceil(max(histogram, default=0) / HISTOGRAM_ROWS / 10) * 10)
+    buckets: Dict[int, int] = {}
+    for wishes, players in histogram.items():
+        start = (wishes - 1) // width * width + 1
+        buckets[start] = buckets.get(start, 0) + players
+    return {
+        "players": total,
+        "mean": sum(wishes * players for wishes, players in histogram.items()) / total if total else 0.0,
+        "p50": percentile(histogram, 0.50),
+        "p90": percentile(histogram, 0.90),
+        "p99": percentile(histogram, 0.99),
+        "max": max(histogram) if histogram else 0,
+        "bucket_width": width,
+        "buckets": {start: buckets[start] for start in sorted(buckets)},
+    }
+
+
+def print_summary(summary: Dict[str, Any], elapsed: float, stones_per_wish: int = 160) -> None:
+    """Print the wishes-to-featured distribution"""
+    print(f"players simulated   {summary['players']:>12}")
+    print(f"time                {elapsed:>12.2f} s ({summary['players'] / elapsed:,.0f} players/s)")
+    print(f"wishes to featured  mean {summary['mean']:.1f}  p50 {summary['p50']}  p90 {summary['p90']}"
+          f"  p99 {summary['p99']}  max {summary['max']}")
+    print(f"stellarstones       mean {summary['mean'] * stones_per_wish:,.0f}"
+          f"  p90 {summary['p90'] * stones_per_wish:,}")
+
+    if not summary["buckets"]:
+        return
+    widest = max(summary["buckets"].values())
+    print(f"\n  {'wishes':<15}{'players':>10}{'share':>8}")
+    for start, players in summary["buckets"].items():
+        share = players / summary["players"]
+        bar = "#" * max(1, round(40 * players / widest))
+        print(f"  {start:>6}-{start + summary['bucket_width'] - 1:<8}{players:>10}{share:>8.1%}  {bar}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Simulate wishes on the Legacies limited banner")
+    parser.add_argument("--game", default="Legacies.py", help="game file providing the pull rules")
+    parser.add_argument("--players", type=int, default=DEFAULT_PLAYERS, help="players to simulate")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--seed", type=int, default=1, help="base seed of the run")
+    parser.add_argument("--character-share", type=float, default=0.15,
+                        help="chance that a wish lands on the character pool")
+    parser.add_argument("--report", help="also write the summary as JSON")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.game):
+        print(f"Game file not found: {args.game}")
+        return 1
+    game_file = os.path.abspath(args.game)
+
+    jobs: List[Tuple[str, int, int, float]] = []
+    for index, start in enumerate(range(0, args.players, CHUNK_PLAYERS)):
+        players = min(CHUNK_PLAYERS, args.players - start)
+        jobs.append((game_file, players, args.seed * 1000003 + index, args.character_share))
+
+    started = time.perf_counter()
+    histogram: Dict[int, int] = {}
+    if args.workers > 1 and len(jobs) > 1:
+        with multiprocessing.Pool(min(args.workers, len(jobs))) as pool:
+            results = pool.map(run_chunk, jobs)
+    else:
+        results = [run_chunk(job) for job in jobs]
+    for result in results:
+        for wishes, players in result.items():
+            histogram[wishes] = histogram.get(wishes, 0) + players
+    elapsed = time.perf_counter() - started
+
+    summary = summarize(histogram)
+    print_summary(summary, elapsed)
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"\nReport written to {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,7 @@ import re
 from datetime import datetime, timedelta
 from typing import Tuple
 from colorama import init, Fore, Style, Back
+from text_mode import TEXT_MODE, pause
 
 # Initialize colorama for cross-platform colored terminal output
 init(autoreset=True)
@@ -104,10 +105,14 @@ class Terminal:
         if color:
             text = Colors.colorize(text, color)
 
+        if TEXT_MODE != "cinematic":
+            print(text)
+            return
+
         for char in text:
             sys.stdout.write(char)
             sys.stdout.flush()
-            time.sleep(delay)
+            pause(delay)
         print()
 
     @staticmethod
@@ -165,7 +170,7 @@ class Terminal:
             iterations += 1
             sys.stdout.write(f"\r{color}{char}{Colors.RESET} {message}...")
             sys.stdout.flush()
-            time.sleep(0.1)
+            pause(0.1)
 
         print()
 
@@ -8506,7 +8511,7 @@ class GameState:
         # Progress animation
         for i in range(11):
             Terminal.progress_bar(30, i/10, "Scanning", Colors.BRIGHT_GREEN)
-            time.sleep(0.2)
+            pause(0.2)
         print()
 
         # Display results
@@ -30,6 +30,13 @@ BORDER_CHARS = {
     'right_tee': '╣'
 }
 
+# Text rendering modes passed to the games, from quickest to most atmospheric
+TEXT_MODES = {
+    'instant': "Text appears at once, no dramatic pauses",
+    'fast': "Text appears at once, shortened pauses",
+    'cinematic': "Typewriter effects and full dramatic pauses"
+}
+
 STATUS_ICONS = {
     'available': '●',
     'purchased': '✓',
@@ -75,6 +82,42 @@ def save_game_data(data: Any) -> Any:
     with open('game_data.json', 'w') as f:
         json.dump(data, f)
 
+# Session profiles are kept next to game_data.json
+PROFILE_FOLDER = "profiles"
+PROFILES_KEPT_PER_GAME = 5
+HOT_FUNCTION_COUNT = 5
+
+def new_profile_path(game_name: str) -> str:
+    """Create the profile folder and return a fresh path for this session"""
+    os.makedirs(PROFILE_FOLDER, exist_ok=True)
+    stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    return os.path.join(PROFILE_FOLDER, f"{game_name}_{stamp}.prof")
+
+def prune_profiles(game_name: str) -> None:
+    """Keep only the most recent session profiles of a game"""
+    prefix = f"{game_name}_"
+    profiles = sorted(f for f in os.listdir(PROFILE_FOLDER)
+                      if f.startswith(prefix) and f.endswith(".prof"))
+    for old_profile in profiles[:-PROFILES_KEPT_PER_GAME]:
+        try:
+            os.remove(os.path.join(PROFILE_FOLDER, old_profile))
+        except OSError:
+            pass
+
+def hot_functions(profile_path: str, game_file: str, limit: int = HOT_FUNCTION_COUNT) -> List[Any]:
+    """Top cumulative-time functions of the game itself in a session profile"""
+    import pstats
+
+    stats = pstats.Stats(profile_path).stats
+    game_path = os.path.abspath(game_file)
+    functions = []
+    for (file_name, line, function), (_, calls, _, cumulative, _) in stats.items():
+        if os.path.abspath(file_name) != game_path or function == "<module>":
+            continue
+        functions.append((cumulative, calls, f"{function} (line {line})"))
+    functions.sort(reverse=True)
+    return functions[:limit]
+
 def color_text(text: Any, color: Any) -> Any:
     """Apply color to text if colors are enabled"""
     data = load_game_data()
@@ -308,14 +351,160 @@ def check_file(file_name: Any) -> bool:
         return False
     return True
 
+# Warm game host
+BASE_GAME_FILES = ["Legacies.py", "Liminal.py", "Exodus.py", "Z_survival.py", "school.py"]
+
+class WarmGameHost:
+    """Keeps compiled game code resident and forks a fresh child per launch.
+
+    Starting a game as a new interpreter means re-parsing and compiling the
+    whole script every time, and scripts run as __main__ never get a cached
+    .pyc. Compilation is by far the largest part of that cost (the module
+    level tables themselves build in a few milliseconds), so the host keeps
+    one code object per game and each launch forks a child that executes it
+    as a brand new __main__ module. Game state is never shared between
+    sessions because every session gets its own process.
+    """
+
+    def __init__(self) -> None:
+        self.code_cache: Dict[str, Any] = {}
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Forking is only available on POSIX systems"""
+        return hasattr(os, 'fork')
+
+    def get_code(self, file_name: str) -> Any:
+        """Return the compiled code for a game, recompiling if the file changed"""
+        path = os.path.abspath(file_name)
+        mtime = os.path.getmtime(path)
+        cached = self.code_cache.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, 'rb') as f:
+                source = f.read()
+            cached = (mtime, compile(source, path, 'exec', dont_inherit=True))
+            self.code_cache[path] = cached
+        return cached[1]
+
+    def preload(self, file_names: List[str]) -> int:
+        """Compile every available game ahead of time, returns the number loaded"""
+        loaded = 0
+        for file_name in file_names:
+            if not os.path.isfile(file_name):
+                continue
+            try:
+                self.get_code(file_name)
+                loaded += 1
+            except (OSError, SyntaxError) as e:
+                print(color_text(f"█ Could not preload {file_name}: {e}", Fore.RED))
+        return loaded
+
+    def run(self, file_name: str, profile_path: Optional[str] = None) -> int:
+        """Run a game in a forked child and return its exit status"""
+        code = self.get_code(file_name)
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        pid = os.fork()
+        if pid == 0:
+            os._exit(self._run_child(file_name, code, profile_path))
+
+        try:
+            _, status = os.waitpid(pid, 0)
+        except KeyboardInterrupt:
+            # Same as subprocess.run: let the game finish handling Ctrl+C first
+            os.waitpid(pid, 0)
+            raise
+        return os.waitstatus_to_exitcode(status)
+
+    @staticmethod
+    def _run_child(file_name: str, code: Any, profile_path: Optional[str] = None) -> int:
+        """Execute a game as __main__ inside the forked child"""
+        import atexit
+        import types
+        import traceback
+
+        # The fork copied the launcher's RNG state, give each session its own
+        random.seed()
+        # Same for its exit handlers, the child must only run the game's own
+        atexit._clear()
+
+        module = types.ModuleType('__main__')
+        module.__file__ = os.path.abspath(file_name)
+        module.__builtins__ = __builtins__
+        sys.modules['__main__'] = module
+        sys.argv = [file_name]
+
+        profiler = None
+        if profile_path:
+            import cProfile
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        exit_code = 0
+        try:
+            exec(code, module.__dict__)
+        except SystemExit as e:
+            if e.code is None:
+                exit_code = 0
+            elif isinstance(e.code, int):
+                exit_code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except KeyboardInterrupt:
+            exit_code = 130
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+
+        if profiler is not None:
+            profiler.disable()
+            try:
+                profiler.dump_stats(profile_path)
+            except OSError as e:
+                print(f"Could not write profile: {e}", file=sys.stderr)
+
+        # The child leaves through os._exit, which skips the exit handlers a
+        # normal interpreter exit would run, e.g. Legacies waiting for its
+        # queued saves to reach the disk
+        atexit._run_exitfuncs()
+
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:
+            pass
+        return exit_code
+
+warm_host = WarmGameHost()
+
+def text_mode_setting(data: Any) -> str:
+    """The text mode from the settings, cinematic when it is missing or not a known mode"""
+    text_mode = data['settings'].get('text_mode', 'cinematic')
+    return text_mode if isinstance(text_mode, str) and text_mode in TEXT_MODES else 'cinematic'
+
+def warm_launch_enabled(data: Any) -> bool:
+    """Check whether games should be launched through the warm host"""
+    return data['settings'].get('warm_launch', False) and WarmGameHost.is_supported()
+
+def preload_games(data: Any) -> None:
+    """Compile all owned games into the warm host"""
+    file_names = BASE_GAME_FILES + [game[1] for game in data['purchased_games']]
+    print(color_text("█ Warming up game host...", Fore.CYAN))
+    loaded = warm_host.preload(file_names)
+    print(color_text(f"█ {loaded} games ready for instant launch", Fore.GREEN))
+
 def launch_game(file_name: Any, data: Any) -> Any:
     """Launch the specified game file with enhanced tracking"""
     try:
         game_name = os.path.splitext(os.path.basename(file_name))[0]
         print(color_text(f"\n🚀 Initializing {game_name}...", Fore.GREEN))
 
-        # Enhanced loading animation with progress
-        animate_loading(f"Loading {game_name}", 1.5)
+        warm = warm_launch_enabled(data)
+        if not warm:
+            # Enhanced loading animation with progress
+            animate_loading(f"Loading {game_name}", 1.5)
 
         # Track game statistics
         if game_name not in data['game_statistics']:
@@ -327,12 +516,29 @@ def launch_game(file_name: Any, data: Any) -> Any:
 
         # Set environment variable to indicate the game was launched from launcher
         os.environ["LAUNCHED_FROM_LAUNCHER"] = "1"
+        os.environ["CHRONOTALE_TEXT_MODE"] = text_mode_setting(data)
+
+        # Profile the session when enabled in the settings
+        profile_path = None
+        if data['settings'].get('profile_games', False):
+            profile_path = new_profile_path(game_name)
+            data['game_statistics'][game_name]['last_profile'] = profile_path
 
         # Track launch time
         start_time = time.time()
 
         # Run the game
-        subprocess.run([sys.executable, file_name], check=True)
+        if warm:
+            return_code = warm_host.run(file_name, profile_path)
+            if return_code != 0:
+                raise subprocess.CalledProcessError(return_code, file_name)
+        elif profile_path:
+            subprocess.run([sys.executable, '-m', 'cProfile', '-o', profile_path, file_name], check=True)
+        else:
+            subprocess.run([sys.executable, file_name], check=True)
+
+        if profile_path:
+            prune_profiles(game_name)
 
         # Calculate session time
         end_time = time.time()
@@ -343,9 +549,11 @@ def launch_game(file_name: Any, data: Any) -> Any:
         # Award achievements for playtime
         check_playtime_achievements(data, game_name, session_time)
 
-        # Clear the environment variable when game exits
+        # Clear the environment variables when game exits
         if "LAUNCHED_FROM_LAUNCHER" in os.environ:
             del os.environ["LAUNCHED_FROM_LAUNCHER"]
+        if "CHRONOTALE_TEXT_MODE" in os.environ:
+            del os.environ["CHRONOTALE_TEXT_MODE"]
 
         return session_time
 
@@ -627,6 +835,21 @@ def statistics_menu(data: Any) -> Any:
         for hint in hints[:3]:  # Show max 3 hints
             print(color_text(f"  • {hint}", Fore.YELLOW))
 
+        # Hot functions from the last profiled session of each game
+        profiled = [(game_name, stats['last_profile']) for game_name, stats in data['game_statistics'].items()
+                    if stats.get('last_profile') and os.path.isfile(stats['last_profile'])]
+        if profiled:
+            print(color_text("\n🔥 HOT FUNCTIONS (LAST PROFILED SESSION)", Fore.CYAN))
+            for game_name, profile_path in profiled:
+                print(color_text(f"  {game_name}:", Fore.WHITE))
+                try:
+                    functions = hot_functions(profile_path, f"{game_name}.py")
+                except Exception as e:
+                    print(color_text(f"    Could not read profile: {e}", Fore.RED))
+                    continue
+                for cumulative, calls, label in functions:
+                    print(color_text(f"    {cumulative:8.3f}s  {calls:>8} calls  {label}", Fore.YELLOW))
+
         print(color_text("\n█ [1] Back to Main Menu", Fore.RED))
         choice = input(color_text("\n█ Select: ", Fore.YELLOW) + Style.RESET_ALL)
 
@@ -653,13 +876,28 @@ def settings_menu(data: Any) -> Any:
         print(color_text(f"█ ⚙️ [1] Color Theme: {color_status}", Fore.WHITE))
         print(color_text("     Toggle colorful text display throughout the launcher", Fore.YELLOW))
         print()
-        print(color_text("█ 📜 [2] Complete Automated Setup", Fore.WHITE))
+        if WarmGameHost.is_supported():
+            warm_status = "✓ ENABLED" if data['settings'].get('warm_launch', False) else "✗ DISABLED"
+        else:
+            warm_status = "✗ UNAVAILABLE ON THIS SYSTEM"
+        print(color_text(f"█ ⚡ [2] Instant Launch: {warm_status}", Fore.WHITE))
+        print(color_text("     Keep games loaded in a warm host for faster start-up", Fore.YELLOW))
+        print()
+        text_mode = text_mode_setting(data)
+        print(color_text(f"█ 📝 [3] Text Speed: {text_mode.upper()}", Fore.WHITE))
+        print(color_text(f"     {TEXT_MODES[text_mode]}", Fore.YELLOW))
+        print()
+        profile_status = "✓ ENABLED" if data['settings'].get('profile_games', False) else "✗ DISABLED"
+        print(color_text(f"█ 🔬 [4] Profile Game Sessions: {profile_status}", Fore.WHITE))
+        print(color_text(f"     Record a cProfile of every session in '{PROFILE_FOLDER}' (slower games)", Fore.YELLOW))
+        print()
+        print(color_text("█ 📜 [5] Complete Automated Setup", Fore.WHITE))
         print(color_text("     Full automation: dependencies, global command, PATH configuration", Fore.YELLOW))
         print()
-        print(color_text("█ 🔙 [3] Return to Main Menu", Fore.RED))
+        print(color_text("█ 🔙 [6] Return to Main Menu", Fore.RED))
         print(color_text("     Save settings and return to the main menu", Fore.YELLOW))
 
-        choice = input(color_text("\n⚙️ Select setting to modify (1-3): ", Fore.MAGENTA) + Style.RESET_ALL)
+        choice = input(color_text("\n⚙️ Select setting to modify (1-6): ", Fore.MAGENTA) + Style.RESET_ALL)
 
         if choice == '1':
             data['settings']['colors_enabled'] = not data['settings']['colors_enabled']
@@ -668,6 +906,33 @@ def settings_menu(data: Any) -> Any:
             print(color_text(f"\n✓ Color theme {status} successfully!", Fore.GREEN))
             time.sleep(1.5)
         elif choice == '2':
+            if not WarmGameHost.is_supported():
+                print(color_text("\n❌ Instant launch requires a system that supports fork()", Fore.RED))
+                time.sleep(1.5)
+                continue
+            data['settings']['warm_launch'] = not data['settings'].get('warm_launch', False)
+            save_game_data(data)
+            if data['settings']['warm_launch']:
+                preload_games(data)
+                print(color_text("\n✓ Instant launch enabled successfully!", Fore.GREEN))
+            else:
+                print(color_text("\n✓ Instant launch disabled successfully!", Fore.GREEN))
+            time.sleep(1.5)
+        elif choice == '3':
+            # Cycle through the text modes
+            modes = list(TEXT_MODES)
+            current = text_mode_setting(data)
+            data['settings']['text_mode'] = modes[(modes.index(current) + 1) % len(modes)]
+            save_game_data(data)
+            print(color_text(f"\n✓ Text speed set to {data['settings']['text_mode']}!", Fore.GREEN))
+            time.sleep(1.5)
+        elif choice == '4':
+            data['settings']['profile_games'] = not data['settings'].get('profile_games', False)
+            save_game_data(data)
+            status = "enabled" if data['settings']['profile_games'] else "disabled"
+            print(color_text(f"\n✓ Session profiling {status} successfully!", Fore.GREEN))
+            time.sleep(1.5)
+        elif choice == '5':
             # Complete automated setup
             os.system('cls' if os.name == 'nt' else 'clear')
             display_banner()
@@ -710,7 +975,7 @@ def settings_menu(data: Any) -> Any:
                 print(color_text("Setup cancelled.", Fore.YELLOW))
             
             input(color_text("\nPress Enter to return to settings...", Fore.YELLOW) + Style.RESET_ALL)
-        elif choice == '3':
+        elif choice == '6':
             return
         else:
             print(color_text("\n❌ Invalid selection!", Fore.RED))
@@ -719,6 +984,8 @@ def settings_menu(data: Any) -> Any:
 def main_menu() -> None:
     """Enhanced main menu controller with modern UI"""
     data = load_game_data()
+    if warm_launch_enabled(data):
+        preload_games(data)
     while True:
         os.system('cls' if os.name == 'nt' else 'clear')
         display_banner()
@@ -21,6 +21,7 @@ import time
 from typing import Optional
 from datetime import datetime
 import sys
+from text_mode import TEXT_MODE, pause
 
 # Import colorama with proper fallback
 try:
@@ -1458,9 +1459,12 @@ class GameEngine:
 
     def slow_print(self, text: str, delay: float = 0.03):
         """Print text with typewriter effect"""
+        if TEXT_MODE != "cinematic":
+            print(text)
+            return
         for char in text:
             print(char, end='', flush=True)
-            time.sleep(delay)
+            pause(delay)
         print()
 
     def display_header(self):
@@ -2618,7 +2622,7 @@ class GameEngine:
                 travel_cost = 50
                 if self.player.remove_money(travel_cost):
                     print(f"Traveling to {destination}...")
-                    time.sleep(2)
+                    pause(2)
 
                     self.player.location = destination
                     self.player.district = CITIES[destination]["districts"][0]
@@ -3850,7 +3854,7 @@ class GameEngine:
 
         # Simulate heist execution
         print(f"\n{Fore.YELLOW}Ejecutando atraco...{Style.RESET_ALL}")
-        time.sleep(2)
+        pause(2)
 
         if random.randint(1, 100) <= success_chance:
             # Successful heist
@@ -4003,7 +4007,7 @@ class GameEngine:
             return
 
         print(f"\n{Fore.CYAN}Ejecutando...{Style.RESET_ALL}")
-        time.sleep(activity["time"])
+        pause(activity["time"])
 
         if random.randint(1, 100) <= success_chance:
             reward = random.randint(activity["reward"][0], activity["reward"][1])
@@ -4344,7 +4348,7 @@ class GameEngine:
         self.player.prison_time = max(0, self.player.prison_time - 1)
 
         if self.player.prison_time > 0:
-            time.sleep(1)
+            pause(1)
             self.prison_activities()
         else:
             print(f"\n{Fore.GREEN}¡LIBERADO! / RELEASED!{Style.RESET_ALL}")
@@ -4391,7 +4395,7 @@ class GameEngine:
                 print(f"Sufriste {damage} de daño en el intento")
 
                 if self.player.prison_time > 0:
-                    time.sleep(2)
+                    pause(2)
                     self.prison_activities()
 
     def gang_hierarchy_system(self):
@@ -4893,7 +4897,7 @@ class GameEngine:
 
         for line in text.strip().split('\n'):
             print(f"{Fore.YELLOW}{line.strip()}{Style.RESET_ALL}")
-            time.sleep(0.5)
+            pause(0.5)
 
         print(f"\n{Fore.YELLOW}ESTADÍSTICAS FINALES / FINAL STATISTICS:{Style.RESET_ALL}")
         print(f"Dinero total: ${self.player.money:,}")
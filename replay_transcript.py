@@ -0,0 +1,234 @@
+"""
+ChronoTale Transcript Replay
+============================
+Plays any game against a recorded command transcript at full speed, without
+a human at the keyboard.
+
+The transcript is a plain text file with one answer per line, exactly what
+would have been typed at each prompt (an empty line presses Enter). While
+replaying:
+- time.sleep() returns immediately and text is drawn in instant mode
+- screen clears (`os.system('clear')`) are skipped
+- input() is served from the transcript, echoing each answer into the log
+- everything the game prints is captured to a log file
+
+The replay stops when the game exits or the transcript runs out. Afterwards
+the driver reports commands per second and the latency of every command,
+measured from the moment an answer is handed to the game until the game asks
+for the next one, grouped by base command (`/fight`, `/save`, `1`...).
+
+Usage:
+    python replay_transcript.py Legacies.py session.txt [--log replay.log]
+                                [--report replay_report.json] [--top 15]
+"""
+
+import argparse
+import builtins
+import json
+import math
+import os
+import runpy
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+SCREEN_CLEAR_COMMANDS = ("clear", "cls")
+DEFAULT_TOP = 15
+
+
+class TranscriptEnd(BaseException):
+    """Raised inside the game when the transcript has no answers left"""
+
+
+def load_transcript(path: str) -> List[str]:
+    """Read the answers of a transcript, one per line"""
+    with open(path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def base_command(command: str) -> str:
+    """Key used to group latencies, e.g. '/fight goblin' -> '/fight'"""
+    words = command.strip().lower().split()
+    if not words:
+        return "<enter>"
+    return words[0]
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class TranscriptReplay:
+    """Run a game file with input(), sleeps and screen clears served by the driver"""
+
+    def __init__(self, game_file: str, answers: List[str], log_path: str) -> None:
+        self.game_file = game_file
+        self.answers = answers
+        self.log_path = log_path
+        self.position = 0
+        self.latencies: List[Dict[str, Any]] = []
+        self.pending: Optional[str] = None
+        self.command_start = 0.0
+        self.startup_time = 0.0
+        self.outcome = "finished"
+
+    def serve_input(self, prompt: Any = "") -> str:
+        """Replacement for input() that answers from the transcript"""
+        now = time.perf_counter()
+        if self.pending is None:
+            self.startup_time = now - self.command_start
+        else:
+            self.latencies.append({"command": self.pending, "time": now - self.command_start})
+
+        if self.position >= len(self.answers):
+            self.pending = None
+            raise TranscriptEnd()
+        answer = self.answers[self.position]
+        self.position += 1
+
+        sys.stdout.write(f"{prompt}{answer}\n")
+        self.pending = answer
+        self.command_start = time.perf_counter()
+        return answer
+
+    def run(self) -> None:
+        """Replay the whole transcript against the game"""
+        original_input = builtins.input
+        original_sleep = time.sleep
+        original_system = os.system
+        original_stdout = sys.stdout
+        original_argv = sys.argv
+        original_path = list(sys.path)
+
+        def skip_sleep(seconds: float) -> None:
+            return None
+
+        def skip_clear(command: str) -> int:
+            if command.strip() in SCREEN_CLEAR_COMMANDS:
+                return 0
+            return original_system(command)
+
+        os.environ["LAUNCHED_FROM_LAUNCHER"] = "1"
+        os.environ["CHRONOTALE_TEXT_MODE"] = "instant"
+        builtins.input = self.serve_input
+        time.sleep = skip_sleep
+        os.system = skip_clear
+        sys.argv = [self.game_file]
+        # Like `python game.py`, so the game finds the modules next to it such as text_mode
+        sys.path.insert(0, os.path.dirname(os.path.abspath(self.game_file)))
+
+        with open(self.log_path, "w", encoding="utf-8") as log:
+            sys.stdout = log
+            self.command_start = time.perf_counter()
+            try:
+                runpy.run_path(self.game_file, run_name="__main__")
+            except TranscriptEnd:
+                self.outcome = "transcript exhausted"
+            except SystemExit as e:
+                self.outcome = f"game exited ({e.code})" if e.code else "game exited"
+            except Exception as e:
+                self.outcome = f"crashed: {type(e).__name__}: {e}"
+            finally:
+                # The last answer only counts once the game has stopped
+                if self.pending is not None:
+                    self.latencies.append({"command": self.pending,
+                                           "time": time.perf_counter() - self.command_start})
+                try:
+                    sys.stdout.flush()
+                except ValueError:
+                    pass
+                sys.stdout = original_stdout
+                builtins.input = original_input
+                time.sleep = original_sleep
+                os.system = original_system
+                sys.argv = original_argv
+                sys.path[:] = original_path
+
+    def report(self) -> Dict[str, Any]:
+        """Summarize throughput and per-command latency"""
+        times = [entry["time"] for entry in self.latencies]
+        total = sum(times)
+        groups: Dict[str, List[float]] = {}
+        for entry in self.latencies:
+            groups.setdefault(base_command(entry["command"]), []).append(entry["time"])
+
+        commands = {}
+        for name, values in groups.items():
+            commands[name] = {
+                "count": len(values),
+                "total": sum(values),
+                "mean": statistics.mean(values),
+                "p50": percentile(values, 0.50),
+                "p95": percentile(values, 0.95),
+                "max": max(values),
+            }
+
+        return {
+            "game": os.path.basename(self.game_file),
+            "outcome": self.outcome,
+            "answers_used": self.position,
+            "answers_total": len(self.answers),
+            "startup_time": self.startup_time,
+            "commands": len(times),
+            "command_time": total,
+            "commands_per_second": len(times) / total if total else 0.0,
+            "p50": percentile(times, 0.50) if times else 0.0,
+            "p95": percentile(times, 0.95) if times else 0.0,
+            "max": max(times) if times else 0.0,
+            "by_command": commands,
+            "latencies": self.latencies,
+        }
+
+
+def print_report(report: Dict[str, Any], top: int) -> None:
+    """Print the replay summary and the slowest commands"""
+    print(f"{report['game']}: {report['outcome']}")
+    print(f"  answers used       {report['answers_used']}/{report['answers_total']}")
+    print(f"  startup            {report['startup_time'] * 1000:10.1f} ms")
+    print(f"  commands           {report['commands']:>10}")
+    print(f"  command time       {report['command_time'] * 1000:10.1f} ms")
+    print(f"  commands/second    {report['commands_per_second']:10.1f}")
+    print(f"  latency p50/p95/max {report['p50'] * 1000:.2f} / {report['p95'] * 1000:.2f}"
+          f" / {report['max'] * 1000:.2f} ms")
+
+    ranked = sorted(report["by_command"].items(), key=lambda item: item[1]["total"], reverse=True)
+    if ranked:
+        print(f"\n  {'command':<20}{'count':>7}{'total ms':>11}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}")
+        for name, stats in ranked[:top]:
+            print(f"  {name[:20]:<20}{stats['count']:>7}{stats['total'] * 1000:>11.1f}"
+                  f"{stats['p50'] * 1000:>9.2f}{stats['p95'] * 1000:>9.2f}{stats['max'] * 1000:>9.2f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay a recorded command transcript against a ChronoTale game")
+    parser.add_argument("game", help="game file to run, e.g. Legacies.py")
+    parser.add_argument("transcript", help="text file with one answer per line")
+    parser.add_argument("--log", help="where to write the captured output (default <game>_replay.log)")
+    parser.add_argument("--report", help="also write the full report as JSON")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="commands to list in the summary")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.game):
+        print(f"Game file not found: {args.game}")
+        return 1
+    log_path = args.log or f"{os.path.splitext(os.path.basename(args.game))[0]}_replay.log"
+
+    replay = TranscriptReplay(args.game, load_transcript(args.transcript), log_path)
+    replay.run()
+    report = replay.report()
+    print_report(report, args.top)
+    print(f"\nOutput captured in {log_path}")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.report}")
+    return 1 if report["outcome"].startswith("crashed") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
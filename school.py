@@ -8,6 +8,7 @@ import platform
 import re
 from datetime import datetime, timedelta
 from colorama import init, Fore, Back, Style
+from text_mode import pause
 
 # Enhanced setup for colorama to ensure colors work in various environments
 os.environ["FORCE_COLOR"] = "1"  # Force colors in certain environments
@@ -5046,7 +5047,7 @@ def slow_print(text: Any, delay: Optional[Any] = None, color: Any = Fore.WHITE,
         
         # Add delay if needed without affecting colors
         if delay > 0.01 and not _non_interactive:
-            time.sleep(min(len(filtered_text) * delay * 0.02, 0.5))
+            pause(min(len(filtered_text) * delay * 0.02, 0.5))
             
     except Exception:
         # Fallback that preserves colors
@@ -11039,7 +11040,7 @@ def take_class_exam(subject_name: str) -> Any:
     print(f"\n{Fore.YELLOW}📋 SURPRISE EXAM! {subject_name} Quiz{Style.RESET_ALL}")
     print(f"{Fore.CYAN}Your teacher announces an unexpected quiz for today's class.{Style.RESET_ALL}")
     
-    time.sleep(1)
+    pause(1)
     
     # Get subject difficulty
     subject_data = subjects.get(subject_name, {"difficulty": 3})
@@ -11055,7 +11056,7 @@ def take_class_exam(subject_name: str) -> Any:
     final_score = max(0, min(100, base_score + variation))
     
     print(f"\n{Fore.YELLOW}⏰ Taking the {subject_name} quiz...{Style.RESET_ALL}")
-    time.sleep(2)
+    pause(2)
     
     # Show result with grade feedback
     if final_score >= 90:
@@ -11106,10 +11107,10 @@ def play_lecture_cutscene(subject_name: str) -> Any:
     scenario = random.choice(lecture_scenarios)
     
     print(f"\n{Fore.WHITE}{scenario['setting']}{Style.RESET_ALL}")
-    time.sleep(1)
+    pause(1)
     
     print(f"\n{Fore.YELLOW}{teacher_name}: \"{scenario['dialogue']}\"{Style.RESET_ALL}")
-    time.sleep(2)
+    pause(2)
     
     # Interactive element
     if scenario.get("interactive") and not _non_interactive:
@@ -16003,13 +16004,13 @@ def pe_class_challenge() -> Any:
     slow_print(f"{Fore.MAGENTA}=== Setting the Scene ==={Style.RESET_ALL}")
     for line in challenge["prep_narrative"]:
         slow_print(line)
-        time.sleep(0.3)  # Brief pause between narrative lines
+        pause(0.3)  # Brief pause between narrative lines
 
     slow_print("")  # Empty line for spacing
 
     # Print a prompt to build anticipation
     slow_print(f"{Fore.YELLOW}The challenge begins...{Style.RESET_ALL}")
-    time.sleep(1)  # Dramatic pause
+    pause(1)  # Dramatic pause
 
     # Challenge success is based on player's energy, PE stats, traits, season, social charisma, and some randomness
     pe_skill_factor = (player["pe_stats"]["technique"] / 10) * 0.2 + (
@@ -16085,7 +16086,7 @@ def pe_class_challenge() -> Any:
         # Show great success narrative
         for line in challenge["great_success_narrative"]:
             slow_print("{}{}{}".format(Fore.GREEN, line, Style.RESET_ALL))
-            time.sleep(0.3)
+            pause(0.3)
 
         # Apply great success effects
         reputation_gain_students = random.randint(3, 6)
@@ -16123,7 +16124,7 @@ def pe_class_challenge() -> Any:
         # Show success narrative
         for line in challenge["success_narrative"]:
             slow_print("{}{}{}".format(Fore.CYAN, line, Style.RESET_ALL))
-            time.sleep(0.3)
+            pause(0.3)
 
         # Apply success effects
         reputation_gain_students = random.randint(1, 3)
@@ -16161,7 +16162,7 @@ def pe_class_challenge() -> Any:
         # Show failure narrative
         for line in challenge["failure_narrative"]:
             slow_print("{}{}{}".format(Fore.RED, line, Style.RESET_ALL))
-            time.sleep(0.3)
+            pause(0.3)
 
         # Apply failure effects
         reputation_loss = random.randint(0, 2)
@@ -17066,7 +17067,7 @@ def play_festival_minigame(minigame_type) -> Any:
             )
             for move in dance_sequence:
                 slow_print(f"{move}...")
-                time.sleep(0.7)
+                pause(0.7)
 
             # Clear screen equivalent
             print("\n" * 5)
@@ -20193,7 +20194,7 @@ def date_narratives(date_type: Any, partner_name: Any, personality) -> Any:
         )
 
         # Add a short pause for dramatic effect
-        time.sleep(0.5)
+        pause(0.5)
 
         # Display setting introduction with special color
         date_location = date_type
@@ -20211,7 +20212,7 @@ def date_narratives(date_type: Any, partner_name: Any, personality) -> Any:
                     Fore.WHITE, line.format(partner_name), Style.RESET_ALL
                 )
             )
-            time.sleep(0.3)  # Short pause between narrative lines
+            pause(0.3)  # Short pause between narrative lines
 
         slow_print("")  # Empty line for separation
 
@@ -20231,7 +20232,7 @@ def date_narratives(date_type: Any, partner_name: Any, personality) -> Any:
                     slow_print("  {}".format(reaction.format(partner_name)))
                 else:
                     slow_print("  {}".format(str(reaction)))
-                time.sleep(0.2)  # Brief pause between reactions
+                pause(0.2)  # Brief pause between reactions
         else:
             # If it's a single string, just show that
             reaction_text = personality_reactions[personality]
@@ -22509,13 +22510,13 @@ def main_game_loop():
                 # Automatically attend morning classes
                 for subject in list(subjects.keys())[:2]:  # Attend first 2 subjects
                     print(f"Attending {subject} class")
-                    time.sleep(0.5)
+                    pause(0.5)
                 
                 # Show status periodically
                 if day == 1:
                     show_status()
                 
-                time.sleep(1)
+                pause(1)
             
             print(f"\n{Fore.YELLOW}Non-interactive gameplay completed. You experienced 3 days of school life!{Style.RESET_ALL}")
             print(f"{Fore.GREEN}Game completed successfully.{Style.RESET_ALL}")
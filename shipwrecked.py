@@ -6,6 +6,7 @@ import colorama
 import glob
 from colorama import Fore, Style
 from typing import Dict, List, Any, Optional, Union, Tuple, Callable
+from text_mode import pause
 
 # Initialize colorama
 colorama.init(autoreset=True)
@@ -2263,7 +2264,7 @@ class GameManager:
         if weather_effect:
             print(weather_effect)
 
-        time.sleep(1)
+        pause(1)
 
         # Check for enemy encounters with modified chance
         if random.random() < (0.3 * enemy_chance_modifier):  # Base 30% modified by weather
@@ -3295,7 +3296,7 @@ class GameManager:
                 # Handle raft escape option
                 if gs.raft_progress >= 100 and choice_num == len(available_locations) + 1:
                     print(f"\n{Fore.CYAN}You push your raft into the water and set sail, hoping to find rescue...{Style.RESET_ALL}")
-                    time.sleep(2)
+                    pause(2)
 
                     # Base chance of successful escape starts at 60%
                     escape_chance = 0.6
@@ -3350,9 +3351,9 @@ class GameManager:
                     displayed_chance = round(escape_chance * 100 / 5) * 5
                     print(f"\n{Fore.CYAN}Estimated survival chance: {displayed_chance}%{Style.RESET_ALL}")
 
-                    time.sleep(2)
+                    pause(2)
                     print(f"\n{Fore.WHITE}You paddle out into the open sea...{Style.RESET_ALL}")
-                    time.sleep(2)
+                    pause(2)
 
                     # Attempt escape
                     if random.random() < escape_chance:
@@ -3361,7 +3362,7 @@ class GameManager:
                         print(f"\n{Fore.GREEN}Success! {gs.message}{Style.RESET_ALL}")
                     else:
                         print(f"\n{Fore.RED}A massive storm hits! Your raft is being tossed by massive waves!{Style.RESET_ALL}")
-                        time.sleep(1)
+                        pause(1)
                         print(f"{Fore.RED}The raft breaks apart and you're washed back to shore.{Style.RESET_ALL}")
 
                         gs.raft_progress = 0
@@ -3539,7 +3540,7 @@ class GameManager:
             return
 
         print(f"\n{Fore.CYAN}You cast your fishing line into the water...{Style.RESET_ALL}")
-        time.sleep(1.5)
+        pause(1.5)
 
         # Weather effects on fishing success
         catch_chance = 0.7  # Base 70% chance
@@ -3556,7 +3557,7 @@ class GameManager:
             print(f"{Fore.GREEN}Perfect fishing weather!{Style.RESET_ALL}")
             catch_chance += 0.15
 
-        time.sleep(1)
+        pause(1)
 
         # Random chance to catch something
         if random.random() < catch_chance:
@@ -3614,7 +3615,7 @@ class GameManager:
             return
 
         print(f"\n{Fore.CYAN}You start tracking for animals to hunt...{Style.RESET_ALL}")
-        time.sleep(1.5)
+        pause(1.5)
 
         # Weather effects on hunting success
         success_chance = 0.65  # Base 65% chance
@@ -3634,7 +3635,7 @@ class GameManager:
             print(f"{Fore.GREEN}Good visibility makes tracking easier!{Style.RESET_ALL}")
             success_chance += 0.1
 
-        time.sleep(1)
+        pause(1)
 
         # Random chance to hunt successfully
         if random.random() < success_chance:
@@ -3699,7 +3700,7 @@ class GameManager:
         success_chance = 0.1  # Base 10% chance - rescue should be rare
 
         print(f"\n{Fore.CYAN}You use your signal mirror to try and catch the attention of any passing ships or aircraft...{Style.RESET_ALL}")
-        time.sleep(1.5)
+        pause(1.5)
 
         if gs.weather == "Rainy":
             print(f"{Fore.BLUE}The rain reduces visibility, making your signal less effective.{Style.RESET_ALL}")
@@ -3724,14 +3725,14 @@ class GameManager:
             gs.update_quest_objective("island_escape", "create_signal", True)
             print(f"{Fore.MAGENTA}Quest updated: Escape Plan{Style.RESET_ALL}")
 
-        time.sleep(1)
+        pause(1)
 
         # Random chance for successful rescue
         if random.random() < success_chance:
             print(f"\n{Fore.CYAN}Wait... you see something on the horizon!{Style.RESET_ALL}")
-            time.sleep(2)
+            pause(2)
             print(f"\n{Fore.GREEN}A ship has spotted your signal and is changing course to rescue you!{Style.RESET_ALL}")
-            time.sleep(2)
+            pause(2)
 
             gs.rescued = True
 
@@ -3827,7 +3828,7 @@ class GameManager:
                 break
             else:
                 print(f"{Fore.RED}Invalid choice. Please try again.{Style.RESET_ALL}")
-                time.sleep(1)
+                pause(1)
 
     def build_raft(self, raft_type: str, materials: dict) -> None:
         """Build a specific type of raft"""
@@ -3915,14 +3916,14 @@ class GameManager:
             final_chance = 95
 
         print(f"\n{Fore.CYAN}You push your {gs.raft_type} into the water and begin rowing away from the island...{Style.RESET_ALL}")
-        time.sleep(2)
+        pause(2)
 
         # Random chance for successful escape
         if random.random() * 100 < final_chance:
             print(f"\n{Fore.GREEN}After many hours of rowing, you spot a passing ship in the distance!{Style.RESET_ALL}")
-            time.sleep(1)
+            pause(1)
             print(f"{Fore.GREEN}They've seen you and are coming to your rescue!{Style.RESET_ALL}")
-            time.sleep(1)
+            pause(1)
 
             gs.rescued = True
 
@@ -3943,9 +3944,9 @@ class GameManager:
             # Game will end in the next update loop
         else:
             print(f"\n{Fore.RED}After several hours at sea, your raft begins to come apart...{Style.RESET_ALL}")
-            time.sleep(1)
+            pause(1)
             print(f"{Fore.RED}You have no choice but to turn back to the island.{Style.RESET_ALL}")
-            time.sleep(1)
+            pause(1)
 
             # Damage or destroy the raft
             if random.random() < 0.7:  # 70% chance raft is destroyed
@@ -4175,7 +4176,7 @@ class GameManager:
             enemy_color = Fore.RED if enemy.startswith("Pirate") else Fore.YELLOW
             print(enemy_color + self.ascii_enemies[enemy] + Style.RESET_ALL)
 
-        time.sleep(1)
+        pause(1)
 
         # Check if player has a weapon
         has_weapon = gs.inventory["Spear"] > 0
@@ -4187,9 +4188,9 @@ class GameManager:
             print(f"{Fore.YELLOW}You have no weapon to defend yourself!{Style.RESET_ALL}")
             success_chance = 0.3  # 30% chance without weapon
 
-        time.sleep(1)
+        pause(1)
         print(f"{Fore.WHITE}You prepare to fight...{Style.RESET_ALL}")
-        time.sleep(1)
+        pause(1)
 
         # Determine outcome
         if random.random() < success_chance:
@@ -4580,7 +4581,7 @@ def check_launcher() -> None:
             choice = input().lower().strip()
             if choice != 'y':
                 print(f"{Fore.GREEN}Launching official ChronoTale launcher...")
-                time.sleep(1)
+                pause(1)
                 import subprocess
                 import sys
                 subprocess.run([sys.executable, "launch.py"])
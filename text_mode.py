@@ -0,0 +1,32 @@
+"""
+ChronoTale Text Mode
+====================
+Text speed chosen in the launcher settings, shared by every game.
+
+The launcher hands the setting to the game it starts in the
+CHRONOTALE_TEXT_MODE environment variable:
+- "instant" skips dramatic pauses and draws text at once
+- "fast" shortens pauses to a quarter
+- "cinematic" plays everything at full length (the default)
+"""
+
+import os
+import time
+
+TEXT_MODE = os.environ.get("CHRONOTALE_TEXT_MODE", "cinematic")
+
+
+def pause_length(seconds: float) -> float:
+    """Length of a dramatic pause in the current TEXT_MODE, 0 when it is skipped"""
+    if TEXT_MODE == "instant":
+        return 0.0
+    if TEXT_MODE == "fast":
+        return seconds * 0.25
+    return seconds
+
+
+def pause(seconds: float) -> None:
+    """Wait for a dramatic pause, shortened or skipped depending on TEXT_MODE"""
+    seconds = pause_length(seconds)
+    if seconds:
+        time.sleep(seconds)